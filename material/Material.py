@@ -1,62 +1,101 @@
-'''Material.py - defines a Material and its electromagnetic properties for SkinDepth
-
-Chris Coughlin
-'''
-import constants
-import math
-
-class Material(object):
-    '''Defines the basic electromagnetic properties of a material (no temperature correction)'''
-    def __init__(self, name, notes=None, sigma_iacs=0.0, mu_rel=1.00):
-        '''Required parameter:  name of material
-          Optional parameters:
-          notes (None):  general descriptive text to add to the material definition
-          sigma_iacs (0.0):  electrical conductivity of material in %IACS scale
-          mu_rel (1.00):  relative magnetic permeability of the material
-        '''
-        self.name = name
-        self.notes = notes
-        self.iacs = sigma_iacs
-        self.mu_r = mu_rel
-
-    @property
-    def conductivity(self): 
-        '''Returns the electrical conductivity in S/m of the material'''
-        return (self.iacs / constants.ConductivityOfCopperIACS)*constants.ConductivityOfCopperSI
-    @conductivity.setter
-    def conductivity(self, conductivitySI):
-        '''Sets the electrical conductivity in S/m of the material'''
-        self.iacs = (conductivitySI / constants.ConductivityOfCopperSI) *100
-
-    @property
-    def permeability(self):
-        '''Returns the magnetic permeability in H/m of the material'''
-        return self.mu_r * constants.PermeabilityOfFreeSpace
-    @permeability.setter
-    def permeability(self, new_perm):
-        '''Sets the magnetic permeability in H/m of the material'''
-        self.mu_r = new_perm / constants.PermeabilityOfFreeSpace
-
-    def calc_skindepth(self, frequency):
-        '''Returns the skin depth in metres for the given excitation frequency.'''
-        omega = 2*math.pi*frequency
-        delta = 0.0
-        if omega == 0 or self.conductivity == 0 or self.permeability == 0:
-            delta = float('inf')
-        elif omega < 0:
-            delta = float('NaN')
-        else:
-            delta = math.sqrt(2/(omega*self.conductivity*self.permeability))
-        return delta
-
-    def calc_frequency(self, attenuation):
-        '''Returns the frequency in Hz that has the desired attenuation depth in this material.
-        Assumes attenuation is in metres.'''
-        frequency = 0.0
-        if attenuation == 0 or self.conductivity == 0 or self.permeability == 0:
-            frequency = float('inf')
-        elif attenuation < 0:
-            return float('NaN')
-        else:
-            frequency = (2 / math.pow(attenuation, 2) / (self.conductivity * self.permeability * 2 * math.pi))
-        return frequency
\ No newline at end of file
+'''Material.py - defines a Material and its electromagnetic properties for SkinDepth
+
+Chris Coughlin
+'''
+from material import constants
+import math
+from material import vectorcalc
+
+class Material(object):
+    '''Defines the basic electromagnetic properties of a material (no temperature correction)'''
+    __slots__ = ('name', 'notes', '_iacs', '_mu_r', '_k')
+
+    def __init__(self, name, notes=None, sigma_iacs=0.0, mu_rel=1.00):
+        '''Required parameter:  name of material
+          Optional parameters:
+          notes (None):  general descriptive text to add to the material definition
+          sigma_iacs (0.0):  electrical conductivity of material in %IACS scale
+          mu_rel (1.00):  relative magnetic permeability of the material
+        '''
+        self.name = name
+        self.notes = notes
+        self._iacs = sigma_iacs
+        self._mu_r = mu_rel
+        self._update_coefficient()
+
+    @property
+    def iacs(self):
+        '''Returns the electrical conductivity in %IACS of the material'''
+        return self._iacs
+    @iacs.setter
+    def iacs(self, sigma_iacs):
+        '''Sets the electrical conductivity in %IACS of the material'''
+        self._iacs = sigma_iacs
+        self._update_coefficient()
+
+    @property
+    def mu_r(self):
+        '''Returns the relative magnetic permeability of the material'''
+        return self._mu_r
+    @mu_r.setter
+    def mu_r(self, mu_rel):
+        '''Sets the relative magnetic permeability of the material'''
+        self._mu_r = mu_rel
+        self._update_coefficient()
+
+    @property
+    def conductivity(self): 
+        '''Returns the electrical conductivity in S/m of the material'''
+        return (self.iacs / constants.ConductivityOfCopperIACS)*constants.ConductivityOfCopperSI
+    @conductivity.setter
+    def conductivity(self, conductivitySI):
+        '''Sets the electrical conductivity in S/m of the material'''
+        self.iacs = (conductivitySI / constants.ConductivityOfCopperSI) *100
+
+    @property
+    def permeability(self):
+        '''Returns the magnetic permeability in H/m of the material'''
+        return self.mu_r * constants.PermeabilityOfFreeSpace
+    @permeability.setter
+    def permeability(self, new_perm):
+        '''Sets the magnetic permeability in H/m of the material'''
+        self.mu_r = new_perm / constants.PermeabilityOfFreeSpace
+
+    @property
+    def skindepth_coefficient(self):
+        '''Returns k = 1/sqrt(pi*conductivity*permeability), such that the skin depth at frequency f is
+        k/sqrt(f).  inf for a perfect insulator or zero permeability.'''
+        return self._k
+
+    def _update_coefficient(self):
+        '''Recalculates the skin depth coefficient after a change in conductivity or permeability'''
+        self._k = vectorcalc.coefficient(self.conductivity * self.permeability)
+
+    def calc_skindepth(self, frequency):
+        '''Returns the skin depth in metres for the given excitation frequency.'''
+        if frequency == 0 or self._k == float('inf'):
+            return float('inf')
+        elif frequency < 0:
+            return float('NaN')
+        return self._k / math.sqrt(frequency)
+
+    def calc_frequency(self, attenuation):
+        '''Returns the frequency in Hz that has the desired attenuation depth in this material.
+        Assumes attenuation is in metres.'''
+        if attenuation == 0 or self._k == float('inf'):
+            return float('inf')
+        elif attenuation < 0:
+            return float('NaN')
+        ratio = self._k / attenuation
+        return ratio * ratio
+
+    def calc_skindepths(self, frequencies):
+        '''Returns the skin depths in metres for an array (NumPy array or any sequence / buffer) of
+        excitation frequencies, calculated in one pass.  Zero and negative frequencies return inf
+        and NaN respectively, as per calc_skindepth.'''
+        return vectorcalc.skindepths(self._k, frequencies)
+
+    def calc_frequencies(self, attenuations):
+        '''Returns the excitation frequencies in Hz for an array (NumPy array or any sequence / buffer)
+        of attenuation depths in metres, calculated in one pass.'''
+        return vectorcalc.frequencies(self._k, attenuations)
\ No newline at end of file
@@ -0,0 +1,105 @@
+'''MaterialCatalog.py - a compact, read-only struct-of-arrays collection of Materials, e.g. for calculating
+the skin depth of every material at every frequency in one pass
+'''
+import array
+import bisect
+from material import constants
+from material import vectorcalc
+from material import Material
+
+class MaterialCatalog(object):
+    '''Stores the names, notes, conductivities (%IACS) and relative permeabilities of a set of Materials as
+    contiguous arrays, one entry per material, along with each material's skin depth coefficient.
+    Materials are only created on demand when indexing or iterating over the catalog.'''
+    def __init__(self, materials=None):
+        '''Optional parameter:  materials (None) - iterable of Materials to add to the catalog'''
+        if materials is None:
+            materials = []
+        self._build((amaterial.name, amaterial.notes, amaterial.iacs, amaterial.mu_r) for amaterial in materials)
+
+    @classmethod
+    def fromrows(cls, rows):
+        '''Returns a new catalog from an iterable of (name, notes, %IACS, relative permeability) rows, e.g.
+        a database cursor, without creating intermediate Material instances.'''
+        catalog = cls.__new__(cls)
+        catalog._build(rows)
+        return catalog
+
+    @classmethod
+    def fromdb(cls, materialdb):
+        '''Returns a new catalog of all the materials in the (connected) MaterialDB materialdb'''
+        return materialdb.retrievecatalog()
+
+    def _build(self, rows):
+        '''Populates the catalog's arrays from (name, notes, %IACS, relative permeability) rows'''
+        self.names = []
+        self.notes = []
+        iacs = array.array('d')
+        mu_r = array.array('d')
+        for name, notes, sigma_iacs, mu_rel in rows:
+            self.names.append(name)
+            self.notes.append(notes)
+            iacs.append(sigma_iacs)
+            mu_r.append(mu_rel)
+        self._sorted = all(self.names[idx] < self.names[idx + 1] for idx in range(len(self.names) - 1))
+        self.iacs = vectorcalc.asarray(iacs)
+        self.mu_r = vectorcalc.asarray(mu_r)
+        conversion = (constants.ConductivityOfCopperSI / constants.ConductivityOfCopperIACS) * \
+                     constants.PermeabilityOfFreeSpace
+        if vectorcalc.numpy is None:
+            self.coefficients = vectorcalc.coefficients([sigma * mu * conversion for sigma, mu in zip(iacs, mu_r)])
+        else:
+            self.coefficients = vectorcalc.coefficients(self.iacs * self.mu_r * conversion)
+
+    def __len__(self):
+        return len(self.names)
+
+    def __getitem__(self, idx):
+        '''Returns a new Material for the entry at index idx'''
+        return Material.Material(name=self.names[idx], notes=self.notes[idx], sigma_iacs=float(self.iacs[idx]),
+                                 mu_rel=float(self.mu_r[idx]))
+
+    def __iter__(self):
+        for idx in range(len(self.names)):
+            yield self[idx]
+
+    def __contains__(self, materialname):
+        try:
+            self.index(materialname)
+            return True
+        except ValueError:
+            return False
+
+    def index(self, materialname):
+        '''Returns the row of the given material in the catalog, raises ValueError if not found'''
+        if self._sorted:
+            idx = bisect.bisect_left(self.names, materialname)
+            if idx < len(self.names) and self.names[idx] == materialname:
+                return idx
+            raise ValueError("{0} is not in the catalog".format(materialname))
+        return self.names.index(materialname)
+
+    def retrieve(self, materialname):
+        '''Returns a new Material for the entry of the given name, or None if not found.'''
+        try:
+            return self[self.index(materialname)]
+        except ValueError:
+            return None
+
+    def skindepth_matrix(self, frequencies):
+        '''Returns the skin depths in metres of every material in the catalog at every frequency in Hz in
+        frequencies, as a (materials x frequencies) matrix.  Without NumPy a list of array rows is
+        returned instead.'''
+        frequencies = vectorcalc.asarray(frequencies)
+        if vectorcalc.numpy is None:
+            return [vectorcalc.skindepths(coefficient, frequencies) for coefficient in self.coefficients]
+        return vectorcalc.skindepths(self.coefficients[:, None], frequencies[None, :])
+
+    def frequency_matrix(self, attenuations):
+        '''Returns the excitation frequencies in Hz for every material in the catalog at every attenuation
+        depth in metres in attenuations, as a (materials x depths) matrix.  Without NumPy a list of array
+        rows is returned instead.'''
+        attenuations = vectorcalc.asarray(attenuations)
+        if vectorcalc.numpy is None:
+            return [vectorcalc.frequencies(coefficient, attenuations) for coefficient in self.coefficients]
+        return vectorcalc.frequencies(self.coefficients[:, None], attenuations[None, :])
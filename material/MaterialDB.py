@@ -1,137 +1,790 @@
-'''MaterialDB.py - defines a SQLITE3 backend for Material I/O
-
-Chris Coughlin
-'''
-import sqlite3
-import Material
-
-class MaterialDB(object):
-    '''Handles mapping between the SQLite database and the Material class'''
-    def __init__(self, dbfile):
-        '''Required parameter - filename of database to use.  Can use ':memory:' as per sqlite3
-          module to keep database in memory only.'''
-        self.dbfilename = dbfile
-
-    def connect(self):
-        '''Connects to the instance's database and creates the database cursor.
-          Raises sqlite3.OperationalError if unable to open the database.
-          '''
-        self.dbconnection = sqlite3.connect(self.dbfilename)
-        self.dbcursor = self.dbconnection.cursor()
-
-    def create(self):
-        '''Creates the materials table in the database'''
-        self.dbcursor.execute(
-                '''create table if not exists materials(name text unique, notes text, conductivity_iacs real,
-                 rel_permeability real)'''
-                )
-        self.update()
-
-    def update(self):
-        '''Commits the changes to the database'''
-        self.dbconnection.commit()
-
-    def add(self, newmaterial, update=False):
-        '''Adds / replaces (if material of same name already exists in database) a material
-          to the database.  If update is True, the changes are commited to the database after
-          execution (default is False).
-        '''
-        if isinstance(newmaterial, Material.Material):
-            self.dbcursor.execute('insert or replace into materials values (?,?,?,?)', (
-            newmaterial.name,
-            newmaterial.notes,
-            newmaterial.iacs,
-            newmaterial.mu_r
-            ))
-            if update:
-                self.update()
-
-    def retrieve(self, materialname):
-        '''Retrieves the material of the given name from the database, or None if not found.'''
-        self.dbcursor.execute('select * from materials where name=?', (materialname,))
-        row = self.dbcursor.fetchone()
-        if row is None:
-            return row
-        else:
-            return Material.Material(
-                    name = row[0],
-                    notes = row[1],
-                    sigma_iacs = row[2],
-                    mu_rel = row[3]
-                    )
-
-    def retrieveall(self):
-        '''Retrieves all the materials currently in the database'''
-        allmaterials = []
-        self.dbcursor.execute('select * from materials order by name asc')
-        alldata = self.dbcursor.fetchall()
-        if alldata is not None:
-            for row in alldata:
-                allmaterials.append(
-                        Material.Material(
-                                name = row[0],
-                                notes = row[1],
-                                sigma_iacs = row[2],
-                                mu_rel = row[3]
-                                )
-                        )
-        return allmaterials
-
-    def delete(self, materialname, update=False):
-        '''Deletes the material of the given name from the database.  If update is True,
-          the changes are commited to the database after execution (default is False).
-          '''
-        self.dbcursor.execute("delete from materials where name=?", (materialname,))
-        if update:
-            self.update()
-
-    def undo(self):
-        '''Rollback the changes to the database since the last commit.'''
-        self.dbconnection.rollback()
-
-    def close(self, update=False):
-        '''Closes the connection to the database.  If update is True, changes are
-        commited to the database prior to close (default is False).
-        '''
-        if update:
-            self.update()
-        self.dbconnection.close()
-
-    def exportsql(self, export_file):
-        '''Wrapper for dumping database to SQL script text file'''
-        with open(export_file, 'w') as fidout:
-            for row in self.dbconnection.iterdump():
-                fidout.write('%s\n' % row)
-
-    def importsql(self, import_file):
-        '''Imports a SQL script and executes, returning the total number of changes made.'''
-        self.connect()
-        self.create()
-        dbwalker = MaterialDB(":memory:")
-        dbwalker.connect()
-        with open(import_file, 'r') as fidin:
-            dbwalker.dbconnection.executescript(fidin.read())
-        imported_records = dbwalker.retrieveall()
-        for amaterial in imported_records:
-            self.add(amaterial)
-        return self.dbconnection.total_changes
-
-    def importdb(self, import_file):
-        '''Attempts to import a SQLite database into the current.  Only materials not already in the database
-        are imported.  Returns the total number of additions made to the database.
-        '''
-        try:
-            otherdb = MaterialDB(import_file)
-            otherdb.connect()
-            otherdb.dbcursor.execute('select * from materials order by name asc')
-            import_materials = otherdb.dbcursor.fetchall()
-            if import_materials is not None:
-                for newmaterial in import_materials:
-                    self.dbcursor.execute('insert or ignore into materials values (?,?,?,?)', newmaterial)
-                materials_added = self.dbconnection.total_changes
-                self.update()
-            otherdb.close()
-            return materials_added
-        except sqlite3.OperationalError:
-            #Unable to read the import database
-            raise
\ No newline at end of file
+'''MaterialDB.py - defines a SQLITE3 backend for Material I/O
+
+Chris Coughlin
+'''
+import binascii
+import contextlib
+import errno
+import gzip
+import io
+import math
+import numbers
+import os
+import re
+import sqlite3
+import stat
+import threading
+try:
+    import lzma
+except ImportError:
+    lzma = None
+from material import constants
+from material import Material
+from material import MaterialCatalog
+
+# SQL expression for the product of %IACS and relative permeability, indexed as materials_sigma_mu;
+# multiply by SIGMA_MU_PER_PRODUCT for conductivity (S/m) * permeability (H/m)
+SIGMA_MU = 'conductivity_iacs * rel_permeability'
+SIGMA_MU_PER_PRODUCT = (constants.ConductivityOfCopperSI / constants.ConductivityOfCopperIACS) * \
+                       constants.PermeabilityOfFreeSpace
+
+# Connection profiles - the pragmas applied in order by MaterialDB.set_profile.  Every profile sets the same
+# pragmas so switching between them is complete; query_only is cleared first so the others can be changed and
+# synchronous is set before journal_mode so the checkpoint on leaving WAL is synced as per the new profile.
+PROFILES = {
+    # SQLite's defaults - rollback journal, fully synced commits
+    'interactive': (('query_only', 0), ('synchronous', 'full'), ('cache_size', -2000), ('temp_store', 'default'),
+                    ('mmap_size', 0), ('journal_mode', 'delete')),
+    # Imports and copies - commits aren't synced, 64 MiB page cache and temporary tables / indexes in memory
+    'bulk-load': (('query_only', 0), ('synchronous', 'off'), ('cache_size', -65536), ('temp_store', 'memory'),
+                  ('mmap_size', 0), ('journal_mode', 'wal')),
+    # Serving lookups - readers don't block on a writer, database memory mapped and writes refused
+    'read-mostly': (('query_only', 0), ('synchronous', 'normal'), ('cache_size', -16384), ('temp_store', 'memory'),
+                    ('mmap_size', 268435456), ('journal_mode', 'wal'), ('query_only', 1))
+    }
+
+# Columns / expressions available for range and top-k queries
+_query_columns = {'iacs': 'conductivity_iacs', 'mu_r': 'rel_permeability', 'sigma_mu': SIGMA_MU}
+
+# Splits a search query into the words matched against the full-text index
+_search_tokens = re.compile(r'\w+', re.UNICODE)
+
+# Matches the start of an INSERT into the materials table, up to the column list or VALUES
+_materials_insert = re.compile(r'''\s*insert\s+(or\s+\w+\s+)?into\s+(main\.)?["'`\[]?materials["'`\]]?\s*(?=\(|values\b)''',
+                               re.IGNORECASE)
+
+# Matches the statements of a dump that recreate the full-text index - its virtual table (written straight into
+# sqlite_master under writable_schema), shadow tables and triggers.  create() rebuilds the index instead.
+_search_index_dump = re.compile(r'''(create\s+(virtual\s+)?table|insert\s+into|create\s+trigger)\s+["'`]?materials_fts|'''
+                                r'''insert\s+into\s+sqlite_master\b.*?values\s*\('table','materials_fts'|'''
+                                r'''pragma\s+writable_schema''', re.IGNORECASE)
+
+def iter_statements(lines):
+    '''Generator that yields the complete SQL statements in an iterable of lines of a SQL script (e.g. an
+    open file).  The text read so far is checked with sqlite3.complete_statement at every semicolon, so a
+    line may hold several statements and a statement may span several lines.'''
+    statement = ''
+    for line in lines:
+        pieces = line.split(';')
+        for piece in pieces[:-1]:
+            statement += piece + ';'
+            if sqlite3.complete_statement(statement):
+                yield statement.strip()
+                statement = ''
+        statement += pieces[-1]
+    if statement.strip():
+        yield statement.strip()
+
+def open_sqlfile(sql_file, mode='rb', compression=None):
+    '''Opens a SQL script file in binary mode, (de)compressing on the fly.  compression is one of None,
+    'gzip' or 'xz'; when None it is determined from the file's contents when reading and from its extension
+    (.gz or .xz) when writing.  Raises ValueError if the compression isn't supported.'''
+    if compression is None:
+        if 'r' in mode:
+            with open(sql_file, 'rb') as fidin:
+                magic = fidin.read(6)
+            if magic.startswith(b'\x1f\x8b'):
+                compression = 'gzip'
+            elif magic == b'\xfd7zXZ\x00':
+                compression = 'xz'
+        else:
+            compression = {'.gz': 'gzip', '.xz': 'xz'}.get(os.path.splitext(sql_file)[1].lower())
+    if compression is None:
+        return io.open(sql_file, mode)
+    elif compression == 'gzip':
+        return gzip.open(sql_file, mode)
+    elif compression == 'xz':
+        if lzma is None:
+            raise ValueError("xz compression requires the lzma module")
+        return lzma.open(sql_file, mode)
+    raise ValueError("Unsupported compression '{0}'".format(compression))
+
+def _material_from_row(row):
+    '''Returns a new Material from a (name, notes, %IACS, relative permeability) row'''
+    return Material.Material(
+            name = row[0],
+            notes = row[1],
+            sigma_iacs = row[2],
+            mu_rel = row[3]
+            )
+
+def _product_for_skindepth(frequency, skindepth):
+    '''Returns the product of %IACS and relative permeability that gives the skin depth in metres at the
+    frequency in Hz, as delta = 1/sqrt(pi*f*sigma*mu)'''
+    return 1.0 / (math.pi * frequency * skindepth * skindepth * SIGMA_MU_PER_PRODUCT)
+
+def _skindepth_conditions(frequency, min_depth=0, max_depth=None):
+    '''Returns the SQL conditions and parameters that limit the skin depth at the frequency to between
+    min_depth and max_depth (None for no upper limit).  Larger products give smaller skin depths.'''
+    conditions = []
+    params = []
+    if max_depth is not None:
+        conditions.append('%s >= ?' % SIGMA_MU)
+        params.append(_product_for_skindepth(frequency, max_depth))
+    if min_depth:
+        conditions.append('%s <= ?' % SIGMA_MU)
+        params.append(_product_for_skindepth(frequency, min_depth))
+    return conditions, params
+
+def _replace_file(src, dst):
+    '''Renames src to dst, replacing dst if it exists'''
+    if hasattr(os, 'replace'):
+        os.replace(src, dst)
+    else:
+        if os.name == 'nt' and os.path.exists(dst):
+            # os.rename won't overwrite on Windows under Python 2
+            os.remove(dst)
+        os.rename(src, dst)
+
+def _create_temp_file(directory, suffix=''):
+    '''Creates a new, empty file in directory and returns its name.  Unlike mkstemp's owner-only file it is
+    created with the permissions of any other new file under the current umask.'''
+    while True:
+        temp_file = os.path.join(directory, 'tmp' + binascii.hexlify(os.urandom(6)).decode('ascii') + suffix)
+        try:
+            temp_fd = os.open(temp_file, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+        except OSError as err:
+            if err.errno == errno.EEXIST:
+                continue
+            raise
+        os.close(temp_fd)
+        return temp_file
+
+def _copy_mode(src, dst):
+    '''Gives src the permissions of dst if dst exists'''
+    if os.path.exists(dst):
+        os.chmod(src, stat.S_IMODE(os.stat(dst).st_mode))
+
+def sql_literal(value):
+    '''Returns value as a SQLite literal'''
+    if value is None or (isinstance(value, float) and math.isnan(value)):
+        return 'NULL'
+    elif isinstance(value, float):
+        if math.isinf(value):
+            return '9e999' if value > 0 else '-9e999'
+        return repr(value)
+    elif isinstance(value, numbers.Number):
+        return str(value)
+    return "'%s'" % value.replace("'", "''")
+
+class MaterialDB(object):
+    '''Handles mapping between the SQLite database and the Material class'''
+    def __init__(self, dbfile, threaded=False, timeout=5.0, profile='interactive'):
+        '''Required parameter - filename of database to use.  Can use ':memory:' as per sqlite3
+          module to keep database in memory only.
+          Optional parameters:  threaded (False) - if True the database can be used from multiple threads,
+          timeout (5.0) - seconds to wait for another connection's lock on the database before raising
+          sqlite3.OperationalError, profile ('interactive') - the name of the connection profile in PROFILES
+          to connect with.
+          Writes (create, add, delete, imports, commit and rollback) are always made through the connection
+          opened by connect() and serialized by writelock, so changes made on any thread are commited or
+          rolled back together.  In threaded mode each thread also gets its own connection and cursor to a
+          file database for reads, so reads proceed in parallel and see only commited changes; a ':memory:'
+          database has one shared connection and a cursor per thread.'''
+        self.dbfilename = dbfile
+        self.threaded = threaded
+        self.timeout = timeout
+        if profile not in PROFILES:
+            raise ValueError("Unknown connection profile {0}".format(profile))
+        self.profile = profile
+        self.writelock = threading.RLock()
+        # The connection and cursor every write is made through, under writelock
+        self._connection = None
+        self._cursor = None
+        self._local = threading.local()
+        self._connections = []
+        self._cursors = []
+
+    def connect(self, profile=None):
+        '''Connects to the instance's database and creates the database cursor.
+          Raises sqlite3.OperationalError if unable to open the database.
+          If specified, profile sets the connection profile (default is to keep the current profile).
+          In threaded mode, other threads connect on first use with the same settings.
+          Any existing connections are closed first, dropping their uncommited changes.
+          '''
+        if profile is not None:
+            if profile not in PROFILES:
+                raise ValueError("Unknown connection profile {0}".format(profile))
+            self.profile = profile
+        if self._connections:
+            # An orphaned connection would keep its open transaction's lock on the database
+            self.close()
+        self._local = threading.local()
+        self._connection = self._open_connection()
+        self._cursor = self._connection.cursor()
+
+    def _open_connection(self):
+        '''Returns a new connection to the database with the instance's settings'''
+        connection = sqlite3.connect(self.dbfilename, timeout=self.timeout, check_same_thread=not self.threaded)
+        # INSERT OR REPLACE only fires the full-text index's delete trigger for the replaced row with recursive
+        # triggers enabled
+        connection.execute('pragma recursive_triggers = on')
+        self._apply_profile(connection, self.profile)
+        with self.writelock:
+            self._connections.append(connection)
+        return connection
+
+    @staticmethod
+    def _apply_profile(connection, profile):
+        '''Sets the pragmas of the named profile on connection'''
+        for pragma, value in PROFILES[profile]:
+            connection.execute('pragma %s = %s' % (pragma, value)).fetchall()
+
+    def set_profile(self, profile):
+        '''Switches to the named connection profile in PROFILES, one of 'interactive' (SQLite's defaults),
+          'bulk-load' (for imports - WAL journal, unsynced commits, large cache) or 'read-mostly' (for serving
+          - WAL journal, memory mapped, read only).  Any pending changes are commited first.  In threaded mode
+          the profile applies to the writing connection, the calling thread's connection and to connections
+          opened from then on.  Raises ValueError for an unknown profile.
+          '''
+        if profile not in PROFILES:
+            raise ValueError("Unknown connection profile {0}".format(profile))
+        with self.writelock:
+            if self._connection is not None:
+                # The journal mode can't be changed inside a transaction
+                self.update()
+                self._apply_profile(self._connection, profile)
+                connection = getattr(self._local, 'connection', None)
+                if connection is not None and connection is not self._connection:
+                    self._apply_profile(connection, profile)
+            self.profile = profile
+
+    @contextlib.contextmanager
+    def using_profile(self, profile):
+        '''Context manager that switches to the named connection profile and restores the current profile on
+          exit, e.g. with materialdb.using_profile('bulk-load'): ...
+          '''
+        previous = self.profile
+        self.set_profile(profile)
+        try:
+            yield self
+        finally:
+            self.set_profile(previous)
+
+    @property
+    def dbconnection(self):
+        '''The database connection for reads; in threaded mode, the calling thread's connection'''
+        if not self.threaded or self._connection is None:
+            return self._connection
+        connection = getattr(self._local, 'connection', None)
+        if connection is None:
+            if self.dbfilename == ':memory:':
+                # Every connection to :memory: opens a separate, empty database
+                connection = self._connection
+            else:
+                connection = self._open_connection()
+            self._local.connection = connection
+        return connection
+
+    @property
+    def dbcursor(self):
+        '''The database cursor for reads; in threaded mode, the calling thread's cursor'''
+        if not self.threaded or self._connection is None:
+            return self._cursor
+        cursor = getattr(self._local, 'cursor', None)
+        if cursor is None:
+            cursor = self._local.cursor = self.dbconnection.cursor()
+            with self.writelock:
+                self._cursors.append(cursor)
+        return cursor
+
+    def create(self):
+        '''Creates the materials table and its indexes in the database.  Under the read-only 'read-mostly'
+        profile, writes are allowed for the duration so databases made before the indexes were added can
+        still be opened.'''
+        with self.writelock:
+            readonly = ('query_only', 1) in PROFILES[self.profile]
+            if readonly:
+                self._connection.execute('pragma query_only = 0')
+            try:
+                self._cursor.execute(
+                        '''create table if not exists materials(name text unique, notes text, conductivity_iacs real,
+                         rel_permeability real)'''
+                        )
+                self._cursor.execute('create index if not exists materials_iacs on materials(conductivity_iacs)')
+                self._cursor.execute('create index if not exists materials_mu_r on materials(rel_permeability)')
+                try:
+                    # The skin depth depends only on the product of conductivity and permeability, which is stored in
+                    # an index on the expression (SQLite 3.9+) rather than in a column so the table's layout is
+                    # unchanged
+                    self._cursor.execute('create index if not exists materials_sigma_mu on materials(%s)' % SIGMA_MU)
+                except sqlite3.OperationalError:
+                    # Older SQLite, range queries on the product fall back to a table scan
+                    pass
+                self.create_search_index()
+                self.update()
+            finally:
+                if readonly:
+                    self._connection.execute('pragma query_only = 1')
+
+    def create_search_index(self):
+        '''Creates the FTS5 full-text index of the materials' names and notes if it doesn't already exist, along
+        with the triggers that keep it up to date, and indexes the existing materials.  Returns True if the
+        index is available, False if this SQLite was built without FTS5 (search falls back to LIKE).
+        '''
+        with self.writelock:
+            if self._has_search_index(self._cursor):
+                return True
+            try:
+                self._cursor.execute(
+                        '''create virtual table materials_fts using fts5(name, notes, content='materials',
+                        content_rowid='rowid')'''
+                        )
+            except sqlite3.OperationalError:
+                return False
+            self._cursor.execute(
+                    '''create trigger if not exists materials_fts_insert after insert on materials begin
+                    insert into materials_fts(rowid, name, notes) values (new.rowid, new.name, new.notes); end'''
+                    )
+            self._cursor.execute(
+                    '''create trigger if not exists materials_fts_delete after delete on materials begin
+                    insert into materials_fts(materials_fts, rowid, name, notes)
+                    values ('delete', old.rowid, old.name, old.notes); end'''
+                    )
+            self._cursor.execute(
+                    '''create trigger if not exists materials_fts_update after update on materials begin
+                    insert into materials_fts(materials_fts, rowid, name, notes)
+                    values ('delete', old.rowid, old.name, old.notes);
+                    insert into materials_fts(rowid, name, notes) values (new.rowid, new.name, new.notes); end'''
+                    )
+            self._cursor.execute("insert into materials_fts(materials_fts) values ('rebuild')")
+            return True
+
+    def has_search_index(self):
+        '''Returns True if the database has a full-text index of the materials'''
+        return self._has_search_index(self.dbcursor)
+
+    @staticmethod
+    def _has_search_index(cursor):
+        '''Returns True if the database read through cursor has a full-text index of the materials'''
+        cursor.execute("select count(*) from sqlite_master where type='table' and name='materials_fts'")
+        return cursor.fetchone()[0] > 0
+
+    def update(self):
+        '''Commits the changes to the database'''
+        with self.writelock:
+            self._connection.commit()
+
+    def add(self, newmaterial, update=False):
+        '''Adds / replaces (if material of same name already exists in database) a material
+          to the database.  If update is True, the changes are commited to the database after
+          execution (default is False).
+        '''
+        with self.writelock:
+            if isinstance(newmaterial, Material.Material):
+                self._cursor.execute('insert or replace into materials values (?,?,?,?)', (
+                newmaterial.name,
+                newmaterial.notes,
+                newmaterial.iacs,
+                newmaterial.mu_r
+                ))
+                if update:
+                    self.update()
+
+    def add_many(self, newmaterials, update=False):
+        '''Adds / replaces a batch of materials, given as any iterable of Materials or of
+          (name, notes, %IACS, relative permeability) tuples.  The rows are streamed through a single
+          executemany within one transaction; if update is True the transaction is commited after
+          execution (default is False).  Returns the number of rows inserted or replaced.
+          '''
+        def rows():
+            for newmaterial in newmaterials:
+                if isinstance(newmaterial, Material.Material):
+                    yield (newmaterial.name, newmaterial.notes, newmaterial.iacs, newmaterial.mu_r)
+                else:
+                    yield tuple(newmaterial)
+        with self.writelock:
+            cursor = self._connection.cursor()
+            try:
+                cursor.executemany('insert or replace into materials values (?,?,?,?)', rows())
+                changes = max(cursor.rowcount, 0)
+            finally:
+                cursor.close()
+            if update:
+                self.update()
+            return changes
+
+    def retrieve(self, materialname):
+        '''Retrieves the material of the given name from the database, or None if not found.'''
+        self.dbcursor.execute('select * from materials where name=?', (materialname,))
+        row = self.dbcursor.fetchone()
+        if row is None:
+            return row
+        else:
+            return Material.Material(
+                    name = row[0],
+                    notes = row[1],
+                    sigma_iacs = row[2],
+                    mu_rel = row[3]
+                    )
+
+    def retrieve_many(self, materialnames, chunksize=500):
+        '''Retrieves the materials of the given names from the database, returning a tuple (materials, missing).
+          materials is a dict of the Materials found keyed by name and missing is a list of the names not found,
+          in the order of materialnames.  Names are looked up with one IN query per chunksize names,
+          to stay within SQLite's limit on the number of parameters per query (999 by default).
+          '''
+        names = []
+        seen = set()
+        for materialname in materialnames:
+            if materialname not in seen:
+                seen.add(materialname)
+                names.append(materialname)
+        materialnames = names
+        found = {}
+        for start in range(0, len(materialnames), chunksize):
+            chunk = materialnames[start:start + chunksize]
+            self.dbcursor.execute('select * from materials where name in (%s)' % ','.join('?' * len(chunk)), chunk)
+            for row in self.dbcursor.fetchall():
+                found[row[0]] = row
+        materials = {}
+        missing = []
+        for materialname in materialnames:
+            row = found.get(materialname)
+            if row is None:
+                missing.append(materialname)
+            else:
+                materials[materialname] = Material.Material(
+                        name = row[0],
+                        notes = row[1],
+                        sigma_iacs = row[2],
+                        mu_rel = row[3]
+                        )
+        return materials, missing
+
+    def retrieveall(self):
+        '''Retrieves all the materials currently in the database'''
+        return list(self.iter_all())
+
+    def retrieve_range(self, min_iacs=None, max_iacs=None, min_mu_r=None, max_mu_r=None, limit=None):
+        '''Retrieves the materials whose conductivity in %IACS and relative permeability lie within the given
+          (inclusive) bounds, in ascending order of name.  Bounds left as None are not applied.  limit (None)
+          sets the maximum number of materials returned.
+          '''
+        conditions = []
+        params = []
+        for column, minimum, maximum in (('conductivity_iacs', min_iacs, max_iacs),
+                                         ('rel_permeability', min_mu_r, max_mu_r)):
+            if minimum is not None:
+                conditions.append('%s >= ?' % column)
+                params.append(minimum)
+            if maximum is not None:
+                conditions.append('%s <= ?' % column)
+                params.append(maximum)
+        return self._select(conditions, params, 'name asc', limit)
+
+    def retrieve_top(self, key='iacs', count=10, largest=True):
+        '''Retrieves the count materials with the largest (or smallest if largest is False) value of key, one of
+          'iacs' (conductivity), 'mu_r' (relative permeability) or 'sigma_mu' (conductivity * permeability,
+          i.e. the smallest skin depths).  Raises KeyError for any other key.
+          '''
+        return self._select([], [], '%s %s' % (_query_columns[key], 'desc' if largest else 'asc'), count)
+
+    def retrieve_skindepth_range(self, frequency, min_depth=0, max_depth=None, limit=None):
+        '''Retrieves the materials whose skin depth in metres at the given frequency in Hz lies between min_depth
+          and max_depth (None for no upper limit), in ascending order of skin depth.  The depth bounds are
+          converted to bounds on the conductivity * permeability product and answered through its index.
+          Raises ValueError if the frequency isn't positive.
+          '''
+        if frequency <= 0:
+            raise ValueError("Frequency must be positive")
+        conditions, params = _skindepth_conditions(frequency, min_depth, max_depth)
+        return self._select(conditions, params, '%s desc' % SIGMA_MU, limit)
+
+    def retrieve_skindepth_nearest(self, frequency, target_depth, count=10, min_depth=0, max_depth=None):
+        '''Retrieves up to count materials whose skin depth in metres at the given frequency in Hz is closest to
+          target_depth, optionally restricted to skin depths between min_depth and max_depth, ranked by closeness.
+          The conductivity * permeability index is searched for the target and read outwards from there in both
+          directions, so at most 2*count rows are read however large the database.  Raises ValueError if the
+          frequency or target depth isn't positive.
+          '''
+        if frequency <= 0 or target_depth <= 0:
+            raise ValueError("Frequency and target skin depth must be positive")
+        target = _product_for_skindepth(frequency, target_depth)
+        conditions, params = _skindepth_conditions(frequency, min_depth, max_depth)
+        # Products at or below the target give skin depths at or above the target depth and vice versa
+        candidates = self._select(conditions + ['%s <= ?' % SIGMA_MU], params + [target], '%s desc' % SIGMA_MU,
+                                  count)
+        candidates += self._select(conditions + ['%s > ?' % SIGMA_MU], params + [target], '%s asc' % SIGMA_MU,
+                                   count)
+        candidates.sort(key=lambda amaterial: abs(amaterial.calc_skindepth(frequency) - target_depth))
+        return candidates[:count]
+
+    def _select(self, conditions, params, order, limit=None):
+        '''Returns the list of Materials matching the SQL conditions (joined with and), sorted by order'''
+        sql = 'select * from materials'
+        if conditions:
+            sql += ' where ' + ' and '.join(conditions)
+        sql += ' order by ' + order
+        if limit is not None:
+            sql += ' limit ?'
+            params = list(params) + [limit]
+        self.dbcursor.execute(sql, params)
+        return [_material_from_row(row) for row in self.dbcursor.fetchall()]
+
+    def search(self, query, limit=20):
+        '''Returns up to limit Materials whose name or notes contain every word in query, as whole words or word
+        prefixes (e.g. 'cop iacs').  Uses the full-text index where available, best matches first with matches
+        in the name ranked above matches in the notes; otherwise falls back to a LIKE scan ordered by name.
+        '''
+        tokens = _search_tokens.findall(query)
+        if not tokens:
+            return []
+        if self.has_search_index():
+            # Each word is quoted so FTS5 operators / syntax in the query are matched literally
+            match = ' '.join('"%s"*' % token for token in tokens)
+            self.dbcursor.execute(
+                    '''select materials.* from materials_fts join materials on materials.rowid = materials_fts.rowid
+                    where materials_fts match ? order by bm25(materials_fts, 10.0, 1.0) limit ?''',
+                    (match, -1 if limit is None else limit)
+                    )
+        else:
+            conditions = []
+            params = []
+            for token in tokens:
+                # Words are alphanumeric / underscores, of which only underscore is a LIKE wildcard
+                pattern = '%%%s%%' % token.replace('_', '\\_')
+                conditions.append("(name like ? escape '\\' or notes like ? escape '\\')")
+                params.extend((pattern, pattern))
+            self.dbcursor.execute('select * from materials where %s order by name asc limit ?' % ' and '.join(conditions),
+                                  params + [-1 if limit is None else limit])
+        return [_material_from_row(row) for row in self.dbcursor.fetchall()]
+
+    def retrievenames(self, after=None, limit=None):
+        '''Retrieves the names of the materials currently in the database in ascending order, without reading
+          the rest of each row.  To page through the names, after (None) returns only the names that sort
+          after the given name (e.g. the last name of the previous page), and limit (None) sets the maximum
+          number of names returned.  Pages are found through the index on name.
+          '''
+        sql = 'select name from materials'
+        params = []
+        if after is not None:
+            sql += ' where name > ?'
+            params.append(after)
+        sql += ' order by name asc'
+        if limit is not None:
+            sql += ' limit ?'
+            params.append(limit)
+        self.dbcursor.execute(sql, params)
+        return [row[0] for row in self.dbcursor.fetchall()]
+
+    def iter_all(self, chunksize=256, ordered=True):
+        '''Generator that yields the materials currently in the database one at a time, reading the rows
+          chunksize at a time so only the current chunk is held in memory.  If ordered is True (default),
+          materials are returned in ascending order of name.
+          '''
+        cursor = self.dbconnection.cursor()
+        try:
+            if ordered:
+                cursor.execute('select * from materials order by name asc')
+            else:
+                cursor.execute('select * from materials')
+            while True:
+                rows = cursor.fetchmany(chunksize)
+                if not rows:
+                    break
+                for row in rows:
+                    yield Material.Material(
+                            name = row[0],
+                            notes = row[1],
+                            sigma_iacs = row[2],
+                            mu_rel = row[3]
+                            )
+        finally:
+            cursor.close()
+
+    def retrievecatalog(self):
+        '''Retrieves all the materials currently in the database as a compact MaterialCatalog'''
+        self.dbcursor.execute('select * from materials order by name asc')
+        return MaterialCatalog.MaterialCatalog.fromrows(self.dbcursor)
+
+    def delete(self, materialname, update=False):
+        '''Deletes the material of the given name from the database.  If update is True,
+          the changes are commited to the database after execution (default is False).
+          '''
+        with self.writelock:
+            self._cursor.execute("delete from materials where name=?", (materialname,))
+            if update:
+                self.update()
+
+    def undo(self):
+        '''Rollback the changes to the database since the last commit.'''
+        with self.writelock:
+            self._connection.rollback()
+
+    def release_connection(self):
+        '''In threaded mode, closes the calling thread's own connection for reading a file database, e.g.
+        before a short-lived worker thread exits; the thread reconnects if it reads the database again.'''
+        if not self.threaded:
+            return
+        cursor = getattr(self._local, 'cursor', None)
+        connection = getattr(self._local, 'connection', None)
+        with self.writelock:
+            if cursor is not None and cursor is not self._cursor:
+                cursor.close()
+                self._cursors.remove(cursor)
+            if connection is not None and connection is not self._connection:
+                connection.close()
+                self._connections.remove(connection)
+        self._local.cursor = None
+        self._local.connection = None
+
+    def close(self, update=False):
+        '''Closes the connection to the database.  If update is True, changes are
+        commited to the database prior to close (default is False).
+        '''
+        if update:
+            self.update()
+        with self.writelock:
+            # Another thread's open cursor on a shared connection would leave its statement unfinalized
+            for cursor in self._cursors:
+                cursor.close()
+            for connection in self._connections:
+                connection.close()
+            self._connections = []
+            self._cursors = []
+            self._connection = None
+            self._cursor = None
+            self._local = threading.local()
+
+    def backup(self, backup_file, pages=256, progress=None):
+        '''Copies the database to backup_file.  The copy is written to a temporary file alongside backup_file
+        which then replaces it, so an existing backup_file is left intact if the copy fails part way.
+        Where the sqlite3 online backup API is available (Python 3.7+) and there are no uncommited changes
+        the copy is made page by page, pages at a time; otherwise the materials are streamed into the copy,
+        pages rows at a time.  If specified, progress(status, remaining, total) is called after each step.
+        The copy is written with the 'bulk-load' profile and left with this database's profile.
+        '''
+        backup_dir = os.path.dirname(os.path.abspath(backup_file))
+        temp_file = _create_temp_file(backup_dir, suffix='.db')
+        try:
+            copydb = MaterialDB(temp_file, profile='bulk-load')
+            copydb.connect()
+            try:
+                if hasattr(self.dbconnection, 'backup') and not self.dbconnection.in_transaction:
+                    self.dbconnection.backup(copydb.dbconnection, pages=pages, progress=progress)
+                else:
+                    copydb.create()
+                    copydb.add_many(self._iter_progress(pages, progress), update=True)
+                # Also checkpoints the copy's write-ahead log back into the file before it's renamed
+                copydb.set_profile(self.profile)
+            finally:
+                copydb.close()
+            _copy_mode(temp_file, backup_file)
+            _replace_file(temp_file, backup_file)
+        except BaseException:
+            if os.path.exists(temp_file):
+                os.remove(temp_file)
+            raise
+
+    def _iter_progress(self, step, progress=None):
+        '''Generator that yields all the materials in the database, calling progress(0, remaining, total)
+        every step materials'''
+        if progress is None:
+            for amaterial in self.iter_all(ordered=False):
+                yield amaterial
+            return
+        total = self.dbconnection.execute('select count(*) from materials').fetchone()[0]
+        for idx, amaterial in enumerate(self.iter_all(ordered=False)):
+            yield amaterial
+            if (idx + 1) % step == 0 or idx + 1 == total:
+                progress(0, total - idx - 1, total)
+
+    def exportsql(self, export_file, compression=None, materials_only=False, buffersize=1048576):
+        '''Dumps the database to a SQL script text file.  compression is one of None (default, use gzip or
+        xz if export_file ends in .gz or .xz), 'gzip' or 'xz'.  If materials_only is True, only a
+        transaction of INSERT OR REPLACE statements for the materials is written rather than the full dump
+        including the schema.  The full dump leaves out the full-text search index, which create() rebuilds
+        from the materials.  Output is written in blocks of about buffersize bytes.
+        '''
+        if materials_only:
+            lines = self.iter_materials_sql()
+        else:
+            lines = (statement for statement in self.dbconnection.iterdump()
+                     if _search_index_dump.match(statement) is None)
+        # closing as GzipFile isn't a context manager before Python 2.7
+        with contextlib.closing(open_sqlfile(export_file, 'wb', compression)) as fidout:
+            block = []
+            blocksize = 0
+            for line in lines:
+                line = ('%s\n' % line).encode('utf-8')
+                block.append(line)
+                blocksize += len(line)
+                if blocksize >= buffersize:
+                    fidout.write(b''.join(block))
+                    block = []
+                    blocksize = 0
+            fidout.write(b''.join(block))
+
+    def iter_materials_sql(self):
+        '''Generator that yields the SQL statements to recreate the current materials, one INSERT OR
+        REPLACE per material wrapped in a single transaction.'''
+        yield 'BEGIN TRANSACTION;'
+        cursor = self.dbconnection.cursor()
+        try:
+            cursor.execute('select * from materials order by name asc')
+            for row in cursor:
+                yield 'INSERT OR REPLACE INTO materials VALUES(%s);' % ','.join(sql_literal(value) for value in row)
+        finally:
+            cursor.close()
+        yield 'COMMIT;'
+
+    def importsql(self, import_file, batchsize=1000):
+        '''Imports the materials from a (optionally gzip or xz compressed) SQL script, returning the total number
+        of changes made.  The script is read and parsed one statement at a time; INSERTs into the materials
+        table are applied directly to this database as INSERT OR REPLACE, commiting every batchsize statements.
+        All other statements (schema, transaction control) are skipped as the schema is managed by create().
+        The import is made with the 'bulk-load' connection profile, the current profile is restored afterwards.
+        Connects to the database if not already connected; pending changes are commited with the import.
+        '''
+        if self._connection is None:
+            self.connect()
+        self.create()
+        with self.writelock:
+            with self.using_profile('bulk-load'):
+                changes = 0
+                pending = 0
+                with contextlib.closing(open_sqlfile(import_file)) as fidin:
+                    lines = (line if isinstance(line, str) else line.decode('utf-8') for line in fidin)
+                    for statement in iter_statements(lines):
+                        materials_insert = _materials_insert.match(statement)
+                        if materials_insert is None:
+                            continue
+                        self._cursor.execute('insert or replace into materials ' +
+                                              statement[materials_insert.end():])
+                        # rowcount rather than total_changes, which also counts the full-text index's trigger
+                        # changes
+                        changes += self._cursor.rowcount
+                        pending += 1
+                        if pending == batchsize:
+                            self.update()
+                            pending = 0
+                self.update()
+                return changes
+
+    def importdb(self, import_file):
+        '''Attempts to import a SQLite database into the current.  Only materials not already in the database
+        are imported.  The other database is ATTACHed and merged with a single INSERT ... SELECT, so the rows
+        are copied entirely within SQLite.  Commits the changes and returns the number of materials added.
+        The import is made with the 'bulk-load' connection profile, the current profile is restored afterwards.
+        '''
+        with self.writelock:
+            with self.using_profile('bulk-load'):
+                # ATTACH isn't allowed inside a transaction
+                self.update()
+                self._cursor.execute('attach database ? as importdb', (import_file,))
+                try:
+                    try:
+                        self._cursor.execute(
+                                '''insert or ignore into materials select name, notes, conductivity_iacs,
+                                rel_permeability from importdb.materials order by name asc'''
+                                )
+                        materials_added = self._cursor.rowcount
+                        self.update()
+                    except sqlite3.DatabaseError:
+                        #Unable to read the import database
+                        self.undo()
+                        raise
+                finally:
+                    self._cursor.execute('detach database importdb')
+                return materials_added
@@ -0,0 +1,137 @@
+'''NameIndex.py - an in-memory index of material names for type-ahead completion
+'''
+import bisect
+import heapq
+import re
+
+# Splits a material name into the words whose prefixes are completed, e.g. "Aluminum, 2024-T4XX" ->
+# "aluminum", "2024", "t4xx"
+_name_tokens = re.compile(r'\w+', re.UNICODE)
+
+def _remove(entries, entry):
+    '''Removes entry from the sorted list entries, if present'''
+    idx = bisect.bisect_left(entries, entry)
+    if idx < len(entries) and entries[idx] == entry:
+        del entries[idx]
+
+def _iter_prefixed(items, prefix, tuples=False):
+    '''Generator that yields the strings of the sorted list items starting with prefix, in order.  If tuples
+    is True items is a sorted list of tuples and those whose first string starts with prefix are yielded.'''
+    idx = bisect.bisect_left(items, (prefix,) if tuples else prefix)
+    while idx < len(items):
+        item = items[idx]
+        if not (item[0] if tuples else item).startswith(prefix):
+            break
+        yield item
+        idx += 1
+
+def _iter_unique(entries):
+    '''Generator that yields the entries of a sorted iterable, skipping repeats'''
+    last = None
+    for entry in entries:
+        if entry != last:
+            yield entry
+            last = entry
+
+def _has_word_prefix(lowername, prefix):
+    '''Returns True if the lowercase name starts with prefix from the start of any of its words'''
+    return any(lowername.startswith(prefix, match.start()) for match in _name_tokens.finditer(lowername))
+
+class NameIndex(object):
+    '''Case-insensitive completion of material names, either from the start of the name or from the start
+    of any word in the name (e.g. "t4" or "2024-t" completing "Aluminum, 2024-T4XX").  Completions are
+    returned in alphabetical order.  The index holds one sorted list of (lowercase name, name) entries of
+    every name, and one per word of the entries of the names containing the word, so completions are found
+    by bisection and by merging the lists of the words starting with the prefix.'''
+    def __init__(self, names=None):
+        '''Optional parameter:  names (None) - iterable of the material names to index'''
+        self._names = set()
+        self._entries = []
+        # Lowercase word -> sorted list of the entries of the names with the word, and the sorted words
+        self._words = {}
+        self._wordlist = []
+        if names is not None:
+            for name in names:
+                if name in self._names:
+                    continue
+                self._names.add(name)
+                entry = (name.lower(), name)
+                self._entries.append(entry)
+                for word in self._name_words(entry[0]):
+                    self._words.setdefault(word, []).append(entry)
+            self._entries.sort()
+            for entries in self._words.values():
+                entries.sort()
+            self._wordlist = sorted(self._words)
+
+    @classmethod
+    def fromdb(cls, materialdb):
+        '''Returns a new index of the names of all the materials in the (connected) MaterialDB materialdb'''
+        return cls(materialdb.retrievenames())
+
+    def __len__(self):
+        return len(self._names)
+
+    def __contains__(self, materialname):
+        return materialname in self._names
+
+    @staticmethod
+    def _name_words(lowername):
+        '''Returns the set of the words in a lowercase name'''
+        return set(_name_tokens.findall(lowername))
+
+    def add(self, materialname):
+        '''Adds a material name to the index'''
+        if materialname in self._names:
+            return
+        self._names.add(materialname)
+        entry = (materialname.lower(), materialname)
+        bisect.insort(self._entries, entry)
+        for word in self._name_words(entry[0]):
+            entries = self._words.get(word)
+            if entries is None:
+                self._words[word] = [entry]
+                bisect.insort(self._wordlist, word)
+            else:
+                bisect.insort(entries, entry)
+
+    def remove(self, materialname):
+        '''Removes a material name from the index, if present'''
+        if materialname not in self._names:
+            return
+        self._names.discard(materialname)
+        entry = (materialname.lower(), materialname)
+        _remove(self._entries, entry)
+        for word in self._name_words(entry[0]):
+            entries = self._words[word]
+            _remove(entries, entry)
+            if not entries:
+                del self._words[word]
+                _remove(self._wordlist, word)
+
+    def complete(self, prefix, limit=10, tokens=False):
+        '''Returns up to limit (None for all) material names starting with prefix, ignoring case, in
+        alphabetical order.  If tokens is True, names with any word starting with prefix are returned.'''
+        prefix = prefix.lower()
+        if tokens:
+            prefix = prefix.lstrip()
+        if not (tokens and prefix):
+            matches = _iter_prefixed(self._entries, prefix, tuples=True)
+        else:
+            word = _name_tokens.match(prefix)
+            if word is None:
+                # Words are only completed from their first character
+                return []
+            word = word.group()
+            if word == prefix:
+                matches = _iter_unique(heapq.merge(*[self._words[match]
+                                                     for match in _iter_prefixed(self._wordlist, word)]))
+            else:
+                # The prefix runs on past its first word, which must then be a whole word of the name
+                matches = (entry for entry in self._words.get(word, []) if _has_word_prefix(entry[0], prefix))
+        names = []
+        for lowername, name in matches:
+            if len(names) == limit:
+                break
+            names.append(name)
+        return names
@@ -1,8 +1,8 @@
-'''constants.py - Defines some basic physical constants'''
-
-import math
-	
-ConductivityOfCopperSI = 58.0E6
-ConductivityOfCopperIACS = 100.0
-PermeabilityOfFreeSpace = 4*math.pi*1E-7
+'''constants.py - Defines some basic physical constants'''
+
+import math
+	
+ConductivityOfCopperSI = 58.0E6
+ConductivityOfCopperIACS = 100.0
+PermeabilityOfFreeSpace = 4*math.pi*1E-7
 MillimetresPerInch = 25.4
\ No newline at end of file
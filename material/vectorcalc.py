@@ -0,0 +1,133 @@
+'''vectorcalc.py - array versions of the skin depth / excitation frequency calculations
+
+Uses NumPy if it is installed, otherwise falls back to a (slower) element-by-element
+calculation that returns array.array('d') results.
+'''
+import array
+import math
+import os.path
+import sys
+
+def _load_source(name, path):
+    '''Loads the module name from the Python source file path into sys.modules, returning the module'''
+    try:
+        import importlib.util
+    except ImportError:
+        # Python 2
+        import imp
+        return imp.load_source(name, path)
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+def _import_numpy():
+    '''Returns the numpy module, or None if NumPy isn't installed.  SkinDepth's platform package shadows
+    the standard library's platform module which NumPy reads on import, so the standard library module
+    is swapped in for the duration of the import.'''
+    shadow = sys.modules.pop('platform', None)
+    stdlib_platform = os.path.join(os.path.dirname(os.__file__), 'platform.py')
+    try:
+        if os.path.exists(stdlib_platform):
+            _load_source('platform', stdlib_platform)
+        try:
+            import numpy
+        except ImportError:
+            return None
+        return numpy
+    finally:
+        sys.modules.pop('platform', None)
+        if shadow is not None:
+            sys.modules['platform'] = shadow
+
+numpy = _import_numpy()
+
+def asarray(values):
+    '''Returns values (NumPy array, array.array, list or other sequence / buffer of numbers)
+    as an array of floats.'''
+    if numpy is not None:
+        return numpy.asarray(values, dtype=float)
+    if isinstance(values, array.array) and values.typecode == 'd':
+        return values
+    return array.array('d', values)
+
+def coefficient(sigma_mu):
+    '''Returns the skin depth coefficient k = 1/sqrt(pi*sigma_mu) for the product of the electrical
+    conductivity (S/m) and the magnetic permeability (H/m); the skin depth at frequency f is then
+    k/sqrt(f) and the frequency for skin depth delta is (k/delta)**2.  A zero product returns inf, a
+    negative product NaN.'''
+    if sigma_mu == 0:
+        return float('inf')
+    elif sigma_mu < 0:
+        return float('NaN')
+    return 1.0 / math.sqrt(math.pi * sigma_mu)
+
+def coefficients(sigma_mu):
+    '''Returns the array of skin depth coefficients for an array of conductivity * permeability
+    products, as per coefficient.'''
+    if numpy is None:
+        return array.array('d', [coefficient(product) for product in sigma_mu])
+    sigma_mu = numpy.asarray(sigma_mu, dtype=float)
+    with numpy.errstate(divide='ignore', invalid='ignore'):
+        return 1.0 / numpy.sqrt(math.pi * sigma_mu)
+
+def skindepths(coefficients, frequencies):
+    '''Returns the skin depths in metres for the excitation frequencies in Hz, given the skin depth
+    coefficient(s) of the material(s).  Zero frequency or an infinite coefficient returns inf, negative
+    frequency returns NaN.  With NumPy the arguments are broadcast against each other, e.g. a column
+    of coefficients and a row of frequencies returns a matrix.'''
+    if numpy is None:
+        return array.array('d', [_skindepth(coefficients, freq) for freq in frequencies])
+    frequencies = numpy.asarray(frequencies, dtype=float)
+    coefficients = numpy.asarray(coefficients, dtype=float)
+    with numpy.errstate(divide='ignore', invalid='ignore'):
+        depths = coefficients / numpy.sqrt(frequencies)
+    depths = numpy.where(frequencies < 0, numpy.nan, depths)
+    return numpy.where((frequencies == 0) | numpy.isposinf(coefficients), numpy.inf, depths)
+
+def frequencies(coefficients, depths):
+    '''Returns the excitation frequencies in Hz that produce the skin depths in metres, given the skin
+    depth coefficient(s) of the material(s).  Zero depth or an infinite coefficient returns inf,
+    negative depth returns NaN.  Arguments are broadcast as per skindepths.'''
+    if numpy is None:
+        return array.array('d', [_frequency(coefficients, depth) for depth in depths])
+    depths = numpy.asarray(depths, dtype=float)
+    coefficients = numpy.asarray(coefficients, dtype=float)
+    with numpy.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        freqs = numpy.square(coefficients / depths)
+    freqs = numpy.where(depths < 0, numpy.nan, freqs)
+    return numpy.where((depths == 0) | numpy.isposinf(coefficients), numpy.inf, freqs)
+
+def attenuations(depths, thickness):
+    '''Returns the fraction exp(-thickness/depth) of the field remaining after passing through thickness
+    metres of material, for each of the skin depths in metres.  An infinite skin depth returns 1.0, an
+    undefined (NaN) skin depth NaN.'''
+    if numpy is None:
+        return array.array('d', [_attenuation(depth, thickness) for depth in depths])
+    depths = numpy.asarray(depths, dtype=float)
+    with numpy.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        return numpy.exp(-thickness / depths)
+
+def _attenuation(depth, thickness):
+    '''Scalar attenuation, used when NumPy isn't available'''
+    if depth == 0:
+        return 0.0 if thickness > 0 else float('NaN')
+    return math.exp(-thickness / depth)
+
+def _skindepth(coefficient, frequency):
+    '''Scalar skin depth, used when NumPy isn't available'''
+    if frequency == 0 or coefficient == float('inf'):
+        return float('inf')
+    elif frequency < 0:
+        return float('NaN')
+    return coefficient / math.sqrt(frequency)
+
+def _frequency(coefficient, depth):
+    '''Scalar excitation frequency, used when NumPy isn't available'''
+    if depth == 0 or coefficient == float('inf'):
+        return float('inf')
+    elif depth < 0:
+        return float('NaN')
+    ratio = coefficient / depth
+    return ratio * ratio
@@ -0,0 +1,169 @@
+'''AsyncSkinDepthController.py - asyncio front-end to the SkinDepth controller
+
+Every call returns an asyncio future to await, so the event loop isn't blocked on SQLite.  Written
+without async / await syntax so the module still compiles under Python 2; requires Python 3.4+ to use.
+'''
+import collections
+try:
+    import asyncio
+    import concurrent.futures
+except ImportError:
+    asyncio = None
+from platform import SkinDepthController
+
+class AsyncSkinDepthController(object):
+    '''Runs a threaded SkinDepthController's calls on dedicated worker threads and returns asyncio futures of
+    the results.  Lookups and calculations run on a pool of reader threads; changes to the database run in
+    order on a single writer thread, so uncommited changes and update / undo share one connection.
+    Concurrent identical fetch / calcdelta / calcfrequency calls are coalesced into one database lookup, and
+    at most maxpending calls are queued on the worker threads at a time - the rest wait on the event loop, up
+    to maxwaiting of them.  Further calls raise asyncio.QueueFull until the waiting calls are started, so
+    callers that outpace the database are pushed back rather than queued without limit.
+    All methods must be called from the event loop's thread.'''
+    def __init__(self, dbfilename, readers=4, maxpending=64, maxwaiting=1024, cachesize=128, loop=None):
+        '''Required parameter - filename of the database.  Optional parameters readers (4) - the number of
+        reader threads, maxpending (64) - the maximum number of calls queued on the worker threads,
+        maxwaiting (1024) - the maximum number of calls waiting on the event loop for the worker threads,
+        cachesize (128) - the size of the controller's material cache, loop (None) - the event loop to
+        return futures of, default is the current event loop.
+        Raises RuntimeError if asyncio isn't available.'''
+        if asyncio is None:
+            raise RuntimeError("AsyncSkinDepthController requires asyncio (Python 3.4+)")
+        self.controller = SkinDepthController.SkinDepthController(dbfilename, cachesize=cachesize, threaded=True)
+        self.loop = loop
+        self.maxpending = maxpending
+        self.maxwaiting = maxwaiting
+        self.readers = concurrent.futures.ThreadPoolExecutor(max_workers=readers)
+        self.writer = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        self._running = 0
+        self._waiting = collections.deque()
+        self._inflight = {}
+
+    def _get_loop(self):
+        if self.loop is None:
+            self.loop = asyncio.get_event_loop()
+        return self.loop
+
+    def _submit(self, executor, key, fn, *args):
+        '''Returns a future of fn(*args) run on executor.  If key isn't None, a call with the same key still in
+        progress is shared rather than run again.  Raises asyncio.QueueFull if the call would have to wait and
+        maxwaiting calls are already waiting.'''
+        loop = self._get_loop()
+        if key is not None and key in self._inflight:
+            # Shielded so one caller cancelling doesn't cancel the others' result
+            return asyncio.shield(self._inflight[key])
+        if self._running >= self.maxpending and len(self._waiting) >= self.maxwaiting:
+            raise asyncio.QueueFull("{0} calls are already waiting".format(len(self._waiting)))
+        result = loop.create_future() if hasattr(loop, 'create_future') else asyncio.Future(loop=loop)
+        if key is not None:
+            self._inflight[key] = result
+        self._waiting.append((executor, key, fn, args, result))
+        self._start_waiting()
+        if key is not None:
+            return asyncio.shield(result)
+        return result
+
+    def _start_waiting(self):
+        '''Hands waiting calls to their executors while fewer than maxpending are running'''
+        loop = self._get_loop()
+        while self._waiting and self._running < self.maxpending:
+            executor, key, fn, args, result = self._waiting.popleft()
+            if result.cancelled():
+                self._finish(key)
+                continue
+            self._running += 1
+            call = asyncio.wrap_future(executor.submit(fn, *args), loop=loop)
+            call.add_done_callback(lambda call, key=key, result=result: self._done(call, key, result))
+
+    def _done(self, call, key, result):
+        '''Passes a finished call's outcome to its result future and starts the next waiting call'''
+        self._running -= 1
+        self._finish(key)
+        if not result.done():
+            if call.cancelled():
+                result.cancel()
+            elif call.exception() is not None:
+                result.set_exception(call.exception())
+            else:
+                result.set_result(call.result())
+        self._start_waiting()
+
+    def _finish(self, key):
+        if key is not None:
+            self._inflight.pop(key, None)
+
+    def read(self, fn, *args):
+        '''Returns a future of fn(*args) run on a reader thread, e.g. for other SkinDepthController methods'''
+        return self._submit(self.readers, None, fn, *args)
+
+    def write(self, fn, *args):
+        '''Returns a future of fn(*args) run on the writer thread'''
+        return self._submit(self.writer, None, fn, *args)
+
+    def open(self):
+        '''Opens / creates the database, returns a future to await before other calls'''
+        return self.write(self.controller.open)
+
+    def close(self, wait=True):
+        '''Closes the database without commiting any changes and shuts down the worker threads'''
+        self.readers.shutdown(wait=wait)
+        self.writer.submit(self.controller.db.close)
+        self.writer.shutdown(wait=wait)
+
+    def fetch(self, materialname):
+        '''Future of the selected material as a dict, or None if not found'''
+        return self._submit(self.readers, ('fetch', materialname), self.controller.fetch, materialname)
+
+    def calcdelta(self, materialname, frequency):
+        '''Future of the skin depth at the given frequency in Hz for the material materialname'''
+        return self._submit(self.readers, ('calcdelta', materialname, frequency), self.controller.calcdelta,
+                            materialname, frequency)
+
+    def calcfrequency(self, materialname, skindepth):
+        '''Future of the excitation frequency in Hz that would induce the given skin depth'''
+        return self._submit(self.readers, ('calcfrequency', materialname, skindepth), self.controller.calcfrequency,
+                            materialname, skindepth)
+
+    def retrieve_many(self, materialnames):
+        '''Future of the tuple (materials, unknown) as per SkinDepthController.retrieve_many'''
+        return self.read(self.controller.retrieve_many, list(materialnames))
+
+    def calcdelta_many(self, materialnames, frequencies):
+        '''Future of the tuple (results, unknown) as per SkinDepthController.calcdelta_many'''
+        return self.read(self.controller.calcdelta_many, list(materialnames), frequencies)
+
+    def calcfrequency_many(self, materialnames, skindepths):
+        '''Future of the tuple (results, unknown) as per SkinDepthController.calcfrequency_many'''
+        return self.read(self.controller.calcfrequency_many, list(materialnames), skindepths)
+
+    def fetchlist(self, after=None, limit=None):
+        '''Future of the list of material names as per SkinDepthController.fetchlist'''
+        return self.read(self.controller.fetchlist, after, limit)
+
+    def search(self, query, limit=20):
+        '''Future of the names of the materials matching query as per SkinDepthController.search'''
+        return self.read(self.controller.search, query, limit)
+
+    def add(self, material_dict):
+        '''Future of adding a new material to the database'''
+        return self.write(self.controller.add, material_dict)
+
+    def remove(self, materialname):
+        '''Future of removing the given material from the database'''
+        return self.write(self.controller.remove, materialname)
+
+    def update(self):
+        '''Future of commiting the changes to the database'''
+        return self.write(self.controller.update)
+
+    def undo(self):
+        '''Future of dropping the changes to the database made since last update'''
+        return self.write(self.controller.undo)
+
+    def importdb(self, import_fn):
+        '''Future of the number of materials added by importing another SQLite3 database'''
+        return self.write(self.controller.importdb, import_fn)
+
+    def importsql(self, import_fn):
+        '''Future of the number of changes made by importing a SQL script'''
+        return self.write(self.controller.importsql, import_fn)
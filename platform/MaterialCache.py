@@ -0,0 +1,69 @@
+'''MaterialCache.py - a bounded least-recently-used cache of Materials for the SkinDepth controller'''
+
+import collections
+import threading
+
+class MaterialCache(object):
+    '''Holds up to maxsize Materials keyed by name, evicting the least recently used material
+    when full.  Keeps counts of cache hits, misses and evictions.  Safe to share between threads.
+    generation counts the invalidations, so a material read from the database can be put only if nothing
+    was invalidated while it was read.'''
+    def __init__(self, maxsize=128):
+        self.maxsize = maxsize
+        self.generation = 0
+        self._materials = collections.OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._materials)
+
+    def __contains__(self, materialname):
+        return materialname in self._materials
+
+    def get(self, materialname):
+        '''Returns the cached Material of the given name, or None if not in the cache'''
+        with self._lock:
+            try:
+                amaterial = self._materials.pop(materialname)
+            except KeyError:
+                self.misses += 1
+                return None
+            # Re-insert to mark as most recently used
+            self._materials[materialname] = amaterial
+            self.hits += 1
+            return amaterial
+
+    def put(self, amaterial, generation=None):
+        '''Adds / replaces a Material in the cache, evicting the least recently used material if full.
+        If generation is specified, the material is only added if the cache's generation is unchanged.'''
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            if generation is not None and generation != self.generation:
+                return
+            self._materials.pop(amaterial.name, None)
+            self._materials[amaterial.name] = amaterial
+            while len(self._materials) > self.maxsize:
+                self._materials.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, materialname=None):
+        '''Drops the named material from the cache, or every material if materialname is None'''
+        with self._lock:
+            self.generation += 1
+            if materialname is None:
+                self._materials.clear()
+            else:
+                self._materials.pop(materialname, None)
+
+    def stats(self):
+        '''Returns a dict of the cache's hits, misses, evictions, current size and maxsize'''
+        with self._lock:
+            return {"hits":self.hits,
+                    "misses":self.misses,
+                    "evictions":self.evictions,
+                    "size":len(self._materials),
+                    "maxsize":self.maxsize}
@@ -1,110 +1,265 @@
-'''SkinDepthController.py - Handles the interface between UI and the backend for SkinDepth'''
-
-__author__ = 'Chris'
-import os.path
-import sys
-from material import Material
-from material import MaterialDB
-from platform import FetchFile
-
-class SkinDepthController(object):
-    '''Controller to handle interface between UI and backend'''
-    def __init__(self, dbfilename):
-        self.db = MaterialDB.MaterialDB(dbfilename)
-
-    def open(self):
-        '''Opens/creates the database @ dbfilename'''
-        self.db.connect()
-        self.db.create()
-
-    def importdb(self, import_fn):
-        '''Imports another SQLite3 database into the current, returning the number of additions made.'''
-        return self.db.importdb(import_fn)
-
-    def import_remotedb(self, db_url = 'http://www.chriscoughlin.com/dnlds/skindepth2_materials.db'):
-        '''Fetches the remote copy of the database, returning the number of additions made.'''
-        try:
-            dest_path = os.path.join(sys.path[0], 'materials_update.db')
-            fetcher = FetchFile.FetchFile(db_url, dst=dest_path, overwrite=True)
-            fetcher.fetch()
-            return self.importdb(dest_path)
-        except Exception:
-            raise
-
-    def exportsql(self, export_fn):
-        '''Exports the current database as a SQL script'''
-        self.db.exportsql(export_fn)
-
-    def importsql(self, import_fn):
-        '''Creates and populates the database using an ASCII text SQL script, returning the number of changes made.'''
-        return self.db.importsql(import_fn)
-
-    def savecopy(self, copy_fn):
-        '''Saves a copy of the current list of materials to the new file copy_fn,
-        closes the current database connection and reopens at the new location.'''
-        if os.path.exists(copy_fn):
-            os.remove(copy_fn)
-        tempdb = MaterialDB.MaterialDB(copy_fn)
-        tempdb.connect()
-        tempdb.create()
-        materials = self.db.retrieveall()
-        for material in materials:
-            tempdb.add(material)
-        tempdb.update()
-        self.db.close()
-        self.db = MaterialDB.MaterialDB(copy_fn)
-        self.open()
-
-    def add(self, material_dict):
-        '''Adds a new material to the database'''
-        newmat = Material.Material(name=material_dict["name"],
-                                   notes=material_dict["notes"],
-                                   sigma_iacs=material_dict["iacs"],
-                                   mu_rel=material_dict["mu_r"])
-        self.db.add(newmat)
-
-    def fetch(self, materialname):
-        '''Returns the selected material as a dict'''
-        foundmat = self.db.retrieve(materialname)
-        if foundmat is None:
-            foundmat_dict = None
-        else:
-            foundmat_dict = {"name":foundmat.name,
-                             "notes":foundmat.notes,
-                             "iacs":foundmat.iacs,
-                             "mu_r":foundmat.mu_r}
-        return foundmat_dict
-
-    def remove(self, materialname):
-        '''Removes the given material from the database'''
-
-        self.db.delete(materialname)
-    def calcdelta(self, materialname, frequency):
-        '''Returns the skin depth in mm at the given frequency in Hz for the material materialname'''
-        thematerial = self.db.retrieve(materialname)
-        if thematerial is None:
-            return None
-        else:
-            return thematerial.calc_skindepth(frequency)
-
-    def calcfrequency(self, materialname, skindepth):
-        '''Returns the excitation frequency in Hz that would induce the given skin depth'''
-        thematerial = self.db.retrieve(materialname)
-        if thematerial is None:
-            return None
-        else:
-            return thematerial.calc_frequency(skindepth)
-
-    def update(self):
-        '''Commits the changes to the database'''
-        self.db.update()
-
-    def undo(self):
-        '''Drops the changes to the database made since last update'''
-        self.db.undo()
-
-    def fetchlist(self):
-        '''Returns a list of the materials (names) currently in the database'''
-        thematerials = self.db.retrieveall()
-        materialnames = [material.name for material in thematerials]
-        return materialnames
\ No newline at end of file
+'''SkinDepthController.py - Handles the interface between UI and the backend for SkinDepth'''
+
+__author__ = 'Chris'
+import collections
+import os.path
+import sys
+import threading
+from material import Material
+from material import MaterialDB
+from material import NameIndex
+from material import vectorcalc
+from platform import FetchFile
+from platform import MaterialCache
+
+def _copy(amaterial):
+    '''Returns a copy of a Material'''
+    return Material.Material(name=amaterial.name, notes=amaterial.notes, sigma_iacs=amaterial.iacs,
+                             mu_rel=amaterial.mu_r)
+
+class SkinDepthController(object):
+    '''Controller to handle interface between UI and backend'''
+    def __init__(self, dbfilename, cachesize=128, threaded=False, profile='interactive'):
+        '''Required parameter - filename of the database.  Optional parameters cachesize (128) -
+        the maximum number of materials held in the controller's least-recently-used cache, threaded (False) -
+        if True the controller can be shared between threads, e.g. to serve concurrent requests, profile
+        ('interactive') - the database connection profile, see MaterialDB.PROFILES.'''
+        self.threaded = threaded
+        self.db = MaterialDB.MaterialDB(dbfilename, threaded=threaded, profile=profile)
+        self.cache = MaterialCache.MaterialCache(cachesize)
+        # Autocompletion index of the material names, (re)built on first use after opening / importing / undo
+        self.names = None
+        self.names_lock = threading.RLock()
+        # Names of the materials changed since the last commit, which aren't cached until commited - in threaded
+        # mode other threads' connections still read the commited rows
+        self.pending = set()
+        self.pending_lock = threading.Lock()
+
+    def open(self):
+        '''Opens/creates the database @ dbfilename'''
+        self.db.connect()
+        self.db.create()
+        self._invalidate_all()
+
+    def importdb(self, import_fn):
+        '''Imports another SQLite3 database into the current, returning the number of additions made.'''
+        try:
+            return self.db.importdb(import_fn)
+        finally:
+            self._invalidate_all()
+
+    def import_remotedb(self, db_url = 'http://www.chriscoughlin.com/dnlds/skindepth2_materials.db'):
+        '''Fetches the remote copy of the database, returning the number of additions made.'''
+        try:
+            dest_path = os.path.join(sys.path[0], 'materials_update.db')
+            fetcher = FetchFile.FetchFile(db_url, dst=dest_path, overwrite=True)
+            fetcher.fetch()
+            return self.importdb(dest_path)
+        except Exception:
+            raise
+
+    def exportsql(self, export_fn, compression=None, materials_only=False):
+        '''Exports the current database as a SQL script, optionally gzip or xz compressed and optionally
+        as just the materials rather than the complete database.'''
+        self.db.exportsql(export_fn, compression=compression, materials_only=materials_only)
+
+    def importsql(self, import_fn):
+        '''Creates and populates the database using an ASCII text SQL script, returning the number of changes made.'''
+        try:
+            return self.db.importsql(import_fn)
+        finally:
+            self._invalidate_all()
+
+    def savecopy(self, copy_fn, progress=None):
+        '''Saves a copy of the current list of materials to the new file copy_fn,
+        closes the current database connection and reopens at the new location.
+        The copy is made through a temporary file so an existing copy_fn is only
+        replaced once the copy is complete.  If specified, progress(status, remaining, total)
+        is called as the copy proceeds.  The copy is written with the database's 'bulk-load' profile.'''
+        self.db.backup(copy_fn, progress=progress)
+        self.db.close()
+        self.db = MaterialDB.MaterialDB(copy_fn, threaded=self.threaded, profile=self.db.profile)
+        self.open()
+
+    def add(self, material_dict):
+        '''Adds a new material to the database'''
+        newmat = Material.Material(name=material_dict["name"],
+                                   notes=material_dict["notes"],
+                                   sigma_iacs=material_dict["iacs"],
+                                   mu_rel=material_dict["mu_r"])
+        self._changed(newmat.name)
+        self.db.add(newmat)
+        with self.names_lock:
+            if self.names is not None:
+                self.names.add(newmat.name)
+
+    def fetch(self, materialname):
+        '''Returns the selected material as a dict'''
+        foundmat = self._retrieve(materialname)
+        if foundmat is None:
+            foundmat_dict = None
+        else:
+            foundmat_dict = {"name":foundmat.name,
+                             "notes":foundmat.notes,
+                             "iacs":foundmat.iacs,
+                             "mu_r":foundmat.mu_r}
+        return foundmat_dict
+
+    def remove(self, materialname):
+        '''Removes the given material from the database'''
+        self._changed(materialname)
+        self.db.delete(materialname)
+        with self.names_lock:
+            if self.names is not None:
+                self.names.remove(materialname)
+
+    def retrieve(self, materialname):
+        '''Returns (a copy of) the Material of the given name from the cache, falling back to
+        the database, or None if not found.'''
+        thematerial = self._retrieve(materialname)
+        if thematerial is None:
+            return None
+        return _copy(thematerial)
+
+    def retrieve_many(self, materialnames):
+        '''Returns a tuple (materials, unknown) where materials is an OrderedDict of (copies of) the Materials
+        in materialnames keyed by name, and unknown is a list of the names not found in the database.
+        Cached materials are used where possible, the remainder are fetched together from the database.'''
+        materials, unknown = self._retrieve_many(materialnames)
+        for materialname, thematerial in materials.items():
+            materials[materialname] = _copy(thematerial)
+        return materials, unknown
+
+    def _retrieve(self, materialname):
+        '''Returns the Material of the given name as per retrieve, but the cached Material itself - it's
+        shared with every other caller (and thread), so it must not be changed.'''
+        thematerial = self.cache.get(materialname)
+        if thematerial is None:
+            generation = self.cache.generation
+            thematerial = self.db.retrieve(materialname)
+            if thematerial is not None and materialname not in self.pending:
+                self.cache.put(thematerial, generation)
+        return thematerial
+
+    def _retrieve_many(self, materialnames):
+        '''Returns the Materials in materialnames as per retrieve_many, but the cached Materials themselves,
+        see _retrieve.'''
+        materialnames = list(collections.OrderedDict.fromkeys(materialnames))
+        cached = {}
+        uncached = []
+        for materialname in materialnames:
+            thematerial = self.cache.get(materialname)
+            if thematerial is None:
+                uncached.append(materialname)
+            else:
+                cached[materialname] = thematerial
+        generation = self.cache.generation
+        found, unknown = self.db.retrieve_many(uncached)
+        for thematerial in found.values():
+            if thematerial.name not in self.pending:
+                self.cache.put(thematerial, generation)
+        cached.update(found)
+        materials = collections.OrderedDict((materialname, cached[materialname])
+                                            for materialname in materialnames if materialname in cached)
+        return materials, unknown
+
+    def cache_stats(self):
+        '''Returns a dict of the material cache's hits, misses, evictions, size and maxsize'''
+        return self.cache.stats()
+
+    def calcdelta(self, materialname, frequency):
+        '''Returns the skin depth in mm at the given frequency in Hz for the material materialname'''
+        thematerial = self._retrieve(materialname)
+        if thematerial is None:
+            return None
+        else:
+            return thematerial.calc_skindepth(frequency)
+
+    def calcfrequency(self, materialname, skindepth):
+        '''Returns the excitation frequency in Hz that would induce the given skin depth'''
+        thematerial = self._retrieve(materialname)
+        if thematerial is None:
+            return None
+        else:
+            return thematerial.calc_frequency(skindepth)
+
+    def calcdelta_many(self, materialnames, frequencies):
+        '''Returns the skin depths in metres of each material in materialnames at every frequency in Hz in
+        frequencies (NumPy array or any sequence / buffer) as a tuple (results, unknown).  results is an
+        OrderedDict of arrays of skin depths keyed by material name, unknown is a list of the names not
+        found in the database.'''
+        materials, unknown = self._retrieve_many(materialnames)
+        frequencies = vectorcalc.asarray(frequencies)
+        results = collections.OrderedDict((materialname, thematerial.calc_skindepths(frequencies))
+                                          for materialname, thematerial in materials.items())
+        return results, unknown
+
+    def calcfrequency_many(self, materialnames, skindepths):
+        '''Returns the excitation frequencies in Hz for each material in materialnames at every skin depth in
+        metres in skindepths (NumPy array or any sequence / buffer) as a tuple (results, unknown).  results is
+        an OrderedDict of arrays of frequencies keyed by material name, unknown is a list of the names not
+        found in the database.'''
+        materials, unknown = self._retrieve_many(materialnames)
+        skindepths = vectorcalc.asarray(skindepths)
+        results = collections.OrderedDict((materialname, thematerial.calc_frequencies(skindepths))
+                                          for materialname, thematerial in materials.items())
+        return results, unknown
+
+    def find_materials(self, frequency, min_depth=0, max_depth=None, target_depth=None, count=10):
+        '''Returns up to count (name, skin depth) tuples for the materials whose skin depth in metres
+        at the given frequency in Hz lies between min_depth and max_depth, ranked by closeness to
+        target_depth (default midway between min_depth and max_depth).  Raises ValueError if
+        neither target_depth nor max_depth is given.'''
+        if target_depth is None:
+            if max_depth is None:
+                raise ValueError("Specify a target skin depth or a maximum skin depth")
+            target_depth = (min_depth + max_depth) / 2.0
+        matches = self.db.retrieve_skindepth_nearest(frequency, target_depth, count=count,
+                                                     min_depth=min_depth, max_depth=max_depth)
+        return [(amaterial.name, amaterial.calc_skindepth(frequency)) for amaterial in matches]
+
+    def search(self, query, limit=20):
+        '''Returns the names of up to limit materials whose name or notes contain every word (or word prefix)
+        in query, best matches first.'''
+        return [amaterial.name for amaterial in self.db.search(query, limit=limit)]
+
+    def update(self):
+        '''Commits the changes to the database'''
+        self.db.update()
+        with self.pending_lock:
+            for materialname in self.pending:
+                self.cache.invalidate(materialname)
+            self.pending.clear()
+
+    def undo(self):
+        '''Drops the changes to the database made since last update'''
+        self.db.undo()
+        self._invalidate_all()
+
+    def _changed(self, materialname):
+        '''Drops a material about to be changed from the cache until the change is commited'''
+        with self.pending_lock:
+            self.pending.add(materialname)
+            self.cache.invalidate(materialname)
+
+    def _invalidate_all(self):
+        '''Drops every cached material and the autocompletion index after the database is reopened, imported
+        into or rolled back'''
+        with self.pending_lock:
+            self.pending.clear()
+            self.cache.invalidate()
+        self.names = None
+
+    def fetchlist(self, after=None, limit=None):
+        '''Returns a list of the materials (names) currently in the database.  For paging
+        through large databases, after returns only the names following the given name
+        (e.g. the last name of the previous page) and limit the maximum number of names.'''
+        return self.db.retrievenames(after=after, limit=limit)
+
+    def complete(self, prefix, limit=10, tokens=False):
+        '''Returns up to limit material names starting with prefix (ignoring case) for type-ahead, in
+        alphabetical order.  If tokens is True, names with any word starting with prefix are returned.'''
+        with self.names_lock:
+            if self.names is None:
+                self.names = NameIndex.NameIndex.fromdb(self.db)
+            return self.names.complete(prefix, limit=limit, tokens=tokens)
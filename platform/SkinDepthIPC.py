@@ -0,0 +1,449 @@
+'''SkinDepthIPC.py - low-latency local socket server and client for SkinDepth calculations
+
+Requests and responses are length-prefixed binary frames over a Unix-domain socket (or a localhost TCP
+socket where Unix sockets aren't available).  Clients may pipeline any number of requests before reading
+the responses, which are returned in request order, and a batch frame carries many calculations at once.
+
+    python skindepthipc.py --db materials.db --socket /tmp/skindepth.sock
+
+Frames (network byte order):  4 byte unsigned payload length, then the payload.
+    Request payload:   1 byte opcode, 4 byte request id, request body
+    Response payload:  4 byte request id, 1 byte status, response body
+Bodies - a name is a 2 byte length then UTF-8 text, doubles are 8 byte IEEE 754:
+    OP_PING                 -                                       -
+    OP_SKINDEPTH            name, frequency (Hz)                    skin depth (m)
+    OP_FREQUENCY            name, skin depth (m)                    frequency (Hz)
+    OP_SKINDEPTHS           name, 4 byte count, frequencies         4 byte count, skin depths
+    OP_FREQUENCIES          name, 4 byte count, skin depths         4 byte count, frequencies
+    OP_BATCH                4 byte count, then per calculation      4 byte count, then per calculation
+                            1 byte opcode (OP_SKINDEPTH or          1 byte status, result
+                            OP_FREQUENCY), name, value
+Statuses are STATUS_OK, STATUS_UNKNOWN (no such material), STATUS_BAD_REQUEST and STATUS_ERROR; the body of
+a bad request or error response is the UTF-8 error message.
+'''
+import argparse
+import array
+import collections
+import errno
+import os
+import select
+import socket
+import stat
+import struct
+import sys
+try:
+    import SocketServer as socketserver
+except ImportError:
+    import socketserver
+from platform import SkinDepthController
+
+OP_PING = 0
+OP_SKINDEPTH = 1
+OP_FREQUENCY = 2
+OP_SKINDEPTHS = 3
+OP_FREQUENCIES = 4
+OP_BATCH = 5
+
+STATUS_OK = 0
+STATUS_UNKNOWN = 1
+STATUS_BAD_REQUEST = 2
+STATUS_ERROR = 3
+
+MAX_FRAME = 64 * 1024 * 1024
+
+_length = struct.Struct('!I')
+_request_header = struct.Struct('!BI')
+_response_header = struct.Struct('!IB')
+_short = struct.Struct('!H')
+_double = struct.Struct('!d')
+_status_double = struct.Struct('!Bd')
+
+if hasattr(socket, 'AF_UNIX'):
+    _StreamServer = socketserver.UnixStreamServer
+else:
+    # No Unix-domain sockets (Windows) - serve on a localhost TCP socket instead
+    _StreamServer = socketserver.TCPServer
+
+class ProtocolError(Exception):
+    '''A malformed frame'''
+    pass
+
+def pack_name(name):
+    '''Returns a material name as a length-prefixed UTF-8 string'''
+    if isinstance(name, type(u'')):
+        name = name.encode('utf-8')
+    return _short.pack(len(name)) + name
+
+def unpack_name(payload, offset):
+    '''Returns the tuple (name, next offset) of the length-prefixed UTF-8 string at offset in payload'''
+    try:
+        size, = _short.unpack_from(payload, offset)
+    except struct.error:
+        raise ProtocolError("Truncated name")
+    offset += _short.size
+    if offset + size > len(payload):
+        raise ProtocolError("Truncated name")
+    return payload[offset:offset + size].decode('utf-8'), offset + size
+
+def pack_doubles(values):
+    '''Returns a sequence of numbers as a count and network byte order doubles'''
+    doubles = array.array('d', values)
+    if sys.byteorder == 'little':
+        doubles.byteswap()
+    return _length.pack(len(doubles)) + (doubles.tobytes() if hasattr(doubles, 'tobytes') else doubles.tostring())
+
+def unpack_doubles(payload, offset):
+    '''Returns the tuple (array of doubles, next offset) of the count and doubles at offset in payload'''
+    try:
+        count, = _length.unpack_from(payload, offset)
+    except struct.error:
+        raise ProtocolError("Truncated array")
+    offset += _length.size
+    end = offset + 8 * count
+    if end > len(payload):
+        raise ProtocolError("Truncated array")
+    doubles = array.array('d')
+    if hasattr(doubles, 'frombytes'):
+        doubles.frombytes(payload[offset:end])
+    else:
+        doubles.fromstring(payload[offset:end])
+    if sys.byteorder == 'little':
+        doubles.byteswap()
+    return doubles, end
+
+def iter_frames(buffer):
+    '''Generator that yields the complete frame payloads at the start of the bytearray buffer, removing
+    them from the buffer'''
+    offset = 0
+    while len(buffer) - offset >= _length.size:
+        size, = _length.unpack_from(buffer, offset)
+        if size > MAX_FRAME:
+            raise ProtocolError("Frame of {0} bytes is too large".format(size))
+        if len(buffer) - offset - _length.size < size:
+            break
+        start = offset + _length.size
+        offset = start + size
+        yield bytes(buffer[start:offset])
+    del buffer[:offset]
+
+def frame(payload):
+    '''Returns payload as a length-prefixed frame'''
+    return _length.pack(len(payload)) + payload
+
+class SkinDepthIPCHandler(socketserver.BaseRequestHandler):
+    '''Serves one client connection - reads whatever frames have arrived, answers them all in order and
+    sends the responses together, so pipelined requests cost one read and one write.'''
+    def handle(self):
+        buffer = bytearray()
+        while True:
+            data = self.request.recv(262144)
+            if not data:
+                return
+            buffer.extend(data)
+            try:
+                responses = [frame(self.respond(payload)) for payload in iter_frames(buffer)]
+            except ProtocolError:
+                # The stream can't be resynchronised after a bad frame length
+                return
+            if responses:
+                self.request.sendall(b''.join(responses))
+
+    def respond(self, payload):
+        '''Returns the response payload for a request payload'''
+        try:
+            opcode, requestid = _request_header.unpack_from(payload, 0)
+        except struct.error:
+            raise ProtocolError("Truncated request header")
+        try:
+            status, body = self.calculate(opcode, payload, _request_header.size)
+        except (ProtocolError, UnicodeDecodeError, struct.error) as err:
+            status, body = STATUS_BAD_REQUEST, str(err).encode('utf-8')
+        except Exception as err:
+            status, body = STATUS_ERROR, str(err).encode('utf-8')
+        return _response_header.pack(requestid, status) + body
+
+    def calculate(self, opcode, payload, offset):
+        '''Returns the tuple (status, response body) for a request'''
+        controller = self.server.controller
+        if opcode == OP_PING:
+            return STATUS_OK, b''
+        elif opcode in (OP_SKINDEPTH, OP_FREQUENCY):
+            name, offset = unpack_name(payload, offset)
+            value, = _double.unpack_from(payload, offset)
+            thematerial = controller.retrieve(name)
+            if thematerial is None:
+                return STATUS_UNKNOWN, b''
+            if opcode == OP_SKINDEPTH:
+                return STATUS_OK, _double.pack(thematerial.calc_skindepth(value))
+            return STATUS_OK, _double.pack(thematerial.calc_frequency(value))
+        elif opcode in (OP_SKINDEPTHS, OP_FREQUENCIES):
+            name, offset = unpack_name(payload, offset)
+            values, offset = unpack_doubles(payload, offset)
+            thematerial = controller.retrieve(name)
+            if thematerial is None:
+                return STATUS_UNKNOWN, b''
+            if opcode == OP_SKINDEPTHS:
+                return STATUS_OK, pack_doubles(thematerial.calc_skindepths(values))
+            return STATUS_OK, pack_doubles(thematerial.calc_frequencies(values))
+        elif opcode == OP_BATCH:
+            return STATUS_OK, self.calculate_batch(payload, offset)
+        raise ProtocolError("Unknown opcode {0}".format(opcode))
+
+    def calculate_batch(self, payload, offset):
+        '''Returns the response body of a batch request.  The batch's materials are retrieved together and
+        each material's values are calculated in one vectorized call.'''
+        try:
+            count, = _length.unpack_from(payload, offset)
+        except struct.error:
+            raise ProtocolError("Truncated batch")
+        offset += _length.size
+        calculations = []
+        groups = {}
+        for idx in range(count):
+            opcode = payload[offset:offset + 1]
+            opcode = ord(opcode) if opcode else None
+            if opcode not in (OP_SKINDEPTH, OP_FREQUENCY):
+                raise ProtocolError("Batches can only hold OP_SKINDEPTH and OP_FREQUENCY calculations")
+            name, offset = unpack_name(payload, offset + 1)
+            try:
+                value, = _double.unpack_from(payload, offset)
+            except struct.error:
+                raise ProtocolError("Truncated batch")
+            offset += _double.size
+            calculations.append((opcode, name, value))
+            groups.setdefault((name, opcode), []).append(idx)
+        materials, unknown = self.server.controller.retrieve_many(name for name, opcode in groups)
+        results = [(STATUS_UNKNOWN, 0.0)] * count
+        for (name, opcode), indices in groups.items():
+            thematerial = materials.get(name)
+            if thematerial is None:
+                continue
+            values = [calculations[idx][2] for idx in indices]
+            if opcode == OP_SKINDEPTH:
+                calculated = thematerial.calc_skindepths(values)
+            else:
+                calculated = thematerial.calc_frequencies(values)
+            for idx, result in zip(indices, calculated):
+                results[idx] = (STATUS_OK, float(result))
+        return _length.pack(count) + b''.join(_status_double.pack(status, result) for status, result in results)
+
+def _is_socket(path):
+    '''Returns True if path is a Unix socket file'''
+    try:
+        return stat.S_ISSOCK(os.stat(path).st_mode)
+    except OSError:
+        return False
+
+class SkinDepthIPCServer(socketserver.ThreadingMixIn, _StreamServer):
+    '''Threaded local socket server for a (threaded) SkinDepthController, one thread per client connection'''
+    daemon_threads = True
+
+    def __init__(self, address, controller):
+        '''Required parameters - the Unix socket path to listen on (or a (host, port) address where Unix
+        sockets aren't available) and the SkinDepthController to serve, which should be opened with
+        threaded=True.  An existing socket file at the path is replaced; raises OSError (EEXIST) if anything
+        else is at the path.'''
+        if _StreamServer is not socketserver.TCPServer and os.path.exists(address):
+            if not _is_socket(address):
+                raise OSError(errno.EEXIST, "Not replacing a file that isn't a socket", address)
+            os.remove(address)
+        _StreamServer.__init__(self, address, SkinDepthIPCHandler)
+        self.controller = controller
+
+    def process_request_thread(self, request, client_address):
+        '''Serves a connection on its own thread, then closes the thread's database connection'''
+        try:
+            socketserver.ThreadingMixIn.process_request_thread(self, request, client_address)
+        finally:
+            self.controller.db.release_connection()
+
+    def server_close(self):
+        _StreamServer.server_close(self)
+        if _StreamServer is not socketserver.TCPServer and _is_socket(self.server_address):
+            os.remove(self.server_address)
+
+class SkinDepthIPCClient(object):
+    '''Client for SkinDepthIPCServer.  The single calls mirror SkinDepthController - unknown materials return
+    None - and pipeline() sends many requests before reading any of the responses.  Not thread safe, use one
+    client per thread.'''
+    def __init__(self, address, timeout=None):
+        '''Required parameter - the server's Unix socket path (or (host, port) address).  Optional parameter
+        timeout (None) - socket timeout in seconds.'''
+        if isinstance(address, tuple):
+            self.socket = socket.create_connection(address, timeout)
+            self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        else:
+            self.socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            self.socket.settimeout(timeout)
+            self.socket.connect(address)
+        self._buffer = bytearray()
+        self._frames = collections.deque()
+        self._nextid = 0
+
+    def close(self):
+        self.socket.close()
+
+    def _request(self, opcode, body):
+        '''Returns the frame of a request, and its request id'''
+        self._nextid = (self._nextid + 1) & 0xFFFFFFFF
+        return frame(_request_header.pack(opcode, self._nextid) + body), self._nextid
+
+    def _read(self):
+        '''Reads whatever the server has sent, queueing the complete response payloads'''
+        data = self.socket.recv(262144)
+        if not data:
+            raise ProtocolError("Connection closed by server")
+        self._buffer.extend(data)
+        self._frames.extend(iter_frames(self._buffer))
+
+    def _receive_frames(self, responses):
+        '''Reads until at least responses payloads are queued'''
+        while len(self._frames) < responses:
+            self._read()
+
+    def _receive(self):
+        '''Returns the next response payload'''
+        self._receive_frames(1)
+        return self._frames.popleft()
+
+    @staticmethod
+    def _request_body(call):
+        '''Returns the (opcode, body) of a call tuple, see pipeline'''
+        method, args = call[0], call[1:]
+        if method == 'ping':
+            return OP_PING, b''
+        elif method == 'calcdelta':
+            return OP_SKINDEPTH, pack_name(args[0]) + _double.pack(args[1])
+        elif method == 'calcfrequency':
+            return OP_FREQUENCY, pack_name(args[0]) + _double.pack(args[1])
+        elif method == 'calcdelta_many':
+            return OP_SKINDEPTHS, pack_name(args[0]) + pack_doubles(args[1])
+        elif method == 'calcfrequency_many':
+            return OP_FREQUENCIES, pack_name(args[0]) + pack_doubles(args[1])
+        elif method == 'batch':
+            body = [_length.pack(len(args[0]))]
+            for kind, name, value in args[0]:
+                body.append(struct.pack('!B', OP_SKINDEPTH if kind == 'calcdelta' else OP_FREQUENCY))
+                body.append(pack_name(name))
+                body.append(_double.pack(value))
+            return OP_BATCH, b''.join(body)
+        raise ValueError("Unknown call {0}".format(method))
+
+    @staticmethod
+    def _result(opcode, payload, requestid):
+        '''Returns the result of a response payload'''
+        responseid, status = _response_header.unpack_from(payload, 0)
+        if responseid != requestid:
+            raise ProtocolError("Response {0} doesn't match request {1}".format(responseid, requestid))
+        body = payload[_response_header.size:]
+        if status == STATUS_UNKNOWN:
+            return None
+        elif status == STATUS_BAD_REQUEST:
+            raise ValueError(body.decode('utf-8'))
+        elif status != STATUS_OK:
+            raise RuntimeError(body.decode('utf-8'))
+        if opcode in (OP_SKINDEPTH, OP_FREQUENCY):
+            return _double.unpack_from(body, 0)[0]
+        elif opcode in (OP_SKINDEPTHS, OP_FREQUENCIES):
+            return unpack_doubles(body, 0)[0]
+        elif opcode == OP_BATCH:
+            count, = _length.unpack_from(body, 0)
+            results = []
+            for idx in range(count):
+                status, result = _status_double.unpack_from(body, _length.size + idx * _status_double.size)
+                results.append(result if status == STATUS_OK else None)
+            return results
+        return True
+
+    def pipeline(self, calls):
+        '''Sends all the calls without waiting for their results, returning the list of results in order.  Each
+        call is a tuple of the method name and its arguments, e.g. ('calcdelta', 'Iron', 60.0) - see the
+        methods of the same names.  Responses are read while the requests are still being sent, so the
+        server is never left blocked on a full socket buffer however many calls are pipelined.'''
+        requests = []
+        frames = []
+        for call in calls:
+            opcode, body = self._request_body(call)
+            request, requestid = self._request(opcode, body)
+            frames.append(request)
+            requests.append((opcode, requestid))
+        if len(frames) == 1:
+            # The server only answers once the whole request has arrived, so a single request can't deadlock
+            self.socket.sendall(frames[0])
+            self._receive_frames(1)
+        else:
+            self._exchange(b''.join(frames), len(requests))
+        payloads = [self._frames.popleft() for request in requests]
+        return [self._result(opcode, payload, requestid) for (opcode, requestid), payload in zip(requests, payloads)]
+
+    def _exchange(self, data, responses):
+        '''Sends data while reading responses as they arrive, until at least responses payloads are queued.
+        Raises socket.timeout if neither is possible within the socket's timeout.'''
+        data = memoryview(data)
+        sent = 0
+        timeout = self.socket.gettimeout()
+        self.socket.setblocking(False)
+        try:
+            while sent < len(data) or len(self._frames) < responses:
+                writers = [self.socket] if sent < len(data) else []
+                readable, writable, errors = select.select([self.socket], writers, [], timeout)
+                if not readable and not writable:
+                    raise socket.timeout("timed out")
+                if writable:
+                    try:
+                        sent += self.socket.send(data[sent:sent + 262144])
+                    except socket.error as err:
+                        if err.args[0] not in (errno.EAGAIN, errno.EWOULDBLOCK):
+                            raise
+                if readable:
+                    self._read()
+        finally:
+            self.socket.settimeout(timeout)
+
+    def ping(self):
+        '''Returns True once the server has answered'''
+        return self.pipeline([('ping',)])[0]
+
+    def calcdelta(self, materialname, frequency):
+        '''Returns the skin depth in metres at the given frequency in Hz, or None if the material isn't found'''
+        return self.pipeline([('calcdelta', materialname, frequency)])[0]
+
+    def calcfrequency(self, materialname, skindepth):
+        '''Returns the excitation frequency in Hz that would induce the given skin depth in metres, or None if
+        the material isn't found'''
+        return self.pipeline([('calcfrequency', materialname, skindepth)])[0]
+
+    def calcdelta_many(self, materialname, frequencies):
+        '''Returns an array of the skin depths at each of the frequencies, or None if the material isn't found'''
+        return self.pipeline([('calcdelta_many', materialname, frequencies)])[0]
+
+    def calcfrequency_many(self, materialname, skindepths):
+        '''Returns an array of the excitation frequencies for each of the skin depths, or None if the material
+        isn't found'''
+        return self.pipeline([('calcfrequency_many', materialname, skindepths)])[0]
+
+    def batch(self, calculations):
+        '''Returns the results of a list of ('calcdelta' or 'calcfrequency', material name, value) calculations
+        sent as one frame, None for each calculation whose material isn't found'''
+        return self.pipeline([('batch', calculations)])[0]
+
+def main(argv=None):
+    '''Command line entry point - serves the database until interrupted'''
+    parser = argparse.ArgumentParser(description='Serves SkinDepth calculations over a local socket.')
+    parser.add_argument('--db', required=True, help='SkinDepth materials database')
+    parser.add_argument('--socket', default='skindepth.sock', help='Unix socket path to listen on')
+    parser.add_argument('--cachesize', type=int, default=1024, help='materials to cache')
+    args = parser.parse_args(argv)
+    controller = SkinDepthController.SkinDepthController(args.db, cachesize=args.cachesize, threaded=True)
+    controller.open()
+    address = args.socket if _StreamServer is not socketserver.TCPServer else ('127.0.0.1', 0)
+    server = SkinDepthIPCServer(address, controller)
+    sys.stderr.write("Serving {0} on {1}\n".format(args.db, server.server_address))
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        controller.db.close()
+    return 0
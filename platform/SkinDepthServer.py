@@ -0,0 +1,446 @@
+'''SkinDepthServer.py - HTTP / JSON calculation service on top of the SkinDepth controller
+
+Standard library only.  Each connection is served by its own thread with HTTP/1.1 keep-alive; concurrent
+calcdelta / calcfrequency requests are collected into micro-batches and calculated together.
+
+    python skindepthserver.py --db materials.db [--host 127.0.0.1] [--port 8080]
+
+Endpoints (all responses are JSON, infinite or undefined results are null):
+    GET    /calcdelta?material=Iron&frequency=60          skin depth in metres at a frequency in Hz
+    GET    /calcfrequency?material=Iron&skindepth=0.001   excitation frequency in Hz for a skin depth in metres
+    POST   /sweep  {"materials": [...], "frequencies": [...]} or {"materials": [...], "skindepths": [...]}
+    GET    /materials?after=&limit=                       material names
+    GET    /materials/<name>                              material
+    PUT    /materials/<name>  {"notes": "", "iacs": 100, "mu_r": 1}   add / replace a material
+    DELETE /materials/<name>                              remove a material
+    GET    /search?q=&limit=                              full-text search of names and notes
+    GET    /complete?prefix=&limit=&tokens=               material name completion
+    GET    /stats                                         per-endpoint latency histograms, batching and cache
+'''
+import argparse
+import bisect
+import collections
+import json
+import math
+import sys
+import threading
+import time
+try:
+    import BaseHTTPServer as httpserver
+    import SocketServer as socketserver
+    import urlparse
+    from urllib import unquote
+except ImportError:
+    import http.server as httpserver
+    import socketserver
+    import urllib.parse as urlparse
+    from urllib.parse import unquote
+from platform import SkinDepthController
+
+def _finite(value):
+    '''Returns value as a float, or None if it's infinite or NaN (which JSON can't represent)'''
+    value = float(value)
+    if math.isinf(value) or math.isnan(value):
+        return None
+    return value
+
+class RequestError(Exception):
+    '''An error to return to the client with the given HTTP status'''
+    def __init__(self, status, message):
+        Exception.__init__(self, message)
+        self.status = status
+
+class LatencyHistogram(object):
+    '''Counts request latencies in exponentially sized buckets, 0.1 ms doubling up to about 13 s'''
+    bounds = [0.0001 * 2 ** idx for idx in range(18)]
+
+    def __init__(self):
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.total = 0.0
+        self.maximum = 0.0
+        self._lock = threading.Lock()
+
+    def record(self, seconds):
+        '''Adds a latency in seconds'''
+        with self._lock:
+            self.counts[bisect.bisect_left(self.bounds, seconds)] += 1
+            self.total += seconds
+            self.maximum = max(self.maximum, seconds)
+
+    def percentile(self, fraction):
+        '''Returns the upper bound in seconds of the bucket holding the given fraction of latencies'''
+        count = sum(self.counts)
+        if count == 0:
+            return None
+        running = 0
+        for idx, bucketcount in enumerate(self.counts):
+            running += bucketcount
+            if running >= fraction * count:
+                return self.bounds[idx] if idx < len(self.bounds) else self.maximum
+        return self.maximum
+
+    def stats(self):
+        '''Returns a dict of the count, mean, maximum and 50th / 90th / 99th percentile latencies in
+        milliseconds, and the (upper bound in ms, count) of each non-empty bucket'''
+        with self._lock:
+            count = sum(self.counts)
+            stats = {"count":count,
+                     "mean_ms":1e3 * self.total / count if count else None,
+                     "max_ms":1e3 * self.maximum,
+                     "buckets":[[1e3 * self.bounds[idx] if idx < len(self.bounds) else None, bucketcount]
+                                for idx, bucketcount in enumerate(self.counts) if bucketcount]}
+            for name, fraction in (("p50_ms", 0.5), ("p90_ms", 0.9), ("p99_ms", 0.99)):
+                bound = self.percentile(fraction)
+                stats[name] = None if bound is None else 1e3 * bound
+            return stats
+
+class _Calculation(object):
+    '''A single calculation waiting on the CalculationBatcher'''
+    __slots__ = ('materialname', 'kind', 'value', 'result', 'error', 'done')
+
+    def __init__(self, materialname, kind, value):
+        self.materialname = materialname
+        self.kind = kind
+        self.value = value
+        self.result = None
+        self.error = None
+        self.done = threading.Event()
+
+class CalculationBatcher(object):
+    '''Collects the calculations submitted by concurrent request threads for up to window seconds (or maxbatch
+    calculations) and calculates them together on one thread - the materials of a batch are retrieved in
+    one query and each material's values are calculated in one vectorized call.'''
+    def __init__(self, controller, window=0.002, maxbatch=256):
+        self.controller = controller
+        self.window = window
+        self.maxbatch = maxbatch
+        self.batches = 0
+        self.calculations = 0
+        self._queue = collections.deque()
+        self._condition = threading.Condition()
+        self._stopped = False
+        self._thread = threading.Thread(target=self._run, name='CalculationBatcher')
+        self._thread.daemon = True
+        self._thread.start()
+
+    def submit(self, materialname, kind, value):
+        '''Returns the skin depth (kind 'skindepth', value a frequency in Hz) or excitation frequency (kind
+        'frequency', value a skin depth in metres) of the material, or None if the material isn't found'''
+        calculation = _Calculation(materialname, kind, value)
+        with self._condition:
+            if self._stopped:
+                raise RuntimeError("Calculation batcher has been stopped")
+            self._queue.append(calculation)
+            self._condition.notify()
+        calculation.done.wait()
+        if calculation.error is not None:
+            raise calculation.error
+        return calculation.result
+
+    def stop(self):
+        '''Stops the batching thread once the queued calculations are done'''
+        with self._condition:
+            self._stopped = True
+            self._condition.notify()
+        self._thread.join()
+
+    def stats(self):
+        '''Returns a dict of the number of batches and calculations and the mean batch size'''
+        return {"batches":self.batches,
+                "calculations":self.calculations,
+                "mean_batch":float(self.calculations) / self.batches if self.batches else None}
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while not self._queue and not self._stopped:
+                    self._condition.wait()
+                if not self._queue:
+                    return
+                # Give concurrent requests the window to join the batch
+                deadline = time.time() + self.window
+                while len(self._queue) < self.maxbatch and not self._stopped:
+                    remaining = deadline - time.time()
+                    if remaining <= 0:
+                        break
+                    self._condition.wait(remaining)
+                batch = [self._queue.popleft() for idx in range(min(self.maxbatch, len(self._queue)))]
+            self._calculate(batch)
+
+    def _calculate(self, batch):
+        '''Calculates a batch, grouping the calculations by material and kind'''
+        try:
+            groups = collections.OrderedDict()
+            for calculation in batch:
+                groups.setdefault((calculation.materialname, calculation.kind), []).append(calculation)
+            materials, unknown = self.controller.retrieve_many(name for name, kind in groups)
+            for (materialname, kind), calculations in groups.items():
+                thematerial = materials.get(materialname)
+                if thematerial is None:
+                    continue
+                values = [calculation.value for calculation in calculations]
+                if kind == 'skindepth':
+                    results = thematerial.calc_skindepths(values)
+                else:
+                    results = thematerial.calc_frequencies(values)
+                for calculation, result in zip(calculations, results):
+                    calculation.result = float(result)
+        except Exception as err:
+            for calculation in batch:
+                calculation.error = err
+        finally:
+            self.batches += 1
+            self.calculations += len(batch)
+            for calculation in batch:
+                calculation.done.set()
+
+class SkinDepthRequestHandler(httpserver.BaseHTTPRequestHandler):
+    '''Handles the SkinDepth service's HTTP requests, see the module documentation for the endpoints'''
+    protocol_version = 'HTTP/1.1'
+    server_version = 'SkinDepth'
+
+    def do_GET(self):
+        self._dispatch('GET')
+
+    def do_POST(self):
+        self._dispatch('POST')
+
+    def do_PUT(self):
+        self._dispatch('PUT')
+
+    def do_DELETE(self):
+        self._dispatch('DELETE')
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            httpserver.BaseHTTPRequestHandler.log_message(self, format, *args)
+
+    def _dispatch(self, method):
+        '''Routes the request to its endpoint, sends the JSON response and records the latency'''
+        start = time.time()
+        parsed = urlparse.urlparse(self.path)
+        parts = [self._text(unquote(part)) for part in parsed.path.strip('/').split('/')]
+        endpoint = parts[0]
+        query = dict((key, self._text(values[-1])) for key, values in urlparse.parse_qs(parsed.query).items())
+        try:
+            try:
+                body = self._read_body()
+                handler = self.routes.get((method, endpoint))
+                if handler is None:
+                    if endpoint in set(route[1] for route in self.routes):
+                        raise RequestError(405, "Method not allowed")
+                    raise RequestError(404, "Unknown endpoint")
+                status, response = handler(self, parts[1:], query, body)
+            except RequestError as err:
+                status, response = err.status, {"error":str(err)}
+            except Exception as err:
+                status, response = 500, {"error":str(err)}
+            self._send_json(status, response)
+        finally:
+            self.server.record_latency(endpoint if (method, endpoint) in self.routes else 'other', time.time() - start)
+
+    @staticmethod
+    def _text(value):
+        if isinstance(value, bytes) and not isinstance(value, type(u'')):
+            return value.decode('utf-8')
+        return value
+
+    def _read_body(self):
+        '''Returns the request's JSON body, or None if it has no body'''
+        length = int(self.headers.get('Content-Length') or 0)
+        if not length:
+            return None
+        try:
+            return json.loads(self.rfile.read(length).decode('utf-8'))
+        except ValueError:
+            raise RequestError(400, "Request body isn't valid JSON")
+
+    def _send_json(self, status, response):
+        payload = json.dumps(response).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    @staticmethod
+    def _number(query, name):
+        try:
+            return float(query[name])
+        except KeyError:
+            raise RequestError(400, "Missing parameter {0}".format(name))
+        except ValueError:
+            raise RequestError(400, "Parameter {0} isn't a number".format(name))
+
+    @staticmethod
+    def _material(query):
+        try:
+            return query['material']
+        except KeyError:
+            raise RequestError(400, "Missing parameter material")
+
+    def calcdelta(self, parts, query, body):
+        materialname = self._material(query)
+        frequency = self._number(query, 'frequency')
+        skindepth = self.server.batcher.submit(materialname, 'skindepth', frequency)
+        if skindepth is None:
+            raise RequestError(404, "Unknown material {0}".format(materialname))
+        return 200, {"material":materialname, "frequency":frequency, "skindepth":_finite(skindepth)}
+
+    def calcfrequency(self, parts, query, body):
+        materialname = self._material(query)
+        skindepth = self._number(query, 'skindepth')
+        frequency = self.server.batcher.submit(materialname, 'frequency', skindepth)
+        if frequency is None:
+            raise RequestError(404, "Unknown material {0}".format(materialname))
+        return 200, {"material":materialname, "skindepth":skindepth, "frequency":_finite(frequency)}
+
+    def sweep(self, parts, query, body):
+        if not isinstance(body, dict) or not isinstance(body.get('materials'), list):
+            raise RequestError(400, "Expected a JSON object with a list of materials")
+        try:
+            if 'frequencies' in body:
+                results, unknown = self.server.controller.calcdelta_many(body['materials'], body['frequencies'])
+            elif 'skindepths' in body:
+                results, unknown = self.server.controller.calcfrequency_many(body['materials'], body['skindepths'])
+            else:
+                raise RequestError(400, "Expected a list of frequencies or skindepths")
+        except (TypeError, ValueError):
+            raise RequestError(400, "Frequencies / skin depths must be numbers")
+        return 200, {"results":dict((name, [_finite(value) for value in values]) for name, values in results.items()),
+                     "unknown":unknown}
+
+    def get_materials(self, parts, query, body):
+        if not parts or not parts[0]:
+            try:
+                limit = int(query['limit']) if 'limit' in query else None
+            except ValueError:
+                raise RequestError(400, "Parameter limit isn't an integer")
+            return 200, {"materials":self.server.controller.fetchlist(after=query.get('after'), limit=limit)}
+        material = self.server.controller.fetch(parts[0])
+        if material is None:
+            raise RequestError(404, "Unknown material {0}".format(parts[0]))
+        return 200, material
+
+    def put_material(self, parts, query, body):
+        if not parts or not parts[0]:
+            raise RequestError(400, "Missing material name")
+        if not isinstance(body, dict):
+            raise RequestError(400, "Expected a JSON object with iacs and mu_r")
+        try:
+            material = {"name":parts[0], "notes":body.get('notes', ''), "iacs":float(body['iacs']),
+                        "mu_r":float(body['mu_r'])}
+        except (KeyError, TypeError, ValueError):
+            raise RequestError(400, "Expected numeric iacs and mu_r")
+        controller = self.server.controller
+        with controller.db.writelock:
+            controller.add(material)
+            controller.update()
+        return 200, controller.fetch(parts[0])
+
+    def delete_material(self, parts, query, body):
+        if not parts or not parts[0]:
+            raise RequestError(400, "Missing material name")
+        controller = self.server.controller
+        with controller.db.writelock:
+            if controller.fetch(parts[0]) is None:
+                raise RequestError(404, "Unknown material {0}".format(parts[0]))
+            controller.remove(parts[0])
+            controller.update()
+        return 200, {"deleted":parts[0]}
+
+    def search(self, parts, query, body):
+        try:
+            limit = int(query.get('limit', 20))
+        except ValueError:
+            raise RequestError(400, "Parameter limit isn't an integer")
+        return 200, {"materials":self.server.controller.search(query.get('q', ''), limit=limit)}
+
+    def complete(self, parts, query, body):
+        try:
+            limit = int(query.get('limit', 10))
+        except ValueError:
+            raise RequestError(400, "Parameter limit isn't an integer")
+        tokens = query.get('tokens', '').lower() in ('1', 'true', 'yes')
+        return 200, {"materials":self.server.controller.complete(query.get('prefix', ''), limit=limit, tokens=tokens)}
+
+    def stats(self, parts, query, body):
+        return 200, self.server.stats()
+
+    routes = {('GET', 'calcdelta'):calcdelta,
+              ('GET', 'calcfrequency'):calcfrequency,
+              ('POST', 'sweep'):sweep,
+              ('GET', 'materials'):get_materials,
+              ('PUT', 'materials'):put_material,
+              ('DELETE', 'materials'):delete_material,
+              ('GET', 'search'):search,
+              ('GET', 'complete'):complete,
+              ('GET', 'stats'):stats}
+
+class SkinDepthServer(socketserver.ThreadingMixIn, httpserver.HTTPServer):
+    '''Threaded HTTP server for a (threaded) SkinDepthController'''
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, address, controller, batchwindow=0.002, maxbatch=256, verbose=False):
+        '''Required parameters - (host, port) address to listen on (port 0 for any free port) and the
+        SkinDepthController to serve, which should be opened with threaded=True.  Optional parameters
+        batchwindow (0.002) - seconds to wait for concurrent calculations to batch together, maxbatch (256) -
+        the maximum calculations per batch, verbose (False) - log each request to stderr.'''
+        httpserver.HTTPServer.__init__(self, address, SkinDepthRequestHandler)
+        self.controller = controller
+        self.verbose = verbose
+        self.batcher = CalculationBatcher(controller, window=batchwindow, maxbatch=maxbatch)
+        self.histograms = collections.defaultdict(LatencyHistogram)
+        self._histograms_lock = threading.Lock()
+
+    def process_request_thread(self, request, client_address):
+        '''Serves a connection on its own thread, then closes the thread's database connection'''
+        try:
+            socketserver.ThreadingMixIn.process_request_thread(self, request, client_address)
+        finally:
+            self.controller.db.release_connection()
+
+    def record_latency(self, endpoint, seconds):
+        '''Adds a request's latency to its endpoint's histogram'''
+        with self._histograms_lock:
+            histogram = self.histograms[endpoint]
+        histogram.record(seconds)
+
+    def stats(self):
+        '''Returns a dict of the latency histograms by endpoint, the batching statistics and the controller's
+        cache statistics'''
+        with self._histograms_lock:
+            histograms = dict(self.histograms)
+        return {"latency":dict((endpoint, histogram.stats()) for endpoint, histogram in histograms.items()),
+                "batching":self.batcher.stats(),
+                "cache":self.controller.cache_stats()}
+
+    def server_close(self):
+        httpserver.HTTPServer.server_close(self)
+        self.batcher.stop()
+
+def main(argv=None):
+    '''Command line entry point - serves the database until interrupted'''
+    parser = argparse.ArgumentParser(description='Serves SkinDepth calculations over HTTP / JSON.')
+    parser.add_argument('--db', required=True, help='SkinDepth materials database')
+    parser.add_argument('--host', default='127.0.0.1', help='address to listen on')
+    parser.add_argument('--port', type=int, default=8080, help='port to listen on')
+    parser.add_argument('--batch-window', type=float, default=2.0,
+                        help='milliseconds to collect concurrent calculations into one batch')
+    parser.add_argument('--cachesize', type=int, default=1024, help='materials to cache')
+    parser.add_argument('--verbose', action='store_true', help='log each request')
+    args = parser.parse_args(argv)
+    controller = SkinDepthController.SkinDepthController(args.db, cachesize=args.cachesize, threaded=True)
+    controller.open()
+    server = SkinDepthServer((args.host, args.port), controller, batchwindow=args.batch_window / 1e3,
+                             verbose=args.verbose)
+    sys.stderr.write("Serving {0} on http://{1}:{2}/\n".format(args.db, *server.server_address[:2]))
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        controller.db.close()
+    return 0
@@ -0,0 +1,131 @@
+'''SweepExecutor.py - parallel design-space sweeps of skin depth and attenuation
+
+Calculates every material x every frequency (x every thickness) over a pool of worker processes.  The
+materials' skin depth coefficients and the frequencies are handed to each worker once, in shared memory,
+when the pool starts; the workers then write their results straight into a shared results array, so each
+task is only a few indices and nothing but a count of points is sent back.
+'''
+import ctypes
+import multiprocessing
+import threading
+from material import vectorcalc
+
+# Shared arrays of the current (worker) process, see init_worker
+_shared = {}
+
+class SweepCancelled(Exception):
+    '''The sweep was cancelled before it finished'''
+    pass
+
+def init_worker(coefficients, frequencies, thicknesses, results):
+    '''Keeps the current process's references to the shared arrays'''
+    _shared['coefficients'] = coefficients
+    _shared['frequencies'] = frequencies
+    _shared['thicknesses'] = thicknesses
+    _shared['results'] = results
+
+def _view(shared):
+    '''Returns a NumPy array sharing the memory of a shared array of doubles, or the shared array itself
+    without NumPy'''
+    if vectorcalc.numpy is None:
+        return shared
+    return vectorcalc.numpy.frombuffer(shared, dtype=float)
+
+def sweep_block(task):
+    '''Calculates the frequencies start:stop of material row into the shared results array, returning the
+    number of points calculated.  Results are skin depths in metres, or with thicknesses the fraction of the
+    field remaining after each thickness.'''
+    row, start, stop = task
+    frequencies = _view(_shared['frequencies'])[start:stop]
+    results = _view(_shared['results'])
+    depths = vectorcalc.skindepths(_shared['coefficients'][row], frequencies)
+    count = len(_shared['frequencies'])
+    thicknesses = _shared['thicknesses']
+    if not thicknesses:
+        results[row * count + start:row * count + stop] = depths
+        return stop - start
+    for idx, thickness in enumerate(thicknesses):
+        offset = (row * len(thicknesses) + idx) * count
+        results[offset + start:offset + stop] = vectorcalc.attenuations(depths, thickness)
+    return (stop - start) * len(thicknesses)
+
+class SweepExecutor(object):
+    '''Runs sweeps of a SkinDepthController's materials over a pool of jobs worker processes, chunksize
+    frequencies per task.  progress and cancel make it suitable for driving from a GUI or command line:
+    cancel() may be called from any thread (or from the progress callback) while run() is in progress.'''
+    def __init__(self, controller, jobs=None, chunksize=262144):
+        '''Required parameter - the (open) SkinDepthController whose materials are swept.  Optional parameters
+        jobs (None) - the number of worker processes, default is the number of CPUs; 1 calculates in this
+        process, chunksize (262144) - frequencies per task.'''
+        self.controller = controller
+        self.jobs = jobs or multiprocessing.cpu_count()
+        self.chunksize = chunksize
+        self._cancelled = threading.Event()
+
+    def cancel(self):
+        '''Stops the sweep in progress, which raises SweepCancelled'''
+        self._cancelled.set()
+
+    def _materials(self, materialnames):
+        '''Returns the tuple (materials, unknown) of the named materials, all the materials if None'''
+        if materialnames is None:
+            return [(amaterial.name, amaterial) for amaterial in self.controller.db.iter_all()], []
+        materials, unknown = self.controller.retrieve_many(materialnames)
+        return list(materials.items()), unknown
+
+    def run(self, materialnames, frequencies, thicknesses=None, progress=None):
+        '''Sweeps the materials (None for every material in the database) over the frequencies in Hz,
+        returning the tuple (names, results, unknown).  names is the list of the materials swept and unknown
+        the list of the names not found in the database.  results holds the skin depths in metres with shape
+        (materials, frequencies), or if thicknesses (in metres) are given the fraction of the field remaining
+        after each thickness with shape (materials, thicknesses, frequencies).  results is a NumPy array, or
+        without NumPy a flat ctypes array in the same (row-major) order.
+        If specified, progress(0, remaining, total) is called with the number of points remaining as each
+        task completes.  Raises SweepCancelled if cancel() is called before the sweep completes.'''
+        self._cancelled.clear()
+        materials, unknown = self._materials(materialnames)
+        names = [name for name, amaterial in materials]
+        coefficients = multiprocessing.RawArray(ctypes.c_double,
+                                                [amaterial.skindepth_coefficient for name, amaterial in materials])
+        frequencies = vectorcalc.asarray(frequencies)
+        shared_frequencies = multiprocessing.RawArray(ctypes.c_double, len(frequencies))
+        _view(shared_frequencies)[:] = frequencies
+        frequencies = shared_frequencies
+        thicknesses = list(thicknesses or [])
+        shape = (len(names),) + ((len(thicknesses),) if thicknesses else ()) + (len(frequencies),)
+        total = 1
+        for size in shape:
+            total *= size
+        results = multiprocessing.RawArray(ctypes.c_double, total)
+        tasks = [(row, start, min(start + self.chunksize, len(frequencies)))
+                 for row in range(len(names)) for start in range(0, len(frequencies), self.chunksize)]
+        initargs = (coefficients, frequencies, thicknesses, results)
+        if self.jobs <= 1 or len(tasks) <= 1:
+            init_worker(*initargs)
+            try:
+                self._collect((sweep_block(task) for task in tasks), len(tasks), total, progress)
+            finally:
+                _shared.clear()
+        else:
+            pool = multiprocessing.Pool(min(self.jobs, len(tasks)), initializer=init_worker, initargs=initargs)
+            try:
+                self._collect(pool.imap_unordered(sweep_block, tasks), len(tasks), total, progress)
+                pool.close()
+            finally:
+                pool.terminate()
+                pool.join()
+        if vectorcalc.numpy is not None:
+            results = _view(results).reshape(shape)
+        return names, results, unknown
+
+    def _collect(self, counts, tasks, total, progress):
+        '''Waits on the counts of points calculated by each of the tasks, reporting progress and checking for
+        cancellation before each task'''
+        counts = iter(counts)
+        remaining = total
+        for task in range(tasks):
+            if self._cancelled.is_set():
+                raise SweepCancelled("Sweep cancelled with {0} of {1} points remaining".format(remaining, total))
+            remaining -= next(counts)
+            if progress is not None:
+                progress(0, remaining, total)
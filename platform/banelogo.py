@@ -1,2073 +1,2073 @@
-'''banelogo.py - Embedded pic of my cat - he's as good a logo as any!'''
-#----------------------------------------------------------------------
-# This file was generated by c:\Python27\Scripts\img2py
-#
-from wx.lib.embeddedimage import PyEmbeddedImage
-
-Bane = PyEmbeddedImage(
-    "iVBORw0KGgoAAAANSUhEUgAAAUAAAADwCAIAAAD+Tyo8AAAACXBIWXMAAAsTAAALEwEAmpwY"
-    "AAAAIGNIUk0AAHolAACAgwAA+f8AAIDpAAB1MAAA6mAAADqYAAAXb5JfxUYAAbI+SURBVHja"
-    "PP1bj6TJsiWGrbXM3L/Iqt57j2Z0Zjgccm6gKIgjQoIkQA/Sq/6D/rkAEaDIM3Mu+9ZdXZfM"
-    "jM/dbOnBs08/NBrd1VWREfG5m60r/9//r//beLzFeHb3T7/7bDpyPOanq/r3c/f6ikg/frf3"
-    "NfaL9zfaAHfHc3vrufHdpBWPz4znp7zHzL9433Zu6k9/+vUvv/zA55db1u2XrJ9eRsTcndfL"
-    "dNu7x5yRKf1EYl5fPj9Wv19zfv4Xf/Pp8+cXdMAdkKxkmq1QTsV890rvz3OGm3lpPLId5Yww"
-    "fD8Gum53BZ3zcXeDDZbyWpuimK/3+hr1O2JkJGD3HRqFYWb3Upb5fa/pepn5qe4Ffx/jK8Hn"
-    "ejhKmKycs8pf7ZXo6lD+jn4Q4/m+QJPTGg43IiMkrPWm8Ovb68hxzWG7q/Za5CcT5vte73l9"
-    "7mIoiA0/jSf76v7s+Y/p/9o1Qs/uO2J0DUHAWP1X4VfUvDGDn8Xo/q58A35XZdBmQ117sWEj"
-    "x7XtiGDQblTV3lWl+Fydec3yXfsv8zLWH3r/JG33ptfjkYrIcblRVkc6I2dw/aV3E5c8iYAB"
-    "FANtZ2T7+uXr88dKzk937b6/cVw9PsV4zOtxjWJ9T4CIYj8yRsLdb69bemmkIY4HczJHvX5d"
-    "z2/zarCux2WN1x+8rt/DHsPPH79AJUp97SeLi8SY04qOBHKMa4bx/u3tl68Yi2MUohuk0JAk"
-    "jSKrDQwHNDIySOx6vQJ9v72/ve7VdGRm9177jlRz5ZhGkGFj3Z1QMMDM69OykFEUkt095u/J"
-    "Gr4f4v7x48evv+zn090SIDfLjLXchU8vn3pj3a20xrqf78Tn5B/ga/lGPOP/9L/7NxkUroyH"
-    "29d4USDonz69hATp8fiD9RAzXDM3ocwHKWPt/ZRguMruHrrguNdXxLDm2oM5y3h939RjjvG4"
-    "PiuudjYCYBdIZgwq4KGQVLVKfnl5+azYCgAC4hrsrkwaLRH8DAAQKWUzBwPltrKa5Xq5rnU/"
-    "u51jgtqtRuZ4MEb1Buhm8qeMf+YuBTIFAIhurCY5DLoo/J7+LD1CtDeYYwZ47ZrMB/sCAiIR"
-    "6M/Mf1H4qXEZjFDEbJcp5my0GwT33u2ym0lRbdoY8yLZHm5mIhSKKzSJkGQ7UtTsFvkmv9g0"
-    "dwZtdMOEKQYU6s7r+n1krH0jTQ1gmCQcYobIENPmHFdVGwS81+32FRcJMcG0u9szFIF114hH"
-    "dwFFISJyjG6RgmgoMtrN2jAzphg2umlIkeN6NHRvvz5rOcxhxbxezAmN+94vL4/kFgsmlZkD"
-    "cCr2KjjJSSvnJON6PFz99u1LpjISHM0BX2N8ipyk1/3W/Z752fXSBrQjU5QymSPGVIoS0d++"
-    "/iqSQpmKYdMNxuymYiou5LVbOR9jzozs7l73t6+/Pl9fQ7I58iViRKSbGcmUDSLJqEZoyMq4"
-    "yEdrQFEOjsf1+Im6yHyZV6qeP359/fbr++sPOuQrIu2i1M3MkZndFrk3gPP7Tzi7OUZcL1PB"
-    "+L/+9//tehb9CE53BUdG27ftVR35AB6ZL+6m3+kndUU8SOx+J5E5RNUuOKqGdM3HfH3H7dD4"
-    "qaHr00s7akeO6I6MT4zLEsHUIJVjgCKSZEjyvMbvMhXpSBJZ1e6tEMDqbcC8IhIgY0ChMe79"
-    "NNyWLRIZQQpUjov5qFZ1QNOOrgZMwT3o2d4RaDSodlpBpuJh001ABiR0L2NFjt0GkzERA45q"
-    "r9qRL+Dvnh7WNLMhN3e53dSA1G4JogyAVASoNgi1cf4ldbVbBM1uddEF2wYg2iLVvUKPMggT"
-    "sGHSZIMGuxn5UMzn/WY1GOCDkgGYXduwmURGzr1uibYA2MiYbrobFhhupCQmYMKAyARbYjAi"
-    "hsG1C2COUd0kpoJMgDZstiGlYt7b1Szo3tzOe6MN5YPIbo8RIRB3BqiUZo4EuFbv24qrobbm"
-    "eGSO7qpaIYcIBONlzD/0DjIpwbXW20jAT/sptS1q5vWCGGVSoSgqvn35UusJiJFgGKIGOHZL"
-    "cZXDvHK+aF5S2rzmCOL+/v1+exM9x8xxPW/saikAVZkIIaVzrGRwMi7wMh/UY9mRnzM/STOU"
-    "ASTr7evPr19+di0JXaIHwK5NyuV5TQAASNRG5kOc4sPGSIG7egGO//Hf/Ru3pQz68chyS0Wb"
-    "kTEed7FXdxeDQfVe4JCut+fbHDNi7qXqbneXwMf761PCyN/t7uo2zlOZc6bRANutDINBCBQl"
-    "BqXQAA0LFilgj3FO36BMxSpYqcyINLz20sgcg4yqbTQFKcTMyPW8d5U0dhMcZoAC6Abs7lIo"
-    "hLWfgHd15MPMalBDcZUtiiA57ACzCxkXtNduExCqLaQhU21BV3Pvbiq7vMsAQGTOttu1n/e9"
-    "bkVWtSLsSE1AYth2N5Egdy0ygHB1d5PnF8BNENK1Nk1Q0YYUigRQbsWshmEwI4IMt8QB+NyH"
-    "ZIz50ptgVGPfdwTmgDuoT3Du3iOnNNYuADpPPgKgITKMVbsyZjPIGHNGDMMEiIZpd3dJeUbo"
-    "HLMgI0DuZpV2R7XGmIRssyoSESa34Ygr8qFMSvsuW+SQpqkcF6R7vT+fPygA7IZxvTz+MPOy"
-    "Ddb7+/e1nkns+tF+IwbwqUBEMgaYmSmtH99e973myGrkmDAjR7easyDlZU7EtIYNMq4cCT9/"
-    "fNvv9/l2Ro5djXjkuNDu3SQVMWISas/2BGcjGI/i0HhhXjFeMh80ZkDrx/ef//T29bfJmYoc"
-    "CglANamRWWu3zVAwjBRTUuYVIg23QTMc/8N/+1+DFWGp9n67+7nvd0LdfF+rm6za9b5rd+kR"
-    "w4gypZkxVpUxjIoRwKzVcHW95ZjUc+89x6M2xL4eIrnr2bhjZDeCHdJ1XWULggX2yAmI2MSW"
-    "hjgzM9OMazV3w4gqA4xIsNrP8q6NMaJ6B0OMKlNIBZRlkAHAcARtk+U2EdIIBUVpdmd1N6qb"
-    "1WibBOyIbG9qt9+BJxFnum6YSIPiY8xP1Wxj5gTCRkjdLUkkqW7EUJCgpKTYhjAI2rabH/dz"
-    "thuoiGQDEkkpqhuwTYrkg0xJ+O32ru7zua9lgCHsvQGtuwN0FdARg9TeqIKovYsUYaFcb+aj"
-    "6irQLDK7oRAICqs2dQHnhYEsKYiImABMKGLXlgifi7rtzhy1OyOpj0nExrjm81lVwZh7uXsH"
-    "HIE5lUNigwAiNEDc9w0zYkijGswhpdvv9ytUjBAlZZzX1m7v5/N1rXeJTKw9yD9Af7itnKkc"
-    "MS4pSTzff6m7gopIadjoNsCGGJciMwc1t6mcEbrGDPLt25f1+m2v5SoKChlSPtq91wopc5Dq"
-    "6vsuY47rJ+bFmMuw0soxP5F5zWuE1/uv3/78d/v9lXXTzhxSAg2sgBMBigZABBvtsjS7W4kI"
-    "oruKVYzUvX/Ev/0Xv6fL9bbq/fX9x67n2/22u368vu1ldH///v35+l53RWRkNtqexqNpsYw3"
-    "aMlksxdCtLv3j1Ar8/1ti2rfz+fT3tV3BB/X5dqS4WpGI65MItyLUGBQZfaIn8bLcK4Zj9XF"
-    "GNUwlHl1FVUZg4j2bZcQRChi9zoTnUJtjuux921ZGa7mttyZcCP1whjbsEVLYclAxMh2GR0R"
-    "5SYWusgqP9kCCBJAeXdZoW50QYqqXfsO0dU2RTawFxhZfcObVhdHjL02hMa498pAN9fexpaa"
-    "7KptfvzVVSLazhwjH1ICdBVlqiVXbxBAXuMBn7u+CEfIhMkzoq9dpBTRJtoibbUu88EQYTjB"
-    "wTPIhD/WDBqAgUjam7AhxiDz45UAjG2VEQyLBt21gYKiW7QoWb7rfn+6miB6241d69Pna4wB"
-    "u9rX46W6QJbd1d1xdzvVzBgh4n6+pkAgoW6Rj9DMnBKez9ddd0YQqsIyGT/l/Az2oExGZobe"
-    "39/evn9nhGGF4AK43Q7uM+soyrKCY8ZIheq+379/ef32s/uewhha+25aI1dj96KQOVFsZOiT"
-    "+6Xiwhg8mESOyCviAiNyuvfrr398+/KnroVagX55XBINozHHNLB6kaCuBqmOTDSqbaZirFWE"
-    "FNntGFRG/Kf/8DdKbC+zEWqahMTa1bvr+az7ib3RDnIMUk16zKJeQUM2OmMGs3fbu/u+77eq"
-    "rUy3qvr5fH2/n+dCkdRlMUhLbEQ1U2gXVTCDJG3VHFdcsDpIN2obwBxjhLo26G7bGJl7Fwwi"
-    "bNh+ebzYNmHDsLG7C+iUem+TDIBoYu9nm6Ko80V1jgFwVx0EhmTXOv85E8TYZZIAaWRMGCGS"
-    "INte9gJaCrbRrQiD7SZ2BGBlzN3sNklpAK2gG0RlCrS7KUqKVLel2HuPnOuuru4u2sCu3ve9"
-    "MhNkm7bONmybOtBX76rdm0SEulukuwieLSIiIz5gQ1JEgAyB7PNuSDINoF1A21W9I4MixWqL"
-    "AFh9U+iizrvaHRGhWIviIKPdSu2175uNuFdTSYDq9n5ckwCohseYmZciI9Qtg9fjUkSK8K79"
-    "tEtBMuZ8mAFIxL5f93onzqEGk6ChIY4QbYN4ecy371/vt7e+OzTFcb/vEcN2dZ8NjpEcw2CO"
-    "a4whKby/ff35+ePb4L5mZGjvvWuBvB6f7B6ZEUmIkDHs3AjmMKMVUIJSpO0xh/aP91/+S//4"
-    "s+pNgtzXnGcgLADi7j4IApTAsM8xri7neFBZ5aqKUDAigpEN5D/75y82pBeQGhnD3e8zznNK"
-    "1P78eLD2Xrvu9fZd1zWvx1rrlex8/LRvGFKM59sTLMoEhWn4fi472ti7MzJCtcsggBGaI3ov"
-    "4wxsCnWbZm2/s/h45Mbbj3ddTOz6ND5dY9x7d63tVVU5xn2vl8fnvTHyoh1kraURVaurRz7O"
-    "lxUE3LTX2iHF5K6n4jrrDLohkugGyb3vKgdDir3KQCh2VQZIQDEvPu8tKeOqXTaqSwLQUjcq"
-    "guJudOTo3jAiA8S+y6am0MjI8u4qALUb1ee71u6qUoS5XU0m0DFyraLOe1TlTZZhSVWQAu5u"
-    "Z6hqlfss1d0tMTS6e+8tQATIvZ6Z08pdlUKEWF21QVW1VXNGo7o22xC7i2i7MuK5u1EhKe0+"
-    "AAtESSygqkmfR2K7wauqxwBge11j3iP2DqpsUHB/wARzXvdqklUAsGtFkHGJDWOG97rrfrpX"
-    "ZFQVOAiCUKD7fr7/QFT3kqLbGiNJ6WMCiRGZfP365fXrr3PMGEnA7YyIUK1SRES0mZHbUKRE"
-    "ePe9vv/65/vtdRAZIFxtEoTclKGDI0LkMGFHjpcqIAfHbOLMu1cS+64fv7x/+WO9f4mMjoFz"
-    "K4hrb0XY1W53x5gRs0u7BCgsV5AFJ6wYmtfsXSAPCpDjU/zv/+2ntZ5ANFnVa98ie+/MMWKg"
-    "fGW+PF5+/7vfE3p/v8WrXcVSvjxrt+kWrfv5rgiHDd+7GvH9da+lMqp2ZrhLDMUkotbO4BgJ"
-    "ppUpSCCHAooiIwKKzhFUTokFf8ChFSGAFLuIDwq3CQd9diMF2zYwRh7Ias5xvoUKKSuG99qB"
-    "MXI2DHjdTwXsFk0yGLYycq9tOGPYq+qNDIpwnS8BYZ3jVw1U7ZKYwb3uTFKoukMDgFFdTaq6"
-    "gY7Umb1zag7Crtp2E5SIgwsDgkQI3Q1JoCO09016zkvKqrJ7XCMYa+29N9kK+jxyIwCSABqw"
-    "CLiCINlnxfJe9/tMrH1TUqCxjap97mQBDBp9Ew13KgnPOWCgYVM6+yBGXFAfdJAk7Ii5V0WG"
-    "1Qw/73pb8eywlDEyBaG6QEVOnY+NskElyBw/NZBhsXq9r/VWtUdeVaHxyHkpBHfXIkoyxCLI"
-    "yHlFigyYKc4p9nr/8TVInJ8dfS6ZSNkGmSOBjMiRU5EEUvv125/ff/wc9PXx1PfH5W7biBhi"
-    "AAmMtW2QmlA0Y1wvVFAYY1wZE3f9+Pn9l79jvWbirt4tOA02CPneT5PnwLW1C2u3kIrYe0c+"
-    "wKzWXcg5KBkJBJVNOTL+h3/3KRTiWLvfn8+9nuu+4V73up933bt3udvtn376neBduOt2wLoA"
-    "4uBPcAasuNdCCMy1tXo0roNXjTlEdwPMiJxjSl5rOQYYez0jBz2kJssgyJFbkS+P3wVa7rWL"
-    "CuFgohCZee0NG+13ya6VktuNUqRB2KRT6e69l1KgugB3kF3LvsEh8ex4Eu/9DJGO+1k5ErAy"
-    "AQAbvq0wCui2AQcJmHTX6q7MyzTpEPDB78BNIY02ECMjpXOzwCSf95vYIRnkOQsglyEKdDfZ"
-    "7ooIoOmG212SFKPKEVL4cE1SEKA7hoDae8Gw3V1xToUu0QIYefhfiSGUb5EGKJDdvUn2RnDC"
-    "Jkuw4N5FpkQCos7nHiGjdi8gEajaJACLEiJCMBjcvZb1uqI5SNndQLshMWLMS4DhtdYHPAnY"
-    "0wcjW+/7fiMMk5ri5cjMVIR7k6i6TSAIypQ0nuuZkWOMESTWj29fggbspjTAaDBGVhkHq5By"
-    "TDIixuPxsO/vv/6J+zUTEty195KI870UYVb3NX+qZlk5LsUY42rIkcppembOkez14+e/X9//"
-    "ijOk2HYnofwdI8ttbqi7OTPdIJLIiMicZ1HL8djF7YjrMkkixosZjFSOMuP/8Z/+Rpk5Po2X"
-    "GhmfXj794fefg/np8TmDc86X6/HyuFyra12Py+Tb/V72wWOl7LrJthMSEAbf73pfsXp0c+ZI"
-    "wbWqn+6MTHLDPWJoXICGIiiGzGxse6MVKcW6xiM9wRUC+yIcw0aej6JbwiAMroieg+3OMVOo"
-    "Kh7M2WZ3w1REBtFn4SVaGpGfGti1jFr3091EAzc5jLQLgM0Uu2rvHCPPSugWZbQj0nYkIe/u"
-    "oHsvoekmLHetjpw0KUFdXRSNJ62AhIZ3V52nPiMA7m0CIZ1BsarcPudktckg1c1uRwSBvZdd"
-    "JKqrbYVkwzUyMwT2uZKJrrrdjbO8olmtUNN1YHDbLrSGgsBeRpSAlFxnegQaIwjsUESM7me7"
-    "Rl5tBhOoMaLrnJAgVW3DCJbH9zUcDs3yajQpIQ5GPDLX+pFBxbRbiDF/lyN6f6+3H917ZsAh"
-    "vjACHhkZer69f5F8fvDMISYZLoz5iAwJ6X778UvXDZoIknZT52QDJIpjzjGmQdNjXlXr1y//"
-    "2Ovby5i2gQZqzMuGkHuXIpuxG3l9UszqUFzUzBwxpyUE5/UYI3t9+/Hzf35+/6u7zG7fkc5x"
-    "QeMInxiq7hhzvS9wZVzw566uuiFygGPsnZxXjhER3d1wM4pCXGM+FCP+L/+HF11Z4OMzHtcD"
-    "jQgLGJkj+Rjj0zUfV47Ufb9V9ePx8unzp3vfz+czM7oKrkPTVJtMAKu6HI3IzEAHS1hjZMQV"
-    "wWBnHARCAoY40Im+73eyxxAgMTMRGCiIRiRjQd+AFl/OtIYWGUBlOtjktm+xIlIRkequDGSM"
-    "6h5jhKL2jsjuHcpDt2aMXTukzN8UIEDdFTlA58jaHQG7r+vh3gIUE2c7FULR3SS67eIYKVFU"
-    "RmZkt6sFhILmghblUGd09EQDLqKDipy7du+zPiT88cC4i/7AgRstaeRcVSAiAvSuFaGIANsu"
-    "u0AShqv7Y3Rad0m0PUYq0oAU511uuGEIhHWIcUq0lGhqRFd19a4tiTyjPcBwxXnsI4MgIYSA"
-    "rt6RUzHJqH0bO0dSsRbvvkDUdn1IFhNg7ZpjKuB6gznzkWPu3dfj9y+P6377Gf2DIojQVDyo"
-    "mNeD7r1/tJ+Gq1qSPwjniEhxPOZjJr9/++tebzlCJEBFVFe5Y4wxH3M+DsO8y4q8Hlf7x6+/"
-    "/vX5/k0ol21TOIhi5uzdDUc+GvFc0JiZL9Q0lDmdow0GrhlTvd5/+frz3/fzG8/TQY8hEmSs"
-    "ZSIy07YkmMwEu3e4MqSRJJRjHAIOFKmIoGRyvnyqzm0xJ6n4T//xJ42XxtX1rKe9a60fQnft"
-    "+35LIMMvjxRd3pFa966+M1WN2rvuApAKNBlRG2/v722uTYCC6Qrux0uA7AbZIyXwvmtXE0iU"
-    "6navMZgZVEpBOYgRvIIRpaEI9OprflrP1b1ClIYURINNFlnkcm8g770kRTjCtTYQioBNAMYB"
-    "9zI0I6pXxuiyxDNIBoNA1zpC5VCs/QSaDqJt1xY1FQpW1VlQo7tCw91z5NqbDBggIgcYZ8Fu"
-    "r0NAicaKrpYA+rqutYrgQcQjjvzmXOY4o5vP3w2AUoBob6Jr30AfWSnZRsEkeoRq7w+giRQP"
-    "Jw0C973JIxloBEEaJmEX2MHs8l4bDEgiu6p721AolJmaF4BN5tlpACpUXRQgtbG33cgLUIF8"
-    "3nWvfL/FMEwGlQGyq6WwG1jEuq5Hjhc3DM4xvJ7388va3yJnA8alvMa87K71XvuV3ET02cw4"
-    "xvWCpsQxLpg/vv38fP46gm5ToQjDVCgHkMqrEUAoMjMfj0ft+8uv/3m/vyVbaEIgFGFol3eb"
-    "ihizEeaFuDQuxpQuKix1jBzxuDTwfP365+8//93gE3WPjDHm2fuqDUTEoLJ2dyMzCVYTcOhx"
-    "5aeRnEeppbi7c74cDRIRVF6PF2tCF2MC0sj8Z/+b3+l6KbwEO7dQD8W0PfKqvV6ucSXe7+9j"
-    "5KffPWq5d63nHVd8mvPbt9f72Z9/eixXaPTudXcX197dSsINCSbuKqDMMHmvlUgplaO7j3oh"
-    "FZLvbhnmkmnIsT1KUq/V5pW/W2+KhNJzpAuER+bdK8dsYsyZYBeu6xqhe7+XqRxnRqjacjOT"
-    "DBJr3cuvIMCLmPve1IqQW0QHi0bXPkPUkTJWkTFCo8v3/XYNAsqM7h6ZQry9v0tWsN2AIXQV"
-    "qF0LaBFuo1Wr2S1lBO9a91rwh/Yt5L3f2oog6D7IHwGREfc66y6qtlBoXxlNurlWR1LkedCr"
-    "6rBR7Q7Frk2huve9M2btBdBw6rH2pqJ2Z0QcTR8wJwHd3ugifV2X7XKvvRnJvhEQrojo6q6C"
-    "oWi3FaEcTexym+TYu0KMccVO+05x0ymjVTowkjIROau36468poT+8u3bt9rP6+UnaNiIeEDD"
-    "7KrnXk+iAEYOpKtNCSA/nkc+X7++v31LUTi0mKDMjPtZUpbDGFWA2I3rMdz725efvfbLeHhv"
-    "JYF8X5tkdYOhvBSjy4wBjHITmmMSo1fZeAzMybVeX7/+5fXbl2DRZ7zfphXc1TbKDp2th6Ex"
-    "Yu6q3vt6vLCHrfa2mxqrrRgQR4x1NzWoMKId0kA7U48Z8f/8P/978JLmYE0kwDE9RxJ8fLr+"
-    "8LvP84rdz+rdbgIjhqvKtcufP/2uCm0/n/cu79qGxNjVVA4dOQ6hkmi2iUxlqIqKZAyDQIOO"
-    "HAgDQYyZoAOlMeLxEiSSvK4F3x9yUKwxopuyurdGVHfEJIJQjglj187geAzQoLpMYo442ED1"
-    "Dtpe5OpG5GPvPUaQ7kLIcLmj/QFNi2Hn3i3GB5bDIhFKKSQaXfeOo/APkdh1hlg0wGyp3c+U"
-    "hgbabc35MLu8bWfqsCB2UTaze4MVZyqgKJkiEgig0Us04RHByL0sfTA2EZMGj9Iu8vxTu0Fb"
-    "EAkjEauKwSY/sGQSYFUR42O/P3uRPsSnlMuLmHO+2AQyx7BduyV19Tjz0IH47ILhcFFBBd/r"
-    "0Z7thSJpdrlbkZE5ryl67XdKUJgOYK2f1/o25ksjqAuR0CNzGrWfr64KEeQYn0xIYTPzyjFs"
-    "wPfz7edgiSnwQKd19mANMswBDsUc18iIvd6+/frX9XwLRnB0Few2qEO3BpRkGgITCmBs0ySZ"
-    "VOTIl8fj04PvP379+uXPz7ev7H30f7+9/yz3WosMMglVWUdqxng+FyOuMUIPMsFtdlkcI3KY"
-    "eUYfIyKGGVaSHJFDPVXxf/8f/110Prp5vydC0fOqeb2M8RnyzMlY12Mw8vX9CTvEcXFVP+9o"
-    "xpypWOV6f/Yu8EgyoKAYR9bMQzikAFeGKJoEQ2hTOOLuiDYaHWIwYOfI65qRmiNghD7RFxyC"
-    "IspG0wpGDhs5XhpJtL32E+vu2kW5VECQFcJ5Aqp2Rrpb4hgB3qnLPaUJcsYk/bF7NtocI0XB"
-    "QQrWcQjtLjdRQQ6zqm+AfVbHM+nqSB8AYiRTdLfCZfUOKYowQC+yyeOa4AeVghBo766KkYz4"
-    "MDwgfHQ27RBSEEilG0c5RdBdNmxkZnXZ2227FcR5/cwud2Ncj+N9EzwnJdzPJyEpu1cE3EgK"
-    "ZgN9fEg599ojQ0HIiiTUjTFSSftD9N3dhjQCLduU2gO4aqs7GCC5VzXA5JgZMnBnKIKMmPNy"
-    "f+39XQ5jbgiRipfIGeF+vmLfhkFKw8etw3QHyTHS+/397cvz/XtI+k3KroiCLUWM3ch8hOYc"
-    "Lym53r/+8qdeb5FK5REOHDIJ4LZBSJn8BIg5C9mcYz6MBON6uR7XIPbb9798//aX/fx+pUZE"
-    "7VsIuBQ6+p+IIY6zNZKTiIBqW4zPn1+gq02pI5hzbgO6kC/OF+TnjKG8mjEy53wZ0Y9sv335"
-    "5c//n/gP/+qx7rXuH8/3H+/P/f7G7z/e3l799s77vt/ef1S9A4gYytzV6/kmdoxr63Fv7645"
-    "J8l7Hd1TVe8GlGkYbdDABrZdc86qqrKU3QaaMbd9vsSMgJ0x3KAcSZ5nXjSsj1MQRtutjMyM"
-    "TIbELLt7z3TIwTnGlSOPNAcg2K6j5zWJriL1oQWPoB67so1j6SG17k5pJCGsvXDWWXDMOJTM"
-    "4ZHIJkQ54qhgZDTQmdq1ujsUoZAOGUu7pCBH9W/f/lo5yFCdP96EZZ9XCMqGQe29SSkGGYeK"
-    "5Bn07aquD9sDI+Ll8Vh7H/7IXXafc6uqbZJ5mAgyfiNdIHmve611zHFoiB5DNkIse1UdDV1V"
-    "Pa5Pj+tFSkZKB7BDd3XvRtkNSjGqRYKIw11HXka+P6sKsJMBdGZEcF7KQQpSSuN6mTn4/vq1"
-    "e2U+qpOZGtcxqtX9fr9/C/nI1XNcI6/dTaaokEbm67df1/16zZCyy4ZItqWcikGOY5O6rmuG"
-    "sN6/f/3rfv4YIVeNnATX2kdXmaHMPA55cjBGU4or8jLC6vb+3afHFf7+y5+//fIP6DUCe92Z"
-    "A8L9vMGWAMtAZFAJZMbD5hgXFYxomJzGXAUzlRMR1EDMjjkenxyPvF4WAvCn6E/swb9+++v/"
-    "9P71T/V8xn/817/bz/v9/ceu9eNtv7+iW6+v9/cfr1++fn398X3XfQ79HBNjBFD73ghcPylU"
-    "zbV2t8mPSfK592+KVsEcoa6yi6TtvStjjnHZLdHKVU3Uh6aHQbLcjN5dEl9eHpTm42p/+GMy"
-    "x3w89l6NOnL/570yYqTsBVfGo3bDZIgRIZItHpy1adpH8KECupq67PiAetRsoQXv7mc+htsR"
-    "oVTXAuvIg0kQnWEyQ2wvEBGmunqdZ1iKY0XYex+UC+w5H0ckKMWHtqpX7wKQGTa7PXLA7l4R"
-    "NA7eNgB14+wC+gCoj35AFCPjYM/nSSZwPMIU52C3qzzyEqPsjAjlru62sX1gUjAiUMfnstyb"
-    "oOGmIi8xDYgN1+GdqXC7uknX3plxwLKICF2KAbZMow0zxnPtH2+7O7qNQ8+hMnBdpKrKVWCk"
-    "0Pf9w2Up7FQ+GAFmxhDd9yv2M0f2kVLERU2QY8yQeu/1fEXdRw16yO1q5LysVA5pUEPKOeY1"
-    "2fv9y1/+WPePK5iBVLQFQ5o8EQJC2xqBCHM0wwjqOodCRMwRyfv7l//87Ze/TexMkuB5b8FQ"
-    "rn2HVM1q4Kj3ikZWd0RCqTkNNqLcMa8mN+SYMT8xJseEcn/M8vFp4oHX++3vvn/50/3jK7Fy"
-    "IP77/+YPgIEN5X2LhBn3Wo1i6OV6XFeuXdLAUTNjNPnetapGQpzPu57vz8MtMhLUmBdwDDcQ"
-    "EEGCEbP2PvpbA2bYqMa8rhFmyG0xu5qhQwVdj2sems5oo3fPednYe4EViVAcqaQEERGUBOSH"
-    "sCETJFBxjnhG176rMgcYETriMPeRKoG2ex2+8wzSYEgBsPZu15HLdG3XBlt0N40eQ919933M"
-    "sBKrDYapOa8jjyBwXEx2QjTu2ovs7tUNRXSXexsNsmrZhSPwRPbhlQFRvXcwMgaMOOZK76Ov"
-    "cIMHw+4OiSLd7DI4xkMKt9e9qDh0dIqRrDqSFVSV0LAjWnIv1JlSrPMVcj/HiPmYDFEpTlH2"
-    "0XVyziklLIPVRRyZRFOxC89Va6mP1Qas3lWb8GMmumDOOYkiaj2XOE3ZA3FRhxrSfr513aKr"
-    "K3MaSQ2NGQpUf5qP99dvb6/fgM5MhUwpBlIcgRzUzJygcsxM9Xr7/vWvdb9n4vzabkABas7H"
-    "biqmj+Vf6qYxwSSHYsD+/OlKVN9vb9//8vz+R/kHgBix1zaoSFtCjjGJMCaoGNfB392gUKDG"
-    "y24wMx+DGTFygYih8WAMQJQik+SD68Gbz19ff/m7X778/XqW3Xc9lzv+3d9ca9+1771BP6ru"
-    "511r1XZ1M6THY85x3fd6Pt9T0RyOjBGuhVpdfH+/YWemxsCHwkeijBqDxIK33YaOSc5uEtVy"
-    "+9A5vd4Y57oeh+2IGFTkTNIRMeIi47DXbhf2GB93T1sxFKHgkTDQEKhjF4AkNtFdDg7DJiKG"
-    "FF0bh0ZQururQ4HecBvVh69RfLgdCAVJHtVxJumyfYyH7d3u9q7e5Me+WobBtb3KAEUYZcvI"
-    "cle/k0cU0SMuShDtygzAcNt9vHvg0SQppO4NdMZc644cFO99o4vA2TJk7eMbAUQC3bVHTsW1"
-    "1iItjeoyrZDQJKpW7Y3jbNY5uVqANJuHA8sPdWcdSlJgtIPxIFuC3REpxd513M4QEhLVKAPQ"
-    "sKM8VpFxEAQESLekl+sBBNmZcHV0gJcpc4z5ksER+f766togQIuhGAZjPAyeKcVV76/fUybV"
-    "dhmMQASSBzahBpWKDNFd33/9ueuZEWPE8RQqp83daLAhI5GSUjz08otyXI9PIT2unOn7+999"
-    "//WvvZ4pDIXJHCNSfRICmL29dykvxON4y6p9BskxA+dRYiqzCCoZV8QDmmNewcgxjmP+04xc"
-    "X/eXf/j+5Y/Pt2/sEFbEW6O6P8d//NdTZ6uqI6jclNrug5y4n+9PwhEJ6u2+TUjISIFv729r"
-    "rxhbql5Yd9m2vddyV/VOqfZNNhCN1oHRiJMbAlCiVO3OTDG6rOS9FwyKEOdMCQRm5syovc2e"
-    "jyEJjMhBMKSqpbBtNsCK4SNIq3rmHLAIn48184pgxHH8dsQhT8JIBYgd2qJTlzSaLgPmsbwe"
-    "J8+ck1RVi6xd1MHpKrFSIBn5CbxIl3tviDNCdETMNgimUr/Rr5Fh/KaL9yGMEDTddDMCIbk/"
-    "Nn9SOXhcAKG1b6otNttsF+r2yIS9a9vbQsOAYFJc+6YxcuTZdrrKi+gh0hzxoLe9q4vMXSjk"
-    "mEdPjjOhZwCEYohj1ybQvccQ6fu+PyB6CtV7764dDMWo7t2Pe41qtXvvJcb9fM4cY14xX8gU"
-    "eUz6YGxPckBi4mWOXev5+jYiJFr+0DGPpGPoitB+u19/fFeQwRgDAogTy2WM0E+Mi8Gc14io"
-    "9fz+9Wevd3ShFBIUDYLalinlpAYjGiBnxEuOz/SJeME1OPH+/Pqn71/+gtpJkyhgzE/Uhm1n"
-    "Q9WgiopdyhnLu0XGUIwjcc9rmKN5WbRCORmpkfOaY8wuZI4r42XA3//u7de//Pj2xXsd4ZO7"
-    "7/UamRE/xb//lxeMqqZDHHnN9+etCGoeJqHbrz/elDmuF3vu6n3vOS4pd9VaK0KhREXtUlAR"
-    "axfOvWWLJTXA1UsZVJI0PGIQ7L1D51gfh3kg0egRGSMICz0HZ76mSuRaJ6ihD2Vy4hSqC8DI"
-    "EVJGRLC7AEmKRLvQTkVQwaCQGXs/jcqIe72JXXtLUnSoqp5gmhORq8otNLsqpOrOTHd399kY"
-    "zpUEIEMhAly7oYSjvUHM8SKlCPShcHOv2rtGqqsMd1f1jhgArzkAt3fX+1lyqSSF3kYZZ7/l"
-    "R5wFbRbp0PFUyNUjhkLttvsIQ4BWaO/VXQcPqOqIcUahhkPIkD60/r1rRaZBMKwB0u2DTZLM"
-    "DADVsFWrcyRowucNAfRhySCAkDTmULDhXY/nkhUUU2nH2+vb+/OOnHm9fHp57HW/vb2/vPzU"
-    "ZjuYn5gRYe/1/vrae+91K6x0QTEGlIoRkff721o37cjIzGNXUEoZEM0rx2dIc+bM3Pf7929f"
-    "vO4guvac2fbukqKMyKEIMBmDioaMMCKPoabul2vC6+sv//j8/gXdAaJbEhUtg91mlQCyHcE5"
-    "XxizxZPudG5fQVWFCI1P9qzy9RjSVF55vSiiyy+PccWu1z9//cv/+v79r/fbax+DktR7VVVm"
-    "jPloK/793zy6HTGE8XyuEqwAgxq7eVwxBl7fnqt9PT5HxPP5tuuOoxqk7ue97upWVVeXAwYl"
-    "oTcNYCnAAFM2V30klwXk8sj8SGyCCIfwAT7DIQZrjHiMmAGYvW1wzEE6IwgCISSDGSHySAfs"
-    "yhTJMYeiqysVM5PgGAO0XTl0ppqRw1UZ84RykQdsi13RUEYKiQ9FnUFE5Fr7eDVBUlGFzLRZ"
-    "u6UT8VNtG30YiGMEEti7pZQi89yqnanuDjEy11oi7Vr1NI7zNqvOJFwS8ngabTeBrn6SllD7"
-    "eZQqB3ftMynIgOccdHXXiYY8uR6G9952R1LJ7q6ute5zDpqOECkqwNjbVAN3Vc28SLodeRmI"
-    "HCJCPkFlkq7r0f6gD9wBQ/Tet4i3uu6tAk6yEjQjBiPH9aIcI3U/32HO61M7lC/X7/8rRAy8"
-    "3e/fj1dUMsItM8Z4PMgM5r7v97c3uHJEVRksFzNAlqExoEdzjDlfrnj78fXrX/8it1xdNUYY"
-    "dcAJRsYYkgzGmFYggnE1cl6fR0Tt995v8n77/vP9+hX9PO+RGA2f0AKzdQBRekbMkW3dDYYo"
-    "a0hSuwCvgvJifgZfckwS0CwnoWvOkc16e//2xx8//+1++6urQkqi1kZbQaXGfOzda93x7//F"
-    "zJj3czdk0B8edDDy/fkuub0ZWuX35357f+69IniyUEEFk4Dt590fDC5696YR4ow0NuWTq6LI"
-    "NoPRe0kRGVVNKGIATZTUR0o0xoB30ujlNjnEQWrMBEGApI0ujnGJ7F0ZUbUlZWrOBNiuCMA7"
-    "dIKFXC7i6AU+LMjdUig02tkmfJY6GnmCDQTBNJai2nC3pJMloBAjujoi1l2Auh2ZACJFQMLe"
-    "tVfRLUCMM3gb3vWUACCH2r3uHUdNQVS3aCjxwSoXhIiwAaMK/KDZ4F5VK/KYGlBlMCkZXbUj"
-    "ZJjoODkKQO2Pn/a4I0Cj67ctUrVrozNFHXCeILsY0YpbBCmJDI35Yqp6zxHdizAFxTieavMk"
-    "hqbg+/k6Z0r6/hzNUfa9Nq0IzTlyDgUjKDTckmLM3dT1KX//b1Kh51/2+3eAGRljNITIHBcR"
-    "ZxF4vr2+v7/PkUDPeZ0NlpIJRpIxH79jXBLW25f3r79g3XPEOShJU+7GvF6O7UuRimhHQTEv"
-    "IyIf1/Uyw8n79def77fvridRu+4c46Qa6Z/UDiCcVaCQ4eq1lzUephk+uloi5njM6yeOB/SQ"
-    "HmNMKqA55/X5moH7/evff//yx+ePX/bzRxC0Zma3id7rNjhf5tpAh/2Mf/vPJxndbMtQ80On"
-    "eteimuHfchjC0Pv7fa9NO2JEjB+vP4625157LxCx+pZO3AXyZE3IEQSzq8iP0FAeOy1ZXVJ2"
-    "Q6Nz0N4MHkY2aPaOk5vMnSMf83IjFMeLN3LarPIYGQdTFas7gicmtt2Sx5mbQQqI89JYu0iK"
-    "YTfliOymaSHcFQpR18jqrjLBMY5HA26TGGNGRB/klh++4MjcextWGC4YYGWMwNGwFI4SSDaq"
-    "vSNCoer9TwP5AcD3qswow5ar8zjOz2HDPKl9RJcXUGOMcldVnFC+nFLYzqE4qjOgu7v62CSO"
-    "nTVHwgbq46lXHMRuzouh7vUBwgPoNG7lk8DumnM8Hp+eazcQ6hAO1XlSVM4RJh5LM9EVYkZW"
-    "88cea+uwxyPHGHRXoQhkAC535RiKEePaMebv/zX2/f7L39I3Y+wyNTQfHNc1ho7/8/nc97uo"
-    "mZFDZ/CAom2H5nyMeRkZee37/fn9r9rvJ6ukuw7HC9pHfU7liCobjPnCnFBCuuZLSMJzP7+s"
-    "9x97vYNtmiFSxsdO0V3+YDeS1plZ2s54mEkxxqQucs7xmZ4FMYYxiIgMxjXmGEnV6/df/v7t"
-    "69/db98kd1maHyZkIEd+ZICI7qjdIzv+m38+jxy526Ewvbu2XV7UcYf7Xs9uVEd3K/hcz+dz"
-    "QxP2vt9ef3yrJjhdTQnBCO79br3vPd/uG7FglhkIVre3kWM+hOhCKoFa/TRtGiYKEaCBtd37"
-    "5TFGHtHPOcaiUWMMgmNMKQhHHIGePz0+ndCjYMK+RrC7qnNe3SdqQ9VBvUCPMmfM6lV7E0d8"
-    "szMEUFCfICKyeyl4whYpAze4qHbMD9eQEdJdPecVIdoKlrcolIMSEgjxuAXvJMbQsf5VLXEL"
-    "Do4Y47me0hhj5pgNuz1yuj8s9F37UBsGqBpp+4wUaFuRbRyboUS7ul27gNytMV/K6PZHSm7X"
-    "Qe6bgOJk1O7aXYuso4to9xwv4DLe0QLjTC9g5Mhgd2/p5BUHCqkLMFzBy3CIM3O370bxMmdD"
-    "gPdaAMacYkQwB8EzGs7QbHs8Hj/N57ef/3bXjnywVcWYk2MoeLKO3r9+c60gjke5G1K6kWNo"
-    "jBhDOTMvhrieb1/+6P01BRo2Rg7F2Ae+Bu1QTHIg0pyMR8QUmeMaUeyvP77949uPL+hl3gpd"
-    "81N8mENEaa91phNCBCMTDOcwZ2syLmgCY46H4qrO1mQ+zISC4IhrZib/en/7X77+8X+tt196"
-    "v5Ou7owEoqobPOGEx7eBjqPIe1yP+Lf/22EczDYkbNR2G50pu40tlEgibB6D+H2vBt+fG66R"
-    "sde725kj5mPDd91jkNggcn4CqWCO2S4hqusoY4yP2Bf3plrRHxGR0IgJuPbOYyLCPgkqmTPy"
-    "I2aJx13NiMg54oS5jJE6Co19iwpoJCXv7mPXORlZoZHxODoPSu1lO2OIaD+7GvxAJNwb6LN4"
-    "nlWp0aCr21AVATyuR/8WowdX9z6KlRC6t6sFuutDQ4UN35lnl+x1r5HhqpGDzPvekRka6DJQ"
-    "1cEIRXXtvimPMVzdOGqKmpnCx6VKEhyERqa7z6l0DPNkGIGI7o44ftg+hsSGm2qfd6aBZ9eW"
-    "wie51XvXoQxMXqTPQTZydDuH3AU4Drd5vtFBCUDsvqVVfkK5e7yuuBch8VDhGbVXCI8rRUec"
-    "/3PEHCCG7vXj5/fvv3wQzYByOrLgjDkisOv99fs1A+h1F6lGgh96w4a6Pcck8fzx7f37l/Br"
-    "cgusD5Ep2qzuyKRGI2I8ygKn8hPzRcprXp8eWs8v33/9h/38ltQYca93Qtf1addyOxT3fR+d"
-    "QkSKQX2MPTEugxqPyCty+uggEJmfcjxohoZ0ff70kul6/vH12z98//Wv2KtPxpg9ctLoqg/P"
-    "uUQwYnSrWmWG0s34t3/zuwO7gUGFZX7ohkG0sPGhTRjnQycZGTEmNYAaoSun7bV256UM0PZ6"
-    "TFVXNf3hj0Gw90YqI4cigYAZ5xNlx2gpYKFIO0eShJBXtrf9kbwlzS7PcXBTRkRI9gJLQoR2"
-    "bQl0hyJjArV7kWnwuq6jh3UjOPZx4bgVnRF2k8dyYDGPoQ+sE9MTEXuv6iP2/tD9SeNgSiGu"
-    "vdZ+I3rO0d4k6D0ygDaQmQ1T1XWHbFTVXQYp/BZhe9LgQJJBHDvREVMRbPPE4mhktPswcF27"
-    "+zgkBSs0xOje+LAHIjK7FHm1aWLMgd57LwpB0CcRLAmGQuDIHUwjKFYv+1wCOCm8Co8xxKjz"
-    "2x0lHInulMrbvzVQdAEU2e2mXqzPTwcc3UZvnD9ODllyBjPUtqXIOXLU/nE/f4glBRSWOC7m"
-    "jBiZ6fV8+/6VKH3odsIcOT8X0hqRM8c4yrz1/uPHlz/1+nGN6lriPO+oEWbEfOCk8EuteUgd"
-    "xkuOa44Qn8/vf3r/8Zf7/ZdAzxzt3vu2fQD2c8zZJ8tkwKwGlYeUMkPjIieYUFIjxmUPY5ih"
-    "KzLxaezsv7x//Z9ff/2H/f7N9Q4sEF1t43FdZ18DIH1kuBwUqQ0ewwkd//Zv/hmRR3ZvQB93"
-    "WKA7gvPYMXTBGTEjMmdej+t6PLo9hm3D0WBeVwMNS4A3vY+8nSd+XCSKSMWIVCiJHDnslvoE"
-    "UQiJToKZInvMCQHngYkEIjRPgrbQI08cckeSXEfcBbpdp2OGzL12DnWXNMl5TLORE91dtxKN"
-    "Emnvdp9QkF07cn6EH7EIWqpqEpJW3Scy7Si9PlLpquzOkeSxptpwhHqvM832kX236Q5ZoTP4"
-    "2gRPqGvxhL1KxvnlphvnpkIBbTJy4LdsutCovQm7nUoqug+vVvpN7H2SR1ynKgEhdpVrHz75"
-    "sLuG3CSEMzZ84BSHYIh5PaqKOOK2E/PJ1EjlCaPZe52IMgBGR0zQey0pQZFBPozHcry+PQ/Z"
-    "2+6qY3hcY+pxjY9IPXOM+dOnT9jr/f17n7gcs5mMoIYiZwbq/fXbr1U3sM93s6x2mDPyakDB"
-    "OcfLFevt17dvfxGfIz5yln0wp5hGMi5wmskYVjIu60GNeX2eI9Nv99d/eP36p1pvsm0rDuiM"
-    "vTvzighLe2+AGbMdEUlFIcb1UyEQ007lizm6GXG1A5o5LkY8rsfF7rc///jr/3p///Pz+aP2"
-    "k3xeD+3b6MxIHvmR9xzTbAokqHh/f1cGye4Cne32h+RN7S1nKEwSxQY+HN8DCEI2InSGsLiU"
-    "ESivQsyrmELXXh+CeYpdM5Az71VVR1uHt/e3OWcGyzcgY2Vi7/fkRygsXFVnYMXqPZkZV3eD"
-    "eN73CWUe1K41SJBrdY7fuBPEIeaVdPt82a/r8f7eOUZX5dBad8AjVdyRwUKE9u61CwOKXLtC"
-    "JyYa7rnu+ojeFyUfYXPmWGsd8OlEK+xatueckrp77wWEuxT08bmT3dv0CI1Q25F5r30I28Mk"
-    "lz/UM9V7KO772a7IOOLr2v3hldGxXvA3YfYHgUeeDLo8ys12k0R5V0XGqo6glJmxnu9n4wBi"
-    "b59wRkZIn6vvCMuyY902BKgLEXYLCpvok/XrlNZeGeNDy32iMA8ggU3OXcFU8PxMN5RrbcbL"
-    "qYk58fcRCZ8MlUCtfr4FPqCFRivIyKZoEPX2+v1e72MypJhZjg03OMBzT8wpsr5//fX5/c/k"
-    "G9Xko4rQEVJMI4nYJUZGJANN5ngxR8aIUK33bz//bb/9I1HCVF6FRtLbuxakqoqMvSvHBByc"
-    "hE6k75gv24IeJqXoE2NuSUHNsjRC8rj/+OvPf/t8/aP7HcaYj6plvJEi5hgXg/bm0VCwToRn"
-    "G3u9z/nIvGp1uWinJMBzZLeFYe/GyS0bcwT6OEhU5WtmZFwPOhaTazsYFBuIMRRx37tri/14"
-    "5Mx8fb4JqFr73lc+rK5uIVEmlxSMutf3qZkJ+rh8OkcAu93slXGcP8FWXjK8VqmNmV3GkViC"
-    "PHn5Q4DPXa8YVmCjOmhr0AQcxu5akQnJrt4n6NCExLbp01AXKt4oHwVIqz78hHNWdVV1V3dB"
-    "g/A/CSS2ubtUHxpkIXPk3s8cs6oYcfweq1bEwzhksstFze4KdrVtAh109T4842ll4Ml9M9pC"
-    "nwja3sDpx9hVAJRR3Wgr4sSsilpeoRwRvqvPgeLwWdi7jN8gelBM0N27qu9eLiqTOoige7Xd"
-    "qUCxiXblpd/kkF0+0b0bJXw4tIwGZfeyXzLGXe2mdwh2FMm31/fH40GCgQwS6+3HW92LCUOR"
-    "ExQjlMox3PH2+k3NmY+q98z4J5v+3sEYpEYIXvfbj/X6tWsr1GUGoQC9t1pROI0qyjGaJ5BN"
-    "jDGVc8T725dvP/8XvP96cmEOTHD2mg1XB6XNps/MEgpvuJhB1zHEksxgDJ0rO5LIMXLGi+nA"
-    "1/uX//z125/eXv94PWCS+mSeWJLf9cKgwd099y7qGTIUPLOom+w543nfDoUGUQlppty1d0Uq"
-    "88JHHZZhVssOaT7mIQDg3l3vV1yCTxvRuXPKRcacF7mq+q6a83HX9qpINXbGIFRHa4EOEdg5"
-    "1GjSSbg7lBJrn/IDZGj3/ghCBNiOQIjeFVcA7d7SaHtEitpuV5kGKiO3t4veaCMCcwz3HRmH"
-    "quWh7o5j77fQGYhjDNPiYIQ5kygAqFUbJ4vqXDuZ9olfL348ZdFuw+3OEWh2LUrtjkhj+dDX"
-    "7LWep3woQqlp5N77uU/u1Iew8oS/d3dkNDZA26mJlt1napV+cxqNCbrRlHc1jcy592bQbLHI"
-    "Fdog1l1gwGwGYGnAkHDmZwkh1V6iKNpFkKSCaCuTpGTbc4xGrf0MGnk8/fWR2WiS3LtCHiPu"
-    "5QwFBW9lPB7j2Kn29rxGN3IkjgQArtojBPRHXZsjEQBYfr796PWkd5xOym3Pk7E5GVnVOSS1"
-    "77fXb38W1ryy9gkMighVV45rrWaMGDN0NQRRMWZcjJi895f/5fnjV7x9fxmzKw762wetQuRk"
-    "hN7f711WQpSlcgOOGEqxCjkipnJUlTkRD4001qanX/H+129f/me///xcyrh6bX+Yjgs86roA"
-    "sXcpDhHnOcfqXRvn7qbift5VHuM62tP49//VH0Tez/fMyIy19pwXwTES7Qzw5BRMKhxhYYVa"
-    "3uODPjkhzCdIMTOUQaJOUJEyyh0ZFNbeAQUt+Th1c5wYp25jxNyrI3JGzjyxuhkBugW+zBd6"
-    "qzGUB1jOcWoiO3OcmEVIVceCe8aKj+P7bPwj52kDOhKu9ukuChwinsiZbXc/yx2hruq2K8/a"
-    "efrTDotCBg8DrFP4tP8pKjWYp+sArEA0jmZf9/NpIHPahlUluzMT7Op2524YOBKDDHRVpIDT"
-    "bwgGykUKHQKPaPGjyeH4rk49BzoCRAD4Def6iCQXKIY/eLg0wxrbIhxhcf+WtemUjkCUJ5KT"
-    "AFHVRzxzBu0DI0PHdFEmIqL2HSfa9qM3EXaANNGFe3FtN7S6KW43Gbsb0uPTFWIIqArzjKOA"
-    "yJFjSjkze6/X79+O8PhEz1IZ16W47o0x5pia6dqvr1//gn4zngTJR47hzoPDGymOOV8YVyEU"
-    "I2bOfIy4ut6f3/+4vv3F+20MdVdDMWY3zA9QylKX98HEr09xTY2rjTEe5CyFxtXMGJc0qAdH"
-    "xDUyr4Er9i/19R+//vn/t55fMtggHV1UjMysEnESupIcx/oeifadmbWtg/SsPcaobTFfXj7Z"
-    "3bXj3/3rPxwZYiiu6xpz2h+TnAT7pjAuAStYa72FPE8LDUx2VeWcuyojMuXe3vdR45RxrP0n"
-    "hy2UQQj9T5ubXbWXoL2ceWVkStfIOXPOCEHyNTIVgfjpcQ0pM6+XGQmqI9h2dce4zlfpGOiP"
-    "0Z1owO2SMMZwq/cWzmzBXR853bS7C8C9d6RAk3GqWE5MKWF3ET4RVW67O0dEgPB9P6u2dGx8"
-    "cTIhJYtu6ETTHdlJxDy9KBJPaZvRu24pXNOWoDHC3nav2ieK8TxvH175j/LUg01FuyRKCWLv"
-    "JclHnFEWKGXGWGtLJ9lTa9Wp0GNmA9Un0qW73rreeA6LMx13nT9DIZxFVEJb9HljI4jfKIT8"
-    "IPZORwSOccIfRnodVfTeeL9PR5SVSbCbQJy+1esxR+r5fHNbOcCR+QINK2HOzF738/0H5e2u"
-    "3+huMzRedgvM6xqhfvvx6/df/zK5gRMEOU8EdHUc5CDigbiaqZwf8VmRV4T3+uWv/7B+/ExF"
-    "A6bLPlUmx9hfDWYC+bx7zM/S3OW8HuCsBjWhCzki56kXZQzGivFT8nHxtX/8z/vr3+/vX96f"
-    "75qXGTBGZPeJpXt0QydUFGpGA22ZJzwnjAC0qyNmNTIHIlZ7rZWhhNCuMdK7q6rdOO06PGqK"
-    "wYzuJtrGNSNEuE/6dtd9rOqH0bG36JjR+z5hipGzwG6XAWzQCRAyWe0EwyORYwYckTFHhiA6"
-    "x9GOIaSRIzx7v1858prVt1kjx3ZLZMZh4cAemWK479+86MeQHlQHKQ22BR213VELkZ2KOmEi"
-    "3alHI07e1b6d2rT3eo4xMnPd5+fC8etGZqRk8izQAKX6qEfAyaOl2Oe52kvKqnW6/7rV3tJJ"
-    "GEG0IuTaOEYFoV2nZOgkywYFRYyxb6PdRwn40bLZdts611YIYgK5d2UmgMJpkWjOsXujsfeG"
-    "ZkTUeuu+Qz0Gonmv21Ao7ZMLVe1GnlZHjpGnUY1qe9/PO5Ujr9/8j8exHOdltOvEDgCq2tvD"
-    "RmSUfWafbmdeVNWuDdQ25N2GYszfVxV6jYEIf//6FeyILKit04+UcYXmie4nsNf7++vX8AYN"
-    "ROhq0vRuZc4TAh05N5IKRs4cVZiKfr59+/5lPb+P7lJnstsjLlcqug/BHYrMVRrzU2g+3+/t"
-    "5u0MxXgBozpSKQ0z4Ygcoc9gu/70/Zf/7/72t/CL69pd6319mjJ4ElIAVsleEScliKvOfRtn"
-    "0jJ4liOcwDALZJVBK+Mkwa+RFy2PNs4Z7JlylUBmSArgFG3adpcy7Fprk6URVFe5agXaNDMZ"
-    "3N2RcVcDQ6ACI5NYCouqgk9xhh+ZL4jnUdkn6uXxIFLRzCHUHBNNd1NPjRSZaY15cKMrE6TI"
-    "3msOwTtS/SGiPE8p7e1V4FOa7VnehsUXcdjPe605B9rBOfgwGeruqlWnxGLvO0gdUWIGQBmr"
-    "luHeNyMysstEdTc/mreFZoBBVDflOBiq9wi54zjzJwnkWkdfgtpgtrmlAMfJka3aAJSgR1W3"
-    "b0A08hyLq6s6JjPyOA7BjpjQ2MUIE1V9S+Xu65q7t6vc+6zu78+vQwtsjWFGn5sTLaLsVh3P"
-    "xHFUpmZjzSF2sQvONMhc1VJkZO0+i311gR1HOYcGGEp7Q5dBu4CoXacmOpm971WkECOVuQtP"
-    "5PW7f7Xf/hr89dvX7xIolis4IifiOhmGkAaZed3v316//yy0Rty9xCsz1nOZofmpTg72KfND"
-    "4rjEZ7Dq/cdfX7/+TO6X3FWWBKq9N3vOi97xW3rSATEjcu1qJZWMzwh2V0RmXNS14ev6SeiM"
-    "W/v+/uXv1ut/8f0LGiKr8DJftrcp0TjVzY2jrLPZuEkCl51wU2dOoRljRLO7gz6AITKvRi9X"
-    "/Pt/9WmO2Xb1zpG/GW3PWokTRf3bATwM1aoccYpbYMQYfYr9XET+VvGyx4iqIEdopCLIzFHd"
-    "ClRXjpE5Q+6iEIqS7isi1SFnZKIfM07alo12X48Aoo3rEQrk+X3F7s00VUQpsPftboRB9Yc8"
-    "6JDV224yGSbbjEOvZsrdEZBi7UX0c70fwGxkuutEQ7fd3QxUVbmMHiNMizr2o9MFfAxKB4U6"
-    "UNTJnYkY+4ijwXttnAonsevDrCuwqskNFCmf4r+9T/DQXkXnMQjCiZO9C4A9RkjcdTgkuuvQ"
-    "AavqVM6SRRR+s0ofvrfdEWdfcI60vZugjnxdZJ0eKcauY6NBaMBLtGvr+BoUxlF6qQtSRgy7"
-    "22WfGD6dr2o7NtTW83mPKz/0x2KAI0NcJ+ZQY1oTGOPxh8//7F/a9fbtj/v54wOTj8S4yGGG"
-    "FEc6SHjv5/evP/d+P8lkUPAAVBHQRSnHAMMQFDnm4zEiOljff/3L64+/op/wLZmBzNNNuQzY"
-    "sqvrI0ILTOqichdiXO04UUeKC5zSIzSuEcl60Vu9/uOPr//T/foPvr/53hnXLrQHFeM6OgIS"
-    "4UYou7cCqaDcVuhTk5HRberU2bO6T/W3NGBGTksFmMyp2M8bJ3cfLcS5vfuMOtJHPkujnlt5"
-    "KT6KtpSnovpD04vuiDa4d0lj37QZQsgZhNF16hg7H5OUWhljxAjOzMrcM1m14C3g1GBXl3JQ"
-    "EtwOKUdOcxNFsA+yolNrJFtrO85WGCnl+/M5gh+4kT0eKbDcVEkbVjAV3Wt1lbIJr7WoCD1q"
-    "b/eptP54luZj7l5Ve8zpPosxAHRVZrY/Yg+7MWLWvk84M+lk7LW7c8wBt4LdtHjfxbbRcFX1"
-    "yV2vY4oOhVRtxZHqam/r46pG5AUXsD9qe0YAEOAuKXbttjInfFOgC6jIsH3vdUIJQgB2hE7e"
-    "WtkfAS6a7ru72wiOtsd8FNY5R2SiETGlELO66XYtk1DAUVVV+xwrVaCN7lM4aAeFx6dLRANi"
-    "AP2Yw/yIrN9lNMfIaiRjRH+7395+vL4Md/dx5wYTkW5d15XJfb+9//jWvQMFNZnViDHXksag"
-    "mJqN3mBEhgbAcWUmar1//cvP635DvWXIbpgkq3b3iVNFhOpAOPFQPO7qyA8/nHX1yV1hUo+M"
-    "KeScQ7pxf//+/Y+v3/7L3u8ZJF82OvCJudTzrFlddZ4aUuU+OoKqUkw5117x+ER90HunXqOA"
-    "1IgYXQcYRo7R953jiv/wL1/4m0X1tHWZB8KikkL37ojIyEMswXatso/A6sQwnYgJRIMa81GN"
-    "iDk0wkfViBAlzqkxVV2ZMceQOMYjoDE9LrU9huaowCIrIgoCFSMQdFOK3TcI+j44cLvmOGmV"
-    "AY3uj12sGtRQhMmhSKbtjNiF3W7dtZ9oBKP27tqZ54xyKFMXnb0LKOoJ20fkdAbpiOZJsPEH"
-    "t77b7UPY7n0S3s/6UuO4ZNwEPwq/pFPG29Wwj4bR7mPBVZJy+wP9zYjTZ+Y2cCIJkppUNCp0"
-    "DH/cu/lRh/ahugSiAaLhnfKxy+AUftv6SKR01drdhonfsnRrnynCIJVU7rLRIl2wPcYjYlSZ"
-    "ir32OVCkUKRdu54nTC9Cu2rGcDUYq9kc7QC1q85LDWHOERHt7a75+BTjkzSGYub49uUfX3/5"
-    "+6inBqiLGh+FVYyQIghv+vn245dgzSGJbrWDyvZoJBWAGGNeL4rMMa7rEnftH2/f/vJ8/TXD"
-    "Us2RvdbeJwFiSKOrxxxjPBRUXOSsDuYVczZOV0MoH10n/e3xcs1Pj8H6/v7jz99+/uPb9y9d"
-    "T7LLpRGNrt7UyPjEU0NhwJo5ygW23TGysamreo7HpZHVZfB53zlmRtZ2jhfFlXmN+WI4xoHK"
-    "Zvx3/+anHLPb11EJZhrIMXBkue4IZUTv4yI8B6j33tfjpd3VdWLfbChOhbw/VGX7JHJAarDn"
-    "DLJEV20wRuYYcgfNOQzRkFj026DLbuA0vhW6e0mXAR3Tgj4SOc6TY6rcJ7dd4aMcAo7yYqCa"
-    "jshodxUUCd45qJZP2jdA9No7R0o4bnxFud6UNxmwDp3T7g8RvBhA9anJJYDIMOy2rO6Wgmzq"
-    "nwI3srrimAqRPjR8BI5I/Qj8/ynXAApq711V8OmRIhCmTj/yrgph7fujsEFJ6KT1H4LpaAbJ"
-    "gpsoGJKqDrp0Kk020Dlzd49MAgn23qY/Ir0g8OTCMFI64LYSTCOp3B8Vu3GgqdPBdDwwZzi3"
-    "zRZPWpPG+9YudeMjLCXC3iEZaFeOgZiIITCkrufr1//y8HuSHunOo5SyOcbMTNHsZz1/pEx3"
-    "8NS7BzmkYDwUIzMUCWbkGDkiOEb8+P7z9y9/3ff3PHsn4V0wMieZ1IBDCounXXVvGLOtnFcZ"
-    "5Hk0RsRDTJMvj5fBqrcv3/70P/349R/kmy6ihM4Y7mCFOlrRDvs04NLNzByPPCUep/DAHuBs"
-    "dp3uPjsyFelGxgTT5jlfItNANzJH/B//w79sOyLGzK41zBjWMIQqiBGpoId0cmI1HvqYfNjV"
-    "6Hh5/G533fseI/feXcgY7Xdu5Clh5WIcfIXGHjmvMU/N6q5lb1fn0BiUd0S2leMTudoljYMf"
-    "HD1e75KRQu06wZyICxpSGoCim2CHXqBHZlS9nZKAE94PGf6eUnCgNSLbfWqjSe29V29x9i56"
-    "RchchPYGI577GUTEdV6Hu05mcTCCQR8xGU9jld2rngBPdgrVbuxVp/wWYJjHm9ldRkFuA0q3"
-    "j7+HwDWHvXc9SUMZ8TAj5chw78BZN8/2E4eRbtcJMQcO69OHCKpSaEZMn+5h+VQoJ/K3aOkd"
-    "g6dH4+h+qjp0SQS9q8/WeWoodHLiD67JIhziMbqdfjMYYxzL25JcFW97gPnReUz0Xu6K1IkT"
-    "HRlgxpjXlbXe3t++dt0RYiZwgYQnmePKHGOOuZ7fX7/+hSyg/v88/VmPZFmSpYutJSJ7H1Uz"
-    "H8IjI4eqrqmbjcu+RF+SjUsC5O/nA8EHEkTz9lzZlZVDDB7h7jabnrNl4IOodz4lEAGHm4Xq"
-    "OXuLrPV9DTwoiNhJ7ZywVquRVoSNMUy2Canj5fGX/flL5kXaFknk4UIRGeTIZEKyoYhdakmq"
-    "nExvij0QEBmDNqrMbOqYpqb5ki9/evj4n2sdRNkQz73gglJlRZqNMbYeEFAR4apDdAQiaqGx"
-    "u7Tl7YFEVZK9fSBtJgRpohNUG1NUspBiEBMxoej//C+/U9NhOlTe3pzf3J4hXTDQjMb6lgAq"
-    "HeWqEgtm70vHptv5XAHW9bxnZiYbUpQYItN0rVcb1dMN0S6OyVUzVl1uEKCo6UfT88TUuu9F"
-    "ssrUGpeTpmoic6iytEftYmhl2xhV0cpkEyWH2oxYRCAvlWwfSuIAXil5nbJUihZRax3WFYoC"
-    "SlVArK5RRUBoIpooU8lkooWdIHQt71h/t3DkGn/Acayq/MrQZbansCU916RD8fprRCFLxD3n"
-    "PGdVsRQEe5PEzKDuWenBYWeh7vuzKYmyDrVHXUs2VarScGNUhTurpIOxNKFlVt8Uvgaw08bo"
-    "JZAIpECYUkmpSIEUNDOqEdNFU5tzfB1t8vp/BOExxtZehv5Hvd9Coeie4TEW3mQJZLhHVmWT"
-    "OlW20+RVu9YEgrw8P0YeqoR06tNKVPXUEhYVPfaXy+ujMrbtOnwVUY4ZpR5Q6z9NZQxVGXMI"
-    "A/HyfP/j8/3PZKhU48DIVgJIplRRdGT2hcAI0THE+tw++utaKlBVG0PtNOfJZL2+vDx+XJeP"
-    "zMvXzkgSJSwi+FVqnJGANDwr0zOgY65wUWahLQiANKI1UR2wAzjmjc1TFahqNnVsoOnYkiM5"
-    "Mc7Fof/T379H1bFfNuX7tzfbydZ6zeiQPQRQCCKVAA6bFtkfQkTWmBqeESmgNVk3IZhSNG1s"
-    "xKsI1ED1jov06wccSkGUqWb4MMl0VZpKk41E+qs+u7kiaPEHhokJIrKFQQ0KbQuzUVFQQKmQ"
-    "UVlACIvpxBx6QxXP3RSZ+B8WgsyMSEKrTGWKUGkoJx2AR6rMFlZTrzhroN9s3VISkmutqszy"
-    "NtAKFYCZNCursqrKrtzcyWKs1eAoETbouFtbIk10DGlCTq6O6RHiS0RP/eEXiWGajSlCyxxY"
-    "10yfdQazITuorsVKX3V7iCEixRTFGJpARk4bCCAZmaKKYnOYqsQjRARdDOk3HUBBZzka7zfG"
-    "JqKF/EoOEqWiqFQyg1y5vRxKGmhZBVydUlUwUzUtcNoQ5v76LFIlkZmkJoeOm7KhehbhMIQf"
-    "L09fhCGCzIiszJIxCwMcY5wIAzfqScTmGNNmrNfHu5/85fFk9HSVBrYwQgpKDNGRxaiY49S7"
-    "EuoQmxDN6n9hFmDbac6z6djGrMv+8uWnl8cvcdwJXsgshaj0Z7jN400pUx1rOahm/YwrnVuH"
-    "TouMQlEpEsXOfhfQfi8ZJ3AcUQnKOBUtSxNKHaWbY8o4cWz6b/7um3D3tU/jHNxOUuW+DqKT"
-    "fDVtY1KZZklUgF5F4Rintk4CmumoFOvdOYcMlFcuqpPigcKuSvTjZt5mCjOHKjJFytOVUJUO"
-    "gUX2NlLCVTA6BqSqWVkV15+aUkASojKnoRDucj0IMCIa/A/UaWyVsBbhFU0N1AK0RV8lpFZS"
-    "OCsJLAEzQ9pGSkNgmEXmCs8qUisjfQm0SW6ZqSraFu1Mka+CX2Nk+61ZaPaoHkcCtKGFoABI"
-    "957xApVEktf5dr+FKou0jEFOiGQGKtTo7j2XEtEsUdEm6XStj0xmkNeifmRmpc3RBbTOmWas"
-    "jEApwQoKFZC2JHyNURZFrusxFguzcVIKZKggqumWdkVCIbp0eR37e7H/VJ1Rt69LV0B1q0Rk"
-    "iGpWap+Ix6b9oYe7HxBRkxKBbLRNdZYMwk6bxXp4vPtFpXr2YLpBjSLUDdzASTHVW8rJ5nka"
-    "N4PvL48Pv8TxQqbp6BAJyAilbLi+flXUxjCKJRCgbeeiqZ3GvKVuAG0IatlQQewPX+5++st6"
-    "+YJ4JS/F3avXodLcmH5nFiB6lSGJWGVbrUGxoiSq6f9stqAYZVSRqmNM0VkyHFY2dJ6oIwK0"
-    "sZ3OkaFjExtivLmd9ubmxsNfEGTNOeZUXxwqxwqiRHQdh8EqU2dlhtR1C1eZZobSiqJK//dT"
-    "62JA+nJRjGEZIhDTJEqHkSMiRbbyS0WKMDOhQOE4liqGaV8jIyCYEQKUSmWVTekP5ZXOCKh2"
-    "gTZYIjAz6VWKoCCZSRV4rYSvOLbtzJKIhBSQnktpWf3OGFmHiHZ2MNIRRYrIEMPy8Az0PimC"
-    "lcMGILy+67palw1gzXRSQB7HURARUzGRdD+GytzMDz/WooRCs9JM3QsZrMx0Viu22Oe85uo5"
-    "jiwgTc1YADIqSapYUcewtbuIZBUyPQ9pmDkpppEhSopmtTWzPJwss7nWrj0Sr6SomGRGuwVL"
-    "mRnGSE9ID5vK1zGmXS8WmcU+NRJZlWGNBqn+W0TfO4oFaGH0dzvSo2KMoSrLO04rwinYPZYf"
-    "u05zsJKiI0uLVpQqHXP6eny6+znjUD0rrdBX1gJHhNiYqlsWkxCljRrizw8fX54eQTcLjzoy"
-    "VafH0UyG6odt95ab3lsQsyGSVNEtir18Eqli+P7gfp8R6/Ge60XViprlVKqekJ5V2jZnseVL"
-    "Vbt9KarHfhAwm9u2OQDROFxUAKpOz5zjBCikzASFSAZV5xZZtLOpqUFa6TKGjXGeW9Qr89He"
-    "niVr5OI2dU6GX6pSRIgcoqm1kj2dL2ZJDlOkuueYVlUsiiKRKOqVC3mBDIWOuaGQOOYAuUnn"
-    "fJCVe0WNPoqWXE9ic/QxLAqCgkuCnoeNk8gElgp4zVQL46DAo2WGWF4neyPFtV9EnSCIqVvz"
-    "8MAyMxLt8gREiKH0I6O878ZtJ+m3TuSFTBEjrhTlgKhpawFUcezwFMo1Uo2qTEd10fdUxO57"
-    "udrUKqlEsnOaZW0tZYqxoI5WcyMSU61pae5ZLDVKaZuHMpeIVFRlRvlX+KaabUimx+U4RDUY"
-    "yw8RTNOMqARVGajl7F+9aAuZAVSyYKLSLO6qvpVcxQElrAz28lyniK61UrGNDdmvWYMUy/oP"
-    "E2k9RSlFyvoPpFpfdPKroTczyZSubmZSphcjErWvtR+v+3bDqCjbIlqLNgg1kdPGXD+/PP0i"
-    "dBsD6SWkDKBvZRkhJZNjDlXUmHOrdbn/8pd1+VwFajXKOEJ9wcYJskANDBW7DkPIKrE5kuTY"
-    "VLdMKJU2ppggL8+Pz5/vSp4FahEmjxlGeUMdqGJWZaB3FZhXIErRi8WaRosRgRQhRIResZ1m"
-    "Q5oIM5EojaKaOqlG+lAxzjlD2GVDm5RN/ZgGCPN4que/PH76R3t7lseXl23mzY1AloipqWqO"
-    "IQAv69i2sy+KSaCqlooKRIGMAwgVHn6oApSoAMtUWEVFlA8ZKrav56FUG707VQoyc9W04e7t"
-    "mwz3UiGQqE11RZJUs9ZkTmVkshhZ9Bw6QBYrfIlJBbwWnKdtiAnKC1i+V3Ebm2llLHePoNqo"
-    "9Ehn1Da28BAb/cCrTLURHlllw8TG8rBWwqgl0o9DFe495BdUiiLCQRp7jm3uTawYgER6VpCK"
-    "QiHPp1OudHcdSkVe45MZ0VWBADPChUqmr0sDawj2jOGqL6rMCooIrVLYRH6ICt1DWuDCpDLC"
-    "M6KqRChyfXhWfD3EXaEi0mWNiIiIbduOY1cdiezqlZr64e7e4rKIUJPSvsWvKqhMNfU4yByz"
-    "ZYoFEgJVRpGUTBxHQEwhK13NMrN7h33r97WO46JyTQir2Bjii0gT5elsmS8PDz8j9iEjo8Yc"
-    "EPUo9vWHpGrRzFpVWpUvD/e/rOcH1LIxClSxyBKU6KDIiqPhXgnasMI1+ZAcDgg21tzmGFxk"
-    "Ctbl5cEvj8Ql85l6muONlL3uFzNTLdD8CJEhoihdnmbTdBOTIt1XVKkaRWSMKBKdDZWuGQtV"
-    "OL04bXYEOkrnkFJUByODqrBBpVvt43j6dHf38Pjp5cv36/ln0wI8T7YJaKKmWobQQoR7DhMw"
-    "aMopx8JpTFC6dlSVIlXwoSJy1XyJ0mOJQamZsTxpZUNFcl+7qqladWKYV8Zab7SQ3lKyN+cb"
-    "eFYlRSi6769m5mSmi5h71FDKaPLjVfbRLJ/IWEmGaCp1hTfKYy0nfAwtKDFtAI1tWglKRrR4"
-    "ZYzRq1cdCnK11qQgFF9Z6MKGeLiooCoyVJxSGaF6VhnNjqrqnyWVJURW1+iVlIjVOB5fJdKi"
-    "BfHlySq6MCkl3fVhfeWzVhVUGvUKZBaAGgF2zcnMUIh1dBoRVUKJvApBM5PVMD9kRAd3SVbC"
-    "/bi5OUck5XrvzQy9oloCuPItwbBh7g4UxYpY4cOkN9BjTpSgvOuHkRlXpWdTGVgR4BBqhFO0"
-    "H4VIn+MElAmEtR8XCnRskCILpTbeRKkRk5fjeHp9+jGP1+sA3CwKuUrHWXQmhDpNhohOtWF4"
-    "ePz8+vzgx4tpkrN//sxClHa+sFT0XGQL4rJEx9YP96SozqROMxWctNb+8vr88PjwyQRDNRbG"
-    "jKwjgjrPFMlcVTB5UzxQFNW2SEZBqEU0j61ECgoRFQNlHUsxSIVIUfYDYgOy8UpHSpmUMVcO"
-    "NeWcZz2Yz/Hy+eXzj0+fP90/fbkcT5ppshnrrJJrvWoZQ23IEYeAggbalqN7GaE9oAPHUF8R"
-    "frGNAc92jFAh0nmGRJmQxerkviThY34d24qGu9lY6RKlqqSoDCRUZF18qO7LN05fxxgkvUFN"
-    "7tEtqcg0KdEi4cdl2qlibfNELo+lBZvt64vM1P7K+D6n9ctGheltAxP31Yy1Y10AoVIVkEJk"
-    "VQVAmI0RXxvm3fxluyezrtuOTNKy1ooQoYr3xqiqe4iKxPPz6xBtrimJ+vqDm5ofh4h6XNri"
-    "eOyrREQ00gXS+Hv3pcOkX7HKAtYRRE/gGrlSZuq+jsPnnA3WAlhkVkXEtUeWKaKZJSJrOdD9"
-    "x74sRGWQ/yNFCPeDxYZRFtL9ZYwNRY8YOltc3NpEEJmlNnx5VqqhmNZ/jSwRKMUj5jYjM1mF"
-    "g9Vh5tA2r4M2NyA9JOdvuc3pd3a5f3q4S9+HSdXVGVJpRYVuYidQUgchQ2io/fn55e4XX09z"
-    "qKhUKftUECCtoZikmhqUWRxj9k2bNqrFerZN07ebcD0+ffl5f3nZX59VKz3FNh6jsiAXiJqN"
-    "WkBQbWayaBC6p7XsKpkQj1AbSnFP6gCtICDGPFMsisSYY55Miiq2iVqhWB4Ik/MmY+OR9fT6"
-    "+Yfn+4+vD58vd78cASCRyGRhWMmMeLnsx7Zdx8QgM4PAnNMl80BBN9uqgprLYy2fJtM2iqsM"
-    "ZEv6hFBSbM4rBwxCoWl2RLPf5BCuCFVZvAYSPNNEgX4PSKIAzDmXH9t2ZbgnKo8lwjFPyUp4"
-    "ZEg1YdtiHSaSeYhER7UzkRHIEqGoRvqYLBxZchyv00zANiQA6KhTb+3MJMuZKhAR9Vj7WnOj"
-    "DV3r8JWU66G0PYNNP+9dEJiiGr73OAkYRF9+S23OaRnRIfOu3mUG+vcm6hk2TmYM9yKsM+7U"
-    "zlqDNsYZTAqJyoq1FjlNR0tVSGbFWi4qguHR/nGhaoVXW0+j1ERKIpBZY8yo1VqJzOvKmjqj"
-    "MjwE0iVIkavvwitQvo4Q20xm82I8UIhhkohemIHUMbpnHeGE2zxLlJIJdkUAQFWetkF6hqtK"
-    "ZkISK4Kgjhq/Hjcn//TpePxUlSoqIh4tqFHqWcSgAzYImWMqyfKHLz8fl0eNNYYWvDA8AbAL"
-    "bZ02L8LdRU5CJSyy69ZDdBMZtGljaB3748+Xu+8vl1cUiKzimCeONLeqqMIwA/aoybQKLaKg"
-    "c9o6jiZ4F6RXRB7d55Wsmtvszy7NUMPGiTq8eTJjREkC29yUt4OhcjouTw+Pvz8+/9Pjl5+P"
-    "rCMEqBWHFJGlInNOKysKNzs1w2HM0+Xl9WbqpSIydJgpDHZFYOs8GzMdWDrmiiPzFWnneaPs"
-    "PXC27mmoJIs092fDVBNhE0OyWMkuIqnolEpWpQdE3E0qjauYKSsFUeLHIYxtm82Oi8KcpSa+"
-    "QkkdKEIYhKtqkRE5zMSYnmNsVaW6xfXOVDfDrtuXCBEQIn32K7ExUcFqWJB6c05VMrPWtQLQ"
-    "UH6Poz0nLQFNQETLMYRms5vPQoRHVYsponGflWCGgMUSkbzGNnsl6HG48LqKAISgCJcvkllZ"
-    "mQKJK6JaIkKw0v1acggXZVVCpZ9HV2Rx3xTVKrM7typCZYaTpcrmP/Zu6fAQEYVWBSUlqypI"
-    "A8qUNK3EFCFz+W42UNjGrIIUMiMBG1tEoAWtmiSOy8VDdx9mExlrrTEUhXKnoe8LACPD9Faq"
-    "tqnkyj0eP/80j5dSowxkqmrJoJwxTsCIUoWqyqYD+XJ5+vn16V6oglTRlYEqYXqqew21QlIb"
-    "ezigtoKqauPUtrzTmKDZuK3j8fXp+5f7HxCvwmvgPzKIiOUQXvbcxhYrCj516lBwCCUEnpR5"
-    "ylwEtnEOVEWIWQlIKM5Rvbvsd/5MWl9bE4GiDbVBFWiAr7883P3w6fMP6+EH8csRCZ3CuSJM"
-    "B1s+XZUZtnzxSu4y0ZFRFVmZ25hHVrCusutEX48SUCNSWGmq7mltRUWqSHqomFGNCqq3LzeH"
-    "+xR5VskxLOlZCShJUgE2nbCjO8rKXDQBat93Pd1ApIrHagtuUqWS6VUlY5wzXIZEOZFXeHoi"
-    "Ym2nbfGIuKieADHTfQUYpRWRCpLi0RoMUlWgCfpxRUVkISoHRYVZXlmiHGbHfun7eTNZgZ5u"
-    "Z8EzKhOUFGEzhMcY4asqhpp7sNCoE6BEJLxZ+w1zBQkRTU92jRvMyszKorSU1DaPRUgj7cWk"
-    "J1NtYp3bLFR09aEaJ6RkubvOCSAbkgGEe0M2zebhixRVRkR2ybZD2V02J7vjfBzLhlyJk2AV"
-    "vq6KAaBf0aIGVP+MRRYSCZpkQmlDNfw6D3MWUQ6ethuPyEqxMeZJRE10CvPpP336/HCKx7Nt"
-    "l6CqiGBFUkx0213GHFPGIIzp+93r0xdfj8rsYUwXk1tiQGokbKgOgqVixQE9NQCKRpXaTpsA"
-    "Jnx9+tPj559yPcTxtM3egJcIKAKmFObVHMWxDdIqdR0x2k4GIHEd8ZDe5RXR1ksX4CUoDhvU"
-    "ATlRjYnTGCriejOGDlmaL+vl4fHTf3/+/JeH+7tjrYk6InVsWQz3YRPR8JkRvh9r2VU8rUgR"
-    "2IjMrl8P0/TyyGEWra0DwWyQN1mCauIJWIhXFY0DSp1XHHGaQUal8jhIzG1GpVemEKiUoUxU"
-    "erVJW4CvTIfDj5t57sVmAgIV1dEkOrkiqfxYpiNd1CbSE1lWyy8k+lux76nSB7nsR76pNDqs"
-    "0edCFVoxVzgVlTVNWVdd4LCmjqPyq6Qimz0OoCKcMsxu3XdedWdpyuVLKeFZmf01QyEiuA40"
-    "IKfDU2REiSqlWm4AIiMio83OHsjMzDRT6fYtxVcAmhFiIqorllBEFVVtmSqglGqy1urISlWp"
-    "IH2pqKmutQxd0b2aj0SkKb5sMVOWkKuhIpKVXX0IESkISghbq4Mr6h6ZKKtuw/W3npFKya9E"
-    "nvBAGbocpEQWBL6OQIoMv3LwDBDTTjFJrXV5+F4u+zifsiOiKXkV2m1F27ZbgCayLo+7v3i8"
-    "HJfnbVy3gFDtSbiKRNFs66MyRIVQG6UnyInstgOmYQ4eL18ePt+tp0fLQIVsG6WyC1zS7Y7q"
-    "o0IkKzr2KSTm2XAlIQsoKwAOUDNbA9eLfEkBa6oa1SqHjpkUoaXZMDmLhL8eL5++/PT7y/3H"
-    "5y+fyawqg0UB4gDHGA4gytcyG1Wlw+JYlvCoI+pIDDHL4+hT6b6ixCjMhGp3TSHEWsecI3pF"
-    "YRxjZMJ9EbiZm3sBqaKQAg5Sp9laCRxVrfvNa680LsLGx5unF21u237J5T5EIpYaFOYRqNpG"
-    "g1TLQEhKikdRrBXTJEowetKmyutnQvtFUQn3IMFufsJO25aVyCu9iaJqml69ADdV9ptQugZU"
-    "GSvWUpX9kvL1/ZeREReiim3rBIhhFhEiRh2J1awfVfn6pQ1p3kel6qjqD3ADQ1PIonangjJa"
-    "xismXUasisbBm6iKJfLqHS+6X3HZRWRlZgtMkOnIzjlLZiA5ra/WVcJwRDaxpNxDtFSFiczU"
-    "qwYtqJoID++lrmEINSoisnGkqtqv7jFGb7Xrawxb7Jr6btYkamQWRRIpY5BYGStizJFVJpqZ"
-    "gxnreHl8CPdtbnsUhSZI2Bgnoa5Slan9O4W/Ho+vz19O53GaBoSoHeGCAaqIZVFEvIStojRN"
-    "gGNmTdNtmAnLlKS/Pn58+PwDjsvAOcIpACUQPbnZ92NuW1UJJQNRjG4l6eho8HFcQHrVmKPK"
-    "skiozFlkETZnoZm9p26ocZypIuTY5tTEejy+fP/5088Pn39cL3eIXSFHW7jyoA2rTdSWO0sz"
-    "cww2xEoEYxMrROShhjH1WEugUdqjTopNSmRmRG8fomC24Uo+hXSeVyg2FJjDTHBERfnQqWSm"
-    "+Mo5JhiVJRRVMaPHgtZAgy5WIw7XOkRnlajN/XgeIjatSlVrmIavdLd5GnpiloJIQLFWqMJE"
-    "Iqqu/b4SJcrUbK2d2TbgykpTi5DKtj1hrUMHoNyPfYiVH1lSjbECaTQxINlINAqNkVE9qwEy"
-    "logkysQIVq5q0K9oRIdc2IxIVALI8ELHpK31n5EeHmZTTVGISoAVWdVV6GtHV4de9SkRbffO"
-    "njxnmA7vGS7JLiixRMSPJSWokuuQmCJSEaaEyO4rAcGICBElBQgCiUaEiFCv/qVoPPXVfNEi"
-    "8izPShXDNZLOzDIddd0iYdhGzRULmaoS+1puy3NFlEBNG07kVdN0mCrMTNbaj5fXzKVDlJWp"
-    "KFMg51YyRMa0k+icg2S+PN1XHXPiWrKmrPAETEc6ipoFs810ZN97RcwMMganyBhW28Dl8unh"
-    "893+8qi5ptpay6ZGeLBErzEb1StdrKBJ2DZ9z0gbnJTKctEBclB7gkdoQoo2zCCEaF96TDal"
-    "QC24qeqcyOP++eM/Pfz4+8vTT0VZ++rxxDrWITRgo1FuKgqlGcukxtTMw48UzUrYgEGgQ7KL"
-    "0lRWAZuMU2WiQpSCK1tYRD2qsBI6xznyojZZI2M3EVONKup5mLjvw6zyoAVKhKFUlphJ5ZKs"
-    "ySECFoM+zF4vBwZEB2XJzIiYdlIk8hRpytdcS8BtTBPWeq0+jvkrMHVuYxTLUckSVYvKdRzb"
-    "oB+L4GnbsrwEKlbQEqlqljJtjqgw2TaR8KNkmQhrAyiKTMYRKgZZxYCosCGqjdUsmVJZLZut"
-    "KrA51drL5yaPSyUiMpYZTXh4SyipatkW5Y68ZLbTNCLEJNp+Ili+RCRWkFLlVa568nj1dB1G"
-    "ZPsKUUWujAQGA8miDKlCOCGV1V/AEhy14EWUisVaEAG1yjMXQbZGoXLF8RW6xiI9FqANSU5k"
-    "Mfn1AGzaraQ+ZUhGZ9oyC4PixMrSslh+PYAo0Vi/KqhRVMgxNCOO/agMocyxZdSgFGdQKQaR"
-    "RJM6BOvu5flzHJehGhwVKyAyqKqILVyu6QqdwFRalASm8noi0zGNIn73fPfD0+uX9BxAb4hn"
-    "j+nBokSgOyAtpxIqZEp1Hc4ztNK8AqDpAGk6ih0a3QQa1BJVk0CJ2s0wylAbEom44Pnu6fu/"
-    "3H/68/76sI4n5CN1E6gfOW2Ynd5IREphKM0jMjk417qUOopjY4m0ycSGsd9Ivtb2XpG29qcu"
-    "kwJ1ZZuqdrvAy4kaosK5TYtaQrUxPY9CskWThG0KKaF4OIWmZHVbLYEMX2OaUcJDyGYgF9Hl"
-    "9bVW7zozo3ypSca+guftBDCissqQXjFMAQfl9bJvUwXaOL9cPsbI6JW1VQVQZpbJ9jCGJ0FA"
-    "shysqKWpgmgEHeFVLMA9pIjSzEOkjnURUXyFY3VBOVFKiXBRqQZjQEEZNtoR0XfnPqlWctpM"
-    "VEUudyGqQqjhoZzXjIZIUU0lckV0JS0p2lkMqJcGo0ZzSEp8pY7uIXeVFFcLEFiVTXbNzIgg"
-    "+7JdqOx/WlWNjAaaHGAeC6lU7RbG1S1A9HePyuYMZcHLryiCarY5+wICJEU9FgralfrS1315"
-    "mQyDjm3bViWFhg481FCLWK/Pr8NGWsfLomAQSxm2nWQMM1VQFet4enn4mHEZZn3nJ0Z4paeo"
-    "isyvx8uxB1RVbAoEOsbcVGBMUz9eH+8//6WOR1HoNVbEloFFRFS7LBVlVddQrcgIakFJVYWv"
-    "ysDcZh+TRAUyskg7RWkWp1nJTKoqTFkUU1q+4uXTlx//ePfww+vLA53HcSnup8GM8AAwV0hz"
-    "zc3G5TU8fdPZmMW5jYRnZbFbtzP8xSoOITxLVcIXAVUoYpiK6rF2GyM81IwQmHmG6Wivb3pk"
-    "+aIR2zzBc2/HXp8nRWSqReYwQUr5EkBNM0KQTG5m+1rUHl8yCY8l/YWHSlbUCj9uT2Yw9xQb"
-    "1bu1gplAM2qP5WLMwrFyqLkEoUTDIirrKqqOo8khjT9qHSnW4ZzFSGoYE9V5jTAbHru1kS3c"
-    "zKpWpx3QCrMMCAgxlVacKWRlr2yvV5T+6iqpMgqIPIBRSXY7D22mFxZDsvnyR6wsKSGqVDQy"
-    "GxJIaSO5i1bWRVSuR3gXUtL/RxhGWe2RYFbFWqbiWZnRyBxRMkqETCagKmojEpk1t8korYKU"
-    "qBYyQRFZ3vRp+erhI5pfryz3XiMDlC5gCZQ9o0w0vxomMsY21gJ0BMRLMpIFVVaVr5Umx+tL"
-    "dgqeNk9nX14lwQE12BSbZmIS+8vjw90vjMuYqqpBqRSkqlrWqitFu3sOQ+dGNU+Djrmdtzmk"
-    "XNfz/ec/7693Uqsy0GIRYbgDVxoZEwmKaFGRGUkRW32U1AFoETakwxui5h4ZOsYZWQGFDVKC"
-    "InYa8zToA0v98fnT3c+ffnj89AP9UohciRSSatXnc4gdzoCJ6B5LU8c8Hcfe2JZjBRJipVpR"
-    "aUOlCFMTCVEWWm++IGoGjahcVFNSOWgCWSBZy0SH6UJ5rPO2lRzHErPTikfQxziFu0ioQpAd"
-    "bbIiqt9rFHJu8zj2EgYwbCvpLVV6VQFjDo89AWSJpCgEioSK+gqqbvNUTMpa8TrnRpHuubKj"
-    "hnEM6jpe06aNeXjAY87Ttb2dERkq7fXMHniBOUxYcexLxVBMTyEyfQwDpLIZn40d5RgGkZWr"
-    "wgOCLIEUxGRkhFCT2VQskmBlBBVUi6DAUIhczWusChRZiIxhYgqRQRn7sZeUSMPA4L4AkBXN"
-    "hleP5dNOoqMABFvdfI3xVRYRWdu2oTL8qypJe7xMVStmlWRURmQ1pXn5sUjLTM31dQZ9VTCp"
-    "KmkdOLtWRIodZiahZmvFmNs6VvvjzUYQkQ31IU01WaorqmIppDKqEmLl+fL0rIjeMoACjhUQ"
-    "O7E3V0JhCeLl8e7l8bMxMdVsZKEgkajANoZAorJkQoaOWWLonqNaUgbL8vLy8Ony9CXWk9US"
-    "lUVp8jWGgQIiqiJa6SmRLfZTNauEmK3QLIXK3GYol/sRdZo3IjxWoIa2z1pbZTIGMeqp9qf9"
-    "+e75p/9+9+XLy+tLzwy0KBzFHGpFOYJVqSaS6sG1vE/tVTmGhq+qPN1sJR1x203GNEMISmza"
-    "EDRdqYRYtdx3qSCxloOnYkd0LKLt1SzW2ITCylCrKZYJG1JFVJ5Pc+2PSpEGtYmWkzCdFLbk"
-    "zk/bqWREVmX2twLpyBhjFMpsFsoIE4F4uKMEAtOxsnaPm9utKpU2xhQZEUcHxE0paPK4gNfY"
-    "oI3ZGP+vGxwUUkwyy2yI1Epf6zAt9nsm63pzALICXbjLIHStNW1Uxjp2GaKm1Sn9YlQyRaBr"
-    "BYRqkhEEIxwMRAAgR2XZtDh2EP3kQRYpY0hWVDig7ft0dxUUIRAbvC6ERVmKyqEWHgnNqkGN"
-    "Igj0zpEoSqe1OjXfa+emZ4ISmQ3iK2hrHyFQqg4WFJWBAqKQkRRtt4SgY7sFUkKky3EezbUr"
-    "gO5BkQIao5vuNsdXYVtFXrMr0uaDXPM0T9tMXxmpQwmI2HHUWmnjphrjbDwNQV4e7x/88mSC"
-    "iEWaZ4oM5fQMciSkSCDH2ErOKZoUMzNV1VCrWI8PX37an+4gYoRxANDuEbSNVaxrzDYsIikj"
-    "OpNo4t5rBTOZK7TTWlUZHnNuOk8ouTkZW79kNobpsOTC65f15YdPf/mnp6eHOPYqWJWvr080"
-    "A4D0FMywEomqUNFuv0R4McymmQWi9fQyhg4AAajpIHKbm2UaYedtqIwxzn48q9JDt2msKBHb"
-    "2HkyE8Vs7RBFCOGxQueJpeuS084RwVITmadJZMUOCHGSOTMEGXNKlhdYsMRGRdZOkeO4NI1i"
-    "6jxyVdVQ01mRh0KzYVcFAed5RvnyQzQ7jZRZYtpV1OPVVYvbAFyhCq1q9Kxk5hXbGKlmGV4t"
-    "e/ODLKNVFGqIzlR4Nucp+4JYpZFmZpoSKMhgg51QIBMqIhXu2YrTRv91Dx5FbZ/3mMaSBJYf"
-    "YCJWQYUKUY+0r5jLJvhV6jS9cqvo7qmqSEU2i83yKtQdmUmxXDvJFa1h6LHaQVYlOE99529m"
-    "wFqexQxR2bRUKMUC0yOa79db58glwozo5q27m4mUpWe2NEbFi0nJjCkwI6Tv340HoQhjLVwn"
-    "o31OEoGCKRpDdBDlF2SYqMpgqXaCHmPe3F68dJ6EK9bL5fnT2l+VCaYMrbKCZgmhQk1a0bre"
-    "EyoJk2GEUG2bYri8PH1+fvq89mchCwId1yEHisXMBFV0eJQN7X1hQcbcVkplJVsEL6pj2PCy"
-    "4ig45FycY76VADTNjN3Bxh77x+ePf/j08cfnhzvEMTpTJ+F+DPmGsgpVC6pSJqSgjorIckof"
-    "JOd2vol00EU33URMo/q9viIx9P1mH85bmj5bVJnKES6Cy7osDyRNZySGKXV4+BgWmdLGPrs6"
-    "soSCYX64qm1zZuxzbMQUIl1QmGMWEBHhlzHOFYyIMQchmQhOEIICwoaZiRWBMqpn+XIaUJUs"
-    "/boUIhB+JOs4UjXNsDxOm+F64czTNlDeMcBEVPjYjKhOLHW/10wzuxQBFhp2HlFmGtEE0GsC"
-    "43oilW7e1FpLGFU1xgA0M7OiktuYSHgAlaToUDbOl+hyPErUtn7tEM31bEoWraWK7pklKiJW"
-    "oKpGkb3f5lVrllmoBgX3kbgTjlDVtfbrBF5GlawKQd+KmRXu0TPWuJI8kYX9yIxj2qZmSq1Y"
-    "NhTlUY6vGoKMsKupcKg0QEF8xVXYk9U8oitlp+fO1a/BmUlJE43gIdzKIYViRYZI5DoCa3ZW"
-    "p2/MkaYn0KiG8Wad/8Gwj7hXf3x6/MXXi7CbxVcPanjYHAChInpK0OZJzIqsMptifL9R1/HP"
-    "n7/8kH5Jf+31XlbFOvqTQDIqVG2tAkEO76dhZktMSjDHNuVM0X1fSOEcwhml47xRDxd9gem0"
-    "OZylzKf18vnx5z8/P3z/9OXPzRsSCsUqXlE0o2ETmSsvHqtYmUmCMiBVuToMq2pVss0NDEqI"
-    "qg2TJKpubm5P2/vy21j2cP/59eWj+XJfx7rsPJ+IEnBfDpVtmwmYmipIbFNZOXR4uFfYtalY"
-    "Q0VlZAgGROhBoYzthpnl+2k7LUYWhMVJQK+124gWi/c4RJVrHaKtONDNZsUyQSxvmbipmA5k"
-    "mIiXi9qYA1imkkB6DFGzVg0acHRwKuHI1ks2JRTa+98sVUFVVc25hUdluyy6O1FT9Vo6SBFq"
-    "Ney11V5CsvNjIqSM0ZtXQsYc+9oRIZS+WgpF1TKClDguqibskRJUdR3FEppJn0n7dnqNWzaS"
-    "DhABq6JEG44nIpqRIKu8AyqC1OYEJnoNIM0f7j+JJCXKAfaQ9vD88vB69/ll2Hz77t37D2+3"
-    "TSFVESXISESxsn9Vzf8Q9kpTWsXqa5nqNUkuyKagUCgSHtlQnuopA6KTK37oPLm3FX1F7p46"
-    "9VwumWWiqvPwioJC5c1vz7h//emfnx/+HLGrifYbFgWKe0Lka0+bNs6etWCnecPinLfnEXn8"
-    "/Hj/0/PTPetQSTMSmlFKtW2u5dfonzQGbHaZWltqLKDOSIGyVKuEZTZnhJhu0GG6MUXt9vAl"
-    "au/Oqv74dP/T51/+6fL08eX+XvKI/XluG1SjY7CqgHheAo+eaNp2g/Wq6MtNMcYEKTCKmbbC"
-    "3KlLoKfznPN22EC8Xp6eHu6enp9SrbbTZrWQe9zO03lsQ4YokilgJUT16pBDImOIiECipikJ"
-    "IofaFVMxt8t6cYeKoqLdnmO+Cc8xLPworjHGsVxEI5bZyITqRKRIZ+80fKlgDGmgfx0+dUDS"
-    "kaBGZR+tT9IvqFq+RGZGdC9WqMuXCWxMstQ2L40sVTQZXcF0p5JMX6vv3lVoUNRaReI6tUI1"
-    "7w6Fquyj8RgW4SCWH8Cg2FVlWMhMUckK8FrrAZhIU6msfiqpjXB3xBxbVqpOmkZIXFNig6Lh"
-    "0VrOzoCajlZgNYBaZTTupq5QbCiVUuGHgJF9niiy2RfMKJRcl0GUJngv4OU1fvzp8fe//+N+"
-    "Wbe3p7/9u7/5N//mXwmBimRN1av7u0JBdp+m79bXXCC1RIQVEX7oNttjLJKN+8j0RvKJWoWw"
-    "JoJN/wQAIBxJsprR2aNBo9hmqlk2Kl//9Pjw5/3Ln4YcphQUvzrxCrR5yqLYqThMp82bbBIi"
-    "uA1THMf93fPjvz+OL1q/luZ1gwAoWrAqAdUDqka2gXFQJ0qWH3NOqkCmyPSqKMyxAXzdnTqD"
-    "2kRzgRpty5Tj56dPPz5+/uPl+eNlv1/7ioSabvOWlMhs21sc7yJsu1nHgQSt+6kC0+FRw8Q0"
-    "h0HVbJzTxxi6/HUMtbndnE829PLiH3/+dLw++n6YnL/78N12M27enu3d7TvxUEIKSjnCp1lB"
-    "kHHsPokMbJNGlh8Q7RCWsCiMLGSpsDKGGcO6nacSGZlMh2eETqh8hS1dl4fecse1jiQEFBkc"
-    "VbVYSVBNVQXpQQ61SEbUnAMimZ5ViLD+d77mehtonIESUyUwAFij3rPYcLdKdrBKUQURZBao"
-    "gJgy68gsMtuPII2kcG871HEs0axIUYuoipRha8XQQeFaR0WoYq3dbGaBrMxQWreFoioKbOS6"
-    "6FpHpYkOSkbuGemXaN9P15gzMuA2hl95tcyKrJKruEoiMjKnWenIvDr5PDw9e92llIKQIyuG"
-    "mqnsa3nw8Wn/wx++/8ff/8VXVNWf/vzL0+PL//Jv/+W3354Ue2VkS0bCSQNUqO2eb5JK819R"
-    "IQW1UZk0E1KF/fe+SrUEFQU97XtQRlZmuHujvIap+WKGCChqVVJZ29TN6P7sn/69P3+eskSt"
-    "SjOXdY08qwomZmbQDTxRtirOuS338xy1Lk/3f/aXLwbOfBvMcIj2b68j5+JRZKtEWqGoIhbe"
-    "EoczFTZHpBwB6jaGUcUzwSod5zfvQNl0KCpefvny839/+fL9y9OnFc9kKahlItrfjmqWJ8tr"
-    "NQDo+fJs41Zlgpe5WYQXa2wbNUxiG1pJFKbI29uRTDPb93h8eHh+fnh62M/z9pt339z++o2I"
-    "7vtxHK/1chjLTWmqasOTa3H5ISqmLbHIzPSQMcWYKi46E4oWdlKLFb6DQrEpW2JRo2/IQ+10"
-    "noc/UXZkUnWzmwp6uOg4DwtfQDArPEy3YmUdoCWoLdZBrVjCU2HZPGfJZT+GpYl0PmKtJeC4"
-    "tm1ymzdXdtSibSNrrVWDKigwvoKgZyaMM9ESY1JGJQpRxHVd5C1sQyVFzDP6EsiSqurWfyYr"
-    "apujUqpEeiLNkGEZmV4UE42OjxaSySGTIJOIMEowPF6RV8JBq/w6OAFK6hRDIFijFRm9SSYl"
-    "kZUQGUD1Yqi/MwgOzrAqYB0HmpteK8MBoXZ7xn/64fM///Enz0YD1d3jy//r//0fvjw+/N//"
-    "b//2r75VrzAYIUMU7P9YZrL5gq6OoKUKElT9WoTIur6+yXGaFYHriLuQhMxAkgrUHKNAz2Ah"
-    "E8deczsBQ0VoVZqgPb9+yXjRPgYWIsvkpqEQohCqp0FMOUAVmgxT5RS+3P98eX7A65fRuki9"
-    "EVJhWdFmG1AbiNCAXhuWUu4ZxRIrKG1AGVCOMYde6/Wm9XoJX2/ef7i5OSOO/f7PD5/+/OXn"
-    "758evgickqIj4pUUDmrXPdH+aVSKyUyLoUtiowI4TERNoETLQ6p3KLKdzqfT7abnl+Px9fL6"
-    "/PS09iWCMU9/9zd/O207Lpf7+y+vl9e52Zs35zfbNGT28NpsBNXsJuoiWlWR4RVuNky1kEFh"
-    "HKbnpIDI8EoOG1Gh09hIOvRsFhUZlcJJTSB0KMV8oS0QpF5en6rrV1VAhrtoT5J66AegPMKD"
-    "pzlEGR7dz4yI8osN/QqcaOFuXSP/mUKJqDwOnSOr1nJlzaFV0ZAp0Qq8Cke4FIWkQElKJbJQ"
-    "UVdQm1SGmGnxuoNBKTW8KNVguHYVZhZYLVWOWI2qFE1wZbi7qFKHoPpMBQ+3lgEOBTptnae5"
-    "idh+7CLgEKFUrahwz9b8fj1rNAOgD/cNc00Va3rCtXHZTV8k8qrtSGT4EtIPfv/9L/vuKBk6"
-    "tilFAfKf/+mfz1vOf/ev3757I6ImBDrIqVXMFYBRUoURexV7bdsQ2UbGH70UB4cJtE9VAKlQ"
-    "NXHvKsFYAVYtDxKQ3M5G6YO5H6/7Wu7+SgVQUYWk2Qn9ZIOCWlS1s25nYIrKMD3djP31+enu"
-    "0/78QKYIo4fghKgKB1KAry1JSIFRBbUjCpSggcPsBhCYkFJiOjbKzKw5xCTj8iR5sZfP+/r8"
-    "5dNfHn/+8+XhU2IDEtJnrajsgpsJpaIS9HCodFVdVItlc/CK6kVWznlqmOnb29up2DYT2sP9"
-    "08eHH1/3Z4ifz+dvf/PdGHMd6cvv7h8law758Lvv1CyRxwo7zXF5ee7ZgExxhvbyKV2BCu/3"
-    "kvSirD/oApHyTDGw8rQNTwcC4iqlAmRRWJmgqyECZO9jRzv2wmtYqRqKEZC5pWulM5svVlEV"
-    "WCW82d4XmHE0vh/oAVBWBZOo0k1RzbihR2SEzq2ff+Hej91CMoFMUjwXuTJi2rusjZBoXbwq"
-    "YRGHqLIbvhUU6RGU6mAicn21HCikWjEAsKIojYZmxOrFdmHPOKpUZKpqXpvW/d1mg4d8HTZM"
-    "hFqo8kyYGIjqIW8lhSIKYK2gdD+qWhrMwrU10XAt0a+zGRBlnWpkleRaizoKyIz7+5effvyM"
-    "kJttMx1mNcbIPEB8/+cf/uOm/+5//T+pivQrC+y1EDpumcdXYnZkoYMOIrpWiKiNUUhtbE9F"
-    "hs95KmbnsiqliF5iqY2vshIFMYaagIxjPaXHUAQ6emsqG2DFEhnUGaFzO+k8q54iinUQl9f7"
-    "+5enx/3laShYPUYXCD1CGzsDaUxXoggpkaQEKDrENqOBp0KXHxQ0sQ1UqJhim1LHg7/e+cuX"
-    "H3/5L8fx4scro4yTRkA9vCPjKqqqvkJVVpSIJo0CFZrZ2peK2ugPZqqOYefTto055jBlPt7f"
-    "vzw+Pr+8rBWn0/bdd99SoWT4erx/Iu3N7btfffNhqKy1Pz093j0+zNPpu1//1oh9GGmjqlgw"
-    "A5Vr7YRn5RDNCOcSEbVhVuFhppU+TFUUSekhg4RjN7EkIlZXH1EQqo1zHHCvjFJSCelgdDmo"
-    "V9udZlQoGJ6bbfOkUR6hmfC1d5CZFZTRJ6suD1IZUdNEIBnpHnMoEOBV6qtiJNIrGAJEdtSe"
-    "ItY5dQgI+FrytT4vqG2bdfXcx4rVuL+IziFpFctTtQKpgsqiXU2aY4waHd4M0r7iaUdVZgSp"
-    "QyUzolKFIIaOiOxIb1VWhsi1QdnPPDKqRFUqy6YuX5mrkEIZplmBjOvMrzoCWbESSCBUShTC"
-    "YIe2s2Lljz98PPZjmJ23kwiGcQ6t0gj1dfnP/+0PN+/e/y//9n8aIh5HIlFlqpmlKtMs21km"
-    "+j+q0VVBohgQURB1FSm1J8ljNfYtKk01KqiWFWo2+jVfaYbjePbjUQCwYbRCyBxnTykaRZJa"
-    "2GyeobNqmM2hx/3dZ8RzxuFrkWinDEVAKVLt2r6Ooo0tIYXGo6BXIWqnEgNm1ICYqFJVOEgd"
-    "g+fNBtbxen/381/ufv7zsT89Pb5I+bQQcdtEsB2rxhiRy0ySdF8U+6qqkCHl5aoiIqfTNNUu"
-    "l21zu7m5OW1noazjuPv85eHui681bHzzzTfnm1uqXfaX55cXVp7G/PbbX4EWgZ8+fXl+fHh8"
-    "uLvsz7aN3/zmd6LDwl8LbceWAnJFJaokIeGuWnKFm6apZJSqCVCCOYYfHoFBAmFGJj3WsHm6"
-    "uanIdAl3mVqrpKxS59iYUXmgojvSDRcNrxU7UEWqjbU8UcFd5UxgTk340OZJeUGR8MzTadIk"
-    "q+KIHo+qsiTQ7TKBH4cZrbRUrHEzbGcJpYymxSThy7tzkwiKBHL3ENsKk/BCrohKSLEylVaJ"
-    "YnkeJYhIFarN9lh0x30OLTAdwlIO9yrkZuaRAhRLhdTGbFBKYh1QM5ttLSgkW0BWFZlVzMzO"
-    "eYgI2cXU9M44EZnXi0MzB2yOyiCZdUQ26VKPKEBeXl4/ffpUmds2zydTESCQfp7GTXbnw8vT"
-    "73//T3/zt7/99a9uYu1zmIp0tzEjIu1KuCQoVoCKZKUJs6VsCQFJ7e/ycexQqWbvgmCv1q9p"
-    "+cwUBeGvz/f78bJZO4o3Ect0VHdGBVC1E3UUlTKhY7OTH8+X/VMc98flaQ4dQyPZWgOhRGZE"
-    "SocWzVCa10RvRYaqqlrBVEbKqLJhW4mWcJ7eKYdWbfK6P338/Okvzw/3L0937i+RR+YLEiJD"
-    "BBlOrn63q2rEkbG27ZTFTv+oMirmHF23vt3GGON8Ps1h52173Y8vnz4+3D2u45ibvbm9ffvr"
-    "35jZ8+vL3cNdQlTt7bsP29Djsn+5+/LzL3cPz5d9d6G8u93+5q9+e3t7WiseHh7N5RR4btFW"
-    "wIvu7moiVBunCnVShKeh6ZdUnQbVBCdo1INp7jEmiBzDFNGOWlRIVZUPaHKUKEoRToEDbN6F"
-    "iq/0OMSmBq6RHUpE2JCBtwS8XrOggmGSFaxyzykmkkmYMJc3OaMQYkKT+orVMSXSPdeY2uZm"
-    "5PWak/BKVyohw4b2iS4rMhVWgYIXY+qgaWRqAQUp7YAkBJUwdowmUIenVJ+mKpPlsXc7J3If"
-    "NiP1CCcZ5ToHIgDxaOcwoVJUzxxjxOvqia7n6iJGXZN0FbF37F6u5ST0T2I6zcTdfYXpuTnP"
-    "ZgJYle8rlaqSWfFyOe4fXgp13rZJmlyzF+fTNk+2+8zC/d3Tf/5Pv7/9X//3N6PhmXumIGUz"
-    "JbwpFYo+R4iXN+Ajs5SBYoqhKiNESGqhhtCogUBVLpdhIsyC9E8Zr0AOUqkHTMYNsz8FmmKV"
-    "ajJknCDWeSFh5v7L8/0nxOvQOirGdsosQpSaRegwo1Z5OG2UWUSoDdJY4JCktkWpEqCZzZpG"
-    "HYM3Y4xcX477+4f7//L05U+XZxedGdkf5puxXfZjVc4xpSr8gJxLtEQidrWR1Iiam1VE/73N"
-    "rEpUxvm8nc6G8tfnp19++unl+SUrbm/e/+53vzXBsda+7y8vrzrH+28+iNq+r/v7x8f7x7u7"
-    "u8vTlzG2N+8+/NVv/vrDhw+3N5oZx36kvx77i/liL8fGGK/rhYhtGoUZriIEwS64rqGiKu3H"
-    "FCWYYxuLgipqEMUSICqLgsog4rRZZBin2kkmXy+vVBsyM6odNRluROZh6tqaFUhBkBURlS6m"
-    "PTqqcCGrcqgIS5XHsUTU7MS8LvoyQ6CN2i+USmvXI1McMWgEMl2NK1wlC8sjh41EdBPLTCup"
-    "IpEQ1eVRjEJG5Gmc2CUAEvTGXwhRWeTqZNpXWFRGROvFbMxEUz4rkSCxX4EIAsvsHh6pzMx1"
-    "HGqaPb3lFZIulKKIca2shjNX4qplqipkLuknrijB5Q7AM8lWLgOkirJ47JEep2nb1G0ocgeg"
-    "NrLy9eUiKjfnczznn//0w+9+882//le/yyowzSz9WurqjqG7i6mZZi5WIpvg5yL2FfiCKooY"
-    "xCJ6TFZX8llERKrZMBvKiMUqUYWeEJqRYmOIkSMxSjfohNnUW4XwuH9+/vPLyycFt3Fimdkp"
-    "v9ruKSbF6Cu7aLcqq6h2ggzaSaCZU8YJokmhVdku3Lb5xiQ1nvzTf/75l//8cPey74+Icdpu"
-    "WbF8iZBqImrFno+oKiXHnKsI1HY+V3lm2jAVmCqVY4zT6Ww6Ad33/eefPj49PVb4zfnmV7/6"
-    "9c3NySP2/fXVX0xvz+db0pbj7vPzL5/u7u4+u6+q+vD+/T/8z//m/fv3pAEWHvvlJTN12Lff"
-    "ftj3i2VZlAiYlXOa+97YcmSuzNM00WZRCUWqqjJlIHyR0f8ZsqqwRBSZvsJMTTSElFItM62S"
-    "zHT3MTWyQCNI1DoWCBOs3CkrCzbmsb5SzCpEKEMQzq+ktTmHN3GqZIwpMoWWXD3gujKnBNpl"
-    "n87mikWWjdlh3A4Yi8DjGCaReTmOocYqNauI6wUPKtBieKQYt20S8FWi2iXFArPJkuXIpaLt"
-    "hFHVTDdTkd4fIjxEaGqRRXYxuPO3AgAFFbvC0/A1MpHXBnFVNoWnf5CrglBUhFeYhkiWR4ZQ"
-    "SI2IZFVlLw7QNeL0yowaL4+Xyrg9zdOgSVZ3WYkxRivaN7P98Mvl8od//um3v/ur92834qgE"
-    "Eo68xsSaXZA0ad9htrqZyqzuJ4m7Z7GrXSuykEZGocUXIM1E6EDW1dpsIWckAatxK5Aq8YUx"
-    "z2Zzmp5mvNz/+enuhyFLfFdR4+aZapqpFPUIUJsUVUUvUKc2MdO2hBW3okArlWobRYaayXdn"
-    "eeb6/vnp+7uP//T0+R8Lh+9nISkJrspUo5pFemaIMoPLU0V0Dp3GVE8X7eoOY63zsJvz6XS7"
-    "FXDs69MvPz08PGXydDq9e/v+9uakoq8v+/39o43x9u2tqB0v9vj4/OXL4939y8vLTn398Ks3"
-    "79+/e//u7e3NG6S6e/gxp53OG8qSdf/w8PTw2O9ei0TFOtNRB+ksUVGIRWQDSymahSoWyj0E"
-    "xc4JRFa5TVsuEUTm+eaGMAJjaKVTsr8/qFQVj1VkJtVOmQe1KZawqY4GtbqoZSK6ISvo1lg1"
-    "Xg089mObm1cXNsdaqVKqVolxMtCjQppNIzXGQBUCoHUS9dgvYxhQY0yPykwBPQIiw4aK7Gt1"
-    "nq56h8lS5TAgvYpqWyU8GuRrHgcgc1j4qqwqB6XhWEIOs4osypiGqqgo6SQSVKyKEa5m7qki"
-    "SGfzpStaTqKUBstHeN9+VS2iMyzRaXwVCa8sRjp7GQWIUNQqvUv+witQZ+3104+fLs+vb2/f"
-    "Gq99F6FUu4v1OjrfxikTP318+Oc/fv4//Ju/EXqmCzDMMrOqVBq0J+4pIqKgIKsIYVFtRKSo"
-    "mCmgnrI8VQcrq8lhBQrXWtZralqWKaZz0irKMH6N84fL89O0MI3TQB6Pv/zyz378wiry9jTf"
-    "VaXoFNU6vKCEQmStFLPOAYlO6ggobQSVnLRJGqgim8k2BwHn5Yf7L//h8fOfnp9efL8kz8Uj"
-    "cinHeb4bJ3l52cXGWjsaLG8KYtqgBIh1LDU9bxulqHnattnh3shPv3y6e/jiy03nze3Nh29+"
-    "Rcpx2V9fXueY59ON2JuI+vLl/ueP/3z3ad8PP928ef/uw1//1V99882tjqDs7nFc1jC+vX1T"
-    "xTHm5XJ8+vmXu8eHL/d357l99+2vDFQxO90MG+LLiTRVITNBtUai2dCK2vclp8Ybo64UBiEF"
-    "oI2tiqSY6bGiI4RJCLBfNW0Nf79G11uTpCbpTkhErFxjzgREewNUkammVKJijGGq+76TPNZq"
-    "1WpFkRpdSAQykCwbSlRltqIiM1UG2F6zGmNUIT2oAvTullRc+wqZZkpUhoPSZMOhmrlnOCHL"
-    "0+xkNiOdCcBEzdeBhDTtrlhARna6kBTQjrVbDwj7WBtFlLJUWOURTqiZkNepqWe0C4TaZSho"
-    "v6uvXJHMqLz6O8K9dIyh4n5QoP1nXFfry0yLiIz0/PL59enxZY6TXpnYnKdzx79NtW8hCjUt"
-    "0h6fXv74p49/+7e/vjnFZBXZ9BaAmcjs0wYhPNxVu/gMVWumiSoLQVz946+vO6VEWw5RmQik"
-    "R9ocJYwlIrOgheUltn1XH/4B/EX8i+Xd/ac/reePlYepiUkKCoeIRlWAlFFipJhqamuZTGSA"
-    "Y6XoONucgESS3HRMqTmnVb4cr798+eUP8fj965c/SeoR1JmTxwpQTpDSk5NzhVcVrqc5BzDn"
-    "yAwBVIdChRxi23kbG7N8f718+fTl8vg6z/L+zfvtNMYYl8vxenmpxJvbN5vdRqz7+8fPX+4f"
-    "H56fnh+2mb/69jfvPnz7zYdvVHXfD7Kq1jb05rSFi7/68/3TkfH4+PzzL58Mebq5+Yd/+Pvv"
-    "Pny7mRmhClXEtIgVVWvY2/3ymhmqt41eiePFzByaJStydim4wXdax9rnthEV0COY5O4XIqF2"
-    "2jZdXiho1iqKGmjbDE8pkj4GSSV04ixXe7xWf6UgK5ZiECMqcy0RGaqoWu5zTjYOhSRDdESm"
-    "zVF+0HpHk4C0VCo9hdqL/YgQSLVDWyQ9lQPwrOMK789tm+djvZJtyqz/oV9QsaFSlZ6RYklG"
-    "oqXVUuUZ27SIVZKl6omoUim1kbEiFwqq12AY1HwtEW5jdlg33dNjjKE0HdXYH+J6lqZoQmK5"
-    "sCgQAJVClkJYZCoN0ERm1ujXorAqumghHF8+/fR4/2zCrIDIGLp8CXxMXbFMbeiAiHslDLCf"
-    "Pn76wx9/+N/9w3c6KNLNwWvfo5BZoQATxmaGK8W8uu9ULErfy7JiLSR13HiUF3oBzpJeQmSo"
-    "zpk6NTenYA7EJY7Lje119/MPP/7+2D9tQ4iKgVg7uI9hc26oQZpIJeVI7f256SlZtBnVDJ2Z"
-    "4JzbZgPQ0+k8X+8f7//y+fM/f/nlvyO+WG3IUVCVlR5hWnjThyY1XtalWCqqBhWmCzEoKOaw"
-    "sQ27uX27nW6q6vXy/OOPHy+Xi1JPNj/8i99tk+G64uF5PZ5P3707vYnMh8fHj/f3n3/59Pz6"
-    "fJpvP3x7+/f/8m/f3HzDfl9y6Vg38xCcfdXjw/Pr83MFKkRtvFwuNubf/O3vfvWrX2/zViTX"
-    "8fy6v5hijc3mjMq1/IiICJ9zuruIsJdGzEI2bIE0j5xmNuZyB/yauAGUVQKliJxQmUxfaWJV"
-    "dfgaNvsGSOm+YKi261dUN1Az4nK5bNsGkKg5rLmX7hkRpkYiknNaLK+EDev3PxhszCmqerIv"
-    "VuFFF0MlVPWaNcwSafFHVX/GucwKIq23LzCDK5ZYeeyUwSxWqVpGCvFV7WkFGC2jhg4IqlwE"
-    "+76jUsZwT7kqy6ubeMNmRFZRqBRGFDvmng0SyPRsxWljWEXEI7pAl5lIQmDKK6K4oCLueazY"
-    "Ni3pDgOAmtPCoxEcJDKDsMi87EdWznGa29xOGwUei1mmSoGKddJkjHma3N2fn1//63/94/s3"
-    "29/89hsh01HKYifhVXrN6z6moVCQ9CQlCxBEBAVZvhYiYoxbSOugxhUZTSxP3WOczpmqENUB"
-    "6u1paj59+ef/51/++N++/6d//OmnH0r8ZrMP37578/bm9u3td999RxXRWdSeZKvMDOUYBWTN"
-    "IcNtpJrqNmRAthpzDI7Xj69/+P98f/fHl8vD2i+xv5w28ezzStgQYoDVoBQlt7mteB3WH2qa"
-    "oMxYNia3eZpzNlztl48/3T/cLz9u3mzfffvtaW6xYt/3DAy7OZ9uqdvDw+v3f/np/vE+M6aN"
-    "Dx+++ft/+Ptpb+Yp9uPe/bKdzqfziSIvr/fPr18eH/f95VVL3t68OY1zCET17/7+b8+3bw5f"
-    "7gv7TqkMp4qp7JkHaSo2x5ZL1IiSud1kdAmUagoGq8IdKm06j2RkqIkNjVznOSnwCs+MwFAt"
-    "wEwb0T9tmJ6ygsjjOEykJkgRbBkSGRkQmsjMhKhCs9nWFT6EVCUUJSDWyjFO18pe5pgDhYya"
-    "phEHUNO2DEeHfYRAo/GbYsdsLge0JZ8mwdqRpGxFRInoyFjXFIQB1RXjlELyyBByCs29h1Os"
-    "XuiKRRygmI0EzAYpWRXRdahyTxFFXTeHVdXMlEL2S15VqjyrIksgSFFoVGalUJvFBV6ncFVZ"
-    "USJTG1ulyXY0dDvfd7WvQ7BMU1mHZ/qwsW0bv6rDh42vEoiuTJmpIblt2Hy+XC4//vTzX75/"
-    "992Ht7cnQyUK2Wa2a4o1aY3Or2EjwfBQ0ypkJvoYhBzDjsRypyqp6/CGv7DYOGobQ804RGB3"
-    "n375x//0//hP//F/+/TTnx/uHvbdVx42xrtvbv/1v/5X/+7/+n+RcQPTFFOZUVqQSqVuut14"
-    "1XLzeXOy86YzxWobt7ofzx/vf/jj8y9/eLn7MeFFL6qO6elZECWL0SODzDFmZZrIzTYz0/dn"
-    "G3Y+nc7bttYy2c7nue/PTw8Pz8/Pay1S3799e3N7jjr2y+Xpsp+27cM379zz6XH/6aePn+9/"
-    "zsibm3e/+vb9tx8+DNt6ggQYmW/evNnGrdjw5es4jv3148ePUXhz8+bbN+9Peqbrw/PT0+VZ"
-    "N3Wkzc2GKfT19RUVWWFFz3LAMhmL4Q2VMWIU+nPczsQFRESS235EVYWmTdWhZIpEVGp1JpGg"
-    "eZNl1Ezssr+qmkqVX+nkFNV0CDN6nAvqYNWwGYnKVEkB3ZNIM+X14ymqLRmLuZmqQDvlGl3v"
-    "VEEsP/aLgKfTaV+vIG1oRJjNBHENLBuq59YR7pRn4QDOjmg0pKoC3oZNFVmFrv+W7zamCMID"
-    "WWCqiPtemRh9hJsi9BXFr/FbtBNTV3SXCCAPX1cFhKqqHmspeQ08X7ucGQ6VqaVNElvuIJMp"
-    "RGQMYWb/yROsyIvHIgeJzKUGVKqZu6MUUNDP50mNl5cnj1XEGEqy4Z5CqNgYc84TxDKXKsaw"
-    "L4+P/+0Pf/zt7371d3/1G2ZGdiUA/bilXO/bQu32AIGMUqXZqGt6u4vUXTliR0lb9aydMoTO"
-    "MUvsy6eP//W//Lf/9B/+t08ff3p+ea48KtFThH0/vtzldvv+5u23Mt+MOWKlYhPbUqRqQE7Q"
-    "0zZnpAyljPfMaeuX/PxfPj5+//jzn+vy6OBLYnBCGC1MAzrx0v7HfqQKr6Jhot6+ua1IJG62"
-    "eXNz8/L8lB4//vCXy+Vp2Pzm3ds5T5lYa11enuc23tzc9inshx/+9PPH+whs2/lX3/71d79+"
-    "b/YVilBKse10en3Jp6f7ucUuvH+89+WnbX749u3f/c3ft0NboGe7PS6rpERxutnqK33YI0VH"
-    "JyOMo++h1sXlYTJsJjZfSpbITiQqTJleMigiKhbhpi3W63lNRh5ytbvO5Q5e0zbeqO9K5PMc"
-    "ctmXqJEFKlRZekQCdW2EU8r9CgtHqTAjzUYXJ0Qmsky1aErNyqvzQkBWxCJiDCOLRfcwnQ31"
-    "UO0mrahOkqwmUC6RJJLlhEb0sEiFikI6iC72USCUhJaBlZHwCJImrMJSrdIiMqJQrmYURb/q"
-    "hc1kValeyKpoxLXPq2ZERqSpomrfL+wzf6Ve7b6lYoWKyDnP7itr9arGw5WshtYRhVZAWOTK"
-    "StVr1VlEslqVVrdvzsN47GsMDSSQNsbb2zeF9oCJUN2PovdzhMri/Pjp6R//6cd3tx++eTcz"
-    "X03VhkWGDA5TU43rQxkN/RNhwauSZWs1vckuK6MiG8mcyFpRZf0zuj/f3f3j7//wH/79//fj"
-    "9x8TYzttdlMR6snj8LW0wm/fvHn/4Vfb6Q1lKw41qJ0gU2yDnIKj1Gjz7faWwdg/Hvf//fnu"
-    "Dy93P10uT3tA9ayUd4YFL02pQoaZFNj4FFWliJki8zRn1Qr305g35+3zL58r49hfv3z+vPZ8"
-    "8/bmX/zV7yLi5eXia2XxdDrf3r6LWF++/HL/8BDpavab3/767dtvzqd3hVrxpDbbNL/v8eXT"
-    "/cPrX54f9m+/vf3u/PbpeX99WafTHHPul8N03pzPN+cbpTLk58vPNu3Dr39n0/YjXp6f3r3/"
-    "8ObduyGmFqiwOW4iL41QMG5kxTJuA1wiQpQyWWHURKwIQKG9AZTMVe7YxBGWhJiAm56maCb2"
-    "40DmWscYFKm1FhxCjqlrRWm5pwoHK6v5gCuR/YTO5dMMqco8LpehE0CVQwagSl2rzGbWQcmW"
-    "k5gslE/bMkuEnktgm02CmVWVpGUWpKm/aOKsKjPOVaBl5QYwEVmhNJHs75WqDhVhHu6qCjnE"
-    "rEKqgFyQrChg2LDKcr/STStWNR6KStGqFb6H03SoItFfsShk58LRvYUKZKYgcwnFvQCqWatI"
-    "UUopZQbYqMzuHXmiqn8iU60IRwbAdtFlLbKQfnuW46CoTJvbdiL711DzPEVGluRl7fselOX+"
-    "+npZfrx6/Yf/8n1h/p//j//mZuZpisWqXLd2oxCkDx3p2lGxKi4vSgmBhJr4sfbXxVKqtRc9"
-    "ksqhLEYdL5c/ffzxP/7n//jpp4/Hvo+h83QuWpodx8Bazkqnir1796vf/u7vzjfvUTL0Fgqd"
-    "MzHUTjFOqiNZpyH1+uPlyz/d/fSH4/GH9NcSZhvJBO6Lam0XaZUqqsgSLVMFoEqh6eAwm/N8"
-    "Ok1mlruZvF7uM8cc/ObNu8p6uH+kQHVT09fL6+Pz/S+f9+Nyubndvvvuw83t7ZjDl1QJGKYy"
-    "5u3z89Onn758+fz5+em4uf1muz3/i7/97YcP7zwy8unbD78635w9nojjzfndNrc4YmU8Pj69"
-    "7vuvfvWb9x/eHnEcj0/fvP3w9ubbOW/I9HWkh2UwInUQ4OGOw7bTUM3tJjKPcpDS+8ZhGzNA"
-    "PZaLyiWcXtvEvj9t51vNGZUknl9fVUYFTEzIeT5FHGs/bI6syMTlWEBvm0yAlO7qZudEIkOo"
-    "HLMAiJIkhG05QrBEdRQgCffDBqTFV8gsF4ljXVopp2qqjPSroatSLCUz4YSgRJSZ5QWBEeXu"
-    "olONHt4iskpFdTVNAR5HNGyhkp2fMiUJX4eKKXF4oL5umMPr6/9UNSJRVLGMXOsw61fxAsNM"
-    "Y7loewNUKNELLuW16lQ81qIOiAJpY0u/dEGoyCq+7hcRsWH96y1hr6MryyPHYJ9U9svrttm3"
-    "357XclDUpKpEbDudijg8jmOFe1Q9Xy77geOIdWCFfL7f/8N/+/7ueb17M7fJ08bf/vrdb38D"
-    "odyc7c15IyAZFFMdeRyNBCkpUL2yTMIFrChHIJNMvVyeH+7uf/jhL9//8JfL5bKNud3cuGdV"
-    "rWNv5FxmVSYAT9y+++Z8+x5yJg1jqojMgRocN6bbafh6+vHhhz+8PPz0fP8R67KZKCWipBuW"
-    "LJAeKdZIMhZKBNLwSqpStrnZHG3/yszLfphU5wGAAvL9+zdTN0Kz6vVyub97ONaiyHY6fffd"
-    "b7ZtihQlW51nZqDe3909PD48Pz9mYRv29u3b3/327bv3H/rqJ0wFvvv225vbeRxHvHLoYPHx"
-    "4TUi3755P+ftu7ffvX3/zvNw329P52+//SbB43hdx25afrhRREqkB044PNyPpUPFJCMKGOPs"
-    "yzPKCwADSVEbloiCvLw8jpuqLF/oxAMQvta0zfq3FX0xtqFyeFCajaJSrdfOK1euXESUGoks"
-    "UZO1X8gac1t7d8a7BOPhCZkUE1RWVHovhJRRtVS2rLimhSAUIViZHRvop0DrP0WEHEyy+7PU"
-    "SEeX3KtsWHmAamPaaEL/hEmhG0wyNov9VazYyBfWZuZejDShZ1CurGYSV2VTVWRMPZHpsXeP"
-    "MGOhgmR6FKWaci9JaqISneZgoTpjvu8Hcf3TVFhZc24tlb5KjaS1o4xKEXVfAC8vx6efPwtw"
-    "s9ledURWBFVE9Pl5P/woyuV1B3F4rZDLEYdnRLnnKvnp8/MPv9x7+WmzN7en3/zqw9s3PymO"
-    "N7f23Yf3333z7u2b8atv3qlwjLFRSa7DF4qiZEUd2QebWn7Up1++fP7l46eff3x+fATqpGYC"
-    "FRk6PLncl8daa61YKzJZKp4MnmBvRI02TAsV5zlKa3/8/c+f/nm/+8vl+b4hYi0JKKRsWpX7"
-    "vlNLOUkKOea28jCTaTbGmGMbHCym58Pd/evr8/tv3py2icrLfjw8Pjw9P02jM57Dc7vN1E+f"
-    "7obZNrZv3r1/9803OifIrPK8EJHpd3d3T4/75XJE1Pnm5q//+q/tdL6ZYwiRQSnbxn7smYks"
-    "m3a5PB8rTqc303Ae55uzgaI237wzs+G5lmd4qdk6VuBSOVp6qrZZ7z8q3DMjY5zMhpUjAnO+"
-    "2f3FPaqYGRmhikSpaqWjfA/ZbJZXUBA1VU+neewv7JRgIplRvQqXhIiO/r5lxNC5lhcWpenF"
-    "PHwXGZ0COPYnQQHl66rBzIiKENUM71DhGDOrREdm9rfs2HcxadWdqhYQK0xrzAG0yTopiXKl"
-    "smcqBURtJtKnuoLqrEKso0M1Jurha/mcm8iWEWoGYnUaREhIRlZ2jzsbfgFkrBxjtPXTzFak"
-    "EA2LRbGI5U6kCVW0Iglm6VoxhgDivsCrVawF3yKaWZUlwk50ixQKEZSGjlAiY8W60gLFGn2B"
-    "xMeffrn7/PD25l0cK9dhOl73/XU/XtfyaO7hPI6jwCPqCLmsXL6qHzzkEemF5VhZz7v/+MtH"
-    "QLaZw/Jk+uZk79/Pt2f91Yd3//D3f/Pdh/fv3twWOW2QeexHRJXZy+vl0+e7H/78448//Ojr"
-    "UnEMYhtzs43alSX1cFEabLkfx3EcC+Cw04dvf3f77lux0+l8HjZu9PJ895enL398eXm63P23"
-    "4/JoKlXmpUOMymQk6/DdxOYY0ogmMSODsW2n8/m0zUkijnh5fnp+evXDbciHb99S8u7uU3iq"
-    "sTLfnM/K8uPleT2rjHXUh2/e3d7cCjUJKF8vl+eX15TaL8+vL48RS0XPpzfffPPhfL4R0X7h"
-    "CTu9o60aV5WqOJ3HNs0Db9++37a5DakAQc9cHkBe1n7ZX4FUm5d1zKzTNoCTiGWmTbOsFX6Z"
-    "JyPZ8d0Va1PJOi77IWokPbxQKpUoNXM/rNg7dOW5vGhDVBnll2UiNmwd1QSToTyaFyPbOtYY"
-    "hry69eYYvrzHql7HHHa4ozCGeURlmIiCDb3uO2Ki0dzZBN1KlgMi4W5aquYrxtC+dipHSYVf"
-    "Xl/3MU6EFgQIirb4soqReRomUoXoVkFVFFDpqwpQ3UbD7jJLQBFzz8y0oVmCdkjKWO6jbaSd"
-    "uBKoMMOl634r1UZdOxetLemUUmaS1ehIg5ggM1cmzMxjkQEiVlBGtKBVaCKlSqYK9iOU50qQ"
-    "1f0lyHX2vZZXwaPCcx152m6GzdOmp/Pt62UdqwC3McWgoiuCahm177unQqRQKlMrD689EqCq"
-    "kXpZa7mb2bGf8boENXXxl2cTvb15/P/9/vNf/eZXf/2736Auv/7Vb3776+/2yB9//sv/n6k/"
-    "a5IkWbIzwcOLiKqZu0dk3lt7NdALaNBDPTP//wcMUb/NSw8RQKAqVAF3v3kzMyJ8MVMVYeYz"
-    "D2JZmHxOivT0MFMVYT7n+769nT/8+NNPP/18fBxCebpuvbenrTVvrW3W7Bz1/n4GkVUUW0Cp"
-    "1ntE9bb/47/7X77//m/26/PWbd6/fvvyx9tP//Xt59+BoSrrUavGxgTCTIpwMdOuau5NVtFQ"
-    "sLWmvrW9RcTrt9cYI6Na3y6XS/V8+XQRyR/+8ud92z99+ty9Hef94/29mTy/fNov+0iMBhe/"
-    "3969tf3puZhfX7/+7g9/hOLXv/r867/6q601N0dpVKz/vSLAyUKAIWVuTXzfr6bae1801axG"
-    "yDmCBWFkVSSJKJY13/YnUfVzaLdmLcLnLDLPGW56iTFG1X5xk4JqIc61yK0tRk7GQ7SoIsI5"
-    "h6rZ8tChTzE16lAQw+779pQYiJnzGultPylBqIpnAmLJJEiJjOpyAaoQ1szKI0IpIswcKHZv"
-    "8mDcRAUhCjN3IQqZKhGRakqKQpXMSbOGR/JCjL7EU6LWrS11g6qUWBUFCRCFrgC5djyysou1"
-    "tpguMgGpJeCGmpgUq2AuC0RZfNAfTKFLKyREhUFURJqzKjNUaG4zz+XRLoaIKB2UZo+8J4Wm"
-    "FGRVzVmALuCGikWkNVFBlayb5WSuHvKMrKIaAEUlWIYCNfmQIS3eTVSNrG9vr+eR3r2I1/f7"
-    "mJVEApE1UEulDUHrm9AMujWcFYyHdG1hJ2bm6jwXJfNcRuCCSKqZzA/58evr73+4ff7NT01r"
-    "3/74D//4j6+v3374858oKaIZ2dVeLs9b86dr27qKmDVv27aaCDyO28ctc8VaOaqq8m/+5q//"
-    "H//H//352ef99z//8Xfj599ftsZxYwSVYirSTZJEpS0CaXMjAmLNuij6toTAWjFixtv7OUaI"
-    "4NPL56Ke57if9xjz5amb8a+++37bNhbG+b63dmp9vL3b8/XOCup+/a63xmu7v399/XaIX5rb"
-    "P/793/fr9eX5whyV4d5MTAMQnvNcO85933vvZureTB9e5awUClPPYxZLDVVopmKy96eMSL42"
-    "3/t2SaKLcc739/n+8TqZ7/dxDvc4p5uZsjIyTghImG9Ztfzv5zjXtSpJg6g/AEhSAFINWeXK"
-    "Ii7uMWPVfigizkQya4UNK0JVlTLGUGneLWdkzkeyKmNdijNC1ERFVSqosm6kRggFBXVd12+I"
-    "6TrgrbxR5pRuBSjYe2NVrmzskompVCaqoGutXSJKULVFjHU9dm0mWC86ET4kF5Ur+rQmRqLG"
-    "nG3h1mDufRk3a0lQoNZ65TjPQU3Vx7J3nLME7r2KIuuiastvUklVVymoRuQj/ilChsrDk7ba"
-    "kSuVoapqLrKOMVQzFBYhVFWTNEBFMsPUAImoMefv//Cn19vdXq458v123O7neU6K+dbOOQn1"
-    "bSdkRAYhpixZRs+29RhJVTUNLgbZY0WW9eCQ1Ug1dtWaWckx6+3j7MKffv747e/+ZKafP7+o"
-    "elYIxEz3S7s+974ZWFlVkSGB0u3paUL6HB/vd7LW/lK0/v3//A8v2+3nf/1/37/9KY+bSP90"
-    "/avJeAw7Aqt6XDVba5nrZSuqbdu2y9bXJ2Sc59v7e8axbZfrtm++3W7Ht29vM2rfL5enS3t5"
-    "2rdOhMh23sfb69vLy5az5nG4snWtApMxRs552dvn7z+dIwubtcvtdm9bb27QNsCsmHE3t+2y"
-    "b9vFrIvQVH+pA2DGPM/TzCJizIA2s2337k1NGgl3Kda34/Xj9sOn7//3++u8H2Pej3k/jvv5"
-    "/jFvZ9wO3D7ErRIoNRRWoL3cLCIgyIje0LvNMQkpMCYkIapNLYvbZjPLVLPERGNALLa9FauQ"
-    "vWUx3Rtpcw4zmkkV3bcqolIgbloxQFOzilJVJpcFqApcNdIsCKz3rFJ6cp3ujEDkbA+9MwQG"
-    "AoQ1j0kye7eVQxQgEw+WBAWku1XSFjBc3MxQmTPE1dRUExKZWgxrRqyO+gBgSJUwjUoxeyHB"
-    "XBw/V8GMWSSzRM3cAGQyST525SnioGbyrNNdQVlcDveeWQ9PG2kmmcxcrWBZFVwRtfXGXvga"
-    "5KOiW8t0VMV1L6gVg13FvyJ//4c//u4PfzI1advb6+3r6wchJQ6RmVWQRf0QsUl+HKfILNoZ"
-    "mZXq0rsyKOZd7e39Y5yhprJsFRFre19VCJpAzZNyO3LKSpH6Zb9428c4jnNu3a/X6/Vp613d"
-    "tUpE9HYMnqyq6xO26/aM53me5xEqBMbLy/VXn7e//PY/SX5xFdK9qWjFPFtXNRmzTNUMpdqb"
-    "SG+rueXeyDqPMyLIckFXke1yP87jPklp2968XZ9MVchUY9U4j/v9fo+ZvW/dVCDfffq07704"
-    "e3suNPVtzOEO6ohKd3Wzy2Ufc4yzMmfvfb/07tfLZQeMVJUGcM4BrputwCimENn2i5o33822"
-    "jAEWRKv07X3cbx/vb+fMy/vHjx+3+vI6bne8v837fWTpEXMm53RvFvdxGLraBkUmRiTB1rx5"
-    "i7gRAq7BCbKKiW3fZiRoM8O0EZJV7k51SnzcZtuaN4eGlIDKyuZ0w5xnFVWNWfaI2klUsR4f"
-    "XKWYaa2eTRaTQqh4rfcvcM7R2w4AmW66uVZNUnOeW9M1rlUoRTKrqlwtg2piAjOf4zSXSi4m"
-    "YMyCwKxVphQgqJoCiA2Rol4yJbJ6bwKMMVRByWSM896sK5Axq6iLebHq/OuxJFIRtnqiasDq"
-    "cGElRqrovvDOFREiGCNJujsfldoy9wW4rMqsX4KMUipK4jzXA1ErWMgVtyZrPZhasypGpJgV"
-    "8fO3t2PU88vz6318eb3djwm1trmauxsiRDRKx5xnRibJHHNAjMyaCdFVUg6smiUfD9Y1jQNX"
-    "tmRkNtWmdh9TINmsuwsxo97ePqoiIkx0RL69v8/Tn54v3jySop7BmfHl28/X697dP39+edf3"
-    "2+3WHP/w97/67lkRA9ISLcW3B9EGW++F2ggATb113y7XlQY7z3G730hSzNxdvcZROUFprbt3"
-    "b3tEzExfQ69IVwA153ndL/vn63Gcb28/XC9Xsyai4yginl4+jcgCW+/nDFGHyv24qdrnl+fr"
-    "01VNRQFNVK7jZARRU9WIFKWI7PsTnAQyxcSrkCljnJkxz3Oc79/eX4+Dt4/7x/1Qez7uX3/6"
-    "8v5++BGXYyj5RFEixZAKJyaktLWZVtwoVSVZQyS27qyqgostHbZam1HnOZcher90AFlZ9CRJ"
-    "adYgFcHiMMi29XlOgNZTVb1JBSKnSMVQYFmwrQhmQSUzSfXeURpzAMaitr40M2LaTIq1isgU"
-    "M4e5ALVv3V0yCwUmrZnISiot2r276pzjUe9ZhsJ6HEqBtXqp5ewVcnHCvF3NfAUtKlNFWNDW"
-    "MmCuM8lxANpay9XAWVYUUYGMcRhEXXVlF8RY6uZzhmCBTliZQKlA17D34XACwIhZDBILXl9F"
-    "WQwUIle5X3QB6M2YTDXVogBxnmqCtTBRVtX9fv7887eRWuK3kfeZAVO1uUTdlGPmmIOic91u"
-    "RepBxS63xcpwp03qMQaxgt+ycGKP4begqsw1hTXHiqnLgyFdmbMZbMVeiOM4cxYuz1tnc2Wi"
-    "ikW03se8j+NObwrpvc1pBfz1X393fdJAIcUruoXr03mcVWUmJtp36+3qruI157zf7+sAsvWu"
-    "5vfB8wwRaaJ920ScgPfNzJLZ8dj1ukIYlfV02ZlamSq4XjdT+/i4/+XHL09Pz9rl9f09ATO9"
-    "HQdUX15eRFtrW2utN4+MyioWKjJCVTNLtWtzFVf1pXo0t0CMEVV6GxEzj9vx89e3Mc8xx+vX"
-    "8/2jz6H345iEWC+3MS/nPeackK1dGmkzY7H2fRJBOYNY2+413hXNXLtsVcMYcx5DWpOiij9w"
-    "L+QxSnhv7nMkK1f5pvXlMpkiOk4xNVFmZuZpLhAX0jQDKqIZRKmJ0DdyLCtwVUWUqNYD5KtU"
-    "FLKJmNoYs/n6BkYEvAExAwptakZmkpK5muVroRVzFNRUaNqsLSh8RkG0EqpIpAhVvVisIWJm"
-    "O2FAqGplLcCVLvgWlyMNv+jConufM2aGNyWXqLqLWhSzcr1vIYycy97n3ig6xrs7zFBR2jwz"
-    "M/NxY6ehuDZwVSHmsiLiMGFFneompZmhgm5GZjFUjVoCqfQEKcryb+9vX77Nj9P4Nt38PgvQ"
-    "Li2i5hwfODOTIjNHBNvWimmm+6WD6NvVXGbx/axx5JwRM1Wt73tWgJy1REWPGe+MtPXoEEEp"
-    "ypZLGBAK994u+zZjgPoxBt8+CmLe+2Yo3O5njNq3fhzDzAGtwl/9+vv/+d//XTMFU42yBFYe"
-    "M8IdW7Otd7Iyj3HjLBQS4NZaVi4ThNneLhcCpkSculJZc8Tgqoi4SEW4Q6F7byI4jsyI1pGp"
-    "5vr88p03Pj0/BdOaf3q6tu4j5r5191appFbhmGdlcZH6DK3vIrLv3bS7blFxnrdxjvsxgjwH"
-    "bvfz4z7f3+N2xLebHsPfP5jVx9EyeiZa+17cGcxEM0E7ss5znpdsglTRQQnQoembwWTOmExW"
-    "bd7MrLLGOaX7zBBqgVIrIZfBcjc3nfN088hSd4hklpmQxioF4RhztiZ4VNutssxE1CFQkzFO"
-    "UNWsyJhDpUR0seXUClwzDgEfwtszom992xrrAMCC27KhoyolH04gIMQs4lxUJFNp1lGoCBHU"
-    "TGtKVka4N9FSbZlwE+KcdTS9ZEqKoqKYaiJmrNLmD8icYIzZt2ZGkpmxXuetras0AeltX15m"
-    "Fpq3iCiq6S9B6yLllxmVrrwZRQiSkQUKYW6iLqaFVXzURzMY5aouVswVzDbfVmKEBKiZuQKc"
-    "FBmBv/x0/OXn8/0m9zFMZ4zsvbmYQAt5zkHCWzdXSm37BpSpbG2DiCprnVIiK5IZIM2W0xxR"
-    "BYgs6LpIZikURESpqAiX6VQAMSvAWp9ZOYuAHBHnuN9ul8ulXfZ2eWom2ts8h4Bz3AF+/nT5"
-    "f/4f//FX331qtnymUPWnpyslhAvFgDnnOA8yzbZLvybnYJqrq6kKi7MEZG9tzlMgUezu3pez"
-    "qlShhubWN23NvBlRxxEQbd2sLt68Ymtbvz5frJm11nuvos0pWuuaxjISjnTzdrmieaAkiKwY"
-    "eZ43xMeR48sb3o92P/vt/vHl9v5+u90Hj4nz5KhPvX2ekyAr1IylvEMcNudphsho3l+++4T3"
-    "j4/bu4oJxLYdKm6OiMqqBEqqtMQ1Z6K0WVdtLIvM1ZIb50ETa07BGdM1gSJVWKw0baSNY7T+"
-    "+D7v+7WKqi6CY55uCnVxzDFZEyIxQ9EWWgtAzCRBLcpcuO8CK0NgJrLQ4VknaoiImouowJr3"
-    "Ypm7i84xqCSDgFsHkjSSFVR1V1QxZrTeVFbPGaQTmgyVsGYZSmmsFBNQ6kGbkZVLE1FbcBlg"
-    "vZYBQtJMgbVioULNRETnHIvUJ+qSlIXvoSgFEgosKCQrivnY0ykXWGvEnJX9shcUyYc4FoQU"
-    "i1VhCwrIzJoAZgClpGlrlSYiR+KnL++//eNfbiPofouxiOmBFC+AkYSYrp/Q9Olpb+7uSkbO"
-    "063NOY8zJowFV33aejN/v50wbb1PBlksmgEQFM3MVMcYS1uzwnyAJLj37Zx1Vuy9AUbYwkof"
-    "Y9xj9BHXp0/7foFv8zzGOEz5v//H//Dv/93fulbbmgibw01FR85TAFDnxNa3fd8gZbJF0Lw1"
-    "LML+EK3i2loKjc3Eti1LxhzuuuTfvRlQ53HDVNEm2t39en06Rxby+vy596Z2NbtQkkAV7/cT"
-    "j5GGctVHfSNUtGr5aeMYM87zNoO3W3z7cr8fYxzyp2/+EZ/P4Hl+I5DssH4/qdqh9jFiUbKr"
-    "LGnmrTLvR6hZ80bkkXHep7X903d23O5zTObp1nzRQjJSrVODVVnJKhQjkrRIIY2LCjpDoHCt"
-    "YFWpqCQEEHMSIjpnqABg38Raq1y2K1NVt61qzJmmllnMcGvVxMznjMyjNVN1UoMpKOasxAM6"
-    "lSUKWWVUPsDCj+t3orVmCinJWsfIUFVBq6IuviXLxH+ZJ03BCnchV99N4M3AGlO0pGmronor"
-    "yjIzC5dXrEooYhQKRSALNGPqZmthM0Skd59nzhgE1jOGqjNzSY9EJaPETKFkqixEXlaCYHMH"
-    "C2AUoBCYQJu18zihK8VB1QUrT4EXREQpzCr3xlIWSGHJOfPn99t/+eff/PaPfyhlIEYMlPZm"
-    "FDnGuZgqq/S/xKtuYsLHGgCFmkyMyTNrEpn5/Pw0g/fbaSJN9X94l8ma08x6a6uMmZVu5qa5"
-    "YOtgFeaMp31za5k5CYi0R8kZYrzdznHm1rdt263h+++u/+E//E8vL3tzg63jSWy7zfM2xm3r"
-    "2/PT9ThPfZBxCTDXmE9lMT117aw2AaTiTAqse9tUywQmAsKbASK4uOu+b/t+yQpQ9uumTm+a"
-    "OaNwxlEMUFvbAN97N5WsgGpRs+R+HGe8xpwft/M+6v02Xr+225332V5vnNmPe070UTkRZtu1"
-    "NTOfGeYAHFhmYzT386zEELXe+owJq4SMqBmp0OverOsuau0e46xzeM6oFBqhKQ9pc93vx+49"
-    "Qc4cMyDidFGupmqOUt9UW5GqwlqcY4uRaumuEdPdpshEqIlWMajWvVvkjJlCmCsANY0ZmTTT"
-    "8zx6e3ZvGbOCUKxR2ZgHs1TVui9T3oI9Nu9uWyYyuY4PqGptjXmjt13kwU5GYXH5jjFMILY2"
-    "ZmvRYRlTbM2WrswZlWoCQKWtnh2LTDYXKrK43lysZQiHmM7JX6gktRJcxfDWkb907zPbAkct"
-    "II5BKSjPjAWjLaL3vkIIsliPgLllAUUTX/3inFNQ4vaY/K0fQwggMgSu5nNWTH77+vbP//q7"
-    "P/zxx8oiMMbMevRyRAHUgthBUCxX3bqbCiuiaCb73isK2uqWr+/HLOx7u+xbLywUXXdX/Fvd"
-    "gir6dL2q6P04akkEQf7SlHST43ZsvQvsPKIyp4o9X1KQiagYcfTOy34R0cp4eWr/8T/+b58/"
-    "PzUXVOUxRNC7Xsyenl7eV9rEYL4GcXCzCooJHsG3LMwlgzZf4TuotbZfVY2hezcXjTmltTnG"
-    "y/PnbdvU1NWiBihQzxxnRZKq4r61fgW6iqBSyfvHbcxRxMd9vt+O9/v58X5/u8W3w258OrKf"
-    "t4zAmEHqtl+meeYwr2a9xE4mZ66xpUgWS2yHasHLaCJRnCPN/LH+h1rfwRyV4z57s23fHLNi"
-    "OipNdqhlsagFud1K2ZeNKqW2rVH8HIFK7w4AaglkkVqgC+wctTUj0b1FjUsTZmAtLYlt6zCY"
-    "4Lyf1mDqiZ7M3vY4AiLWxJaCE3GcJSIqm0JEmWOaoVRUKagIinetIgv0hTWvOomCqbWehLAL"
-    "rCohqrXIyjajzBSquV50kpWpqkQKxNUzU1QAK9LNI0q1hJ6zSLoaKw1QYTmgHlEiKKiUsCgA"
-    "xEQjZoBdJWveTLxIBDYxWVxDTrPS4qwyse4tcoqY+OM03LtXRaLcLSurUKVSXN8XETXpxags"
-    "CitDpaSwtV4loGYs0F/+8c8//fGPP759e59nZkxynZTKzIXV3IEqKRUx0fUeVmBCImaHX7YO"
-    "0xrzDHwMQdWnq15am1HNYCYxEyJFKQBcfiPNqHlO1jpKSDJdW3MnsO3SrN3uB6vc7NouWTbu"
-    "pypFNSdC5inazNX56fm768XGeauhptg3U2XvmjETcr1cItJE9m1Ts3gEOvIXLreYWrDEZOvN"
-    "RSlL4bR721Wl6eYCFRvmVfX0/afMHJV5DtN1D7OitvYspkCpmUAzEDnHOc9jvn2M1/fzfsTH"
-    "+/F+z3v4tyNGXmfqIJKplij2vvlK+xZUFNqpOmqx+LpIVgwBujdkqkhOHHOaN4GhmJHioiaj"
-    "kqKLQLcYFKliQlf+6q+fPekzERl0rRREGso0RFDVID6r1iGLzDmnua/iqShYkhQTZeTD6Z5U"
-    "44iEax1j2zdVVISoJsLMBRWxLroeJZQuisiAeomqSK4QkJqZz3EUINDeW1XNGdaaQt01M011"
-    "zimobV9rFXncBVyyisjeDcKqEIUsFDVqNQHECpLLhCjiEUNUH5MkAYsqC7GixbVkWpXFKpbY"
-    "OnpY5nK1qCiqSIQWW+uVRtC1oVYdYNFtKouFMElCXK0ikgVUVpaIWzPVqBARE5LFKlWllGBR"
-    "oAkiK6ggxc1Ti1ielwWQlawq4MuXrz/85cfb7VjG8H3fSvqYYSLL/CSsc0w1ocLNFIxxpujM"
-    "nGNW1+u2XS/PtzPPEZnVDNvml62P+WGm9/sBjawy06VIVLUs3M8jGdvWVueE8EWZ33q33u4f"
-    "d/LB744iz1ksd3XRiCxJSH75+vXpqRWOt4+f+vbp0/Nza4u/tW6g0txZKYI5R2s9IlhZoCia"
-    "KMRa31WhegGrNV/NE1Mza63tC8zOyPMcS5hTZVnVvDUjzd27wApSxbqPj/v9yHmM+fZxP97G"
-    "x4mfb/Zt7O9D5xFVPoaU77lYAFxN0yksrZAEoBANUiSteSRmEiYKJem+15xIXZTkmMESWNJg"
-    "ruo2IkzVzWdEkWpCQYgzq3X9u7/9m3//d995oVeJNi1ZNGsvDGqdZ5KbKk1RTPdeOSmIGW5L"
-    "P2VqLWdVA0syLRGNAnBmmTloc4TbMpFDzYo1Roho9z6JMYp8qB9HSiRFplkHpSAjE2puBmbU"
-    "YHHrDUIgMqq3vkAQ7lp5FtD7JqLugKK11qxlBapmTrVq/QKuHhWXghNwFQhTkKDoL6D51hoZ"
-    "i1xVVJBqjpxZBaa6E4iZa78vZpm5+obrixpRoIhqFjJLlwz9EYrEehkokBkEcyVUVFSNa2la"
-    "tW0u63xsllUmps2r5vIqqVmSZi3GEFE3nfXgaVYykrfbxw8//Pj6+laZ3mxvjgCOgapK9kvb"
-    "eq+cWQ7hZd9VZGsqkIgwlba2QGorU5WZBu6bv7xc14dhkWFa65Pnin1A4WYzckR4s/3a55zj"
-    "CNHl6khXrBeviNWK6Y8UyX3vUKWoNc+aH7cDGe7t++8//er7X7ljjtldzbBtm7uQtfU+xsHM"
-    "9fgwaGQqRXsDpLXu215FN1uDKjoWjVBEq2YWkZUzVTsJE9v6c2cKKIXjzLfX2zHHx/12jvPH"
-    "H7/eT327t/u4vN8ZEjMlQmfOoqm7Aq1vBanMWU5REXBNbvxC8SoKdcxQo1TNVPWtRCguEIAq"
-    "UkHCY9KXoGi1GCiAiEolM0LNlqxUVEVLkc/Pu4F/+v3vPciIMjdQxyzVLbLGWSadaDOGabW2"
-    "zzmi5vKqnOforcegdEQEKnffV4E+4sx57O6ToIm5nvPeXFVhsnDEDtEAI0LEYs7WnFKEbnsX"
-    "VAxgUdGEC59GlltWpdLXyFZMI4L5aCatXtH9GNtlhz2muWNOIMHqvRPKlcmvcvWFjBaRrGhW"
-    "7hZRQm7dHlyBBT6uBNRXaw8OYQUXDWr5rFS7ALpQtQtQB4DltqvInOuRKKiKmJDiUiFCMhft"
-    "2ZhSLDUTtYoSSDeXImLZCU0EXNx2rjhJrKBpzsFMqOSihYrFrCoI5P3j9vNPP7Pq+flZx4x7"
-    "HrdbzIyRzRWqWRVRM9LMVNu+tWaqqlfTMc/IICDao2Dmyyb5V796+f67p4qzcqopJCOrsla0"
-    "WyDnOdba7/K8t2ZzjEV+b1sXTVa6tZK1dSuWRoW5cAwJ6a0h0xS99UT8+ruXf/ePf//d5xcX"
-    "qshlM+ZwE1NkVmuyX57PcxzHqYr39w+gPn/6bL0D6tbUd1FZ5TVWxQgWSjQzzNX7PmNAbLt8"
-    "F5lZ97fj437M28c5x/j25du31/F++NtNb0fdws6JpK1YeLcuuk3aSBF3CuF6xhRVihkf4zyI"
-    "KjRonGzmEPEmJYigqBKi1gidMavSVwOGwCNiwEeHlFWZZk2hc0ol1YxqxxiooMtx5s+RPKdD"
-    "xZoC6322LvxoaCCrhphEpmSct7NvJDnmlJJmzEpECSBSkJo5l3xeVTNB1QAxo3etqjEmKNr8"
-    "4dqrxwqODkGCKeKsIJe/oqmy1kVXRVVIVbVxZusuUFMjBWYCFbJgEBFFVHk3FZ8zdK2YzESU"
-    "1AcqUWXWuVaqJu5uCsxxmjpZGUmUezPdKilCYGYhslwpVaotmYQAtc6Cc06ogCW2zAqP+m5m"
-    "ij720sFYmhgIRSxmKEVYYqvuq5HVgLag3srMamoEx3kCqrbuLKSkqVaWGFVN3JaaBBRWKXCe"
-    "89vr2+9++8f3jw9VnZVzzHnMReGFUFSTmFUQSUoV7scgWL2ZokGLGiVkHWMWXEW35tz5+XlX"
-    "xnkewCMDe78fhQLXNoARURGtaze77tfjNiNHlbjO7dqfrhdAx3lmcev7/ZiQInXOaM1jhlS2"
-    "rbMgVf/uf/r7Ty+9OxUwoUomkowxQ4EYU1T2fVfVc4zr9bLv+75f12FVxFg+z+XQm6rq0mzr"
-    "Yl6kGOaY314/YpS9xdvH/Ok9bvd6+4iP27zdz9tHzNKDNtFLHHM+BgSECkddRLZJ2qamrKXY"
-    "EV3TBzWdVQWDOkQEYi4RsYb1VBOluC/LaWWaGJlq5mpSspptxSIFWa3Z1jxmVoSKjczWdyJ7"
-    "72PqPUa8194a4uoVmaTrBhRzJDtEIyiIs2bv7tbGTHt8XKA0E8uiND1jCqGCyFM4jszLZRO2"
-    "Ako9ZgDVFAWoa1AwswqqMBfhRKZQYGs0Gpmzqsw2kxwRq6BARdZkjaZPvnWi5jE3aNt8TKpp"
-    "yCoJyH7Zyah5UidZzZu7qyHOENnkkejVqnjYdBvNMGcxwaxCqqN5E5Fz3BVu3s1sznBVIqk0"
-    "a15WZEWKLv+xgFj2E1OK6MjMuJsoVYnFf1axdS1AJUV7JK1EDFmTooAc8757118M5iMLqHqw"
-    "YLAO3aSsl/xa3yxSDyFVQOXt7eMvP3797e//8nGbih5xHOc8xip0qWrtl43EOeN+BksiacoR"
-    "42MUNGbkcT9l4VKE1317vqS7Xq/+ctWGuH3MMSNGXfr2qmEG4RY5XaWZqAitnp/2zy8vata7"
-    "LWx1UrbL1dxqTrJUjYA1KSofLUWtokAKqaV/86tf/bu/fzKfJrspmktreo6Pc9Zl2+aMt4+3"
-    "Kz89v1z3bTeL1r1kUsC0KhV1U9u6eltzEErhvI9j3m9zvN/z7fV4+/r19e12m9vH2L7Oy4iK"
-    "kkzNuohuySJo6iDKAFRWgehtozi4PqkVlaZiNEk1bwTMTYlRmWRBFZpMbQZBZao4SAgrJspN"
-    "XERoTiFN1P08ZxXU1h4xqlgUrHB7wNayhrW1hqJomyTP6mqeUcUcA6M45lQdBRFO1YVWzzGK"
-    "cFGNjDGOzXux7sd9f9pYU0QLNuZpagaMMZupu80xRKXA+zl60w6rKoGoGaRIZiQrl+WdrJqE"
-    "QkWZNWuuJERmrjd88+bWFJhzem/qHms9gjJhsbp3kHNOaG1b1+aZkRWqutBcqMdOyb1VxRLt"
-    "rvhhETFL3UQQmWbamlcoS6JSVUS1MkVlVflXh2mZoh6k0IUoEYFa60Yio1hciAwVUviQj4Gg"
-    "mgrqDlKkRJhJVc483bzWYIwCMaEIHp9vsrDAH6KqClRkskoMUB1jfH37+sOff7i/fwB9pfnH"
-    "GGBTResN7kfwHOM8M5NzrsHkQnGGmEVm61tv+u3bBylvH+fXNl+e/PuXy8umc5wrpd3c73Oh"
-    "nrMKzcWbf3p+qsyq43q5iDAr1lvLBL4Ml4qSdaWXyICyEmqCkhEhIk0xZqjJd999/ru//fx8"
-    "3XpXA5qbiPzq+79xk5pjf3kpUu0islWle8+YcFVt1i8P5AMjZh7vvN3mcZy3+8dPPx/H0Ndb"
-    "fH3Lt3q6xTbrMqaRalJrXS+2gC0Lss/12VNZgwnq2qBCWWy9zTmLJmoFFKoiVzlUVNco0cwi"
-    "kuCCYeDRxBGFNjcmsoLy6LqOMd0etzayFtc/ZklrQomYACIqoK314zhbc6ybVeV5Ds/MQqqp"
-    "CNXKFedM5MgCVUqrCAIVnPNUkznD1Mw9MlVpzY4ZXVRFouCUJKxQXC4FmTPdRCA1Q60VU5Rr"
-    "f1dJXfO45LL4CSAlsqj+OVpzPHQcup6Eazw9M8VKzZc1xE1FkCw1I/AYjT7mFgUrVqp6zBQ3"
-    "6CI/iwircs7Q8qKigBI1FdXMcnPCwGBRTbX1zCkrc+SOTLJUERG69I1myeTqN0FVFCIRQaZq"
-    "iUitmrP3yhIIxUnoov+IFnUVK0TbSmuJwNSqUFGFaE3FHRWqHgzw0SSsoDQHcNkunz59nqE/"
-    "ffk4B+cswFvbQlkxj4jXjzGjRKCme/N1BI2Ebj2rovC//q///vtfv/yf/+f/J6etPSSR101f"
-    "tt6NMxlZM0u1/Y88jCwIQS7iduaMQGTNMVAAF3pWTeSedY4ZhKomCqpRYWqZePQgQd3y++8v"
-    "z5d+3buZNGu994g01ebWLpcSFOHaCLr31pySWZFh5+C319uc+fZ2+/J2/wh9/cjbmUf4jOuY"
-    "kuIjPaPCthMWNRqzyTSjCETEzBayPAtFga6aJNQ6gEm4WkXNyEj2viVYuVrzihJZH2C1LOas"
-    "FdkbcRcR9xYpKBaLM/r6LK3/ImmmD+lHVa6lurpKxiPqa1lp7qCaWj0e3BDVnGVwB7CsJVSA"
-    "UaS5sRhnpqh1N9VZLFDN1+IzGapSKcWaOVS7qqPQVIKQkrNGc60xk7oyEzEjo7yrmkVkd1fr"
-    "ImBWZrFSXXtb+oWeETFL4Ev2W5WAiIKoYBJKiItkBlQqClXefK1qxCQi5XE6E5W24ryosmYL"
-    "L0qWqkOWxbdZ6zUIE3Mrxjmnm9QvX12ozkiRJSUtkX/7EzQz1s+27AcQqFlludp65KnC3WWd"
-    "eaksznOoGaGkikqyqmiqChVrUUVCzDPCVZdwzUwhWrLSuxByddOwUpnix8d5v92/fb19/XZ7"
-    "/5jHqPuZBW3bdoa/3z4+jvkxMgnv1tqqGwiLXZuB3vzt/X657h+3jz//+IOsOLuKUI/IMcfz"
-    "9Xlv/nEf7x/H/YxJ5eKy46EaHOehgBkqNWYuvRvArdtl7yY6jxwjzjEJeGsiwoz1nK2CqWYx"
-    "Et9/2v/hH//2u0+fr5erNV8IQmsNlWKmrbu1hORZ5pcz7Otbvd3iuJ9vt3j9FvdDjvs4Bt5O"
-    "HiK05xnFKMMmKpGxxkgKekVz2vLFRpZU23vXFmQGRTxJNV+iyQKq0kyPnEU0BlVGZiS7P6QD"
-    "C6IkVPWWx1BVcUs5E+ze5wK5QKu4djGKRxuzTDPStBeRWc1UTXNGZLhyBtT2ZKk3JuYIgcyY"
-    "C9hi3qrSMzILe+9rEghbXHRVl6SOc7o3iK1LtokJMOahKt46oeq7aItCVWKViYSsKGLbPCLd"
-    "LBPBbNZiTPNC03NMhZg55XHLqxxVkzShCqVSzSzm8l+BKGqIYYGM1b2QWIFGCEyzShbFYxXM"
-    "1TIyY8WOYWpZicqSFOT6jZupm8YC1fQ+50QSUIjNORQw6curEEEVIVZbSBZkY+WlWnM+FI21"
-    "iCEmBoBZQvXWVFdSssgCVFVEpJhUBnKdL1ipqsz1HNci1VdHL1bYi4KIlXi5VLEyRUAiznG/"
-    "337++cvXL1+/fXu/HbydPGaVmG/9NuLtdry+x33GLKpr7ybiIGKu6LW3hjWty8kff/hKbZUC"
-    "LYIsmJqqZs7LpwtEMupjMM6MGQpJlJqYipsrRbVYjJmRCaI1vVybu1UBCeGKn0llmWpvTkgt"
-    "Xl9WrBrPdnl++fz09NK8tdZECdFzzL7vTHzccc75cZ/3u7ze3r9+yOuBM2SeeR9zJqoKMFg/"
-    "hJXSpTXB7DEnjUIqS1KVWb4ismqb5Hm7VZ7un6xvq+LnvVVVViBLxaJKRIMVpKmnlLmrqlMi"
-    "S4W6OBEARKvqctlH1HGeYuHNEyiiIiFwbcvzrqqoikiHjBH7vhFQ0QpCy8TMnTVHTKSaNuN6"
-    "qmohm3WIKBYAcF2jUeccwSpoUzvvJ8TEjWO6u9ClpCkCTIqZ9H1b/RRhEdOaUTErXEBgzOru"
-    "7iIsQqAtSxwS1FUENyhEK6MqTZqYF+MXjiSJNN3tYSCLqgVkL9ZjqZ0Vqj2j3MAa5g1AMm09"
-    "2zJmSu/N1JO5YIRkLuk2WQoC1UxZQT7EqCklrgWaNuARN3i004QiDeLAEmGXVpqyFvGRyKKZ"
-    "UzUzMXMtAgAxx6N2EJOguZOoKORUWbMiJRokZoSiVCSizFoGW+8kMyELR1aQ9Z0mUDKDCuY5"
-    "v/387cuXb3/5+ct5jm9v9zM91/i06cdZX97n2z0+zsoUUXERxjzzBCwDJN1t3y97a/fjWHXI"
-    "c34s04WKaMneldqgePmkl6cnVP7wfhbRm0nZlGmuarbOO8EaIzZ3925961tE1f2cEWxm1i7P"
-    "fScqYpAEKiLHzIIJbK3mVeU24pZ8UZtEDh7H7TiO+/28D//pvX3E9X7KORlZ97PMOmCjsCCc"
-    "QGZlKUzWLKWonilrUxIpYtK91cL7RkpKd22fLt9//iuQX7++SgkhkxWVzT0Yq922bnYOzWSx"
-    "iiGSakoU1LKq9z7GgGJNp2cOETRvkSOjUKIQ1DqgpehatdMkQfTmMxaruzXXyhDDjFIzNa9U"
-    "ACNnZLn1TBF/eOBNW0Y4tFY+VlIX9cl7y9Kc68UtrF98WmSiIJ5ZzdscMyOZMwq9t9YMEkRa"
-    "b713VESE+oKMaQFEktHUl124AJMtIoHTPVAbGWSwuK6p61vXW485VaS1VkUTE9U4Z29OhqhG"
-    "lijVe/HR8ARqjFNhzRxZM2shRVc2w6Qi5znmct7bw9hQ5otBN4HHV30ZWFSk9zZmAVg9dQHm"
-    "2rpCIDTvxcoZonCzKi445apbjRgQmqsIM2tGuW9rhrzCVma+isZkNVGC7kbK/ThbaxAllPWY"
-    "fcUslLjYOM4vP/78848/ff36/nYbt/t4P+rMCNJaP8b5fp9f345jkqXetDVdXTk1nkdkFETm"
-    "5O1+PHu77JcxPv7NVGNUVEHq+rRVYh7166fvxNr94yx+VdWmNmeoyloiRQRKsqK7ufe+7WPm"
-    "/TzmjHVVdpP9cjWzrZlbr4pMnmNSjI+QmYnVxzn+r//828v15fu/+TWp92OOMyB6nE8fo2a1"
-    "FJmRBoGY9y0pmSW2bJWlZtqUWTBZV7wsmDV3yeTarxdLBBmBeuwRPn/+/vvvnq57v+7b73/4"
-    "enyMhIj6OSMzt7YJFEBkJRdJm2rImKLtIaYGlimWj3zOKnWv8ZWKiDfPSYjmYzwWk+HmK0wj"
-    "ouriIsUaMVgJsZU9UDWVvo5wAhWR1j24uAu59S1Bh3DEdO2kuVpkjQUipABSFGapWsxJhQgj"
-    "gmSDmDZEmTlUK6er4YF5rY/zeNp2FaXUSmKMpLlv3cR+wdZRqfe+QdAZLyJZVQrH+k2wiNr2"
-    "LWfoQylOAONMs6aCmNm6y+MfsoSAuAEoVl+bqYXJk8exOiu4VAtmD7Og6Rynd6miJNwsIwBW"
-    "gVWyCoeVwBTRhWVW0aw0b7nAuUuNDfStgyGAiKzc5QJb+BIjFqJCxPfLNWYVpCIFYGGZwtd+"
-    "IjOL6/FcajrnrIK2jeLneQgeZErO8/b2+vWnL++vt+M+joP3Uz/u8naOEiXGmDFmqejmSqU3"
-    "F4WZXq9PH/czZ0r3EZXF45xqh7e+9V51WqKWTlX5+dN+2S8fX99UN5MpvB3jgNCUMQeKChER"
-    "ZmUkk63b5XLZ+h7Fb9/e32/3h6Ac1dzO/BBw7+26ba4yF8zaGpNRqaVqfL3d/uX3X9rl5799"
-    "/c6sFTahm3k6EhQTFTQkWFnM1BIpFYFq86W6JArMyCkAoYSRNDXRdEMmAYt5djehRIxE+/Z2"
-    "f3t7d5Vm7r3piI/74duFlW6+EPlzpJqv61vOqSpqSjIyFow5a6lhU1RqVdeo6mqrmUMUlRQB"
-    "IqYqTWSM2fsGVlWoigiUJqo1hcC2P89xEtb7PmaZUVXVNSs0Vd0zKwVUccKyphZUEXPJMAUl"
-    "LDCpataNxRBkDvV2HIc5DnLTtvmeVWqcORPhTVKEqKY2Zgpr22x1h5YYAYIxhogqHFCVMWMw"
-    "HLlZOygqoJoujUFWjJEmkpVRVDGzLuJZcF+N/DSYulaAYO9teezNGrOKAYqZL+OrLJINS4Qq"
-    "amZRU8FSxBxijZVnTMjy+jpUKwKyFjZDZMtKl7a4Nk3NrEFFYKsusgoDj/wb1ox7LJbyEqWK"
-    "aEQYGpdoEatICAaJOuuuLrFqhLQMUciYc0SdcUuR437PGeftpkWeNxMyK4JzYsw6BqN8zqkO"
-    "Mz5fN3UnlbQzIhb+RMSFT1sX8ON+irdIiZy3j7vq8K09XTf5OLTJpdnL86f9sn/96fW4R4mc"
-    "mTnn69sdCTedEb0560HhUYq39vLp+en6dJ7j65evt+Ooxf0x5VoJrHsg8Rj4YQGHbAW4AYFK"
-    "FN+P/Mvb7em4Pz/vzbcZJYpcvgwBc7hSxJDGWnboQomKEaiqzIRI95Zr3ycNUpUlqplzedTN"
-    "ZJ3ubN/PNdrKmmOYWRmO0BCJEZdtK/Ics2tzb1G5zo6EzJmAuKp7ixmAuBpZa1TmthWUXPYl"
-    "VGEtMZs7CfVuq2THQXARI9QMYpEU8bZ1oLJIuHkjdM1HC8zFt/INKqLMVUe+3QdJb+vTIwKg"
-    "MM+h2kx9DRQrikxBqYj70uIhkyiqrxauLEBwSRF0sywww13MEFlRdZV9jGlC705aVmzyKZd0"
-    "0z9mgkx1NCBZAN0NyIecZpVlRAk1a6KFRbBXRaHplkWUFKcbjY9llUK8GWwB7qAKItYnqYpm"
-    "BpaqZFEe2dPFTRVwQWmBhamTB4qDWLtfrCbA/4izgqhatqGYsfS3LhIsVpZoZKnCm1cR0CzW"
-    "jIiIjON+z8yRgOg5xnnGOKMi3U3V7iO+vX18u32Mc87jyOO8dv3rz/vTpffeZ5KqkTOySLv0"
-    "TV1ar8tlN3cVj+Tb3e4HI8KbjeO2Ss5AiDRR0ZKsmjMI9u4vT7thGoJ1/vyX2zjG5bqPiR9+"
-    "yjhtDjXrkbU6bitUJ4UqXp4uL88v7v7zz98+Pu4U8aYwUffKhIhBRKrIY0yQpqruVhBzEVmq"
-    "RHfPivu4RQmlQRtWqA8XMiHx93//1+D504+vkgLA1FUQVSoOSORwa8UigwkQc4bZEnYb1LJm"
-    "VaxMTAAVYa4Qp/KMfHt9U2v9+gkq4zwE2dxMvIrqpHCthrIKBTcTcaGBVLhAi1NIN1W1HOnN"
-    "IMKiqjdvojBxEtaUpFY9XTtQM0JMsgATNe9tH+fEw7/RUDorFueKIiLWeq/KSjyAvlQ329RU"
-    "RSMnRCJOkm5eiVLaWjSrdm8jCNaKJbmYqwWrSFNbT7WFitHNKmKSm2nmmCGqcGuVIWqQVtPU"
-    "JCk1p0BdTQkKvF2KAajoioWvn1KLuu/Gqsph7utaYUYwIkLUXKubqnCcQZfqwx7frhKJkaLi"
-    "rIQAXADRFBHCWSyhCCqPZYWtkipWMUNBemvLYQEliZIEBQpWZKhaCRSkKjKDsxL/plxg+YKJ"
-    "hgCu24ghmmDeT37cIqM+Pt6/fXv98ccv397uN14h7X7Oc9Q4pwpnjOYCwXEe4xwrn/N5Q/vs"
-    "as9q7Zw5qz7u47hHpUOkbe3p2r57lue+m8v7yK83KIcJQwkFInImRHf3M6WCsaJdWnMWWZen"
-    "/W+/+7XMc4wMj5df79fLy7eP22/+9FWpkejKKIgYyBWPNXUVbtu2tX673T7u91QkgVUE4SBL"
-    "3NdH36AkMjEQmNl6NSczAAjdoBGZRRG4bTRbfkZWCer5uoO5b+2v/vr7P/35Q+gC5SqZiCzW"
-    "PhJiNs807aA0R4JmtpokJprMJFSbshS6sCqjSvu2PwtF9+uVYiTGPE3V1YXMpYolKdVcxxhV"
-    "sjR87lusAELVrNncQ0RaM1sy5GqqUgCWpkcjQsVLli44YSyV7i2qIit9OQeW9Y+wrs0ro6q6"
-    "m6DmHFGOtbMUiMCPM1qzbbvMZERQV33RKMgoNVnmOwqlMqtMF5S4KodCWZTSSrBKXKhLKFem"
-    "tgRzCjNVJAolXE2DmnN6d6IWhTNHLvaqtz5jLGeKLctuFkojEsx9f6paZXcuQ4kAzEgiZpmZ"
-    "P8ynNUeJ6rZt93EWrTWpCoUVp6rOGILmtujT4aolVKWs7VwhWaq+kvqLoC8lFLhbJkXQ3CNK"
-    "AVMd56iFaPxFs5AV+7YnsypJZMYqHWZWFkbi7T7++++//fCXn376+vXL14/bfWZ+KWoWshSQ"
-    "rFrichG4qRuE3FW2i3/+/tO+XVYM++u397ePM6rNGCXW3Z82//Wn66Y+48hxHrc8zhFVrDKz"
-    "y8vnrCzg/Yj767HwDRC4Ghd5PIZI/u3f/XqMkT/8dNzx8XGgztthny9P29YmS5m9e54TIASZ"
-    "4a2R+XF7+/Hnr1nlajFjuSqYJYqtNZACLKBU1QkxCmeEQLo3KJJZjOv2ZKYqUlVxDHN380SZ"
-    "6P0YY7yrpogm7X4capvZLw2gqqp0tSqY+b+NXUVl3XqWYWP9tUZS1DIqg4CaigB68YKumN31"
-    "crmzxnH2Xc2aCFba3FSguLTm1kR6ZGVF627NlJ5pZg5Kc7HmKCZP6DIleNVKDRuIUCnS6Q5R"
-    "t5NZYq3vKHW4GDYzqaqqY55mmxhZwXlcmo/0+33Y1vrmM6ab9irez0lIVLm5GSqUTHdjrd1H"
-    "LMeJubmjKjKmiK4FJtakmloKd9dHnUojRu+PvrXiAW9bCaLWWjINGjEWcEdVCDnHwOKhgDNi"
-    "1TRWlKx3X5i4XH9Fuibp62tc5qogGKsJYCrBuA9Ya05jVWtmQndlUcWWTGH96GutWhFZWVD3"
-    "vrS+Zi652uo9syqLUqBkRuYUcRbux12KrbmZZqXC1D0TxyoVQiENIrOQ434c45y8HfX7P/34"
-    "r7+9/eaPf/n2cctSlisCSIjX6ksvd+J6mVOTbJJb15en69Nld7PjuN/v5zkjKCkUX9PqlJwx"
-    "Z++WUVW8H+dxTopqa6AC2rrfzzHnXH7S7lbAI2FdFWd9+/L26bJDmJmvH1GTL1eo2qJzLhZX"
-    "cz2OWhZXbQaREefH6+3jvAPWt7Z+W0yC1TZH1RxDTfZ9q6KI5INGnBSsgJ1IEaHKZsiMiBBv"
-    "5NLqrOkx06zGjDhH+McdqrxeL+76/7ec15hZWb01PrphZJaIJBcsS1YDRKyJsJmMGaa6eYvM"
-    "mQShiubGbTszZ6SImVpvlxItKfP12tIqhajYupW5Cr1fH1e9gpqYSbGJssxBwzqDi4vKRs6Y"
-    "MFNv5xhEuPfIFFOCPjlKS1taGyiYiRvU5ix3qyd/jarrJzxd2tPFUSEqprL++BWOGXOqalS6"
-    "OZiUZBYil8uEDJXF98bSWBQhopHDimtENia33qhrDgl9LHK4dsOLlFS5fp1VVWy2CtDmUkyC"
-    "EI0Id1EVtQbWnAGUrZ3MUvuqAqlmth4BVaIoBCGAyS/iP0CEkpGZc/2rzXeWihJRWWXmAs1E"
-    "27aH30Stspp3hR7HXexhRRAxcwFM1ec4RcXUF8ysVJo3UglEVdbMERn1/pHfPsbPP//4+u39"
-    "6+v9/RivH/cff473M2Cr0wpCSAIpJt2sQpdjds4RzAyq8fJsn66+qVTMqkyWtd5MOHKeCRER"
-    "yeTb7T4nZ8yvt/P1HmeWmPDMY9z35q37MYeKvbxskRJR58z3j/taH6Hk9nH+8OefvLXzyKpK"
-    "Uq0X5HYe67nSVOdJeSzCkMXW9Iy4nXPMUqErLpcWkRHp3txtnEOBl5eXvm334xATpRAiVDIz"
-    "U01U6ErkyHEex/H8AhU104hkom1bVq5WqJh37zCP4JixAGNiZqpV7M1SSqDFVDUzzJqqsrcL"
-    "pcZk2zY8Qj5rDEaBsOjmqlhXKJHamveX5/v9GBkNtqtZjWJqWZWs46z5xhVXVqqCKaVq3mdF"
-    "Zqp20S2Yk011q0U3tCai2l7q2YdIUJOgNagFuOIlUGW73MTTLxG5KWTbZbtSt3HmLc8kyvK7"
-    "X++f/u7FUQFRVFJShWpWMbxZziRAq0SuW3RzVQSXOhqyct4ii0yeiz+eMU+GuYlarLu2aGYK"
-    "BDWt2Rinu0GWCEFb6zWmQudYNs3luNYIuDTzXkRrfp53E6rIWqUglRARz8rFdjzOoQr3Zfor"
-    "VRNiKaRMVaCL9go+kFqKFIiaPEAWIaCoOSDujfWYH0ZU1VzzGqyRdIYaAUacFNpSpZmtj/r9"
-    "PghN6BFxP9/uH7cf/vztLz/df/j5/On1/vZ+O0fMBTgMQj2KxVCiRNfRURUs0KTIY87MMtPG"
-    "unb91cv+vLWuEJXeWwBHDZkQKzWbyaQeY6b5MY9znK9n3AuRqMzMEPDUqYJkeneDVPE45io2"
-    "eDMTmmNzg3LGrCxV8c21+YgoMjKSRdU5WElTzyoRg2pm3s+BB2gsALhLb76izlvvW+sAPj7e"
-    "Z+TMLMoKrldStKTKmwgSjHnej+OoKhch6a5UU7VZBaj1J8agtKauzvM8RtKam8ki8Ltbd8lK"
-    "p+PxkEBWCBD5oIh2b3SNKBHZfBOVrMwHnKDWO4MqY9Jby+T7/SbeSjvVF2kdMO2eBE2Tac1o"
-    "F/GeqlRLMv1iuh856S3Q7XJRM7Weie1yaZ+2FJuF+z1zpppVlVHyOJrZyGBr58KjadwBb7u1"
-    "zcW8NbzXnLOyiMo4PSvcukh2IxIj5jJpeXNA5qoEF1ezSnS1/30mcxXKKZW5blNdXaV0zXDn"
-    "hDWoUxVaJaUquVyhYpIqTAKJWpnh1qxYWVmpTLpExk1sh2xZFHMggFRthK2WAVi28rjgY+fr"
-    "rVAoE18lWZpJMTPoKu5s2lJFpeUkKhFgUcQhChWozqrFRROKS4sYrfkyeBdXjINFEFooU2GK"
-    "MNfjYmmSzhlvH+ftjN/88Q9/+MPrz1/u7/d8fY+PW0QWTATQZeI2YVSlQHWlbaE6MwlU1Mxi"
-    "ppso2V2/e2nXXpcGUWRFFMbMKuYcOUVUKzKtvWflt8NUR+b7WZF1zIpcw3Kklpk0t5gxjjlD"
-    "KgWorcm+6fNlQ01TVbNjRJG25Mes+xmSMebSa6hAmzEjFyZinKNYCgnS3Z+fryalgiLGzCyQ"
-    "MmqMI+ZMNRfYuuQvJQ1IiJqqIDMjZjCTskDcFCQEa9EqhJaZ7ykas1yhzbOi5r31LTJFGlSz"
-    "SLHIAKiigMdaKG4SwSwkjfDQSjhdS3pu/Tajit6kJBRsYqMEakm5nzH7Jupsz9We1TdhoVWW"
-    "wDaaBSt1U7UERyVU3by1nhHFFdQzMaNAXet6PYxnsdRmm2OWjCPG3K27yDkOa/08z8hsvaMI"
-    "pqcbG0RnhgqYx+W6K03NfeQhLmPOJlpkplQRyCVfWLDOlfykSpVkSlS17QJLspICMWtwl5VS"
-    "5IKKUHpXsrLgqmMO3XvmNO1FieTerDKj4KZqknmKyL71iCywrJZ2p2pUUVXNfZWyVB5+cBbB"
-    "kuWqN1+veoLd2hh337YqSpEVi7ltpnNGFbS5qHAtplSKAixR01L3SndjkBXNvaqSZc2b+owg"
-    "a3m1e98yolYKI5GJoo8zv3y7/+7PP/3mj3/+w59ev73OY3JEjakzkgJOisBdBFoiAhOUqhpI"
-    "8jhmRK4dH8ne3IXN5NPOl4tfL26OyHHOKOqMmjMjirI2DLaGhLeRxZhVt1HHRCxe0EJimlpH"
-    "a3LZ9nEeoEQUzN11c+/dKrBKl6PKFaU6IsYpVlpzcuGB1MQ8MiIrE1EDapW5CGEm0ptv3c5z"
-    "zHOeY0bWsmdVQU2jav00qspKkgoyU8WFnGfOc4zz/n6/ZTtD+rTrte0qCs6cd6TQdrRtukKN"
-    "WYo5it98w/UaaOcjZ6FRLKBsA2VdLyFcgs0UixSqoF9mlKhTdW0pgIo4IUAStUZLV/dGsWOO"
-    "NQrqkhfHCQ1aUFOUKhVHA5v1LqRKKRKw1jAnM1Gp4tZs2zfWVLHdfBL3OUQRY532jXOoKjNN"
-    "IJUrBLu5gdVUxeycQ6qaiGR2c2R5JiHWeoMUpFhYLLWICVBknTNXKVWK2rdLQQoUM4ZkofXG"
-    "ipHDOQG2ZgplImJu207WnLmQX2NGay4V3XsREQGUShuYQJjqmIVS8x65KOHbo+r9KOVCVy0p"
-    "UCwsOosWdWmtNTPVbOEoVYxL9CAGcYHOiBUWrAzAsDjLlCJMlCxZm7tK0b5gCwTVrAosjghz"
-    "wyOMbbFQ1SakzJhm18z59nH73R9/+k//9Q+///PXj4OkUSU1AuRaOOti9KipZUYVVYSkmpFg"
-    "xXoBA+xuvZvmuHT9dMWvP22fnzcij/OYJVE5Z82ZcxZVZ+V9sJgkxkyqWN9RKZVrC1JVTXVG"
-    "JsXUurXLk4E5Yri6qq7u5xABmREKXlqrqhKpqI+Zj2G46SzEnCMZxSBHlLoAuvTKbjrGOSdv"
-    "tyOCBYEqC6q+1owA1GV1MFeh8rF2D269qXrOev3yRa4/1ev48Wj9H/9fT3/7f2vm8/b19dsf"
-    "u/X+9Bm1abuWuu0GSIqi7/36/HE/OI5mJiIzKim67aamkDmniKxoVVImqWYmbF1FIKzIseBk"
-    "oRQYGsDMYvcW5JyjoRlYmI0pMy7bdUS6lraNokQn2NyCoEoyerPlblB5bI3AMoG3Tsiskqym"
-    "gKpzc1GZKQotVKa5o/nM2dsmhJm6IuLQyoby5slCBAKuugG+noCrSoRa+qpHXaQyVddYSUU1"
-    "KEmqAlmiQsp5xmU3RFB1eajdbSmnI+fD0Gt6xBTRZTCLnM27iLg5FLEMJpCIs9kekaJNRc6R"
-    "om4mK1hVxb175KmiZg4RslSZHPaYbzyS56BGpECCRWbTTq5U36raFCD6uOuue9sDwWUmWRgx"
-    "BEaREaeqmDkJXSAugaqQjJxmzJBiZdnXt/tP3778t9/+4b///uc//Xh/P+wcp7vWw/e38K1o"
-    "5t1VgBhBPiRTK9EdEZl8vD7AZtokLrs87/pXn7fnS5dFb4TPyNv9WOWQ5nbMPI68n4wUQlJW"
-    "KDxFtC+cHGetHf3S004i2Lqqcm9bJSqx7jnMCVJFnq7XhIqf9/s4ZiVB8yWVk0fHWtYSQFgj"
-    "Us3UbEWV5swxxpirWyUryG1YUBlaMxVb7bHee0QIV9mgZKA1z8Tt/R1fv5Yer/np8//y63f7"
-    "1Arn+HidbUffh7iomqo3ilP6mdnQeAZmVCE11+Owad8tDckMrzQ1ZKxE5NJiwbp5ryoiJU9l"
-    "KrFJqdqINN+SKhJVvDY3i3MOCMlUxZX3q6EAqSnSCj4ixhzWbbBUhHm6qAsBWKlaUzON6g3H"
-    "UvsRn/atigmZx2iLboGKmsgC6ULNoKoWa46MaKKuC6KTFefeNicKUlTNnBRTc60UamWYeT2m"
-    "yCWmLC0mFEitCpEUyBILxSyHAOtPW+dcmTG0uZovehCxUOJ0R+UYgwIKa2Yko/UNTR6f5lkm"
-    "GbkwjswKgWayb7247qg55qGi7iiUKoFy95wDAClFGlahP0WFKskywFXzFzQckmYtM1trrBJg"
-    "xnBfLiIQWVy9AqqtdEeut3RGiaIqY9QcPGd++Xb+87/85V9/+6efvn47Zp1EUs00s6BSwQrx"
-    "HQtassrJEWGutkqvzAgWqaZ9a/qoUGYzPO323XO/7p3MMSoigzhnQZoKLlc39W0c0BPK+6j1"
-    "hJlV53kuGfIq8XfXxbhVEpXnPZq0/dpEeM5ZyTPmSJroZbsQPGdFhTIFte6oBVkErqpqvXuz"
-    "mDFzRpGUOaMtUzMFZUAzy6iFzSozW88OFcvIRPm299ZrfS5ISM3IyhLtHWBWjlO7XlqjbFJi"
-    "qibmYgpRU3c3XWv7IVqttayQRQANxgg1tiVzPqa7IEurXNtRAQGz1KybZry6XilWDEiA7GIK"
-    "meNsAgTd23kOUydjljZZCp2SqjOHmLpqzFCJGGVqL94ixkUkm8kjpRCm5rKCvGlgRSCzt2au"
-    "xxj389BSmacUmkAqe7OCaDEBc0nozJhHbNve1M77nZxAbX51hQfm5DAqaMWaXDymKVJjolsX"
-    "iEhFRVSqIHO0pfTMEgpAcwcIU/eqmYBGpLs03WTlwMwrRdUFIRUR2XRTtIgPbaSEeyNyRrnJ"
-    "/Xx3fVobXizWlHeFrjFazLk1e+ytmkPqAWeFUEJNSdCyeY+M4mh9696rygwsmoh4r8rIGscB"
-    "V98UQnVlpYggask/C8udyQQYaaYrQUtVc5+R51njvJ/hv/nT1//8T3/4zW9f3z7es2jNoOim"
-    "cC0yimo0sALXi6kxYoWZRISqiOIKH7m5u5mIyrINqTdzZZOqGMVLQmYxkqraure+ed8iUkyh"
-    "237BOWtEHGcup3UkKbJtbURuvQkkxmyGzc2kTGTvvXe7+DzO+Po+xm3M4gg8cHwsA5TKTDEI"
-    "ODNWBEJXeTAqiSqqiq/LygL8mHXTqMozqmAqZORqZrKgsvXet11EIgpMU+3WKhclYs4Z1mo7"
-    "X8v7pVuylJKVq/kjrtbMu7XeChYLSy0FVWuKwpKmdzFTmhUjkCLFZhJxGAxFRa0RiKrN8w4R"
-    "M+smMydIgZiKAYSMcap55WnWtKBmOVJQriKkFVgQIiMEypjJqKwEM3TbtipYCWMG67r1c47W"
-    "exPMKHMRgjM4htJeto4xUBSxqBRbQaYSMGv07Up1DRApFKU8XzZ3yRRHyQrEkRjjcPOUKqYo"
-    "RGVkNi3EFKU/gsAZM7pbMxMxigXR3HIeM6OpowhwHNGam3kmTQSw5TXKLADJEg7IkvQKRMxU"
-    "oBnRrPW+ZWXOdHM+LNKlEEaoMMZUN2u+ThYATWUt9FRtjLO1vtZNoiKiaxoZI7q1yHzYyCjX"
-    "y5Nqy5qCUmPUXNlnE3skvYjIar1BJWIwS0Qz5xxDzQV4veV//92X/+9/+c3vf/hyHOsejqrH"
-    "GXsdGZFlYiWppqqSGZUPI7ZAIpC1Sk3sbmCxKGbAyt8HCYG6t0rOnIvSKarNW9U6SoQJny67"
-    "WzXn7WBkqbWZxf9B8tNt6w6tiBXx3Uyed71et97UXjQLn4/66ev9Tz9+fXu/Q/D8tG2bNwhz"
-    "jMnBymAVKkhlcURxREDVVQVwNRW1xfogVy7NjBGzqsyxYNOrFtpaE8GcR0T0Zs3NoOIWEREh"
-    "5yne+jx2yX2T6RQpVazyiao0w7oYWFMW3Fuah5qZJWDuNXPOKd0ejAqSgoVP6e5r+pDMylxR"
-    "GdH1Y8NFDboi+HMO89bMRs3ursJzBhQidHPwYVpXFVe9jzNnmStTozJBBmi275eP2x1iRY5x"
-    "QlVt9QQV4LrlubquvkFGM1198tURyMVGU+0KmAJqgJiZirkuy63HmLZfmvrMFJGIueJPRC0T"
-    "0hnDJNzFTec5VXXrbfV1AY0YRZ8VTSEQExUViKFxzilR3toMCmoV0gtliqooXStddW2VgMK9"
-    "ZVaRMQLKBfsTlcgylACt6Rznvu8lSNSMcAVYIrL1lpMAem/LbA2IuxdjqQDMzExjzhil6lKy"
-    "tJkVUZJL8JxFsa1El6oXQGuXR0cWrJqmLm6idj/i93/8y//1T7/7p3/98uWtEp7IKlGRylKU"
-    "qiSjUsbIX9KXYAwUkZSCmACoZJUUq3VUhZAqUjkJNkFzmKk1zyxmomju7p6yuGuoGDMnCuQp"
-    "VK1y8nnzMx6fTm+iIuYqSIn5tG1q7spm2Lt2RzdVkXke4xgmeH5+Wru0OUOZnz8/vTy9XPb7"
-    "H3++fYQIVMSyMCtjIcqKSqpqcwO45gW1/hbdBDBFrMW7yCrlRJAMkQnQTVzFTfa2iXBMjZHL"
-    "NXseNzs+9rg7hlopWI7L3lqzbqa2rkJLjoOMkK4gzJQZZiYrJwUo2JpXZo7ZmyPPiCWsw9Z7"
-    "LiwZGRlgahYVM5OVq0kLSDchK2c0N28WwYzMmCs+uJq3Zsrkelb27qPmCghWzuZOlVFZoDeH"
-    "IJliD15taQLM8y4ql60fx3GOaH1fmfpieVvy3WNvTVdAWpgxpbX1gvGaJ1CZkyisRVwJFGYa"
-    "x1T3bd9irI/00jdjzFPV3fqa87mbsohkSQlMhSgKqFJrRVv0pqaGpHHlEZkVCnHRKlRVqaQk"
-    "SVWJcUozNVl/8bZuE4xMeNNCFiRGiGoJ3ERMz3OizE1EMWeIYD3xkUGgtV6R53my6L1XgiXL"
-    "PacCdVOTAkytqBVFilkXrtoZTExEVZuYZMpP327//C9/+Kf/+pv/9ufXj9nvWRAKmZml2pqS"
-    "zGTOymQlvKk3aU1JzBGumixRsDhn8iFIfOg5e2trJltFBqXWlLu6SXO/7leozUwA57jfzyMr"
-    "3MzbpdtmQhW7nQcM7anPjMxzJscBsJoa53G5dDEg0+BV066b9b71ZvcY58ccWawkmHze+/PT"
-    "5brZ89Wh+ocv520CaxtBrJ2EKVWldaMUSBWHyuNQm2kmIk1zvZOVD13MGAOq4q7KomFr12bi"
-    "1lTkVgAfEj2pMOScd6lTFc4QE9VqrlCp1SADWEmIgBlDWI83RKKq1M20VTFnLK1QRVTS+0aA"
-    "mW3fRqzYdCmwEh22soMqVclgrVCrCpk1jiqtpMmDgFf1sLyr2TqgmbWMMFUzK+I+TnNPQRMk"
-    "a8SAeRXUUFUzzpjn7maCj/sHoNZaVlGYkdr0QVY1w3IRk8XITIR6FQDftwYU1uUeK4NLiiQL"
-    "JqyKmaYOGBaIFLnKTTOLwuUk3kwZjChfV0UmGa1tIhJzikhMKKTJYtyV2uMOgmUhe2RWU4WV"
-    "IWICZmZBVyuphApUzuUfXScxEclY6HkoDKUlMBGiVMxMFqKVa/gkYq1VFAu9b6s72VpTReYM"
-    "lkgjvCpFxN0y09UCUbkuDlrFyPjp6/t//uc//tO//PnHL/cRFlW0AhZHAWZwt8q1IZJlFDOB"
-    "K4UJrgGzuDkVc5ZIitJMQXjzrXU3HWOeZ5rw5bnvl715v+523bZmMu4jRpQ8Mne9dWh/en5m"
-    "yfv7vN/PTFZGb6bNz5CsPI/IKjUVQF3c9Pq0bS5b89ZbN8SYc9a6gvbN7jPHGQaOM+ac7cn2"
-    "baPt9OO//+XbeYYopUQVBnHTfe/W7MwRkzNnVWXRRAwKETEBDBCIx4xV9liCgiq4uSsA6jI9"
-    "LlDjQ0GzwtkDNZrWZev3G6ZkcwWTTLGmar9U4KCroUaqGzNX5XhRFRZ0snnTpekoZCHJiGB4"
-    "VolazfWZXHMOIav1NjJmRvNd1Uh216IudQ4EOYsGW7sJUtxjzKrMQQGqOCO0u3lb57eocHpE"
-    "uLk1IYLgnKebOCVmmLUiIh4DzmW6r0y3NmsS1rd9zDEiClTAzTdzr5EmGzgtu1STOkyQD4Qd"
-    "pVBRasakqoq5giKgKGEKpVqJzAyNctHKkyUUaFNIRUwTN3UpIION4i0jVpQJakEly5eWC1NM"
-    "kZIVli5NW2umWjmLtXcVsUp2NVDF7D4OMy80QQNFTKrK3QQlTM6yva06sQhgKw5muizbolxT"
-    "inmKkWUzUy0edzohhQGumwdKoHpG/vQl/tN/+cM//bc///jtdmTOAEyVDtViGOmmsniqpogS"
-    "hULWp9nANYkRdYqMyFWLdYc6VFTArCB8BCNh3cRa79vlsu9dyTqO0802d4oeY97POXN+/vQJ"
-    "Ja+vb8cxAfdm2+WpQGtdrZ1zyL5QXst+GPWL5aGKGTWDixiyILvnpAo+P22mYlLHOG9333dp"
-    "vV0vm+KRZALq6bo/PfW970wcMe7jnMmKoWYj0tR3b+6+vj2VfCA7+YtlbpFSmnkzay0oLkai"
-    "Mk0kImdNZBDR4t1itCapGtqarg64KCyqkqVtV6AWo1joSxQiAtXl0DCVmVFVKy5PShatde19"
-    "zgWci8xYEFw1i5lgnedBleZt/cKKqFJCqwKUKiGlkqpcl+g5j8hQc5DNHSbN+3lOCEBq0Ypd"
-    "zdpe1OJipMVl34/b/XYOIxTIWGYliTnNxUSRkNK+d1n2g9K+X6IikKbKEa5q5zm9C1brHVIx"
-    "RB8eKhE39UUhhGhEummMUC/RR8Vdlv/DQFDdWRSVQqKmiLgrKt2NC0w+E2RvG8FzzG0TVpYQ"
-    "IkiaK0xBmlthQe1zSclUq7c2x4jMFb9r1qEWCQUMuhhXhCxILcHIIKEiEawKFTPz1tqcmRUg"
-    "hVJMyWxmzU20RDHnBODeweU7SlU9J3/8ev7Tf/vhX37zw19+fj+DpaLuIyqzmLXyGFhIHbBq"
-    "iS65ue/dH/tVVUAW9KwSmRQRM1WFm7NwHiNrrp1zb93dCIw5JMoET5d96/0cM7NmsSDetmPM"
-    "n79+vd9P175d9227ZGXlnOcRxSL71ntrEWkulpqRb++30/T5adtFrLmbldCbRU1SisWkbb1t"
-    "m/U+0eY9BuRICeo5ksTnl+s//O3fXC5bBe/HGCRgEKqYq/anXUQdAhFz//8R9W/NliTJlSa2"
-    "9GLme5+IyMwqoNANQKZFmvNACmUo/P//gC8UCi/NnpluoAso3OqemRFxtruZqi4+qAcoUk9V"
-    "JZEnT2zfbqa61vdp8aodGVV9lpbMKKbajEiDNmKGq1YfZ6uKiMjcWXHNOKfBmsyWqQKFqtlV"
-    "3XhpOiiyUkWtEYF7C2scByupWGupoA91u/HcYsnc+1IxoAR0U7C6wZfZ2C3JSkWJaWMYrivc"
-    "B6P9EhThcO9TPEAX3VVVMcaoTIGmpIncbCagomKHeFK4dojInDMK7/EFYllJoLccqFq7TK0C"
-    "poPEin0csyDRC1Qz6d0YxN0PwE21ygUByLQZ9629aQlqOs0coEl1ZKoXinCKVGWpHW31jdqA"
-    "KGy6szbBytU6ycfxiAxXr6oIUqimZJrfYDQ1LYoQ7mPvvSofwtFjm9ixN+QmTsVOKCFWSB8z"
-    "s5I8xhRBFSBMlt59ZiP1OmOM0by7a5+AZQVAKXG3/v0yw00aBmLmKlakqkfs17p+96f8X//7"
-    "7//Xv/+XP/35ywrsZF+Y145MorMTKgAgVNXIzMrD1QzDBGKr2E7dxsiwukIsqjqHq8hrb1Ij"
-    "Ss2OYyTrXOv9VYcdb09/zgOQ99deO66o194lwuR6f987jseHOY7jeJ7nda2TYFStyDHG9NF9"
-    "VB+jjXGVlbk/v/aOsu8/agelXT5996HeK/MM9V2M9+uKeE5m5UJ+OSUoJXh7Hn/zN3/98cPz"
-    "Olfs/Pr19eV837tEtE2LjzlEzJrs2dbGb99uZpYZHf2sQiY2UqC1r2/2VrDoxyAkI5E7zy/x"
-    "+px8SIUr1lqP8YYqVbreV5thLoKGnpIY5sIyECIZS1Fs6XhEmwBUlaIpaNucdWtCrT1Grqpy"
-    "o/ZUPQtqClE1AWSOudY2b6F1jDFpXGvnjiEmEGSZqfanSlRN85sMvnZg1srwYxptn/t6v/a1"
-    "3dzHdB0fPoyffvpJBHOOiE2mquoYKOUZU6ea1qKCJpYRsbdXYqjLbSJWUJu1rpCKNO8xvGaR"
-    "pA0DwIK0H6XoJqx4Zbm4V4Fx+HTX2Jf08vfw/ovcGaZK6I6g5fEcxYxKETFVG6OqVpRCdLBU"
-    "p1vPkM6Mw+ZNEaCCOtR3bBXChJljHFVZyL5YlzQuh9ZjSOA4jraKRkYxTdzNBFpVKq5Sjcxc"
-    "kebeVeqMBZGqAnle8q+///q//fq3v/vDz9HT3TlF9cv7Xit7IdRSDjcdwzKXqbR/UiVZoiKZ"
-    "7M5qZkUVISpwN3cDsSKqSHFaraz4+pqOt3kcz7fHc5bUa8VeO6J2YQUTSSUb9Hu8JfBa+/PX"
-    "s6quHdrLI3O3x15BlLm9XnsnmfJ+nVX1cN0zfa5PH6aIjjmOFHz9YmaAr0gSVfL6fBW4Gef2"
-    "tbe6HG+PFfnnH39WtbVjFSmmaq2hMTUhh2tXSN9fZyU7awV2at16ytXQwcjqy8aO0C6Gm6Il"
-    "UDoqMYdjn4+PbylgpevkjZ28nepIVqaYCVRNCrtyo7KZFSTdtIh9LgFglhnaMFN3CAlaP5vV"
-    "cmWqqopl05y0+7Nokk43KJtVnKz7Si/aJp3ucPdAJ3dOcXFdsbvndIwjslB0UYUI27dFV1vr"
-    "mh+muXdPu+0qZPWwRoG3t4/UGcWOTKMw3Y/jsOEu0uiMtpsb4FnpNiJCqgy5V2YNSJlrJv1G"
-    "bWSBFRuo4R4phInWUDUFMoaruvEmZ5SPUdX065zHUJWsiAp3y+pqcYlakqZ3zk4EpmDlGFPg"
-    "QJCkWFZna4epmqsYoJ0ULJ8zcxcrktNNWtUomrt7ZFWVpmVKFYvo8LPs5pL52HFVbBEzHVkA"
-    "mblUHr/97U//5b/++l9/92dWsr0p7tdqsmyfmnHPTFTuv9Wkm5lguKnKunZmtk0DHcYl2ofR"
-    "OLUEEjh3rJ0FPAYez+en7z5K95MqM+J8rSzx8aAoISsvoirrtZqiBDcH0U62tYPAzz9/QdXb"
-    "xwO2k7I3v7xfX89w1+8/TECOcx3HUKH5PJ7+q1+9fX5fP34+N5lR5/tZ6Wr+2vuKjM4hFn/6"
-    "/NnF1DTaN2/uAGqryXHMPtK4eWvB+sWrVTAB9IbpSitN2a6P5mJ0lwB6wwwgTngVHkLGUnC4"
-    "uQ91j57SK9aKOZ/aj7JoRcYKVj6Hs5IoV83YYJkb0FxkYSbEUNxcEKh4RbASJIg5H5VUtZ0b"
-    "VVDLLDVP4c5y1QJRKaoAuirb9I+IaLuAmVVmZaLW3osi7mOvJWNmBNRAgNhrxd5VeQyP2JWU"
-    "IkgVmN3Et2OOteP981c7CLedq3WC13k+Y64wv+hPLSu78gWdpJiOvocUqSHqLuICzSArMI+O"
-    "2/vQEAFV5TimscpAATOXmglHsSBWVdBEictTfRYCjuRSpYpklfvBpAwXSFUEq7IHUpw+VQ2l"
-    "17WOD7pzmfqYBzJMtRGTLLaslKzY/T4fblUM16MqAMtbklEQgzAqM19mU8WzpVXcVTzMA5UJ"
-    "ZpmPqnDBr//lx//b//vXf/fPv43UCoxhc/iKXKv/VK2kQXxgmguxd/C2RTZkh6+1qspMfDhE"
-    "mnqHYY3AJTVS1873KyKoKsP56Xl8ejtiX3v7F9REXucG7Tje1pWrrpVX1FIFCudCZj4ex/Px"
-    "4XWe64rKy1QEcl1xHO7j6N3ber3OFXtnJv+Ur+8/PfU9iet52DHtcTzG84l5hTq/Xp+/vBBC"
-    "xblzBSO2iVJ0r1A4XJCZRESwf+uSbqbix5xmRkpVPp8fImNnzOaEQdRdY5LUb+LNXRydFFeq"
-    "yZijQ/IlVfowdTcpMnKJVLCazjN8NGMDTVKMzcxYi1Kt/4oog7DCzMhKRmsHBRZFNydQEIhe"
-    "O1RFiR3Rs4+9F2BzPIup7tX4AZPKLJUMZNEGs1oBIFXd6JaIzQgdb4Aky81AUqRQBczh2QUJ"
-    "ziJ9eMUSFAo7KvOaNkS4GWM4JCtqqA0fMsyHJ+hiUsmKYSpVruo7KmsXAsKIhN41QlNVkRVb"
-    "HT69spJhoiRxz+Ls2292M1aBwZgmreIdD5AKKCtdZI4RO2pRh/WIQhDH47GundhCcToEppp7"
-    "+ZxmCube26xUYcMppeaEVIVJDpfYsYNmJtoxLJDlPlKquKsKVFEpyWJJdWjGiAJgriqyYw+d"
-    "Pkasfr2LiJgJYL3L/dffff2//79+/d//4bdXyg0xBRtRSTTHj6r6OHxOG4rsIqX2zi3NXIFd"
-    "CZUxTK21afftCCwWFLIy+uvATHzoh7ehxtf59fj4/Pr+GhbpSgqT589f3l8nIfM5jvHYe/VV"
-    "7fF4zmO+n2utPF9LFI/ppuruc87Kep0nzIEWTIu5q/DL1+v9fZ0rDscP3318o1DxGI8ffjCf"
-    "j+PxfH9dX76+ZOWYmoUgWFw7VqxkiamoUYQmJjbH2+NxmKp0xqh/YYCZQh3C0MpCA0/GsJtt"
-    "c6tiqoNsY8x+rL/BXrBvk8N9oe4TpqpkVVSqOWj9GTjPS0XEvXeQ2h5H9circouwKUdoR6t0"
-    "tUOyh8YVJm5qe+fKDUjEnjaaOiAqkYyqKmarnhsz40piR4qO2GdPSa/rigj3XkkONS0CxLcr"
-    "NgXc6xIpVpq0nhPIMBhY6jobxANCsHPDZ0YkTjWvzGbNAHD3MYf7HMdjiK42IhWiGB3ZG6ox"
-    "9Ypc57tp/yjcGW6D0EgKi8JiwKAqMMuq4Q+AO0vUekVuiteX1xhHsNxEKD4myayac0jSTATK"
-    "ShXoLe2uzLQxOkCb3BWdjCk1Re+y2bzhbqOVu805q3pGUiIwN5JUiqlA5hjkrrrzhaxsmll/"
-    "pGLnxhqHqWgm166ffvr6//wvv/kf//TnL2fP2+hDxvRGNFXrnUH322QsqMxo4sdwU0kBgbSm"
-    "gbUwmCIlxYaf6MqMCMDMPBHmNqftvYeamv748+dPDz18rKjYwZK1i8Cc4/l4qIr7UNWEZOHa"
-    "fF2xd0byw/EwVxUdKHd7va5rBRRXZOz0Mcbx2PuKvUGNP319O6xKXmccxzGfomMexyzyynzi"
-    "+eGjx25spe5Mva5rp003m8Ey88oSEXXPYsufiOoQzI0pAyBqZlnNAwU6CZLbVCECb3Rv7p3u"
-    "ThWxAbHIptUFpMyU697ZqCAYRWGlymClqI5pGaHq0s9XVrf53Jy1d4T5valSdTPZu8/VQmTs"
-    "XVUuZiJRpWptpatiokqUsPYzUNCQ807wVoImGSniO9IVqnatCwpXB8jGu8BQBOFmOwtMoQ/3"
-    "99cLVUI83CNhrud1HnO0HEBUqboqbZi6uegxxs8//lmHmGvbqpyoFdUzPHXZa/OWlcpie5wA"
-    "FbPBKkQRVcw5m/NGdbAgKvN4VIRYb2sbp2glQnF3anG4oZCZ4mamDIuoYh3qFbX3u4joMKFU"
-    "diJixq7MeDwOYaqoQE1VmaxY11a14zhg2vuYqv56UwVMzIZ2VKdDa6BmAWI7qBZI+phmVrEF"
-    "EDXI3TLfUZHy0+fr//u//8Pf/+Nvv7wISkZON++cqKCiUABhru4K6XOdgjeVFkWfJiKKVtWp"
-    "Tx9jnu9r7cVddpib2aFQXFGmHKI+LTNMxdRe76cbIFYhYM0xIoiVpjof4+3t2Rvn13Vea51n"
-    "vb/ytTbBj8+HmBM0H8OZrCuy3V8rah7T59zZBRBTkTH9+XZE8ucvl76WvZb4oTaq8Bhz2oR4"
-    "HhI7SdtZ8xHnWoRQ7DDLyuZCklQAgsiIvSqzy80Eo5JiLY5zNxFnsVFqyqa9goDZIWY6hs2h"
-    "4wkbKVoibgKwtY/urtaRRxFBZkBDxMnU3jmTIkJFrXR1VWGFQpUqFEYAUDDWzigxXbGlge1E"
-    "ZOyoeTyTSBaz/LBve2wKOIY2ABCACM0sYrOgZlOVDLCBkyqmVfV6vXbUOKaK7B06kmtn0eSo"
-    "rBLpAdiOPWwgsdYlInnFGD7G3DvF7BgO/YaeKc557FpmLhTu9EKyDtFDuIkaoimlbpFFIKP0"
-    "m6gepN5K65uFfs/KIYC2iUsosXO4RYUk1bu/+Bo+IwJi6h6RZl4tS1BVM2QKZAwfplBpNWhT"
-    "YJogb6bTRzJc9Xq9HsfoeHOHy3wcfbCtKhMzEVZUhkqPGbUIgawdPvQ4nnu/izIrqvN07kB7"
-    "VLCiMvG64jf/8rtf/+bfrhXCVr3AgekuxF4bVSaaIMh2h7ewM7Oi3c9qIiCZmbGpCjNZ51mZ"
-    "Le8cZipaSDe7dpE5h0cGq47Hh0YLUmXvSpHv3h4QUaQ8DhFz08wN09d1vZ/X69qfv8QKicKY"
-    "4/4y+rbFiIwoFnRFRXGYrLXVvR/g5+F/+YvvK/f7l6/ntUqVX5fqS9Ufx/N4HvM4kiamRanU"
-    "aVOsREdm6RgFRGzTpotSBHtdFbH3zowi914FEFCbhBA5j4cq3Wcx3t7eFMKqYYr+ChZNmOuj"
-    "MMSnjuOeLFW6NgXTTC1jRULU3RyaRXDTzFkoVGQJ6nCX1hlksLJ9Z2CKWKH9R9qUY1HZVRCJ"
-    "Kh9eYAEBGkqpRPvHqqpzQBBwraUyBBhuUQVRSmZWpwz3iqySIrJj0iUKd88de+8z8njD4/km"
-    "wvN1FQkFyV5V1W3DhqmSXOd6fHA0/cLl9f5uqpGhocN9qDlKRFkK0rjPQu1scAKrNmwwDwb2"
-    "XmMO81G1o5YLq8SsJc6+c9WmGCMIYEDmcINkBeJCrQQEVpxSnIcxWpXABPYul3JMLV07VGCq"
-    "FChcpGRUKVSsiLiuXrfyjl5v86k6yGgsbUVC2cA7AGVLoVklMCL7i/ZaX93v4lt39rJE1CJ2"
-    "VZhL0f/8+cu//NsfrouQAS0RgKIq0yQieoISLLBUtTMb6po7WdCCT4FlJpNExw2K8cpiqsoY"
-    "auoqpjYi8PVaV6TBYm+Sb2/P45ivr+8r4GYmYoDA+/2jj5EQEXz9+uqFVuzK6LtoqQuEr3Vl"
-    "+qDE5BhSqLXy6ysKeDwOEReRtfF6TxE8p4aUDntFBGRHrRVmOSd38IzrQ73N56PSAJnuCWnI"
-    "045VmY0WIVkF1VRI7b2vq7LbALDhNzINnGMIxU18GCpMMY6ZSdUhvZuFrUgfg2Lqb5Sn2lTR"
-    "OE+Htq5+coGzJ8Yikpmmz2ESRGaJuknmhohklrI/QxDt14Vxq6glenc5MtOFGdtNmtgnCmY1"
-    "Y4mobqJEFqnDvBSZ63x/mSqBiLIxIMjKngQx8+3DczzGeb5bo8X7ZBZJpR4ukKF4fnz4Ye/v"
-    "721Rcj3aQRJruc9xeBG5ilVzDNMmQMLdluq6XoUY/hBlIf2WJ1bPnDyS0Ss0obqr+vnaYnoc"
-    "jy5a92ygsgRqZgVWU44AoZirQlakkdRU15uUVaUm5lpARvYGFBqMcj8yQhzFUhttjtCpEWma"
-    "yGSJz+deG2Ii3TExoC0VkLZpZ7LucPtr7WMed84jtz+eLFFV87H3yQa5QAmpFLfR6y5zqQ1x"
-    "+/zT+3/7u7//t9//KfoaItLxUTNJls+hlOv97L8bZpmJgBU7ikXYsDGHGVGJZCHNxE1aulF9"
-    "g/C5qa9rfz3XDhaNDBF8+PD2eDyu87rOiy1tyRpvxzF970WKqsaOL6+1M7LKfJj5fBi8sGpF"
-    "7RXXle8MK35807e3o1DX2gWom80ZhS+v67wiCwpG1dfXKYISE5XKIgLikcgKdXs/VzWIRsYr"
-    "l5knK2Lnjqb/r2sVk8xYqwMbbW02s75vqA81IwWk2+wlkbj2WIGAuZkrqVB/zLcWHc3nR52P"
-    "SHy7M4NVY7gJqnIMlQJFKraikGE61Oy6NiWne2W6q2ZmcwM7rUWaGEMgkkwAUVtUoFIBoQ4T"
-    "9GpOlRAqxNC4wyYZVJYCbhp7rSgfw8xcLfZWZgl9aMYaYw4fqj6gOxmRJUJwCr7/9ClIn2Ot"
-    "VeB8Pi++KkvFRDgP32s5CBURE4G6rmupu7bO2y3TRBhVa4VP91YeqjmqwC65SbP2qy5zm+Om"
-    "t0rvUplmnlWVwYAPX7m9gylEgSIyhiuw8nJVVboPphSque4kXDxiDa+qrBpFWXE9jg9757BB"
-    "VgQVlXUZ0Yau4eaq5shYt6qwRNXOtaY6M9WELFDGeESVmw71BJCl6qzMAAATq2RWiPhwz0oV"
-    "NslZx/h6rv/6v/+Pv//1vyWPoETlt0lVI1yGmL3eX5HFghTG1MfQ43CB5LmZwWJVitDbPd43"
-    "Z1MX6XesqEHwutaPX873syBKcijmdFW9zut6XQDGcFftEaWQz3kka0Xta7+uyOLOelMRt2QR"
-    "iKzrih3JpAIfPs23j/PxmHvv46jD7Eq8Vnx9j2tHQkWEwiuhK0kmNXaeVwJ6+Nx7q+K8QrMy"
-    "4fPZdizJiKjcGRFDsXdmbEhVxd6LVSoqIsGqgqu3PNWHZ1TjQ7PKBKqaxTHNaCJSACF7xTge"
-    "sDGPZ+kMjDEea1fssjfdsdyHMEVqqGVG7O1mLlkEy6FEZe8iTVC5wQTLXKWcQVOvTIoM91UZ"
-    "exe3upkMiIqgVpBUH7uKZoUyuJistSvLbKAoLG3JpTZQsWInK8is2DQqFAFCr+uc4wHR4rcL"
-    "p1uRERGv0+ZhNrfEeB7aK+Y8i6VuJSxWVdoYEMkmLWWaDVXOx3FFQ/Gpak7m63zJ8DYziOgY"
-    "x95bTURGRpoOMxOJiEWBqoFq0o7uFJFpA8qsMIMNF/RjDLcBgQ1VZTV5StC7uNzM2CYY6nvn"
-    "8Ti6QDf86EGIGyqXKKECGrofqHqe77dqUQwFki4mgLqT0fq1YpkZmDtPgbiYoFZRUD6H8CAS"
-    "JrwxWZnVBmOt1H/8x9/95jd/WMsIy5IrIwpZReDQCbXXtc4VEBPUMeXtzY9pc/i5dmUruSuD"
-    "SugYYorMY05BXVdkxHEcY8zPr/Pz133tyuYoVx3POYZVPx5VAhnuOwKuYw6IqBng+/09gt1D"
-    "FJVM1rWoWJt7bRAmsGN8eI6/+OHDh+c4z3cBP74d5873Mz+/9vsrqbcZywxfXrlikw2Rr11U"
-    "0fdrETSRfS1LDZbuhAwx23tXwsQg0rCvzBCpXjhca/WgNbNazFkQdeOGiampwc4mzWrrzVzE"
-    "CS2YjrFqn9c1RVkcNm1+9OOD6NFOORVmbD0euMuGaV1s7O0wazzEXc1HZShYKHdMHZmxdqgo"
-    "WVBACBWFVpRrfzrLTSvyHoQA0z1VUypiZTZmRIN7+sgogb09PyAg0Fg7u+nKHMcopLmxUJWt"
-    "NFEdahpZc5qY3dHbxDFGn9Tfv16WENZQWa/XGKMioVKsfeWcR0dixmHH8C/Xa+XO2rAUMEmH"
-    "1DyGmZRoVWaW6eyrS2aawe2up5tLrFC1jFDIGMbE3Q7LcjPRqgaTqiiM3ygMRGSxeQ2VyQoT"
-    "P+Zh2FXZRCU3ZRKmxQSTwk7jZP/5RGYxOXyoRPtH+3wLYUmNOXPTVNS0y4jdSBHhXiehYi7q"
-    "mZFRIhhD5MZTKoGgFOYf/vDzf/tv/3id+Tg+nhde769rs5JmbqbtlSzqTlaUiD4ecgy4psAy"
-    "cq0Qig97ewxXqGplFrD3ZgXZAgy7Vq6dDfx0VzKPYzzmEOHaufYiZPbbN7MzvCIm6q+vr/fr"
-    "6uDiMaUDeZ1aomMPAJECH3JME8b711dEHHOSWXvXxr5u4/xNKUucC+e5RThGqqmYAXrtKOTD"
-    "xhwjc9cuSBKhYt1hugpjHnEtoF8wsc+V0SKoBBCxAUkn91Z301tmMXyKaGZd+zXnHLN8NEHR"
-    "AVUbFBbril1RQ0zs8fHj94/nG28Lh7qPcr/Wtv6bVi2qiLkPUYUwc7koSFc0oUs7DdjwLYeI"
-    "JMPMIVOAqmh5lQoigxTrapwa0ZkQg6ioVVx3dcecZGUYxIa3LqiIjulFcfqAZOeUIhdFUc6S"
-    "69r6MPVRxOqjTCSIYEzV5nfvfVmhBGKdcOsQUvOPYwyPXOqmrj4dCndVGUfcsUGhyNovn7Pd"
-    "WgrPOktrjMGoaXMMjwoUCLkrHNRjTnIXt0ApEJUWUkF4XQWkikGNuRk1xjDTHSlJkRQtlVFM"
-    "ULhPBcdARalXVFGNGVPMRDPWrjCji0ufTIymcoy51mkGGAolWW72GAeZGauQpppYYAkPUxfx"
-    "iAvc1jvDWkhZm//4j7/97R/ex5gsfH1///qKBI45jNqWZ7heV0SICoazeajqzoxYYSLmcjzE"
-    "nSqKYM+rCTyPCRZZFEZjbyWHawXd7TiMjMiMbJCIzefRtw2fc0U+Cz9/+fr19dqZK6pEIWI+"
-    "II2LgYND7tWKyj7PPr7kh7chalkSsgPx8cMs6Gutc2efWhHtHpIdNYepWcRpqqpY507nx4/P"
-    "j2/PFfXzz6/e377OK6osCihICRpnQSEi0kSKgW8uiwL2dalsFRVBjlSf0X76iPPaUwxSY86z"
-    "sihQTRW1I5gLTHOaiXmKGkrBnSGkmUZG7j3H1KKw3D1IVTVRVoJJFsBslHfXiwBWRpRqBdKP"
-    "gQQoZpPMrKWiq3Zlznm0ogo+xHRnqejQ2X4jRrXXUlWLklmuJtAr1jg8YoumiQbS3SNKBDYN"
-    "Wpn7MT5RVFSviIQUi5qAMmvv7WP0PHXYoIiZJ5lAQ4iqcrjh8QEmclioXet0Fa3iODxyV10Q"
-    "7WqoiI3jUXuJdWl/WwcP2Xvyso59qlJkx3YXkiZqY7B28xAqU+//lzTFS8WI2nGZmsEbQwlx"
-    "dzKldvZbVV12hqkIDVBoj7jsfn9EJTj6H5m1sbvEq4qscDsa1Jq5TcXtLdnBjdsGolrFUA0b"
-    "ttdZBbXnb/7+3/63//p352vLh3HtfV6Z5PA5fTCy7cBr7R0pQFURNt2fDxfWilJR13w8/JiW"
-    "GTtXBlEcpnNOdhsOyIZ1ZO1gVKnKnG4mbDTLHUwdY2jsDRWKFPDj589rL6pFNdvXqtiMWxIG"
-    "uvuHt8dBFnC9XntFEseQZF1rva768p7m/vbxmWX6MrnW+2s3WU+dFcxkSCHbQAl3U5XcuVfY"
-    "x/HD9x/HuD5/+XqeZ1ZFcsdpzjGGqLh0U60HdXqMSXLXLpG6E+ICSlUWS0hT7xFXxObJOY8d"
-    "e0UppqnThqgNn2Me43iqeWOiVHTH1UyIDlqJS2ezzIxVKVST3NkZw9zVkkuIdDNURbvR2a3k"
-    "zBKiN0+Q6r7dYbOYleE2Gk5HMYFkRjdkImOO0ck5VVMfgMRaw+Aiey0yK4UMAUAdrpkVuccx"
-    "dMyMGMdD3UFckS0YI1qn1y9bqGorOGMvit6Q9q6xmanKtZfaqEyb7v9/Mklt0aiA+eyqizbM"
-    "wxoKharamYbexfWIPUVdbkIVx7QOfxZpprn3nENNVFC1M/IYR4ECa9peFsVsZz1UcqcKfTiq"
-    "diRHR6wESXdHVaLMzMR9qER15wNVUZuHi5QRvYVba2XtYWamItp79t7ti4gOr6oxnNhrnyxG"
-    "+e9/9+N/+S9///PPl49xvfL9SpaoubllhKsCMJXa1V8wAIbI4Ya8YRdVWwXIXGdoK+pExeT5"
-    "PFpkDIGKZjGydlYWin1YYebOSFUFMA8/npOVmVuBqPrp64q1RcRG12wFopHdcUEWH97MM519"
-    "n1aDlpq641obqz6/17Uxn7bi2iGEsGAqyQL1mBODGSGtVieiqZklIvzy5TJ8/vBdtwsEgjkn"
-    "1lo7IkoVYxwA3A2VMDXVOYaqUh8UZLIDBW0aKHIezyyI6nE8ImOvCyxjFwbUfDQ91tXcxhzH"
-    "6G84yIrdoVlTy4hrLzV3NXPbu2BEFe5Ps3Tpx4rismJXxY34YEeXSRFUqynrJhFDuo0kQO6g"
-    "i3UmL0/1QXJFQ+cyUkz1eL61k7aqMkKqVIWxbWju1p1Z5ZVJEYWMWHvMtzGPnsBmRFy74USq"
-    "kplQZOXe8Xwca+8SFRM3jfbR++HjwYoeh1fsvdc4xP5Pfz3nY4ohYykTcLVJeGZHNDpzutyM"
-    "1cQJdt51zKHKjKXCOZ0oZUVEL2H1m6L7ptG7F5szxAq2IVSIBFtfA6qoRSRE3AdRBN3cxFy1"
-    "GMO9A+gsVubdWjEzN1Eh6aMhyyKY7nOMWa1m6H9oLTMFJIWiErF6FAKM12n/n//6m3/4xz9k"
-    "Wt03ay0YoUoK6nHY7T5hiaipHtOPw6Z2N0syuaOEhGB6j16tsmslVoyqMlNRTTKpK7iCYF9g"
-    "UB0zAKs43KaPKkZkAyR2FEV3IQqRTOJajXSVFVwtxq0UE3c/5vjw9uHt7fl4zs4rVkn1VRqV"
-    "mdeO64zzyiqSMMXz4cNwDH3OmTtE7qB4FUFmZOzo5FFLBtwsc7F5fKS79aeiv9j6GkzWmHOM"
-    "CaLrk7H2vpYAWRVZJCJix6qK2Ndei5VTxdXH82E+zQ8dbz7fPn78+OHtY2bGvkzg8ylqmRWZ"
-    "LJqZ+SiK2GweOHtCF9lF72vvrDQTKQrhqiClYDJalzmPiRvcASFr7amqhYoibslRz/yk/cBF"
-    "g3bht4BzLSGHqbH2uobbPAZZKmJqphprkxjzgBh1iA/o/eE387WuzHRvIT0rqyLf3h406c5p"
-    "fiMQqU/xQZHzfF176zE//fIHmviHt6dZO3jTiqbj6sK69yapjjmsqdyuGdvsuOlaDNMahjG0"
-    "hMNNIdUeBhSr5hxEVUSiVIepVRJUVSelshdtyNyhedhz7xa3aoq6e67ckZJ74/KpYk6mD6+q"
-    "xliImigKrMwxvNWl7VJR9R0UEVKLEjuP4xDB3kWvpJiq66E+f/58/fO//vmf/uXPV2gkpxmJ"
-    "IvZaK3AMeb6NMXStZapzWp5LxD68vTWxWe5zQJlIUOaYPkwgsbOf54jdmf7+gQ2snVkoQTcZ"
-    "zCyTWSRrmDbDwdXLKzPOSCPUEAGCbpJr7+wosUbCzBaLpEU1DeXxPASsDFdRtWvFh0/cxRV8"
-    "f+3cceYWCgFTfnjaNGbuYUOlHodUHwuavwlc56odX9+/UgBp+2wJeAw312LtvTLk+Xwc8yC5"
-    "195rMWX3jVZN3VBVkRGbZO1sQ44IjmNWxl4Ldj6eb4rhErXfQRU5at1rudx7uGOMWJdnSWbs"
-    "5WY7KjMcPfpPwGIXtEzUhgFZRfbGrHPI/U1fqEifcDVTrLUamVmVKCookUPcTc/MXZeZmnsV"
-    "7VslVZu3KCJuSFYWMq1KujobySox6S93NY+IaguYiIoWGHur+OH+Ei3T9u9WZVNu9t4wVTeK"
-    "VnRnY+6qXMvMVlSJ+JjXDqg4aw59QqrfmNfKkqHqIoJKlbsnvc/3MUaz9IbPEktQBTZPwSU1"
-    "mWLWt9RGQlI7qmIuAJOUAMTtnmRKqbqjatoQQTGy6GOqGQV7J2Cg+mjGTkVew2YFyJ3dWCeF"
-    "tjfnMVEo1BhDRCFWfUocBhCF4QOwiGwZy2MqRJM4r/rzl+u///qffv/nz+8XVdVVC1K465Rm"
-    "c7gDPI6xd3Xt14cNxZAOqVOqBWrVZuOiVjupoQ1JcOjQm0+cJIWqUEg5ykARc4szQTX3McaN"
-    "QXG/snYl70Ekq7CyCG3Ujxgp3EVJZDFinyuG258+fx2mIKarqtqYw3tXmjbIIC1s6ID84rvv"
-    "fvnp7fPPP+oYz8fj1W9IMooUDPe3t+d1XO/nGZHX6uGWuJuU7dhmmtV1Isbap4iIvM4zd6hZ"
-    "7A3I43hMtXXFXlugkVWxRU19qBsqY69eatS6cpzljq/XVT99yd/6xx8Bf7z9Yo7Hw0TEfD57"
-    "++KmSQBlNjpmIUohVwbEFegLfO1tKhTNCqNU0oBhww/tcV2xTCsrQMkUFVE7qirWfozH4Yey"
-    "UJmLHecA0f5nc012Q8NLMiqpojb3DgumUNR27ojsS27kJsaEZURF+vHIfe4qR085i8V1Lq36"
-    "+HyK6qqiSFWZW0Wpirmlymtvn5O1qaiCyfS1cqztKm6emSIW0dXCFqUiK5g5jweyGv/ZrQGf"
-    "M/PV2X61mP1s2ywBezYgELHpo5jQXrfTXVA1VAkRldwCQo06bD5UdWYVk6h6zuMYzlhk+XBg"
-    "i0k1F6457yzqEFdVIwPQtemuosakqSmUlcwQ9ZXh7iKs2pkjmJHy5cv6p3/+3e/+8FNCS1iU"
-    "lTWH92HMzUaHWFQIZOUVUaS7RqyIdRzDzT6/X1ewiGEqEJACO89TgDENcqNkYBr3FksbD+LW"
-    "Su6SriWadiV9I+eccziZEQsqPl2qDJqFzBJoMqUVc9pOPURVLVy7qnq/LSLiZsWvxxxVjMQu"
-    "vF+7imPYpw8f3t4eJB+Ph4Jvbx/mceyMtfbnr++RUcHrPX2Mx3QOT5ZBzM1NU8bj8My8du6i"
-    "HwNAZcaOzIRqVO0MM187vnz5sRqZjfZrWVPtYu11VWU0+UABVjCjuK/rPC/Ua8n87vtf/mp9"
-    "POb8kLXdVI1JRUlkqMJdszKqbEhm2XC28GAta1ofC6CLxb6ANqFssRG11GSY5i25bjVXmarZ"
-    "EGpUUXQMX5WwPsYmIK14gzh6CoQyE5qYDkaatQZTC7Jji2hWFhvdg6qSrGRdsuYY7W2uDLmv"
-    "JxhuZmpjdJK8LwQmImRFynQ13fuM3EfkMM+1/Q5BZrFYJZnVTQMzG0OE7FtorP2YD5UOS3xT"
-    "rY3JGlQXSSsLJKvMRwkpEKhq50iJLIyhVUy6qIoEyKSoA6xc5WqKHZeom7kId4QKpNKtBYXI"
-    "itg5hry9PetudXYBUTqR0hzvdaUQ6ijmHErziFS1Ztf2rVLsWCv/6Z9/9z9+/W8rRG0kV2Rh"
-    "iOsN+3W3JmAjWFkU7a0dK0vKXWEIFlSLyQJc3L1t45F8POz5PKqiMnemmxUlCxmsxnGoqmpG"
-    "VeSdACdZGHO43+VKc1F3dWdVRBUqqnFeZHVe5X4sVKzRHWx8DwCR3KmsL+eLBPv5rxLVjHp9"
-    "fTEWdw6352HyehdTIeYcH/nIyGvv2tfO7WNA1aEs5l5Ca7vCUD3Xea21MvdORi+XWR0EkBFR"
-    "1zpZtHt4USBNDUFWFuu2TxUYBeP1eu21fQzUpSWSo97/sH/+t+v7j8/pFSxIZhG3qK5Yu6Un"
-    "biUNlA21yVrJZKaJzDHW+SrS1QRyrdXZNxveMZC9F0TUGlAnmbmSQgyfyTRQlGqAoFAiqqaV"
-    "XFVVKbfUeI3DcyXJxnoDxiwV33t/m9sRIjBpfaSBEDyO4/V6gdjrjIjpw80oiIjIbODLtPGY"
-    "j9eOyo4937fx6S5VxzT7X/6nX3z89Ba5c8feTBpFxxwNua/MZvS4qlu3j2hqRJHhLmYfkjSj"
-    "y8G6S9SiKqbgt6aSqc1badHBQIFoO1rpKjWsFbbN177xYSod/Nje4wUpEOrmrud5ZqZpA8nM"
-    "HRFnVpiOSlHRMcZwi7girwKjqvV5on28H5H+m3/+/d/9/T98/nLt4LlrRapqktAWJlQk1WUe"
-    "SpaoRWLFN+KJyvP56Et1lJSgWMPMTPZeZA234zHGsAbssOVRZru4S5LoMoeKRZuFzY7jyIyI"
-    "bW5ZVErsJKREoiqrsmRF7WASHclksrLUPLo4oVq4v1M6Vxf9zxalSEF6N6oqKGTGuta6IiPX"
-    "Oq9rXWvVzQzSqtprqYqosLBi77Xfv17XtTJqR2SWmYw5GtfOYpFNU/M5VK3YuZfeg2jXUG96"
-    "EtDZVXG7eXfMiLyuyMy9r7U3yOFjHocy1Z6u7j59HDYmBWtfomoN9fexE2bH2tGb5471A+Wt"
-    "BIjoem33pdTMxtixRNti17sk5o1n61G3kt0EZusICRYw54xbdGw+vGveRPX5WikZqWYiwqzm"
-    "Woq5zwmBjuHHA2atoyZrmLWPWEAhPj7emNxdaTaNnsGKVUQWjzuCRjW46YePH3yYqNr/+T99"
-    "msOUfJ2LMLFJubETZqpoviBbF6I2AKLKVY5DRTdlJlK4XSZLmlUvogSlH2gTm+5usRYrXV1E"
-    "254DmQ3iHqOaDNmYFUAa7ynkGKom1MQN4NWoTELdut1SSdcEQ0ClDH8oVASVAQkfpsN8DEJ6"
-    "pqcyzyt/+9s//fe/+8c//vnnWFEQtdHyziiySrqAAqhRUW8fHj0hf51Fwl3f3p7tAarC61wr"
-    "ckxXkWorvMm4jRi7MptNaDZWnzmDOwrAmLNzS6aqowE7/RhK7HvMTsja+1qxg9eqyJ4f9gwI"
-    "zCIbT6s7uzpPlpFaiQqym/W4341qBu0dgZkaCZSymk5qBCOS5Fo3U6IzLWvvzMiqSiVlRV4r"
-    "d2Tkrrpf/2POAgoEZPhU83PvyBTVjtxkVZd1cb89+wfDfQAkdhTkvqqQLqpu5u5gRcFMxph2"
-    "zPE4ihWRDQO5LREw1W9TaJXKliqGgLWilVw9bjS1nUmhuolgxRaVxt+0vomk9Nqid6tIc7XG"
-    "q/nEDbEVCtjz132N6ebm5uzdE8RMs2rH9uliHW3SBGQMuKuZmA33iFjntc7TRQ+frtb5vOfz"
-    "mawdYWamJiJZjKjMcvNmWGTl4+0hpvZ/+c9vj+dMVgEwDTFKqmHHIvB4HoZSxjiGmMdWs2EK"
-    "tVKjQGyaDhEq0n26WNfizX1A04ZCjJSsbR0INCtSfTTlQLDdkyXXOoneqbrK6NYlpMRY3P6w"
-    "FkGz6hgPkXI3UKsoKpQQmT4OdS9IRcsfCKmGE+swUd2RQsvMn34+f/PPv/uH3/zrTvjx0WyA"
-    "vM6riB7Im2qxKDDKMf04PLJe116bInwc8xiDVVV5rdhZYiZ9yRdtemsVms3hrhDPsrXj2nle"
-    "WQWKmqqrfHsniYhQEEkVZYIVUAZyR+2dVZKFRsSpihRM1d0akZo9cSvuJEt6oJ1ZoxGiZA+f"
-    "nm8PEzGBm/XyqjfYYnq8zWRmZiX67fd8Pt6eb2Ct2LsSYu7uo9My1jWpvfp+R/fRB3gW1dTH"
-    "2CvOHd8SjM2iYDf+O3hI0tpGSnbJAQI1bSMPqD0gahT568vn88trPOZ4exvHx+EHBWdEFOYx"
-    "ob7TxI9AJSxit9rOQMZmpILKotDEkmmmXd6G2JAJyI6ESGWiqIKvX7+O6TRkbXMzN6hBxYev"
-    "tYuU/s1LifDbvHAgusVk7paxKuP5mCKIKqFUUVQfH7/3eRQwxlTzSlbuXGu0d3PvAtVc1bN4"
-    "XpeNGSzzQ82i6vl4U6JiRcXxNt++e4PT1SlSOy7AqlCMrovNOVnM3MJUQbfeUY24odtRlepS"
-    "EFSZuZRm1TChwIepeVZEhvZNjyimq7JKqNJ1KZWozFhm1hvdMR+5kVHzGCgFouMDexcrh8rz"
-    "OMg0UYVkbLepUlW0Yed5zjnmnA1PlFs8JVmbKVkF6M7au/704+e///W//vw5H49HVqEI1hw2"
-    "pu2donbtYEdsh6lrzxJVtNUzoGTWfRtReRzHa69M9ghXUrKqulPqmiUkY++ozIK54Q5lsapa"
-    "ompmbnatSyAAonKYRCWhojbmwYyK1hQXBPMx3M0MJZZZEFtrEzDVzGwKwvEYIhJXTJfjcDN1"
-    "s1dtd1W1ClKkimPImK6qK6KSyjCTx/PxeD5i57k3+xX37XrrbmZexcy61r4iN3MX5zy+TWWV"
-    "xWutjOgoDlndQfMm0HXx0/Qbg0yqqjcu1Yp2MrEpFu9fV8I8RHZyvv34xw+/+o/FbF6SqyWl"
-    "AintJLfKXVGuvZQ2RaoZiMoQYe4Nq+btsqfELZ0VKdCtM5hF1JwOKVOkCQTX3jqninXia60F"
-    "UNSGqRCM7GsGI1WEld3Kah5zxFIzCFjl7lVVe1USMEp1TWe6u7DI5D3YeV2vXWXqESFqYrKu"
-    "GGNYb8taMaEWLEA8M9deY4zdhuSsBNyNVXNMJZtlw8brkCY6xzMj1bxjdCIbDZLMIqgOVUBE"
-    "zIdppRx2RFFdaoeqdaanoiDh3iVFClTU1rXdhppGbFcxH6IlAlJ6stUoEO07oHTeoCBAyTEP"
-    "lcp9ud+kDlEpdgKhTZ0Wxd/+/sf/9nf/9Mcfz9eSnTEino/5mBPkteJ5jKRE6Q5RN5+WJFJY"
-    "/eaQTKnC3ilSQIlZu7UyWSxTFaCAYFuahLDYuXcF6XMCEhGd+DGT4Wa9vI8cfcQg1SAqgI4x"
-    "o+T9/VyZWRTIHK5+ZwQorKq9uxSEHpW3ichUhyIznod+eI5Wrp/nycgS6G0VhwJU5N2BAmk6"
-    "+HgMHf661tqxVu3KqDQdEY0mKSAbl+BjJCojX9eKgqlnn1QLmXWjoIC+HJm7mWVEM3gb26Qq"
-    "XX1VSFbZcDHdEckSoYjmXhlij/nh06df/epXHz48TaVQlcGEihuccNPZqEoz0W/3i4g0pglU"
-    "gGw5ZkvGmQCFJeivFmhPEHHt01U7tdNjB4roMQlbSZfMLBW51vLp4kNBgrlWFBTSbfmVS1VF"
-    "ELHZzhcp0UG5FXhDfZhEFCOUdIGivyV7KSnBYicnRWyMK9YY3swnVR0ysnZm9LTC3d/MHlV5"
-    "rXfVoWoZd6qmUFIokzGOIhGZLTLROYY3oFHoqlSXWqVWPo09cEnrS4xCM6iiuJveEKmIHs8o"
-    "UBAxn0ZEL1QMJikiEEasHXE8fB4PtDSltolmlZu3X/o4DoGwjwYoRd5AnrYgCmKnUwQeJZ+/"
-    "nr/7w8//9oefv75qBXwWN0zTIEPV5yjRV2AnNqWCloAostmgYmoVee2Kvd+efhxHASVV16pC"
-    "QfpNF1EFjDFg9jp3RLr79INEdi6OHMPNpZF3rMzCcFfVzDI3g0MQxfdznyvZgntRqPftMWqr"
-    "kIXaufe3pwJ4HO5qFcGK5+GPo2P6jIzrjC4LAE5WRZr0N512rrVJ6UWNlPPa52t1bI+ASCog"
-    "jdYveFev77ilJWtlyi4fzqzr2tJ7CkAEpiIijU4X6SR9B4Oa9QBTMfTARljUHqCX3Mhtk8en"
-    "X/4f/5f/6w//8W/t8TyOuSIzUmnVGkcVSPbUs0eMACpLTStF0IScEmFlqIj5RDGDal79E7Yu"
-    "EOI62kN559RA9CcSagXkDXh4HFNM+nUc11ZYrcxMMlPZ/457b7NhYoVys03cZq5SZPZPIsK1"
-    "LmXtmymvRTKKZua69lYzhRgkM0itrGEzqskVoqrtkXgCHrHJ2rWy3Ez/PbqwskR8JYcSqj6m"
-    "QjMTKnIHqth/tapyl0nMwXktreKQUTeMK0RUUPde1FWgBWZyjAOwRjy2RKYfvcz06SoaGRbu"
-    "7kIVmcltPlfBfUIkCGvXnTZ2pC+T+Xg8V25C3E1EI/Dly/n7P/z5X3//x3MVbMTuE5etK7n3"
-    "x+fDx7gy196vKyJZBt2lOoZbMSkZmQD22n7YcTzGnFF5vl69GFczEmuFqJoY1XZyk+pD3U3t"
-    "ta7Y0QrVnrr3EsyG2xj9aRQXdZXSHXGuuFayFbjZo/FdWUSZaw/zh/nzOLIyKz88pw9f1yJr"
-    "Dh0mKvQxzisytppm4Y62V7krgUqoIotVNYaKeJa8fz5fZ1SyP/sd+BVAu5nHaqZJk4baa1OZ"
-    "Qz12tIOrdvDfqXmEEJXRj2QVtceMoDRWOartJpompk2oQVJUK8uHf/jhL/3te59vYt7liALc"
-    "PRMCDtddzNzknT0ky1QzWVnibO+KgEKpO5SlClm7RLXVL9XLwY5JMwlEhg8Xt/O6xniiJCth"
-    "HeCVYuYKJt1G7tx7j6G7UgkqIhZLq39rQDfP1axYFXS1RsDjbqQD2szAMn/sTO2bm1bDciR7"
-    "I0wKrli81aoSK0zdX69yF9EhNgBWZAuhKzdKH8cU0ExgLsMBCPZUxBLw8DmqNhGgiNMwq9q0"
-    "IS4KRVRAxaW37xB3olTagSQiFmSkqskmDxtTWHX5kCr29wgLJl6JQilJYZaoOZgVpaKgRGFY"
-    "KTjcV2yRND3O6xLXLLB2pRZ5rtfPX97fr1UqO4MES/aiH3Icw907754RXaIhJaI4hJR17Wun"
-    "uu9rqdt8PMTG2tfOuPaOwhW0zMfhPrQFu7HQwBGKaLG4SImUyLKB6aqm7uba7snMyJ76x8a6"
-    "znPnokT2ebEdd4hKQdvIRQQ+7DjG+doR8XzOD8/n+TprR69tdkJdK3CueF1BqKoXqaIFWVlZ"
-    "OXwkKyJBDlEyXq99XlybfXOCSkJMIezMEKka1asQ3Rk7szE6wfJbWy8GcUVXsAhRoHNFXb2R"
-    "Ehqbpe5i0rF2VTMDBIlhfjdP5qTZcz4MYImVMcLNhz/3a4tIQShRYlMOIreI+UgEmaIQ6R87"
-    "XTjM9+qMmRZlV6m5iEYVUdrbJPQguzAcLqIw0CUrLtIAmPmOAEwAxlIICmSpcXcsIhd3mRp8"
-    "JBmR4+GUMgWzAA1WRszHwaKgxrC8EhAfcwdL1MzEsCvgJgzUNXTuVSLyOB5X1Mrtc5o5icpy"
-    "iAhMdRyPj+/nS0dVsY+2PiZ6/6zeK5POfNv0CPQkXd1EhkhWbTMFDEmWmDnlJn0Ky0wKEhl9"
-    "lx7zOM+TAnNfkVpUGLCDa7iyNDPUrBW+crfJTFBVMeZU1Yw8hvddRWyWVDKxY7itrIgQE0Ul"
-    "rbIETsh17T/+8afzjIZK2xBUHcfxfHpzRK5rn5EiBqncCQeJvWOvU4VjuqSw7JhT3b6+3qsS"
-    "qJ7E3Ijyqr3RIGTvvHtSlcnIlPPce5e6qrfrVCLYcerIBOHmEN1xfb1iF1aS1CIKTUrlcB1u"
-    "blpVxzx8jPfztfb24Y/nY+94nRdFiuTmitpFCNdKqsYuYRg0r6XakCfsCIVW0b/NhNu3rr3Y"
-    "NBXTAsDsN2dHvkxkeH9Z143DITDMbEA1Yt8o8/tuV67qClcXQCkOeaqIiFFdzUQPgFVmAwTn"
-    "LECEakZxMf+rXcff/93+13/Dx0+PX/widKo+zI84Dtp0nZgPuGiWVtFVyb022Sfozb1s2I5t"
-    "wzNw7oAYYG2ubCJCRba6w/R+wZkYqXuF6oD62vk4DpisvKdyQ00oUVvAyNyRb89HxxOKob1N"
-    "Nqy1SmFD3AVCdT3GbMyFur1fF1QY7B54EWM6Xb++TjUhco4hWW66d+x1zeMBRyArQghm+Zgj"
-    "ChBd++r3Yi/B7Ba4ap/9eyKhJuZWTDvm2nnnNACD+pgqaJmi6cyEq4hgZ6i2W7TUrJMa53US"
-    "SULEm06uJYpVuQIu5mpHb88a7xXRI7tviP7KDiEO00RBVN1ihw9lUVSPOc99FjVLCBXqTz+/"
-    "/uEff/uHP/x0bZiNtzdZO5BQo7kUeO2ITBXLYhaSggJ2sfZw+mP0r9jUKvPz5y9AHMeYcyrk"
-    "3C9VVciO6pFvNXmkgWNmIN7P2LvMjMJIRuz+HKjQVMYwV71WZuXrypWyC8VO/IKkCYfJxw+H"
-    "K/feOszc18739xBiPjQqv355RUBdM6uKarIqcN8Jb2yEaBtROhokLbe/ezbswVaNaR3/U/X6"
-    "NjIUEwpbZpRFnOEimjrvilVJlVcdZm/uzBqSD5UPlGfJBIbd8fVBTHXrMiWBWwpflcTe7WTJ"
-    "HlFGJVJj8e/+HzTTMXA8zsdjH9/n8Z19/O75w1/k2w/Xp7/N735pv/zFMtvqD6oUh8reX3Ze"
-    "Y4iIx75QXDvUn+5HFf69Z6Ii3SohbnWTmrH6e7WiOKap2tvb0SYJ+zaTD2KqX9flPtyGqFVF"
-    "5lb1ygCZ/cCoZuY4tLm2KsO8vTNRUZklFB9+nmd/uphJ5MN15zZXFvd5HvNZKhHL5jCVymqp"
-    "5c7wqHBxVSuo9qSXBW4RZKwS6y6BiKLoY2RcCzmm24B4uY3czH7HEHPOjKi63J2VYjVmE5IK"
-    "Io0gZXGMuWMJhUVz23f2j8MONSugF7x9XSkSFLdhxmu/Oud4j9kqVEH0/UU2A7F8frjO06ZA"
-    "lWYp9vnH9Xd//5t/+dc/ZpmP/saVtUMgFBa4mIwqYldPme7iwVArpM2HmlWkmYvKl9cVGe4y"
-    "1caca29VZWVC394eouxjgUApVJVI7is6AUJS1ToV0SkeEQnIusJVTbVKrmD0bksAFsjp+PA2"
-    "n4/pJrFWI2m/vp+vc+/gcDG3b51466f3PnVDAGozEpQk9s7+Urhpj2QKFVKZfgy9+fiyYwtQ"
-    "aKdvfQsvsgAkkYDE6sU+yqUO1w+OXyg+ZDxWfUz9oHCzqk7gdK80hFBiFDc3RNVHZrIWfbhb"
-    "x/rd1KBNLjDRYqzr5aY4UV881JO/0flRfMp8E/9gH/7j8Yu/2R8+vf3qL/iLX12fPs2P3y9F"
-    "SQ4HYqNCMlxnJGsv6CiKufnQe3dTtwdUad03UbNYQUhz8KDRJo2MGGY70obX3lds8yGiYpqt"
-    "ijCLyDEmCVfdVSSf8yHQ2ukuOr2KoKhYobIVUkkzb1j8vpa4mjfN5roZlNyiNoeriapA/PCh"
-    "JVJ0tu+H9GHnWhBnyTGn1DaTMQ2Vc3rbx01UzZhRGWM89OGxy9yYNVy7Km1urRO9CZSdVZBu"
-    "YwnlDhIO89glZO2AgFLuBzJ3hk1xGQ2njmzxoe0dhDSzrk/UEVES8/CMLW4QRG037tiEKK0y"
-    "MnBt/vTzl59++rp2EaMdtmsvNA1EPTKFJT00YKgZpXBnwsqH2+iYMSr33rHuiALmPCi6M7s2"
-    "EETeB2mK2l65M0U1s1TUDW2lJyXvfKFCbMfeK91U+uldfSHtcW+q4nHopw/z8TzAuq7lPtz9"
-    "85evr3PvBAU+VCArsuXJnVi8LfJ3ueJbwKjdTX0TVeE3NxfAOcZwTyYEsVN6KcpIQF3dVbL2"
-    "RgeUTGWqvUk9IZ8gH2EfaJ92Hrc7qg5vsnyW9i1YKuE2I7MEW0T1EFHgFr6hoGYlVHUzDQLQ"
-    "HTRRAo9DTdXMzp0wJ6e5kTtfP228H+fP9YdfP8eDHx/84Yf8xd/mL/86Pv4iVD+8PcrRhFAl"
-    "zS0KmwUCWZ0pEcpQyz4CdMJZJckSdiuzj7iiM6tFK2yJTqcuh4+1dmQkkwKWqDowzHRnjDG1"
-    "/9Qtc/hhR1BUTMwqYke4u5L72moGaEYCNXxUNiHgTiJ3nuL5PIKMtUpQkQpMG96FltgXQdNR"
-    "yWF9CBmsZIoPK5aJDjUVTnM13VQdzky97b5TKgymJlGrYaJZRciOUBXFkM4yZml7JaxEDYWH"
-    "696niAoTSmYxEOyMXZVg+GGiEImMzFCV4/Dik4DoPvcS2VJrDjMxFsTkDnGrJPP9ff/Lb3//"
-    "45eLPDIyk5s7IiHwnnkmvbUtgpVKoRo1IQImTXRfq4qxmSg382NU5jzG2ue1ymzszFUU8Dov"
-    "u98k2LsiaV49cLopfKo7qaZQVKKyIlGF6GEDuHbPHgHBdJtWHx7y8XCQr/Naa9eUiP3aOwgY"
-    "DPBhScSmmWVmkeJ9LGHdQa+6d8zgjXHseFRHh7V8uJrvYGTtnQBNZScgpigHZUeGlujMGi6/"
-    "PMbfpH3PONRGclQ3jMrU1DwlgJI7uNr8EppShN3977Qxup0HFKGm1bUBJSqVKTrGOColmabW"
-    "Tf0xB6BWJgDUaWoU8DKuXO/ys9r1+8fv/2Ecn76fHzjfcDzjh/+AT9/lp+/i+UHnAR45BmPJ"
-    "DjkeKtzX+2MeUANsRYjAXc919XF32kH1BAFZewtFTTKT6ECIRkZxgzVEyjyonfZl7mLJrrql"
-    "UKjaIpfK0ZzrjATJat8X+h6ekY/H002uvZB8e8ww6ZBk+2Wyz0/FoWKVLnRYQ9bn1/NVGZE5"
-    "TJPZOA9tAHflmLM3OkpO/xZwUVSWufZuNqNkSOdFVCQjxcyHA4wIg5DlrhF1NyKoK65hY0yt"
-    "ZFWI6PC51uq9tZuZNa+Qwrq/CBQutlY24kjg6lW5MjZVjnEQMueIXOfaa9mff/zy29/96ct7"
-    "rosk4UxREdsRrHIrMaEoC9feUYTqY7ob94osZqYU1BxWrn4cMyOwpSDXFWP6Tq5dTXuF0Al3"
-    "7ZBzP7LTfV1LrP9quXeoGQrNV+2uf0HOtVUtu3ACUdBYh+LDnNPs6+u8ztWZv9e110afhOfT"
-    "zGzvHclhqG+MxvYttgWx8xJkNZyEtzgLAmi16k6S1b2oLAZRKAqUCSKjvdX1H6T+k9svoMfi"
-    "R8lRKoUEElkU914CljY7HxSKqfKbNZKiWd2XKrHBzJZjNGxuuCYpUiqeQBVuwke3xxWZ2Vrp"
-    "zHJBstMT4m636FmLVc7CTy+Guj3gs37/L/z4ob7/5fnDX9cPv7qO7x7+ydzlcM0yyqGPzKq6"
-    "ghu40eamUj2ssqrKXaXDTF1Fr7VteDslcgcqqxLCc8ewJ1R3n3zUWSVQpTAxXR0wIOomEoCl"
-    "QI9LzKRv6Wo6D9uVu3K4ZaSqs7qeoQwqNHOromLXXkX68ZhikqtctKDjUBMwCiyzu3LVF1Ez"
-    "PezQShDTPVkKM9VhLoyh2v+2c3pUVV8szFLauKluxtq8SU5wHwTHsKhlfUUrEBTROR/gHmYs"
-    "mPV/v0j2Ws1EYy2lDlcXdg5hjAlsEd3BZvFkolLPM3/7uy+fv+b7e56LbmqqV946lBJZlWpj"
-    "Ze0dRRF3KajEdJjY2mxARzB66cVr9yl5t1Qpbe+dybUpEFGaCO5ORvm0MR8ZQSihESyWuTcY"
-    "HPcttGkMTEo/9uA91naVj4/xmNbX4aKYeSQjOl3c11itYuwEUWQRbk0Sh6p0QsvMcgdaTa5t"
-    "ppC6Z2My3AleKzJriBa1qtRVULolAAN+Zfgrtb+O+l7NyEK4qIlIH00VYtoE3HbciEgrzlk3"
-    "U0mrCmSVuymJ4jFG9G9GJGOlqJl1HUqgrkZSRdy0e0IKQSUKaHC2iiBJRmjnPTt7RB0smFqB"
-    "UmE/fcYX4k//wse/XccPn/7ir17f/+X16bv5fB7Pj1flcB2uhVr7DGn1USdeBMzcW4aoorIo"
-    "EozMHHOoWEn2t08L7KiuQ7NERV0ts8wgFBQrS7KUrLXgIg4RDre1V+bFyjFceqBrg8xdIW7m"
-    "Q4TtVHCbIrb3Fh/ndT0f/pjeK2Qnsqoicq8NE1GpCBSPx6M9SXvX4zhErAgHVEw796jW2EtU"
-    "tvTMhhGalQWIqPuI2jRUJVRXhN178AnTrKwKNSFk5T58qiCTUHEboJKpqqw7BqAifdEHS9Vg"
-    "BVmsbw1Uqe4gRlpX2osuqu+vz7//4+evZ63UqIAi4n4mu9aI6BZQVglhCrjJMedaS0TMLDL6"
-    "a8VMcmcwVKWTzFE7qvrRKlJIVww3N8sdYm3czGsFiqqyIxo6CCCiMkEYwVgh+q1XR3YKzRTP"
-    "w911x4pkFsbwVXZdvc0U3oOoypIifVgzsNjJLt4gZFJuuDTQHEb99qrsXW5mtfC+H4gsinBS"
-    "WIiJ/1Dyf6D9R/ItMqBlTOFR5pStVNIEU61rgyS+7UVVpWunLPYLkqx8zKPZriQzog9uXbmD"
-    "4tpLYcO9OuJTBBSg91wwymw6hEi/OZMBpdDuAV3RXC2EUJjt2N2hsMTx/vX5iuQf68d/9u9+"
-    "+G58qk+/+NMPv7BPfynPZw4/RWQ+BrYImPENzKAFznl0AFbHMLNDnYXYoe5nvEuGaruL89pL"
-    "7dFKemvKeqW7Z0XEds6MKGhCx5wqcMNGJoMlmVuEKzcoYxwUWfsCq3sjz7dpYwC228qtQqb6"
-    "ARHPvcfxLLPIdPO1txYPH5Elw1x9jNn4ryrCRARVFCQKm5zjYEFIISiMbMOoRNZ0EaoodYx9"
-    "hbmJ5s4CVGRErYg91MREdXSgt9ncne9jJTKniZtNn1VRla4iIivWnCqiuxYoh04ghRJZZg+Y"
-    "QAzQr1++/vHPP58XX69MmAyD9hBPUExGRGb/oqPaHf04vNuhgJrbtVafcsfwzBZq6d7RfLwo"
-    "WlUDSs0EyTFsDLsvKqLndZHCAgq5ogo27j92JxvQw3uBUfeKDDcDdA4dQ8Uki1VZ0Chcq+fZ"
-    "d7yne9Urove399KdENOO73R3r2fdXQYy06pqk6SqJCkZd1wSGswCBjCT35n/p8IPyk/Mh4iK"
-    "D5F/H5+EyoAhO6le2VYb6W2ydc3jTlyLiiIr3Rw3NyJEVGxUliiGaUmPclmULPZqWgARsGqY"
-    "3MvwVs+KotLMbGhUtGOpkAJKRdZWG7kXUgemmCelVA0lWHnmfH2dx4zPn/7DH34h8x/q49v1"
-    "3Xd4e9bHD/XpFzDfGTamJCrCTFElZm6WZKwogqZmfp2nND+qYcA+gn7tRFOUWdG91IqSUteo"
-    "qLjEhoi0gvw8X7HXGN5lTSB25hgTWUpEpaq6ORyqcu4l/ihRCq59RT2ISsKnTRIJmI/Kdcyh"
-    "rgJNlor5mALLKHW/F/EatU/YgOhQZZCkKty0Wc0lcHe1BHLqSO7Y17AhKioP1ZXciYSIj0OQ"
-    "qhoJqii8qlZGg44gU4pJUekPBCCRADC8TxfYWXnYIHZlkk42acd2ckdcV335ut9fJymU7jM7"
-    "BHsHVPcGqz8MyKQqjtm2GBfVQlZsMVVUZmVXupmgRiFJNbhKFTJTharA1L79RtySAhXrskuB"
-    "1XQ1kYxiUqDkndrDv9vjG5whGCLDYAYRZVkqK7C7CU3mHcBjR5crC4XseyaqUG1e7AdApBf+"
-    "hMCHN0u1rNGmoNASBtnAJg6xXwK/UvyF4Jfg9/ePxG97OypRKrxxCwT7uDP624RZzSTRziUz"
-    "VFRE8/6fpS/9FJ3m/UdnUQ0CNRkKK3a9rVSsMsF4DI+I7lpVhall/zYj1OFk5up5I4gKZkFZ"
-    "lTXsIUQFQancUfp4PP1Ohiu//DjwM5Xx23x+9918fsLxJm/fff3hL37+/hfXfEwfkFGmyRoY"
-    "q1JVEn26fJLCKhchSzpmCqjqMX2dsZXGTo2iKnp4WUUpVKarmNLc3xU6564c5iK29j6mV63K"
-    "ltwTpos5yKSreyDdx7ll2EwgQLr4tffxnBQRPxQmKkkIpISuVrHVpQO0QGNu6G7ug5DMdHfX"
-    "oZKZOyLm44jKa13qTpY1BIzd8ChARFQNVWXuBsu4RMzMFYk0FU3G3vtxPHr/ZK5E7aSNdtjR"
-    "dBoJpXl7EqPC5ngARkgGYZVVa++vr/Onn7+c1xV9Y4TsKCjr25yINyqltdMABKo7a/rhalF5"
-    "g86BzieaWUSZiqjMw6Vy76qiqRyPWYJYy20AChRQ0oXYQlfYOgeemY1G6RksAVVU4V7O3q/M"
-    "m3C3M68Ioq5gURupIbfGGgooQZEomPW1jX1d7EaAu2cGwGEdq5LFNJFRUoRRQUZVGh/EX2j9"
-    "lcj/VOMXq8QyB1o4IEwTRbGk1Ay86+8R2RUZM4UwQRFUpAiK7a9XQCISUOvUMaHWXwXdnZM7"
-    "/GOy1xKoqzbOvvXXvai2b7839rdR94gy+rVP0Z5oNC3ohjOrFRelMtJ8AALkugqiQST6+EMZ"
-    "krnlx6t++nGON6U9P/7C/upvXs83zhlvH/j2C7z9cHrVp2EqqkM2be+DcJuxTpQW6jmPIkps"
-    "V/vOwkyH6a4QkazMwnw8S2TvrWvt1JU51VeUANcVKirUihYJsZG0jzGr6lrXjvAxfXqiRKDm"
-    "Xf1fa7vPmaSMgeTeRRGIZsVwrZsJi3G8uX1TSanOMbJSzcR0xwZkx+Vanc+LTJ2ubrVRAVUc"
-    "Y0p1d6QUpqrE7lWk2dg7CRxzxJWoVDed41prmhdrrVSnqlYCqqq49nqY9besma+MoVrUzBLT"
-    "G70EL9rnL9fnLxdU3TXAHinDxUwzma1DEBnfPJf9/VKVkQltBk3tRreLUfoFIsPxeBw+/Tqv"
-    "vDJTfLgNX+drTO+SlxJZcq32PNNEmobXZ1/28h2U9r7d1GW6mbD9xoDIuXbEBrGzCpZEsnu8"
-    "1dtbH4omTXQgZG9TqNo92b7ZHeiMpItmBIvKe9xTkk4Zio9i/9nlf05M0jTygJs9C0zeh8Qs"
-    "ESGk4o7ftV4pBd2KbcCKiWZmr1cVKtTMUjVVAwnKMCtk9yEEYqrmKmaRWaSZ7B1igEpkmQiI"
-    "3OkmECVUBVk7dwwHK1o20KJuEVFY29ip2BlUqdqmj73D0DW7bTaYbEkAqxR2GJiXIqM/HPsa"
-    "P/9pDB8fnzkf1/NXr+/+9vr+h9gfjrc3+NvrjA2O49hxuXW3qbRE1DouPkSLUbnsmI0WdpMk"
-    "166SjAoVHeNQE1aiiikKZxFUEm42n8e+lqnta7m7Px8761zrGMcVO/ZWgfibqXGHqwwRB9pi"
-    "P1YsSJlhjKFSw9Tt2JFVGO7zeArqWtcYWlU6ZeionWMMAdSMkGPMUgN0jimUiBfjzFiReRxH"
-    "EWuvqFQfyBKUqUJGVbmOiFJItTMKzW1viVfzdCRzq0gPwI5jrFU7XcxyFdlU3UwSZT//fP3h"
-    "jz9H3m8eBu+JTlTsFDMxNZNqLOC3cc5u4DpQYCSjSkwIicj2Ys6hj8cc0ypiZyXR/7nWVut+"
-    "iagqElnNn79zFG6q2ky2b9kK3NcniBLZ7TAl3NRUKnOvO5shgEBZdVs0+t3bv5AIBgFk1TCd"
-    "Pro8yGLD01WobmCxKJSDomSiXDCAp/F/xvxPpW8RxjSoQWhyX1nktmqIajUcinccSxTDJ4Tm"
-    "tvc2cVax0vpBsk7B0DoRLJ4VAHZEMXxoZk4fYO0VEBUzMNcVd9BlV8NbKCxKVIhM9IG4Yrro"
-    "LYXSIirT3EUlg2wjV6E/RaiCRB+CUMvU2sSrqmQKKBGRBVVqd05Eayner31daWqO+qfDf+Mf"
-    "f5XffV/ffcgxvvv4aX/3y62YyqmWrXSaajrO872Iil2VOjT2pSolklFV+spzPj5CRBXFmDai"
-    "7wJ0hUZlyw2qql25kVmV13nJNIr5HLF2FafZMQYLOzHn0zMoRxcPE8BQT/QpKKeZdlzGXNVs"
-    "+Nqhbs/5ADJzKVUbIWeSWcWooo8ptEpRs4wtlYKE1PSBGx8GgsMMKXunuYpmJmKFoavYMaZn"
-    "1hheGeoOhqpl7oocw0ABtAnEouP9Je5z7Xz9/CoGwNd7/e73f/rDH3/cgaiCuKru7nBVA/TA"
-    "rG+Rb5o5yb3v2n4lGl4PExWNXTfM6c6+dzO5H+pmMuc8DhVUhrJx57E3+l7k7YC7adlgoVg9"
-    "4ekjQDXwXkBKVimhrihJ0Ez3TgDJqjaOAy4CfNtVkSqSSd4t+RtIiTu5AUIyuiUkzRUEeZh8"
-    "Uvsrsf9c8n3ElF0Ks5ksLQzVRL9pLSOkkdZFVSnStddU0qoKZiuWcOM1sqBkQXpnBUjTNghV"
-    "yT5gV92qLrOeL0O6zt4ja4weyjeqQcTGI3f/ywZysYjWamfTiayNh1mpal3lFVMkFZq1hTet"
-    "PPbl84CwckMI1Gp4Swjg6kW9Vm72heRlpafg/W281vXb8+fHcxwwkV/85edPfxs//LUdTwyX"
-    "x2M/nlHEdSFZGUAAqTrunyeKfdawISrDHQJ3XfvswK0o4gq/cehLKdkuBDMqXPxa72pTCVB8"
-    "TNF9HIe6dRLBjRKrpaDVkeTjIaZQWiaQoQfVLCI0CbG+bEw3yJQywgWMpMosJlo3E6nqhU0u"
-    "c2ZwDiuIwCJSxT6MwaxrVZUarNap46D1eqflzJdCqVCt2C/79tyQ2JEi5vK83l9FZNX7eidx"
-    "rvjp8+u1Myqv99fnz193cEVF8/khEBQ2+7NShNQcpvCeUzEBoKAAKtJch0gJMxEwsMwwVFTY"
-    "fpCisFCkukB0r3QtAMFMNqBDAKhQkBTCbnlKJy5xS3wEoAjllhU1Z04Arao5jUVRWVFFSeHd"
-    "MP9WgEL1i5Yi0sOUxTAatY/oAMBkj+6FHFFPlUPsB9e/Evkb6MfM0Kbd0YQOpbZcECyqRLEM"
-    "RrnnWEMFgJlmizBEUEBClKYChXjv/LTHbarWP2KzOc3k24yKTSwAtCpNaSomo5vdhcpIClTd"
-    "1PZKwEQkmTYVuavliuZS9NkVP/aCGSQLO0NdILSSIgu7/5UyFk2TpaZtWpAqUBObWRJKpLgW"
-    "KvYyO8zldb6rx9gvOx5RiNe72e+Pj78+P/zy9fE7+/C9fPwhfviLmEedJAOjFMTetbb6tP5n"
-    "iPiAmdrwIsAcbtf75g5XpFoLc485Mi5V2zur0P2PAZ3DgYSk6/E6Y1a6HiDMzDMwjpHrBOhu"
-    "jFWxxhz6TXoWsUx9uLvhlhfDd5dzuyptAmww7R6RO5hmXrlzn2ZqbhAgMxMG8entwkWVyDAf"
-    "ldoYaVOBqhOVW5hZ21ytayxVrS6NXUS97zNWnFdc19dzvb/Oda74+et6rYzaIIXSW1YXoypZ"
-    "BlGRVBRhZjaGm/Y8ZW+24iiqdYqqENy3TYNEsVASLBWstdWsbsSJZElGqrCqhusx59fX6liB"
-    "4t/fTJD+f/S99F733K/KRgr1aKdHUDeptLsWvHErXU7EfYj+tnHqkId8a3eqVqamKO/BGImh"
-    "MpCfiL+y+bHig9mT+Ch8ZvsvxET/f1T9a7ttWVKcCZq5j7n2ORF5g+SSgCBBqJ4qSegCqurq"
-    "p///X+mqEhKQZFzO3msOd+sP5mOdaMQHPcGJE3uvNecYfjF7LShbZ71wMpqzAQZLncG8Yiwt"
-    "u8z1cXJxRFRtQrVvIjKSRJKM2L5hjAqjk7FA8rqu3jessHPF08Vm917X4+wRAbHNr++diWBu"
-    "FdRrhRq+cgvUNpMEQkVkIA2Xr10moKzrzYpOodU0Og/VklZkbRAwa5GpFSGCwO4d1wNOEruf"
-    "jLyfH1Ln/eWK39f3//jN9fPr88/fvvlWa318/uWP3/7m+c0v+g9//tFxXZ83Kh+XwXyruq/H"
-    "Wo/r8VbA44qC7ioFkETEFdFgZu6Pj0AIASaTkfH8+NHp2KS6ddd9P5/3x8XrmbE6YiUC3ai9"
-    "nzfEFcpA193a33z6vB4L+qJ6X+tTrpXRLW6ltNZadz0jGUJAIt7WYz8LEepGdHA/LsuB2ELd"
-    "JSnXY+8NNPr+9Pa58Lgb4IrqZLw/39e18rpS4fwbqvZdBFbGjz/+GAySPz67Kr+8v++9f/zh"
-    "rq4v7+8/vu8fnvVsgxbDeJoq+6A6SV4J5NMhi7shYSnTAs/rvv1zdkbkWq1ORMajqtHtYWkH"
-    "GEtAMJ/72SiDpfwqGg70saskN8aUbMUxl8Ia0gOhRJA9wg3DZJRJo6Ra6sa920mTtElogjpj"
-    "kOgxh0PMaNb7EqFJsEuicsUK/JHwF8pfS79oIOK69/KmnHEFCIYryCqT5TxeUkvOg6WDIMAg"
-    "SiGgOjOd/1WFlRlOlbOBSqraIJcxserMKI8EZm+qXOu+q3vnWozwT5+ZTjOwPifzElC1B6a5"
-    "kAqQ+/6QIFwlMZczDHbtWGvvOymbXryAfHvLyKjaM1BB3nuPTb313B8rFyQ5wsaW967I67Gy"
-    "ddddRHbdqK37/WW6fKxH3//K+7v1ZT3vj09vP398/r+f18/4y19++fRt/8EfP3/2mZ8/XT/7"
-    "5VNoMqDae398QaZuMQPo9y/vKvAt0cpMVXXdAKqk4N773vXp7cKuYJhAIdWDV4CWWApY16NX"
-    "VODO6H0XYpmdlVg+CB8rEyJ2EPvZ6/qGZHBDG4zruu77I52yB4pRe9e+ATwukHHXDcRaj7iu"
-    "+zZpXBEZWojoDSFn3RKl0O7dN1YggqTquaubqo967l2tqNIt3Xc28az7ruf7+/O+q0Eh3z/2"
-    "WrGrSWn2DNEqJCXdu+7qbjDi+azL4cNAdTECgSuTpJPvwFTX/XyuAfC3CFNpYi3spzCUVNv0"
-    "Hp+uau37NgLel2UEEAHi+dzdTdILNYsEd3ehiaiyYtVyLLrGf94dIYQNLbYo9fDrzuvs6Oqx"
-    "/LWdC7ylhH6V/FXw18o/bfwKKnVzL0QEm6LxtFD48fJph/kRLId8FRAJugSFesrx3s4B32fI"
-    "Nv9GyI8C2t8Bq7eYYd2jBIRzdta6unvvI8A8vTHQScRaHtU1hGREfHy8R7giIIRdm3G1VL1j"
-    "hXdFBHZLrRCuFQ5kbA2SugsRaznSiZHX6q1SrXU9n/d6XOhGay1vxarVxAPVieBouh2Kc72r"
-    "0c9AqPbKZr/vL/8Xf8i3f73W519+9/t/zJ/9Bp8/4w8+7rdv9+dvPmFjRSGtUIqWVBfItVC9"
-    "qzPR91O9mSsC2D2KXdxJ7H1nXrvvdWXmWnmpFELvyv/y7/5wpZw3CjLXuu8PCyFbQvRjKVAZ"
-    "NLPHpsCMHbiDV6tXEtpQVdfE0QVXglEkugQ5LrDk8OOw3B1SVEcgXFvSK0Z1rothPe3ezxtN"
-    "Ynftj48nxPve976rsbs+nl+eH88uxbqeu7//srdQpVKTQaYDmhhqasT0rYjsxsS0moWu3lUM"
-    "2j7lO/B5bwErI9L3ywxp3ETv7YlyVNOroHHN+rJt3O0314p8H1wjqwCRMD7J6c6zAbb/12Tw"
-    "bsMxbPtHtbl9cyFnpq/llliK4U4BYkCfr/zTT4+/Jf+26k+Ez+xmIfiG9Ym5kkSt1qNQ7PkL"
-    "I4yXnkBuS9bsQ8T85Je/ezntKYb1DBmyeTBwGCN3d6sV1NGMWRLf3Xaq2fboI2lKDDWDM/YD"
-    "21eMdHdLJdV9b3sl2wQysqHM2LUzTTJWMFdeln+l15yBy8iVba90qxHXte1+m+ppVohQb+2S"
-    "vErAlLnY+3ZpGYFrkdrCXlKyS3t1fMJqbe6Pb1p4//jmx3/+9M//4/Gv/7Lef1gfX561Aa71"
-    "VtWL+ZYX1SuTiESKARXVUF/XtU86DVq9m8HuEDLXApTXYz0enhHu3fmf//qv1ooffvy+WowH"
-    "kiIQeFxJ6PqUALtukMnPUmRmguwA1m5SCCizgpsKdaq5HpZ+xC6RXHlVYVcL/Xi7ulric2Ot"
-    "K9fllk7k1p0JBvdd3ZtVWbVWit31fH48mdnd975LkHbdH5ag7cJd8eN7vd+q8xwTYVZeqY0U"
-    "g6KL4SVwy7wNW93XWmAUrJMIAYJy8fO3j6QVfBWW1ye4WFI1u1GzdfKix42fI6xe1xiDCfrr"
-    "kINliGAas2nDkgiyqT4FtaNBJmcILbjhtPnBruzdpRZ1KFMkgG+Dv135byP/bfevdl0BB8Fc"
-    "sa7mArJLXct8DShX+DI2sTkwqK2I2KU0/52epjAwapSVuRCqCgDqx2UdzHgmRQhNiFYn0Cdo"
-    "qeTU6FYh5LywNBzYc7hFJmcn3zKzslSIArV7M4mMBiVd18MVzckdsyKQoT5ZPFC0+bBBhtcI"
-    "kcELHkur2tLvSKCh28m1UmSuVqMQCH8nexeqJr9KIBRbZCG0qzPzrg4Fa0HI+/1RO95/iC//"
-    "+un3//iL3/1fn7/7J3z3/vjh+2/vH7EVny6V+ub7l5srCd77GV2q5113JoKxb2WszKuFbsS6"
-    "rrdPpXZ6m2LO3fy7v/rjx1vWfgoEE8FujVchGBGOr/n06dOKT8wTuhW6rkU9IpR5U2LTSimS"
-    "uVxulEehXbXWcjF2q8Hr7nQI+66+azea0ZFay7VaZzLnia5W194f+wZzt8q8wnYKyVWFH579"
-    "3Q8fX7a2uNuFMzLDmMi9m8yWLAyKiD08GYrIjGs5W5hktmtViYRjl2sXwbUWifvescLerF3N"
-    "AxryPCkzTHislibu2wtbb0nkG96DK5yuda2507xJOk2iyCyhpzA92g8hM5TsqmhGIZz7R1zU"
-    "bxb/NtffIn+pfqgYwooHGI2LmSKF9BSBzEwPtYfuemZr9HbK9p7DXr9WQsbuzASt7ZmK8LLY"
-    "Kd4k06+yqxSSadFYeNMOUp6VEv6Hxnq71cd8XG5hLB3BXcVIWm5vQG3mfENkt2pvENe1qvtM"
-    "XuFkk2CstSQFQ+BYtf2b9SawVQxmhm/4806kU9ONN1l5VVdGRBQTQpV2BMAlshvWb1d17W2w"
-    "elV/fNw2lNx7qzf/9X+uH7775vt/+vzdP719/x2++/53rS91fYoHH0LdUq+guiPy20+fAuv9"
-    "4xZ5fXrLlV8+ntfj8fj0GZkN5Mrr7bHeHsXOf/hf/8Id/Mfz9qywW91csdZa1/L5yyuS+ZDy"
-    "bT38Dgu61oV4Bz+uRbTWtQDuGrnlx/PdTitaGCTV3tXaCsZb+ssL3PvJQKT2fncFeq0FNFRV"
-    "H901s1RGFa7rbe/a9127yet568tHffdlf/9RH4W70LJcFblSwu620stOCef0zAtsyoPNbd37"
-    "bkMwLKUiuU/fmZHreOUR0Y2Watsx6utFDeUVPuwHUT2o8YwAqIh5z0c4FYwYbJjvr8ldI9ZK"
-    "BEuoatcmtAhzMrYJNZuhGXJ/hv6E8dvI3wZ/A1xJdVH4jPwGuSICCJiySNsMPfXyl0inooPh"
-    "2OL56Po16o7wGw6X7B6RaLSQikyH1YlyrpejXiSsa4lqMCPVjQhErMzuLjVPXLikzOUUOP++"
-    "tXdGMOK5bwQj0klorkpyZYSZjJLkiEYGQWmXtRDbelWodg3ICZTGFt8DJtHd1SMtb4KMCYhh"
-    "cOXSEbiiFcPRNbvSi0CeXQJ7d9e2tTU8Q52YNE/oauuJel/39/j4oX/8/vrdP/7sy++5P+6g"
-    "di4mBHTn3qH+5vFGGCWNTFbt63EpokA5DS/i7fMnJYvKf/j3f0Xxy/uHn2mnTqxcQdZ+ErjW"
-    "I4R1LcQl9SNzkYR8LDY2UyvSfYmETEo35FSo6G4i1FTdEQpiZVDdu6XadftpZ1ib1491ZSbU"
-    "XTemZpO1S2RA8fH+0aIU78/+4cf9r989v3u/P0ofRQudS1oZ17Uk+S0jGel4l0ETOzmgD18m"
-    "I6zCt9KxT4Sl69kRGFDMBODAVMYBALaaiKQjcBzoblgZgbVCh1zpE2LuX7i5iBNMwThsCvdi"
-    "Pi4yHfp5gpEYaWMnCPVn6peLf7HWbyP/DfgzKdWxO8X0TQWxO0m0/3OpKlW7DFiZjQ6EUz8A"
-    "OPEEh2Ovlzq75WldMF76TEy7nAxLBHJ4YgwBjUbAva6PjpqkRoGK4AqLopGRzvWMYKwJIo1c"
-    "d5f/KlpAcjmXltVipNsMRgSXg5d5PlVOIlSOQBYeEVCkWi7RuPLUZXTGBRlARix3/q5TIkJN"
-    "tSKiOdr1at1e9Hu02aPSWcuKUQWd49lkSRu6I68Q1NwfN5/vn/TdH3z3L/H9P318+eGbL6r7"
-    "R0YxxOStuppb0LoUmcG9b9NImBex4rpipYgOYCH/07/9Teb1fO6P+wZxXZNYe0V+elwBXOsK"
-    "TNjHevQjjU2QohtUXLui774yzYIz9UzaZO+9I3Ll48cf39Vb2hF1JdH36BUc0KgWcV1X25Nu"
-    "sEPSj0uQ1H5+fNSu+75//PH9LtzV333//rvv7r2xwbvUXBJ9kVoFNO0kOyJLE+Ms68UAu2k0"
-    "u9Rai5njFXd0k/0GnsWuKyJYGIT+unK3JEe3uPXzVB4DOhyTin2JlOvquU2DJjWMWqojwyMg"
-    "C9mrunpKWsPu24UBkWOIAKRvyD/L+KvM3xC/oIANKsRMXcE3cqWCHWf8lhFdZeOiZ0WYZpVV"
-    "1dWMgJ9pIHNlXi5UJWTQ0UHzE3ava3kSXt13CRGGZjDC9zCTdh+Y3QfM+h3kRP/NYenXDg5k"
-    "BnHXXpEjhImcgj147+3v67nrGDbZrS4fGVNWp1lfhrdRvX34sucGjkJX1y61YpqW8Ct6dcP/"
-    "LgQdHpCnniRKz3VRKC6u9DwPmXmtNXvm3o5lqvFjb6Lu+71RrYqIZor9iOfz44d7Q+/78/c/"
-    "fPr9//Pt7/7x8eV7ftz7yZWfH4/HU+jrqtbKWMZVrtXI3axWqa+3x+Pz42Pf+Q//7q9M/d/7"
-    "GYFkGnV3AUtcGSuR7Ai7bJvdyTBTF2qiE1hEyr0ug82oXMVk4NLd/bwTF1AmfFBkB1pBUUIR"
-    "CMe0G4Gr3fu+H9ebk+tuR/Td+Hj/qOpWvt+9Gz/8eN/FLXamwC4993z+j4wIrZzwjm7shuVN"
-    "2wNGeeKqBRB8PNbj8bifuwoevCgAUM0Mff68gn5Zg6DDSqt7a1y3C5FgUwCuDDJUgLqGCzNU"
-    "Xht3qo01QhCZbmCT3gk3qr2OdkL6SEEcJLikbBt98i8Qf0v8BfEHEQkt4QFewiPjzXTpI34M"
-    "KsBgml9wrZxdlaWh7XME8qqPmenmpugCphSZRJSwN5tRQKycysN0Z0gRg7SZeKdlnVnkshDF"
-    "wyLNYNmjxB4mMWkIp0y7FQvYDeYCWSpGWo7oylxQDgNwtJO0WtIltkVykYrYAMRGN8s1Vd2b"
-    "7El58hrQ5VArPTAXvdZyRGhV+xLYaq+idj0TOJM5hZcn6kbZgma9XXV5bMlFUWqodt9PWokX"
-    "fN6NjQvA/pEf/6p//h/87vv9sVXA99/v5J3ZVKnisa7HtZBXvD1Frry++fTzX/8yMinm3//V"
-    "n6uwdyPX06F73Y/H48oFhsMBAcVKMFL7sRJ0fVuJrboj8nF9rhsrL4JEMW7hxuIuzBi2U/py"
-    "LWSAu1kdXB7RFBSZIdGZ3Y2kq+xCbeynbTXPZxFsNbHu5g/vHwafPN6uZn7c++OpYVUQpB6P"
-    "vBxO1840j6qR+DCYSYAm7AD65ptv9t4fH890orEXrd1sXVc60Q+MqioomM+7dulYZZFTZiqS"
-    "K0OSBcwiqnBStRBz0tOvszSblWBUq+w5Ng4q6ELWK1WgvykU+LH4c8S/S/zVI/744luK6kRc"
-    "5EU+MjkRHFPhjhrMfx0U9IMrRnjrk5MSiIgljaYKlOyiNNPXT6UYueSH0q8fGS7njYaujuCB"
-    "2HmZJ/u3/MB7+OQ6aFd5OHL+h2utSfe1aHNNNrqrm1wLMHE+zo6BXU1rCiJiin9MRE+skxjh"
-    "ZZ5PDhLm1DOxMq/dyFzqCreF/kqtYQw72xwkoohEyNmIZwFZ5rJI1bVjBVJSr8y9i0CuWEnS"
-    "Ho8QulX20u768C5mV+29W0RtfXzJL7//9P0/f/vd7779+OH64bswmJ8q4sv7/cgrueL69Pnt"
-    "myu5HqtZ+Z8e4Jd3vr/jy0d+PPH+jOedd+Pj7i/v68v7Y+sbLny58b6zgdL+ci9Eve9+390I"
-    "OmFvv7//cH984V3XB/hD40d8/Ot7Pz/WMvDnjaXnj/f+cT+/FJ67nltiMB/r2qpg7t1EVuNi"
-    "hCjtK1NV+73QVPX9fD7v2gWQxjWD+Hjqy5fnPnsDoB8XH4+HJ5X3bV2TTXsm28pc7ElnWwlh"
-    "33utxKl41e303JgIGxpl0+LeunfNFQkDYmlyugnpRjKQsav7Nd+FRy12w8+mipEYVZ/CPQgO"
-    "6LVluSKBpbiTEfg3wf818zcXf1b9BqRwIR4Rq5XSuLZkzG0AtGlOQjgciJLlNoQnWlZQ+KOR"
-    "3Aq6no0jGSPAsPc66M7P76jZjG5ux0QZYx2fcxLhWxhei2HCgJEBKSKsS3fJ3WcQLBLpRXe0"
-    "OsIzhbr3Nslp/pQQiETIuaQjL3dkl5FJFrjtCNgBRJHrysh5BLiE4Gziq/qO8L7MvlEFYZfL"
-    "rl65GjtCEZQ6GN27e1/X5Qya8nmsrpYTcBi4Hnk/PzTpUduXCCK678UVSAqZLkB2oNb9/vjy"
-    "Az9+iN//0+N3/7y++9315fvHx3vvvden+PTzZ6zvn1+48Fi593vVx/r1f//nXRLQ3WtlR5qf"
-    "dD0WgEuovfPTp5XBtXbiSQbxZLBV2Lqi3xKq5/s7k0m+rU+t6/nlWfcTCXzq+nYh3oRPqPvj"
-    "u++76t69fv6Zj4XM6/M3hS9vVUBHd+YC+KFnsRT1gSaUxX133U9AiUzUikQusX/4/vcfHzMq"
-    "tLQ5roiIfW+pFz3OvCyw3Xch+VLPTQae+uPjfUxyAXYnsa7V1WJXdTfv2wOo6JbxWUE5fMgP"
-    "HwKoYykOqnGXRRCCIURELmokymLSK64gnCdaA6Mwz5YRRDP9vgR+JfxW/DPgunaASVC4mKsF"
-    "NYUEtcvROiXd22YLkJkwmn8mbf6u4fOmS4duYGYINCrvCeOMkGZ+/tx3A7EyIkvglU4WP91s"
-    "ZWYNXsuR1ozIlnPDZi1U6GRwLZfT67pu86YZjVmq+1MyT974LLuy5+xjkoH28IG7bifFRGYk"
-    "dgnQCt61mbFWOM9+5dUlthPMQLJ6C+wuRAHGPNxXMsy7Vd2Ft8dSAQGTZeP8gkKP0GU8yfG4"
-    "rns/26nRDFCt+nh+7L1Bb1hvcpmvBoZIdL9/fL90cQUjEVfE9axbH3fe65uPH+P3//zLH/7n"
-    "/T9/+btf/Yn+5AuezbfP3154fIJ2PD6/8XkvP0dvDN9lC9lQdeVHIOLeDfD5vgtqaGITpBAf"
-    "sRyX+yTj7iTI3NTv84ePvUtYi8FYqSBqr2DXfVO2p6L+5Z3XxWu98/uuuhgt95Xs6kg8tXfi"
-    "8c2joVpxdxf3vqQVgQ3h3s+P7WCuExeuejy49ZpFUcRa67pWaj+fRbLIqg53fgUPiyOiWmut"
-    "a41pPhnPqojxF7i+DRoCanK9rGAuWwVnvWrWpGSCxEFSjRvBnWdyprFNeUcJzpbYpmw6ZAtL"
-    "chT8r6m/ZvxSda1YHZd00UEWuiicls5CXhflLUWs3hXm8lgl1ar6Co40E29uWXCt3PfTIQU9"
-    "XrxdDVjak4FxYrmTgPzpeN9txXt3RHZvkpnMXA2xlRlyxxGIiKrKiHvXNfIvOeN0IJpgI2s3"
-    "1xIXVO2PWrJGvUVAy26jM0X0x6+GUIyo3ispVQYd72oRFjyWoG9usisShbbyLwwnGFEZrsej"
-    "1FwRwt07Ar37uq7Idd+bYDD3rXVdAN8/bifxMbgiW11dsXJdl//wda33fed17SohWozg9ZZM"
-    "de2AtLfyA8Cjvnnvjx8vPSK//Pf/b376/vrxy+cfftA//ePPfvmz59vPdf/mTpa6auf/4TIo"
-    "iIg2e7ELeSmTkdu5sekQEAjtrTxfDUo3PYsXGKtaHx9PdzEsZOTzY6uwn7dnhhlLjbvK1cbz"
-    "4/n88aPfb3XVvfdzq3U/73ruaOz3zQruvN+7PurefRc+nnvl46P6h3s/ix+tUn581K5mwOJ7"
-    "IrpkUVEGezsvY5UajdlTdrhhdgnlG3JSeBn7riqUIIbOgKq6M2NdF+iTHtt2BgBS0iUjRD5r"
-    "bEdebCKMPj8bpP5qCvS7nQx0d6AFVjSEUgCfoD9e6y+v/FXGI/QpYrWW9Mi8FA8GuzMQhgwb"
-    "zOlCGsxcNjrZZDtiJEd6egPsd2yQlakSAysTDXWL3g5IThWpJvwyn+SY8GujI4XurnZgt1xy"
-    "0OMh51tZGun5cFwROFulcXW5Vo+MXI0+wpUmZtOWZM/+DLUrIv33y0BMaPcubX3ta7CWbfFC"
-    "5l2V1zW+LftDfE6GAR1xBQkmiYYz6N3JN1A9V9fH/Rxh7G6n2Ds0CEF0SdWQAtUdAw0DyaoS"
-    "9biW6UrIuNbb8+MDUCauHDfYrmd3RQQjtfcjs/bd3e+7Yn+sH353/et///nv/+c3v/vvu/cX"
-    "pLp1/5j/Z3BNKLJniJ2xrnXde++9T99IQ83MByWQsYxf6+qYh4OCHMGeDAdNOAk2M30hENm7"
-    "eqSNXo3Ok7pW7vt+7c1J7hIjGOt538+nv4gW47o+VePZ+v7j/ti6S1/edzfWWsjw41DVEVgu"
-    "NKukjshqvX/cEWFiS9dkutMMRMIBHr4z7+e29K5cMzMyaXTvutJuh3mc3N0SAe8mZdW+cZav"
-    "tWSM632QOjihJ/OYJxaJRm2Ekq1PjZ9d8aeP9deIt9QDuiBj0xc6iYSBFEjDIHu2Gq2uXTG3"
-    "K5JHDGKlIfiiB2X4lx1thnv6YPS9mYFRoaQ3aR43QIb1jF4tnd5NZCaG12G27Fgv2jT2XZpD"
-    "BGqNo4cE4BW0LVbedPsGtDU6PQWqihxt1wRbT9M7usvz0XKtq1s8NpIxuA8L2UEQI9UCWb29"
-    "Ho5AcObXXcq8HP9krpiRepFh/c6V2a2MtHkp4yKjSxlA0PUpGEKrO4L3fTPYXfd+CiybKNt/"
-    "sDO590aN2jwig4vrqm42ns+nxUeBrX6i9/P5Q9bH5//xL99+/8P77/7vX94/5v9nraPlxWJE"
-    "ZFXfe3v6bC3J8667xs8ALyrvMpdK6pz8BD6f2/O30FQ0u4wpBiNrW2oTPi/P+Q63HFZHHbxT"
-    "qL1/W96pWFkhK7bALRbiy633Z1Vxt+iJSBDBj4+S+tPbIhUA0dUtR8LGAuwjx8p15YLrbVoy"
-    "EWrd973v8m0wusjBXyAzMsMu+vHpzgr4YFo5wsY50YYUO/Q63yTST8w7FlQaDg6qYwPVeCN+"
-    "ea2/jvwL6i37LXk5hJV8RHxOhS8P+KCflUgw2mTxga4jAmtYTU3K3oqMJNjSdjoeX6CuCW2w"
-    "227+KQmipStXm59tWY037Idc64eSI+weJ4RDf62EIfq6lvVSAMrrIEt0SHLRF4CvBffDtHz5"
-    "9UH5hQq7H6Rea1nq47PmcDjRVXQsFLwlTmuupa4uS6ZdgDDmy7C0p8twPHjIVepyuxzYfUtt"
-    "5ppn6RkZXC16a191S7prg5F5Vd3lSAtKvRlihoDMFPreH2vZc1R7b5XU7Q8axMfe/gKSslpq"
-    "Zdz3XbVXsHRj/4h/+n++/e5fvvnud/m/k85TPKAyVTcyvI9o6mlJUITDYF1LMEPqto8RaGHv"
-    "2tV+hId5Op5sug5zKq/JzC7nDgIZ4xq9snb7MHU23xZ2S4gqW3uyI0q8Wx/VX6qfLeSCFV5B"
-    "B1Y6guBxJYVwho3Of2JlQ6022LlrlO7r8tyYtcvPjRk0Lbmc9OzRGyHX4P3aXRoAkNEiDTYX"
-    "Lb3QCCBDoyQbZpZT4HwN+qe9gmhuKVrfQH/ylv9LXH+oitUJXd25leSnlQ9pRch6dc6B4rcV"
-    "DhInVqbbYKEjgjEs2hd5uk/TeLgd5gqlp3SIsUwJ2q1dE+aqVmaaGplhtlT0gG/gJlMW0Hxd"
-    "+ZhSgAlOsJwFirWcWR6MlZbbN2M1xn0JMlbuvZ26bPHeiiSjKUGPt7cap5uthRFr7dpiWyCO"
-    "jLvVwRIZq6XSdgkQZMnpE5PMCDHTOkqsvMDQEWMqLENrtd2UMF2MkWoZrwToMm+d7CZEBa5l"
-    "PX6oCoH1uKzkg6TeMSavWGv1tl4tAdTePamARgEJdqd5ate97nrGfdcXffz48fw+/9/XdQof"
-    "dKskZoi0A+aG7yIufyuS7ZsO+82IvFJCi+/3HvHhgRYTsHGvJ7AZCAqo6oxsqhzGkeE6jxHW"
-    "LZVaCHviPRtWoIkiivGs/rLvD+FdvckCBnUevKvvXRidkwgk08e2+57dZcGTQ3osZsjkuuIQ"
-    "S5UZK5fFfaD3pcyV029JZOxdfoF9+Viv0+0VpCsIvW4Qf82+0o5v7vUnDdliN6qh1h80/jbX"
-    "X7c+RzP6U+alSOAir4iLeAMYSyW1HFs1+14mwGNminvfEWSgun1yETyhrQKPNcKu6+MxvrtX"
-    "ZrXvKbcGYdnWXJmYnz8zebwXGs0KIpc7rkk2sXeni/ad90lritzq0Rt7WODbgGwFGKDzFdmw"
-    "UJGQAszxN03ereZoaG+aqwqksBH+8EPMDSlWCf4HqimhW4g0wC/QGIANc61riEtQV+WKlnbv"
-    "sKjS7Q5jUIW2oqojuK5r90aEUwoM8QsfBK1mIeK+t8OrvFXq+QWCYsbyUeWSNiJ9ZoHa+9m6"
-    "mSyUQpX92LrAWLj2M//PtJcKACIjk8aNa7BGiohHLguHgRRwVyeZA5ZoZHzsfsrWMKyILlnt"
-    "Op9L0vicNkjJVVTORX3op66B49l9Sx1sCBFNbHVHbKoj7hYj30s/tHbEVnxIDFbprvmxbY4J"
-    "4tPbta7o2iAbtH1X5VARJCPBXLgeSSpXtDpGQoxqVMnRoUfLNd1WV1vneqa77HHrIoArZ3Lt"
-    "TiwtV4jxJ5Lhy80moqZi4bIBo/XziL++8t8mrxUMXsInJFtXRAAJLBsM7n0ud4+/sycUO14e"
-    "BLdtpsY4H8xVDPN49CMI1J5sXDA8DwdR3Q3RdgnHQ3fLK59drmkb89oBTUYD1k47ALnQVbUi"
-    "p/9f4WgVDXTAkSnHUGw1JShGAwU8ezeBTN99KyKknOn6bnhEhJXs2vgJfD5yJakOx7k02XIh"
-    "L3lPRCLi8XiQ6N5OocFosLzf66ZalQaTqTk6kYwzQlvrsqg2rxXBXRsYcim5WjIqOzDe0YYi"
-    "8q6dEZmraktIC5sVEBzD3rWhyshddT979y1uYHr16rrvJ0OL6r0dvbbikf+vtMmkI6NbghwJ"
-    "u6tL7RGURSfOvEYEPUEBGXze+4ZusRBSZ9ADr0x7xywYjYKmCJ/IALR3MNUkr8e11aW+ez/t"
-    "G7D1hWgor9VkCXfV+97PqifwDO6ILW2yWs/dBeyahjaCj5WP6wrMcXStC1IyAGxs865WMIJr"
-    "5TqepOpupwfAa1ThSAXohazxo4KoYS9jMq6sYKfnVWPdn/7Zu6RRQWEswinY/2C10p9l/Mdc"
-    "fwYqYMJ9yuFDLrA7ZH5VhmCAmf3xg1bJJDzDQ5k1APVohkEy1pp9kbVR4w00W6ZgiVXAQ2MP"
-    "1zzt2/ZurWWxh/femR66j2LjJaiSUH06WSqCSModPtDU6CJdi3XH3D/sGSixMXOnUUU6UgUj"
-    "k7J0edCT9GXT9ir02caNwjuiZYOUzgLAIRidM7Uut+jDriDWekTmx/M5DaBVfN1BC8QQkcyc"
-    "oQxsH9esHjy9yQTSaupAELjvDchzolhr7xqvEqO2Q97dh8qf/wDkEGTnosTpMNStzsyuL4KN"
-    "utFQ/rc0zCkjow0FIBraFgZeV1ePdhzgSqlzNEhg4Ga8Qx89xUSMZ5QtFZt0oneDcDFqk3qs"
-    "3GPopUcaTSGiwAKLrEZbR77iWXV3y6VyxCbv4H3FF3WRd3c1Rx3PAHAtvF0ZdgIN+nRO+jim"
-    "z0Y72XhdGQK6ZjLVssnQVxnl13IESXVrdjQ2tX5tIMd1kKQRkFb0zE9EcNQBx51gYIAVgdIi"
-    "//KRf8f1R9qKWsWUUrJAchFX0G9v0D5uTSclh4n71Bw20Aw0LXTMsHPDdaoT2PyLO3c9TgRL"
-    "e2gnzf228q6JJwrzNMeppdFayRVSMMYbHMxRQkt2aaqb/qtMnHK1KIq4xuZ4enCGGIW2nMsT"
-    "Ehv/OMGE1jZ2qT0ZjYiSdYyIyKEJ4TWVftnY+hWQXdW2Rs7bazMpFCvv2mplXvfentgF2LWv"
-    "6wJCLbffdlVGrJWXj0XH/HqIu6s0YI9xREwkVaY6NaE8DXBqRcfBkdOkkFvd6PHh2LmiuFbc"
-    "95MEUGRHIhj3LSCv61P+t4zMcJhFAWA0ZoYUGa8QAByj1istC0RD79CPJUYs+1tcQgOF0aRq"
-    "2KpsUUQTDd7V80mMewueft2NW0DELbV3DJACYEodV1ZQmXfkj+zKbMV9xFuZGZThXGvFylxr"
-    "vTjJVb0yH4+HVfixlu+hrgo4B4RhRW4r48q0sW91V6lNpOgWM5paV2aEDyYcSmTEzF9inp5X"
-    "JqBvFEhIpj9AN+Uh/CLwN5/yb4tvqUBlIYmLkdQCAh4dOJPba5M25QJCg2slI+d698D8NNwB"
-    "GXzrNY/dBddKdU+O6WuZFZHrceYCjEjI1+wMtOPAQEatZi+Iz+tA2OM4BqH5Hz+Y1WqafT3/"
-    "V58wqt5Oe5iImThoEh2v53ysK0K02XBwQu7e2rrukXi/OCZzYkPIWJkp9VQ9E5w1JFA/4dUe"
-    "h+MM7dDoteYaFXTvDQag2XbbwNUYbHVPFeCRT2ZEpCtIjfsS7XUzzFPQZEwAgxQiMmLvJ5nd"
-    "/jwbcAR83fczeNXejqNJ13JdQAipYjLyHyYzxTcQxOXvxjxuzMBlXuDxVlqXs6KDP+x+Cgxc"
-    "ESvZ3enVFWI+u4jdbZaRfzQ7+65rGTPz6mAENGk/gudLQZQBcAwIBVRwE5XrHf0Bjcek26ip"
-    "cPEZeFzX/KqDMstrPRi8awOMdSHy4+Pu3Rm4Vj5WXtdlOVNEkuu+n2fT6NLXQxaKihy3oeXy"
-    "lhLacGmAUkYeT+0MnC0s8PNl+cNqBeMz8Zcr/pJc0Z8QFCP4MJhifOFOD5otrslvORNkllpC"
-    "v9RIBMjllezU/POAo/X2eFvLSsCOGXUlhpMT1XA7Q0Q3upqg0EEnQiD4cnczMtZa7cj14C7d"
-    "ZZHGV7BOV7vFAEwKHitFxpjEZn7p4pNHgDbvyEzPBpQJrEyvab0+8JhJxMrFA+1SDyb7RfPt"
-    "7q5tTXsPZXcUCOYfxQElqBW2TwcN6Ld3EhG5lveAiws9M0t17X17fDWaPEyNsx5LklD24wx8"
-    "mivMBoFX8R1hrpgiyXDAvaVENkRL2i0l3yTt53MtuztZ+tj3PQbD3vnf0sdCOOCz1A1TAhmR"
-    "vV8g48hcsQgpgVzXLf6wewe3P+4wHwvD+S35Yr+9p89ocUtcKeFal/UG9s54P+xcGxGNEUnQ"
-    "ivY5mULkO/BOPFd+SDvULctIPTnw0bMyjVDZRpzcexTqu6vAzBJ2vdrvJLHWylh26ku4Mgn2"
-    "fYBX4TUChpITROsoQThGowhH4ww2aYAc814FmdS5TmfAmqHfrvzz1mJfzJQeZnRIF4PqkK7l"
-    "LW5ZeUtx2TXXfRwIeKlDpsXtWYQey/5MpgFqn5FpLm/i/X/sVnflcM5fonBv8+MrUq/LgM4M"
-    "ogpODj2BNunGztfg4HWWY9B8L5ew2/lVQIOGGQ2WLH0WdimYoOKgh4Rew9JrRnTDCF6bHLUb"
-    "gLoNdhbkVtMS5QAe6xIaaiTb4VjD3BEVhvt4YO5g22AEvVgREME0RCUj1NVSV/WuiIgr5yv2"
-    "qiJyV02KtXA/byLJzLha2Oq967wgRzdKE/UJLoGIKHSrq6p0M0JKKYyC4ZCSnxGOzNwQtJX/"
-    "7QpPWT0OtKkmMrtU3XHqQzckAVyRIG/oXfrS2kQTyQghyIzzSHG2o9XmGs7S/8weegodTHpW"
-    "jkqJouttWchueoMRGJt4Z+/kM2BQ1ZzdkcY87xrT0X3Xvrc3e1WSm0MCiL13g/fu7n5c11m1"
-    "zcu51lIrCEuIGAGiNBJjL10xVfE8X2dMLUJJpH/l2VbQf1tQOZoGx4rpF4HfXo8/yXwLPRir"
-    "FeglBWTgI0EvEvRK93TWLrDWCrJ/stc11ss4S74+U0wUjJkkvUvtUaVf/UFeznQ4Djcy04tZ"
-    "I9ojHN4+G46ZrlS3LCNxSk1HBM9U79QCnunNk7CuqwfwFQRr17iTOAIYjffQa+Kz3xrwkW+q"
-    "sM0rI2KlvxTnUXH+KpuEdV1XzdgDQwa3qtF+h1yiGLEyq8v/ePlvz9i1e5oBVE3SorqBl/vM"
-    "W7chnLquzlx735F8+UCBA5AAgL7eHpJypUfjQbV34q78mbXl1WxVEVpXdjW5DPONjOvxkKbN"
-    "9bNkiH/+wwpH8ljYGSdxAucMm4pjVq18rFXEF+FH6Em0V+7gAkhv6vsKT6lfy712jzozjles"
-    "CIOZ3SdyiCHTUsCCajpttrqArX5S9+KTuKkOci3zk3wTjoBmHCot0DVFa/pwkB/3LfDede8e"
-    "7iNmauqlTHeji9LKWNdyF2SE1kgI+2WzC2IYSK7C0vRGC+UaHogmcS1eGVckGldwlX4W8edX"
-    "/LbyFxkdeitF6SIWcTm8ZTIKHR1uhfQAHcOVocSRMU5U0yCb5iM+2ZwedfWQuixItmjS8g9/"
-    "6WBMgmzrxLa0pJXpFiAj6NwHW35G6Kxk7C4X24IM1JmOYnTldPs9Rn+e9w0guR6XIR67TeKG"
-    "zdhGqWWEt4xHdz/N1h46GS0j81njZZXPjlLvKnMIpQJU6sz0K14/aS6gAwCyNGdwWdZ1SRj5"
-    "FJPdZam5myyhNYGJiyOLMPOhHQHvp3wwLOnPxyNaTaVqJ0ukxPvuSbTISMbjkREuGGtgDNOZ"
-    "lNNXpaoqn7j592va62oBvK7l4ClX9t7VZwbBay2pSt0Rd+QPu94tXpe3SgrBT9s5pLsO6bdH"
-    "j4MVsd4ettn14S+9VpqN9qrJog6duUmTRdWVz8Va1JUFbfXHc2/nuikEPm9HayMvh3R7ssT2"
-    "h0h202+W3wjzEIFww6bu2v1YcSVy0TrKriEz7d1VqhGDeo85uBr8JK4I8hQAa4W6HyseBk/e"
-    "FcDa+lXrN4/rV+ifbV0e+1UTyinXgNn1C1IGV2TYg3bUjt7B2is/myTABDXC3hTjX7Ueq9UM"
-    "mqWuqYjh26CnzOexUnHb9eEFjGly9x6SsyrS0bDoHiLnVptiZyy+/6/rMkljipBkdHVDe9fQ"
-    "SMxlnSm6UT4ed48ITpZkTI4jIrNbVR6As7tKirW86KYCZxJfXZnLV6j/2rT/NzD0AudatLFo"
-    "FUyBTrHKEZ9mm1JC5lovTJ9bEwSt6t5qRGigJt3sXGmw1gmsw6QuWqamu1W1n1aa9mDeojug"
-    "aEHoaw1CwL9i5lqZ5mxRTXTX01wP64qr+vF4y7/PsLq8C9e6yCkY1koLTQ2YdZ/TTs1i/rD3"
-    "U5J4rXVlPiJWRsB7yxk+OzrOVu9hZwsZ0dBdNawIxjDNpJNb6bgSp3IMD60JrNQj+21pZQXu"
-    "Xc2s6lyJyOfHvceAGhFkntbzHEIRsbc1cLirWsxcBPeuLg+uvOHGteLzp8unvG9ekc+7utk2"
-    "bhBBjuNklFVYa9kEbyzT43EJ7sEWzMbdWsIvMv70sX4lfRuZK7sru6y8X+DyNTgkvbOrGwn/"
-    "mGy8C4n4Ssab8TCnRCJhnq4P4Lsq0ni6iEyNH489sFU3ulYsz9IIxw7stRCD1RWnhzQy5hgP"
-    "DEuDo/Q8MKhuoyj8U6qaNrQdwKX10KfUxuyTXvbG2QWU2SrdFSunWY/p/8dtZGdtTH3MmSfZ"
-    "lj+rtVYXyrgP37LXdWm2vnnWyRlk1b19PDMErrW2+r53vQrdELxhUYPwziiC3T37Rhu/Y611"
-    "OXNKTAwUXo/HyoXuHRm1x09KZMbym24bpvfPMzshpKrnfa3luRfZDp5iLA+u8++W5X52h+l1"
-    "75HoKpNG9p5BlRBc60l9KdyNFVzEI+MCtLdXpDGccJpb4z1BHi2X8100SbeeuB0EjMipFkjg"
-    "o1x+qwJxRS9+ifoIIVkqaL2/lxAN7Y2BSOUpjGwi5+zY+hgPGNy71HI5VDXKdBKPx7qSb2/r"
-    "22++wWkLu7S77627tOskDDQlXYuRngBjrbVLdXvZj3UFIJQW44rgWdv8OfM3Fx/sqzpLKVxE"
-    "QoQeYdKOjJjHga1fkUkiR1XgT3hsxRn2AJ1UNNB6VaudCAubV75UmxTKcHMrIHNFKUZ56yhg"
-    "KDPUpe4E+0iaq5qMtlWb6Vs6aBlT2izTonVddC1TZRdEo5HDavZ+kzErdAeae8xS3bPLlEpd"
-    "7hi9XuKEANfMOLDO6KK6g7mW7XT226ig7fj4GKYHxEBecYH0d3E9HpkGEkRyESdy3RfGRDiD"
-    "83OLgRVZeyezSxJXLLjHuaje0h3BzMtjpxKIKHWhFROsN8GOVWytsHEqBHmI0GZfFucWiihV"
-    "9fbeLiPUfV2Puy3thpm++Z+vtD6TYePOHNZVHcAaYeAM3RmhiPfqj22cQhj/tgLEsGkOyo0v"
-    "mYGEvW8QK+JxXV4ejJYFGKWDh97VMdxEIhmZj8ejQh38UD/JHikvd2E377JhjIi4HkvN2k7w"
-    "M9QNtcuZtFW+U+cXdKiKkwEymCuuKwmti7137wLY4vOJ+1Zk3jWpuw7HyYx1rZrhrEVF6haT"
-    "68qVlltOQEnc/an5Z+v681zfygC6SEsjJUhXDjPaFM7ePaYmnjHPvLSWBdrB22clr7Fw0ODy"
-    "8tXkulrSOvgoH2veB3cfJ3Qcgs8gWKW2vSzLTo8gMxBWf5luza9/1skQtLiao5kadLr8/swR"
-    "sD2hOg5eUO41wjNlCthutg+keuTlM3I/BOauwY9FeMvt2amG4RORWWW/t/yf9tyC7WXt1Au2"
-    "/t1bmCwSBVFVdhv5i31cF1o9M5YpBSNW5BK4Mq3y2b1dInWJmZ7wnaZggdGNxYwJu4xuOGST"
-    "cP+8I6Isr3dBkZdf5qq2LL/LjB5u29zdiidblf+BIqf1lSTmixhqbcbh5YexKBv68TZPzsWk"
-    "9QZNoNuTUhcCdg2kg92naXRegzTcbYaqEYM78+OVCBhBaI904AP6Ufpo8dMjPz1293NXtQrz"
-    "xY/k4zyD1Sh1Rvo1nmbvDAxfAqax/qKHL6u2n7mrq3pv1UYrAH752HQWB0giV8SKvWfa0Wf6"
-    "bdKLQe7GQEnivT/d+pPr8edXfCNl9yJd/SSxMh4D1juZRDiw8Bh93pC6wrESa3BNMQw3zzlP"
-    "Bz4s2nHquaI2TvVsEU8wmqyumfvPxuCZdc3f5h6CGQduY+lrzaDOfspjMrG8S5NMekyGR8jl"
-    "ZltEvmr4MUG2VZmehM+YLNjdNja/7NIk17oOpNbGv2n3O/gyvSAsn3qMEfYkTsX5i/xPrAFU"
-    "sDtChmBtr2TjjE4yl0qjicoMJhGBMMV2ZU4aNtrzLYyDn4wcy/vyU43k1WUze5xgrCWxwVwZ"
-    "SdXIxvxlPUdeFyuv438uoa5redW8950rujeg/DtiDWE77hkam9OsjPRzEQIzEdGRd+vu9pAw"
-    "zaG3OLjFSLtGTnDuiVuGjCaahm3wwnNvTLmLoTBV23zf1WV/1g9V3zcqWRdr1uVo0UsvZ8E3"
-    "VKW9ZzJvWT5O5NaIXkbT4+F24EyFWuzpoCDxLlUNg3lX68SIuCqyNNIBSE6ZNZ7SOjC7EMNs"
-    "bGlt/YH4pxl/SFy9oV4ku1eSXQxEeuQ00AyVrXKgZdtf+ZL+T6xZeE28WPrzrBHsxytdbGSt"
-    "B65HcIpPjUxdaKMZ/CrVnk3AT0TNFvcBEVX+w8ozqJu5jsRMJc+3kFaDRXpSPQul0T75Do/o"
-    "gzp6pb2Zdu8D1r+UTxk7Wyd/1OVJHwvmCDzp7HZHxyFoaRxPGk13r0wPAo3K6TYZb83ydiuD"
-    "GYj0IKatSJtZlITWdV1tPn1pTbHulJyq3j3hodi13YVWtbUZwAwCM0xJ6YjsSYZbxKQ2eISX"
-    "y3I67l0GivjXH6GY9rWIgHnTkQTweFsRyP+6YmXsXY0xJIyB7GWH646D4Xp2vd/bDZCVro91"
-    "UVgv9Z41aPNBIoKIierwJxI5E0745s3MyO5OHT/SCszcySUZ36H3FfnpUvDWBrSbBSjiTLlM"
-    "48VIdsMoSStm5wo6GZYeOc445Mx9MmLZzQpNIJvEvYf06jbeT5jf/SOd//qs+5dNzNFipMEv"
-    "wL+4rnl7gQhG62pFy1n1PDpMjm7CGaODigzMjMTvzN67qg1R9YgI4/7hjJ9yEOr2NkCIwZuE"
-    "UalHFOmt/1jmvW6Y6NOXGuQI4zxZnKbMN8+MShWZxRYRaw0AW3BKCK2LUsdAP5BpmDbW9XY/"
-    "dw5f8qtx3GK2F6/kFAJxLNNnsHJSiO3sZ8ZJWk9JwcyL2m1bVWSqS1X2TkPjOTuhc45VMy6P"
-    "U5JYV7EuhzkFo26vXnMFz2wBgk2a0SgTOZQBMnPZqlF2FQTC7b0EGZPmAMqwRsBKfWimg4PU"
-    "X9nducKL+q6t3urbSH3Xdj0isMq/v5IZY1bArIUuK9YA7RrQOcDIj6oO9nSC5sjgwvi0hCI1"
-    "94mAXC6V1SqvwXnY3LTlWBMx1rB7yaEBUJFREDOe6ndoL2BRyQ1PcuJj39tGsNlIjfEmFzUu"
-    "uZlReY1m0vgRzkKy/CZbFFTl+PGo3fQcqACut8fySxuRI5WcNyUlFY12823Qgj6dgu8t1qP7"
-    "z6/HH9llF1xkFqJGNEtaOBm2f7EbGnrGyLDts204acWPY08gyzoGKCCQl5Oc58CeQTSBIx7s"
-    "7hcKY5bwPNioV+0Oero5oxSLja2H8nvWck7imMwiTEc446hwGioNp+8yQR46nBM/fEDVZuBU"
-    "ta7iJVeyQQhrTl95xWpigsT7eZ/fmkPStjEml9VUoFYmqYm096kw8B9dsTKCSQIr0ic+87Gu"
-    "1are+6QOMhlXZu9itYw6vFa3GTWSigxfHrMlYLbTvzaOmKTSvWPD299wJqpGSe7xnq1oYSdz"
-    "BJgUQ9HaHmi7CvG9DhbRD0+sIoNprm3+/bI6KqwOdxiuyliBoaNEBjN368v0ChyZWQRaec5F"
-    "8/J9o/RrMaDTZ3lLeRZ0DhkcPvjLMKGR63j43NAtVUZdEY+IKxHo7ltodazLRW/tnkCzXINi"
-    "mkplerzHlXB+dECceWPDH7vlVDAIoK1Bd+VzXbVvlyvW7oExtiUqIw4IerZeYQ0Z+DPy161f"
-    "P65fMC51QNlcYKgX8VjLCqZrpTUkV6ZhSjkrZdA7Krdt1h4GW5pumd1drY4YR59JJgN7Po51"
-    "TgphGOY4TsCBL83O1isAz7Re+gpwliVnQQJr7p3HW/3SME+P6qrKkgvPrnwsn0TyNhp6/ETd"
-    "J2bltUs/lCJDsCNrXJp2FNYLUr0yz3+U4xWIyUjLZKjfMoim4T4A0Ivxdj1GYR0h6L7vzOly"
-    "gvnaZwXYo4mdeiTDkqdVJmES1tIx06opBy+WLS6Y8UVOUM4kk/u6e9UatlgGl6omaI5JKsbE"
-    "v6zP79oZIWrvHWFTdgHd1QNKtl23kf/wklJGCIHuIO1AzIgMYzq6Izb4XlsRFjzJjwHBkofU"
-    "rSZz13Y44Nd2zXbUnOX9zLjilfJz7gZC4a5GDFaAER2xV/TC7troLe3qskH1eljy2SQ0Asx9"
-    "CBXTb8uNCcZRhNhiVRs04GJQkhM9unnscgKw9/aqbtRjrWo/fx4EojHW35k3tTbxaP7FWn9O"
-    "/AK8ykpTXIXHCseIOOAzI6saE8DjTKWZktEgZn8uzVHVz+HuXtevN5xa1sJaEbFmrOWx4Uka"
-    "Fo5VXfBH5BSiBnbVsQ/w2JWPmm1Kdx21F7v7fGXUnOx5sqV69l6ksw4noRMu7029d9RLvGw6"
-    "Vi/f1YgJTDFBq+dfDEPxRxpoi6IDJcb0ypPz0Bm8IlC1iCTV/VgrV6h7ceLCRzQEBeWILB/6"
-    "ppT4F5wNqJSZK7NLZDqLiOebvu8NhuwkgWYPEbk9rEXy0M4ohtKWjHVdQq81eH0qXLq7cvYl"
-    "sXeFCxaVpeu1t00jmVRXDhpF6umCgpn/JbMb5X2PU8WIQKQ/4qpcq4ln4d2ULn9wQOTlHPU8"
-    "y95zgzHXZaL3K4oSdo1rRr5MTo52i+IKD8ReaqH0cskBgpv0baBc5kHEdVXr3vu+nTZGByYM"
-    "5pNwNdcm9BBHmhyNuO9xjM8mOrJK5pnvCRMyo3es6pYWX5d5/4r4ejYFCbRFTza+ResPgb/5"
-    "9Papd1Y9yBAucnV7FhjgStJLrOogVgzAyqvHKxPVZgn6VCppvsVInLA9lcLn99ml+5R0to9l"
-    "HkmKiMXhpVv5YGSxh3tHSGZpBFfaGd7sbo/x9eq0RyMx6o4+ne0LB2tjmX12xhOafpH77pWr"
-    "u4LT5PrHm6mh5ZMEMyyMyIhtRNvxTruRNljCnsE69YVPvRVpGc2geMLdRwtw9VFV8+cDLp2s"
-    "ENSr+z7ByBGWdnsK21YTlQrE9phkXBU5OxX1K5QvyNe2ZWJtYCzO2BWDSneIsnvK4y5/Ax7n"
-    "hKprlz3YJ9RC970PuDo1TBMT+CP/jmRGNaSmV3NtXaS6OiNiRYMfB/JjSf1EXR4HUjo31YuT"
-    "DC+KiLPXsfp7kK9WlukYX468j2qgxZ4hiuqsPkuzHtxkMd7d/K5131Xd3dil6j5uarbi5c2w"
-    "ssg95l3q+Q+YxpoB3rf3lxTRwjVsynEpOBz58XAwz4kOHmbqIGwCmENK+Bnxb1b8fJfQK/LB"
-    "DPQKJ+84234W1L4/D8b5RZtAYtQw967d5SmO95lWTVZVNDLSs5iBJ2vCHDSkCPgqMxbELcAI"
-    "m86LO5FNc29GU3eXfbjbHtbj08ChcHzdo8ZIZXVIWaqO+T18809gd5fZtDGN87nP1aqu0SoG"
-    "Bd0echoMRHRrrRUZtYtH/1jdVcUYBuWKFe5bqwJ85IUe87OVJ3oVS5Sn7BzTIpunyqGX3lV9"
-    "259KoHvf981IkREolXHRHPxGlOAVDcnMdVeFhjVvz6mlEHvb5gEfD/Ear/Yo0n1RaeToywDG"
-    "zCWIK553RV4+Ezz4CMZBvI3ONP/zGaBDzqRPQldgBaHOlVu6wdtZkphbLhoJqneSg0MPnqH3"
-    "S4wVNXioMErqpGYICBEDjZweE5FpDMoMxSIy+OwCmCtu6aO1gdIIJwpc6+EVESbwx4V4f2XY"
-    "HI13yemEcsVyAM7uS1SmCpOZFFi7M7FiOLLoCvSVM++OiC6ZFxqnY2fjivgt+etGRFzSEi9i"
-    "AWuyAGZnu64LVpy5QO3jX/VW+Tiw3aya+9Ho+c7cvEw4s4+PwUCO6sMxXDj6psNjPZ8Izy0x"
-    "SgAn3E7xRbZhgOPft8EdPpEZtCa5ecik0HGhGNiHFnJNhrHrTHOeRS8XXQo5+JG5VjcUqK6t"
-    "0Y2NOgATFVDH9O+jwl6KK2OrM5dQ6MqTM+ztN3NVj09sOrSDF9LYIiZNYndHPiwfkuyyRquq"
-    "y5dlIQCWNhnlY5ejpSnptTbv6rDsC8qgyL2LajJHTtrldfSyTbVE4lpXZEDI4DaV+u5XJnOs"
-    "t+ou3TaLxqRWZKljpfnJGex+5n+IET4dqi4AXXwBk6Kg9yoXnoxBCiVpJkqOSsjJmsspchOm"
-    "jPl/o1Y/0APa24DwYMY95FqrhY+9PRTxieWUk63myoKe6i0oHBPhnawhWN4xYhJLZF0UZikv"
-    "ycpVzON2FhV0FrsXwpM/JnR1hgdgDk/pYDjhAePnm6NiQXmGLY/mH2f8yeIDCuIhvK2VVKoX"
-    "p9vOiGCo1bXRWisDXBEvDfNs7cdQJGftvjRSZzyFs84Az2jXk2qdX3l21wat7BoqV8tOA5tZ"
-    "RjmM8egjw/tknpPFF/hPwlGxMs9RQ6crvSLqX3+SDOYl4t5bUwIY6c4p1P2lEBJu79kFZi6P"
-    "JA3Tr7a0tHcZqT/HupWeGCz38sAJzFhBW38m6WIe5mALPDa4yDgDvvnbSiKx9zYzobqYueVV"
-    "jcOfJeCu/QKL5gSUYPQtQJUBLzpt9qTcnAJfBgAM9EMmT2Rk+mk1ni4mIsDu2JRYtd0bZ8IE"
-    "0ECgVb1tAgGBVv6HZZjr6JbpNOeYn5IRu/U8cxSPoAz4dMRWnOt8AAieoqbFrsNVFlHdAwaL"
-    "SZxWxC4XpYzgtl36xV4dKWJkRl7rrr2rFaHIAg7JkLPpJnrgZuZIzwZxqFr5KlGnzPcT6ZJ7"
-    "fiNybgbRDspwyAhY1dfKt8fl/+i89jxYRUP7wF9m/vXKb9DRWsIbGero9kc041L/W11BLj+J"
-    "3QcKNSD9mvnnMF1PGR996Kr+azy/GUqeMWv+nOdomxQDj5r5ChgdXXaDWOsKej8/uWF15sCv"
-    "Gur40pCRDlvcNQxfM25eOd1nHRWR667SQP0guKxzlTiuVQBG/QgZscjYXfJEPL4qKKx4MOAF"
-    "UK71InLRHe9s4NMCtlLHMbH1CEhOLrCnhLbk+Z2xBRToLj/z1VtG/81UqGmklNffGZZzwCk7"
-    "R8XgPh80XbCCzjHWiTu2sVkk1kq/xoyBH+mkRo8aQQFE6QCFoqEdEZxV02w6SttDgSo93h75"
-    "7xGZ67z+g3HBkAHTRtwm45Td1wpIK+IK7xqbmZhMSgIo4K69RwDA0QxIsZZ91RO9YbNRjIvh"
-    "qHs9Wpj5x0uTUFXd2A68aG1rXCXbR6vV4N7dCI03eMzEcZrAryknc3u9GrJjXwUDyMBKK96A"
-    "iUELX74r0+yV6fHclzIIfJJ+vfIPqt5Cn+O6EIy+PJ2SBrwqlaHTa6EVY0M/AZ+cb9QSook4"
-    "OM3nus5nohEGdpXFQ3oFKUw4KCYsF8qVTgP3zzyn1MGEHHpUjwCm51uOs/z7ymSLMKqeR7pi"
-    "TJfLH0fpHnmcoxuO5O6AI90qfrVVDzg8IpeFrYZWRsTe5bMu47TOZ3720ggGQ12uXITogz3y"
-    "FD3WstlQdqEak5KJxv3cKCFig3ldUgh9EjOcm7PAhJLzbIsZTPZEsw0k2InBI9Mkydj3toTb"
-    "n7Nlanm9+S93k+O9mmffg0qMOXeg3vcetfUhfgYV2Y9TmBhv2iqniTPSNqn8u2u5qojgilgr"
-    "ITsuychN9ShznKSOeZpfoxeyuoZoNKGv4EoAK6+zS6RNNRN5FTGSlJnsTN/lyYQnnG+PNVhe"
-    "GdIbQcZ1NaI4Tpxm2L6zW3fZHpsj33zR1c/BcPwA9oWOkNs33wzVIyJ4JSPweFwt7K2INLTD"
-    "MxsPkwLsLjbUoLAaf7jy14xPFLsfHY/IjWLB03AhmifHR1prMdh3BWOtrF2A8XEEWHtrYnI8"
-    "pe8gdn/NtLA6wiWV3x8T6v28v+IuXCGPukwmnUysWkRQISkZTE7fddBoh84TX/9OxexaBtkX"
-    "c8HQ3oEcTyXTl6SVSTgzTD8ofd6Q3SODt/TLeeKO0bKH1GSfDKuyjqVsKLiy4ydJQNd1MXK3"
-    "SnKKZ8u4Gvoq82kyQroqNKy9dnMioVUZiwyvxKpbTYc3RQwlH9Sube2ENwXuA/VCDbgHYeZX"
-    "t2O+MndWLtfU/Np35HyFEWX39d5DvfauZNL2GuyVl04mACixH2+PQMxSsDv/bq3ufSUvR7nO"
-    "iCyKLPKjqx1yldbTNC0rIyXsiEYvg0Ct9glWFRHqmLA06KsleGb74wUPRr/QKp4GdY0PwynJ"
-    "4V89ktkw7NaJll30DEpb1RpEi0GKIxuasevoFV+wROsNd89SxP/plXysnMlA5rP6uQcrtatb"
-    "JXJ3V2Ex4OC1JqFi/Zz8y1i/gD4FL0aoIzqBbGXw7e3R0u32b8pb1N4RcV3X6xOarn5E7NON"
-    "Q51ukhNSpxnHUkEF7l1+LXHw8UbSj6ixVbsmyGWiUhQRQswwy+zRHjqMoJxgaxyGFvYeFuQ5"
-    "FxpAaga43oCUhj6rM6aypyc8ZT+5KuQy9dYiNiEUC62khKYjJZORSWExCFm2ISmDmVF7H2vO"
-    "VHWM3Or3XQ2sK8deDz1rO2xl6oUYAZ13Hh2sCTsf1i4gVQcT+YaI6tqqrgHWN4fC7FNv4ld3"
-    "MRJqoHKlCIk1VrcY7ME4wMr2L7dfGDUYR87tZlpKx7eiQUWuKVIbvffubqIwX91jXaDHivl4"
-    "u/I/Bh8rx3Q+BaaYGW+PL3s/CwfeSwnqzhO3N3km4xs3Dcfav5j2XXXc6JxMZPPTLQY1PEWv"
-    "2EMcpHAcN++AlcwSOFTcENkRH9UtVenuabmatNJweKW+bI+X8mRkDf0Fg92CBWSPa0Ww1Znr"
-    "3nVvC/G4t+zB3VvdcND6c1dLyQT51vqzXL+GHl0JeIUVsxyCt6YliQbHj46FxMrVkEkgnhUf"
-    "ZbRBZ+Cx5gyN2X9OA4vYox+wnJdBqrp2RwRq6DbIaPdCxhVp/v8HE43twderCOdP0I0DRvj/"
-    "q1P0cvY4f3jY/Y4aG+OKe7y1pvFzweUB7ks2Q2szwtbqYvphQHd19cpZpVZv/w1BZ6kkMKeD"
-    "FXsOoGqmMQAabOhkFXoPqUM7c4M+T2P1mPQZzKhXe5Dr3pvj0TcPC1WduaCYsbMj0hFbOwIz"
-    "3AQQOXJXVZlbLEYs3809OczDwI/I6prhGSPS8Q44nbxXC7CyeiAnaKmvFVc8Pp63X1ZI+Xd+"
-    "k45m3erDW7qlp1CNtS5H2pefUbtn5t0C6tWNn8J1rvxx2E1kdcvr+lcaEAY6oYNlSw9gbS18"
-    "ZbyWYaJhUxsU4a9tA/fWLnVEjx/lJY33MO5cvP5HrWutpE3nOOKLoZxXlZfetXU/a+hrNrsK"
-    "VV7qDCrMYGO2Wvol4jcrv0Enykv3R2YchO/AU5ed3yJwrfSF5LvXTDZj3dJniiFv7lnyFVYy"
-    "q2ZVM+hyd+bPgZjRgjLixEqAGUUxo8uLorOC5ylqDe49L2ocHuXjuq5Ma6PGInMyPD1PXvbW"
-    "BF27jluqJz3yutYyjuMn4+uI3GXGmQt1QvWsO9APNxT99ZqyOMZ8+Zd9X1ORxZCvjSiJ1Qjv"
-    "jKoq15J5g+ZWGimxPCuJyVUE276uw3gwXMdRSS16aoUQI9Bd6shETc1rq4/zDJs98SPdYX2u"
-    "G2AoVu5dPmBxhtL38w5yDWQQw8eM2LPXmuO1VeERMb0eirZ9LearaI0ry/dk/tdcJ3gmvIf0"
-    "Vud99/vuTKOHpuGLoRyODmYJ3sIEaAfvTN8mJwA1NLIz4DqR6gR9/+Shw/hKvK4LwG73fGHN"
-    "EIINzoqdS81C3927ZmsyHfVoNH0bxDo3CF8LgIwqJyVSX7MlcN9O5COAfftwftnqYDLeyRmk"
-    "Cq0JAvw28JuVv1Cz9sUMaYE+kD00XuuMYY6VbwXToGa98k318gNhXqpZHTlWF6N+ngVhA/2T"
-    "qZTHXX2GScChVXIG3491+Yt/DahQQ9U5XmK4qsuXud+79Va9/BAMnyMebsqzSdMCQZrRQecw"
-    "dZdNn7NtOhRDusgT5ohnyunDPvCfd5W4Vr7CowdvCqAUa1n7T8Yot4ykygRj771WTjbChMe1"
-    "4/wOBQY9Th1DRchMY+zs9Wr/b7W5CJ4/mywrUOLb443Jqj0O2RxF6UeV4PFNGzTcMg3ysH5H"
-    "Ao1g2Lc7Cx2M8GFwTuu6+yt53/2g2+uMYd4CyXhYI5hwtKJf4BjRaXU1pYgCP6qVC0BS0WOM"
-    "wpElulR7mxwXDALi7FfNS7SRrWaDkLHSdud727+sTGMKNPQkDIppV/VkIzFyAq/kvBUnPbK3"
-    "BGbLEcSIV5oxj6XRaLiXtiTYfQKfbWqFQhYjD6Rm4D7JgW/rlT84a0VvjER26+dX/tXj+iPh"
-    "064rY3VAfV2pY4yaK16IzHs3nUCJTiooZ53PFa+R+BsRRqLPcxhHxpBrWWpa4wSbmJ+XTp6g"
-    "6Qjy6iiOxHLgeHOtq52oGq6bx6rqFVsfq5JVOCZ162u4klVIrjm7hVhWwvSQA2aw7x+oCl0a"
-    "Dt7AHdJpAWM4T1wra9ckgViT4kYBKAeoDNogNM1UMNeudoa7cYURy/O58wM6kcy4Su5qUyNt"
-    "brcq7QyYbEha9H7h3D15raryfpCRA7U2fkVtF7andIgU06muydkgjMqyauUEw83WwNbFNa7p"
-    "Fy7beZ2FqA4N59TkQI9/HAPZTmOo7SHJ8uaAUP4X+3dPsDkRRRbioxriCqzAdTlBs/XiGAJO"
-    "3FI3EMxViD1AbkzjthJB6ez1SIm1ha+j9agBLkf39B5labylqh42dJtrFYy80oaCYJRkg9mg"
-    "1TSv6zFSfb31D0bMdY7JeYrBBs6fMxMQ7dL9Za9w2kOsleHkB+Qd+Ab6D1x/3PvqujIeEVBN"
-    "Qp7NclMHk0ovvQ6L1bHSMJzsZGdxFLy0Tv+VUTKo6mM91uu4xGGGeoi7mObdOLvY+sCx+Doa"
-    "wtHEpttNUzyuwDqxWlKvSP+XPGz0skMSEw17RijG3XN6DkHwWBc87KgWIjpcXStWgKzJxjpN"
-    "aYYr6d0FnlStWc/Mlj4mhmYkTZ70+VrctUXkWhDv2jo3fu8mmGvVyXYAubsROVYKU7A8H45E"
-    "YHc3bDkSk+EA7noqbDluznfqhzFg2hOSsSS+wo1yeT1fVy50L08vShk5AYtM0wV37bu9eJvF"
-    "dVHBK5CEGKqBzdA8SeFeisjHBDcXWlkNBDIi/+uyO5oN9Epea3d/2du1x5vVXyMoNziCcDqW"
-    "+qwcwci7+8gAaX/Z7r73jgy+4H2j9ygLVgfT1N1SLrNoWGcLLFv/2gctMmLaYykj11pbKrDP"
-    "TWfNhtEZQ2YZEwXmf0f7q9bokDl+QMuxzC+Y9BMrdPk1ehAhrI0mP0P/jvFX5IopHUKdYUFm"
-    "eIky87egz7fJ0VWr2w1O8Cdy1uQBWRkU3C8L+4tDfRiFNlEch9fBEtDXlDuInyh+Mh1r3BMS"
-    "7QAUfZ1B1tSYno8akTdJeJPK7aK7B8E1YqfIHgzjIHjsfdOJHYxcoyfDa9XObe2HRSN7gEiW"
-    "/K2zEJqjLzGHO/xi8wUe42Q8mczTY0nHSQYadBURYc2ZeVq+G73XMkmmpzyc0INd29GO1ZtB"
-    "Ju+uF7NluiJ1XhcPb8yXp0HTGYT2dPxqzmNp/rYyAzUzgnFKmtLjE3y+35xEWAgycMta5iW1"
-    "7ua6NmJvwbxOEqxG538EQNg412QBHx4pCEE+RkBIzwDaRgzOKLrBwmiAdhcOGu+rrOcllIUM"
-    "2RnDJPv1DQ3aYkjb3NWNyJVNVHe1SFzXRYa607eiIOnZdau7tTJCTItiJesTvW3yL9olJpNm"
-    "VmMZdmFzHxRCDGobV/ICrlTO8IsJEkbDmYys3zL+JtfKO5mLDCM4zL484wWNW33eTKNYD0wD"
-    "EYH2rmXyGT28d/MzLJuJUUZLpitVtZEma80Wmz8JDQPtPycDloiu67J/xmcldBLVT5ii8z6N"
-    "Np+9G9yNT9d6jq44yWo4VmGNN2WWrniZGg6L/7CODut07+JxoTasgvTc11lcvEuvOXnJo1G2"
-    "w7tNWRzzBBqdp1WuOu/Sa4PDaHSsfOHgzbLKQxGDI4qHQ27w18QylTqC11rVtVYadZw5odBY"
-    "a5agHLybf8fuMrHVra+1McwA6DCqwc27gB14/bLj97ouT9jdvzgX9hWLReK5n2Sw6VhkINDF"
-    "IBNSFTv/fZh3Rc/3Pqq3ZL21Y7J82e6t7biiWBolOwoTF6qD1rY28IyRcbb87XZrhIP+yiPK"
-    "9v1Trw4vMrKPxLd1Gls3eNWcdHUxuIEGG1pkUAmGOgVTqeh/vYE6y1JpAQku8BN5AQ/oQSzg"
-    "IlPI1gIexFswMwDUnnjet8DVeBPfqD/6FL9SP2aVMQJWHCp1SbkWrbCZPL5XkEIyMCqurzGP"
-    "QcTJ7HlN6V/xJB5+ClJmZOCxcubsEcclGa66MV7Z+XYQhDWqav8TAZm5HB0EwSiZMWmf70Wy"
-    "CJ/J1zspsZtgY0IjRktuT1zbVJE5NcJPeT22r8zDPl0+HNHgULGGi1rbUBHcvcGXrNmmEY9q"
-    "fUh1Zk5eT8/cPhFpc/JB7N4OLnGFZRidVKqtPgjeOIfS5Om9sD2A1MUANcMUuzbMvv0a3zbf"
-    "ncfF5fg3cc58N0Zr0sqG7EFxYlCF3t6HqfastOaIaYSDncfuZvYn+7hZ3Zj5hxOR/1vwkKvp"
-    "oL+504+bxUPIPcvMJrhmHjCdkx+61pGJTrLh3CBHi2ej4TJ+Na/VsnE0BOYs6GxJgcfeZ5GU"
-    "KqkL1T625+eMKHukhsqDFC/G5UPAKsgIiddM376+qBdxBS/oLbiCj4wlpPCI+BTxyHi7kpHP"
-    "24MSXMFPwCX8jPzL6+2PpUvNkR3DCMX5EMasEc4BsFVFR5OMyQGZ/KiXgNj94ysnyqXgvTfO"
-    "1eZKPYlrGV7KIN3SN0QEZKuATwMi2ARsf0++WFNOA/UGMa/c3S0MwAdDvGbmiNVnMO4b2MID"
-    "trCua0SRiwZTjE1FeA3Y/HpYvNnTBsc4XlsT/Gs/cyxm+iZsqboMB/cL7CvEvZmFeg498IS4"
-    "qhiGepKOmD4dxe4uy+bMGHAKx0rXaxQtRHXnqMj1eOOoSRRDwoTqfNh+vxhHl2oXt0MbHLOm"
-    "FktOmbCjLiJXD6dkFHgZaSezZzY5ph0QkedYv9bVffsHz1w2q18xCRsrwjATn613V/6nlVPN"
-    "RNzSc+9jfcNKnoLKrV0NoiVCDMcO7lZTUidCpIyD5aSpWe97QNXYtQUop5/xUGFqkgwGHJNC"
-    "Sp55BGpvhriIHr0BichAxA1uzRN/AY/AIyOIkPIUySvst9AnxlvwwXgjPgUegU8Zj7VSSCGJ"
-    "R+Aivkl+XhFQNT6qA3hkvAXfpJ8Ff0X8YeAz3SQvg4NWRiSFkxbrG6h9qSAYu9tRWuqC6rgC"
-    "Zd6ys5DiuHl8XrZjuI97AWfyFETtE05G4nBVmIfDKSBpvhAiqicIj0JYQUWW7LDB3rL3hQx5"
-    "aJSxqzBiG7ay5iuEoIywaJEv0cng8WZNfZQl7ipo9IezwY4Km+qKcS5bm8F7b0nrsl1kMrjR"
-    "tGnRn1Wu1cBW+SVpT3dfSJAW0CcEbzbG49xuBWgYjYAYt2lnRmTcXkWuAFq7/YfP9RYmSFvh"
-    "06ehb2p0UZjac+UiU+oVkZF11+m82dVdncHFsHpEYMaCcX9MW5WQaQ8QQ9IOITy9lTIe7Dzg"
-    "vpBqNLF+C9T57/k66NHgPZp2s/9mieE/sNayIrfVu2rX3t37GDUdN95QYVKmDU9+6WZnn4MZ"
-    "celEV57g9ikCrY8ZH2LOgxq2R+F42aAm7tYWzO+L1kVcETGl5oj4Alzkg/y0ltPDPtn/or4C"
-    "FxmNi3FlZOuSPj3WFQTw7P7YDfJTxM9W/izw88xvyW8YRiFcsaYOXTkRZBpjpjdYOXM7ZoRL"
-    "L1jHdiS087Y7vkCD13jN/HDeaksdz5Pah5hvpQxoSxb6JOgKJlQNxtUPRXtWHMRtrGFM3k8k"
-    "4EHr4bU6XWH+9TXO6dm/HFPaKBNV/tJHPNfTinf78jfQ6sVlcJrEUKPc2YpwbczASTPyKeTx"
-    "rF4O5xIKuHuXTns9zedxc73WFhozj0YtN9aB3R2RjRDZxHPfviU97vf4GvYtgxJKAhPyiWbq"
-    "JcbPMCvSnLlYrhp/XzRU3R4fW/XJ4+rCMTyeoOk8k4UGsWKpO0rsSmCtyIhWPDd2a3dNTdfV"
-    "qOMNFaT8jxagRtzSxy5LOngGpDiuIPO91Lp7M63D7nEe5pTQotlsA18YmqbDSn1O5xp1vb8t"
-    "p7DGyLLDub521Uym2wEUTxgpIT8faLIZ208hdCUfEVG9OFkVCTwyFrSki7qABazWkhb1yHjL"
-    "i9VRujKWsIRPmRcQUEPPwlNgxLcZ39b+BfBN8A34FF9PN3RZ1qJDFXBHeU31/OrC4JAUq3KS"
-    "pHjYQbmP1OU19H0Z9Dw48KifQfy0S44w4rlbTIwV6QQ3LdtTX1iDc01Ve8eGXc1IT3T9d9Ys"
-    "xOE4KyGZF5LV5UKJPxl9V9VwpCMGwu6EZ+D2suGVGCE7ImLA5ZbIUF7IO5ZIA8GZ1vqksaHL"
-    "mxtaOX+3EIGAjUqD7BrAuBzG7d93LeMHpw07CBJ7WlfMgm10dZy4NlM0dFhLnoSG2uU3wyHU"
-    "VnH5/JglZcCxlSNdwXna5xvxs+C31MWObQrPvcF4PC7f5SsWS6FWVSb9U5WoWFyPCZTsOj5e"
-    "M6gQjPxPj5VrbfEmn2eKeeyo9gMhV+YVe1IdqRy5TwM1Wmh2dbWRJIyVLe1dbq4n1CIT5G0P"
-    "sGXcGsuBpX8jFQZjzfC2xsm49j5DCfsylrmeqJNRvWZuYJmO1FqRSaS0iAt8RHhR95YZwBXx"
-    "iDQIhuqklrDAQAcBx8c0AH1L/AH1LfCJTPVC+KKL6gFxjqhUlu9kZoAqrxaOrEoKUerHlZnp"
-    "WFNDR8o7m5ybzcZmHDuBe6G99zD2Bx4/KcqO8/QnkGvBE48j/4gT12aJlcmKOlEDL2KQBZgj"
-    "bj0x86Jt98TY/czp9DJCL9mNJEe9+CYhc/a8U1tmHvCo8fHtuhdfwydMBZnhpM3dEV2lGm/e"
-    "mK5n6O2ndvJEMzIiZGX/MC7BCLfxQccDjOqlpdfTQsRa12Qk93EMj87Zlb5fQsOMknhlAtdr"
-    "gVS9nenpQsD1Os5DCioCzjNwFcb5ysQIA8CcPmF/maMb/KJaMHBXNVjtr4h778wxAZIpsbs/"
-    "fXrk/5ZExLP72b1nNQ+reQVvzxErWr09Tk0W1ETJYjVkjvTwJOUgls8/q9bTAJqeLaJGW99j"
-    "oxlpztE80iVfxm5tUORzjyXwejiIAh0gY5ugP12ihVOqsxT193DlWkE7FfJl635FQms2WAEk"
-    "cGXSFtxY3+96b6zELxN/sNa3mTYGzYhJXPyJ4Oy8ISa0Dz+eY4jlseMf0y6Mvz4EcK/fuCLN"
-    "9Z5xlDeKth9R9y6LKErdbqa7W0TQekdHqw+m5OssWFORe8qZzLxm8Z5ToR5x7jCkhxDm+KKW"
-    "2r7iFqf/tirTos6RfEzxkQfsxmOBHZaere0njzN22dRoda+t3ZBs0FRVp40HADOMspnBWI98"
-    "pe49IaxDxD1mFSlylXRP+lNMnotFIGo/2DFEhHa6+eF+xU9W/ni8mbBlMgkyuAdxOjrh1sbs"
-    "CNp937XWOCRtMkKZ63LskHRCakTetf1OmfXnIKhc15BRSU2dDjLQyMjrsda67l0gV1zj3FDl"
-    "3z2uLXxU35MPPLyMOorZ67pKvX3WcISvtWch6/wOlxCjD0tsJ4zFJbGJyNCxmladT+qVmRch"
-    "okzW9l5f6EOHbWC3zDEOUDWbb6/v9xBJzup1rHhQt2syNlJAa83iHHy5zAMIlLU7xCNjnTHM"
-    "l8Z3d5H6VcSf5vq565cuVjtBxcoWapivHA3Ga2qC4Fnkg5a8x/Ekj6XoeLomCXNSG/Ei9hhY"
-    "BwNfgrlyd4HRYKE9JkBrrRhWA2znXjy+527YA1N3UXbhHTmYxYAAKIc8edY61kDYdRA+oT2B"
-    "3Nb22E2XRuoFREmeVK0IaHNK5df3OFwHe/piprgBCz8w66WX+cTRhy4ZIodbefBMxq9qEPX0"
-    "JFkT/EV4iTq6v5ZmrBCTrDo3JKHwZnv3Pis7DBHdMYbu89uC6/DMb/RFsxMdP1REdN9hGflB"
-    "RxzTfzmStLY1HDp0Qf8ChunWikAfUwAk9a4m864aJvv5ahisOkMnws5SCPm3wVt9jyAkwjKA"
-    "A52PyFixJ3tqtvYDMoIiYhnLGmF75BCuMGetUQ8zkJh+Qye7zW47p62yppoOzsPuoR1PwM5Y"
-    "sdKvwUxx08MGv8NzHpg7gSaxGNTkaEltlIzPAobjnJDjMdQiaFOB9KXxXp3EH138gyuzSl0U"
-    "LUs9ZZKcn4KAI20n9j7cNWg0lQesEZP04e5rksdeje7JWNHgK3Uk3Bkn6wcvVVhEqJXHLG/q"
-    "+rom/26iy2IeXOsmNam8M0uM4yjEiWUxQXZd174NEV2CkbQeO/NI1/Cidpkmb42docoH75wS"
-    "fXWfCILwxTLrxglvmvLk1f3PL/sVzeaXhDnehq8FME7UsLW9BgngWFkO1OLYDu0HsiA8Vx94"
-    "1bAcpjzJ6tpH+eGPu7tqTFThhZsDdPzEYoxWMyZrGf4xuEuDLfzW5LVs/rcwfs4kMnOAbNYg"
-    "RaTIx6fPPfvblvq6FjP2fnbtVgu61mqVb7jMzL9JPluN6IFFxJnLwzrqu6uo26ZJD5C966dT"
-    "PEeQbxWGnwkvGHtuEkWmHVs15ljGWrCwJvN6exNwV8c1c7L5FDL3FsM6WFyZ8j+n+gBhqsGM"
-    "Bu5Wmyw/ZHI6oTeOUeH1IilwlhM4XRkjaCNRAiV9iNX9syv+9IrPrbDJQUjCNTyONOVM+ljW"
-    "T7oOP+Gpo3ny+X0yvowHC8ZaSyf4YyjTRzfpMaqjqH32zTPqhPQWwYx17Hd6PC51OzyJJ9gV"
-    "L611RphHJ+UYPGzTbYSJ8JBQ24BMZs7w1u/PWmv0kvMzTHcAcOwoB/MQQUNHh+wdlsRGHRnt"
-    "VxQtkBErl38wHzuvKYffz3NwuEsvd6p50nk4XO5ZYfh3dHF+IkEOamwkRgrkqNmmQJC1GZ4I"
-    "jkdtACLKqYGsjoaA7Sb6YD1dwHMGjIJ6ndiUMzWj3QgQbnWutdZqp/bZepird8WrDADJPBWE"
-    "6Ui4rvXc92wlMnNlq1aG5T0M5m8jt5oZsRYCVbP0sl4CGRvaAiMjV3evXO6TM7yA6CPmmdjL"
-    "PvwU7x851QVqhv48jTg6wm/18y7PnLf3K4PgG/GD1SNOfvCG/EwgTWaZw6Udh5sRp5mZjasL"
-    "0zi2D+urOfpkHxlJXMG5gcmP0kX+8efrW4i7eCALi44CnUuAx3Gg8Za6rjcCbuKHjg5ptuE1"
-    "NJZXGT8OvuSC7XJA15Qcdf69l3ZZJxZiZV7XtasayhVhQIdj72SB73Q0HiJuNU6sueXlk4+Q"
-    "qWFfUee4OUop+jqNMdN6+zU+fvPArrV4uHBWtfi4eflG6qSSD0r+JRIb6oj2vl8ji5HwmVUa"
-    "cT5dnjp8PoduWKl+LFxInJYRp2Y+w/o+dOsBKU4mrgUvk3fR0HbDobFhe+HnTFZnzFl9Q2Et"
-    "CydGeO1vfmUG0VUeyrSJdmoTds1s85TRYuTp5P2N6KilEMawub2PFaM59xAjYq01PIMeEvCu"
-    "nb+1gzRpXC8mq/J0SsbkT0iBt4boXfYiRoY8gI8ZoPvj4IEDjqBdX6VHmsnEAN8bx/AX8fq3"
-    "IpPMvScZ8PRBI3BvId018iR9gAP4msTTqHtI95YEYjoyKtgjXviar2sbgfmIauxuiT9/XL8I"
-    "sTvGOcs1JZn7qK93hf/hC8nvl8SFn4NtrMTyuvi1t/DTUtUzYzwAZN+xE1wzV/IA7lakPZ2m"
-    "Id57z4fpkrvn2cU5fA81kpqHhNEz22qIy/mpLxqh11dD7zpfVphOrtPkO5XgWpmRaU8fFPzJ"
-    "lstzcjJWCOBaAu6qtS6OB31koS+W0NFX9VTEZ24/LHqzu857OD9WJoAuuYKNcCRQaKgBkZnd"
-    "1d25nNbLLngW5Zg6T1z3yQ/o+d+hc1PtnAYeVeu9byfb2Bj4FffpEvyMeFqIlWfaQYmSdiuu"
-    "da11EF3GGOQoFdzyjICkz0M22InGqEyr+963H62qGgMhkX9JKhArDjOTpPfIzOtRMp7KvYf7"
-    "yHKGz0ig/Zvb99NNpGV31XVM7Qt0dF64uDpK+slS87Daywac+YtBrA1wXTaaePvvJdQR9mCO"
-    "3UElvOSJ/MmqY7yXDkPVsfXWWaKrO6VUrIjkSA0/r/g2I4XlPnGSPq0P6aPRDdBvXXvYaHaE"
-    "HRWU1JzsMAYQKpdNYf/PyjjxKGGBRLdOju7J5tAIKgY+3jD2LxUEm7irmGsEj0JbARSx1kMO"
-    "70A3OgPJQB0GfUbJooIgoqFYazrsVySFrUp0mzJnpRvKcMnYTWHXPWfTWfPZbrrW5SFvA3fV"
-    "tS7/Xx/X5egmZ0XmSmUgQh3VdRJJzhCLZ19wQslPMOh4fW1j9g7E176Q13og4r63IwJr769R"
-    "Pg5o6poXmNHpG3wpsnSOHg+ZKKBe0zi1Vq7Z8UwkjN/ODTg16haQ10PCvu/MZU5jO8Iks6og"
-    "hTpOGzHvDjZZU67OVIWA8hoMR++R1vrmP283St1A/nUeEa+kwooIyEj5Lt0nDobHqDns/7Fb"
-    "GoM2itCMVZZej49gkgEsLBoIBs8hGrHWBXz1sp9IuJHUeJZSPcOnTIenxTkCYL5JZu75hF+7"
-    "R77AThoCB62/sSsIRz/kxI+k315CWvY2BFMdMvzVkZTyJPqEFvjOkVUKvj0WTyaroyFKI1E4"
-    "zuSqsnBXLXYbfTgIHb0svlOVY+x+1iENnc7dhAaCPfk942f6mvETziHxZeexoDd5TtlTzJLG"
-    "w8yYDXzP0NOLpe4MntDtUUtPqW19v8HiAzNyvZMNHS/KMYqWImKt9E+PbmdzRCDWuk0S54m7"
-    "s+QjcJyVP50C4spVg4IZLsGyDlpRXS7fI7MsyZ6kRrSYK+3Id1UxkeoHb2xMwkwjveIce6Ay"
-    "+QIonNtlBmn5Vbv6tUkUY+8ScT0emkGGNTPDVzqThQFo76p1LQby2KFOuFf5sulS5jXSJobn"
-    "AsmMXGiDRCP/OmD/N0SDj98iQ127CzD36HjQXpkphzb1so3GGlSaYFi7vak2cpzKQZL5IEe0"
-    "0F1VJ7XnhGjxqBQwNMBdU6ILiLVsQDFKCkCs2KX7wFB6UsJmAskDOPeFYJ2Jy/GV2d3BvEaN"
-    "XlfgU8SVfGOyK2AdIl5EdbsO3OL6fc6Mx+OSaq18ZHYVx4kZOvihrs5YY8eBffPOfwingBlH"
-    "+tMYsQkX8KcH7ar5b3osNrR483qO4MsVyLzmzZ/MzCKP/ch5kjym61lmYpokME6Kgtu0GdHR"
-    "GBpEpAe29jb2kWif7KU4O75odVcl8+yZRwqmanX579ktMApOnS+/Ax4J+cByRTFBRxb2+sIw"
-    "n8Slb/UrenH4Su4POVKxvBbpjGytMDqijrHZfDqvs47pXXIAhUjLNvwzAPJFMnFAUvV+rAVg"
-    "rQtEFchEpMieE0xouEn0Xr+2YyQuMneXIp3u7TXayCqAWA46zW67dckhLo+LnmCkoQWRf50H"
-    "/9mCFNAjI40IIp9V5ZgpnkhmNaQVs950OSoRwQJe8eQ8CzRfKhMRfvqYODmXL6i//yEazl7o"
-    "SX8dx0xEMpyIKZ/Z1jH5dNxOgXBMAR1jeSJA3K5Y1AW2xeg1mdYujKFi6xFxRUTLb1WIK08K"
-    "4SttjnNIx+HDZ3B28UmHRB+Zjl6knxBfkA11kcrR8fEkng94Tyc72/utMxeNWDQ6f3ZqYHXX"
-    "2ARJZ4v5+xGqt4sLhwgfiz+PlMJu7eEtS+qemBWg47xvHvhZNPTSOexx2OcuNewzBcBbbbky"
-    "clRQk7wcRyczPTnPFT4IWDkKC0CyR+R8MN0cH9sQ/HEcReG5t+M7ypX4VwnKcBEguiVUdas6"
-    "Q6o+UnpXRjmbHXfNTNv3Jls6QhGWP5JMM20II7s0LGt0l7UtEyPIuKtoUroNwt60rNVVJ/aJ"
-    "QmS+3aUGpV72qaMjMzIKvXuWD2n3dNcrDgHJsAl9xoXMv1mzP0TrOKbUJgmB95he4qQEMYlr"
-    "pdehZXaYBT2T/txuj1/rEUZI/QKm4eDkMnNXV/Ww5zLRXj/S4DAwbvfRI3Tj3uWI0BHRgvQ3"
-    "xDHQ1Ul+cVB9BFfGwfZzS8z1dTLZZ7suhbTsMneHFoGW7LM6uoLuTjARCajaoRrGDMGo1tI8"
-    "lwyXz1WVkdZU2NRisEp37zEvBeA0I0VGabBFay0HVnikaSmxGA01pdbek/SjRjqWcip7ih0x"
-    "z05PH80W8rpKk4R+Cp1XgOSEEcTXLU52o2ac0dda/tualtaMdVvHEAZGc4ANxwasEyPyuo38"
-    "iSIy910cwvZWonFcot01cnG8Js+Gphu8vqscQWigp8dl/nX8sDXwrBohF+e+Qfdaaaqh29w9"
-    "5CEXYupWVYts9TZbhkzmiuxqyhPFtiOqNU6gScYZGyyfdx0wcMh+qQmC8dDE2X1+gGNP6dDo"
-    "WsmINGlM5G5Fpi0CV/pyjwL6AM8miYFB8P83AFDjRuw5FsFJAAAAAElFTkSuQmCC")
-getBaneData = Bane.GetData
-getBaneImage = Bane.GetImage
-getBaneBitmap = Bane.GetBitmap
-getBaneIcon = Bane.GetIcon
-
+'''banelogo.py - Embedded pic of my cat - he's as good a logo as any!'''
+#----------------------------------------------------------------------
+# This file was generated by c:\Python27\Scripts\img2py
+#
+from wx.lib.embeddedimage import PyEmbeddedImage
+
+Bane = PyEmbeddedImage(
+    "iVBORw0KGgoAAAANSUhEUgAAAUAAAADwCAIAAAD+Tyo8AAAACXBIWXMAAAsTAAALEwEAmpwY"
+    "AAAAIGNIUk0AAHolAACAgwAA+f8AAIDpAAB1MAAA6mAAADqYAAAXb5JfxUYAAbI+SURBVHja"
+    "PP1bj6TJsiWGrbXM3L/Iqt57j2Z0Zjgccm6gKIgjQoIkQA/Sq/6D/rkAEaDIM3Mu+9ZdXZfM"
+    "jM/dbOnBs08/NBrd1VWREfG5m60r/9//r//beLzFeHb3T7/7bDpyPOanq/r3c/f6ikg/frf3"
+    "NfaL9zfaAHfHc3vrufHdpBWPz4znp7zHzL9433Zu6k9/+vUvv/zA55db1u2XrJ9eRsTcndfL"
+    "dNu7x5yRKf1EYl5fPj9Wv19zfv4Xf/Pp8+cXdMAdkKxkmq1QTsV890rvz3OGm3lpPLId5Yww"
+    "fD8Gum53BZ3zcXeDDZbyWpuimK/3+hr1O2JkJGD3HRqFYWb3Upb5fa/pepn5qe4Ffx/jK8Hn"
+    "ejhKmKycs8pf7ZXo6lD+jn4Q4/m+QJPTGg43IiMkrPWm8Ovb68hxzWG7q/Za5CcT5vte73l9"
+    "7mIoiA0/jSf76v7s+Y/p/9o1Qs/uO2J0DUHAWP1X4VfUvDGDn8Xo/q58A35XZdBmQ117sWEj"
+    "x7XtiGDQblTV3lWl+Fydec3yXfsv8zLWH3r/JG33ptfjkYrIcblRVkc6I2dw/aV3E5c8iYAB"
+    "FANtZ2T7+uXr88dKzk937b6/cVw9PsV4zOtxjWJ9T4CIYj8yRsLdb69bemmkIY4HczJHvX5d"
+    "z2/zarCux2WN1x+8rt/DHsPPH79AJUp97SeLi8SY04qOBHKMa4bx/u3tl68Yi2MUohuk0JAk"
+    "jSKrDQwHNDIySOx6vQJ9v72/ve7VdGRm9177jlRz5ZhGkGFj3Z1QMMDM69OykFEUkt095u/J"
+    "Gr4f4v7x48evv+zn090SIDfLjLXchU8vn3pj3a20xrqf78Tn5B/ga/lGPOP/9L/7NxkUroyH"
+    "29d4USDonz69hATp8fiD9RAzXDM3ocwHKWPt/ZRguMruHrrguNdXxLDm2oM5y3h939RjjvG4"
+    "PiuudjYCYBdIZgwq4KGQVLVKfnl5+azYCgAC4hrsrkwaLRH8DAAQKWUzBwPltrKa5Xq5rnU/"
+    "u51jgtqtRuZ4MEb1Buhm8qeMf+YuBTIFAIhurCY5DLoo/J7+LD1CtDeYYwZ47ZrMB/sCAiIR"
+    "6M/Mf1H4qXEZjFDEbJcp5my0GwT33u2ym0lRbdoY8yLZHm5mIhSKKzSJkGQ7UtTsFvkmv9g0"
+    "dwZtdMOEKQYU6s7r+n1krH0jTQ1gmCQcYobIENPmHFdVGwS81+32FRcJMcG0u9szFIF114hH"
+    "dwFFISJyjG6RgmgoMtrN2jAzphg2umlIkeN6NHRvvz5rOcxhxbxezAmN+94vL4/kFgsmlZkD"
+    "cCr2KjjJSSvnJON6PFz99u1LpjISHM0BX2N8ipyk1/3W/Z752fXSBrQjU5QymSPGVIoS0d++"
+    "/iqSQpmKYdMNxuymYiou5LVbOR9jzozs7l73t6+/Pl9fQ7I58iViRKSbGcmUDSLJqEZoyMq4"
+    "yEdrQFEOjsf1+Im6yHyZV6qeP359/fbr++sPOuQrIu2i1M3MkZndFrk3gPP7Tzi7OUZcL1PB"
+    "+L/+9//tehb9CE53BUdG27ftVR35AB6ZL+6m3+kndUU8SOx+J5E5RNUuOKqGdM3HfH3H7dD4"
+    "qaHr00s7akeO6I6MT4zLEsHUIJVjgCKSZEjyvMbvMhXpSBJZ1e6tEMDqbcC8IhIgY0ChMe79"
+    "NNyWLRIZQQpUjov5qFZ1QNOOrgZMwT3o2d4RaDSodlpBpuJh001ABiR0L2NFjt0GkzERA45q"
+    "r9qRL+Dvnh7WNLMhN3e53dSA1G4JogyAVASoNgi1cf4ldbVbBM1uddEF2wYg2iLVvUKPMggT"
+    "sGHSZIMGuxn5UMzn/WY1GOCDkgGYXduwmURGzr1uibYA2MiYbrobFhhupCQmYMKAyARbYjAi"
+    "hsG1C2COUd0kpoJMgDZstiGlYt7b1Szo3tzOe6MN5YPIbo8RIRB3BqiUZo4EuFbv24qrobbm"
+    "eGSO7qpaIYcIBONlzD/0DjIpwbXW20jAT/sptS1q5vWCGGVSoSgqvn35UusJiJFgGKIGOHZL"
+    "cZXDvHK+aF5S2rzmCOL+/v1+exM9x8xxPW/saikAVZkIIaVzrGRwMi7wMh/UY9mRnzM/STOU"
+    "ASTr7evPr19+di0JXaIHwK5NyuV5TQAASNRG5kOc4sPGSIG7egGO//Hf/Ru3pQz68chyS0Wb"
+    "kTEed7FXdxeDQfVe4JCut+fbHDNi7qXqbneXwMf761PCyN/t7uo2zlOZc6bRANutDINBCBQl"
+    "BqXQAA0LFilgj3FO36BMxSpYqcyINLz20sgcg4yqbTQFKcTMyPW8d5U0dhMcZoAC6Abs7lIo"
+    "hLWfgHd15MPMalBDcZUtiiA57ACzCxkXtNduExCqLaQhU21BV3Pvbiq7vMsAQGTOttu1n/e9"
+    "bkVWtSLsSE1AYth2N5Egdy0ygHB1d5PnF8BNENK1Nk1Q0YYUigRQbsWshmEwI4IMt8QB+NyH"
+    "ZIz50ptgVGPfdwTmgDuoT3Du3iOnNNYuADpPPgKgITKMVbsyZjPIGHNGDMMEiIZpd3dJeUbo"
+    "HLMgI0DuZpV2R7XGmIRssyoSESa34Ygr8qFMSvsuW+SQpqkcF6R7vT+fPygA7IZxvTz+MPOy"
+    "Ddb7+/e1nkns+tF+IwbwqUBEMgaYmSmtH99e973myGrkmDAjR7easyDlZU7EtIYNMq4cCT9/"
+    "fNvv9/l2Ro5djXjkuNDu3SQVMWISas/2BGcjGI/i0HhhXjFeMh80ZkDrx/ef//T29bfJmYoc"
+    "CglANamRWWu3zVAwjBRTUuYVIg23QTMc/8N/+1+DFWGp9n67+7nvd0LdfF+rm6za9b5rd+kR"
+    "w4gypZkxVpUxjIoRwKzVcHW95ZjUc+89x6M2xL4eIrnr2bhjZDeCHdJ1XWULggX2yAmI2MSW"
+    "hjgzM9OMazV3w4gqA4xIsNrP8q6NMaJ6B0OMKlNIBZRlkAHAcARtk+U2EdIIBUVpdmd1N6qb"
+    "1WibBOyIbG9qt9+BJxFnum6YSIPiY8xP1Wxj5gTCRkjdLUkkqW7EUJCgpKTYhjAI2rabH/dz"
+    "thuoiGQDEkkpqhuwTYrkg0xJ+O32ru7zua9lgCHsvQGtuwN0FdARg9TeqIKovYsUYaFcb+aj"
+    "6irQLDK7oRAICqs2dQHnhYEsKYiImABMKGLXlgifi7rtzhy1OyOpj0nExrjm81lVwZh7uXsH"
+    "HIE5lUNigwAiNEDc9w0zYkijGswhpdvv9ytUjBAlZZzX1m7v5/N1rXeJTKw9yD9Af7itnKkc"
+    "MS4pSTzff6m7gopIadjoNsCGGJciMwc1t6mcEbrGDPLt25f1+m2v5SoKChlSPtq91wopc5Dq"
+    "6vsuY47rJ+bFmMuw0soxP5F5zWuE1/uv3/78d/v9lXXTzhxSAg2sgBMBigZABBvtsjS7W4kI"
+    "oruKVYzUvX/Ev/0Xv6fL9bbq/fX9x67n2/22u368vu1ldH///v35+l53RWRkNtqexqNpsYw3"
+    "aMlksxdCtLv3j1Ar8/1ti2rfz+fT3tV3BB/X5dqS4WpGI65MItyLUGBQZfaIn8bLcK4Zj9XF"
+    "GNUwlHl1FVUZg4j2bZcQRChi9zoTnUJtjuux921ZGa7mttyZcCP1whjbsEVLYclAxMh2GR0R"
+    "5SYWusgqP9kCCBJAeXdZoW50QYqqXfsO0dU2RTawFxhZfcObVhdHjL02hMa498pAN9fexpaa"
+    "7KptfvzVVSLazhwjH1ICdBVlqiVXbxBAXuMBn7u+CEfIhMkzoq9dpBTRJtoibbUu88EQYTjB"
+    "wTPIhD/WDBqAgUjam7AhxiDz45UAjG2VEQyLBt21gYKiW7QoWb7rfn+6miB6241d69Pna4wB"
+    "u9rX46W6QJbd1d1xdzvVzBgh4n6+pkAgoW6Rj9DMnBKez9ddd0YQqsIyGT/l/Az2oExGZobe"
+    "39/evn9nhGGF4AK43Q7uM+soyrKCY8ZIheq+379/ef32s/uewhha+25aI1dj96KQOVFsZOiT"
+    "+6Xiwhg8mESOyCviAiNyuvfrr398+/KnroVagX55XBINozHHNLB6kaCuBqmOTDSqbaZirFWE"
+    "FNntGFRG/Kf/8DdKbC+zEWqahMTa1bvr+az7ib3RDnIMUk16zKJeQUM2OmMGs3fbu/u+77eq"
+    "rUy3qvr5fH2/n+dCkdRlMUhLbEQ1U2gXVTCDJG3VHFdcsDpIN2obwBxjhLo26G7bGJl7Fwwi"
+    "bNh+ebzYNmHDsLG7C+iUem+TDIBoYu9nm6Ko80V1jgFwVx0EhmTXOv85E8TYZZIAaWRMGCGS"
+    "INte9gJaCrbRrQiD7SZ2BGBlzN3sNklpAK2gG0RlCrS7KUqKVLel2HuPnOuuru4u2sCu3ve9"
+    "MhNkm7bONmybOtBX76rdm0SEulukuwieLSIiIz5gQ1JEgAyB7PNuSDINoF1A21W9I4MixWqL"
+    "AFh9U+iizrvaHRGhWIviIKPdSu2175uNuFdTSYDq9n5ckwCohseYmZciI9Qtg9fjUkSK8K79"
+    "tEtBMuZ8mAFIxL5f93onzqEGk6ChIY4QbYN4ecy371/vt7e+OzTFcb/vEcN2dZ8NjpEcw2CO"
+    "a4whKby/ff35+ePb4L5mZGjvvWuBvB6f7B6ZEUmIkDHs3AjmMKMVUIJSpO0xh/aP91/+S//4"
+    "s+pNgtzXnGcgLADi7j4IApTAsM8xri7neFBZ5aqKUDAigpEN5D/75y82pBeQGhnD3e8zznNK"
+    "1P78eLD2Xrvu9fZd1zWvx1rrlex8/LRvGFKM59sTLMoEhWn4fi472ti7MzJCtcsggBGaI3ov"
+    "4wxsCnWbZm2/s/h45Mbbj3ddTOz6ND5dY9x7d63tVVU5xn2vl8fnvTHyoh1kraURVaurRz7O"
+    "lxUE3LTX2iHF5K6n4jrrDLohkugGyb3vKgdDir3KQCh2VQZIQDEvPu8tKeOqXTaqSwLQUjcq"
+    "guJudOTo3jAiA8S+y6am0MjI8u4qALUb1ee71u6qUoS5XU0m0DFyraLOe1TlTZZhSVWQAu5u"
+    "Z6hqlfss1d0tMTS6e+8tQATIvZ6Z08pdlUKEWF21QVW1VXNGo7o22xC7i2i7MuK5u1EhKe0+"
+    "AAtESSygqkmfR2K7wauqxwBge11j3iP2DqpsUHB/wARzXvdqklUAsGtFkHGJDWOG97rrfrpX"
+    "ZFQVOAiCUKD7fr7/QFT3kqLbGiNJ6WMCiRGZfP365fXrr3PMGEnA7YyIUK1SRES0mZHbUKRE"
+    "ePe9vv/65/vtdRAZIFxtEoTclKGDI0LkMGFHjpcqIAfHbOLMu1cS+64fv7x/+WO9f4mMjoFz"
+    "K4hrb0XY1W53x5gRs0u7BCgsV5AFJ6wYmtfsXSAPCpDjU/zv/+2ntZ5ANFnVa98ie+/MMWKg"
+    "fGW+PF5+/7vfE3p/v8WrXcVSvjxrt+kWrfv5rgiHDd+7GvH9da+lMqp2ZrhLDMUkotbO4BgJ"
+    "ppUpSCCHAooiIwKKzhFUTokFf8ChFSGAFLuIDwq3CQd9diMF2zYwRh7Ias5xvoUKKSuG99qB"
+    "MXI2DHjdTwXsFk0yGLYycq9tOGPYq+qNDIpwnS8BYZ3jVw1U7ZKYwb3uTFKoukMDgFFdTaq6"
+    "gY7Umb1zag7Crtp2E5SIgwsDgkQI3Q1JoCO09016zkvKqrJ7XCMYa+29N9kK+jxyIwCSABqw"
+    "CLiCINlnxfJe9/tMrH1TUqCxjap97mQBDBp9Ew13KgnPOWCgYVM6+yBGXFAfdJAk7Ii5V0WG"
+    "1Qw/73pb8eywlDEyBaG6QEVOnY+NskElyBw/NZBhsXq9r/VWtUdeVaHxyHkpBHfXIkoyxCLI"
+    "yHlFigyYKc4p9nr/8TVInJ8dfS6ZSNkGmSOBjMiRU5EEUvv125/ff/wc9PXx1PfH5W7biBhi"
+    "AAmMtW2QmlA0Y1wvVFAYY1wZE3f9+Pn9l79jvWbirt4tOA02CPneT5PnwLW1C2u3kIrYe0c+"
+    "wKzWXcg5KBkJBJVNOTL+h3/3KRTiWLvfn8+9nuu+4V73up933bt3udvtn376neBduOt2wLoA"
+    "4uBPcAasuNdCCMy1tXo0roNXjTlEdwPMiJxjSl5rOQYYez0jBz2kJssgyJFbkS+P3wVa7rWL"
+    "CuFgohCZee0NG+13ya6VktuNUqRB2KRT6e69l1KgugB3kF3LvsEh8ex4Eu/9DJGO+1k5ErAy"
+    "AQAbvq0wCui2AQcJmHTX6q7MyzTpEPDB78BNIY02ECMjpXOzwCSf95vYIRnkOQsglyEKdDfZ"
+    "7ooIoOmG212SFKPKEVL4cE1SEKA7hoDae8Gw3V1xToUu0QIYefhfiSGUb5EGKJDdvUn2RnDC"
+    "Jkuw4N5FpkQCos7nHiGjdi8gEajaJACLEiJCMBjcvZb1uqI5SNndQLshMWLMS4DhtdYHPAnY"
+    "0wcjW+/7fiMMk5ri5cjMVIR7k6i6TSAIypQ0nuuZkWOMESTWj29fggbspjTAaDBGVhkHq5By"
+    "TDIixuPxsO/vv/6J+zUTEty195KI870UYVb3NX+qZlk5LsUY42rIkcppembOkez14+e/X9//"
+    "ijOk2HYnofwdI8ttbqi7OTPdIJLIiMicZ1HL8djF7YjrMkkixosZjFSOMuP/8Z/+Rpk5Po2X"
+    "GhmfXj794fefg/np8TmDc86X6/HyuFyra12Py+Tb/V72wWOl7LrJthMSEAbf73pfsXp0c+ZI"
+    "wbWqn+6MTHLDPWJoXICGIiiGzGxse6MVKcW6xiM9wRUC+yIcw0aej6JbwiAMroieg+3OMVOo"
+    "Kh7M2WZ3w1REBtFn4SVaGpGfGti1jFr3091EAzc5jLQLgM0Uu2rvHCPPSugWZbQj0nYkIe/u"
+    "oHsvoekmLHetjpw0KUFdXRSNJ62AhIZ3V52nPiMA7m0CIZ1BsarcPudktckg1c1uRwSBvZdd"
+    "JKqrbYVkwzUyMwT2uZKJrrrdjbO8olmtUNN1YHDbLrSGgsBeRpSAlFxnegQaIwjsUESM7me7"
+    "Rl5tBhOoMaLrnJAgVW3DCJbH9zUcDs3yajQpIQ5GPDLX+pFBxbRbiDF/lyN6f6+3H917ZsAh"
+    "vjACHhkZer69f5F8fvDMISYZLoz5iAwJ6X778UvXDZoIknZT52QDJIpjzjGmQdNjXlXr1y//"
+    "2Ovby5i2gQZqzMuGkHuXIpuxG3l9UszqUFzUzBwxpyUE5/UYI3t9+/Hzf35+/6u7zG7fkc5x"
+    "QeMInxiq7hhzvS9wZVzw566uuiFygGPsnZxXjhER3d1wM4pCXGM+FCP+L/+HF11Z4OMzHtcD"
+    "jQgLGJkj+Rjj0zUfV47Ufb9V9ePx8unzp3vfz+czM7oKrkPTVJtMAKu6HI3IzEAHS1hjZMQV"
+    "wWBnHARCAoY40Im+73eyxxAgMTMRGCiIRiRjQd+AFl/OtIYWGUBlOtjktm+xIlIRkequDGSM"
+    "6h5jhKL2jsjuHcpDt2aMXTukzN8UIEDdFTlA58jaHQG7r+vh3gIUE2c7FULR3SS67eIYKVFU"
+    "RmZkt6sFhILmghblUGd09EQDLqKDipy7du+zPiT88cC4i/7AgRstaeRcVSAiAvSuFaGIANsu"
+    "u0AShqv7Y3Rad0m0PUYq0oAU511uuGEIhHWIcUq0lGhqRFd19a4tiTyjPcBwxXnsI4MgIYSA"
+    "rt6RUzHJqH0bO0dSsRbvvkDUdn1IFhNg7ZpjKuB6gznzkWPu3dfj9y+P6377Gf2DIojQVDyo"
+    "mNeD7r1/tJ+Gq1qSPwjniEhxPOZjJr9/++tebzlCJEBFVFe5Y4wxH3M+DsO8y4q8Hlf7x6+/"
+    "/vX5/k0ol21TOIhi5uzdDUc+GvFc0JiZL9Q0lDmdow0GrhlTvd5/+frz3/fzG8/TQY8hEmSs"
+    "ZSIy07YkmMwEu3e4MqSRJJRjHAIOFKmIoGRyvnyqzm0xJ6n4T//xJ42XxtX1rKe9a60fQnft"
+    "+35LIMMvjxRd3pFa966+M1WN2rvuApAKNBlRG2/v722uTYCC6Qrux0uA7AbZIyXwvmtXE0iU"
+    "6navMZgZVEpBOYgRvIIRpaEI9OprflrP1b1ClIYURINNFlnkcm8g770kRTjCtTYQioBNAMYB"
+    "9zI0I6pXxuiyxDNIBoNA1zpC5VCs/QSaDqJt1xY1FQpW1VlQo7tCw91z5NqbDBggIgcYZ8Fu"
+    "r0NAicaKrpYA+rqutYrgQcQjjvzmXOY4o5vP3w2AUoBob6Jr30AfWSnZRsEkeoRq7w+giRQP"
+    "Jw0C973JIxloBEEaJmEX2MHs8l4bDEgiu6p721AolJmaF4BN5tlpACpUXRQgtbG33cgLUIF8"
+    "3nWvfL/FMEwGlQGyq6WwG1jEuq5Hjhc3DM4xvJ7388va3yJnA8alvMa87K71XvuV3ET02cw4"
+    "xvWCpsQxLpg/vv38fP46gm5ToQjDVCgHkMqrEUAoMjMfj0ft+8uv/3m/vyVbaEIgFGFol3eb"
+    "ihizEeaFuDQuxpQuKix1jBzxuDTwfP365+8//93gE3WPjDHm2fuqDUTEoLJ2dyMzCVYTcOhx"
+    "5aeRnEeppbi7c74cDRIRVF6PF2tCF2MC0sj8Z/+b3+l6KbwEO7dQD8W0PfKqvV6ucSXe7+9j"
+    "5KffPWq5d63nHVd8mvPbt9f72Z9/eixXaPTudXcX197dSsINCSbuKqDMMHmvlUgplaO7j3oh"
+    "FZLvbhnmkmnIsT1KUq/V5pW/W2+KhNJzpAuER+bdK8dsYsyZYBeu6xqhe7+XqRxnRqjacjOT"
+    "DBJr3cuvIMCLmPve1IqQW0QHi0bXPkPUkTJWkTFCo8v3/XYNAsqM7h6ZQry9v0tWsN2AIXQV"
+    "qF0LaBFuo1Wr2S1lBO9a91rwh/Yt5L3f2oog6D7IHwGREfc66y6qtlBoXxlNurlWR1LkedCr"
+    "6rBR7Q7Frk2huve9M2btBdBw6rH2pqJ2Z0QcTR8wJwHd3ugifV2X7XKvvRnJvhEQrojo6q6C"
+    "oWi3FaEcTexym+TYu0KMccVO+05x0ymjVTowkjIROau36468poT+8u3bt9rP6+UnaNiIeEDD"
+    "7KrnXk+iAEYOpKtNCSA/nkc+X7++v31LUTi0mKDMjPtZUpbDGFWA2I3rMdz725efvfbLeHhv"
+    "JYF8X5tkdYOhvBSjy4wBjHITmmMSo1fZeAzMybVeX7/+5fXbl2DRZ7zfphXc1TbKDp2th6Ex"
+    "Yu6q3vt6vLCHrfa2mxqrrRgQR4x1NzWoMKId0kA7U48Z8f/8P/978JLmYE0kwDE9RxJ8fLr+"
+    "8LvP84rdz+rdbgIjhqvKtcufP/2uCm0/n/cu79qGxNjVVA4dOQ6hkmi2iUxlqIqKZAyDQIOO"
+    "HAgDQYyZoAOlMeLxEiSSvK4F3x9yUKwxopuyurdGVHfEJIJQjglj187geAzQoLpMYo442ED1"
+    "Dtpe5OpG5GPvPUaQ7kLIcLmj/QFNi2Hn3i3GB5bDIhFKKSQaXfeOo/APkdh1hlg0wGyp3c+U"
+    "hgbabc35MLu8bWfqsCB2UTaze4MVZyqgKJkiEgig0Us04RHByL0sfTA2EZMGj9Iu8vxTu0Fb"
+    "EAkjEauKwSY/sGQSYFUR42O/P3uRPsSnlMuLmHO+2AQyx7BduyV19Tjz0IH47ILhcFFBBd/r"
+    "0Z7thSJpdrlbkZE5ryl67XdKUJgOYK2f1/o25ksjqAuR0CNzGrWfr64KEeQYn0xIYTPzyjFs"
+    "wPfz7edgiSnwQKd19mANMswBDsUc18iIvd6+/frX9XwLRnB0Few2qEO3BpRkGgITCmBs0ySZ"
+    "VOTIl8fj04PvP379+uXPz7ev7H30f7+9/yz3WosMMglVWUdqxng+FyOuMUIPMsFtdlkcI3KY"
+    "eUYfIyKGGVaSHJFDPVXxf/8f/110Prp5vydC0fOqeb2M8RnyzMlY12Mw8vX9CTvEcXFVP+9o"
+    "xpypWOV6f/Yu8EgyoKAYR9bMQzikAFeGKJoEQ2hTOOLuiDYaHWIwYOfI65qRmiNghD7RFxyC"
+    "IspG0wpGDhs5XhpJtL32E+vu2kW5VECQFcJ5Aqp2Rrpb4hgB3qnLPaUJcsYk/bF7NtocI0XB"
+    "QQrWcQjtLjdRQQ6zqm+AfVbHM+nqSB8AYiRTdLfCZfUOKYowQC+yyeOa4AeVghBo766KkYz4"
+    "MDwgfHQ27RBSEEilG0c5RdBdNmxkZnXZ2227FcR5/cwud2Ncj+N9EzwnJdzPJyEpu1cE3EgK"
+    "ZgN9fEg599ojQ0HIiiTUjTFSSftD9N3dhjQCLduU2gO4aqs7GCC5VzXA5JgZMnBnKIKMmPNy"
+    "f+39XQ5jbgiRipfIGeF+vmLfhkFKw8etw3QHyTHS+/397cvz/XtI+k3KroiCLUWM3ch8hOYc"
+    "Lym53r/+8qdeb5FK5REOHDIJ4LZBSJn8BIg5C9mcYz6MBON6uR7XIPbb9798//aX/fx+pUZE"
+    "7VsIuBQ6+p+IIY6zNZKTiIBqW4zPn1+gq02pI5hzbgO6kC/OF+TnjKG8mjEy53wZ0Y9sv335"
+    "5c//n/gP/+qx7rXuH8/3H+/P/f7G7z/e3l799s77vt/ef1S9A4gYytzV6/kmdoxr63Fv7645"
+    "J8l7Hd1TVe8GlGkYbdDABrZdc86qqrKU3QaaMbd9vsSMgJ0x3KAcSZ5nXjSsj1MQRtutjMyM"
+    "TIbELLt7z3TIwTnGlSOPNAcg2K6j5zWJriL1oQWPoB67so1j6SG17k5pJCGsvXDWWXDMOJTM"
+    "4ZHIJkQ54qhgZDTQmdq1ujsUoZAOGUu7pCBH9W/f/lo5yFCdP96EZZ9XCMqGQe29SSkGGYeK"
+    "5Bn07aquD9sDI+Ll8Vh7H/7IXXafc6uqbZJ5mAgyfiNdIHmve611zHFoiB5DNkIse1UdDV1V"
+    "Pa5Pj+tFSkZKB7BDd3XvRtkNSjGqRYKIw11HXka+P6sKsJMBdGZEcF7KQQpSSuN6mTn4/vq1"
+    "e2U+qpOZGtcxqtX9fr9/C/nI1XNcI6/dTaaokEbm67df1/16zZCyy4ZItqWcikGOY5O6rmuG"
+    "sN6/f/3rfv4YIVeNnATX2kdXmaHMPA55cjBGU4or8jLC6vb+3afHFf7+y5+//fIP6DUCe92Z"
+    "A8L9vMGWAMtAZFAJZMbD5hgXFYxomJzGXAUzlRMR1EDMjjkenxyPvF4WAvCn6E/swb9+++v/"
+    "9P71T/V8xn/817/bz/v9/ceu9eNtv7+iW6+v9/cfr1++fn398X3XfQ79HBNjBFD73ghcPylU"
+    "zbV2t8mPSfK592+KVsEcoa6yi6TtvStjjnHZLdHKVU3Uh6aHQbLcjN5dEl9eHpTm42p/+GMy"
+    "x3w89l6NOnL/570yYqTsBVfGo3bDZIgRIZItHpy1adpH8KECupq67PiAetRsoQXv7mc+htsR"
+    "oVTXAuvIg0kQnWEyQ2wvEBGmunqdZ1iKY0XYex+UC+w5H0ckKMWHtqpX7wKQGTa7PXLA7l4R"
+    "NA7eNgB14+wC+gCoj35AFCPjYM/nSSZwPMIU52C3qzzyEqPsjAjlru62sX1gUjAiUMfnstyb"
+    "oOGmIi8xDYgN1+GdqXC7uknX3plxwLKICF2KAbZMow0zxnPtH2+7O7qNQ8+hMnBdpKrKVWCk"
+    "0Pf9w2Up7FQ+GAFmxhDd9yv2M0f2kVLERU2QY8yQeu/1fEXdRw16yO1q5LysVA5pUEPKOeY1"
+    "2fv9y1/+WPePK5iBVLQFQ5o8EQJC2xqBCHM0wwjqOodCRMwRyfv7l//87Ze/TexMkuB5b8FQ"
+    "rn2HVM1q4Kj3ikZWd0RCqTkNNqLcMa8mN+SYMT8xJseEcn/M8vFp4oHX++3vvn/50/3jK7Fy"
+    "IP77/+YPgIEN5X2LhBn3Wo1i6OV6XFeuXdLAUTNjNPnetapGQpzPu57vz8MtMhLUmBdwDDcQ"
+    "EEGCEbP2PvpbA2bYqMa8rhFmyG0xu5qhQwVdj2sems5oo3fPednYe4EViVAcqaQEERGUBOSH"
+    "sCETJFBxjnhG176rMgcYETriMPeRKoG2ex2+8wzSYEgBsPZu15HLdG3XBlt0N40eQ919933M"
+    "sBKrDYapOa8jjyBwXEx2QjTu2ovs7tUNRXSXexsNsmrZhSPwRPbhlQFRvXcwMgaMOOZK76Ov"
+    "cIMHw+4OiSLd7DI4xkMKt9e9qDh0dIqRrDqSFVSV0LAjWnIv1JlSrPMVcj/HiPmYDFEpTlH2"
+    "0XVyziklLIPVRRyZRFOxC89Va6mP1Qas3lWb8GMmumDOOYkiaj2XOE3ZA3FRhxrSfr513aKr"
+    "K3MaSQ2NGQpUf5qP99dvb6/fgM5MhUwpBlIcgRzUzJygcsxM9Xr7/vWvdb9n4vzabkABas7H"
+    "biqmj+Vf6qYxwSSHYsD+/OlKVN9vb9//8vz+R/kHgBix1zaoSFtCjjGJMCaoGNfB392gUKDG"
+    "y24wMx+DGTFygYih8WAMQJQik+SD68Gbz19ff/m7X778/XqW3Xc9lzv+3d9ca9+1771BP6ru"
+    "511r1XZ1M6THY85x3fd6Pt9T0RyOjBGuhVpdfH+/YWemxsCHwkeijBqDxIK33YaOSc5uEtVy"
+    "+9A5vd4Y57oeh+2IGFTkTNIRMeIi47DXbhf2GB93T1sxFKHgkTDQEKhjF4AkNtFdDg7DJiKG"
+    "FF0bh0ZQururQ4HecBvVh69RfLgdCAVJHtVxJumyfYyH7d3u9q7e5Me+WobBtb3KAEUYZcvI"
+    "cle/k0cU0SMuShDtygzAcNt9vHvg0SQppO4NdMZc644cFO99o4vA2TJk7eMbAUQC3bVHTsW1"
+    "1iItjeoyrZDQJKpW7Y3jbNY5uVqANJuHA8sPdWcdSlJgtIPxIFuC3REpxd513M4QEhLVKAPQ"
+    "sKM8VpFxEAQESLekl+sBBNmZcHV0gJcpc4z5ksER+f766togQIuhGAZjPAyeKcVV76/fUybV"
+    "dhmMQASSBzahBpWKDNFd33/9ueuZEWPE8RQqp83daLAhI5GSUjz08otyXI9PIT2unOn7+999"
+    "//WvvZ4pDIXJHCNSfRICmL29dykvxON4y6p9BskxA+dRYiqzCCoZV8QDmmNewcgxjmP+04xc"
+    "X/eXf/j+5Y/Pt2/sEFbEW6O6P8d//NdTZ6uqI6jclNrug5y4n+9PwhEJ6u2+TUjISIFv729r"
+    "rxhbql5Yd9m2vddyV/VOqfZNNhCN1oHRiJMbAlCiVO3OTDG6rOS9FwyKEOdMCQRm5syovc2e"
+    "jyEJjMhBMKSqpbBtNsCK4SNIq3rmHLAIn48184pgxHH8dsQhT8JIBYgd2qJTlzSaLgPmsbwe"
+    "J8+ck1RVi6xd1MHpKrFSIBn5CbxIl3tviDNCdETMNgimUr/Rr5Fh/KaL9yGMEDTddDMCIbk/"
+    "Nn9SOXhcAKG1b6otNttsF+r2yIS9a9vbQsOAYFJc+6YxcuTZdrrKi+gh0hzxoLe9q4vMXSjk"
+    "mEdPjjOhZwCEYohj1ybQvccQ6fu+PyB6CtV7764dDMWo7t2Pe41qtXvvJcb9fM4cY14xX8gU"
+    "eUz6YGxPckBi4mWOXev5+jYiJFr+0DGPpGPoitB+u19/fFeQwRgDAogTy2WM0E+Mi8Gc14io"
+    "9fz+9Wevd3ShFBIUDYLalinlpAYjGiBnxEuOz/SJeME1OPH+/Pqn71/+gtpJkyhgzE/Uhm1n"
+    "Q9WgiopdyhnLu0XGUIwjcc9rmKN5WbRCORmpkfOaY8wuZI4r42XA3//u7de//Pj2xXsd4ZO7"
+    "7/UamRE/xb//lxeMqqZDHHnN9+etCGoeJqHbrz/elDmuF3vu6n3vOS4pd9VaK0KhREXtUlAR"
+    "axfOvWWLJTXA1UsZVJI0PGIQ7L1D51gfh3kg0egRGSMICz0HZ76mSuRaJ6ihD2Vy4hSqC8DI"
+    "EVJGRLC7AEmKRLvQTkVQwaCQGXs/jcqIe72JXXtLUnSoqp5gmhORq8otNLsqpOrOTHd399kY"
+    "zpUEIEMhAly7oYSjvUHM8SKlCPShcHOv2rtGqqsMd1f1jhgArzkAt3fX+1lyqSSF3kYZZ7/l"
+    "R5wFbRbp0PFUyNUjhkLttvsIQ4BWaO/VXQcPqOqIcUahhkPIkD60/r1rRaZBMKwB0u2DTZLM"
+    "DADVsFWrcyRowucNAfRhySCAkDTmULDhXY/nkhUUU2nH2+vb+/OOnHm9fHp57HW/vb2/vPzU"
+    "ZjuYn5gRYe/1/vrae+91K6x0QTEGlIoRkff721o37cjIzGNXUEoZEM0rx2dIc+bM3Pf7929f"
+    "vO4guvac2fbukqKMyKEIMBmDioaMMCKPoabul2vC6+sv//j8/gXdAaJbEhUtg91mlQCyHcE5"
+    "XxizxZPudG5fQVWFCI1P9qzy9RjSVF55vSiiyy+PccWu1z9//cv/+v79r/fbax+DktR7VVVm"
+    "jPloK/793zy6HTGE8XyuEqwAgxq7eVwxBl7fnqt9PT5HxPP5tuuOoxqk7ue97upWVVeXAwYl"
+    "oTcNYCnAAFM2V30klwXk8sj8SGyCCIfwAT7DIQZrjHiMmAGYvW1wzEE6IwgCISSDGSHySAfs"
+    "yhTJMYeiqysVM5PgGAO0XTl0ppqRw1UZ84RykQdsi13RUEYKiQ9FnUFE5Fr7eDVBUlGFzLRZ"
+    "u6UT8VNtG30YiGMEEti7pZQi89yqnanuDjEy11oi7Vr1NI7zNqvOJFwS8ngabTeBrn6SllD7"
+    "eZQqB3ftMynIgOccdHXXiYY8uR6G9952R1LJ7q6ute5zDpqOECkqwNjbVAN3Vc28SLodeRmI"
+    "HCJCPkFlkq7r0f6gD9wBQ/Tet4i3uu6tAk6yEjQjBiPH9aIcI3U/32HO61M7lC/X7/8rRAy8"
+    "3e/fj1dUMsItM8Z4PMgM5r7v97c3uHJEVRksFzNAlqExoEdzjDlfrnj78fXrX/8it1xdNUYY"
+    "dcAJRsYYkgzGmFYggnE1cl6fR0Tt995v8n77/vP9+hX9PO+RGA2f0AKzdQBRekbMkW3dDYYo"
+    "a0hSuwCvgvJifgZfckwS0CwnoWvOkc16e//2xx8//+1++6urQkqi1kZbQaXGfOzda93x7//F"
+    "zJj3czdk0B8edDDy/fkuub0ZWuX35357f+69IniyUEEFk4Dt590fDC5696YR4ow0NuWTq6LI"
+    "NoPRe0kRGVVNKGIATZTUR0o0xoB30ujlNjnEQWrMBEGApI0ujnGJ7F0ZUbUlZWrOBNiuCMA7"
+    "dIKFXC7i6AU+LMjdUig02tkmfJY6GnmCDQTBNJai2nC3pJMloBAjujoi1l2Auh2ZACJFQMLe"
+    "tVfRLUCMM3gb3vWUACCH2r3uHUdNQVS3aCjxwSoXhIiwAaMK/KDZ4F5VK/KYGlBlMCkZXbUj"
+    "ZJjoODkKQO2Pn/a4I0Cj67ctUrVrozNFHXCeILsY0YpbBCmJDI35Yqp6zxHdizAFxTieavMk"
+    "hqbg+/k6Z0r6/hzNUfa9Nq0IzTlyDgUjKDTckmLM3dT1KX//b1Kh51/2+3eAGRljNITIHBcR"
+    "ZxF4vr2+v7/PkUDPeZ0NlpIJRpIxH79jXBLW25f3r79g3XPEOShJU+7GvF6O7UuRimhHQTEv"
+    "IyIf1/Uyw8n79def77fvridRu+4c46Qa6Z/UDiCcVaCQ4eq1lzUephk+uloi5njM6yeOB/SQ"
+    "HmNMKqA55/X5moH7/evff//yx+ePX/bzRxC0Zma3id7rNjhf5tpAh/2Mf/vPJxndbMtQ80On"
+    "eteimuHfchjC0Pv7fa9NO2JEjB+vP4625157LxCx+pZO3AXyZE3IEQSzq8iP0FAeOy1ZXVJ2"
+    "Q6Nz0N4MHkY2aPaOk5vMnSMf83IjFMeLN3LarPIYGQdTFas7gicmtt2Sx5mbQQqI89JYu0iK"
+    "YTfliOymaSHcFQpR18jqrjLBMY5HA26TGGNGRB/klh++4MjcextWGC4YYGWMwNGwFI4SSDaq"
+    "vSNCoer9TwP5AcD3qswow5ar8zjOz2HDPKl9RJcXUGOMcldVnFC+nFLYzqE4qjOgu7v62CSO"
+    "nTVHwgbq46lXHMRuzouh7vUBwgPoNG7lk8DumnM8Hp+eazcQ6hAO1XlSVM4RJh5LM9EVYkZW"
+    "88cea+uwxyPHGHRXoQhkAC535RiKEePaMebv/zX2/f7L39I3Y+wyNTQfHNc1ho7/8/nc97uo"
+    "mZFDZ/CAom2H5nyMeRkZee37/fn9r9rvJ6ukuw7HC9pHfU7liCobjPnCnFBCuuZLSMJzP7+s"
+    "9x97vYNtmiFSxsdO0V3+YDeS1plZ2s54mEkxxqQucs7xmZ4FMYYxiIgMxjXmGEnV6/df/v7t"
+    "69/db98kd1maHyZkIEd+ZICI7qjdIzv+m38+jxy526Ewvbu2XV7UcYf7Xs9uVEd3K/hcz+dz"
+    "QxP2vt9ef3yrJjhdTQnBCO79br3vPd/uG7FglhkIVre3kWM+hOhCKoFa/TRtGiYKEaCBtd37"
+    "5TFGHtHPOcaiUWMMgmNMKQhHHIGePz0+ndCjYMK+RrC7qnNe3SdqQ9VBvUCPMmfM6lV7E0d8"
+    "szMEUFCfICKyeyl4whYpAze4qHbMD9eQEdJdPecVIdoKlrcolIMSEgjxuAXvJMbQsf5VLXEL"
+    "Do4Y47me0hhj5pgNuz1yuj8s9F37UBsGqBpp+4wUaFuRbRyboUS7ul27gNytMV/K6PZHSm7X"
+    "Qe6bgOJk1O7aXYuso4to9xwv4DLe0QLjTC9g5Mhgd2/p5BUHCqkLMFzBy3CIM3O370bxMmdD"
+    "gPdaAMacYkQwB8EzGs7QbHs8Hj/N57ef/3bXjnywVcWYk2MoeLKO3r9+c60gjke5G1K6kWNo"
+    "jBhDOTMvhrieb1/+6P01BRo2Rg7F2Ae+Bu1QTHIg0pyMR8QUmeMaUeyvP77949uPL+hl3gpd"
+    "81N8mENEaa91phNCBCMTDOcwZ2syLmgCY46H4qrO1mQ+zISC4IhrZib/en/7X77+8X+tt196"
+    "v5Ou7owEoqobPOGEx7eBjqPIe1yP+Lf/22EczDYkbNR2G50pu40tlEgibB6D+H2vBt+fG66R"
+    "sde725kj5mPDd91jkNggcn4CqWCO2S4hqusoY4yP2Bf3plrRHxGR0IgJuPbOYyLCPgkqmTPy"
+    "I2aJx13NiMg54oS5jJE6Co19iwpoJCXv7mPXORlZoZHxODoPSu1lO2OIaD+7GvxAJNwb6LN4"
+    "nlWp0aCr21AVATyuR/8WowdX9z6KlRC6t6sFuutDQ4UN35lnl+x1r5HhqpGDzPvekRka6DJQ"
+    "1cEIRXXtvimPMVzdOGqKmpnCx6VKEhyERqa7z6l0DPNkGIGI7o44ftg+hsSGm2qfd6aBZ9eW"
+    "wie51XvXoQxMXqTPQTZydDuH3AU4Drd5vtFBCUDsvqVVfkK5e7yuuBch8VDhGbVXCI8rRUec"
+    "/3PEHCCG7vXj5/fvv3wQzYByOrLgjDkisOv99fs1A+h1F6lGgh96w4a6Pcck8fzx7f37l/Br"
+    "cgusD5Ep2qzuyKRGI2I8ygKn8hPzRcprXp8eWs8v33/9h/38ltQYca93Qtf1addyOxT3fR+d"
+    "QkSKQX2MPTEugxqPyCty+uggEJmfcjxohoZ0ff70kul6/vH12z98//Wv2KtPxpg9ctLoqg/P"
+    "uUQwYnSrWmWG0s34t3/zuwO7gUGFZX7ohkG0sPGhTRjnQycZGTEmNYAaoSun7bV256UM0PZ6"
+    "TFVXNf3hj0Gw90YqI4cigYAZ5xNlx2gpYKFIO0eShJBXtrf9kbwlzS7PcXBTRkRI9gJLQoR2"
+    "bQl0hyJjArV7kWnwuq6jh3UjOPZx4bgVnRF2k8dyYDGPoQ+sE9MTEXuv6iP2/tD9SeNgSiGu"
+    "vdZ+I3rO0d4k6D0ygDaQmQ1T1XWHbFTVXQYp/BZhe9LgQJJBHDvREVMRbPPE4mhktPswcF27"
+    "+zgkBSs0xOje+LAHIjK7FHm1aWLMgd57LwpB0CcRLAmGQuDIHUwjKFYv+1wCOCm8Co8xxKjz"
+    "2x0lHInulMrbvzVQdAEU2e2mXqzPTwcc3UZvnD9ODllyBjPUtqXIOXLU/nE/f4glBRSWOC7m"
+    "jBiZ6fV8+/6VKH3odsIcOT8X0hqRM8c4yrz1/uPHlz/1+nGN6lriPO+oEWbEfOCk8EuteUgd"
+    "xkuOa44Qn8/vf3r/8Zf7/ZdAzxzt3vu2fQD2c8zZJ8tkwKwGlYeUMkPjIieYUFIjxmUPY5ih"
+    "KzLxaezsv7x//Z9ff/2H/f7N9Q4sEF1t43FdZ18DIH1kuBwUqQ0ewwkd//Zv/hmRR3ZvQB93"
+    "WKA7gvPYMXTBGTEjMmdej+t6PLo9hm3D0WBeVwMNS4A3vY+8nSd+XCSKSMWIVCiJHDnslvoE"
+    "UQiJToKZInvMCQHngYkEIjRPgrbQI08cckeSXEfcBbpdp2OGzL12DnWXNMl5TLORE91dtxKN"
+    "Emnvdp9QkF07cn6EH7EIWqpqEpJW3Scy7Si9PlLpquzOkeSxptpwhHqvM832kX236Q5ZoTP4"
+    "2gRPqGvxhL1KxvnlphvnpkIBbTJy4LdsutCovQm7nUoqug+vVvpN7H2SR1ynKgEhdpVrHz75"
+    "sLuG3CSEMzZ84BSHYIh5PaqKOOK2E/PJ1EjlCaPZe52IMgBGR0zQey0pQZFBPozHcry+PQ/Z"
+    "2+6qY3hcY+pxjY9IPXOM+dOnT9jr/f17n7gcs5mMoIYiZwbq/fXbr1U3sM93s6x2mDPyakDB"
+    "OcfLFevt17dvfxGfIz5yln0wp5hGMi5wmskYVjIu60GNeX2eI9Nv99d/eP36p1pvsm0rDuiM"
+    "vTvzighLe2+AGbMdEUlFIcb1UyEQ007lizm6GXG1A5o5LkY8rsfF7rc///jr/3p///Pz+aP2"
+    "k3xeD+3b6MxIHvmR9xzTbAokqHh/f1cGye4Cne32h+RN7S1nKEwSxQY+HN8DCEI2InSGsLiU"
+    "ESivQsyrmELXXh+CeYpdM5Az71VVR1uHt/e3OWcGyzcgY2Vi7/fkRygsXFVnYMXqPZkZV3eD"
+    "eN73CWUe1K41SJBrdY7fuBPEIeaVdPt82a/r8f7eOUZX5dBad8AjVdyRwUKE9u61CwOKXLtC"
+    "JyYa7rnu+ojeFyUfYXPmWGsd8OlEK+xatueckrp77wWEuxT08bmT3dv0CI1Q25F5r30I28Mk"
+    "lz/UM9V7KO772a7IOOLr2v3hldGxXvA3YfYHgUeeDLo8ys12k0R5V0XGqo6glJmxnu9n4wBi"
+    "b59wRkZIn6vvCMuyY902BKgLEXYLCpvok/XrlNZeGeNDy32iMA8ggU3OXcFU8PxMN5RrbcbL"
+    "qYk58fcRCZ8MlUCtfr4FPqCFRivIyKZoEPX2+v1e72MypJhZjg03OMBzT8wpsr5//fX5/c/k"
+    "G9Xko4rQEVJMI4nYJUZGJANN5ngxR8aIUK33bz//bb/9I1HCVF6FRtLbuxakqoqMvSvHBByc"
+    "hE6k75gv24IeJqXoE2NuSUHNsjRC8rj/+OvPf/t8/aP7HcaYj6plvJEi5hgXg/bm0VCwToRn"
+    "G3u9z/nIvGp1uWinJMBzZLeFYe/GyS0bcwT6OEhU5WtmZFwPOhaTazsYFBuIMRRx37tri/14"
+    "5Mx8fb4JqFr73lc+rK5uIVEmlxSMutf3qZkJ+rh8OkcAu93slXGcP8FWXjK8VqmNmV3GkViC"
+    "PHn5Q4DPXa8YVmCjOmhr0AQcxu5akQnJrt4n6NCExLbp01AXKt4oHwVIqz78hHNWdVV1V3dB"
+    "g/A/CSS2ubtUHxpkIXPk3s8cs6oYcfweq1bEwzhksstFze4KdrVtAh109T4842ll4Ml9M9pC"
+    "nwja3sDpx9hVAJRR3Wgr4sSsilpeoRwRvqvPgeLwWdi7jN8gelBM0N27qu9eLiqTOoige7Xd"
+    "qUCxiXblpd/kkF0+0b0bJXw4tIwGZfeyXzLGXe2mdwh2FMm31/fH40GCgQwS6+3HW92LCUOR"
+    "ExQjlMox3PH2+k3NmY+q98z4J5v+3sEYpEYIXvfbj/X6tWsr1GUGoQC9t1pROI0qyjGaJ5BN"
+    "jDGVc8T725dvP/8XvP96cmEOTHD2mg1XB6XNps/MEgpvuJhB1zHEksxgDJ0rO5LIMXLGi+nA"
+    "1/uX//z125/eXv94PWCS+mSeWJLf9cKgwd099y7qGTIUPLOom+w543nfDoUGUQlppty1d0Uq"
+    "88JHHZZhVssOaT7mIQDg3l3vV1yCTxvRuXPKRcacF7mq+q6a83HX9qpINXbGIFRHa4EOEdg5"
+    "1GjSSbg7lBJrn/IDZGj3/ghCBNiOQIjeFVcA7d7SaHtEitpuV5kGKiO3t4veaCMCcwz3HRmH"
+    "quWh7o5j77fQGYhjDNPiYIQ5kygAqFUbJ4vqXDuZ9olfL348ZdFuw+3OEWh2LUrtjkhj+dDX"
+    "7LWep3woQqlp5N77uU/u1Iew8oS/d3dkNDZA26mJlt1napV+cxqNCbrRlHc1jcy592bQbLHI"
+    "Fdog1l1gwGwGYGnAkHDmZwkh1V6iKNpFkKSCaCuTpGTbc4xGrf0MGnk8/fWR2WiS3LtCHiPu"
+    "5QwFBW9lPB7j2Kn29rxGN3IkjgQArtojBPRHXZsjEQBYfr796PWkd5xOym3Pk7E5GVnVOSS1"
+    "77fXb38W1ryy9gkMighVV45rrWaMGDN0NQRRMWZcjJi895f/5fnjV7x9fxmzKw762wetQuRk"
+    "hN7f711WQpSlcgOOGEqxCjkipnJUlTkRD4001qanX/H+129f/me///xcyrh6bX+Yjgs86roA"
+    "sXcpDhHnOcfqXRvn7qbift5VHuM62tP49//VH0Tez/fMyIy19pwXwTES7Qzw5BRMKhxhYYVa"
+    "3uODPjkhzCdIMTOUQaJOUJEyyh0ZFNbeAQUt+Th1c5wYp25jxNyrI3JGzjyxuhkBugW+zBd6"
+    "qzGUB1jOcWoiO3OcmEVIVceCe8aKj+P7bPwj52kDOhKu9ukuChwinsiZbXc/yx2hruq2K8/a"
+    "efrTDotCBg8DrFP4tP8pKjWYp+sArEA0jmZf9/NpIHPahlUluzMT7Op2524YOBKDDHRVpIDT"
+    "bwgGykUKHQKPaPGjyeH4rk49BzoCRAD4Def6iCQXKIY/eLg0wxrbIhxhcf+WtemUjkCUJ5KT"
+    "AFHVRzxzBu0DI0PHdFEmIqL2HSfa9qM3EXaANNGFe3FtN7S6KW43Gbsb0uPTFWIIqArzjKOA"
+    "yJFjSjkze6/X79+O8PhEz1IZ16W47o0x5pia6dqvr1//gn4zngTJR47hzoPDGymOOV8YVyEU"
+    "I2bOfIy4ut6f3/+4vv3F+20MdVdDMWY3zA9QylKX98HEr09xTY2rjTEe5CyFxtXMGJc0qAdH"
+    "xDUyr4Er9i/19R+//vn/t55fMtggHV1UjMysEnESupIcx/oeifadmbWtg/SsPcaobTFfXj7Z"
+    "3bXj3/3rPxwZYiiu6xpz2h+TnAT7pjAuAStYa72FPE8LDUx2VeWcuyojMuXe3vdR45RxrP0n"
+    "hy2UQQj9T5ubXbWXoL2ceWVkStfIOXPOCEHyNTIVgfjpcQ0pM6+XGQmqI9h2dce4zlfpGOiP"
+    "0Z1owO2SMMZwq/cWzmzBXR853bS7C8C9d6RAk3GqWE5MKWF3ET4RVW67O0dEgPB9P6u2dGx8"
+    "cTIhJYtu6ETTHdlJxDy9KBJPaZvRu24pXNOWoDHC3nav2ieK8TxvH175j/LUg01FuyRKCWLv"
+    "JclHnFEWKGXGWGtLJ9lTa9Wp0GNmA9Un0qW73rreeA6LMx13nT9DIZxFVEJb9HljI4jfKIT8"
+    "IPZORwSOccIfRnodVfTeeL9PR5SVSbCbQJy+1esxR+r5fHNbOcCR+QINK2HOzF738/0H5e2u"
+    "3+huMzRedgvM6xqhfvvx6/df/zK5gRMEOU8EdHUc5CDigbiaqZwf8VmRV4T3+uWv/7B+/ExF"
+    "A6bLPlUmx9hfDWYC+bx7zM/S3OW8HuCsBjWhCzki56kXZQzGivFT8nHxtX/8z/vr3+/vX96f"
+    "75qXGTBGZPeJpXt0QydUFGpGA22ZJzwnjAC0qyNmNTIHIlZ7rZWhhNCuMdK7q6rdOO06PGqK"
+    "wYzuJtrGNSNEuE/6dtd9rOqH0bG36JjR+z5hipGzwG6XAWzQCRAyWe0EwyORYwYckTFHhiA6"
+    "x9GOIaSRIzx7v1858prVt1kjx3ZLZMZh4cAemWK479+86MeQHlQHKQ22BR213VELkZ2KOmEi"
+    "3alHI07e1b6d2rT3eo4xMnPd5+fC8etGZqRk8izQAKX6qEfAyaOl2Oe52kvKqnW6/7rV3tJJ"
+    "GEG0IuTaOEYFoV2nZOgkywYFRYyxb6PdRwn40bLZdts611YIYgK5d2UmgMJpkWjOsXujsfeG"
+    "ZkTUeuu+Qz0Gonmv21Ao7ZMLVe1GnlZHjpGnUY1qe9/PO5Ujr9/8j8exHOdltOvEDgCq2tvD"
+    "RmSUfWafbmdeVNWuDdQ25N2GYszfVxV6jYEIf//6FeyILKit04+UcYXmie4nsNf7++vX8AYN"
+    "ROhq0vRuZc4TAh05N5IKRs4cVZiKfr59+/5lPb+P7lJnstsjLlcqug/BHYrMVRrzU2g+3+/t"
+    "5u0MxXgBozpSKQ0z4Ygcoc9gu/70/Zf/7/72t/CL69pd6319mjJ4ElIAVsleEScliKvOfRtn"
+    "0jJ4liOcwDALZJVBK+Mkwa+RFy2PNs4Z7JlylUBmSArgFG3adpcy7Fprk6URVFe5agXaNDMZ"
+    "3N2RcVcDQ6ACI5NYCouqgk9xhh+ZL4jnUdkn6uXxIFLRzCHUHBNNd1NPjRSZaY15cKMrE6TI"
+    "3msOwTtS/SGiPE8p7e1V4FOa7VnehsUXcdjPe605B9rBOfgwGeruqlWnxGLvO0gdUWIGQBmr"
+    "luHeNyMysstEdTc/mreFZoBBVDflOBiq9wi54zjzJwnkWkdfgtpgtrmlAMfJka3aAJSgR1W3"
+    "b0A08hyLq6s6JjPyOA7BjpjQ2MUIE1V9S+Xu65q7t6vc+6zu78+vQwtsjWFGn5sTLaLsVh3P"
+    "xHFUpmZjzSF2sQvONMhc1VJkZO0+i311gR1HOYcGGEp7Q5dBu4CoXacmOpm971WkECOVuQtP"
+    "5PW7f7Xf/hr89dvX7xIolis4IifiOhmGkAaZed3v316//yy0Rty9xCsz1nOZofmpTg72KfND"
+    "4rjEZ7Dq/cdfX7/+TO6X3FWWBKq9N3vOi97xW3rSATEjcu1qJZWMzwh2V0RmXNS14ev6SeiM"
+    "W/v+/uXv1ut/8f0LGiKr8DJftrcp0TjVzY2jrLPZuEkCl51wU2dOoRljRLO7gz6AITKvRi9X"
+    "/Pt/9WmO2Xb1zpG/GW3PWokTRf3bATwM1aoccYpbYMQYfYr9XET+VvGyx4iqIEdopCLIzFHd"
+    "ClRXjpE5Q+6iEIqS7isi1SFnZKIfM07alo12X48Aoo3rEQrk+X3F7s00VUQpsPftboRB9Yc8"
+    "6JDV224yGSbbjEOvZsrdEZBi7UX0c70fwGxkuutEQ7fd3QxUVbmMHiNMizr2o9MFfAxKB4U6"
+    "UNTJnYkY+4ijwXttnAonsevDrCuwqskNFCmf4r+9T/DQXkXnMQjCiZO9C4A9RkjcdTgkuuvQ"
+    "AavqVM6SRRR+s0ofvrfdEWdfcI60vZugjnxdZJ0eKcauY6NBaMBLtGvr+BoUxlF6qQtSRgy7"
+    "22WfGD6dr2o7NtTW83mPKz/0x2KAI0NcJ+ZQY1oTGOPxh8//7F/a9fbtj/v54wOTj8S4yGGG"
+    "FEc6SHjv5/evP/d+P8lkUPAAVBHQRSnHAMMQFDnm4zEiOljff/3L64+/op/wLZmBzNNNuQzY"
+    "sqvrI0ILTOqichdiXO04UUeKC5zSIzSuEcl60Vu9/uOPr//T/foPvr/53hnXLrQHFeM6OgIS"
+    "4UYou7cCqaDcVuhTk5HRberU2bO6T/W3NGBGTksFmMyp2M8bJ3cfLcS5vfuMOtJHPkujnlt5"
+    "KT6KtpSnovpD04vuiDa4d0lj37QZQsgZhNF16hg7H5OUWhljxAjOzMrcM1m14C3g1GBXl3JQ"
+    "EtwOKUdOcxNFsA+yolNrJFtrO85WGCnl+/M5gh+4kT0eKbDcVEkbVjAV3Wt1lbIJr7WoCD1q"
+    "b/eptP54luZj7l5Ve8zpPosxAHRVZrY/Yg+7MWLWvk84M+lk7LW7c8wBt4LdtHjfxbbRcFX1"
+    "yV2vY4oOhVRtxZHqam/r46pG5AUXsD9qe0YAEOAuKXbttjInfFOgC6jIsH3vdUIJQgB2hE7e"
+    "WtkfAS6a7ru72wiOtsd8FNY5R2SiETGlELO66XYtk1DAUVVV+xwrVaCN7lM4aAeFx6dLRANi"
+    "AP2Yw/yIrN9lNMfIaiRjRH+7395+vL4Md/dx5wYTkW5d15XJfb+9//jWvQMFNZnViDHXksag"
+    "mJqN3mBEhgbAcWUmar1//cvP635DvWXIbpgkq3b3iVNFhOpAOPFQPO7qyA8/nHX1yV1hUo+M"
+    "KeScQ7pxf//+/Y+v3/7L3u8ZJF82OvCJudTzrFlddZ4aUuU+OoKqUkw5117x+ER90HunXqOA"
+    "1IgYXQcYRo7R953jiv/wL1/4m0X1tHWZB8KikkL37ojIyEMswXatso/A6sQwnYgJRIMa81GN"
+    "iDk0wkfViBAlzqkxVV2ZMceQOMYjoDE9LrU9huaowCIrIgoCFSMQdFOK3TcI+j44cLvmOGmV"
+    "AY3uj12sGtRQhMmhSKbtjNiF3W7dtZ9oBKP27tqZ54xyKFMXnb0LKOoJ20fkdAbpiOZJsPEH"
+    "t77b7UPY7n0S3s/6UuO4ZNwEPwq/pFPG29Wwj4bR7mPBVZJy+wP9zYjTZ+Y2cCIJkppUNCp0"
+    "DH/cu/lRh/ahugSiAaLhnfKxy+AUftv6SKR01drdhonfsnRrnynCIJVU7rLRIl2wPcYjYlSZ"
+    "ir32OVCkUKRdu54nTC9Cu2rGcDUYq9kc7QC1q85LDWHOERHt7a75+BTjkzSGYub49uUfX3/5"
+    "+6inBqiLGh+FVYyQIghv+vn245dgzSGJbrWDyvZoJBWAGGNeL4rMMa7rEnftH2/f/vJ8/TXD"
+    "Us2RvdbeJwFiSKOrxxxjPBRUXOSsDuYVczZOV0MoH10n/e3xcs1Pj8H6/v7jz99+/uPb9y9d"
+    "T7LLpRGNrt7UyPjEU0NhwJo5ygW23TGysamreo7HpZHVZfB53zlmRtZ2jhfFlXmN+WI4xoHK"
+    "Zvx3/+anHLPb11EJZhrIMXBkue4IZUTv4yI8B6j33tfjpd3VdWLfbChOhbw/VGX7JHJAarDn"
+    "DLJEV20wRuYYcgfNOQzRkFj026DLbuA0vhW6e0mXAR3Tgj4SOc6TY6rcJ7dd4aMcAo7yYqCa"
+    "jshodxUUCd45qJZP2jdA9No7R0o4bnxFud6UNxmwDp3T7g8RvBhA9anJJYDIMOy2rO6Wgmzq"
+    "nwI3srrimAqRPjR8BI5I/Qj8/ynXAApq711V8OmRIhCmTj/yrgph7fujsEFJ6KT1H4LpaAbJ"
+    "gpsoGJKqDrp0Kk020Dlzd49MAgn23qY/Ir0g8OTCMFI64LYSTCOp3B8Vu3GgqdPBdDwwZzi3"
+    "zRZPWpPG+9YudeMjLCXC3iEZaFeOgZiIITCkrufr1//y8HuSHunOo5SyOcbMTNHsZz1/pEx3"
+    "8NS7BzmkYDwUIzMUCWbkGDkiOEb8+P7z9y9/3ff3PHsn4V0wMieZ1IBDCounXXVvGLOtnFcZ"
+    "5Hk0RsRDTJMvj5fBqrcv3/70P/349R/kmy6ihM4Y7mCFOlrRDvs04NLNzByPPCUep/DAHuBs"
+    "dp3uPjsyFelGxgTT5jlfItNANzJH/B//w79sOyLGzK41zBjWMIQqiBGpoId0cmI1HvqYfNjV"
+    "6Hh5/G533fseI/feXcgY7Xdu5Clh5WIcfIXGHjmvMU/N6q5lb1fn0BiUd0S2leMTudoljYMf"
+    "HD1e75KRQu06wZyICxpSGoCim2CHXqBHZlS9nZKAE94PGf6eUnCgNSLbfWqjSe29V29x9i56"
+    "RchchPYGI577GUTEdV6Hu05mcTCCQR8xGU9jld2rngBPdgrVbuxVp/wWYJjHm9ldRkFuA0q3"
+    "j7+HwDWHvXc9SUMZ8TAj5chw78BZN8/2E4eRbtcJMQcO69OHCKpSaEZMn+5h+VQoJ/K3aOkd"
+    "g6dH4+h+qjp0SQS9q8/WeWoodHLiD67JIhziMbqdfjMYYxzL25JcFW97gPnReUz0Xu6K1IkT"
+    "HRlgxpjXlbXe3t++dt0RYiZwgYQnmePKHGOOuZ7fX7/+hSyg/v88/VmPZFmSpYutJSJ7H1Uz"
+    "H8IjI4eqrqmbjcu+RF+SjUsC5O/nA8EHEkTz9lzZlZVDDB7h7jabnrNl4IOodz4lEAGHm4Xq"
+    "OXuLrPV9DTwoiNhJ7ZywVquRVoSNMUy2Canj5fGX/flL5kXaFknk4UIRGeTIZEKyoYhdakmq"
+    "nExvij0QEBmDNqrMbOqYpqb5ki9/evj4n2sdRNkQz73gglJlRZqNMbYeEFAR4apDdAQiaqGx"
+    "u7Tl7YFEVZK9fSBtJgRpohNUG1NUspBiEBMxoej//C+/U9NhOlTe3pzf3J4hXTDQjMb6lgAq"
+    "HeWqEgtm70vHptv5XAHW9bxnZiYbUpQYItN0rVcb1dMN0S6OyVUzVl1uEKCo6UfT88TUuu9F"
+    "ssrUGpeTpmoic6iytEftYmhl2xhV0cpkEyWH2oxYRCAvlWwfSuIAXil5nbJUihZRax3WFYoC"
+    "SlVArK5RRUBoIpooU8lkooWdIHQt71h/t3DkGn/Acayq/MrQZbansCU916RD8fprRCFLxD3n"
+    "PGdVsRQEe5PEzKDuWenBYWeh7vuzKYmyDrVHXUs2VarScGNUhTurpIOxNKFlVt8Uvgaw08bo"
+    "JZAIpECYUkmpSIEUNDOqEdNFU5tzfB1t8vp/BOExxtZehv5Hvd9Coeie4TEW3mQJZLhHVmWT"
+    "OlW20+RVu9YEgrw8P0YeqoR06tNKVPXUEhYVPfaXy+ujMrbtOnwVUY4ZpR5Q6z9NZQxVGXMI"
+    "A/HyfP/j8/3PZKhU48DIVgJIplRRdGT2hcAI0THE+tw++utaKlBVG0PtNOfJZL2+vDx+XJeP"
+    "zMvXzkgSJSwi+FVqnJGANDwr0zOgY65wUWahLQiANKI1UR2wAzjmjc1TFahqNnVsoOnYkiM5"
+    "Mc7Fof/T379H1bFfNuX7tzfbydZ6zeiQPQRQCCKVAA6bFtkfQkTWmBqeESmgNVk3IZhSNG1s"
+    "xKsI1ED1jov06wccSkGUqWb4MMl0VZpKk41E+qs+u7kiaPEHhokJIrKFQQ0KbQuzUVFQQKmQ"
+    "UVlACIvpxBx6QxXP3RSZ+B8WgsyMSEKrTGWKUGkoJx2AR6rMFlZTrzhroN9s3VISkmutqszy"
+    "NtAKFYCZNCursqrKrtzcyWKs1eAoETbouFtbIk10DGlCTq6O6RHiS0RP/eEXiWGajSlCyxxY"
+    "10yfdQazITuorsVKX3V7iCEixRTFGJpARk4bCCAZmaKKYnOYqsQjRARdDOk3HUBBZzka7zfG"
+    "JqKF/EoOEqWiqFQyg1y5vRxKGmhZBVydUlUwUzUtcNoQ5v76LFIlkZmkJoeOm7KhehbhMIQf"
+    "L09fhCGCzIiszJIxCwMcY5wIAzfqScTmGNNmrNfHu5/85fFk9HSVBrYwQgpKDNGRxaiY49S7"
+    "EuoQmxDN6n9hFmDbac6z6djGrMv+8uWnl8cvcdwJXsgshaj0Z7jN400pUx1rOahm/YwrnVuH"
+    "TouMQlEpEsXOfhfQfi8ZJ3AcUQnKOBUtSxNKHaWbY8o4cWz6b/7um3D3tU/jHNxOUuW+DqKT"
+    "fDVtY1KZZklUgF5F4Rintk4CmumoFOvdOYcMlFcuqpPigcKuSvTjZt5mCjOHKjJFytOVUJUO"
+    "gUX2NlLCVTA6BqSqWVkV15+aUkASojKnoRDucj0IMCIa/A/UaWyVsBbhFU0N1AK0RV8lpFZS"
+    "OCsJLAEzQ9pGSkNgmEXmCs8qUisjfQm0SW6ZqSraFu1Mka+CX2Nk+61ZaPaoHkcCtKGFoABI"
+    "957xApVEktf5dr+FKou0jEFOiGQGKtTo7j2XEtEsUdEm6XStj0xmkNeifmRmpc3RBbTOmWas"
+    "jEApwQoKFZC2JHyNURZFrusxFguzcVIKZKggqumWdkVCIbp0eR37e7H/VJ1Rt69LV0B1q0Rk"
+    "iGpWap+Ix6b9oYe7HxBRkxKBbLRNdZYMwk6bxXp4vPtFpXr2YLpBjSLUDdzASTHVW8rJ5nka"
+    "N4PvL48Pv8TxQqbp6BAJyAilbLi+flXUxjCKJRCgbeeiqZ3GvKVuAG0IatlQQewPX+5++st6"
+    "+YJ4JS/F3avXodLcmH5nFiB6lSGJWGVbrUGxoiSq6f9stqAYZVSRqmNM0VkyHFY2dJ6oIwK0"
+    "sZ3OkaFjExtivLmd9ubmxsNfEGTNOeZUXxwqxwqiRHQdh8EqU2dlhtR1C1eZZobSiqJK//dT"
+    "62JA+nJRjGEZIhDTJEqHkSMiRbbyS0WKMDOhQOE4liqGaV8jIyCYEQKUSmWVTekP5ZXOCKh2"
+    "gTZYIjAz6VWKoCCZSRV4rYSvOLbtzJKIhBSQnktpWf3OGFmHiHZ2MNIRRYrIEMPy8Az0PimC"
+    "lcMGILy+67palw1gzXRSQB7HURARUzGRdD+GytzMDz/WooRCs9JM3QsZrMx0Viu22Oe85uo5"
+    "jiwgTc1YADIqSapYUcewtbuIZBUyPQ9pmDkpppEhSopmtTWzPJwss7nWrj0Sr6SomGRGuwVL"
+    "mRnGSE9ID5vK1zGmXS8WmcU+NRJZlWGNBqn+W0TfO4oFaGH0dzvSo2KMoSrLO04rwinYPZYf"
+    "u05zsJKiI0uLVpQqHXP6eny6+znjUD0rrdBX1gJHhNiYqlsWkxCljRrizw8fX54eQTcLjzoy"
+    "VafH0UyG6odt95ab3lsQsyGSVNEtir18Eqli+P7gfp8R6/Ge60XViprlVKqekJ5V2jZnseVL"
+    "Vbt9KarHfhAwm9u2OQDROFxUAKpOz5zjBCikzASFSAZV5xZZtLOpqUFa6TKGjXGeW9Qr89He"
+    "niVr5OI2dU6GX6pSRIgcoqm1kj2dL2ZJDlOkuueYVlUsiiKRKOqVC3mBDIWOuaGQOOYAuUnn"
+    "fJCVe0WNPoqWXE9ic/QxLAqCgkuCnoeNk8gElgp4zVQL46DAo2WGWF4neyPFtV9EnSCIqVvz"
+    "8MAyMxLt8gREiKH0I6O878ZtJ+m3TuSFTBEjrhTlgKhpawFUcezwFMo1Uo2qTEd10fdUxO57"
+    "udrUKqlEsnOaZW0tZYqxoI5WcyMSU61pae5ZLDVKaZuHMpeIVFRlRvlX+KaabUimx+U4RDUY"
+    "yw8RTNOMqARVGajl7F+9aAuZAVSyYKLSLO6qvpVcxQElrAz28lyniK61UrGNDdmvWYMUy/oP"
+    "E2k9RSlFyvoPpFpfdPKroTczyZSubmZSphcjErWvtR+v+3bDqCjbIlqLNgg1kdPGXD+/PP0i"
+    "dBsD6SWkDKBvZRkhJZNjDlXUmHOrdbn/8pd1+VwFajXKOEJ9wcYJskANDBW7DkPIKrE5kuTY"
+    "VLdMKJU2ppggL8+Pz5/vSp4FahEmjxlGeUMdqGJWZaB3FZhXIErRi8WaRosRgRQhRIResZ1m"
+    "Q5oIM5EojaKaOqlG+lAxzjlD2GVDm5RN/ZgGCPN4que/PH76R3t7lseXl23mzY1AloipqWqO"
+    "IQAv69i2sy+KSaCqlooKRIGMAwgVHn6oApSoAMtUWEVFlA8ZKrav56FUG707VQoyc9W04e7t"
+    "mwz3UiGQqE11RZJUs9ZkTmVkshhZ9Bw6QBYrfIlJBbwWnKdtiAnKC1i+V3Ebm2llLHePoNqo"
+    "9Ehn1Da28BAb/cCrTLURHlllw8TG8rBWwqgl0o9DFe495BdUiiLCQRp7jm3uTawYgER6VpCK"
+    "QiHPp1OudHcdSkVe45MZ0VWBADPChUqmr0sDawj2jOGqL6rMCooIrVLYRH6ICt1DWuDCpDLC"
+    "M6KqRChyfXhWfD3EXaEi0mWNiIiIbduOY1cdiezqlZr64e7e4rKIUJPSvsWvKqhMNfU4yByz"
+    "ZYoFEgJVRpGUTBxHQEwhK13NMrN7h33r97WO46JyTQir2Bjii0gT5elsmS8PDz8j9iEjo8Yc"
+    "EPUo9vWHpGrRzFpVWpUvD/e/rOcH1LIxClSxyBKU6KDIiqPhXgnasMI1+ZAcDgg21tzmGFxk"
+    "Ctbl5cEvj8Ql85l6muONlL3uFzNTLdD8CJEhoihdnmbTdBOTIt1XVKkaRWSMKBKdDZWuGQtV"
+    "OL04bXYEOkrnkFJUByODqrBBpVvt43j6dHf38Pjp5cv36/ln0wI8T7YJaKKmWobQQoR7DhMw"
+    "aMopx8JpTFC6dlSVIlXwoSJy1XyJ0mOJQamZsTxpZUNFcl+7qqladWKYV8Zab7SQ3lKyN+cb"
+    "eFYlRSi6769m5mSmi5h71FDKaPLjVfbRLJ/IWEmGaCp1hTfKYy0nfAwtKDFtAI1tWglKRrR4"
+    "ZYzRq1cdCnK11qQgFF9Z6MKGeLiooCoyVJxSGaF6VhnNjqrqnyWVJURW1+iVlIjVOB5fJdKi"
+    "BfHlySq6MCkl3fVhfeWzVhVUGvUKZBaAGgF2zcnMUIh1dBoRVUKJvApBM5PVMD9kRAd3SVbC"
+    "/bi5OUck5XrvzQy9oloCuPItwbBh7g4UxYpY4cOkN9BjTpSgvOuHkRlXpWdTGVgR4BBqhFO0"
+    "H4VIn+MElAmEtR8XCnRskCILpTbeRKkRk5fjeHp9+jGP1+sA3CwKuUrHWXQmhDpNhohOtWF4"
+    "ePz8+vzgx4tpkrN//sxClHa+sFT0XGQL4rJEx9YP96SozqROMxWctNb+8vr88PjwyQRDNRbG"
+    "jKwjgjrPFMlcVTB5UzxQFNW2SEZBqEU0j61ECgoRFQNlHUsxSIVIUfYDYgOy8UpHSpmUMVcO"
+    "NeWcZz2Yz/Hy+eXzj0+fP90/fbkcT5ppshnrrJJrvWoZQ23IEYeAggbalqN7GaE9oAPHUF8R"
+    "frGNAc92jFAh0nmGRJmQxerkviThY34d24qGu9lY6RKlqqSoDCRUZF18qO7LN05fxxgkvUFN"
+    "7tEtqcg0KdEi4cdl2qlibfNELo+lBZvt64vM1P7K+D6n9ctGheltAxP31Yy1Y10AoVIVkEJk"
+    "VQVAmI0RXxvm3fxluyezrtuOTNKy1ooQoYr3xqiqe4iKxPPz6xBtrimJ+vqDm5ofh4h6XNri"
+    "eOyrREQ00gXS+Hv3pcOkX7HKAtYRRE/gGrlSZuq+jsPnnA3WAlhkVkXEtUeWKaKZJSJrOdD9"
+    "x74sRGWQ/yNFCPeDxYZRFtL9ZYwNRY8YOltc3NpEEJmlNnx5VqqhmNZ/jSwRKMUj5jYjM1mF"
+    "g9Vh5tA2r4M2NyA9JOdvuc3pd3a5f3q4S9+HSdXVGVJpRYVuYidQUgchQ2io/fn55e4XX09z"
+    "qKhUKftUECCtoZikmhqUWRxj9k2bNqrFerZN07ebcD0+ffl5f3nZX59VKz3FNh6jsiAXiJqN"
+    "WkBQbWayaBC6p7XsKpkQj1AbSnFP6gCtICDGPFMsisSYY55Miiq2iVqhWB4Ik/MmY+OR9fT6"
+    "+Yfn+4+vD58vd78cASCRyGRhWMmMeLnsx7Zdx8QgM4PAnNMl80BBN9uqgprLYy2fJtM2iqsM"
+    "ZEv6hFBSbM4rBwxCoWl2RLPf5BCuCFVZvAYSPNNEgX4PSKIAzDmXH9t2ZbgnKo8lwjFPyUp4"
+    "ZEg1YdtiHSaSeYhER7UzkRHIEqGoRvqYLBxZchyv00zANiQA6KhTb+3MJMuZKhAR9Vj7WnOj"
+    "DV3r8JWU66G0PYNNP+9dEJiiGr73OAkYRF9+S23OaRnRIfOu3mUG+vcm6hk2TmYM9yKsM+7U"
+    "zlqDNsYZTAqJyoq1FjlNR0tVSGbFWi4qguHR/nGhaoVXW0+j1ERKIpBZY8yo1VqJzOvKmjqj"
+    "MjwE0iVIkavvwitQvo4Q20xm82I8UIhhkohemIHUMbpnHeGE2zxLlJIJdkUAQFWetkF6hqtK"
+    "ZkISK4Kgjhq/Hjcn//TpePxUlSoqIh4tqFHqWcSgAzYImWMqyfKHLz8fl0eNNYYWvDA8AbAL"
+    "bZ02L8LdRU5CJSyy69ZDdBMZtGljaB3748+Xu+8vl1cUiKzimCeONLeqqMIwA/aoybQKLaKg"
+    "c9o6jiZ4F6RXRB7d55Wsmtvszy7NUMPGiTq8eTJjREkC29yUt4OhcjouTw+Pvz8+/9Pjl5+P"
+    "rCMEqBWHFJGlInNOKysKNzs1w2HM0+Xl9WbqpSIydJgpDHZFYOs8GzMdWDrmiiPzFWnneaPs"
+    "PXC27mmoJIs092fDVBNhE0OyWMkuIqnolEpWpQdE3E0qjauYKSsFUeLHIYxtm82Oi8KcpSa+"
+    "QkkdKEIYhKtqkRE5zMSYnmNsVaW6xfXOVDfDrtuXCBEQIn32K7ExUcFqWJB6c05VMrPWtQLQ"
+    "UH6Poz0nLQFNQETLMYRms5vPQoRHVYsponGflWCGgMUSkbzGNnsl6HG48LqKAISgCJcvkllZ"
+    "mQKJK6JaIkKw0v1acggXZVVCpZ9HV2Rx3xTVKrM7typCZYaTpcrmP/Zu6fAQEYVWBSUlqypI"
+    "A8qUNK3EFCFz+W42UNjGrIIUMiMBG1tEoAWtmiSOy8VDdx9mExlrrTEUhXKnoe8LACPD9Faq"
+    "tqnkyj0eP/80j5dSowxkqmrJoJwxTsCIUoWqyqYD+XJ5+vn16V6oglTRlYEqYXqqew21QlIb"
+    "ezigtoKqauPUtrzTmKDZuK3j8fXp+5f7HxCvwmvgPzKIiOUQXvbcxhYrCj516lBwCCUEnpR5"
+    "ylwEtnEOVEWIWQlIKM5Rvbvsd/5MWl9bE4GiDbVBFWiAr7883P3w6fMP6+EH8csRCZ3CuSJM"
+    "B1s+XZUZtnzxSu4y0ZFRFVmZ25hHVrCusutEX48SUCNSWGmq7mltRUWqSHqomFGNCqq3LzeH"
+    "+xR5VskxLOlZCShJUgE2nbCjO8rKXDQBat93Pd1ApIrHagtuUqWS6VUlY5wzXIZEOZFXeHoi"
+    "Ym2nbfGIuKieADHTfQUYpRWRCpLi0RoMUlWgCfpxRUVkISoHRYVZXlmiHGbHfun7eTNZgZ5u"
+    "Z8EzKhOUFGEzhMcY4asqhpp7sNCoE6BEJLxZ+w1zBQkRTU92jRvMyszKorSU1DaPRUgj7cWk"
+    "J1NtYp3bLFR09aEaJ6RkubvOCSAbkgGEe0M2zebhixRVRkR2ybZD2V02J7vjfBzLhlyJk2AV"
+    "vq6KAaBf0aIGVP+MRRYSCZpkQmlDNfw6D3MWUQ6ethuPyEqxMeZJRE10CvPpP336/HCKx7Nt"
+    "l6CqiGBFUkx0213GHFPGIIzp+93r0xdfj8rsYUwXk1tiQGokbKgOgqVixQE9NQCKRpXaTpsA"
+    "Jnx9+tPj559yPcTxtM3egJcIKAKmFObVHMWxDdIqdR0x2k4GIHEd8ZDe5RXR1ksX4CUoDhvU"
+    "ATlRjYnTGCriejOGDlmaL+vl4fHTf3/+/JeH+7tjrYk6InVsWQz3YRPR8JkRvh9r2VU8rUgR"
+    "2IjMrl8P0/TyyGEWra0DwWyQN1mCauIJWIhXFY0DSp1XHHGaQUal8jhIzG1GpVemEKiUoUxU"
+    "erVJW4CvTIfDj5t57sVmAgIV1dEkOrkiqfxYpiNd1CbSE1lWyy8k+lux76nSB7nsR76pNDqs"
+    "0edCFVoxVzgVlTVNWVdd4LCmjqPyq6Qimz0OoCKcMsxu3XdedWdpyuVLKeFZmf01QyEiuA40"
+    "IKfDU2REiSqlWm4AIiMio83OHsjMzDRT6fYtxVcAmhFiIqorllBEFVVtmSqglGqy1urISlWp"
+    "IH2pqKmutQxd0b2aj0SkKb5sMVOWkKuhIpKVXX0IESkISghbq4Mr6h6ZKKtuw/W3npFKya9E"
+    "nvBAGbocpEQWBL6OQIoMv3LwDBDTTjFJrXV5+F4u+zifsiOiKXkV2m1F27ZbgCayLo+7v3i8"
+    "HJfnbVy3gFDtSbiKRNFs66MyRIVQG6UnyInstgOmYQ4eL18ePt+tp0fLQIVsG6WyC1zS7Y7q"
+    "o0IkKzr2KSTm2XAlIQsoKwAOUDNbA9eLfEkBa6oa1SqHjpkUoaXZMDmLhL8eL5++/PT7y/3H"
+    "5y+fyawqg0UB4gDHGA4gytcyG1Wlw+JYlvCoI+pIDDHL4+hT6b6ixCjMhGp3TSHEWsecI3pF"
+    "YRxjZMJ9EbiZm3sBqaKQAg5Sp9laCRxVrfvNa680LsLGx5unF21u237J5T5EIpYaFOYRqNpG"
+    "g1TLQEhKikdRrBXTJEowetKmyutnQvtFUQn3IMFufsJO25aVyCu9iaJqml69ADdV9ptQugZU"
+    "GSvWUpX9kvL1/ZeREReiim3rBIhhFhEiRh2J1awfVfn6pQ1p3kel6qjqD3ADQ1PIonangjJa"
+    "xismXUasisbBm6iKJfLqHS+6X3HZRWRlZgtMkOnIzjlLZiA5ra/WVcJwRDaxpNxDtFSFiczU"
+    "qwYtqJoID++lrmEINSoisnGkqtqv7jFGb7Xrawxb7Jr6btYkamQWRRIpY5BYGStizJFVJpqZ"
+    "gxnreHl8CPdtbnsUhSZI2Bgnoa5Slan9O4W/Ho+vz19O53GaBoSoHeGCAaqIZVFEvIStojRN"
+    "gGNmTdNtmAnLlKS/Pn58+PwDjsvAOcIpACUQPbnZ92NuW1UJJQNRjG4l6eho8HFcQHrVmKPK"
+    "skiozFlkETZnoZm9p26ocZypIuTY5tTEejy+fP/5088Pn39cL3eIXSFHW7jyoA2rTdSWO0sz"
+    "cww2xEoEYxMrROShhjH1WEugUdqjTopNSmRmRG8fomC24Uo+hXSeVyg2FJjDTHBERfnQqWSm"
+    "+Mo5JhiVJRRVMaPHgtZAgy5WIw7XOkRnlajN/XgeIjatSlVrmIavdLd5GnpiloJIQLFWqMJE"
+    "Iqqu/b4SJcrUbK2d2TbgykpTi5DKtj1hrUMHoNyPfYiVH1lSjbECaTQxINlINAqNkVE9qwEy"
+    "logkysQIVq5q0K9oRIdc2IxIVALI8ELHpK31n5EeHmZTTVGISoAVWdVV6GtHV4de9SkRbffO"
+    "njxnmA7vGS7JLiixRMSPJSWokuuQmCJSEaaEyO4rAcGICBElBQgCiUaEiFCv/qVoPPXVfNEi"
+    "8izPShXDNZLOzDIddd0iYdhGzRULmaoS+1puy3NFlEBNG07kVdN0mCrMTNbaj5fXzKVDlJWp"
+    "KFMg51YyRMa0k+icg2S+PN1XHXPiWrKmrPAETEc6ipoFs810ZN97RcwMMganyBhW28Dl8unh"
+    "893+8qi5ptpay6ZGeLBErzEb1StdrKBJ2DZ9z0gbnJTKctEBclB7gkdoQoo2zCCEaF96TDal"
+    "QC24qeqcyOP++eM/Pfz4+8vTT0VZ++rxxDrWITRgo1FuKgqlGcukxtTMw48UzUrYgEGgQ7KL"
+    "0lRWAZuMU2WiQpSCK1tYRD2qsBI6xznyojZZI2M3EVONKup5mLjvw6zyoAVKhKFUlphJ5ZKs"
+    "ySECFoM+zF4vBwZEB2XJzIiYdlIk8hRpytdcS8BtTBPWeq0+jvkrMHVuYxTLUckSVYvKdRzb"
+    "oB+L4GnbsrwEKlbQEqlqljJtjqgw2TaR8KNkmQhrAyiKTMYRKgZZxYCosCGqjdUsmVJZLZut"
+    "KrA51drL5yaPSyUiMpYZTXh4SyipatkW5Y68ZLbTNCLEJNp+Ili+RCRWkFLlVa568nj1dB1G"
+    "ZPsKUUWujAQGA8miDKlCOCGV1V/AEhy14EWUisVaEAG1yjMXQbZGoXLF8RW6xiI9FqANSU5k"
+    "Mfn1AGzaraQ+ZUhGZ9oyC4PixMrSslh+PYAo0Vi/KqhRVMgxNCOO/agMocyxZdSgFGdQKQaR"
+    "RJM6BOvu5flzHJehGhwVKyAyqKqILVyu6QqdwFRalASm8noi0zGNIn73fPfD0+uX9BxAb4hn"
+    "j+nBokSgOyAtpxIqZEp1Hc4ztNK8AqDpAGk6ih0a3QQa1BJVk0CJ2s0wylAbEom44Pnu6fu/"
+    "3H/68/76sI4n5CN1E6gfOW2Ynd5IREphKM0jMjk417qUOopjY4m0ycSGsd9Ivtb2XpG29qcu"
+    "kwJ1ZZuqdrvAy4kaosK5TYtaQrUxPY9CskWThG0KKaF4OIWmZHVbLYEMX2OaUcJDyGYgF9Hl"
+    "9bVW7zozo3ypSca+guftBDCissqQXjFMAQfl9bJvUwXaOL9cPsbI6JW1VQVQZpbJ9jCGJ0FA"
+    "shysqKWpgmgEHeFVLMA9pIjSzEOkjnURUXyFY3VBOVFKiXBRqQZjQEEZNtoR0XfnPqlWctpM"
+    "VEUudyGqQqjhoZzXjIZIUU0lckV0JS0p2lkMqJcGo0ZzSEp8pY7uIXeVFFcLEFiVTXbNzIgg"
+    "+7JdqOx/WlWNjAaaHGAeC6lU7RbG1S1A9HePyuYMZcHLryiCarY5+wICJEU9FgralfrS1315"
+    "mQyDjm3bViWFhg481FCLWK/Pr8NGWsfLomAQSxm2nWQMM1VQFet4enn4mHEZZn3nJ0Z4paeo"
+    "isyvx8uxB1RVbAoEOsbcVGBMUz9eH+8//6WOR1HoNVbEloFFRFS7LBVlVddQrcgIakFJVYWv"
+    "ysDcZh+TRAUyskg7RWkWp1nJTKoqTFkUU1q+4uXTlx//ePfww+vLA53HcSnup8GM8AAwV0hz"
+    "zc3G5TU8fdPZmMW5jYRnZbFbtzP8xSoOITxLVcIXAVUoYpiK6rF2GyM81IwQmHmG6Wivb3pk"
+    "+aIR2zzBc2/HXp8nRWSqReYwQUr5EkBNM0KQTG5m+1rUHl8yCY8l/YWHSlbUCj9uT2Yw9xQb"
+    "1bu1gplAM2qP5WLMwrFyqLkEoUTDIirrKqqOo8khjT9qHSnW4ZzFSGoYE9V5jTAbHru1kS3c"
+    "zKpWpx3QCrMMCAgxlVacKWRlr2yvV5T+6iqpMgqIPIBRSXY7D22mFxZDsvnyR6wsKSGqVDQy"
+    "GxJIaSO5i1bWRVSuR3gXUtL/RxhGWe2RYFbFWqbiWZnRyBxRMkqETCagKmojEpk1t8korYKU"
+    "qBYyQRFZ3vRp+erhI5pfryz3XiMDlC5gCZQ9o0w0vxomMsY21gJ0BMRLMpIFVVaVr5Umx+tL"
+    "dgqeNk9nX14lwQE12BSbZmIS+8vjw90vjMuYqqpBqRSkqlrWqitFu3sOQ+dGNU+Djrmdtzmk"
+    "XNfz/ec/7693Uqsy0GIRYbgDVxoZEwmKaFGRGUkRW32U1AFoETakwxui5h4ZOsYZWQGFDVKC"
+    "InYa8zToA0v98fnT3c+ffnj89AP9UohciRSSatXnc4gdzoCJ6B5LU8c8Hcfe2JZjBRJipVpR"
+    "aUOlCFMTCVEWWm++IGoGjahcVFNSOWgCWSBZy0SH6UJ5rPO2lRzHErPTikfQxziFu0ioQpAd"
+    "bbIiqt9rFHJu8zj2EgYwbCvpLVV6VQFjDo89AWSJpCgEioSK+gqqbvNUTMpa8TrnRpHuubKj"
+    "hnEM6jpe06aNeXjAY87Ttb2dERkq7fXMHniBOUxYcexLxVBMTyEyfQwDpLIZn40d5RgGkZWr"
+    "wgOCLIEUxGRkhFCT2VQskmBlBBVUi6DAUIhczWusChRZiIxhYgqRQRn7sZeUSMPA4L4AkBXN"
+    "hleP5dNOoqMABFvdfI3xVRYRWdu2oTL8qypJe7xMVStmlWRURmQ1pXn5sUjLTM31dQZ9VTCp"
+    "KmkdOLtWRIodZiahZmvFmNs6VvvjzUYQkQ31IU01WaorqmIppDKqEmLl+fL0rIjeMoACjhUQ"
+    "O7E3V0JhCeLl8e7l8bMxMdVsZKEgkajANoZAorJkQoaOWWLonqNaUgbL8vLy8Ony9CXWk9US"
+    "lUVp8jWGgQIiqiJa6SmRLfZTNauEmK3QLIXK3GYol/sRdZo3IjxWoIa2z1pbZTIGMeqp9qf9"
+    "+e75p/9+9+XLy+tLzwy0KBzFHGpFOYJVqSaS6sG1vE/tVTmGhq+qPN1sJR1x203GNEMISmza"
+    "EDRdqYRYtdx3qSCxloOnYkd0LKLt1SzW2ITCylCrKZYJG1JFVJ5Pc+2PSpEGtYmWkzCdFLbk"
+    "zk/bqWREVmX2twLpyBhjFMpsFsoIE4F4uKMEAtOxsnaPm9utKpU2xhQZEUcHxE0paPK4gNfY"
+    "oI3ZGP+vGxwUUkwyy2yI1Epf6zAt9nsm63pzALICXbjLIHStNW1Uxjp2GaKm1Sn9YlQyRaBr"
+    "BYRqkhEEIxwMRAAgR2XZtDh2EP3kQRYpY0hWVDig7ft0dxUUIRAbvC6ERVmKyqEWHgnNqkGN"
+    "Igj0zpEoSqe1OjXfa+emZ4ISmQ3iK2hrHyFQqg4WFJWBAqKQkRRtt4SgY7sFUkKky3EezbUr"
+    "gO5BkQIao5vuNsdXYVtFXrMr0uaDXPM0T9tMXxmpQwmI2HHUWmnjphrjbDwNQV4e7x/88mSC"
+    "iEWaZ4oM5fQMciSkSCDH2ErOKZoUMzNV1VCrWI8PX37an+4gYoRxANDuEbSNVaxrzDYsIikj"
+    "OpNo4t5rBTOZK7TTWlUZHnNuOk8ouTkZW79kNobpsOTC65f15YdPf/mnp6eHOPYqWJWvr080"
+    "A4D0FMywEomqUNFuv0R4McymmQWi9fQyhg4AAajpIHKbm2UaYedtqIwxzn48q9JDt2msKBHb"
+    "2HkyE8Vs7RBFCOGxQueJpeuS084RwVITmadJZMUOCHGSOTMEGXNKlhdYsMRGRdZOkeO4NI1i"
+    "6jxyVdVQ01mRh0KzYVcFAed5RvnyQzQ7jZRZYtpV1OPVVYvbAFyhCq1q9Kxk5hXbGKlmGV4t"
+    "e/ODLKNVFGqIzlR4Nucp+4JYpZFmZpoSKMhgg51QIBMqIhXu2YrTRv91Dx5FbZ/3mMaSBJYf"
+    "YCJWQYUKUY+0r5jLJvhV6jS9cqvo7qmqSEU2i83yKtQdmUmxXDvJFa1h6LHaQVYlOE99529m"
+    "wFqexQxR2bRUKMUC0yOa79db58glwozo5q27m4mUpWe2NEbFi0nJjCkwI6Tv340HoQhjLVwn"
+    "o31OEoGCKRpDdBDlF2SYqMpgqXaCHmPe3F68dJ6EK9bL5fnT2l+VCaYMrbKCZgmhQk1a0bre"
+    "EyoJk2GEUG2bYri8PH1+fvq89mchCwId1yEHisXMBFV0eJQN7X1hQcbcVkplJVsEL6pj2PCy"
+    "4ig45FycY76VADTNjN3Bxh77x+ePf/j08cfnhzvEMTpTJ+F+DPmGsgpVC6pSJqSgjorIckof"
+    "JOd2vol00EU33URMo/q9viIx9P1mH85bmj5bVJnKES6Cy7osDyRNZySGKXV4+BgWmdLGPrs6"
+    "soSCYX64qm1zZuxzbMQUIl1QmGMWEBHhlzHOFYyIMQchmQhOEIICwoaZiRWBMqpn+XIaUJUs"
+    "/boUIhB+JOs4UjXNsDxOm+F64czTNlDeMcBEVPjYjKhOLHW/10wzuxQBFhp2HlFmGtEE0GsC"
+    "43oilW7e1FpLGFU1xgA0M7OiktuYSHgAlaToUDbOl+hyPErUtn7tEM31bEoWraWK7pklKiJW"
+    "oKpGkb3f5lVrllmoBgX3kbgTjlDVtfbrBF5GlawKQd+KmRXu0TPWuJI8kYX9yIxj2qZmSq1Y"
+    "NhTlUY6vGoKMsKupcKg0QEF8xVXYk9U8oitlp+fO1a/BmUlJE43gIdzKIYViRYZI5DoCa3ZW"
+    "p2/MkaYn0KiG8Wad/8Gwj7hXf3x6/MXXi7CbxVcPanjYHAChInpK0OZJzIqsMptifL9R1/HP"
+    "n7/8kH5Jf+31XlbFOvqTQDIqVG2tAkEO76dhZktMSjDHNuVM0X1fSOEcwhml47xRDxd9gem0"
+    "OZylzKf18vnx5z8/P3z/9OXPzRsSCsUqXlE0o2ETmSsvHqtYmUmCMiBVuToMq2pVss0NDEqI"
+    "qg2TJKpubm5P2/vy21j2cP/59eWj+XJfx7rsPJ+IEnBfDpVtmwmYmipIbFNZOXR4uFfYtalY"
+    "Q0VlZAgGROhBoYzthpnl+2k7LUYWhMVJQK+124gWi/c4RJVrHaKtONDNZsUyQSxvmbipmA5k"
+    "mIiXi9qYA1imkkB6DFGzVg0acHRwKuHI1ks2JRTa+98sVUFVVc25hUdluyy6O1FT9Vo6SBFq"
+    "Ney11V5CsvNjIqSM0ZtXQsYc+9oRIZS+WgpF1TKClDguqibskRJUdR3FEppJn0n7dnqNWzaS"
+    "DhABq6JEG44nIpqRIKu8AyqC1OYEJnoNIM0f7j+JJCXKAfaQ9vD88vB69/ll2Hz77t37D2+3"
+    "TSFVESXISESxsn9Vzf8Q9kpTWsXqa5nqNUkuyKagUCgSHtlQnuopA6KTK37oPLm3FX1F7p46"
+    "9VwumWWiqvPwioJC5c1vz7h//emfnx/+HLGrifYbFgWKe0Lka0+bNs6etWCnecPinLfnEXn8"
+    "/Hj/0/PTPetQSTMSmlFKtW2u5dfonzQGbHaZWltqLKDOSIGyVKuEZTZnhJhu0GG6MUXt9vAl"
+    "au/Oqv74dP/T51/+6fL08eX+XvKI/XluG1SjY7CqgHheAo+eaNp2g/Wq6MtNMcYEKTCKmbbC"
+    "3KlLoKfznPN22EC8Xp6eHu6enp9SrbbTZrWQe9zO03lsQ4YokilgJUT16pBDImOIiECipikJ"
+    "IofaFVMxt8t6cYeKoqLdnmO+Cc8xLPworjHGsVxEI5bZyITqRKRIZ+80fKlgDGmgfx0+dUDS"
+    "kaBGZR+tT9IvqFq+RGZGdC9WqMuXCWxMstQ2L40sVTQZXcF0p5JMX6vv3lVoUNRaReI6tUI1"
+    "7w6Fquyj8RgW4SCWH8Cg2FVlWMhMUckK8FrrAZhIU6msfiqpjXB3xBxbVqpOmkZIXFNig6Lh"
+    "0VrOzoCajlZgNYBaZTTupq5QbCiVUuGHgJF9niiy2RfMKJRcl0GUJngv4OU1fvzp8fe//+N+"
+    "Wbe3p7/9u7/5N//mXwmBimRN1av7u0JBdp+m79bXXCC1RIQVEX7oNttjLJKN+8j0RvKJWoWw"
+    "JoJN/wQAIBxJsprR2aNBo9hmqlk2Kl//9Pjw5/3Ln4YcphQUvzrxCrR5yqLYqThMp82bbBIi"
+    "uA1THMf93fPjvz+OL1q/luZ1gwAoWrAqAdUDqka2gXFQJ0qWH3NOqkCmyPSqKMyxAXzdnTqD"
+    "2kRzgRpty5Tj56dPPz5+/uPl+eNlv1/7ioSabvOWlMhs21sc7yJsu1nHgQSt+6kC0+FRw8Q0"
+    "h0HVbJzTxxi6/HUMtbndnE829PLiH3/+dLw++n6YnL/78N12M27enu3d7TvxUEIKSjnCp1lB"
+    "kHHsPokMbJNGlh8Q7RCWsCiMLGSpsDKGGcO6nacSGZlMh2eETqh8hS1dl4fecse1jiQEFBkc"
+    "VbVYSVBNVQXpQQ61SEbUnAMimZ5ViLD+d77mehtonIESUyUwAFij3rPYcLdKdrBKUQURZBao"
+    "gJgy68gsMtuPII2kcG871HEs0axIUYuoipRha8XQQeFaR0WoYq3dbGaBrMxQWreFoioKbOS6"
+    "6FpHpYkOSkbuGemXaN9P15gzMuA2hl95tcyKrJKruEoiMjKnWenIvDr5PDw9e92llIKQIyuG"
+    "mqnsa3nw8Wn/wx++/8ff/8VXVNWf/vzL0+PL//Jv/+W3354Ue2VkS0bCSQNUqO2eb5JK819R"
+    "IQW1UZk0E1KF/fe+SrUEFQU97XtQRlZmuHujvIap+WKGCChqVVJZ29TN6P7sn/69P3+eskSt"
+    "SjOXdY08qwomZmbQDTxRtirOuS338xy1Lk/3f/aXLwbOfBvMcIj2b68j5+JRZKtEWqGoIhbe"
+    "EoczFTZHpBwB6jaGUcUzwSod5zfvQNl0KCpefvny839/+fL9y9OnFc9kKahlItrfjmqWJ8tr"
+    "NQDo+fJs41Zlgpe5WYQXa2wbNUxiG1pJFKbI29uRTDPb93h8eHh+fnh62M/z9pt339z++o2I"
+    "7vtxHK/1chjLTWmqasOTa3H5ISqmLbHIzPSQMcWYKi46E4oWdlKLFb6DQrEpW2JRo2/IQ+10"
+    "noc/UXZkUnWzmwp6uOg4DwtfQDArPEy3YmUdoCWoLdZBrVjCU2HZPGfJZT+GpYl0PmKtJeC4"
+    "tm1ymzdXdtSibSNrrVWDKigwvoKgZyaMM9ESY1JGJQpRxHVd5C1sQyVFzDP6EsiSqurWfyYr"
+    "apujUqpEeiLNkGEZmV4UE42OjxaSySGTIJOIMEowPF6RV8JBq/w6OAFK6hRDIFijFRm9SSYl"
+    "kZUQGUD1Yqi/MwgOzrAqYB0HmpteK8MBoXZ7xn/64fM///Enz0YD1d3jy//r//0fvjw+/N//"
+    "b//2r75VrzAYIUMU7P9YZrL5gq6OoKUKElT9WoTIur6+yXGaFYHriLuQhMxAkgrUHKNAz2Ah"
+    "E8deczsBQ0VoVZqgPb9+yXjRPgYWIsvkpqEQohCqp0FMOUAVmgxT5RS+3P98eX7A65fRuki9"
+    "EVJhWdFmG1AbiNCAXhuWUu4ZxRIrKG1AGVCOMYde6/Wm9XoJX2/ef7i5OSOO/f7PD5/+/OXn"
+    "758evgickqIj4pUUDmrXPdH+aVSKyUyLoUtiowI4TERNoETLQ6p3KLKdzqfT7abnl+Px9fL6"
+    "/PS09iWCMU9/9zd/O207Lpf7+y+vl9e52Zs35zfbNGT28NpsBNXsJuoiWlWR4RVuNky1kEFh"
+    "HKbnpIDI8EoOG1Gh09hIOvRsFhUZlcJJTSB0KMV8oS0QpF5en6rrV1VAhrtoT5J66AegPMKD"
+    "pzlEGR7dz4yI8osN/QqcaOFuXSP/mUKJqDwOnSOr1nJlzaFV0ZAp0Qq8Cke4FIWkQElKJbJQ"
+    "UVdQm1SGmGnxuoNBKTW8KNVguHYVZhZYLVWOWI2qFE1wZbi7qFKHoPpMBQ+3lgEOBTptnae5"
+    "idh+7CLgEKFUrahwz9b8fj1rNAOgD/cNc00Va3rCtXHZTV8k8qrtSGT4EtIPfv/9L/vuKBk6"
+    "tilFAfKf/+mfz1vOf/ev3757I6ImBDrIqVXMFYBRUoURexV7bdsQ2UbGH70UB4cJtE9VAKlQ"
+    "NXHvKsFYAVYtDxKQ3M5G6YO5H6/7Wu7+SgVQUYWk2Qn9ZIOCWlS1s25nYIrKMD3djP31+enu"
+    "0/78QKYIo4fghKgKB1KAry1JSIFRBbUjCpSggcPsBhCYkFJiOjbKzKw5xCTj8iR5sZfP+/r8"
+    "5dNfHn/+8+XhU2IDEtJnrajsgpsJpaIS9HCodFVdVItlc/CK6kVWznlqmOnb29up2DYT2sP9"
+    "08eHH1/3Z4ifz+dvf/PdGHMd6cvv7h8law758Lvv1CyRxwo7zXF5ee7ZgExxhvbyKV2BCu/3"
+    "kvSirD/oApHyTDGw8rQNTwcC4iqlAmRRWJmgqyECZO9jRzv2wmtYqRqKEZC5pWulM5svVlEV"
+    "WCW82d4XmHE0vh/oAVBWBZOo0k1RzbihR2SEzq2ff+Hej91CMoFMUjwXuTJi2rusjZBoXbwq"
+    "YRGHqLIbvhUU6RGU6mAicn21HCikWjEAsKIojYZmxOrFdmHPOKpUZKpqXpvW/d1mg4d8HTZM"
+    "hFqo8kyYGIjqIW8lhSIKYK2gdD+qWhrMwrU10XAt0a+zGRBlnWpkleRaizoKyIz7+5effvyM"
+    "kJttMx1mNcbIPEB8/+cf/uOm/+5//T+pivQrC+y1EDpumcdXYnZkoYMOIrpWiKiNUUhtbE9F"
+    "hs95KmbnsiqliF5iqY2vshIFMYaagIxjPaXHUAQ6emsqG2DFEhnUGaFzO+k8q54iinUQl9f7"
+    "+5enx/3laShYPUYXCD1CGzsDaUxXoggpkaQEKDrENqOBp0KXHxQ0sQ1UqJhim1LHg7/e+cuX"
+    "H3/5L8fx4scro4yTRkA9vCPjKqqqvkJVVpSIJo0CFZrZ2peK2ugPZqqOYefTto055jBlPt7f"
+    "vzw+Pr+8rBWn0/bdd99SoWT4erx/Iu3N7btfffNhqKy1Pz093j0+zNPpu1//1oh9GGmjqlgw"
+    "A5Vr7YRn5RDNCOcSEbVhVuFhppU+TFUUSekhg4RjN7EkIlZXH1EQqo1zHHCvjFJSCelgdDmo"
+    "V9udZlQoGJ6bbfOkUR6hmfC1d5CZFZTRJ6suD1IZUdNEIBnpHnMoEOBV6qtiJNIrGAJEdtSe"
+    "ItY5dQgI+FrytT4vqG2bdfXcx4rVuL+IziFpFctTtQKpgsqiXU2aY4waHd4M0r7iaUdVZgSp"
+    "QyUzolKFIIaOiOxIb1VWhsi1QdnPPDKqRFUqy6YuX5mrkEIZplmBjOvMrzoCWbESSCBUShTC"
+    "YIe2s2Lljz98PPZjmJ23kwiGcQ6t0gj1dfnP/+0PN+/e/y//9n8aIh5HIlFlqpmlKtMs21km"
+    "+j+q0VVBohgQURB1FSm1J8ljNfYtKk01KqiWFWo2+jVfaYbjePbjUQCwYbRCyBxnTykaRZJa"
+    "2GyeobNqmM2hx/3dZ8RzxuFrkWinDEVAKVLt2r6Ooo0tIYXGo6BXIWqnEgNm1ICYqFJVOEgd"
+    "g+fNBtbxen/381/ufv7zsT89Pb5I+bQQcdtEsB2rxhiRy0ySdF8U+6qqkCHl5aoiIqfTNNUu"
+    "l21zu7m5OW1noazjuPv85eHui681bHzzzTfnm1uqXfaX55cXVp7G/PbbX4EWgZ8+fXl+fHh8"
+    "uLvsz7aN3/zmd6LDwl8LbceWAnJFJaokIeGuWnKFm6apZJSqCVCCOYYfHoFBAmFGJj3WsHm6"
+    "uanIdAl3mVqrpKxS59iYUXmgojvSDRcNrxU7UEWqjbU8UcFd5UxgTk340OZJeUGR8MzTadIk"
+    "q+KIHo+qsiTQ7TKBH4cZrbRUrHEzbGcJpYymxSThy7tzkwiKBHL3ENsKk/BCrohKSLEylVaJ"
+    "YnkeJYhIFarN9lh0x30OLTAdwlIO9yrkZuaRAhRLhdTGbFBKYh1QM5ttLSgkW0BWFZlVzMzO"
+    "eYgI2cXU9M44EZnXi0MzB2yOyiCZdUQ26VKPKEBeXl4/ffpUmds2zydTESCQfp7GTXbnw8vT"
+    "73//T3/zt7/99a9uYu1zmIp0tzEjIu1KuCQoVoCKZKUJs6VsCQFJ7e/ycexQqWbvgmCv1q9p"
+    "+cwUBeGvz/f78bJZO4o3Ect0VHdGBVC1E3UUlTKhY7OTH8+X/VMc98flaQ4dQyPZWgOhRGZE"
+    "SocWzVCa10RvRYaqqlrBVEbKqLJhW4mWcJ7eKYdWbfK6P338/Okvzw/3L0937i+RR+YLEiJD"
+    "BBlOrn63q2rEkbG27ZTFTv+oMirmHF23vt3GGON8Ps1h52173Y8vnz4+3D2u45ibvbm9ffvr"
+    "35jZ8+vL3cNdQlTt7bsP29Djsn+5+/LzL3cPz5d9d6G8u93+5q9+e3t7WiseHh7N5RR4btFW"
+    "wIvu7moiVBunCnVShKeh6ZdUnQbVBCdo1INp7jEmiBzDFNGOWlRIVZUPaHKUKEoRToEDbN6F"
+    "iq/0OMSmBq6RHUpE2JCBtwS8XrOggmGSFaxyzykmkkmYMJc3OaMQYkKT+orVMSXSPdeY2uZm"
+    "5PWak/BKVyohw4b2iS4rMhVWgYIXY+qgaWRqAQUp7YAkBJUwdowmUIenVJ+mKpPlsXc7J3If"
+    "NiP1CCcZ5ToHIgDxaOcwoVJUzxxjxOvqia7n6iJGXZN0FbF37F6u5ST0T2I6zcTdfYXpuTnP"
+    "ZgJYle8rlaqSWfFyOe4fXgp13rZJmlyzF+fTNk+2+8zC/d3Tf/5Pv7/9X//3N6PhmXumIGUz"
+    "JbwpFYo+R4iXN+Ajs5SBYoqhKiNESGqhhtCogUBVLpdhIsyC9E8Zr0AOUqkHTMYNsz8FmmKV"
+    "ajJknCDWeSFh5v7L8/0nxOvQOirGdsosQpSaRegwo1Z5OG2UWUSoDdJY4JCktkWpEqCZzZpG"
+    "HYM3Y4xcX477+4f7//L05U+XZxedGdkf5puxXfZjVc4xpSr8gJxLtEQidrWR1Iiam1VE/73N"
+    "rEpUxvm8nc6G8tfnp19++unl+SUrbm/e/+53vzXBsda+7y8vrzrH+28+iNq+r/v7x8f7x7u7"
+    "u8vTlzG2N+8+/NVv/vrDhw+3N5oZx36kvx77i/liL8fGGK/rhYhtGoUZriIEwS64rqGiKu3H"
+    "FCWYYxuLgipqEMUSICqLgsog4rRZZBin2kkmXy+vVBsyM6odNRluROZh6tqaFUhBkBURlS6m"
+    "PTqqcCGrcqgIS5XHsUTU7MS8LvoyQ6CN2i+USmvXI1McMWgEMl2NK1wlC8sjh41EdBPLTCup"
+    "IpEQ1eVRjEJG5Gmc2CUAEvTGXwhRWeTqZNpXWFRGROvFbMxEUz4rkSCxX4EIAsvsHh6pzMx1"
+    "HGqaPb3lFZIulKKIca2shjNX4qplqipkLuknrijB5Q7AM8lWLgOkirJ47JEep2nb1G0ocgeg"
+    "NrLy9eUiKjfnczznn//0w+9+882//le/yyowzSz9WurqjqG7i6mZZi5WIpvg5yL2FfiCKooY"
+    "xCJ6TFZX8llERKrZMBvKiMUqUYWeEJqRYmOIkSMxSjfohNnUW4XwuH9+/vPLyycFt3Fimdkp"
+    "v9ruKSbF6Cu7aLcqq6h2ggzaSaCZU8YJokmhVdku3Lb5xiQ1nvzTf/75l//8cPey74+Icdpu"
+    "WbF8iZBqImrFno+oKiXHnKsI1HY+V3lm2jAVmCqVY4zT6Ww6Ad33/eefPj49PVb4zfnmV7/6"
+    "9c3NySP2/fXVX0xvz+db0pbj7vPzL5/u7u4+u6+q+vD+/T/8z//m/fv3pAEWHvvlJTN12Lff"
+    "ftj3i2VZlAiYlXOa+97YcmSuzNM00WZRCUWqqjJlIHyR0f8ZsqqwRBSZvsJMTTSElFItM62S"
+    "zHT3MTWyQCNI1DoWCBOs3CkrCzbmsb5SzCpEKEMQzq+ktTmHN3GqZIwpMoWWXD3gujKnBNpl"
+    "n87mikWWjdlh3A4Yi8DjGCaReTmOocYqNauI6wUPKtBieKQYt20S8FWi2iXFArPJkuXIpaLt"
+    "hFHVTDdTkd4fIjxEaGqRRXYxuPO3AgAFFbvC0/A1MpHXBnFVNoWnf5CrglBUhFeYhkiWR4ZQ"
+    "SI2IZFVlLw7QNeL0yowaL4+Xyrg9zdOgSVZ3WYkxRivaN7P98Mvl8od//um3v/ur92834qgE"
+    "Eo68xsSaXZA0ad9htrqZyqzuJ4m7Z7GrXSuykEZGocUXIM1E6EDW1dpsIWckAatxK5Aq8YUx"
+    "z2Zzmp5mvNz/+enuhyFLfFdR4+aZapqpFPUIUJsUVUUvUKc2MdO2hBW3okArlWobRYaayXdn"
+    "eeb6/vnp+7uP//T0+R8Lh+9nISkJrspUo5pFemaIMoPLU0V0Dp3GVE8X7eoOY63zsJvz6XS7"
+    "FXDs69MvPz08PGXydDq9e/v+9uakoq8v+/39o43x9u2tqB0v9vj4/OXL4939y8vLTn398Ks3"
+    "79+/e//u7e3NG6S6e/gxp53OG8qSdf/w8PTw2O9ei0TFOtNRB+ksUVGIRWQDSymahSoWyj0E"
+    "xc4JRFa5TVsuEUTm+eaGMAJjaKVTsr8/qFQVj1VkJtVOmQe1KZawqY4GtbqoZSK6ISvo1lg1"
+    "Xg089mObm1cXNsdaqVKqVolxMtCjQppNIzXGQBUCoHUS9dgvYxhQY0yPykwBPQIiw4aK7Gt1"
+    "nq56h8lS5TAgvYpqWyU8GuRrHgcgc1j4qqwqB6XhWEIOs4osypiGqqgo6SQSVKyKEa5m7qki"
+    "SGfzpStaTqKUBstHeN9+VS2iMyzRaXwVCa8sRjp7GQWIUNQqvUv+witQZ+3104+fLs+vb2/f"
+    "Gq99F6FUu4v1OjrfxikTP318+Oc/fv4//Ju/EXqmCzDMMrOqVBq0J+4pIqKgIKsIYVFtRKSo"
+    "mCmgnrI8VQcrq8lhBQrXWtZralqWKaZz0irKMH6N84fL89O0MI3TQB6Pv/zyz378wiry9jTf"
+    "VaXoFNU6vKCEQmStFLPOAYlO6ggobQSVnLRJGqgim8k2BwHn5Yf7L//h8fOfnp9efL8kz8Uj"
+    "cinHeb4bJ3l52cXGWjsaLG8KYtqgBIh1LDU9bxulqHnattnh3shPv3y6e/jiy03nze3Nh29+"
+    "Rcpx2V9fXueY59ON2JuI+vLl/ueP/3z3ad8PP928ef/uw1//1V99882tjqDs7nFc1jC+vX1T"
+    "xTHm5XJ8+vmXu8eHL/d357l99+2vDFQxO90MG+LLiTRVITNBtUai2dCK2vclp8Ybo64UBiEF"
+    "oI2tiqSY6bGiI4RJCLBfNW0Nf79G11uTpCbpTkhErFxjzgREewNUkammVKJijGGq+76TPNZq"
+    "1WpFkRpdSAQykCwbSlRltqIiM1UG2F6zGmNUIT2oAvTullRc+wqZZkpUhoPSZMOhmrlnOCHL"
+    "0+xkNiOdCcBEzdeBhDTtrlhARna6kBTQjrVbDwj7WBtFlLJUWOURTqiZkNepqWe0C4TaZSho"
+    "v6uvXJHMqLz6O8K9dIyh4n5QoP1nXFfry0yLiIz0/PL59enxZY6TXpnYnKdzx79NtW8hCjUt"
+    "0h6fXv74p49/+7e/vjnFZBXZ9BaAmcjs0wYhPNxVu/gMVWumiSoLQVz946+vO6VEWw5RmQik"
+    "R9ocJYwlIrOgheUltn1XH/4B/EX8i+Xd/ac/reePlYepiUkKCoeIRlWAlFFipJhqamuZTGSA"
+    "Y6XoONucgESS3HRMqTmnVb4cr798+eUP8fj965c/SeoR1JmTxwpQTpDSk5NzhVcVrqc5BzDn"
+    "yAwBVIdChRxi23kbG7N8f718+fTl8vg6z/L+zfvtNMYYl8vxenmpxJvbN5vdRqz7+8fPX+4f"
+    "H56fnh+2mb/69jfvPnz7zYdvVHXfD7Kq1jb05rSFi7/68/3TkfH4+PzzL58Mebq5+Yd/+Pvv"
+    "Pny7mRmhClXEtIgVVWvY2/3ymhmqt41eiePFzByaJStydim4wXdax9rnthEV0COY5O4XIqF2"
+    "2jZdXiho1iqKGmjbDE8pkj4GSSV04ixXe7xWf6UgK5ZiECMqcy0RGaqoWu5zTjYOhSRDdESm"
+    "zVF+0HpHk4C0VCo9hdqL/YgQSLVDWyQ9lQPwrOMK789tm+djvZJtyqz/oV9QsaFSlZ6RYklG"
+    "oqXVUuUZ27SIVZKl6omoUim1kbEiFwqq12AY1HwtEW5jdlg33dNjjKE0HdXYH+J6lqZoQmK5"
+    "sCgQAJVClkJYZCoN0ERm1ujXorAqumghHF8+/fR4/2zCrIDIGLp8CXxMXbFMbeiAiHslDLCf"
+    "Pn76wx9/+N/9w3c6KNLNwWvfo5BZoQATxmaGK8W8uu9ULErfy7JiLSR13HiUF3oBzpJeQmSo"
+    "zpk6NTenYA7EJY7Lje119/MPP/7+2D9tQ4iKgVg7uI9hc26oQZpIJeVI7f256SlZtBnVDJ2Z"
+    "4JzbZgPQ0+k8X+8f7//y+fM/f/nlvyO+WG3IUVCVlR5hWnjThyY1XtalWCqqBhWmCzEoKOaw"
+    "sQ27uX27nW6q6vXy/OOPHy+Xi1JPNj/8i99tk+G64uF5PZ5P3707vYnMh8fHj/f3n3/59Pz6"
+    "fJpvP3x7+/f/8m/f3HzDfl9y6Vg38xCcfdXjw/Pr83MFKkRtvFwuNubf/O3vfvWrX2/zViTX"
+    "8fy6v5hijc3mjMq1/IiICJ9zuruIsJdGzEI2bIE0j5xmNuZyB/yauAGUVQKliJxQmUxfaWJV"
+    "dfgaNvsGSOm+YKi261dUN1Az4nK5bNsGkKg5rLmX7hkRpkYiknNaLK+EDev3PxhszCmqerIv"
+    "VuFFF0MlVPWaNcwSafFHVX/GucwKIq23LzCDK5ZYeeyUwSxWqVpGCvFV7WkFGC2jhg4IqlwE"
+    "+76jUsZwT7kqy6ubeMNmRFZRqBRGFDvmng0SyPRsxWljWEXEI7pAl5lIQmDKK6K4oCLueazY"
+    "Ni3pDgOAmtPCoxEcJDKDsMi87EdWznGa29xOGwUei1mmSoGKddJkjHma3N2fn1//63/94/s3"
+    "29/89hsh01HKYifhVXrN6z6moVCQ9CQlCxBEBAVZvhYiYoxbSOugxhUZTSxP3WOczpmqENUB"
+    "6u1paj59+ef/51/++N++/6d//OmnH0r8ZrMP37578/bm9u3td999RxXRWdSeZKvMDOUYBWTN"
+    "IcNtpJrqNmRAthpzDI7Xj69/+P98f/fHl8vD2i+xv5w28ezzStgQYoDVoBQlt7mteB3WH2qa"
+    "oMxYNia3eZpzNlztl48/3T/cLz9u3mzfffvtaW6xYt/3DAy7OZ9uqdvDw+v3f/np/vE+M6aN"
+    "Dx+++ft/+Ptpb+Yp9uPe/bKdzqfziSIvr/fPr18eH/f95VVL3t68OY1zCET17/7+b8+3bw5f"
+    "7gv7TqkMp4qp7JkHaSo2x5ZL1IiSud1kdAmUagoGq8IdKm06j2RkqIkNjVznOSnwCs+MwFAt"
+    "wEwb0T9tmJ6ygsjjOEykJkgRbBkSGRkQmsjMhKhCs9nWFT6EVCUUJSDWyjFO18pe5pgDhYya"
+    "phEHUNO2DEeHfYRAo/GbYsdsLge0JZ8mwdqRpGxFRInoyFjXFIQB1RXjlELyyBByCs29h1Os"
+    "XuiKRRygmI0EzAYpWRXRdahyTxFFXTeHVdXMlEL2S15VqjyrIksgSFFoVGalUJvFBV6ncFVZ"
+    "USJTG1ulyXY0dDvfd7WvQ7BMU1mHZ/qwsW0bv6rDh42vEoiuTJmpIblt2Hy+XC4//vTzX75/"
+    "992Ht7cnQyUK2Wa2a4o1aY3Or2EjwfBQ0ypkJvoYhBzDjsRypyqp6/CGv7DYOGobQ804RGB3"
+    "n375x//0//hP//F/+/TTnx/uHvbdVx42xrtvbv/1v/5X/+7/+n+RcQPTFFOZUVqQSqVuut14"
+    "1XLzeXOy86YzxWobt7ofzx/vf/jj8y9/eLn7MeFFL6qO6elZECWL0SODzDFmZZrIzTYz0/dn"
+    "G3Y+nc7bttYy2c7nue/PTw8Pz8/Pay1S3799e3N7jjr2y+Xpsp+27cM379zz6XH/6aePn+9/"
+    "zsibm3e/+vb9tx8+DNt6ggQYmW/evNnGrdjw5es4jv3148ePUXhz8+bbN+9Peqbrw/PT0+VZ"
+    "N3Wkzc2GKfT19RUVWWFFz3LAMhmL4Q2VMWIU+nPczsQFRESS235EVYWmTdWhZIpEVGp1JpGg"
+    "eZNl1Ezssr+qmkqVX+nkFNV0CDN6nAvqYNWwGYnKVEkB3ZNIM+X14ymqLRmLuZmqQDvlGl3v"
+    "VEEsP/aLgKfTaV+vIG1oRJjNBHENLBuq59YR7pRn4QDOjmg0pKoC3oZNFVmFrv+W7zamCMID"
+    "WWCqiPtemRh9hJsi9BXFr/FbtBNTV3SXCCAPX1cFhKqqHmspeQ08X7ucGQ6VqaVNElvuIJMp"
+    "RGQMYWb/yROsyIvHIgeJzKUGVKqZu6MUUNDP50mNl5cnj1XEGEqy4Z5CqNgYc84TxDKXKsaw"
+    "L4+P/+0Pf/zt7371d3/1G2ZGdiUA/bilXO/bQu32AIGMUqXZqGt6u4vUXTliR0lb9aydMoTO"
+    "MUvsy6eP//W//Lf/9B/+t08ff3p+ea48KtFThH0/vtzldvv+5u23Mt+MOWKlYhPbUqRqQE7Q"
+    "0zZnpAyljPfMaeuX/PxfPj5+//jzn+vy6OBLYnBCGC1MAzrx0v7HfqQKr6Jhot6+ua1IJG62"
+    "eXNz8/L8lB4//vCXy+Vp2Pzm3ds5T5lYa11enuc23tzc9inshx/+9PPH+whs2/lX3/71d79+"
+    "b/YVilBKse10en3Jp6f7ucUuvH+89+WnbX749u3f/c3ft0NboGe7PS6rpERxutnqK33YI0VH"
+    "JyOMo++h1sXlYTJsJjZfSpbITiQqTJleMigiKhbhpi3W63lNRh5ytbvO5Q5e0zbeqO9K5PMc"
+    "ctmXqJEFKlRZekQCdW2EU8r9CgtHqTAjzUYXJ0Qmsky1aErNyqvzQkBWxCJiDCOLRfcwnQ31"
+    "UO0mrahOkqwmUC6RJJLlhEb0sEiFikI6iC72USCUhJaBlZHwCJImrMJSrdIiMqJQrmYURb/q"
+    "hc1kValeyKpoxLXPq2ZERqSpomrfL+wzf6Ve7b6lYoWKyDnP7itr9arGw5WshtYRhVZAWOTK"
+    "StVr1VlEslqVVrdvzsN47GsMDSSQNsbb2zeF9oCJUN2PovdzhMri/Pjp6R//6cd3tx++eTcz"
+    "X03VhkWGDA5TU43rQxkN/RNhwauSZWs1vckuK6MiG8mcyFpRZf0zuj/f3f3j7//wH/79//fj"
+    "9x8TYzttdlMR6snj8LW0wm/fvHn/4Vfb6Q1lKw41qJ0gU2yDnIKj1Gjz7faWwdg/Hvf//fnu"
+    "Dy93P10uT3tA9ayUd4YFL02pQoaZFNj4FFWliJki8zRn1Qr305g35+3zL58r49hfv3z+vPZ8"
+    "8/bmX/zV7yLi5eXia2XxdDrf3r6LWF++/HL/8BDpavab3/767dtvzqd3hVrxpDbbNL/v8eXT"
+    "/cPrX54f9m+/vf3u/PbpeX99WafTHHPul8N03pzPN+cbpTLk58vPNu3Dr39n0/YjXp6f3r3/"
+    "8ObduyGmFqiwOW4iL41QMG5kxTJuA1wiQpQyWWHURKwIQKG9AZTMVe7YxBGWhJiAm56maCb2"
+    "40DmWscYFKm1FhxCjqlrRWm5pwoHK6v5gCuR/YTO5dMMqco8LpehE0CVQwagSl2rzGbWQcmW"
+    "k5gslE/bMkuEnktgm02CmVWVpGUWpKm/aOKsKjPOVaBl5QYwEVmhNJHs75WqDhVhHu6qCjnE"
+    "rEKqgFyQrChg2LDKcr/STStWNR6KStGqFb6H03SoItFfsShk58LRvYUKZKYgcwnFvQCqWatI"
+    "UUopZQbYqMzuHXmiqn8iU60IRwbAdtFlLbKQfnuW46CoTJvbdiL711DzPEVGluRl7fselOX+"
+    "+npZfrx6/Yf/8n1h/p//j//mZuZpisWqXLd2oxCkDx3p2lGxKi4vSgmBhJr4sfbXxVKqtRc9"
+    "ksqhLEYdL5c/ffzxP/7n//jpp4/Hvo+h83QuWpodx8Bazkqnir1796vf/u7vzjfvUTL0Fgqd"
+    "MzHUTjFOqiNZpyH1+uPlyz/d/fSH4/GH9NcSZhvJBO6Lam0XaZUqqsgSLVMFoEqh6eAwm/N8"
+    "Ok1mlruZvF7uM8cc/ObNu8p6uH+kQHVT09fL6+Pz/S+f9+Nyubndvvvuw83t7ZjDl1QJGKYy"
+    "5u3z89Onn758+fz5+em4uf1muz3/i7/97YcP7zwy8unbD78635w9nojjzfndNrc4YmU8Pj69"
+    "7vuvfvWb9x/eHnEcj0/fvP3w9ubbOW/I9HWkh2UwInUQ4OGOw7bTUM3tJjKPcpDS+8ZhGzNA"
+    "PZaLyiWcXtvEvj9t51vNGZUknl9fVUYFTEzIeT5FHGs/bI6syMTlWEBvm0yAlO7qZudEIkOo"
+    "HLMAiJIkhG05QrBEdRQgCffDBqTFV8gsF4ljXVopp2qqjPSroatSLCUz4YSgRJSZ5QWBEeXu"
+    "olONHt4iskpFdTVNAR5HNGyhkp2fMiUJX4eKKXF4oL5umMPr6/9UNSJRVLGMXOsw61fxAsNM"
+    "Y7loewNUKNELLuW16lQ81qIOiAJpY0u/dEGoyCq+7hcRsWH96y1hr6MryyPHYJ9U9svrttm3"
+    "357XclDUpKpEbDudijg8jmOFe1Q9Xy77geOIdWCFfL7f/8N/+/7ueb17M7fJ08bf/vrdb38D"
+    "odyc7c15IyAZFFMdeRyNBCkpUL2yTMIFrChHIJNMvVyeH+7uf/jhL9//8JfL5bKNud3cuGdV"
+    "rWNv5FxmVSYAT9y+++Z8+x5yJg1jqojMgRocN6bbafh6+vHhhz+8PPz0fP8R67KZKCWipBuW"
+    "LJAeKdZIMhZKBNLwSqpStrnZHG3/yszLfphU5wGAAvL9+zdTN0Kz6vVyub97ONaiyHY6fffd"
+    "b7ZtihQlW51nZqDe3909PD48Pz9mYRv29u3b3/327bv3H/rqJ0wFvvv225vbeRxHvHLoYPHx"
+    "4TUi3755P+ftu7ffvX3/zvNw329P52+//SbB43hdx25afrhRREqkB044PNyPpUPFJCMKGOPs"
+    "yzPKCwADSVEbloiCvLw8jpuqLF/oxAMQvta0zfq3FX0xtqFyeFCajaJSrdfOK1euXESUGoks"
+    "UZO1X8gac1t7d8a7BOPhCZkUE1RWVHovhJRRtVS2rLimhSAUIViZHRvop0DrP0WEHEyy+7PU"
+    "SEeX3KtsWHmAamPaaEL/hEmhG0wyNov9VazYyBfWZuZejDShZ1CurGYSV2VTVWRMPZHpsXeP"
+    "MGOhgmR6FKWaci9JaqISneZgoTpjvu8Hcf3TVFhZc24tlb5KjaS1o4xKEXVfAC8vx6efPwtw"
+    "s9ledURWBFVE9Pl5P/woyuV1B3F4rZDLEYdnRLnnKvnp8/MPv9x7+WmzN7en3/zqw9s3PymO"
+    "N7f23Yf3333z7u2b8atv3qlwjLFRSa7DF4qiZEUd2QebWn7Up1++fP7l46eff3x+fATqpGYC"
+    "FRk6PLncl8daa61YKzJZKp4MnmBvRI02TAsV5zlKa3/8/c+f/nm/+8vl+b4hYi0JKKRsWpX7"
+    "vlNLOUkKOea28jCTaTbGmGMbHCym58Pd/evr8/tv3py2icrLfjw8Pjw9P02jM57Dc7vN1E+f"
+    "7obZNrZv3r1/9803OifIrPK8EJHpd3d3T4/75XJE1Pnm5q//+q/tdL6ZYwiRQSnbxn7smYks"
+    "m3a5PB8rTqc303Ae55uzgaI237wzs+G5lmd4qdk6VuBSOVp6qrZZ7z8q3DMjY5zMhpUjAnO+"
+    "2f3FPaqYGRmhikSpaqWjfA/ZbJZXUBA1VU+neewv7JRgIplRvQqXhIiO/r5lxNC5lhcWpenF"
+    "PHwXGZ0COPYnQQHl66rBzIiKENUM71DhGDOrREdm9rfs2HcxadWdqhYQK0xrzAG0yTopiXKl"
+    "smcqBURtJtKnuoLqrEKso0M1Jurha/mcm8iWEWoGYnUaREhIRlZ2jzsbfgFkrBxjtPXTzFak"
+    "EA2LRbGI5U6kCVW0Iglm6VoxhgDivsCrVawF3yKaWZUlwk50ixQKEZSGjlAiY8W60gLFGn2B"
+    "xMeffrn7/PD25l0cK9dhOl73/XU/XtfyaO7hPI6jwCPqCLmsXL6qHzzkEemF5VhZz7v/+MtH"
+    "QLaZw/Jk+uZk79/Pt2f91Yd3//D3f/Pdh/fv3twWOW2QeexHRJXZy+vl0+e7H/78448//Ojr"
+    "UnEMYhtzs43alSX1cFEabLkfx3EcC+Cw04dvf3f77lux0+l8HjZu9PJ895enL398eXm63P23"
+    "4/JoKlXmpUOMymQk6/DdxOYY0ogmMSODsW2n8/m0zUkijnh5fnp+evXDbciHb99S8u7uU3iq"
+    "sTLfnM/K8uPleT2rjHXUh2/e3d7cCjUJKF8vl+eX15TaL8+vL48RS0XPpzfffPPhfL4R0X7h"
+    "CTu9o60aV5WqOJ3HNs0Db9++37a5DakAQc9cHkBe1n7ZX4FUm5d1zKzTNoCTiGWmTbOsFX6Z"
+    "JyPZ8d0Va1PJOi77IWokPbxQKpUoNXM/rNg7dOW5vGhDVBnll2UiNmwd1QSToTyaFyPbOtYY"
+    "hry69eYYvrzHql7HHHa4ozCGeURlmIiCDb3uO2Ki0dzZBN1KlgMi4W5aquYrxtC+dipHSYVf"
+    "Xl/3MU6EFgQIirb4soqReRomUoXoVkFVFFDpqwpQ3UbD7jJLQBFzz8y0oVmCdkjKWO6jbaSd"
+    "uBKoMMOl634r1UZdOxetLemUUmaS1ehIg5ggM1cmzMxjkQEiVlBGtKBVaCKlSqYK9iOU50qQ"
+    "1f0lyHX2vZZXwaPCcx152m6GzdOmp/Pt62UdqwC3McWgoiuCahm177unQqRQKlMrD689EqCq"
+    "kXpZa7mb2bGf8boENXXxl2cTvb15/P/9/vNf/eZXf/2736Auv/7Vb3776+/2yB9//sv/n6k/"
+    "a5IkWbIzwcOLiKqZu0dk3lt7NdALaNBDPTP//wcMUb/NSw8RQKAqVAF3v3kzMyJ8MVMVYeYz"
+    "D2JZmHxOivT0MFMVYT7n+769nT/8+NNPP/18fBxCebpuvbenrTVvrW3W7Bz1/n4GkVUUW0Cp"
+    "1ntE9bb/47/7X77//m/26/PWbd6/fvvyx9tP//Xt59+BoSrrUavGxgTCTIpwMdOuau5NVtFQ"
+    "sLWmvrW9RcTrt9cYI6Na3y6XS/V8+XQRyR/+8ud92z99+ty9Hef94/29mTy/fNov+0iMBhe/"
+    "3969tf3puZhfX7/+7g9/hOLXv/r867/6q601N0dpVKz/vSLAyUKAIWVuTXzfr6bae1801axG"
+    "yDmCBWFkVSSJKJY13/YnUfVzaLdmLcLnLDLPGW56iTFG1X5xk4JqIc61yK0tRk7GQ7SoIsI5"
+    "h6rZ8tChTzE16lAQw+779pQYiJnzGultPylBqIpnAmLJJEiJjOpyAaoQ1szKI0IpIswcKHZv"
+    "8mDcRAUhCjN3IQqZKhGRakqKQpXMSbOGR/JCjL7EU6LWrS11g6qUWBUFCRCFrgC5djyysou1"
+    "tpguMgGpJeCGmpgUq2AuC0RZfNAfTKFLKyREhUFURJqzKjNUaG4zz+XRLoaIKB2UZo+8J4Wm"
+    "FGRVzVmALuCGikWkNVFBlayb5WSuHvKMrKIaAEUlWIYCNfmQIS3eTVSNrG9vr+eR3r2I1/f7"
+    "mJVEApE1UEulDUHrm9AMujWcFYyHdG1hJ2bm6jwXJfNcRuCCSKqZzA/58evr73+4ff7NT01r"
+    "3/74D//4j6+v3374858oKaIZ2dVeLs9b86dr27qKmDVv27aaCDyO28ctc8VaOaqq8m/+5q//"
+    "H//H//352ef99z//8Xfj599ftsZxYwSVYirSTZJEpS0CaXMjAmLNuij6toTAWjFixtv7OUaI"
+    "4NPL56Ke57if9xjz5amb8a+++37bNhbG+b63dmp9vL3b8/XOCup+/a63xmu7v399/XaIX5rb"
+    "P/793/fr9eX5whyV4d5MTAMQnvNcO85933vvZureTB9e5awUClPPYxZLDVVopmKy96eMSL42"
+    "3/t2SaKLcc739/n+8TqZ7/dxDvc4p5uZsjIyTghImG9Ztfzv5zjXtSpJg6g/AEhSAFINWeXK"
+    "Ii7uMWPVfigizkQya4UNK0JVlTLGUGneLWdkzkeyKmNdijNC1ERFVSqosm6kRggFBXVd12+I"
+    "6TrgrbxR5pRuBSjYe2NVrmzskompVCaqoGutXSJKULVFjHU9dm0mWC86ET4kF5Ur+rQmRqLG"
+    "nG3h1mDufRk3a0lQoNZ65TjPQU3Vx7J3nLME7r2KIuuiastvUklVVymoRuQj/ilChsrDk7ba"
+    "kSuVoapqLrKOMVQzFBYhVFWTNEBFMsPUAImoMefv//Cn19vdXq458v123O7neU6K+dbOOQn1"
+    "bSdkRAYhpixZRs+29RhJVTUNLgbZY0WW9eCQ1Ug1dtWaWckx6+3j7MKffv747e/+ZKafP7+o"
+    "elYIxEz3S7s+974ZWFlVkSGB0u3paUL6HB/vd7LW/lK0/v3//A8v2+3nf/1/37/9KY+bSP90"
+    "/avJeAw7Aqt6XDVba5nrZSuqbdu2y9bXJ2Sc59v7e8axbZfrtm++3W7Ht29vM2rfL5enS3t5"
+    "2rdOhMh23sfb69vLy5az5nG4snWtApMxRs552dvn7z+dIwubtcvtdm9bb27QNsCsmHE3t+2y"
+    "b9vFrIvQVH+pA2DGPM/TzCJizIA2s2337k1NGgl3Kda34/Xj9sOn7//3++u8H2Pej3k/jvv5"
+    "/jFvZ9wO3D7ErRIoNRRWoL3cLCIgyIje0LvNMQkpMCYkIapNLYvbZjPLVLPERGNALLa9FauQ"
+    "vWUx3Rtpcw4zmkkV3bcqolIgbloxQFOzilJVJpcFqApcNdIsCKz3rFJ6cp3ujEDkbA+9MwQG"
+    "AoQ1j0kye7eVQxQgEw+WBAWku1XSFjBc3MxQmTPE1dRUExKZWgxrRqyO+gBgSJUwjUoxeyHB"
+    "XBw/V8GMWSSzRM3cAGQyST525SnioGbyrNNdQVlcDveeWQ9PG2kmmcxcrWBZFVwRtfXGXvga"
+    "5KOiW8t0VMV1L6gVg13FvyJ//4c//u4PfzI1advb6+3r6wchJQ6RmVWQRf0QsUl+HKfILNoZ"
+    "mZXq0rsyKOZd7e39Y5yhprJsFRFre19VCJpAzZNyO3LKSpH6Zb9428c4jnNu3a/X6/Vp613d"
+    "tUpE9HYMnqyq6xO26/aM53me5xEqBMbLy/VXn7e//PY/SX5xFdK9qWjFPFtXNRmzTNUMpdqb"
+    "SG+rueXeyDqPMyLIckFXke1yP87jPklp2968XZ9MVchUY9U4j/v9fo+ZvW/dVCDfffq07704"
+    "e3suNPVtzOEO6ohKd3Wzy2Ufc4yzMmfvfb/07tfLZQeMVJUGcM4BrputwCimENn2i5o33822"
+    "jAEWRKv07X3cbx/vb+fMy/vHjx+3+vI6bne8v837fWTpEXMm53RvFvdxGLraBkUmRiTB1rx5"
+    "i7gRAq7BCbKKiW3fZiRoM8O0EZJV7k51SnzcZtuaN4eGlIDKyuZ0w5xnFVWNWfaI2klUsR4f"
+    "XKWYaa2eTRaTQqh4rfcvcM7R2w4AmW66uVZNUnOeW9M1rlUoRTKrqlwtg2piAjOf4zSXSi4m"
+    "YMyCwKxVphQgqJoCiA2Rol4yJbJ6bwKMMVRByWSM896sK5Axq6iLebHq/OuxJFIRtnqiasDq"
+    "cGElRqrovvDOFREiGCNJujsfldoy9wW4rMqsX4KMUipK4jzXA1ErWMgVtyZrPZhasypGpJgV"
+    "8fO3t2PU88vz6318eb3djwm1trmauxsiRDRKx5xnRibJHHNAjMyaCdFVUg6smiUfD9Y1jQNX"
+    "tmRkNtWmdh9TINmsuwsxo97ePqoiIkx0RL69v8/Tn54v3jySop7BmfHl28/X697dP39+edf3"
+    "2+3WHP/w97/67lkRA9ISLcW3B9EGW++F2ggATb113y7XlQY7z3G730hSzNxdvcZROUFprbt3"
+    "b3tEzExfQ69IVwA153ndL/vn63Gcb28/XC9Xsyai4yginl4+jcgCW+/nDFGHyv24qdrnl+fr"
+    "01VNRQFNVK7jZARRU9WIFKWI7PsTnAQyxcSrkCljnJkxz3Oc79/eX4+Dt4/7x/1Qez7uX3/6"
+    "8v5++BGXYyj5RFEixZAKJyaktLWZVtwoVSVZQyS27qyqgostHbZam1HnOZcher90AFlZ9CRJ"
+    "adYgFcHiMMi29XlOgNZTVb1JBSKnSMVQYFmwrQhmQSUzSfXeURpzAMaitr40M2LaTIq1isgU"
+    "M4e5ALVv3V0yCwUmrZnISiot2r276pzjUe9ZhsJ6HEqBtXqp5ewVcnHCvF3NfAUtKlNFWNDW"
+    "MmCuM8lxANpay9XAWVYUUYGMcRhEXXVlF8RY6uZzhmCBTliZQKlA17D34XACwIhZDBILXl9F"
+    "WQwUIle5X3QB6M2YTDXVogBxnmqCtTBRVtX9fv7887eRWuK3kfeZAVO1uUTdlGPmmIOic91u"
+    "RepBxS63xcpwp03qMQaxgt+ycGKP4begqsw1hTXHiqnLgyFdmbMZbMVeiOM4cxYuz1tnc2Wi"
+    "ikW03se8j+NObwrpvc1pBfz1X393fdJAIcUruoXr03mcVWUmJtp36+3qruI157zf7+sAsvWu"
+    "5vfB8wwRaaJ920ScgPfNzJLZ8dj1ukIYlfV02ZlamSq4XjdT+/i4/+XHL09Pz9rl9f09ATO9"
+    "HQdUX15eRFtrW2utN4+MyioWKjJCVTNLtWtzFVf1pXo0t0CMEVV6GxEzj9vx89e3Mc8xx+vX"
+    "8/2jz6H345iEWC+3MS/nPeackK1dGmkzY7H2fRJBOYNY2+413hXNXLtsVcMYcx5DWpOiij9w"
+    "L+QxSnhv7nMkK1f5pvXlMpkiOk4xNVFmZuZpLhAX0jQDKqIZRKmJ0DdyLCtwVUWUqNYD5KtU"
+    "FLKJmNoYs/n6BkYEvAExAwptakZmkpK5muVroRVzFNRUaNqsLSh8RkG0EqpIpAhVvVisIWJm"
+    "O2FAqGplLcCVLvgWlyMNv+jConufM2aGNyWXqLqLWhSzcr1vIYycy97n3ig6xrs7zFBR2jwz"
+    "M/NxY6ehuDZwVSHmsiLiMGFFneompZmhgm5GZjFUjVoCqfQEKcryb+9vX77Nj9P4Nt38PgvQ"
+    "Li2i5hwfODOTIjNHBNvWimmm+6WD6NvVXGbx/axx5JwRM1Wt73tWgJy1REWPGe+MtPXoEEEp"
+    "ypZLGBAK994u+zZjgPoxBt8+CmLe+2Yo3O5njNq3fhzDzAGtwl/9+vv/+d//XTMFU42yBFYe"
+    "M8IdW7Otd7Iyj3HjLBQS4NZaVi4ThNneLhcCpkSculJZc8Tgqoi4SEW4Q6F7byI4jsyI1pGp"
+    "5vr88p03Pj0/BdOaf3q6tu4j5r5191appFbhmGdlcZH6DK3vIrLv3bS7blFxnrdxjvsxgjwH"
+    "bvfz4z7f3+N2xLebHsPfP5jVx9EyeiZa+17cGcxEM0E7ss5znpdsglTRQQnQoembwWTOmExW"
+    "bd7MrLLGOaX7zBBqgVIrIZfBcjc3nfN088hSd4hklpmQxioF4RhztiZ4VNutssxE1CFQkzFO"
+    "UNWsyJhDpUR0seXUClwzDgEfwtszom992xrrAMCC27KhoyolH04gIMQs4lxUJFNp1lGoCBHU"
+    "TGtKVka4N9FSbZlwE+KcdTS9ZEqKoqKYaiJmrNLmD8icYIzZt2ZGkpmxXuetras0AeltX15m"
+    "Fpq3iCiq6S9B6yLllxmVrrwZRQiSkQUKYW6iLqaFVXzURzMY5aouVswVzDbfVmKEBKiZuQKc"
+    "FBmBv/x0/OXn8/0m9zFMZ4zsvbmYQAt5zkHCWzdXSm37BpSpbG2DiCprnVIiK5IZIM2W0xxR"
+    "BYgs6LpIZikURESpqAiX6VQAMSvAWp9ZOYuAHBHnuN9ul8ulXfZ2eWom2ts8h4Bz3AF+/nT5"
+    "f/4f//FX331qtnymUPWnpyslhAvFgDnnOA8yzbZLvybnYJqrq6kKi7MEZG9tzlMgUezu3pez"
+    "qlShhubWN23NvBlRxxEQbd2sLt68Ymtbvz5frJm11nuvos0pWuuaxjISjnTzdrmieaAkiKwY"
+    "eZ43xMeR48sb3o92P/vt/vHl9v5+u90Hj4nz5KhPvX2ekyAr1IylvEMcNudphsho3l+++4T3"
+    "j4/bu4oJxLYdKm6OiMqqBEqqtMQ1Z6K0WVdtLIvM1ZIb50ETa07BGdM1gSJVWKw0baSNY7T+"
+    "+D7v+7WKqi6CY55uCnVxzDFZEyIxQ9EWWgtAzCRBLcpcuO8CK0NgJrLQ4VknaoiImouowJr3"
+    "Ypm7i84xqCSDgFsHkjSSFVR1V1QxZrTeVFbPGaQTmgyVsGYZSmmsFBNQ6kGbkZVLE1FbcBlg"
+    "vZYBQtJMgbVioULNRETnHIvUJ+qSlIXvoSgFEgosKCQrivnY0ykXWGvEnJX9shcUyYc4FoQU"
+    "i1VhCwrIzJoAZgClpGlrlSYiR+KnL++//eNfbiPofouxiOmBFC+AkYSYrp/Q9Olpb+7uSkbO"
+    "063NOY8zJowFV33aejN/v50wbb1PBlksmgEQFM3MVMcYS1uzwnyAJLj37Zx1Vuy9AUbYwkof"
+    "Y9xj9BHXp0/7foFv8zzGOEz5v//H//Dv/93fulbbmgibw01FR85TAFDnxNa3fd8gZbJF0Lw1"
+    "LML+EK3i2loKjc3Eti1LxhzuuuTfvRlQ53HDVNEm2t39en06Rxby+vy596Z2NbtQkkAV7/cT"
+    "j5GGctVHfSNUtGr5aeMYM87zNoO3W3z7cr8fYxzyp2/+EZ/P4Hl+I5DssH4/qdqh9jFiUbKr"
+    "LGnmrTLvR6hZ80bkkXHep7X903d23O5zTObp1nzRQjJSrVODVVnJKhQjkrRIIY2LCjpDoHCt"
+    "YFWpqCQEEHMSIjpnqABg38Raq1y2K1NVt61qzJmmllnMcGvVxMznjMyjNVN1UoMpKOasxAM6"
+    "lSUKWWVUPsDCj+t3orVmCinJWsfIUFVBq6IuviXLxH+ZJ03BCnchV99N4M3AGlO0pGmronor"
+    "yjIzC5dXrEooYhQKRSALNGPqZmthM0Skd59nzhgE1jOGqjNzSY9EJaPETKFkqixEXlaCYHMH"
+    "C2AUoBCYQJu18zihK8VB1QUrT4EXREQpzCr3xlIWSGHJOfPn99t/+eff/PaPfyhlIEYMlPZm"
+    "FDnGuZgqq/S/xKtuYsLHGgCFmkyMyTNrEpn5/Pw0g/fbaSJN9X94l8ma08x6a6uMmZVu5qa5"
+    "YOtgFeaMp31za5k5CYi0R8kZYrzdznHm1rdt263h+++u/+E//E8vL3tzg63jSWy7zfM2xm3r"
+    "2/PT9ThPfZBxCTDXmE9lMT117aw2AaTiTAqse9tUywQmAsKbASK4uOu+b/t+yQpQ9uumTm+a"
+    "OaNwxlEMUFvbAN97N5WsgGpRs+R+HGe8xpwft/M+6v02Xr+225332V5vnNmPe070UTkRZtu1"
+    "NTOfGeYAHFhmYzT386zEELXe+owJq4SMqBmp0OverOsuau0e46xzeM6oFBqhKQ9pc93vx+49"
+    "Qc4cMyDidFGupmqOUt9UW5GqwlqcY4uRaumuEdPdpshEqIlWMajWvVvkjJlCmCsANY0ZmTTT"
+    "8zx6e3ZvGbOCUKxR2ZgHs1TVui9T3oI9Nu9uWyYyuY4PqGptjXmjt13kwU5GYXH5jjFMILY2"
+    "ZmvRYRlTbM2WrswZlWoCQKWtnh2LTDYXKrK43lysZQiHmM7JX6gktRJcxfDWkb907zPbAkct"
+    "II5BKSjPjAWjLaL3vkIIsliPgLllAUUTX/3inFNQ4vaY/K0fQwggMgSu5nNWTH77+vbP//q7"
+    "P/zxx8oiMMbMevRyRAHUgthBUCxX3bqbCiuiaCb73isK2uqWr+/HLOx7u+xbLywUXXdX/Fvd"
+    "gir6dL2q6P04akkEQf7SlHST43ZsvQvsPKIyp4o9X1KQiagYcfTOy34R0cp4eWr/8T/+b58/"
+    "PzUXVOUxRNC7Xsyenl7eV9rEYL4GcXCzCooJHsG3LMwlgzZf4TuotbZfVY2hezcXjTmltTnG"
+    "y/PnbdvU1NWiBihQzxxnRZKq4r61fgW6iqBSyfvHbcxRxMd9vt+O9/v58X5/u8W3w258OrKf"
+    "t4zAmEHqtl+meeYwr2a9xE4mZ66xpUgWS2yHasHLaCJRnCPN/LH+h1rfwRyV4z57s23fHLNi"
+    "OipNdqhlsagFud1K2ZeNKqW2rVH8HIFK7w4AaglkkVqgC+wctTUj0b1FjUsTZmAtLYlt6zCY"
+    "4Lyf1mDqiZ7M3vY4AiLWxJaCE3GcJSIqm0JEmWOaoVRUKagIinetIgv0hTWvOomCqbWehLAL"
+    "rCohqrXIyjajzBSquV50kpWpqkQKxNUzU1QAK9LNI0q1hJ6zSLoaKw1QYTmgHlEiKKiUsCgA"
+    "xEQjZoBdJWveTLxIBDYxWVxDTrPS4qwyse4tcoqY+OM03LtXRaLcLSurUKVSXN8XETXpxags"
+    "CitDpaSwtV4loGYs0F/+8c8//fGPP759e59nZkxynZTKzIXV3IEqKRUx0fUeVmBCImaHX7YO"
+    "0xrzDHwMQdWnq15am1HNYCYxEyJFKQBcfiPNqHlO1jpKSDJdW3MnsO3SrN3uB6vc7NouWTbu"
+    "pypFNSdC5inazNX56fm768XGeauhptg3U2XvmjETcr1cItJE9m1Ts3gEOvIXLreYWrDEZOvN"
+    "RSlL4bR721Wl6eYCFRvmVfX0/afMHJV5DtN1D7OitvYspkCpmUAzEDnHOc9jvn2M1/fzfsTH"
+    "+/F+z3v4tyNGXmfqIJKplij2vvlK+xZUFNqpOmqx+LpIVgwBujdkqkhOHHOaN4GhmJHioiaj"
+    "kqKLQLcYFKliQlf+6q+fPekzERl0rRREGso0RFDVID6r1iGLzDmnua/iqShYkhQTZeTD6Z5U"
+    "44iEax1j2zdVVISoJsLMBRWxLroeJZQuisiAeomqSK4QkJqZz3EUINDeW1XNGdaaQt01M011"
+    "zimobV9rFXncBVyyisjeDcKqEIUsFDVqNQHECpLLhCjiEUNUH5MkAYsqC7GixbVkWpXFKpbY"
+    "OnpY5nK1qCiqSIQWW+uVRtC1oVYdYNFtKouFMElCXK0ikgVUVpaIWzPVqBARE5LFKlWllGBR"
+    "oAkiK6ggxc1Ti1ielwWQlawq4MuXrz/85cfb7VjG8H3fSvqYYSLL/CSsc0w1ocLNFIxxpujM"
+    "nGNW1+u2XS/PtzPPEZnVDNvml62P+WGm9/sBjawy06VIVLUs3M8jGdvWVueE8EWZ33q33u4f"
+    "d/LB744iz1ksd3XRiCxJSH75+vXpqRWOt4+f+vbp0/Nza4u/tW6g0txZKYI5R2s9IlhZoCia"
+    "KMRa31WhegGrNV/NE1Mza63tC8zOyPMcS5hTZVnVvDUjzd27wApSxbqPj/v9yHmM+fZxP97G"
+    "x4mfb/Zt7O9D5xFVPoaU77lYAFxN0yksrZAEoBANUiSteSRmEiYKJem+15xIXZTkmMESWNJg"
+    "ruo2IkzVzWdEkWpCQYgzq3X9u7/9m3//d995oVeJNi1ZNGsvDGqdZ5KbKk1RTPdeOSmIGW5L"
+    "P2VqLWdVA0syLRGNAnBmmTloc4TbMpFDzYo1Roho9z6JMYp8qB9HSiRFplkHpSAjE2puBmbU"
+    "YHHrDUIgMqq3vkAQ7lp5FtD7JqLugKK11qxlBapmTrVq/QKuHhWXghNwFQhTkKDoL6D51hoZ"
+    "i1xVVJBqjpxZBaa6E4iZa78vZpm5+obrixpRoIhqFjJLlwz9EYrEehkokBkEcyVUVFSNa2la"
+    "tW0u63xsllUmps2r5vIqqVmSZi3GEFE3nfXgaVYykrfbxw8//Pj6+laZ3mxvjgCOgapK9kvb"
+    "eq+cWQ7hZd9VZGsqkIgwlba2QGorU5WZBu6bv7xc14dhkWFa65Pnin1A4WYzckR4s/3a55zj"
+    "CNHl6khXrBeviNWK6Y8UyX3vUKWoNc+aH7cDGe7t++8//er7X7ljjtldzbBtm7uQtfU+xsHM"
+    "9fgwaGQqRXsDpLXu215FN1uDKjoWjVBEq2YWkZUzVTsJE9v6c2cKKIXjzLfX2zHHx/12jvPH"
+    "H7/eT327t/u4vN8ZEjMlQmfOoqm7Aq1vBanMWU5REXBNbvxC8SoKdcxQo1TNVPWtRCguEIAq"
+    "UkHCY9KXoGi1GCiAiEolM0LNlqxUVEVLkc/Pu4F/+v3vPciIMjdQxyzVLbLGWSadaDOGabW2"
+    "zzmi5vKqnOforcegdEQEKnffV4E+4sx57O6ToIm5nvPeXFVhsnDEDtEAI0LEYs7WnFKEbnsX"
+    "VAxgUdGEC59GlltWpdLXyFZMI4L5aCatXtH9GNtlhz2muWNOIMHqvRPKlcmvcvWFjBaRrGhW"
+    "7hZRQm7dHlyBBT6uBNRXaw8OYQUXDWr5rFS7ALpQtQtQB4DltqvInOuRKKiKmJDiUiFCMhft"
+    "2ZhSLDUTtYoSSDeXImLZCU0EXNx2rjhJrKBpzsFMqOSihYrFrCoI5P3j9vNPP7Pq+flZx4x7"
+    "HrdbzIyRzRWqWRVRM9LMVNu+tWaqqlfTMc/IICDao2Dmyyb5V796+f67p4qzcqopJCOrsla0"
+    "WyDnOdba7/K8t2ZzjEV+b1sXTVa6tZK1dSuWRoW5cAwJ6a0h0xS99UT8+ruXf/ePf//d5xcX"
+    "qshlM+ZwE1NkVmuyX57PcxzHqYr39w+gPn/6bL0D6tbUd1FZ5TVWxQgWSjQzzNX7PmNAbLt8"
+    "F5lZ97fj437M28c5x/j25du31/F++NtNb0fdws6JpK1YeLcuuk3aSBF3CuF6xhRVihkf4zyI"
+    "KjRonGzmEPEmJYigqBKi1gidMavSVwOGwCNiwEeHlFWZZk2hc0ol1YxqxxiooMtx5s+RPKdD"
+    "xZoC6322LvxoaCCrhphEpmSct7NvJDnmlJJmzEpECSBSkJo5l3xeVTNB1QAxo3etqjEmKNr8"
+    "4dqrxwqODkGCKeKsIJe/oqmy1kVXRVVIVbVxZusuUFMjBWYCFbJgEBFFVHk3FZ8zdK2YzESU"
+    "1AcqUWXWuVaqJu5uCsxxmjpZGUmUezPdKilCYGYhslwpVaotmYQAtc6Cc06ogCW2zAqP+m5m"
+    "ij720sFYmhgIRSxmKEVYYqvuq5HVgLag3srMamoEx3kCqrbuLKSkqVaWGFVN3JaaBBRWKXCe"
+    "89vr2+9++8f3jw9VnZVzzHnMReGFUFSTmFUQSUoV7scgWL2ZokGLGiVkHWMWXEW35tz5+XlX"
+    "xnkewCMDe78fhQLXNoARURGtaze77tfjNiNHlbjO7dqfrhdAx3lmcev7/ZiQInXOaM1jhlS2"
+    "rbMgVf/uf/r7Ty+9OxUwoUomkowxQ4EYU1T2fVfVc4zr9bLv+75f12FVxFg+z+XQm6rq0mzr"
+    "Yl6kGOaY314/YpS9xdvH/Ok9bvd6+4iP27zdz9tHzNKDNtFLHHM+BgSECkddRLZJ2qamrKXY"
+    "EV3TBzWdVQWDOkQEYi4RsYb1VBOluC/LaWWaGJlq5mpSspptxSIFWa3Z1jxmVoSKjczWdyJ7"
+    "72PqPUa8194a4uoVmaTrBhRzJDtEIyiIs2bv7tbGTHt8XKA0E8uiND1jCqGCyFM4jszLZRO2"
+    "Ako9ZgDVFAWoa1AwswqqMBfhRKZQYGs0Gpmzqsw2kxwRq6BARdZkjaZPvnWi5jE3aNt8TKpp"
+    "yCoJyH7Zyah5UidZzZu7qyHOENnkkejVqnjYdBvNMGcxwaxCqqN5E5Fz3BVu3s1sznBVIqk0"
+    "a15WZEWKLv+xgFj2E1OK6MjMuJsoVYnFf1axdS1AJUV7JK1EDFmTooAc8757118M5iMLqHqw"
+    "YLAO3aSsl/xa3yxSDyFVQOXt7eMvP3797e//8nGbih5xHOc8xip0qWrtl43EOeN+BksiacoR"
+    "42MUNGbkcT9l4VKE1317vqS7Xq/+ctWGuH3MMSNGXfr2qmEG4RY5XaWZqAitnp/2zy8vata7"
+    "LWx1UrbL1dxqTrJUjYA1KSofLUWtokAKqaV/86tf/bu/fzKfJrspmktreo6Pc9Zl2+aMt4+3"
+    "Kz89v1z3bTeL1r1kUsC0KhV1U9u6eltzEErhvI9j3m9zvN/z7fV4+/r19e12m9vH2L7Oy4iK"
+    "kkzNuohuySJo6iDKAFRWgehtozi4PqkVlaZiNEk1bwTMTYlRmWRBFZpMbQZBZao4SAgrJspN"
+    "XERoTiFN1P08ZxXU1h4xqlgUrHB7wNayhrW1hqJomyTP6mqeUcUcA6M45lQdBRFO1YVWzzGK"
+    "cFGNjDGOzXux7sd9f9pYU0QLNuZpagaMMZupu80xRKXA+zl60w6rKoGoGaRIZiQrl+WdrJqE"
+    "QkWZNWuuJERmrjd88+bWFJhzem/qHms9gjJhsbp3kHNOaG1b1+aZkRWqutBcqMdOyb1VxRLt"
+    "rvhhETFL3UQQmWbamlcoS6JSVUS1MkVlVflXh2mZoh6k0IUoEYFa60Yio1hciAwVUviQj4Gg"
+    "mgrqDlKkRJhJVc483bzWYIwCMaEIHp9vsrDAH6KqClRkskoMUB1jfH37+sOff7i/fwB9pfnH"
+    "GGBTResN7kfwHOM8M5NzrsHkQnGGmEVm61tv+u3bBylvH+fXNl+e/PuXy8umc5wrpd3c73Oh"
+    "nrMKzcWbf3p+qsyq43q5iDAr1lvLBL4Ml4qSdaWXyICyEmqCkhEhIk0xZqjJd999/ru//fx8"
+    "3XpXA5qbiPzq+79xk5pjf3kpUu0islWle8+YcFVt1i8P5AMjZh7vvN3mcZy3+8dPPx/H0Ndb"
+    "fH3Lt3q6xTbrMqaRalJrXS+2gC0Lss/12VNZgwnq2qBCWWy9zTmLJmoFFKoiVzlUVNco0cwi"
+    "kuCCYeDRxBGFNjcmsoLy6LqOMd0etzayFtc/ZklrQomYACIqoK314zhbc6ybVeV5Ds/MQqqp"
+    "CNXKFedM5MgCVUqrCAIVnPNUkznD1Mw9MlVpzY4ZXVRFouCUJKxQXC4FmTPdRCA1Q60VU5Rr"
+    "f1dJXfO45LL4CSAlsqj+OVpzPHQcup6Eazw9M8VKzZc1xE1FkCw1I/AYjT7mFgUrVqp6zBQ3"
+    "6CI/iwircs7Q8qKigBI1FdXMcnPCwGBRTbX1zCkrc+SOTLJUERG69I1myeTqN0FVFCIRQaZq"
+    "iUitmrP3yhIIxUnoov+IFnUVK0TbSmuJwNSqUFGFaE3FHRWqHgzw0SSsoDQHcNkunz59nqE/"
+    "ffk4B+cswFvbQlkxj4jXjzGjRKCme/N1BI2Ebj2rovC//q///vtfv/yf/+f/J6etPSSR101f"
+    "tt6NMxlZM0u1/Y88jCwIQS7iduaMQGTNMVAAF3pWTeSedY4ZhKomCqpRYWqZePQgQd3y++8v"
+    "z5d+3buZNGu994g01ebWLpcSFOHaCLr31pySWZFh5+C319uc+fZ2+/J2/wh9/cjbmUf4jOuY"
+    "kuIjPaPCthMWNRqzyTSjCETEzBayPAtFga6aJNQ6gEm4WkXNyEj2viVYuVrzihJZH2C1LOas"
+    "FdkbcRcR9xYpKBaLM/r6LK3/ImmmD+lHVa6lurpKxiPqa1lp7qCaWj0e3BDVnGVwB7CsJVSA"
+    "UaS5sRhnpqh1N9VZLFDN1+IzGapSKcWaOVS7qqPQVIKQkrNGc60xk7oyEzEjo7yrmkVkd1fr"
+    "ImBWZrFSXXtb+oWeETFL4Ev2W5WAiIKoYBJKiItkBlQqClXefK1qxCQi5XE6E5W24ryosmYL"
+    "L0qWqkOWxbdZ6zUIE3Mrxjmnm9QvX12ozkiRJSUtkX/7EzQz1s+27AcQqFlludp65KnC3WWd"
+    "eaksznOoGaGkikqyqmiqChVrUUVCzDPCVZdwzUwhWrLSuxByddOwUpnix8d5v92/fb19/XZ7"
+    "/5jHqPuZBW3bdoa/3z4+jvkxMgnv1tqqGwiLXZuB3vzt/X657h+3jz//+IOsOLuKUI/IMcfz"
+    "9Xlv/nEf7x/H/YxJ5eKy46EaHOehgBkqNWYuvRvArdtl7yY6jxwjzjEJeGsiwoz1nK2CqWYx"
+    "Et9/2v/hH//2u0+fr5erNV8IQmsNlWKmrbu1hORZ5pcz7Otbvd3iuJ9vt3j9FvdDjvs4Bt5O"
+    "HiK05xnFKMMmKpGxxkgKekVz2vLFRpZU23vXFmQGRTxJNV+iyQKq0kyPnEU0BlVGZiS7P6QD"
+    "C6IkVPWWx1BVcUs5E+ze5wK5QKu4djGKRxuzTDPStBeRWc1UTXNGZLhyBtT2ZKk3JuYIgcyY"
+    "C9hi3qrSMzILe+9rEghbXHRVl6SOc7o3iK1LtokJMOahKt46oeq7aItCVWKViYSsKGLbPCLd"
+    "LBPBbNZiTPNC03NMhZg55XHLqxxVkzShCqVSzSzm8l+BKGqIYYGM1b2QWIFGCEyzShbFYxXM"
+    "1TIyY8WOYWpZicqSFOT6jZupm8YC1fQ+50QSUIjNORQw6curEEEVIVZbSBZkY+WlWnM+FI21"
+    "iCEmBoBZQvXWVFdSssgCVFVEpJhUBnKdL1ipqsz1HNci1VdHL1bYi4KIlXi5VLEyRUAiznG/"
+    "337++cvXL1+/fXu/HbydPGaVmG/9NuLtdry+x33GLKpr7ybiIGKu6LW3hjWty8kff/hKbZUC"
+    "LYIsmJqqZs7LpwtEMupjMM6MGQpJlJqYipsrRbVYjJmRCaI1vVybu1UBCeGKn0llmWpvTkgt"
+    "Xl9WrBrPdnl++fz09NK8tdZECdFzzL7vTHzccc75cZ/3u7ze3r9+yOuBM2SeeR9zJqoKMFg/"
+    "hJXSpTXB7DEnjUIqS1KVWb4ismqb5Hm7VZ7un6xvq+LnvVVVViBLxaJKRIMVpKmnlLmrqlMi"
+    "S4W6OBEARKvqctlH1HGeYuHNEyiiIiFwbcvzrqqoikiHjBH7vhFQ0QpCy8TMnTVHTKSaNuN6"
+    "qmohm3WIKBYAcF2jUeccwSpoUzvvJ8TEjWO6u9ClpCkCTIqZ9H1b/RRhEdOaUTErXEBgzOru"
+    "7iIsQqAtSxwS1FUENyhEK6MqTZqYF+MXjiSJNN3tYSCLqgVkL9ZjqZ0Vqj2j3MAa5g1AMm09"
+    "2zJmSu/N1JO5YIRkLuk2WQoC1UxZQT7EqCklrgWaNuARN3i004QiDeLAEmGXVpqyFvGRyKKZ"
+    "UzUzMXMtAgAxx6N2EJOguZOoKORUWbMiJRokZoSiVCSizFoGW+8kMyELR1aQ9Z0mUDKDCuY5"
+    "v/387cuXb3/5+ct5jm9v9zM91/i06cdZX97n2z0+zsoUUXERxjzzBCwDJN1t3y97a/fjWHXI"
+    "c34s04WKaMneldqgePmkl6cnVP7wfhbRm0nZlGmuarbOO8EaIzZ3925961tE1f2cEWxm1i7P"
+    "fScqYpAEKiLHzIIJbK3mVeU24pZ8UZtEDh7H7TiO+/28D//pvX3E9X7KORlZ97PMOmCjsCCc"
+    "QGZlKUzWLKWonilrUxIpYtK91cL7RkpKd22fLt9//iuQX7++SgkhkxWVzT0Yq922bnYOzWSx"
+    "iiGSakoU1LKq9z7GgGJNp2cOETRvkSOjUKIQ1DqgpehatdMkQfTmMxaruzXXyhDDjFIzNa9U"
+    "ACNnZLn1TBF/eOBNW0Y4tFY+VlIX9cl7y9Kc68UtrF98WmSiIJ5ZzdscMyOZMwq9t9YMEkRa"
+    "b713VESE+oKMaQFEktHUl124AJMtIoHTPVAbGWSwuK6p61vXW485VaS1VkUTE9U4Z29OhqhG"
+    "lijVe/HR8ARqjFNhzRxZM2shRVc2w6Qi5znmct7bw9hQ5otBN4HHV30ZWFSk9zZmAVg9dQHm"
+    "2rpCIDTvxcoZonCzKi445apbjRgQmqsIM2tGuW9rhrzCVma+isZkNVGC7kbK/ThbaxAllPWY"
+    "fcUslLjYOM4vP/78848/ff36/nYbt/t4P+rMCNJaP8b5fp9f345jkqXetDVdXTk1nkdkFETm"
+    "5O1+PHu77JcxPv7NVGNUVEHq+rRVYh7166fvxNr94yx+VdWmNmeoyloiRQRKsqK7ufe+7WPm"
+    "/TzmjHVVdpP9cjWzrZlbr4pMnmNSjI+QmYnVxzn+r//828v15fu/+TWp92OOMyB6nE8fo2a1"
+    "FJmRBoGY9y0pmSW2bJWlZtqUWTBZV7wsmDV3yeTarxdLBBmBeuwRPn/+/vvvnq57v+7b73/4"
+    "enyMhIj6OSMzt7YJFEBkJRdJm2rImKLtIaYGlimWj3zOKnWv8ZWKiDfPSYjmYzwWk+HmK0wj"
+    "ouriIsUaMVgJsZU9UDWVvo5wAhWR1j24uAu59S1Bh3DEdO2kuVpkjQUipABSFGapWsxJhQgj"
+    "gmSDmDZEmTlUK6er4YF5rY/zeNp2FaXUSmKMpLlv3cR+wdZRqfe+QdAZLyJZVQrH+k2wiNr2"
+    "LWfoQylOAONMs6aCmNm6y+MfsoSAuAEoVl+bqYXJk8exOiu4VAtmD7Og6Rynd6miJNwsIwBW"
+    "gVWyCoeVwBTRhWVW0aw0b7nAuUuNDfStgyGAiKzc5QJb+BIjFqJCxPfLNWYVpCIFYGGZwtd+"
+    "IjOL6/FcajrnrIK2jeLneQgeZErO8/b2+vWnL++vt+M+joP3Uz/u8naOEiXGmDFmqejmSqU3"
+    "F4WZXq9PH/czZ0r3EZXF45xqh7e+9V51WqKWTlX5+dN+2S8fX99UN5MpvB3jgNCUMQeKChER"
+    "ZmUkk63b5XLZ+h7Fb9/e32/3h6Ac1dzO/BBw7+26ba4yF8zaGpNRqaVqfL3d/uX3X9rl5799"
+    "/c6sFTahm3k6EhQTFTQkWFnM1BIpFYFq86W6JArMyCkAoYSRNDXRdEMmAYt5djehRIxE+/Z2"
+    "f3t7d5Vm7r3piI/74duFlW6+EPlzpJqv61vOqSpqSjIyFow5a6lhU1RqVdeo6mqrmUMUlRQB"
+    "IqYqTWSM2fsGVlWoigiUJqo1hcC2P89xEtb7PmaZUVXVNSs0Vd0zKwVUccKyphZUEXPJMAUl"
+    "LDCpataNxRBkDvV2HIc5DnLTtvmeVWqcORPhTVKEqKY2Zgpr22x1h5YYAYIxhogqHFCVMWMw"
+    "HLlZOygqoJoujUFWjJEmkpVRVDGzLuJZcF+N/DSYulaAYO9teezNGrOKAYqZL+OrLJINS4Qq"
+    "amZRU8FSxBxijZVnTMjy+jpUKwKyFjZDZMtKl7a4Nk3NrEFFYKsusgoDj/wb1ox7LJbyEqWK"
+    "aEQYGpdoEatICAaJOuuuLrFqhLQMUciYc0SdcUuR437PGeftpkWeNxMyK4JzYsw6BqN8zqkO"
+    "Mz5fN3UnlbQzIhb+RMSFT1sX8ON+irdIiZy3j7vq8K09XTf5OLTJpdnL86f9sn/96fW4R4mc"
+    "mTnn69sdCTedEb0560HhUYq39vLp+en6dJ7j65evt+Ooxf0x5VoJrHsg8Rj4YQGHbAW4AYFK"
+    "FN+P/Mvb7em4Pz/vzbcZJYpcvgwBc7hSxJDGWnboQomKEaiqzIRI95Zr3ycNUpUlqplzedTN"
+    "ZJ3ubN/PNdrKmmOYWRmO0BCJEZdtK/Ics2tzb1G5zo6EzJmAuKp7ixmAuBpZa1TmthWUXPYl"
+    "VGEtMZs7CfVuq2THQXARI9QMYpEU8bZ1oLJIuHkjdM1HC8zFt/INKqLMVUe+3QdJb+vTIwKg"
+    "MM+h2kx9DRQrikxBqYj70uIhkyiqrxauLEBwSRF0sywww13MEFlRdZV9jGlC705aVmzyKZd0"
+    "0z9mgkx1NCBZAN0NyIecZpVlRAk1a6KFRbBXRaHplkWUFKcbjY9llUK8GWwB7qAKItYnqYpm"
+    "BpaqZFEe2dPFTRVwQWmBhamTB4qDWLtfrCbA/4izgqhatqGYsfS3LhIsVpZoZKnCm1cR0CzW"
+    "jIiIjON+z8yRgOg5xnnGOKMi3U3V7iO+vX18u32Mc87jyOO8dv3rz/vTpffeZ5KqkTOySLv0"
+    "TV1ar8tlN3cVj+Tb3e4HI8KbjeO2Ss5AiDRR0ZKsmjMI9u4vT7thGoJ1/vyX2zjG5bqPiR9+"
+    "yjhtDjXrkbU6bitUJ4UqXp4uL88v7v7zz98+Pu4U8aYwUffKhIhBRKrIY0yQpqruVhBzEVmq"
+    "RHfPivu4RQmlQRtWqA8XMiHx93//1+D504+vkgLA1FUQVSoOSORwa8UigwkQc4bZEnYb1LJm"
+    "VaxMTAAVYa4Qp/KMfHt9U2v9+gkq4zwE2dxMvIrqpHCthrIKBTcTcaGBVLhAi1NIN1W1HOnN"
+    "IMKiqjdvojBxEtaUpFY9XTtQM0JMsgATNe9tH+fEw7/RUDorFueKIiLWeq/KSjyAvlQ329RU"
+    "RSMnRCJOkm5eiVLaWjSrdm8jCNaKJbmYqwWrSFNbT7WFitHNKmKSm2nmmCGqcGuVIWqQVtPU"
+    "JCk1p0BdTQkKvF2KAajoioWvn1KLuu/Gqsph7utaYUYwIkLUXKubqnCcQZfqwx7frhKJkaLi"
+    "rIQAXADRFBHCWSyhCCqPZYWtkipWMUNBemvLYQEliZIEBQpWZKhaCRSkKjKDsxL/plxg+YKJ"
+    "hgCu24ghmmDeT37cIqM+Pt6/fXv98ccv397uN14h7X7Oc9Q4pwpnjOYCwXEe4xwrn/N5Q/vs"
+    "as9q7Zw5qz7u47hHpUOkbe3p2r57lue+m8v7yK83KIcJQwkFInImRHf3M6WCsaJdWnMWWZen"
+    "/W+/+7XMc4wMj5df79fLy7eP22/+9FWpkejKKIgYyBWPNXUVbtu2tX673T7u91QkgVUE4SBL"
+    "3NdH36AkMjEQmNl6NSczAAjdoBGZRRG4bTRbfkZWCer5uoO5b+2v/vr7P/35Q+gC5SqZiCzW"
+    "PhJiNs807aA0R4JmtpokJprMJFSbshS6sCqjSvu2PwtF9+uVYiTGPE3V1YXMpYolKdVcxxhV"
+    "sjR87lusAELVrNncQ0RaM1sy5GqqUgCWpkcjQsVLli44YSyV7i2qIit9OQeW9Y+wrs0ro6q6"
+    "m6DmHFGOtbMUiMCPM1qzbbvMZERQV33RKMgoNVnmOwqlMqtMF5S4KodCWZTSSrBKXKhLKFem"
+    "tgRzCjNVJAolXE2DmnN6d6IWhTNHLvaqtz5jLGeKLctuFkojEsx9f6paZXcuQ4kAzEgiZpmZ"
+    "P8ynNUeJ6rZt93EWrTWpCoUVp6rOGILmtujT4aolVKWs7VwhWaq+kvqLoC8lFLhbJkXQ3CNK"
+    "AVMd56iFaPxFs5AV+7YnsypJZMYqHWZWFkbi7T7++++//fCXn376+vXL14/bfWZ+KWoWshSQ"
+    "rFrichG4qRuE3FW2i3/+/tO+XVYM++u397ePM6rNGCXW3Z82//Wn66Y+48hxHrc8zhFVrDKz"
+    "y8vnrCzg/Yj767HwDRC4Ghd5PIZI/u3f/XqMkT/8dNzx8XGgztthny9P29YmS5m9e54TIASZ"
+    "4a2R+XF7+/Hnr1nlajFjuSqYJYqtNZACLKBU1QkxCmeEQLo3KJJZjOv2ZKYqUlVxDHN380SZ"
+    "6P0YY7yrpogm7X4capvZLw2gqqp0tSqY+b+NXUVl3XqWYWP9tUZS1DIqg4CaigB68YKumN31"
+    "crmzxnH2Xc2aCFba3FSguLTm1kR6ZGVF627NlJ5pZg5Kc7HmKCZP6DIleNVKDRuIUCnS6Q5R"
+    "t5NZYq3vKHW4GDYzqaqqY55mmxhZwXlcmo/0+33Y1vrmM6ab9irez0lIVLm5GSqUTHdjrd1H"
+    "LMeJubmjKjKmiK4FJtakmloKd9dHnUojRu+PvrXiAW9bCaLWWjINGjEWcEdVCDnHwOKhgDNi"
+    "1TRWlKx3X5i4XH9Fuibp62tc5qogGKsJYCrBuA9Ya05jVWtmQndlUcWWTGH96GutWhFZWVD3"
+    "vrS+Zi652uo9syqLUqBkRuYUcRbux12KrbmZZqXC1D0TxyoVQiENIrOQ434c45y8HfX7P/34"
+    "r7+9/eaPf/n2cctSlisCSIjX6ksvd+J6mVOTbJJb15en69Nld7PjuN/v5zkjKCkUX9PqlJwx"
+    "Z++WUVW8H+dxTopqa6AC2rrfzzHnXH7S7lbAI2FdFWd9+/L26bJDmJmvH1GTL1eo2qJzLhZX"
+    "cz2OWhZXbQaREefH6+3jvAPWt7Z+W0yC1TZH1RxDTfZ9q6KI5INGnBSsgJ1IEaHKZsiMiBBv"
+    "5NLqrOkx06zGjDhH+McdqrxeL+76/7ec15hZWb01PrphZJaIJBcsS1YDRKyJsJmMGaa6eYvM"
+    "mQShiubGbTszZ6SImVpvlxItKfP12tIqhajYupW5Cr1fH1e9gpqYSbGJssxBwzqDi4vKRs6Y"
+    "MFNv5xhEuPfIFFOCPjlKS1taGyiYiRvU5ix3qyd/jarrJzxd2tPFUSEqprL++BWOGXOqalS6"
+    "OZiUZBYil8uEDJXF98bSWBQhopHDimtENia33qhrDgl9LHK4dsOLlFS5fp1VVWy2CtDmUkyC"
+    "EI0Id1EVtQbWnAGUrZ3MUvuqAqlmth4BVaIoBCGAyS/iP0CEkpGZc/2rzXeWihJRWWXmAs1E"
+    "27aH30Stspp3hR7HXexhRRAxcwFM1ec4RcXUF8ysVJo3UglEVdbMERn1/pHfPsbPP//4+u39"
+    "6+v9/RivH/cff473M2Cr0wpCSAIpJt2sQpdjds4RzAyq8fJsn66+qVTMqkyWtd5MOHKeCRER"
+    "yeTb7T4nZ8yvt/P1HmeWmPDMY9z35q37MYeKvbxskRJR58z3j/taH6Hk9nH+8OefvLXzyKpK"
+    "Uq0X5HYe67nSVOdJeSzCkMXW9Iy4nXPMUqErLpcWkRHp3txtnEOBl5eXvm334xATpRAiVDIz"
+    "U01U6ErkyHEex/H8AhU104hkom1bVq5WqJh37zCP4JixAGNiZqpV7M1SSqDFVDUzzJqqsrcL"
+    "pcZk2zY8Qj5rDEaBsOjmqlhXKJHamveX5/v9GBkNtqtZjWJqWZWs46z5xhVXVqqCKaVq3mdF"
+    "Zqp20S2Yk011q0U3tCai2l7q2YdIUJOgNagFuOIlUGW73MTTLxG5KWTbZbtSt3HmLc8kyvK7"
+    "X++f/u7FUQFRVFJShWpWMbxZziRAq0SuW3RzVQSXOhqyct4ii0yeiz+eMU+GuYlarLu2aGYK"
+    "BDWt2Rinu0GWCEFb6zWmQudYNs3luNYIuDTzXkRrfp53E6rIWqUglRARz8rFdjzOoQr3Zfor"
+    "VRNiKaRMVaCL9go+kFqKFIiaPEAWIaCoOSDujfWYH0ZU1VzzGqyRdIYaAUacFNpSpZmtj/r9"
+    "PghN6BFxP9/uH7cf/vztLz/df/j5/On1/vZ+O0fMBTgMQj2KxVCiRNfRURUs0KTIY87MMtPG"
+    "unb91cv+vLWuEJXeWwBHDZkQKzWbyaQeY6b5MY9znK9n3AuRqMzMEPDUqYJkeneDVPE45io2"
+    "eDMTmmNzg3LGrCxV8c21+YgoMjKSRdU5WElTzyoRg2pm3s+BB2gsALhLb76izlvvW+sAPj7e"
+    "Z+TMLMoKrldStKTKmwgSjHnej+OoKhch6a5UU7VZBaj1J8agtKauzvM8RtKam8ki8Ltbd8lK"
+    "p+PxkEBWCBD5oIh2b3SNKBHZfBOVrMwHnKDWO4MqY9Jby+T7/SbeSjvVF2kdMO2eBE2Tac1o"
+    "F/GeqlRLMv1iuh856S3Q7XJRM7Weie1yaZ+2FJuF+z1zpppVlVHyOJrZyGBr58KjadwBb7u1"
+    "zcW8NbzXnLOyiMo4PSvcukh2IxIj5jJpeXNA5qoEF1ezSnS1/30mcxXKKZW5blNdXaV0zXDn"
+    "hDWoUxVaJaUquVyhYpIqTAKJWpnh1qxYWVmpTLpExk1sh2xZFHMggFRthK2WAVi28rjgY+fr"
+    "rVAoE18lWZpJMTPoKu5s2lJFpeUkKhFgUcQhChWozqrFRROKS4sYrfkyeBdXjINFEFooU2GK"
+    "MNfjYmmSzhlvH+ftjN/88Q9/+MPrz1/u7/d8fY+PW0QWTATQZeI2YVSlQHWlbaE6MwlU1Mxi"
+    "ppso2V2/e2nXXpcGUWRFFMbMKuYcOUVUKzKtvWflt8NUR+b7WZF1zIpcw3Kklpk0t5gxjjlD"
+    "KgWorcm+6fNlQ01TVbNjRJG25Mes+xmSMebSa6hAmzEjFyZinKNYCgnS3Z+fryalgiLGzCyQ"
+    "MmqMI+ZMNRfYuuQvJQ1IiJqqIDMjZjCTskDcFCQEa9EqhJaZ7ykas1yhzbOi5r31LTJFGlSz"
+    "SLHIAKiigMdaKG4SwSwkjfDQSjhdS3pu/Tajit6kJBRsYqMEakm5nzH7Jupsz9We1TdhoVWW"
+    "wDaaBSt1U7UERyVU3by1nhHFFdQzMaNAXet6PYxnsdRmm2OWjCPG3K27yDkOa/08z8hsvaMI"
+    "pqcbG0RnhgqYx+W6K03NfeQhLmPOJlpkplQRyCVfWLDOlfykSpVkSlS17QJLspICMWtwl5VS"
+    "5IKKUHpXsrLgqmMO3XvmNO1FieTerDKj4KZqknmKyL71iCywrJZ2p2pUUVXNfZWyVB5+cBbB"
+    "kuWqN1+veoLd2hh337YqSpEVi7ltpnNGFbS5qHAtplSKAixR01L3SndjkBXNvaqSZc2b+owg"
+    "a3m1e98yolYKI5GJoo8zv3y7/+7PP/3mj3/+w59ev73OY3JEjakzkgJOisBdBFoiAhOUqhpI"
+    "8jhmRK4dH8ne3IXN5NPOl4tfL26OyHHOKOqMmjMjirI2DLaGhLeRxZhVt1HHRCxe0EJimlpH"
+    "a3LZ9nEeoEQUzN11c+/dKrBKl6PKFaU6IsYpVlpzcuGB1MQ8MiIrE1EDapW5CGEm0ptv3c5z"
+    "zHOeY0bWsmdVQU2jav00qspKkgoyU8WFnGfOc4zz/n6/ZTtD+rTrte0qCs6cd6TQdrRtukKN"
+    "WYo5it98w/UaaOcjZ6FRLKBsA2VdLyFcgs0UixSqoF9mlKhTdW0pgIo4IUAStUZLV/dGsWOO"
+    "NQrqkhfHCQ1aUFOUKhVHA5v1LqRKKRKw1jAnM1Gp4tZs2zfWVLHdfBL3OUQRY532jXOoKjNN"
+    "IJUrBLu5gdVUxeycQ6qaiGR2c2R5JiHWeoMUpFhYLLWICVBknTNXKVWK2rdLQQoUM4ZkofXG"
+    "ipHDOQG2ZgplImJu207WnLmQX2NGay4V3XsREQGUShuYQJjqmIVS8x65KOHbo+r9KOVCVy0p"
+    "UCwsOosWdWmtNTPVbOEoVYxL9CAGcYHOiBUWrAzAsDjLlCJMlCxZm7tK0b5gCwTVrAosjghz"
+    "wyOMbbFQ1SakzJhm18z59nH73R9/+k//9Q+///PXj4OkUSU1AuRaOOti9KipZUYVVYSkmpFg"
+    "xXoBA+xuvZvmuHT9dMWvP22fnzcij/OYJVE5Z82ZcxZVZ+V9sJgkxkyqWN9RKZVrC1JVTXVG"
+    "JsXUurXLk4E5Yri6qq7u5xABmREKXlqrqhKpqI+Zj2G46SzEnCMZxSBHlLoAuvTKbjrGOSdv"
+    "tyOCBYEqC6q+1owA1GV1MFeh8rF2D269qXrOev3yRa4/1ev48Wj9H/9fT3/7f2vm8/b19dsf"
+    "u/X+9Bm1abuWuu0GSIqi7/36/HE/OI5mJiIzKim67aamkDmniKxoVVImqWYmbF1FIKzIseBk"
+    "oRQYGsDMYvcW5JyjoRlYmI0pMy7bdUS6lraNokQn2NyCoEoyerPlblB5bI3AMoG3Tsiskqym"
+    "gKpzc1GZKQotVKa5o/nM2dsmhJm6IuLQyoby5slCBAKuugG+noCrSoRa+qpHXaQyVddYSUU1"
+    "KEmqAlmiQsp5xmU3RFB1eajdbSmnI+fD0Gt6xBTRZTCLnM27iLg5FLEMJpCIs9kekaJNRc6R"
+    "om4mK1hVxb175KmiZg4RslSZHPaYbzyS56BGpECCRWbTTq5U36raFCD6uOuue9sDwWUmWRgx"
+    "BEaREaeqmDkJXSAugaqQjJxmzJBiZdnXt/tP3778t9/+4b///uc//Xh/P+wcp7vWw/e38K1o"
+    "5t1VgBhBPiRTK9EdEZl8vD7AZtokLrs87/pXn7fnS5dFb4TPyNv9WOWQ5nbMPI68n4wUQlJW"
+    "KDxFtC+cHGetHf3S004i2Lqqcm9bJSqx7jnMCVJFnq7XhIqf9/s4ZiVB8yWVk0fHWtYSQFgj"
+    "Us3UbEWV5swxxpirWyUryG1YUBlaMxVb7bHee0QIV9mgZKA1z8Tt/R1fv5Yer/np8//y63f7"
+    "1Arn+HidbUffh7iomqo3ilP6mdnQeAZmVCE11+Owad8tDckMrzQ1ZKxE5NJiwbp5ryoiJU9l"
+    "KrFJqdqINN+SKhJVvDY3i3MOCMlUxZX3q6EAqSnSCj4ixhzWbbBUhHm6qAsBWKlaUzON6g3H"
+    "UvsRn/atigmZx2iLboGKmsgC6ULNoKoWa46MaKKuC6KTFefeNicKUlTNnBRTc60UamWYeT2m"
+    "yCWmLC0mFEitCpEUyBILxSyHAOtPW+dcmTG0uZovehCxUOJ0R+UYgwIKa2Yko/UNTR6f5lkm"
+    "GbkwjswKgWayb7247qg55qGi7iiUKoFy95wDAClFGlahP0WFKskywFXzFzQckmYtM1trrBJg"
+    "xnBfLiIQWVy9AqqtdEeut3RGiaIqY9QcPGd++Xb+87/85V9/+6efvn47Zp1EUs00s6BSwQrx"
+    "HQtassrJEWGutkqvzAgWqaZ9a/qoUGYzPO323XO/7p3MMSoigzhnQZoKLlc39W0c0BPK+6j1"
+    "hJlV53kuGfIq8XfXxbhVEpXnPZq0/dpEeM5ZyTPmSJroZbsQPGdFhTIFte6oBVkErqpqvXuz"
+    "mDFzRpGUOaMtUzMFZUAzy6iFzSozW88OFcvIRPm299ZrfS5ISM3IyhLtHWBWjlO7XlqjbFJi"
+    "qibmYgpRU3c3XWv7IVqttayQRQANxgg1tiVzPqa7IEurXNtRAQGz1KybZry6XilWDEiA7GIK"
+    "meNsAgTd23kOUydjljZZCp2SqjOHmLpqzFCJGGVqL94ixkUkm8kjpRCm5rKCvGlgRSCzt2au"
+    "xxj389BSmacUmkAqe7OCaDEBc0nozJhHbNve1M77nZxAbX51hQfm5DAqaMWaXDymKVJjolsX"
+    "iEhFRVSqIHO0pfTMEgpAcwcIU/eqmYBGpLs03WTlwMwrRdUFIRUR2XRTtIgPbaSEeyNyRrnJ"
+    "/Xx3fVobXizWlHeFrjFazLk1e+ytmkPqAWeFUEJNSdCyeY+M4mh9696rygwsmoh4r8rIGscB"
+    "V98UQnVlpYggask/C8udyQQYaaYrQUtVc5+R51njvJ/hv/nT1//8T3/4zW9f3z7es2jNoOim"
+    "cC0yimo0sALXi6kxYoWZRISqiOIKH7m5u5mIyrINqTdzZZOqGMVLQmYxkqraure+ed8iUkyh"
+    "237BOWtEHGcup3UkKbJtbURuvQkkxmyGzc2kTGTvvXe7+DzO+Po+xm3M4gg8cHwsA5TKTDEI"
+    "ODNWBEJXeTAqiSqqiq/LygL8mHXTqMozqmAqZORqZrKgsvXet11EIgpMU+3WKhclYs4Z1mo7"
+    "X8v7pVuylJKVq/kjrtbMu7XeChYLSy0FVWuKwpKmdzFTmhUjkCLFZhJxGAxFRa0RiKrN8w4R"
+    "M+smMydIgZiKAYSMcap55WnWtKBmOVJQriKkFVgQIiMEypjJqKwEM3TbtipYCWMG67r1c47W"
+    "exPMKHMRgjM4htJeto4xUBSxqBRbQaYSMGv07Up1DRApFKU8XzZ3yRRHyQrEkRjjcPOUKqYo"
+    "RGVkNi3EFKU/gsAZM7pbMxMxigXR3HIeM6OpowhwHNGam3kmTQSw5TXKLADJEg7IkvQKRMxU"
+    "oBnRrPW+ZWXOdHM+LNKlEEaoMMZUN2u+ThYATWUt9FRtjLO1vtZNoiKiaxoZI7q1yHzYyCjX"
+    "y5Nqy5qCUmPUXNlnE3skvYjIar1BJWIwS0Qz5xxDzQV4veV//92X/+9/+c3vf/hyHOsejqrH"
+    "GXsdGZFlYiWppqqSGZUPI7ZAIpC1Sk3sbmCxKGbAyt8HCYG6t0rOnIvSKarNW9U6SoQJny67"
+    "WzXn7WBkqbWZxf9B8tNt6w6tiBXx3Uyed71et97UXjQLn4/66ev9Tz9+fXu/Q/D8tG2bNwhz"
+    "jMnBymAVKkhlcURxREDVVQVwNRW1xfogVy7NjBGzqsyxYNOrFtpaE8GcR0T0Zs3NoOIWEREh"
+    "5yne+jx2yX2T6RQpVazyiao0w7oYWFMW3Fuah5qZJWDuNXPOKd0ejAqSgoVP6e5r+pDMylxR"
+    "GdH1Y8NFDboi+HMO89bMRs3ursJzBhQidHPwYVpXFVe9jzNnmStTozJBBmi275eP2x1iRY5x"
+    "QlVt9QQV4LrlubquvkFGM1198tURyMVGU+0KmAJqgJiZirkuy63HmLZfmvrMFJGIueJPRC0T"
+    "0hnDJNzFTec5VXXrbfV1AY0YRZ8VTSEQExUViKFxzilR3toMCmoV0gtliqooXStddW2VgMK9"
+    "ZVaRMQLKBfsTlcgylACt6Rznvu8lSNSMcAVYIrL1lpMAem/LbA2IuxdjqQDMzExjzhil6lKy"
+    "tJkVUZJL8JxFsa1El6oXQGuXR0cWrJqmLm6idj/i93/8y//1T7/7p3/98uWtEp7IKlGRylKU"
+    "qiSjUsbIX9KXYAwUkZSCmACoZJUUq3VUhZAqUjkJNkFzmKk1zyxmomju7p6yuGuoGDMnCuQp"
+    "VK1y8nnzMx6fTm+iIuYqSIn5tG1q7spm2Lt2RzdVkXke4xgmeH5+Wru0OUOZnz8/vTy9XPb7"
+    "H3++fYQIVMSyMCtjIcqKSqpqcwO45gW1/hbdBDBFrMW7yCrlRJAMkQnQTVzFTfa2iXBMjZHL"
+    "NXseNzs+9rg7hlopWI7L3lqzbqa2rkJLjoOMkK4gzJQZZiYrJwUo2JpXZo7ZmyPPiCWsw9Z7"
+    "LiwZGRlgahYVM5OVq0kLSDchK2c0N28WwYzMmCs+uJq3Zsrkelb27qPmCghWzuZOlVFZoDeH"
+    "IJliD15taQLM8y4ql60fx3GOaH1fmfpieVvy3WNvTVdAWpgxpbX1gvGaJ1CZkyisRVwJFGYa"
+    "x1T3bd9irI/00jdjzFPV3fqa87mbsohkSQlMhSgKqFJrRVv0pqaGpHHlEZkVCnHRKlRVqaQk"
+    "SVWJcUozNVl/8bZuE4xMeNNCFiRGiGoJ3ERMz3OizE1EMWeIYD3xkUGgtV6R53my6L1XgiXL"
+    "PacCdVOTAkytqBVFilkXrtoZTExEVZuYZMpP327//C9/+Kf/+pv/9ufXj9nvWRAKmZml2pqS"
+    "zGTOymQlvKk3aU1JzBGumixRsDhn8iFIfOg5e2trJltFBqXWlLu6SXO/7leozUwA57jfzyMr"
+    "3MzbpdtmQhW7nQcM7anPjMxzJscBsJoa53G5dDEg0+BV066b9b71ZvcY58ccWawkmHze+/PT"
+    "5brZ89Wh+ocv520CaxtBrJ2EKVWldaMUSBWHyuNQm2kmIk1zvZOVD13MGAOq4q7KomFr12bi"
+    "1lTkVgAfEj2pMOScd6lTFc4QE9VqrlCp1SADWEmIgBlDWI83RKKq1M20VTFnLK1QRVTS+0aA"
+    "mW3fRqzYdCmwEh22soMqVclgrVCrCpk1jiqtpMmDgFf1sLyr2TqgmbWMMFUzK+I+TnNPQRMk"
+    "a8SAeRXUUFUzzpjn7maCj/sHoNZaVlGYkdr0QVY1w3IRk8XITIR6FQDftwYU1uUeK4NLiiQL"
+    "JqyKmaYOGBaIFLnKTTOLwuUk3kwZjChfV0UmGa1tIhJzikhMKKTJYtyV2uMOgmUhe2RWU4WV"
+    "IWICZmZBVyuphApUzuUfXScxEclY6HkoDKUlMBGiVMxMFqKVa/gkYq1VFAu9b6s72VpTReYM"
+    "lkgjvCpFxN0y09UCUbkuDlrFyPjp6/t//uc//tO//PnHL/cRFlW0AhZHAWZwt8q1IZJlFDOB"
+    "K4UJrgGzuDkVc5ZIitJMQXjzrXU3HWOeZ5rw5bnvl715v+523bZmMu4jRpQ8Mne9dWh/en5m"
+    "yfv7vN/PTFZGb6bNz5CsPI/IKjUVQF3c9Pq0bS5b89ZbN8SYc9a6gvbN7jPHGQaOM+ac7cn2"
+    "baPt9OO//+XbeYYopUQVBnHTfe/W7MwRkzNnVWXRRAwKETEBDBCIx4xV9liCgiq4uSsA6jI9"
+    "LlDjQ0GzwtkDNZrWZev3G6ZkcwWTTLGmar9U4KCroUaqGzNX5XhRFRZ0snnTpekoZCHJiGB4"
+    "VolazfWZXHMOIav1NjJmRvNd1Uh216IudQ4EOYsGW7sJUtxjzKrMQQGqOCO0u3lb57eocHpE"
+    "uLk1IYLgnKebOCVmmLUiIh4DzmW6r0y3NmsS1rd9zDEiClTAzTdzr5EmGzgtu1STOkyQD4Qd"
+    "pVBRasakqoq5giKgKGEKpVqJzAyNctHKkyUUaFNIRUwTN3UpIION4i0jVpQJakEly5eWC1NM"
+    "kZIVli5NW2umWjmLtXcVsUp2NVDF7D4OMy80QQNFTKrK3QQlTM6yva06sQhgKw5muizbolxT"
+    "inmKkWUzUy0edzohhQGumwdKoHpG/vQl/tN/+cM//bc///jtdmTOAEyVDtViGOmmsniqpogS"
+    "hULWp9nANYkRdYqMyFWLdYc6VFTArCB8BCNh3cRa79vlsu9dyTqO0802d4oeY97POXN+/vQJ"
+    "Ja+vb8cxAfdm2+WpQGtdrZ1zyL5QXst+GPWL5aGKGTWDixiyILvnpAo+P22mYlLHOG9333dp"
+    "vV0vm+KRZALq6bo/PfW970wcMe7jnMmKoWYj0tR3b+6+vj2VfCA7+YtlbpFSmnkzay0oLkai"
+    "Mk0kImdNZBDR4t1itCapGtqarg64KCyqkqVtV6AWo1joSxQiAtXl0DCVmVFVKy5PShatde19"
+    "zgWci8xYEFw1i5lgnedBleZt/cKKqFJCqwKUKiGlkqpcl+g5j8hQc5DNHSbN+3lOCEBq0Ypd"
+    "zdpe1OJipMVl34/b/XYOIxTIWGYliTnNxUSRkNK+d1n2g9K+X6IikKbKEa5q5zm9C1brHVIx"
+    "RB8eKhE39UUhhGhEummMUC/RR8Vdlv/DQFDdWRSVQqKmiLgrKt2NC0w+E2RvG8FzzG0TVpYQ"
+    "IkiaK0xBmlthQe1zSclUq7c2x4jMFb9r1qEWCQUMuhhXhCxILcHIIKEiEawKFTPz1tqcmRUg"
+    "hVJMyWxmzU20RDHnBODeweU7SlU9J3/8ev7Tf/vhX37zw19+fj+DpaLuIyqzmLXyGFhIHbBq"
+    "iS65ue/dH/tVVUAW9KwSmRQRM1WFm7NwHiNrrp1zb93dCIw5JMoET5d96/0cM7NmsSDetmPM"
+    "n79+vd9P175d9227ZGXlnOcRxSL71ntrEWkulpqRb++30/T5adtFrLmbldCbRU1SisWkbb1t"
+    "m/U+0eY9BuRICeo5ksTnl+s//O3fXC5bBe/HGCRgEKqYq/anXUQdAhFz//8R9W/NliTJlSa2"
+    "9GLme5+IyMwqoNANQKZFmvNACmUo/P//gC8UCi/NnpluoAso3OqemRFxtruZqi4+qAcoUk9V"
+    "JZEnT2zfbqa61vdp8aodGVV9lpbMKKbajEiDNmKGq1YfZ6uKiMjcWXHNOKfBmsyWqQKFqtlV"
+    "3XhpOiiyUkWtEYF7C2scByupWGupoA91u/HcYsnc+1IxoAR0U7C6wZfZ2C3JSkWJaWMYrivc"
+    "B6P9EhThcO9TPEAX3VVVMcaoTIGmpIncbCagomKHeFK4dojInDMK7/EFYllJoLccqFq7TK0C"
+    "poPEin0csyDRC1Qz6d0YxN0PwE21ygUByLQZ9629aQlqOs0coEl1ZKoXinCKVGWpHW31jdqA"
+    "KGy6szbBytU6ycfxiAxXr6oIUqimZJrfYDQ1LYoQ7mPvvSofwtFjm9ixN+QmTsVOKCFWSB8z"
+    "s5I8xhRBFSBMlt59ZiP1OmOM0by7a5+AZQVAKXG3/v0yw00aBmLmKlakqkfs17p+96f8X//7"
+    "7//Xv/+XP/35ywrsZF+Y145MorMTKgAgVNXIzMrD1QzDBGKr2E7dxsiwukIsqjqHq8hrb1Ij"
+    "Ss2OYyTrXOv9VYcdb09/zgOQ99deO66o194lwuR6f987jseHOY7jeJ7nda2TYFStyDHG9NF9"
+    "VB+jjXGVlbk/v/aOsu8/agelXT5996HeK/MM9V2M9+uKeE5m5UJ+OSUoJXh7Hn/zN3/98cPz"
+    "Olfs/Pr19eV837tEtE2LjzlEzJrs2dbGb99uZpYZHf2sQiY2UqC1r2/2VrDoxyAkI5E7zy/x"
+    "+px8SIUr1lqP8YYqVbreV5thLoKGnpIY5sIyECIZS1Fs6XhEmwBUlaIpaNucdWtCrT1Grqpy"
+    "o/ZUPQtqClE1AWSOudY2b6F1jDFpXGvnjiEmEGSZqfanSlRN85sMvnZg1srwYxptn/t6v/a1"
+    "3dzHdB0fPoyffvpJBHOOiE2mquoYKOUZU6ea1qKCJpYRsbdXYqjLbSJWUJu1rpCKNO8xvGaR"
+    "pA0DwIK0H6XoJqx4Zbm4V4Fx+HTX2Jf08vfw/ovcGaZK6I6g5fEcxYxKETFVG6OqVpRCdLBU"
+    "p1vPkM6Mw+ZNEaCCOtR3bBXChJljHFVZyL5YlzQuh9ZjSOA4jraKRkYxTdzNBFpVKq5Sjcxc"
+    "kebeVeqMBZGqAnle8q+///q//fq3v/vDz9HT3TlF9cv7Xit7IdRSDjcdwzKXqbR/UiVZoiKZ"
+    "7M5qZkUVISpwN3cDsSKqSHFaraz4+pqOt3kcz7fHc5bUa8VeO6J2YQUTSSUb9Hu8JfBa+/PX"
+    "s6quHdrLI3O3x15BlLm9XnsnmfJ+nVX1cN0zfa5PH6aIjjmOFHz9YmaAr0gSVfL6fBW4Gef2"
+    "tbe6HG+PFfnnH39WtbVjFSmmaq2hMTUhh2tXSN9fZyU7awV2at16ytXQwcjqy8aO0C6Gm6Il"
+    "UDoqMYdjn4+PbylgpevkjZ28nepIVqaYCVRNCrtyo7KZFSTdtIh9LgFglhnaMFN3CAlaP5vV"
+    "cmWqqopl05y0+7Nokk43KJtVnKz7Si/aJp3ucPdAJ3dOcXFdsbvndIwjslB0UYUI27dFV1vr"
+    "mh+muXdPu+0qZPWwRoG3t4/UGcWOTKMw3Y/jsOEu0uiMtpsb4FnpNiJCqgy5V2YNSJlrJv1G"
+    "bWSBFRuo4R4phInWUDUFMoaruvEmZ5SPUdX065zHUJWsiAp3y+pqcYlakqZ3zk4EpmDlGFPg"
+    "QJCkWFZna4epmqsYoJ0ULJ8zcxcrktNNWtUomrt7ZFWVpmVKFYvo8LPs5pL52HFVbBEzHVkA"
+    "mblUHr/97U//5b/++l9/92dWsr0p7tdqsmyfmnHPTFTuv9Wkm5lguKnKunZmtk0DHcYl2ofR"
+    "OLUEEjh3rJ0FPAYez+en7z5K95MqM+J8rSzx8aAoISsvoirrtZqiBDcH0U62tYPAzz9/QdXb"
+    "xwO2k7I3v7xfX89w1+8/TECOcx3HUKH5PJ7+q1+9fX5fP34+N5lR5/tZ6Wr+2vuKjM4hFn/6"
+    "/NnF1DTaN2/uAGqryXHMPtK4eWvB+sWrVTAB9IbpSitN2a6P5mJ0lwB6wwwgTngVHkLGUnC4"
+    "uQ91j57SK9aKOZ/aj7JoRcYKVj6Hs5IoV83YYJkb0FxkYSbEUNxcEKh4RbASJIg5H5VUtZ0b"
+    "VVDLLDVP4c5y1QJRKaoAuirb9I+IaLuAmVVmZaLW3osi7mOvJWNmBNRAgNhrxd5VeQyP2JWU"
+    "IkgVmN3Et2OOteP981c7CLedq3WC13k+Y64wv+hPLSu78gWdpJiOvocUqSHqLuICzSArMI+O"
+    "2/vQEAFV5TimscpAATOXmglHsSBWVdBEictTfRYCjuRSpYpklfvBpAwXSFUEq7IHUpw+VQ2l"
+    "17WOD7pzmfqYBzJMtRGTLLaslKzY/T4fblUM16MqAMtbklEQgzAqM19mU8WzpVXcVTzMA5UJ"
+    "ZpmPqnDBr//lx//b//vXf/fPv43UCoxhc/iKXKv/VK2kQXxgmguxd/C2RTZkh6+1qspMfDhE"
+    "mnqHYY3AJTVS1873KyKoKsP56Xl8ejtiX3v7F9REXucG7Tje1pWrrpVX1FIFCudCZj4ex/Px"
+    "4XWe64rKy1QEcl1xHO7j6N3ber3OFXtnJv+Ur+8/PfU9iet52DHtcTzG84l5hTq/Xp+/vBBC"
+    "xblzBSO2iVJ0r1A4XJCZRESwf+uSbqbix5xmRkpVPp8fImNnzOaEQdRdY5LUb+LNXRydFFeq"
+    "yZijQ/IlVfowdTcpMnKJVLCazjN8NGMDTVKMzcxYi1Kt/4oog7DCzMhKRmsHBRZFNydQEIhe"
+    "O1RFiR3Rs4+9F2BzPIup7tX4AZPKLJUMZNEGs1oBIFXd6JaIzQgdb4Aky81AUqRQBczh2QUJ"
+    "ziJ9eMUSFAo7KvOaNkS4GWM4JCtqqA0fMsyHJ+hiUsmKYSpVruo7KmsXAsKIhN41QlNVkRVb"
+    "HT69spJhoiRxz+Ls2292M1aBwZgmreIdD5AKKCtdZI4RO2pRh/WIQhDH47GundhCcToEppp7"
+    "+ZxmCube26xUYcMppeaEVIVJDpfYsYNmJtoxLJDlPlKquKsKVFEpyWJJdWjGiAJgriqyYw+d"
+    "Pkasfr2LiJgJYL3L/dffff2//79+/d//4bdXyg0xBRtRSTTHj6r6OHxOG4rsIqX2zi3NXIFd"
+    "CZUxTK21afftCCwWFLIy+uvATHzoh7ehxtf59fj4/Pr+GhbpSgqT589f3l8nIfM5jvHYe/VV"
+    "7fF4zmO+n2utPF9LFI/ppuruc87Kep0nzIEWTIu5q/DL1+v9fZ0rDscP3318o1DxGI8ffjCf"
+    "j+PxfH9dX76+ZOWYmoUgWFw7VqxkiamoUYQmJjbH2+NxmKp0xqh/YYCZQh3C0MpCA0/GsJtt"
+    "c6tiqoNsY8x+rL/BXrBvk8N9oe4TpqpkVVSqOWj9GTjPS0XEvXeQ2h5H9circouwKUdoR6t0"
+    "tUOyh8YVJm5qe+fKDUjEnjaaOiAqkYyqKmarnhsz40piR4qO2GdPSa/rigj3XkkONS0CxLcr"
+    "NgXc6xIpVpq0nhPIMBhY6jobxANCsHPDZ0YkTjWvzGbNAHD3MYf7HMdjiK42IhWiGB3ZG6ox"
+    "9Ypc57tp/yjcGW6D0EgKi8JiwKAqMMuq4Q+AO0vUekVuiteX1xhHsNxEKD4myayac0jSTATK"
+    "ShXoLe2uzLQxOkCb3BWdjCk1Re+y2bzhbqOVu805q3pGUiIwN5JUiqlA5hjkrrrzhaxsmll/"
+    "pGLnxhqHqWgm166ffvr6//wvv/kf//TnL2fP2+hDxvRGNFXrnUH322QsqMxo4sdwU0kBgbSm"
+    "gbUwmCIlxYaf6MqMCMDMPBHmNqftvYeamv748+dPDz18rKjYwZK1i8Cc4/l4qIr7UNWEZOHa"
+    "fF2xd0byw/EwVxUdKHd7va5rBRRXZOz0Mcbx2PuKvUGNP319O6xKXmccxzGfomMexyzyynzi"
+    "+eGjx25spe5Mva5rp003m8Ey88oSEXXPYsufiOoQzI0pAyBqZlnNAwU6CZLbVCECb3Rv7p3u"
+    "ThWxAbHIptUFpMyU697ZqCAYRWGlymClqI5pGaHq0s9XVrf53Jy1d4T5valSdTPZu8/VQmTs"
+    "XVUuZiJRpWptpatiokqUsPYzUNCQ807wVoImGSniO9IVqnatCwpXB8jGu8BQBOFmOwtMoQ/3"
+    "99cLVUI83CNhrud1HnO0HEBUqboqbZi6uegxxs8//lmHmGvbqpyoFdUzPHXZa/OWlcpie5wA"
+    "FbPBKkQRVcw5m/NGdbAgKvN4VIRYb2sbp2glQnF3anG4oZCZ4mamDIuoYh3qFbX3u4joMKFU"
+    "diJixq7MeDwOYaqoQE1VmaxY11a14zhg2vuYqv56UwVMzIZ2VKdDa6BmAWI7qBZI+phmVrEF"
+    "EDXI3TLfUZHy0+fr//u//8Pf/+Nvv7wISkZON++cqKCiUABhru4K6XOdgjeVFkWfJiKKVtWp"
+    "Tx9jnu9r7cVddpib2aFQXFGmHKI+LTNMxdRe76cbIFYhYM0xIoiVpjof4+3t2Rvn13Vea51n"
+    "vb/ytTbBj8+HmBM0H8OZrCuy3V8rah7T59zZBRBTkTH9+XZE8ucvl76WvZb4oTaq8Bhz2oR4"
+    "HhI7SdtZ8xHnWoRQ7DDLyuZCklQAgsiIvSqzy80Eo5JiLY5zNxFnsVFqyqa9goDZIWY6hs2h"
+    "4wkbKVoibgKwtY/urtaRRxFBZkBDxMnU3jmTIkJFrXR1VWGFQpUqFEYAUDDWzigxXbGlge1E"
+    "ZOyoeTyTSBaz/LBve2wKOIY2ABCACM0sYrOgZlOVDLCBkyqmVfV6vXbUOKaK7B06kmtn0eSo"
+    "rBLpAdiOPWwgsdYlInnFGD7G3DvF7BgO/YaeKc557FpmLhTu9EKyDtFDuIkaoimlbpFFIKP0"
+    "m6gepN5K65uFfs/KIYC2iUsosXO4RYUk1bu/+Bo+IwJi6h6RZl4tS1BVM2QKZAwfplBpNWhT"
+    "YJogb6bTRzJc9Xq9HsfoeHOHy3wcfbCtKhMzEVZUhkqPGbUIgawdPvQ4nnu/izIrqvN07kB7"
+    "VLCiMvG64jf/8rtf/+bfrhXCVr3AgekuxF4bVSaaIMh2h7ewM7Oi3c9qIiCZmbGpCjNZ51mZ"
+    "Le8cZipaSDe7dpE5h0cGq47Hh0YLUmXvSpHv3h4QUaQ8DhFz08wN09d1vZ/X69qfv8QKicKY"
+    "4/4y+rbFiIwoFnRFRXGYrLXVvR/g5+F/+YvvK/f7l6/ntUqVX5fqS9Ufx/N4HvM4kiamRanU"
+    "aVOsREdm6RgFRGzTpotSBHtdFbH3zowi914FEFCbhBA5j4cq3Wcx3t7eFMKqYYr+ChZNmOuj"
+    "MMSnjuOeLFW6NgXTTC1jRULU3RyaRXDTzFkoVGQJ6nCX1hlksLJ9Z2CKWKH9R9qUY1HZVRCJ"
+    "Kh9eYAEBGkqpRPvHqqpzQBBwraUyBBhuUQVRSmZWpwz3iqySIrJj0iUKd88de+8z8njD4/km"
+    "wvN1FQkFyV5V1W3DhqmSXOd6fHA0/cLl9f5uqpGhocN9qDlKRFkK0rjPQu1scAKrNmwwDwb2"
+    "XmMO81G1o5YLq8SsJc6+c9WmGCMIYEDmcINkBeJCrQQEVpxSnIcxWpXABPYul3JMLV07VGCq"
+    "FChcpGRUKVSsiLiuXrfyjl5v86k6yGgsbUVC2cA7AGVLoVklMCL7i/ZaX93v4lt39rJE1CJ2"
+    "VZhL0f/8+cu//NsfrouQAS0RgKIq0yQieoISLLBUtTMb6po7WdCCT4FlJpNExw2K8cpiqsoY"
+    "auoqpjYi8PVaV6TBYm+Sb2/P45ivr+8r4GYmYoDA+/2jj5EQEXz9+uqFVuzK6LtoqQuEr3Vl"
+    "+qDE5BhSqLXy6ysKeDwOEReRtfF6TxE8p4aUDntFBGRHrRVmOSd38IzrQ73N56PSAJnuCWnI"
+    "045VmY0WIVkF1VRI7b2vq7LbALDhNzINnGMIxU18GCpMMY6ZSdUhvZuFrUgfg2Lqb5Sn2lTR"
+    "OE+Htq5+coGzJ8Yikpmmz2ESRGaJuknmhohklrI/QxDt14Vxq6glenc5MtOFGdtNmtgnCmY1"
+    "Y4mobqJEFqnDvBSZ63x/mSqBiLIxIMjKngQx8+3DczzGeb5bo8X7ZBZJpR4ukKF4fnz4Ye/v"
+    "721Rcj3aQRJruc9xeBG5ilVzDNMmQMLdluq6XoUY/hBlIf2WJ1bPnDyS0Ss0obqr+vnaYnoc"
+    "jy5a92ygsgRqZgVWU44AoZirQlakkdRU15uUVaUm5lpARvYGFBqMcj8yQhzFUhttjtCpEWma"
+    "yGSJz+deG2Ii3TExoC0VkLZpZ7LucPtr7WMed84jtz+eLFFV87H3yQa5QAmpFLfR6y5zqQ1x"
+    "+/zT+3/7u7//t9//KfoaItLxUTNJls+hlOv97L8bZpmJgBU7ikXYsDGHGVGJZCHNxE1aulF9"
+    "g/C5qa9rfz3XDhaNDBF8+PD2eDyu87rOiy1tyRpvxzF970WKqsaOL6+1M7LKfJj5fBi8sGpF"
+    "7RXXle8MK35807e3o1DX2gWom80ZhS+v67wiCwpG1dfXKYISE5XKIgLikcgKdXs/VzWIRsYr"
+    "l5knK2Lnjqb/r2sVk8xYqwMbbW02s75vqA81IwWk2+wlkbj2WIGAuZkrqVB/zLcWHc3nR52P"
+    "SHy7M4NVY7gJqnIMlQJFKraikGE61Oy6NiWne2W6q2ZmcwM7rUWaGEMgkkwAUVtUoFIBoQ4T"
+    "9GpOlRAqxNC4wyYZVJYCbhp7rSgfw8xcLfZWZgl9aMYaYw4fqj6gOxmRJUJwCr7/9ClIn2Ot"
+    "VeB8Pi++KkvFRDgP32s5CBURE4G6rmupu7bO2y3TRBhVa4VP91YeqjmqwC65SbP2qy5zm+Om"
+    "t0rvUplmnlWVwYAPX7m9gylEgSIyhiuw8nJVVboPphSque4kXDxiDa+qrBpFWXE9jg9757BB"
+    "VgQVlXUZ0Yau4eaq5shYt6qwRNXOtaY6M9WELFDGeESVmw71BJCl6qzMAAATq2RWiPhwz0oV"
+    "NslZx/h6rv/6v/+Pv//1vyWPoETlt0lVI1yGmL3eX5HFghTG1MfQ43CB5LmZwWJVitDbPd43"
+    "Z1MX6XesqEHwutaPX873syBKcijmdFW9zut6XQDGcFftEaWQz3kka0Xta7+uyOLOelMRt2QR"
+    "iKzrih3JpAIfPs23j/PxmHvv46jD7Eq8Vnx9j2tHQkWEwiuhK0kmNXaeVwJ6+Nx7q+K8QrMy"
+    "4fPZdizJiKjcGRFDsXdmbEhVxd6LVSoqIsGqgqu3PNWHZ1TjQ7PKBKqaxTHNaCJSACF7xTge"
+    "sDGPZ+kMjDEea1fssjfdsdyHMEVqqGVG7O1mLlkEy6FEZe8iTVC5wQTLXKWcQVOvTIoM91UZ"
+    "exe3upkMiIqgVpBUH7uKZoUyuJistSvLbKAoLG3JpTZQsWInK8is2DQqFAFCr+uc4wHR4rcL"
+    "p1uRERGv0+ZhNrfEeB7aK+Y8i6VuJSxWVdoYEMkmLWWaDVXOx3FFQ/Gpak7m63zJ8DYziOgY"
+    "x95bTURGRpoOMxOJiEWBqoFq0o7uFJFpA8qsMIMNF/RjDLcBgQ1VZTV5StC7uNzM2CYY6nvn"
+    "8Ti6QDf86EGIGyqXKKECGrofqHqe77dqUQwFki4mgLqT0fq1YpkZmDtPgbiYoFZRUD6H8CAS"
+    "JrwxWZnVBmOt1H/8x9/95jd/WMsIy5IrIwpZReDQCbXXtc4VEBPUMeXtzY9pc/i5dmUruSuD"
+    "SugYYorMY05BXVdkxHEcY8zPr/Pz133tyuYoVx3POYZVPx5VAhnuOwKuYw6IqBng+/09gt1D"
+    "FJVM1rWoWJt7bRAmsGN8eI6/+OHDh+c4z3cBP74d5873Mz+/9vsrqbcZywxfXrlikw2Rr11U"
+    "0fdrETSRfS1LDZbuhAwx23tXwsQg0rCvzBCpXjhca/WgNbNazFkQdeOGiampwc4mzWrrzVzE"
+    "CS2YjrFqn9c1RVkcNm1+9OOD6NFOORVmbD0euMuGaV1s7O0wazzEXc1HZShYKHdMHZmxdqgo"
+    "WVBACBWFVpRrfzrLTSvyHoQA0z1VUypiZTZmRIN7+sgogb09PyAg0Fg7u+nKHMcopLmxUJWt"
+    "NFEdahpZc5qY3dHbxDFGn9Tfv16WENZQWa/XGKMioVKsfeWcR0dixmHH8C/Xa+XO2rAUMEmH"
+    "1DyGmZRoVWaW6eyrS2aawe2up5tLrFC1jFDIGMbE3Q7LcjPRqgaTqiiM3ygMRGSxeQ2VyQoT"
+    "P+Zh2FXZRCU3ZRKmxQSTwk7jZP/5RGYxOXyoRPtH+3wLYUmNOXPTVNS0y4jdSBHhXiehYi7q"
+    "mZFRIhhD5MZTKoGgFOYf/vDzf/tv/3id+Tg+nhde769rs5JmbqbtlSzqTlaUiD4ecgy4psAy"
+    "cq0Qig97ewxXqGplFrD3ZgXZAgy7Vq6dDfx0VzKPYzzmEOHaufYiZPbbN7MzvCIm6q+vr/fr"
+    "6uDiMaUDeZ1aomMPAJECH3JME8b711dEHHOSWXvXxr5u4/xNKUucC+e5RThGqqmYAXrtKOTD"
+    "xhwjc9cuSBKhYt1hugpjHnEtoF8wsc+V0SKoBBCxAUkn91Z301tmMXyKaGZd+zXnHLN8NEHR"
+    "AVUbFBbril1RQ0zs8fHj94/nG28Lh7qPcr/Wtv6bVi2qiLkPUYUwc7koSFc0oUs7DdjwLYeI"
+    "JMPMIVOAqmh5lQoigxTrapwa0ZkQg6ioVVx3dcecZGUYxIa3LqiIjulFcfqAZOeUIhdFUc6S"
+    "69r6MPVRxOqjTCSIYEzV5nfvfVmhBGKdcOsQUvOPYwyPXOqmrj4dCndVGUfcsUGhyNovn7Pd"
+    "WgrPOktrjMGoaXMMjwoUCLkrHNRjTnIXt0ApEJUWUkF4XQWkikGNuRk1xjDTHSlJkRQtlVFM"
+    "ULhPBcdARalXVFGNGVPMRDPWrjCji0ufTIymcoy51mkGGAolWW72GAeZGauQpppYYAkPUxfx"
+    "iAvc1jvDWkhZm//4j7/97R/ex5gsfH1///qKBI45jNqWZ7heV0SICoazeajqzoxYYSLmcjzE"
+    "nSqKYM+rCTyPCRZZFEZjbyWHawXd7TiMjMiMbJCIzefRtw2fc0U+Cz9/+fr19dqZK6pEIWI+"
+    "II2LgYND7tWKyj7PPr7kh7chalkSsgPx8cMs6Gutc2efWhHtHpIdNYepWcRpqqpY507nx4/P"
+    "j2/PFfXzz6/e377OK6osCihICRpnQSEi0kSKgW8uiwL2dalsFRVBjlSf0X76iPPaUwxSY86z"
+    "sihQTRW1I5gLTHOaiXmKGkrBnSGkmUZG7j3H1KKw3D1IVTVRVoJJFsBslHfXiwBWRpRqBdKP"
+    "gQQoZpPMrKWiq3Zlznm0ogo+xHRnqejQ2X4jRrXXUlWLklmuJtAr1jg8YoumiQbS3SNKBDYN"
+    "Wpn7MT5RVFSviIQUi5qAMmvv7WP0PHXYoIiZJ5lAQ4iqcrjh8QEmclioXet0Fa3iODxyV10Q"
+    "7WqoiI3jUXuJdWl/WwcP2Xvyso59qlJkx3YXkiZqY7B28xAqU+//lzTFS8WI2nGZmsEbQwlx"
+    "dzKldvZbVV12hqkIDVBoj7jsfn9EJTj6H5m1sbvEq4qscDsa1Jq5TcXtLdnBjdsGolrFUA0b"
+    "ttdZBbXnb/7+3/63//p352vLh3HtfV6Z5PA5fTCy7cBr7R0pQFURNt2fDxfWilJR13w8/JiW"
+    "GTtXBlEcpnNOdhsOyIZ1ZO1gVKnKnG4mbDTLHUwdY2jsDRWKFPDj589rL6pFNdvXqtiMWxIG"
+    "uvuHt8dBFnC9XntFEseQZF1rva768p7m/vbxmWX6MrnW+2s3WU+dFcxkSCHbQAl3U5XcuVfY"
+    "x/HD9x/HuD5/+XqeZ1ZFcsdpzjGGqLh0U60HdXqMSXLXLpG6E+ICSlUWS0hT7xFXxObJOY8d"
+    "e0UppqnThqgNn2Me43iqeWOiVHTH1UyIDlqJS2ezzIxVKVST3NkZw9zVkkuIdDNURbvR2a3k"
+    "zBKiN0+Q6r7dYbOYleE2Gk5HMYFkRjdkImOO0ck5VVMfgMRaw+Aiey0yK4UMAUAdrpkVuccx"
+    "dMyMGMdD3UFckS0YI1qn1y9bqGorOGMvit6Q9q6xmanKtZfaqEyb7v9/Mklt0aiA+eyqizbM"
+    "wxoKharamYbexfWIPUVdbkIVx7QOfxZpprn3nENNVFC1M/IYR4ECa9peFsVsZz1UcqcKfTiq"
+    "diRHR6wESXdHVaLMzMR9qER15wNVUZuHi5QRvYVba2XtYWamItp79t7ti4gOr6oxnNhrnyxG"
+    "+e9/9+N/+S9///PPl49xvfL9SpaoubllhKsCMJXa1V8wAIbI4Ya8YRdVWwXIXGdoK+pExeT5"
+    "PFpkDIGKZjGydlYWin1YYebOSFUFMA8/npOVmVuBqPrp64q1RcRG12wFopHdcUEWH97MM519"
+    "n1aDlpq641obqz6/17Uxn7bi2iGEsGAqyQL1mBODGSGtVieiqZklIvzy5TJ8/vBdtwsEgjkn"
+    "1lo7IkoVYxwA3A2VMDXVOYaqUh8UZLIDBW0aKHIezyyI6nE8ImOvCyxjFwbUfDQ91tXcxhzH"
+    "6G84yIrdoVlTy4hrLzV3NXPbu2BEFe5Ps3Tpx4rismJXxY34YEeXSRFUqynrJhFDuo0kQO6g"
+    "i3UmL0/1QXJFQ+cyUkz1eL61k7aqMkKqVIWxbWju1p1Z5ZVJEYWMWHvMtzGPnsBmRFy74USq"
+    "kplQZOXe8Xwca+8SFRM3jfbR++HjwYoeh1fsvdc4xP5Pfz3nY4ohYykTcLVJeGZHNDpzutyM"
+    "1cQJdt51zKHKjKXCOZ0oZUVEL2H1m6L7ptG7F5szxAq2IVSIBFtfA6qoRSRE3AdRBN3cxFy1"
+    "GMO9A+gsVubdWjEzN1Eh6aMhyyKY7nOMWa1m6H9oLTMFJIWiErF6FAKM12n/n//6m3/4xz9k"
+    "Wt03ay0YoUoK6nHY7T5hiaipHtOPw6Z2N0syuaOEhGB6j16tsmslVoyqMlNRTTKpK7iCYF9g"
+    "UB0zAKs43KaPKkZkAyR2FEV3IQqRTOJajXSVFVwtxq0UE3c/5vjw9uHt7fl4zs4rVkn1VRqV"
+    "mdeO64zzyiqSMMXz4cNwDH3OmTtE7qB4FUFmZOzo5FFLBtwsc7F5fKS79aeiv9j6GkzWmHOM"
+    "CaLrk7H2vpYAWRVZJCJix6qK2Ndei5VTxdXH82E+zQ8dbz7fPn78+OHtY2bGvkzg8ylqmRWZ"
+    "LJqZ+SiK2GweOHtCF9lF72vvrDQTKQrhqiClYDJalzmPiRvcASFr7amqhYoibslRz/yk/cBF"
+    "g3bht4BzLSGHqbH2uobbPAZZKmJqphprkxjzgBh1iA/o/eE387WuzHRvIT0rqyLf3h406c5p"
+    "fiMQqU/xQZHzfF176zE//fIHmviHt6dZO3jTiqbj6sK69yapjjmsqdyuGdvsuOlaDNMahjG0"
+    "hMNNIdUeBhSr5hxEVUSiVIepVRJUVSelshdtyNyhedhz7xa3aoq6e67ckZJ74/KpYk6mD6+q"
+    "xliImigKrMwxvNWl7VJR9R0UEVKLEjuP4xDB3kWvpJiq66E+f/58/fO//vmf/uXPV2gkpxmJ"
+    "IvZaK3AMeb6NMXStZapzWp5LxD68vTWxWe5zQJlIUOaYPkwgsbOf54jdmf7+gQ2snVkoQTcZ"
+    "zCyTWSRrmDbDwdXLKzPOSCPUEAGCbpJr7+wosUbCzBaLpEU1DeXxPASsDFdRtWvFh0/cxRV8"
+    "f+3cceYWCgFTfnjaNGbuYUOlHodUHwuavwlc56odX9+/UgBp+2wJeAw312LtvTLk+Xwc8yC5"
+    "195rMWX3jVZN3VBVkRGbZO1sQ44IjmNWxl4Ldj6eb4rhErXfQRU5at1rudx7uGOMWJdnSWbs"
+    "5WY7KjMcPfpPwGIXtEzUhgFZRfbGrHPI/U1fqEifcDVTrLUamVmVKCookUPcTc/MXZeZmnsV"
+    "7VslVZu3KCJuSFYWMq1KujobySox6S93NY+IaguYiIoWGHur+OH+Ei3T9u9WZVNu9t4wVTeK"
+    "VnRnY+6qXMvMVlSJ+JjXDqg4aw59QqrfmNfKkqHqIoJKlbsnvc/3MUaz9IbPEktQBTZPwSU1"
+    "mWLWt9RGQlI7qmIuAJOUAMTtnmRKqbqjatoQQTGy6GOqGQV7J2Cg+mjGTkVew2YFyJ3dWCeF"
+    "tjfnMVEo1BhDRCFWfUocBhCF4QOwiGwZy2MqRJM4r/rzl+u///qffv/nz+8XVdVVC1K465Rm"
+    "c7gDPI6xd3Xt14cNxZAOqVOqBWrVZuOiVjupoQ1JcOjQm0+cJIWqUEg5ykARc4szQTX3McaN"
+    "QXG/snYl70Ekq7CyCG3Ujxgp3EVJZDFinyuG258+fx2mIKarqtqYw3tXmjbIIC1s6ID84rvv"
+    "fvnp7fPPP+oYz8fj1W9IMooUDPe3t+d1XO/nGZHX6uGWuJuU7dhmmtV1Isbap4iIvM4zd6hZ"
+    "7A3I43hMtXXFXlugkVWxRU19qBsqY69eatS6cpzljq/XVT99yd/6xx8Bf7z9Yo7Hw0TEfD57"
+    "++KmSQBlNjpmIUohVwbEFegLfO1tKhTNCqNU0oBhww/tcV2xTCsrQMkUFVE7qirWfozH4Yey"
+    "UJmLHecA0f5nc012Q8NLMiqpojb3DgumUNR27ojsS27kJsaEZURF+vHIfe4qR085i8V1Lq36"
+    "+HyK6qqiSFWZW0Wpirmlymtvn5O1qaiCyfS1cqztKm6emSIW0dXCFqUiK5g5jweyGv/ZrQGf"
+    "M/PV2X61mP1s2ywBezYgELHpo5jQXrfTXVA1VAkRldwCQo06bD5UdWYVk6h6zuMYzlhk+XBg"
+    "i0k1F6457yzqEFdVIwPQtemuosakqSmUlcwQ9ZXh7iKs2pkjmJHy5cv6p3/+3e/+8FNCS1iU"
+    "lTWH92HMzUaHWFQIZOUVUaS7RqyIdRzDzT6/X1ewiGEqEJACO89TgDENcqNkYBr3FksbD+LW"
+    "Su6SriWadiV9I+eccziZEQsqPl2qDJqFzBJoMqUVc9pOPURVLVy7qnq/LSLiZsWvxxxVjMQu"
+    "vF+7imPYpw8f3t4eJB+Ph4Jvbx/mceyMtfbnr++RUcHrPX2Mx3QOT5ZBzM1NU8bj8My8du6i"
+    "HwNAZcaOzIRqVO0MM187vnz5sRqZjfZrWVPtYu11VWU0+UABVjCjuK/rPC/Ua8n87vtf/mp9"
+    "POb8kLXdVI1JRUlkqMJdszKqbEhm2XC28GAta1ofC6CLxb6ANqFssRG11GSY5i25bjVXmarZ"
+    "EGpUUXQMX5WwPsYmIK14gzh6CoQyE5qYDkaatQZTC7Jji2hWFhvdg6qSrGRdsuYY7W2uDLmv"
+    "JxhuZmpjdJK8LwQmImRFynQ13fuM3EfkMM+1/Q5BZrFYJZnVTQMzG0OE7FtorP2YD5UOS3xT"
+    "rY3JGlQXSSsLJKvMRwkpEKhq50iJLIyhVUy6qIoEyKSoA6xc5WqKHZeom7kId4QKpNKtBYXI"
+    "itg5hry9PetudXYBUTqR0hzvdaUQ6ijmHErziFS1Ztf2rVLsWCv/6Z9/9z9+/W8rRG0kV2Rh"
+    "iOsN+3W3JmAjWFkU7a0dK0vKXWEIFlSLyQJc3L1t45F8POz5PKqiMnemmxUlCxmsxnGoqmpG"
+    "VeSdACdZGHO43+VKc1F3dWdVRBUqqnFeZHVe5X4sVKzRHWx8DwCR3KmsL+eLBPv5rxLVjHp9"
+    "fTEWdw6352HyehdTIeYcH/nIyGvv2tfO7WNA1aEs5l5Ca7vCUD3Xea21MvdORi+XWR0EkBFR"
+    "1zpZtHt4USBNDUFWFuu2TxUYBeP1eu21fQzUpSWSo97/sH/+t+v7j8/pFSxIZhG3qK5Yu6Un"
+    "biUNlA21yVrJZKaJzDHW+SrS1QRyrdXZNxveMZC9F0TUGlAnmbmSQgyfyTRQlGqAoFAiqqaV"
+    "XFVVKbfUeI3DcyXJxnoDxiwV33t/m9sRIjBpfaSBEDyO4/V6gdjrjIjpw80oiIjIbODLtPGY"
+    "j9eOyo4937fx6S5VxzT7X/6nX3z89Ba5c8feTBpFxxwNua/MZvS4qlu3j2hqRJHhLmYfkjSj"
+    "y8G6S9SiKqbgt6aSqc1badHBQIFoO1rpKjWsFbbN177xYSod/Nje4wUpEOrmrud5ZqZpA8nM"
+    "HRFnVpiOSlHRMcZwi7girwKjqvV5on28H5H+m3/+/d/9/T98/nLt4LlrRapqktAWJlQk1WUe"
+    "SpaoRWLFN+KJyvP56Et1lJSgWMPMTPZeZA234zHGsAbssOVRZru4S5LoMoeKRZuFzY7jyIyI"
+    "bW5ZVErsJKREoiqrsmRF7WASHclksrLUPLo4oVq4v1M6Vxf9zxalSEF6N6oqKGTGuta6IiPX"
+    "Oq9rXWvVzQzSqtprqYqosLBi77Xfv17XtTJqR2SWmYw5GtfOYpFNU/M5VK3YuZfeg2jXUG96"
+    "EtDZVXG7eXfMiLyuyMy9r7U3yOFjHocy1Z6u7j59HDYmBWtfomoN9fexE2bH2tGb5471A+Wt"
+    "BIjoem33pdTMxtixRNti17sk5o1n61G3kt0EZusICRYw54xbdGw+vGveRPX5WikZqWYiwqzm"
+    "Woq5zwmBjuHHA2atoyZrmLWPWEAhPj7emNxdaTaNnsGKVUQWjzuCRjW46YePH3yYqNr/+T99"
+    "msOUfJ2LMLFJubETZqpoviBbF6I2AKLKVY5DRTdlJlK4XSZLmlUvogSlH2gTm+5usRYrXV1E"
+    "254DmQ3iHqOaDNmYFUAa7ynkGKom1MQN4NWoTELdut1SSdcEQ0ClDH8oVASVAQkfpsN8DEJ6"
+    "pqcyzyt/+9s//fe/+8c//vnnWFEQtdHyziiySrqAAqhRUW8fHj0hf51Fwl3f3p7tAarC61wr"
+    "ckxXkWorvMm4jRi7MptNaDZWnzmDOwrAmLNzS6aqowE7/RhK7HvMTsja+1qxg9eqyJ4f9gwI"
+    "zCIbT6s7uzpPlpFaiQqym/W4341qBu0dgZkaCZSymk5qBCOS5Fo3U6IzLWvvzMiqSiVlRV4r"
+    "d2Tkrrpf/2POAgoEZPhU83PvyBTVjtxkVZd1cb89+wfDfQAkdhTkvqqQLqpu5u5gRcFMxph2"
+    "zPE4ihWRDQO5LREw1W9TaJXKliqGgLWilVw9bjS1nUmhuolgxRaVxt+0vomk9Nqid6tIc7XG"
+    "q/nEDbEVCtjz132N6ebm5uzdE8RMs2rH9uliHW3SBGQMuKuZmA33iFjntc7TRQ+frtb5vOfz"
+    "mawdYWamJiJZjKjMcvNmWGTl4+0hpvZ/+c9vj+dMVgEwDTFKqmHHIvB4HoZSxjiGmMdWs2EK"
+    "tVKjQGyaDhEq0n26WNfizX1A04ZCjJSsbR0INCtSfTTlQLDdkyXXOoneqbrK6NYlpMRY3P6w"
+    "FkGz6hgPkXI3UKsoKpQQmT4OdS9IRcsfCKmGE+swUd2RQsvMn34+f/PPv/uH3/zrTvjx0WyA"
+    "vM6riB7Im2qxKDDKMf04PLJe116bInwc8xiDVVV5rdhZYiZ9yRdtemsVms3hrhDPsrXj2nle"
+    "WQWKmqqrfHsniYhQEEkVZYIVUAZyR+2dVZKFRsSpihRM1d0akZo9cSvuJEt6oJ1ZoxGiZA+f"
+    "nm8PEzGBm/XyqjfYYnq8zWRmZiX67fd8Pt6eb2Ct2LsSYu7uo9My1jWpvfp+R/fRB3gW1dTH"
+    "2CvOHd8SjM2iYDf+O3hI0tpGSnbJAQI1bSMPqD0gahT568vn88trPOZ4exvHx+EHBWdEFOYx"
+    "ob7TxI9AJSxit9rOQMZmpILKotDEkmmmXd6G2JAJyI6ESGWiqIKvX7+O6TRkbXMzN6hBxYev"
+    "tYuU/s1LifDbvHAgusVk7paxKuP5mCKIKqFUUVQfH7/3eRQwxlTzSlbuXGu0d3PvAtVc1bN4"
+    "XpeNGSzzQ82i6vl4U6JiRcXxNt++e4PT1SlSOy7AqlCMrovNOVnM3MJUQbfeUY24odtRlepS"
+    "EFSZuZRm1TChwIepeVZEhvZNjyimq7JKqNJ1KZWozFhm1hvdMR+5kVHzGCgFouMDexcrh8rz"
+    "OMg0UYVkbLepUlW0Yed5zjnmnA1PlFs8JVmbKVkF6M7au/704+e///W//vw5H49HVqEI1hw2"
+    "pu2donbtYEdsh6lrzxJVtNUzoGTWfRtReRzHa69M9ghXUrKqulPqmiUkY++ozIK54Q5lsapa"
+    "ompmbnatSyAAonKYRCWhojbmwYyK1hQXBPMx3M0MJZZZEFtrEzDVzGwKwvEYIhJXTJfjcDN1"
+    "s1dtd1W1ClKkimPImK6qK6KSyjCTx/PxeD5i57k3+xX37XrrbmZexcy61r4iN3MX5zy+TWWV"
+    "xWutjOgoDlndQfMm0HXx0/Qbg0yqqjcu1Yp2MrEpFu9fV8I8RHZyvv34xw+/+o/FbF6SqyWl"
+    "AintJLfKXVGuvZQ2RaoZiMoQYe4Nq+btsqfELZ0VKdCtM5hF1JwOKVOkCQTX3jqninXia60F"
+    "UNSGqRCM7GsGI1WEld3Kah5zxFIzCFjl7lVVe1USMEp1TWe6u7DI5D3YeV2vXWXqESFqYrKu"
+    "GGNYb8taMaEWLEA8M9deY4zdhuSsBNyNVXNMJZtlw8brkCY6xzMj1bxjdCIbDZLMIqgOVUBE"
+    "zIdppRx2RFFdaoeqdaanoiDh3iVFClTU1rXdhppGbFcxH6IlAlJ6stUoEO07oHTeoCBAyTEP"
+    "lcp9ud+kDlEpdgKhTZ0Wxd/+/sf/9nf/9Mcfz9eSnTEino/5mBPkteJ5jKRE6Q5RN5+WJFJY"
+    "/eaQTKnC3ilSQIlZu7UyWSxTFaCAYFuahLDYuXcF6XMCEhGd+DGT4Wa9vI8cfcQg1SAqgI4x"
+    "o+T9/VyZWRTIHK5+ZwQorKq9uxSEHpW3ichUhyIznod+eI5Wrp/nycgS6G0VhwJU5N2BAmk6"
+    "+HgMHf661tqxVu3KqDQdEY0mKSAbl+BjJCojX9eKgqlnn1QLmXWjoIC+HJm7mWVEM3gb26Qq"
+    "XX1VSFbZcDHdEckSoYjmXhlij/nh06df/epXHz48TaVQlcGEihuccNPZqEoz0W/3i4g0pglU"
+    "gGw5ZkvGmQCFJeivFmhPEHHt01U7tdNjB4roMQlbSZfMLBW51vLp4kNBgrlWFBTSbfmVS1VF"
+    "ELHZzhcp0UG5FXhDfZhEFCOUdIGivyV7KSnBYicnRWyMK9YY3swnVR0ysnZm9LTC3d/MHlV5"
+    "rXfVoWoZd6qmUFIokzGOIhGZLTLROYY3oFHoqlSXWqVWPo09cEnrS4xCM6iiuJveEKmIHs8o"
+    "UBAxn0ZEL1QMJikiEEasHXE8fB4PtDSltolmlZu3X/o4DoGwjwYoRd5AnrYgCmKnUwQeJZ+/"
+    "nr/7w8//9oefv75qBXwWN0zTIEPV5yjRV2AnNqWCloAostmgYmoVee2Kvd+efhxHASVV16pC"
+    "QfpNF1EFjDFg9jp3RLr79INEdi6OHMPNpZF3rMzCcFfVzDI3g0MQxfdznyvZgntRqPftMWqr"
+    "kIXaufe3pwJ4HO5qFcGK5+GPo2P6jIzrjC4LAE5WRZr0N512rrVJ6UWNlPPa52t1bI+ASCog"
+    "jdYveFev77ilJWtlyi4fzqzr2tJ7CkAEpiIijU4X6SR9B4Oa9QBTMfTARljUHqCX3Mhtk8en"
+    "X/4f/5f/6w//8W/t8TyOuSIzUmnVGkcVSPbUs0eMACpLTStF0IScEmFlqIj5RDGDal79E7Yu"
+    "EOI62kN559RA9CcSagXkDXh4HFNM+nUc11ZYrcxMMlPZ/457b7NhYoVys03cZq5SZPZPIsK1"
+    "LmXtmymvRTKKZua69lYzhRgkM0itrGEzqskVoqrtkXgCHrHJ2rWy3Ez/PbqwskR8JYcSqj6m"
+    "QjMTKnIHqth/tapyl0nMwXktreKQUTeMK0RUUPde1FWgBWZyjAOwRjy2RKYfvcz06SoaGRbu"
+    "7kIVmcltPlfBfUIkCGvXnTZ2pC+T+Xg8V25C3E1EI/Dly/n7P/z5X3//x3MVbMTuE5etK7n3"
+    "x+fDx7gy196vKyJZBt2lOoZbMSkZmQD22n7YcTzGnFF5vl69GFczEmuFqJoY1XZyk+pD3U3t"
+    "ta7Y0QrVnrr3EsyG2xj9aRQXdZXSHXGuuFayFbjZo/FdWUSZaw/zh/nzOLIyKz88pw9f1yJr"
+    "Dh0mKvQxzisytppm4Y62V7krgUqoIotVNYaKeJa8fz5fZ1SyP/sd+BVAu5nHaqZJk4baa1OZ"
+    "Qz12tIOrdvDfqXmEEJXRj2QVtceMoDRWOartJpompk2oQVJUK8uHf/jhL/3te59vYt7liALc"
+    "PRMCDtddzNzknT0ky1QzWVnibO+KgEKpO5SlClm7RLXVL9XLwY5JMwlEhg8Xt/O6xniiJCth"
+    "HeCVYuYKJt1G7tx7j6G7UgkqIhZLq39rQDfP1axYFXS1RsDjbqQD2szAMn/sTO2bm1bDciR7"
+    "I0wKrli81aoSK0zdX69yF9EhNgBWZAuhKzdKH8cU0ExgLsMBCPZUxBLw8DmqNhGgiNMwq9q0"
+    "IS4KRVRAxaW37xB3olTagSQiFmSkqskmDxtTWHX5kCr29wgLJl6JQilJYZaoOZgVpaKgRGFY"
+    "KTjcV2yRND3O6xLXLLB2pRZ5rtfPX97fr1UqO4MES/aiH3Icw907754RXaIhJaI4hJR17Wun"
+    "uu9rqdt8PMTG2tfOuPaOwhW0zMfhPrQFu7HQwBGKaLG4SImUyLKB6aqm7uba7snMyJ76x8a6"
+    "znPnokT2ebEdd4hKQdvIRQQ+7DjG+doR8XzOD8/n+TprR69tdkJdK3CueF1BqKoXqaIFWVlZ"
+    "OXwkKyJBDlEyXq99XlybfXOCSkJMIezMEKka1asQ3Rk7szE6wfJbWy8GcUVXsAhRoHNFXb2R"
+    "Ehqbpe5i0rF2VTMDBIlhfjdP5qTZcz4MYImVMcLNhz/3a4tIQShRYlMOIreI+UgEmaIQ6R87"
+    "XTjM9+qMmRZlV6m5iEYVUdrbJPQguzAcLqIw0CUrLtIAmPmOAEwAxlIICmSpcXcsIhd3mRp8"
+    "JBmR4+GUMgWzAA1WRszHwaKgxrC8EhAfcwdL1MzEsCvgJgzUNXTuVSLyOB5X1Mrtc5o5icpy"
+    "iAhMdRyPj+/nS0dVsY+2PiZ6/6zeK5POfNv0CPQkXd1EhkhWbTMFDEmWmDnlJn0Ky0wKEhl9"
+    "lx7zOM+TAnNfkVpUGLCDa7iyNDPUrBW+crfJTFBVMeZU1Yw8hvddRWyWVDKxY7itrIgQE0Ul"
+    "rbIETsh17T/+8afzjIZK2xBUHcfxfHpzRK5rn5EiBqncCQeJvWOvU4VjuqSw7JhT3b6+3qsS"
+    "qJ7E3Ijyqr3RIGTvvHtSlcnIlPPce5e6qrfrVCLYcerIBOHmEN1xfb1iF1aS1CIKTUrlcB1u"
+    "blpVxzx8jPfztfb24Y/nY+94nRdFiuTmitpFCNdKqsYuYRg0r6XakCfsCIVW0b/NhNu3rr3Y"
+    "NBXTAsDsN2dHvkxkeH9Z143DITDMbEA1Yt8o8/tuV67qClcXQCkOeaqIiFFdzUQPgFVmAwTn"
+    "LECEakZxMf+rXcff/93+13/Dx0+PX/widKo+zI84Dtp0nZgPuGiWVtFVyb022Sfozb1s2I5t"
+    "wzNw7oAYYG2ubCJCRba6w/R+wZkYqXuF6oD62vk4DpisvKdyQ00oUVvAyNyRb89HxxOKob1N"
+    "Nqy1SmFD3AVCdT3GbMyFur1fF1QY7B54EWM6Xb++TjUhco4hWW66d+x1zeMBRyArQghm+Zgj"
+    "ChBd++r3Yi/B7Ba4ap/9eyKhJuZWTDvm2nnnNACD+pgqaJmi6cyEq4hgZ6i2W7TUrJMa53US"
+    "SULEm06uJYpVuQIu5mpHb88a7xXRI7tviP7KDiEO00RBVN1ihw9lUVSPOc99FjVLCBXqTz+/"
+    "/uEff/uHP/x0bZiNtzdZO5BQo7kUeO2ITBXLYhaSggJ2sfZw+mP0r9jUKvPz5y9AHMeYcyrk"
+    "3C9VVciO6pFvNXmkgWNmIN7P2LvMjMJIRuz+HKjQVMYwV71WZuXrypWyC8VO/IKkCYfJxw+H"
+    "K/feOszc18739xBiPjQqv355RUBdM6uKarIqcN8Jb2yEaBtROhokLbe/ezbswVaNaR3/U/X6"
+    "NjIUEwpbZpRFnOEimjrvilVJlVcdZm/uzBqSD5UPlGfJBIbd8fVBTHXrMiWBWwpflcTe7WTJ"
+    "HlFGJVJj8e/+HzTTMXA8zsdjH9/n8Z19/O75w1/k2w/Xp7/N735pv/zFMtvqD6oUh8reX3Ze"
+    "Y4iIx75QXDvUn+5HFf69Z6Ii3SohbnWTmrH6e7WiOKap2tvb0SYJ+zaTD2KqX9flPtyGqFVF"
+    "5lb1ygCZ/cCoZuY4tLm2KsO8vTNRUZklFB9+nmd/uphJ5MN15zZXFvd5HvNZKhHL5jCVymqp"
+    "5c7wqHBxVSuo9qSXBW4RZKwS6y6BiKLoY2RcCzmm24B4uY3czH7HEHPOjKi63J2VYjVmE5IK"
+    "Io0gZXGMuWMJhUVz23f2j8MONSugF7x9XSkSFLdhxmu/Oud4j9kqVEH0/UU2A7F8frjO06ZA"
+    "lWYp9vnH9Xd//5t/+dc/ZpmP/saVtUMgFBa4mIwqYldPme7iwVArpM2HmlWkmYvKl9cVGe4y"
+    "1caca29VZWVC394eouxjgUApVJVI7is6AUJS1ToV0SkeEQnIusJVTbVKrmD0bksAFsjp+PA2"
+    "n4/pJrFWI2m/vp+vc+/gcDG3b51466f3PnVDAGozEpQk9s7+Urhpj2QKFVKZfgy9+fiyYwtQ"
+    "aKdvfQsvsgAkkYDE6sU+yqUO1w+OXyg+ZDxWfUz9oHCzqk7gdK80hFBiFDc3RNVHZrIWfbhb"
+    "x/rd1KBNLjDRYqzr5aY4UV881JO/0flRfMp8E/9gH/7j8Yu/2R8+vf3qL/iLX12fPs2P3y9F"
+    "SQ4HYqNCMlxnJGsv6CiKufnQe3dTtwdUad03UbNYQUhz8KDRJo2MGGY70obX3lds8yGiYpqt"
+    "ijCLyDEmCVfdVSSf8yHQ2ukuOr2KoKhYobIVUkkzb1j8vpa4mjfN5roZlNyiNoeriapA/PCh"
+    "JVJ0tu+H9GHnWhBnyTGn1DaTMQ2Vc3rbx01UzZhRGWM89OGxy9yYNVy7Km1urRO9CZSdVZBu"
+    "YwnlDhIO89glZO2AgFLuBzJ3hk1xGQ2njmzxoe0dhDSzrk/UEVES8/CMLW4QRG037tiEKK0y"
+    "MnBt/vTzl59++rp2EaMdtmsvNA1EPTKFJT00YKgZpXBnwsqH2+iYMSr33rHuiALmPCi6M7s2"
+    "EETeB2mK2l65M0U1s1TUDW2lJyXvfKFCbMfeK91U+uldfSHtcW+q4nHopw/z8TzAuq7lPtz9"
+    "85evr3PvBAU+VCArsuXJnVi8LfJ3ueJbwKjdTX0TVeE3NxfAOcZwTyYEsVN6KcpIQF3dVbL2"
+    "RgeUTGWqvUk9IZ8gH2EfaJ92Hrc7qg5vsnyW9i1YKuE2I7MEW0T1EFHgFr6hoGYlVHUzDQLQ"
+    "HTRRAo9DTdXMzp0wJ6e5kTtfP228H+fP9YdfP8eDHx/84Yf8xd/mL/86Pv4iVD+8PcrRhFAl"
+    "zS0KmwUCWZ0pEcpQyz4CdMJZJckSdiuzj7iiM6tFK2yJTqcuh4+1dmQkkwKWqDowzHRnjDG1"
+    "/9Qtc/hhR1BUTMwqYke4u5L72moGaEYCNXxUNiHgTiJ3nuL5PIKMtUpQkQpMG96FltgXQdNR"
+    "yWF9CBmsZIoPK5aJDjUVTnM13VQdzky97b5TKgymJlGrYaJZRciOUBXFkM4yZml7JaxEDYWH"
+    "696niAoTSmYxEOyMXZVg+GGiEImMzFCV4/Dik4DoPvcS2VJrDjMxFsTkDnGrJPP9ff/Lb3//"
+    "45eLPDIyk5s7IiHwnnkmvbUtgpVKoRo1IQImTXRfq4qxmSg382NU5jzG2ue1ymzszFUU8Dov"
+    "u98k2LsiaV49cLopfKo7qaZQVKKyIlGF6GEDuHbPHgHBdJtWHx7y8XCQr/Naa9eUiP3aOwgY"
+    "DPBhScSmmWVmkeJ9LGHdQa+6d8zgjXHseFRHh7V8uJrvYGTtnQBNZScgpigHZUeGlujMGi6/"
+    "PMbfpH3PONRGclQ3jMrU1DwlgJI7uNr8EppShN3977Qxup0HFKGm1bUBJSqVKTrGOColmabW"
+    "Tf0xB6BWJgDUaWoU8DKuXO/ys9r1+8fv/2Ecn76fHzjfcDzjh/+AT9/lp+/i+UHnAR45BmPJ"
+    "DjkeKtzX+2MeUANsRYjAXc919XF32kH1BAFZewtFTTKT6ECIRkZxgzVEyjyonfZl7mLJrrql"
+    "UKjaIpfK0ZzrjATJat8X+h6ekY/H002uvZB8e8ww6ZBk+2Wyz0/FoWKVLnRYQ9bn1/NVGZE5"
+    "TJPZOA9tAHflmLM3OkpO/xZwUVSWufZuNqNkSOdFVCQjxcyHA4wIg5DlrhF1NyKoK65hY0yt"
+    "ZFWI6PC51uq9tZuZNa+Qwrq/CBQutlY24kjg6lW5MjZVjnEQMueIXOfaa9mff/zy29/96ct7"
+    "rosk4UxREdsRrHIrMaEoC9feUYTqY7ob94osZqYU1BxWrn4cMyOwpSDXFWP6Tq5dTXuF0Al3"
+    "7ZBzP7LTfV1LrP9quXeoGQrNV+2uf0HOtVUtu3ACUdBYh+LDnNPs6+u8ztWZv9e110afhOfT"
+    "zGzvHclhqG+MxvYttgWx8xJkNZyEtzgLAmi16k6S1b2oLAZRKAqUCSKjvdX1H6T+k9svoMfi"
+    "R8lRKoUEElkU914CljY7HxSKqfKbNZKiWd2XKrHBzJZjNGxuuCYpUiqeQBVuwke3xxWZ2Vrp"
+    "zHJBstMT4m636FmLVc7CTy+Guj3gs37/L/z4ob7/5fnDX9cPv7qO7x7+ydzlcM0yyqGPzKq6"
+    "ghu40eamUj2ssqrKXaXDTF1Fr7VteDslcgcqqxLCc8ewJ1R3n3zUWSVQpTAxXR0wIOomEoCl"
+    "QI9LzKRv6Wo6D9uVu3K4ZaSqs7qeoQwqNHOromLXXkX68ZhikqtctKDjUBMwCiyzu3LVF1Ez"
+    "PezQShDTPVkKM9VhLoyh2v+2c3pUVV8szFLauKluxtq8SU5wHwTHsKhlfUUrEBTROR/gHmYs"
+    "mPV/v0j2Ws1EYy2lDlcXdg5hjAlsEd3BZvFkolLPM3/7uy+fv+b7e56LbmqqV946lBJZlWpj"
+    "Ze0dRRF3KajEdJjY2mxARzB66cVr9yl5t1Qpbe+dybUpEFGaCO5ORvm0MR8ZQSihESyWuTcY"
+    "HPcttGkMTEo/9uA91naVj4/xmNbX4aKYeSQjOl3c11itYuwEUWQRbk0Sh6p0QsvMcgdaTa5t"
+    "ppC6Z2My3AleKzJriBa1qtRVULolAAN+Zfgrtb+O+l7NyEK4qIlIH00VYtoE3HbciEgrzlk3"
+    "U0mrCmSVuymJ4jFG9G9GJGOlqJl1HUqgrkZSRdy0e0IKQSUKaHC2iiBJRmjnPTt7RB0smFqB"
+    "UmE/fcYX4k//wse/XccPn/7ir17f/+X16bv5fB7Pj1flcB2uhVr7DGn1USdeBMzcW4aoorIo"
+    "EozMHHOoWEn2t08L7KiuQ7NERV0ts8wgFBQrS7KUrLXgIg4RDre1V+bFyjFceqBrg8xdIW7m"
+    "Q4TtVHCbIrb3Fh/ndT0f/pjeK2Qnsqoicq8NE1GpCBSPx6M9SXvX4zhErAgHVEw796jW2EtU"
+    "tvTMhhGalQWIqPuI2jRUJVRXhN178AnTrKwKNSFk5T58qiCTUHEboJKpqqw7BqAifdEHS9Vg"
+    "BVmsbw1Uqe4gRlpX2osuqu+vz7//4+evZ63UqIAi4n4mu9aI6BZQVglhCrjJMedaS0TMLDL6"
+    "a8VMcmcwVKWTzFE7qvrRKlJIVww3N8sdYm3czGsFiqqyIxo6CCCiMkEYwVgh+q1XR3YKzRTP"
+    "w911x4pkFsbwVXZdvc0U3oOoypIifVgzsNjJLt4gZFJuuDTQHEb99qrsXW5mtfC+H4gsinBS"
+    "WIiJ/1Dyf6D9R/ItMqBlTOFR5pStVNIEU61rgyS+7UVVpWunLPYLkqx8zKPZriQzog9uXbmD"
+    "4tpLYcO9OuJTBBSg91wwymw6hEi/OZMBpdDuAV3RXC2EUJjt2N2hsMTx/vX5iuQf68d/9u9+"
+    "+G58qk+/+NMPv7BPfynPZw4/RWQ+BrYImPENzKAFznl0AFbHMLNDnYXYoe5nvEuGaruL89pL"
+    "7dFKemvKeqW7Z0XEds6MKGhCx5wqcMNGJoMlmVuEKzcoYxwUWfsCq3sjz7dpYwC228qtQqb6"
+    "ARHPvcfxLLPIdPO1txYPH5Elw1x9jNn4ryrCRARVFCQKm5zjYEFIISiMbMOoRNZ0EaoodYx9"
+    "hbmJ5s4CVGRErYg91MREdXSgt9ncne9jJTKniZtNn1VRla4iIivWnCqiuxYoh04ghRJZZg+Y"
+    "QAzQr1++/vHPP58XX69MmAyD9hBPUExGRGb/oqPaHf04vNuhgJrbtVafcsfwzBZq6d7RfLwo"
+    "WlUDSs0EyTFsDLsvKqLndZHCAgq5ogo27j92JxvQw3uBUfeKDDcDdA4dQ8Uki1VZ0Chcq+fZ"
+    "d7yne9Urove399KdENOO73R3r2fdXQYy06pqk6SqJCkZd1wSGswCBjCT35n/p8IPyk/Mh4iK"
+    "D5F/H5+EyoAhO6le2VYb6W2ydc3jTlyLiiIr3Rw3NyJEVGxUliiGaUmPclmULPZqWgARsGqY"
+    "3MvwVs+KotLMbGhUtGOpkAJKRdZWG7kXUgemmCelVA0lWHnmfH2dx4zPn/7DH34h8x/q49v1"
+    "3Xd4e9bHD/XpFzDfGTamJCrCTFElZm6WZKwogqZmfp2nND+qYcA+gn7tRFOUWdG91IqSUteo"
+    "qLjEhoi0gvw8X7HXGN5lTSB25hgTWUpEpaq6ORyqcu4l/ihRCq59RT2ISsKnTRIJmI/Kdcyh"
+    "rgJNlor5mALLKHW/F/EatU/YgOhQZZCkKty0Wc0lcHe1BHLqSO7Y17AhKioP1ZXciYSIj0OQ"
+    "qhoJqii8qlZGg44gU4pJUekPBCCRADC8TxfYWXnYIHZlkk42acd2ckdcV335ut9fJymU7jM7"
+    "BHsHVPcGqz8MyKQqjtm2GBfVQlZsMVVUZmVXupmgRiFJNbhKFTJTharA1L79RtySAhXrskuB"
+    "1XQ1kYxiUqDkndrDv9vjG5whGCLDYAYRZVkqK7C7CU3mHcBjR5crC4XseyaqUG1e7AdApBf+"
+    "hMCHN0u1rNGmoNASBtnAJg6xXwK/UvyF4Jfg9/ePxG97OypRKrxxCwT7uDP624RZzSTRziUz"
+    "VFRE8/6fpS/9FJ3m/UdnUQ0CNRkKK3a9rVSsMsF4DI+I7lpVhall/zYj1OFk5up5I4gKZkFZ"
+    "lTXsIUQFQancUfp4PP1Ohiu//DjwM5Xx23x+9918fsLxJm/fff3hL37+/hfXfEwfkFGmyRoY"
+    "q1JVEn26fJLCKhchSzpmCqjqMX2dsZXGTo2iKnp4WUUpVKarmNLc3xU6564c5iK29j6mV63K"
+    "ltwTpos5yKSreyDdx7ll2EwgQLr4tffxnBQRPxQmKkkIpISuVrHVpQO0QGNu6G7ug5DMdHfX"
+    "oZKZOyLm44jKa13qTpY1BIzd8ChARFQNVWXuBsu4RMzMFYk0FU3G3vtxPHr/ZK5E7aSNdtjR"
+    "dBoJpXl7EqPC5ngARkgGYZVVa++vr/Onn7+c1xV9Y4TsKCjr25yINyqltdMABKo7a/rhalF5"
+    "g86BzieaWUSZiqjMw6Vy76qiqRyPWYJYy20AChRQ0oXYQlfYOgeemY1G6RksAVVU4V7O3q/M"
+    "m3C3M68Ioq5gURupIbfGGgooQZEomPW1jX1d7EaAu2cGwGEdq5LFNJFRUoRRQUZVGh/EX2j9"
+    "lcj/VOMXq8QyB1o4IEwTRbGk1Ay86+8R2RUZM4UwQRFUpAiK7a9XQCISUOvUMaHWXwXdnZM7"
+    "/GOy1xKoqzbOvvXXvai2b7839rdR94gy+rVP0Z5oNC3ohjOrFRelMtJ8AALkugqiQST6+EMZ"
+    "krnlx6t++nGON6U9P/7C/upvXs83zhlvH/j2C7z9cHrVp2EqqkM2be+DcJuxTpQW6jmPIkps"
+    "V/vOwkyH6a4QkazMwnw8S2TvrWvt1JU51VeUANcVKirUihYJsZG0jzGr6lrXjvAxfXqiRKDm"
+    "Xf1fa7vPmaSMgeTeRRGIZsVwrZsJi3G8uX1TSanOMbJSzcR0xwZkx+Vanc+LTJ2ubrVRAVUc"
+    "Y0p1d6QUpqrE7lWk2dg7CRxzxJWoVDed41prmhdrrVSnqlYCqqq49nqY9besma+MoVrUzBLT"
+    "G70EL9rnL9fnLxdU3TXAHinDxUwzma1DEBnfPJf9/VKVkQltBk3tRreLUfoFIsPxeBw+/Tqv"
+    "vDJTfLgNX+drTO+SlxJZcq32PNNEmobXZ1/28h2U9r7d1GW6mbD9xoDIuXbEBrGzCpZEsnu8"
+    "1dtbH4omTXQgZG9TqNo92b7ZHeiMpItmBIvKe9xTkk4Zio9i/9nlf05M0jTygJs9C0zeh8Qs"
+    "ESGk4o7ftV4pBd2KbcCKiWZmr1cVKtTMUjVVAwnKMCtk9yEEYqrmKmaRWaSZ7B1igEpkmQiI"
+    "3OkmECVUBVk7dwwHK1o20KJuEVFY29ip2BlUqdqmj73D0DW7bTaYbEkAqxR2GJiXIqM/HPsa"
+    "P/9pDB8fnzkf1/NXr+/+9vr+h9gfjrc3+NvrjA2O49hxuXW3qbRE1DouPkSLUbnsmI0WdpMk"
+    "166SjAoVHeNQE1aiiikKZxFUEm42n8e+lqnta7m7Px8761zrGMcVO/ZWgfibqXGHqwwRB9pi"
+    "P1YsSJlhjKFSw9Tt2JFVGO7zeArqWtcYWlU6ZeionWMMAdSMkGPMUgN0jimUiBfjzFiReRxH"
+    "EWuvqFQfyBKUqUJGVbmOiFJItTMKzW1viVfzdCRzq0gPwI5jrFU7XcxyFdlU3UwSZT//fP3h"
+    "jz9H3m8eBu+JTlTsFDMxNZNqLOC3cc5u4DpQYCSjSkwIicj2Ys6hj8cc0ypiZyXR/7nWVut+"
+    "iagqElnNn79zFG6q2ky2b9kK3NcniBLZ7TAl3NRUKnOvO5shgEBZdVs0+t3bv5AIBgFk1TCd"
+    "Pro8yGLD01WobmCxKJSDomSiXDCAp/F/xvxPpW8RxjSoQWhyX1nktmqIajUcinccSxTDJ4Tm"
+    "tvc2cVax0vpBsk7B0DoRLJ4VAHZEMXxoZk4fYO0VEBUzMNcVd9BlV8NbKCxKVIhM9IG4Yrro"
+    "LYXSIirT3EUlg2wjV6E/RaiCRB+CUMvU2sSrqmQKKBGRBVVqd05Eayner31daWqO+qfDf+Mf"
+    "f5XffV/ffcgxvvv4aX/3y62YyqmWrXSaajrO872Iil2VOjT2pSolklFV+spzPj5CRBXFmDai"
+    "7wJ0hUZlyw2qql25kVmV13nJNIr5HLF2FafZMQYLOzHn0zMoRxcPE8BQT/QpKKeZdlzGXNVs"
+    "+Nqhbs/5ADJzKVUbIWeSWcWooo8ptEpRs4wtlYKE1PSBGx8GgsMMKXunuYpmJmKFoavYMaZn"
+    "1hheGeoOhqpl7oocw0ABtAnEouP9Je5z7Xz9/CoGwNd7/e73f/rDH3/cgaiCuKru7nBVA/TA"
+    "rG+Rb5o5yb3v2n4lGl4PExWNXTfM6c6+dzO5H+pmMuc8DhVUhrJx57E3+l7k7YC7adlgoVg9"
+    "4ekjQDXwXkBKVimhrihJ0Ez3TgDJqjaOAy4CfNtVkSqSSd4t+RtIiTu5AUIyuiUkzRUEeZh8"
+    "Uvsrsf9c8n3ElF0Ks5ksLQzVRL9pLSOkkdZFVSnStddU0qoKZiuWcOM1sqBkQXpnBUjTNghV"
+    "yT5gV92qLrOeL0O6zt4ja4weyjeqQcTGI3f/ywZysYjWamfTiayNh1mpal3lFVMkFZq1hTet"
+    "PPbl84CwckMI1Gp4Swjg6kW9Vm72heRlpafg/W281vXb8+fHcxwwkV/85edPfxs//LUdTwyX"
+    "x2M/nlHEdSFZGUAAqTrunyeKfdawISrDHQJ3XfvswK0o4gq/cehLKdkuBDMqXPxa72pTCVB8"
+    "TNF9HIe6dRLBjRKrpaDVkeTjIaZQWiaQoQfVLCI0CbG+bEw3yJQywgWMpMosJlo3E6nqhU0u"
+    "c2ZwDiuIwCJSxT6MwaxrVZUarNap46D1eqflzJdCqVCt2C/79tyQ2JEi5vK83l9FZNX7eidx"
+    "rvjp8+u1Myqv99fnz193cEVF8/khEBQ2+7NShNQcpvCeUzEBoKAAKtJch0gJMxEwsMwwVFTY"
+    "fpCisFCkukB0r3QtAMFMNqBDAKhQkBTCbnlKJy5xS3wEoAjllhU1Z04Arao5jUVRWVFFSeHd"
+    "MP9WgEL1i5Yi0sOUxTAatY/oAMBkj+6FHFFPlUPsB9e/Evkb6MfM0Kbd0YQOpbZcECyqRLEM"
+    "RrnnWEMFgJlmizBEUEBClKYChXjv/LTHbarWP2KzOc3k24yKTSwAtCpNaSomo5vdhcpIClTd"
+    "1PZKwEQkmTYVuavliuZS9NkVP/aCGSQLO0NdILSSIgu7/5UyFk2TpaZtWpAqUBObWRJKpLgW"
+    "KvYyO8zldb6rx9gvOx5RiNe72e+Pj78+P/zy9fE7+/C9fPwhfviLmEedJAOjFMTetbb6tP5n"
+    "iPiAmdrwIsAcbtf75g5XpFoLc485Mi5V2zur0P2PAZ3DgYSk6/E6Y1a6HiDMzDMwjpHrBOhu"
+    "jFWxxhz6TXoWsUx9uLvhlhfDd5dzuyptAmww7R6RO5hmXrlzn2ZqbhAgMxMG8entwkWVyDAf"
+    "ldoYaVOBqhOVW5hZ21ytayxVrS6NXUS97zNWnFdc19dzvb/Oda74+et6rYzaIIXSW1YXoypZ"
+    "BlGRVBRhZjaGm/Y8ZW+24iiqdYqqENy3TYNEsVASLBWstdWsbsSJZElGqrCqhusx59fX6liB"
+    "4t/fTJD+f/S99F733K/KRgr1aKdHUDeptLsWvHErXU7EfYj+tnHqkId8a3eqVqamKO/BGImh"
+    "MpCfiL+y+bHig9mT+Ch8ZvsvxET/f1T9a7ttWVKcCZq5j7n2ORF5g+SSgCBBqJ4qSegCqurq"
+    "p///X+mqEhKQZFzO3msOd+sP5mOdaMQHPcGJE3uvNecYfjF7LShbZ71wMpqzAQZLncG8Yiwt"
+    "u8z1cXJxRFRtQrVvIjKSRJKM2L5hjAqjk7FA8rqu3jessHPF08Vm917X4+wRAbHNr++diWBu"
+    "FdRrhRq+cgvUNpMEQkVkIA2Xr10moKzrzYpOodU0Og/VklZkbRAwa5GpFSGCwO4d1wNOEruf"
+    "jLyfH1Ln/eWK39f3//jN9fPr88/fvvlWa318/uWP3/7m+c0v+g9//tFxXZ83Kh+XwXyruq/H"
+    "Wo/r8VbA44qC7ioFkETEFdFgZu6Pj0AIASaTkfH8+NHp2KS6ddd9P5/3x8XrmbE6YiUC3ai9"
+    "nzfEFcpA193a33z6vB4L+qJ6X+tTrpXRLW6ltNZadz0jGUJAIt7WYz8LEepGdHA/LsuB2ELd"
+    "JSnXY+8NNPr+9Pa58Lgb4IrqZLw/39e18rpS4fwbqvZdBFbGjz/+GAySPz67Kr+8v++9f/zh"
+    "rq4v7+8/vu8fnvVsgxbDeJoq+6A6SV4J5NMhi7shYSnTAs/rvv1zdkbkWq1ORMajqtHtYWkH"
+    "GEtAMJ/72SiDpfwqGg70saskN8aUbMUxl8Ia0gOhRJA9wg3DZJRJo6Ra6sa920mTtElogjpj"
+    "kOgxh0PMaNb7EqFJsEuicsUK/JHwF8pfS79oIOK69/KmnHEFCIYryCqT5TxeUkvOg6WDIMAg"
+    "SiGgOjOd/1WFlRlOlbOBSqraIJcxserMKI8EZm+qXOu+q3vnWozwT5+ZTjOwPifzElC1B6a5"
+    "kAqQ+/6QIFwlMZczDHbtWGvvOymbXryAfHvLyKjaM1BB3nuPTb313B8rFyQ5wsaW967I67Gy"
+    "ddddRHbdqK37/WW6fKxH3//K+7v1ZT3vj09vP398/r+f18/4y19++fRt/8EfP3/2mZ8/XT/7"
+    "5VNoMqDae398QaZuMQPo9y/vKvAt0cpMVXXdAKqk4N773vXp7cKuYJhAIdWDV4CWWApY16NX"
+    "VODO6H0XYpmdlVg+CB8rEyJ2EPvZ6/qGZHBDG4zruu77I52yB4pRe9e+ATwukHHXDcRaj7iu"
+    "+zZpXBEZWojoDSFn3RKl0O7dN1YggqTquaubqo967l2tqNIt3Xc28az7ruf7+/O+q0Eh3z/2"
+    "WrGrSWn2DNEqJCXdu+7qbjDi+azL4cNAdTECgSuTpJPvwFTX/XyuAfC3CFNpYi3spzCUVNv0"
+    "Hp+uau37NgLel2UEEAHi+dzdTdILNYsEd3ehiaiyYtVyLLrGf94dIYQNLbYo9fDrzuvs6Oqx"
+    "/LWdC7ylhH6V/FXw18o/bfwKKnVzL0QEm6LxtFD48fJph/kRLId8FRAJugSFesrx3s4B32fI"
+    "Nv9GyI8C2t8Bq7eYYd2jBIRzdta6unvvI8A8vTHQScRaHtU1hGREfHy8R7giIIRdm3G1VL1j"
+    "hXdFBHZLrRCuFQ5kbA2SugsRaznSiZHX6q1SrXU9n/d6XOhGay1vxarVxAPVieBouh2Kc72r"
+    "0c9AqPbKZr/vL/8Xf8i3f73W519+9/t/zJ/9Bp8/4w8+7rdv9+dvPmFjRSGtUIqWVBfItVC9"
+    "qzPR91O9mSsC2D2KXdxJ7H1nXrvvdWXmWnmpFELvyv/y7/5wpZw3CjLXuu8PCyFbQvRjKVAZ"
+    "NLPHpsCMHbiDV6tXEtpQVdfE0QVXglEkugQ5LrDk8OOw3B1SVEcgXFvSK0Z1rothPe3ezxtN"
+    "Ynftj48nxPve976rsbs+nl+eH88uxbqeu7//srdQpVKTQaYDmhhqasT0rYjsxsS0moWu3lUM"
+    "2j7lO/B5bwErI9L3ywxp3ETv7YlyVNOroHHN+rJt3O0314p8H1wjqwCRMD7J6c6zAbb/12Tw"
+    "bsMxbPtHtbl9cyFnpq/llliK4U4BYkCfr/zTT4+/Jf+26k+Ez+xmIfiG9Ym5kkSt1qNQ7PkL"
+    "I4yXnkBuS9bsQ8T85Je/ezntKYb1DBmyeTBwGCN3d6sV1NGMWRLf3Xaq2fboI2lKDDWDM/YD"
+    "21eMdHdLJdV9b3sl2wQysqHM2LUzTTJWMFdeln+l15yBy8iVba90qxHXte1+m+ppVohQb+2S"
+    "vErAlLnY+3ZpGYFrkdrCXlKyS3t1fMJqbe6Pb1p4//jmx3/+9M//4/Gv/7Lef1gfX561Aa71"
+    "VtWL+ZYX1SuTiESKARXVUF/XtU86DVq9m8HuEDLXApTXYz0enhHu3fmf//qv1ooffvy+WowH"
+    "kiIQeFxJ6PqUALtukMnPUmRmguwA1m5SCCizgpsKdaq5HpZ+xC6RXHlVYVcL/Xi7ulric2Ot"
+    "K9fllk7k1p0JBvdd3ZtVWbVWit31fH48mdnd975LkHbdH5ag7cJd8eN7vd+q8xwTYVZeqY0U"
+    "g6KL4SVwy7wNW93XWmAUrJMIAYJy8fO3j6QVfBWW1ye4WFI1u1GzdfKix42fI6xe1xiDCfrr"
+    "kINliGAas2nDkgiyqT4FtaNBJmcILbjhtPnBruzdpRZ1KFMkgG+Dv135byP/bfevdl0BB8Fc"
+    "sa7mArJLXct8DShX+DI2sTkwqK2I2KU0/52epjAwapSVuRCqCgDqx2UdzHgmRQhNiFYn0Cdo"
+    "qeTU6FYh5LywNBzYc7hFJmcn3zKzslSIArV7M4mMBiVd18MVzckdsyKQoT5ZPFC0+bBBhtcI"
+    "kcELHkur2tLvSKCh28m1UmSuVqMQCH8nexeqJr9KIBRbZCG0qzPzrg4Fa0HI+/1RO95/iC//"
+    "+un3//iL3/1fn7/7J3z3/vjh+2/vH7EVny6V+ub7l5srCd77GV2q5113JoKxb2WszKuFbsS6"
+    "rrdPpXZ6m2LO3fy7v/rjx1vWfgoEE8FujVchGBGOr/n06dOKT8wTuhW6rkU9IpR5U2LTSimS"
+    "uVxulEehXbXWcjF2q8Hr7nQI+66+azea0ZFay7VaZzLnia5W194f+wZzt8q8wnYKyVWFH579"
+    "3Q8fX7a2uNuFMzLDmMi9m8yWLAyKiD08GYrIjGs5W5hktmtViYRjl2sXwbUWifvescLerF3N"
+    "AxryPCkzTHislibu2wtbb0nkG96DK5yuda2507xJOk2iyCyhpzA92g8hM5TsqmhGIZz7R1zU"
+    "bxb/NtffIn+pfqgYwooHGI2LmSKF9BSBzEwPtYfuemZr9HbK9p7DXr9WQsbuzASt7ZmK8LLY"
+    "Kd4k06+yqxSSadFYeNMOUp6VEv6Hxnq71cd8XG5hLB3BXcVIWm5vQG3mfENkt2pvENe1qvtM"
+    "XuFkk2CstSQFQ+BYtf2b9SawVQxmhm/4806kU9ONN1l5VVdGRBQTQpV2BMAlshvWb1d17W2w"
+    "elV/fNw2lNx7qzf/9X+uH7775vt/+vzdP719/x2++/53rS91fYoHH0LdUq+guiPy20+fAuv9"
+    "4xZ5fXrLlV8+ntfj8fj0GZkN5Mrr7bHeHsXOf/hf/8Id/Mfz9qywW91csdZa1/L5yyuS+ZDy"
+    "bT38Dgu61oV4Bz+uRbTWtQDuGrnlx/PdTitaGCTV3tXaCsZb+ssL3PvJQKT2fncFeq0FNFRV"
+    "H901s1RGFa7rbe/a9127yet568tHffdlf/9RH4W70LJcFblSwu620stOCef0zAtsyoPNbd37"
+    "bkMwLKUiuU/fmZHreOUR0Y2Watsx6utFDeUVPuwHUT2o8YwAqIh5z0c4FYwYbJjvr8ldI9ZK"
+    "BEuoatcmtAhzMrYJNZuhGXJ/hv6E8dvI3wZ/A1xJdVH4jPwGuSICCJiySNsMPfXyl0inooPh"
+    "2OL56Po16o7wGw6X7B6RaLSQikyH1YlyrpejXiSsa4lqMCPVjQhErMzuLjVPXLikzOUUOP++"
+    "tXdGMOK5bwQj0klorkpyZYSZjJLkiEYGQWmXtRDbelWodg3ICZTGFt8DJtHd1SMtb4KMCYhh"
+    "cOXSEbiiFcPRNbvSi0CeXQJ7d9e2tTU8Q52YNE/oauuJel/39/j4oX/8/vrdP/7sy++5P+6g"
+    "di4mBHTn3qH+5vFGGCWNTFbt63EpokA5DS/i7fMnJYvKf/j3f0Xxy/uHn2mnTqxcQdZ+ErjW"
+    "I4R1LcQl9SNzkYR8LDY2UyvSfYmETEo35FSo6G4i1FTdEQpiZVDdu6XadftpZ1ib1491ZSbU"
+    "XTemZpO1S2RA8fH+0aIU78/+4cf9r989v3u/P0ofRQudS1oZ17Uk+S0jGel4l0ETOzmgD18m"
+    "I6zCt9KxT4Sl69kRGFDMBODAVMYBALaaiKQjcBzoblgZgbVCh1zpE2LuX7i5iBNMwThsCvdi"
+    "Pi4yHfp5gpEYaWMnCPVn6peLf7HWbyP/DfgzKdWxO8X0TQWxO0m0/3OpKlW7DFiZjQ6EUz8A"
+    "OPEEh2Ovlzq75WldMF76TEy7nAxLBHJ4YgwBjUbAva6PjpqkRoGK4AqLopGRzvWMYKwJIo1c"
+    "d5f/KlpAcjmXltVipNsMRgSXg5d5PlVOIlSOQBYeEVCkWi7RuPLUZXTGBRlARix3/q5TIkJN"
+    "tSKiOdr1at1e9Hu02aPSWcuKUQWd49lkSRu6I68Q1NwfN5/vn/TdH3z3L/H9P318+eGbL6r7"
+    "R0YxxOStuppb0LoUmcG9b9NImBex4rpipYgOYCH/07/9Teb1fO6P+wZxXZNYe0V+elwBXOsK"
+    "TNjHevQjjU2QohtUXLui774yzYIz9UzaZO+9I3Ll48cf39Vb2hF1JdH36BUc0KgWcV1X25Nu"
+    "sEPSj0uQ1H5+fNSu+75//PH9LtzV333//rvv7r2xwbvUXBJ9kVoFNO0kOyJLE+Ms68UAu2k0"
+    "u9Rai5njFXd0k/0GnsWuKyJYGIT+unK3JEe3uPXzVB4DOhyTin2JlOvquU2DJjWMWqojwyMg"
+    "C9mrunpKWsPu24UBkWOIAKRvyD/L+KvM3xC/oIANKsRMXcE3cqWCHWf8lhFdZeOiZ0WYZpVV"
+    "1dWMgJ9pIHNlXi5UJWTQ0UHzE3ava3kSXt13CRGGZjDC9zCTdh+Y3QfM+h3kRP/NYenXDg5k"
+    "BnHXXpEjhImcgj147+3v67nrGDbZrS4fGVNWp1lfhrdRvX34sucGjkJX1y61YpqW8Ct6dcP/"
+    "LgQdHpCnniRKz3VRKC6u9DwPmXmtNXvm3o5lqvFjb6Lu+71RrYqIZor9iOfz44d7Q+/78/c/"
+    "fPr9//Pt7/7x8eV7ftz7yZWfH4/HU+jrqtbKWMZVrtXI3axWqa+3x+Pz42Pf+Q//7q9M/d/7"
+    "GYFkGnV3AUtcGSuR7Ai7bJvdyTBTF2qiE1hEyr0ug82oXMVk4NLd/bwTF1AmfFBkB1pBUUIR"
+    "CMe0G4Gr3fu+H9ebk+tuR/Td+Hj/qOpWvt+9Gz/8eN/FLXamwC4993z+j4wIrZzwjm7shuVN"
+    "2wNGeeKqBRB8PNbj8bifuwoevCgAUM0Mff68gn5Zg6DDSqt7a1y3C5FgUwCuDDJUgLqGCzNU"
+    "Xht3qo01QhCZbmCT3gk3qr2OdkL6SEEcJLikbBt98i8Qf0v8BfEHEQkt4QFewiPjzXTpI34M"
+    "KsBgml9wrZxdlaWh7XME8qqPmenmpugCphSZRJSwN5tRQKycysN0Z0gRg7SZeKdlnVnkshDF"
+    "wyLNYNmjxB4mMWkIp0y7FQvYDeYCWSpGWo7oylxQDgNwtJO0WtIltkVykYrYAMRGN8s1Vd2b"
+    "7El58hrQ5VArPTAXvdZyRGhV+xLYaq+idj0TOJM5hZcn6kbZgma9XXV5bMlFUWqodt9PWokX"
+    "fN6NjQvA/pEf/6p//h/87vv9sVXA99/v5J3ZVKnisa7HtZBXvD1Frry++fTzX/8yMinm3//V"
+    "n6uwdyPX06F73Y/H48oFhsMBAcVKMFL7sRJ0fVuJrboj8nF9rhsrL4JEMW7hxuIuzBi2U/py"
+    "LWSAu1kdXB7RFBSZIdGZ3Y2kq+xCbeynbTXPZxFsNbHu5g/vHwafPN6uZn7c++OpYVUQpB6P"
+    "vBxO1840j6qR+DCYSYAm7AD65ptv9t4fH890orEXrd1sXVc60Q+MqioomM+7dulYZZFTZiqS"
+    "K0OSBcwiqnBStRBz0tOvszSblWBUq+w5Ng4q6ELWK1WgvykU+LH4c8S/S/zVI/744luK6kRc"
+    "5EU+MjkRHFPhjhrMfx0U9IMrRnjrk5MSiIgljaYKlOyiNNPXT6UYueSH0q8fGS7njYaujuCB"
+    "2HmZJ/u3/MB7+OQ6aFd5OHL+h2utSfe1aHNNNrqrm1wLMHE+zo6BXU1rCiJiin9MRE+skxjh"
+    "ZZ5PDhLm1DOxMq/dyFzqCreF/kqtYQw72xwkoohEyNmIZwFZ5rJI1bVjBVJSr8y9i0CuWEnS"
+    "Ho8QulX20u768C5mV+29W0RtfXzJL7//9P0/f/vd7779+OH64bswmJ8q4sv7/cgrueL69Pnt"
+    "myu5HqtZ+Z8e4Jd3vr/jy0d+PPH+jOedd+Pj7i/v68v7Y+sbLny58b6zgdL+ci9Eve9+390I"
+    "OmFvv7//cH984V3XB/hD40d8/Ot7Pz/WMvDnjaXnj/f+cT+/FJ67nltiMB/r2qpg7t1EVuNi"
+    "hCjtK1NV+73QVPX9fD7v2gWQxjWD+Hjqy5fnPnsDoB8XH4+HJ5X3bV2TTXsm28pc7ElnWwlh"
+    "33utxKl41e303JgIGxpl0+LeunfNFQkDYmlyugnpRjKQsav7Nd+FRy12w8+mipEYVZ/CPQgO"
+    "6LVluSKBpbiTEfg3wf818zcXf1b9BqRwIR4Rq5XSuLZkzG0AtGlOQjgciJLlNoQnWlZQ+KOR"
+    "3Aq6no0jGSPAsPc66M7P76jZjG5ux0QZYx2fcxLhWxhei2HCgJEBKSKsS3fJ3WcQLBLpRXe0"
+    "OsIzhbr3Nslp/pQQiETIuaQjL3dkl5FJFrjtCNgBRJHrysh5BLiE4Gziq/qO8L7MvlEFYZfL"
+    "rl65GjtCEZQ6GN27e1/X5Qya8nmsrpYTcBi4Hnk/PzTpUduXCCK678UVSAqZLkB2oNb9/vjy"
+    "Az9+iN//0+N3/7y++9315fvHx3vvvden+PTzZ6zvn1+48Fi593vVx/r1f//nXRLQ3WtlR5qf"
+    "dD0WgEuovfPTp5XBtXbiSQbxZLBV2Lqi3xKq5/s7k0m+rU+t6/nlWfcTCXzq+nYh3oRPqPvj"
+    "u++76t69fv6Zj4XM6/M3hS9vVUBHd+YC+KFnsRT1gSaUxX133U9AiUzUikQusX/4/vcfHzMq"
+    "tLQ5roiIfW+pFz3OvCyw3Xch+VLPTQae+uPjfUxyAXYnsa7V1WJXdTfv2wOo6JbxWUE5fMgP"
+    "HwKoYykOqnGXRRCCIURELmokymLSK64gnCdaA6Mwz5YRRDP9vgR+JfxW/DPgunaASVC4mKsF"
+    "NYUEtcvROiXd22YLkJkwmn8mbf6u4fOmS4duYGYINCrvCeOMkGZ+/tx3A7EyIkvglU4WP91s"
+    "ZWYNXsuR1ozIlnPDZi1U6GRwLZfT67pu86YZjVmq+1MyT974LLuy5+xjkoH28IG7bifFRGYk"
+    "dgnQCt61mbFWOM9+5dUlthPMQLJ6C+wuRAHGPNxXMsy7Vd2Ft8dSAQGTZeP8gkKP0GU8yfG4"
+    "rns/26nRDFCt+nh+7L1Bb1hvcpmvBoZIdL9/fL90cQUjEVfE9axbH3fe65uPH+P3//zLH/7n"
+    "/T9/+btf/Yn+5AuezbfP3154fIJ2PD6/8XkvP0dvDN9lC9lQdeVHIOLeDfD5vgtqaGITpBAf"
+    "sRyX+yTj7iTI3NTv84ePvUtYi8FYqSBqr2DXfVO2p6L+5Z3XxWu98/uuuhgt95Xs6kg8tXfi"
+    "8c2joVpxdxf3vqQVgQ3h3s+P7WCuExeuejy49ZpFUcRa67pWaj+fRbLIqg53fgUPiyOiWmut"
+    "a41pPhnPqojxF7i+DRoCanK9rGAuWwVnvWrWpGSCxEFSjRvBnWdyprFNeUcJzpbYpmw6ZAtL"
+    "chT8r6m/ZvxSda1YHZd00UEWuiicls5CXhflLUWs3hXm8lgl1ar6Co40E29uWXCt3PfTIQU9"
+    "XrxdDVjak4FxYrmTgPzpeN9txXt3RHZvkpnMXA2xlRlyxxGIiKrKiHvXNfIvOeN0IJpgI2s3"
+    "1xIXVO2PWrJGvUVAy26jM0X0x6+GUIyo3ispVQYd72oRFjyWoG9usisShbbyLwwnGFEZrsej"
+    "1FwRwt07Ar37uq7Idd+bYDD3rXVdAN8/bifxMbgiW11dsXJdl//wda33fed17SohWozg9ZZM"
+    "de2AtLfyA8Cjvnnvjx8vPSK//Pf/b376/vrxy+cfftA//ePPfvmz59vPdf/mTpa6auf/4TIo"
+    "iIg2e7ELeSmTkdu5sekQEAjtrTxfDUo3PYsXGKtaHx9PdzEsZOTzY6uwn7dnhhlLjbvK1cbz"
+    "4/n88aPfb3XVvfdzq3U/73ruaOz3zQruvN+7PurefRc+nnvl46P6h3s/ix+tUn581K5mwOJ7"
+    "IrpkUVEGezsvY5UajdlTdrhhdgnlG3JSeBn7riqUIIbOgKq6M2NdF+iTHtt2BgBS0iUjRD5r"
+    "bEdebCKMPj8bpP5qCvS7nQx0d6AFVjSEUgCfoD9e6y+v/FXGI/QpYrWW9Mi8FA8GuzMQhgwb"
+    "zOlCGsxcNjrZZDtiJEd6egPsd2yQlakSAysTDXWL3g5IThWpJvwyn+SY8GujI4XurnZgt1xy"
+    "0OMh51tZGun5cFwROFulcXW5Vo+MXI0+wpUmZtOWZM/+DLUrIv33y0BMaPcubX3ta7CWbfFC"
+    "5l2V1zW+LftDfE6GAR1xBQkmiYYz6N3JN1A9V9fH/Rxh7G6n2Ds0CEF0SdWQAtUdAw0DyaoS"
+    "9biW6UrIuNbb8+MDUCauHDfYrmd3RQQjtfcjs/bd3e+7Yn+sH353/et///nv/+c3v/vvu/cX"
+    "pLp1/5j/Z3BNKLJniJ2xrnXde++9T99IQ83MByWQsYxf6+qYh4OCHMGeDAdNOAk2M30hENm7"
+    "eqSNXo3Ok7pW7vt+7c1J7hIjGOt538+nv4gW47o+VePZ+v7j/ti6S1/edzfWWsjw41DVEVgu"
+    "NKukjshqvX/cEWFiS9dkutMMRMIBHr4z7+e29K5cMzMyaXTvutJuh3mc3N0SAe8mZdW+cZav"
+    "tWSM632QOjihJ/OYJxaJRm2Ekq1PjZ9d8aeP9deIt9QDuiBj0xc6iYSBFEjDIHu2Gq2uXTG3"
+    "K5JHDGKlIfiiB2X4lx1thnv6YPS9mYFRoaQ3aR43QIb1jF4tnd5NZCaG12G27Fgv2jT2XZpD"
+    "BGqNo4cE4BW0LVbedPsGtDU6PQWqihxt1wRbT9M7usvz0XKtq1s8NpIxuA8L2UEQI9UCWb29"
+    "Ho5AcObXXcq8HP9krpiRepFh/c6V2a2MtHkp4yKjSxlA0PUpGEKrO4L3fTPYXfd+CiybKNt/"
+    "sDO590aN2jwig4vrqm42ns+nxUeBrX6i9/P5Q9bH5//xL99+/8P77/7vX94/5v9nraPlxWJE"
+    "ZFXfe3v6bC3J8667xs8ALyrvMpdK6pz8BD6f2/O30FQ0u4wpBiNrW2oTPi/P+Q63HFZHHbxT"
+    "qL1/W96pWFkhK7bALRbiy633Z1Vxt+iJSBDBj4+S+tPbIhUA0dUtR8LGAuwjx8p15YLrbVoy"
+    "EWrd973v8m0wusjBXyAzMsMu+vHpzgr4YFo5wsY50YYUO/Q63yTST8w7FlQaDg6qYwPVeCN+"
+    "ea2/jvwL6i37LXk5hJV8RHxOhS8P+KCflUgw2mTxga4jAmtYTU3K3oqMJNjSdjoeX6CuCW2w"
+    "227+KQmipStXm59tWY037Idc64eSI+weJ4RDf62EIfq6lvVSAMrrIEt0SHLRF4CvBffDtHz5"
+    "9UH5hQq7H6Rea1nq47PmcDjRVXQsFLwlTmuupa4uS6ZdgDDmy7C0p8twPHjIVepyuxzYfUtt"
+    "5ppn6RkZXC16a191S7prg5F5Vd3lSAtKvRlihoDMFPreH2vZc1R7b5XU7Q8axMfe/gKSslpq"
+    "Zdz3XbVXsHRj/4h/+n++/e5fvvnud/m/k85TPKAyVTcyvI9o6mlJUITDYF1LMEPqto8RaGHv"
+    "2tV+hId5Op5sug5zKq/JzC7nDgIZ4xq9snb7MHU23xZ2S4gqW3uyI0q8Wx/VX6qfLeSCFV5B"
+    "B1Y6guBxJYVwho3Of2JlQ6022LlrlO7r8tyYtcvPjRk0Lbmc9OzRGyHX4P3aXRoAkNEiDTYX"
+    "Lb3QCCBDoyQbZpZT4HwN+qe9gmhuKVrfQH/ylv9LXH+oitUJXd25leSnlQ9pRch6dc6B4rcV"
+    "DhInVqbbYKEjgjEs2hd5uk/TeLgd5gqlp3SIsUwJ2q1dE+aqVmaaGplhtlT0gG/gJlMW0Hxd"
+    "+ZhSgAlOsJwFirWcWR6MlZbbN2M1xn0JMlbuvZ26bPHeiiSjKUGPt7cap5uthRFr7dpiWyCO"
+    "jLvVwRIZq6XSdgkQZMnpE5PMCDHTOkqsvMDQEWMqLENrtd2UMF2MkWoZrwToMm+d7CZEBa5l"
+    "PX6oCoH1uKzkg6TeMSavWGv1tl4tAdTePamARgEJdqd5ate97nrGfdcXffz48fw+/9/XdQof"
+    "dKskZoi0A+aG7yIufyuS7ZsO+82IvFJCi+/3HvHhgRYTsHGvJ7AZCAqo6oxsqhzGkeE6jxHW"
+    "LZVaCHviPRtWoIkiivGs/rLvD+FdvckCBnUevKvvXRidkwgk08e2+57dZcGTQ3osZsjkuuIQ"
+    "S5UZK5fFfaD3pcyV029JZOxdfoF9+Viv0+0VpCsIvW4Qf82+0o5v7vUnDdliN6qh1h80/jbX"
+    "X7c+RzP6U+alSOAir4iLeAMYSyW1HFs1+14mwGNminvfEWSgun1yETyhrQKPNcKu6+MxvrtX"
+    "ZrXvKbcGYdnWXJmYnz8zebwXGs0KIpc7rkk2sXeni/ad90lritzq0Rt7WODbgGwFGKDzFdmw"
+    "UJGQAszxN03ereZoaG+aqwqksBH+8EPMDSlWCf4HqimhW4g0wC/QGIANc61riEtQV+WKlnbv"
+    "sKjS7Q5jUIW2oqojuK5r90aEUwoM8QsfBK1mIeK+t8OrvFXq+QWCYsbyUeWSNiJ9ZoHa+9m6"
+    "mSyUQpX92LrAWLj2M//PtJcKACIjk8aNa7BGiohHLguHgRRwVyeZA5ZoZHzsfsrWMKyILlnt"
+    "Op9L0vicNkjJVVTORX3op66B49l9Sx1sCBFNbHVHbKoj7hYj30s/tHbEVnxIDFbprvmxbY4J"
+    "4tPbta7o2iAbtH1X5VARJCPBXLgeSSpXtDpGQoxqVMnRoUfLNd1WV1vneqa77HHrIoArZ3Lt"
+    "TiwtV4jxJ5Lhy80moqZi4bIBo/XziL++8t8mrxUMXsInJFtXRAAJLBsM7n0ud4+/sycUO14e"
+    "BLdtpsY4H8xVDPN49CMI1J5sXDA8DwdR3Q3RdgnHQ3fLK59drmkb89oBTUYD1k47ALnQVbUi"
+    "p/9f4WgVDXTAkSnHUGw1JShGAwU8ezeBTN99KyKknOn6bnhEhJXs2vgJfD5yJakOx7k02XIh"
+    "L3lPRCLi8XiQ6N5OocFosLzf66ZalQaTqTk6kYwzQlvrsqg2rxXBXRsYcim5WjIqOzDe0YYi"
+    "8q6dEZmraktIC5sVEBzD3rWhyshddT979y1uYHr16rrvJ0OL6r0dvbbikf+vtMmkI6NbghwJ"
+    "u6tL7RGURSfOvEYEPUEBGXze+4ZusRBSZ9ADr0x7xywYjYKmCJ/IALR3MNUkr8e11aW+ez/t"
+    "G7D1hWgor9VkCXfV+97PqifwDO6ILW2yWs/dBeyahjaCj5WP6wrMcXStC1IyAGxs865WMIJr"
+    "5TqepOpupwfAa1ThSAXohazxo4KoYS9jMq6sYKfnVWPdn/7Zu6RRQWEswinY/2C10p9l/Mdc"
+    "fwYqYMJ9yuFDLrA7ZH5VhmCAmf3xg1bJJDzDQ5k1APVohkEy1pp9kbVR4w00W6ZgiVXAQ2MP"
+    "1zzt2/ZurWWxh/femR66j2LjJaiSUH06WSqCSModPtDU6CJdi3XH3D/sGSixMXOnUUU6UgUj"
+    "k7J0edCT9GXT9ir02caNwjuiZYOUzgLAIRidM7Uut+jDriDWekTmx/M5DaBVfN1BC8QQkcyc"
+    "oQxsH9esHjy9yQTSaupAELjvDchzolhr7xqvEqO2Q97dh8qf/wDkEGTnosTpMNStzsyuL4KN"
+    "utFQ/rc0zCkjow0FIBraFgZeV1ePdhzgSqlzNEhg4Ga8Qx89xUSMZ5QtFZt0oneDcDFqk3qs"
+    "3GPopUcaTSGiwAKLrEZbR77iWXV3y6VyxCbv4H3FF3WRd3c1Rx3PAHAtvF0ZdgIN+nRO+jim"
+    "z0Y72XhdGQK6ZjLVssnQVxnl13IESXVrdjQ2tX5tIMd1kKQRkFb0zE9EcNQBx51gYIAVgdIi"
+    "//KRf8f1R9qKWsWUUrJAchFX0G9v0D5uTSclh4n71Bw20Aw0LXTMsHPDdaoT2PyLO3c9TgRL"
+    "e2gnzf228q6JJwrzNMeppdFayRVSMMYbHMxRQkt2aaqb/qtMnHK1KIq4xuZ4enCGGIW2nMsT"
+    "Ehv/OMGE1jZ2qT0ZjYiSdYyIyKEJ4TWVftnY+hWQXdW2Rs7bazMpFCvv2mplXvfentgF2LWv"
+    "6wJCLbffdlVGrJWXj0XH/HqIu6s0YI9xREwkVaY6NaE8DXBqRcfBkdOkkFvd6PHh2LmiuFbc"
+    "95MEUGRHIhj3LSCv61P+t4zMcJhFAWA0ZoYUGa8QAByj1istC0RD79CPJUYs+1tcQgOF0aRq"
+    "2KpsUUQTDd7V80mMewueft2NW0DELbV3DJACYEodV1ZQmXfkj+zKbMV9xFuZGZThXGvFylxr"
+    "vTjJVb0yH4+HVfixlu+hrgo4B4RhRW4r48q0sW91V6lNpOgWM5paV2aEDyYcSmTEzF9inp5X"
+    "JqBvFEhIpj9AN+Uh/CLwN5/yb4tvqUBlIYmLkdQCAh4dOJPba5M25QJCg2slI+d698D8NNwB"
+    "GXzrNY/dBddKdU+O6WuZFZHrceYCjEjI1+wMtOPAQEatZi+Iz+tA2OM4BqH5Hz+Y1WqafT3/"
+    "V58wqt5Oe5iImThoEh2v53ysK0K02XBwQu7e2rrukXi/OCZzYkPIWJkp9VQ9E5w1JFA/4dUe"
+    "h+MM7dDoteYaFXTvDQag2XbbwNUYbHVPFeCRT2ZEpCtIjfsS7XUzzFPQZEwAgxQiMmLvJ5nd"
+    "/jwbcAR83fczeNXejqNJ13JdQAipYjLyHyYzxTcQxOXvxjxuzMBlXuDxVlqXs6KDP+x+Cgxc"
+    "ESvZ3enVFWI+u4jdbZaRfzQ7+65rGTPz6mAENGk/gudLQZQBcAwIBVRwE5XrHf0Bjcek26ip"
+    "cPEZeFzX/KqDMstrPRi8awOMdSHy4+Pu3Rm4Vj5WXtdlOVNEkuu+n2fT6NLXQxaKihy3oeXy"
+    "lhLacGmAUkYeT+0MnC0s8PNl+cNqBeMz8Zcr/pJc0Z8QFCP4MJhifOFOD5otrslvORNkllpC"
+    "v9RIBMjllezU/POAo/X2eFvLSsCOGXUlhpMT1XA7Q0Q3upqg0EEnQiD4cnczMtZa7cj14C7d"
+    "ZZHGV7BOV7vFAEwKHitFxpjEZn7p4pNHgDbvyEzPBpQJrEyvab0+8JhJxMrFA+1SDyb7RfPt"
+    "7q5tTXsPZXcUCOYfxQElqBW2TwcN6Ld3EhG5lveAiws9M0t17X17fDWaPEyNsx5LklD24wx8"
+    "mivMBoFX8R1hrpgiyXDAvaVENkRL2i0l3yTt53MtuztZ+tj3PQbD3vnf0sdCOOCz1A1TAhmR"
+    "vV8g48hcsQgpgVzXLf6wewe3P+4wHwvD+S35Yr+9p89ocUtcKeFal/UG9s54P+xcGxGNEUnQ"
+    "ivY5mULkO/BOPFd+SDvULctIPTnw0bMyjVDZRpzcexTqu6vAzBJ2vdrvJLHWylh26ku4Mgn2"
+    "fYBX4TUChpITROsoQThGowhH4ww2aYAc814FmdS5TmfAmqHfrvzz1mJfzJQeZnRIF4PqkK7l"
+    "LW5ZeUtx2TXXfRwIeKlDpsXtWYQey/5MpgFqn5FpLm/i/X/sVnflcM5fonBv8+MrUq/LgM4M"
+    "ogpODj2BNunGztfg4HWWY9B8L5ew2/lVQIOGGQ2WLH0WdimYoOKgh4Rew9JrRnTDCF6bHLUb"
+    "gLoNdhbkVtMS5QAe6xIaaiTb4VjD3BEVhvt4YO5g22AEvVgREME0RCUj1NVSV/WuiIgr5yv2"
+    "qiJyV02KtXA/byLJzLha2Oq967wgRzdKE/UJLoGIKHSrq6p0M0JKKYyC4ZCSnxGOzNwQtJX/"
+    "7QpPWT0OtKkmMrtU3XHqQzckAVyRIG/oXfrS2kQTyQghyIzzSHG2o9XmGs7S/8weegodTHpW"
+    "jkqJouttWchueoMRGJt4Z+/kM2BQ1ZzdkcY87xrT0X3Xvrc3e1WSm0MCiL13g/fu7n5c11m1"
+    "zcu51lIrCEuIGAGiNBJjL10xVfE8X2dMLUJJpH/l2VbQf1tQOZoGx4rpF4HfXo8/yXwLPRir"
+    "FeglBWTgI0EvEvRK93TWLrDWCrJ/stc11ss4S74+U0wUjJkkvUvtUaVf/UFeznQ4Djcy04tZ"
+    "I9ojHN4+G46ZrlS3LCNxSk1HBM9U79QCnunNk7CuqwfwFQRr17iTOAIYjffQa+Kz3xrwkW+q"
+    "sM0rI2KlvxTnUXH+KpuEdV1XzdgDQwa3qtF+h1yiGLEyq8v/ePlvz9i1e5oBVE3SorqBl/vM"
+    "W7chnLquzlx735F8+UCBA5AAgL7eHpJypUfjQbV34q78mbXl1WxVEVpXdjW5DPONjOvxkKbN"
+    "9bNkiH/+wwpH8ljYGSdxAucMm4pjVq18rFXEF+FH6Em0V+7gAkhv6vsKT6lfy712jzozjles"
+    "CIOZ3SdyiCHTUsCCajpttrqArX5S9+KTuKkOci3zk3wTjoBmHCot0DVFa/pwkB/3LfDede8e"
+    "7iNmauqlTHeji9LKWNdyF2SE1kgI+2WzC2IYSK7C0vRGC+UaHogmcS1eGVckGldwlX4W8edX"
+    "/LbyFxkdeitF6SIWcTm8ZTIKHR1uhfQAHcOVocSRMU5U0yCb5iM+2ZwedfWQuixItmjS8g9/"
+    "6WBMgmzrxLa0pJXpFiAj6NwHW35G6Kxk7C4X24IM1JmOYnTldPs9Rn+e9w0guR6XIR67TeKG"
+    "zdhGqWWEt4xHdz/N1h46GS0j81njZZXPjlLvKnMIpQJU6sz0K14/aS6gAwCyNGdwWdZ1SRj5"
+    "FJPdZam5myyhNYGJiyOLMPOhHQHvp3wwLOnPxyNaTaVqJ0ukxPvuSbTISMbjkREuGGtgDNOZ"
+    "lNNXpaoqn7j592va62oBvK7l4ClX9t7VZwbBay2pSt0Rd+QPu94tXpe3SgrBT9s5pLsO6bdH"
+    "j4MVsd4ettn14S+9VpqN9qrJog6duUmTRdWVz8Va1JUFbfXHc2/nuikEPm9HayMvh3R7ssT2"
+    "h0h202+W3wjzEIFww6bu2v1YcSVy0TrKriEz7d1VqhGDeo85uBr8JK4I8hQAa4W6HyseBk/e"
+    "FcDa+lXrN4/rV+ifbV0e+1UTyinXgNn1C1IGV2TYg3bUjt7B2is/myTABDXC3hTjX7Ueq9UM"
+    "mqWuqYjh26CnzOexUnHb9eEFjGly9x6SsyrS0bDoHiLnVptiZyy+/6/rMkljipBkdHVDe9fQ"
+    "SMxlnSm6UT4ed48ITpZkTI4jIrNbVR6As7tKirW86KYCZxJfXZnLV6j/2rT/NzD0AudatLFo"
+    "FUyBTrHKEZ9mm1JC5lovTJ9bEwSt6t5qRGigJt3sXGmw1gmsw6QuWqamu1W1n1aa9mDeojug"
+    "aEHoaw1CwL9i5lqZ5mxRTXTX01wP64qr+vF4y7/PsLq8C9e6yCkY1koLTQ2YdZ/TTs1i/rD3"
+    "U5J4rXVlPiJWRsB7yxk+OzrOVu9hZwsZ0dBdNawIxjDNpJNb6bgSp3IMD60JrNQj+21pZQXu"
+    "Xc2s6lyJyOfHvceAGhFkntbzHEIRsbc1cLirWsxcBPeuLg+uvOHGteLzp8unvG9ekc+7utk2"
+    "bhBBjuNklFVYa9kEbyzT43EJ7sEWzMbdWsIvMv70sX4lfRuZK7sru6y8X+DyNTgkvbOrGwn/"
+    "mGy8C4n4Ssab8TCnRCJhnq4P4Lsq0ni6iEyNH489sFU3ulYsz9IIxw7stRCD1RWnhzQy5hgP"
+    "DEuDo/Q8MKhuoyj8U6qaNrQdwKX10KfUxuyTXvbG2QWU2SrdFSunWY/p/8dtZGdtTH3MmSfZ"
+    "lj+rtVYXyrgP37LXdWm2vnnWyRlk1b19PDMErrW2+r53vQrdELxhUYPwziiC3T37Rhu/Y611"
+    "OXNKTAwUXo/HyoXuHRm1x09KZMbym24bpvfPMzshpKrnfa3luRfZDp5iLA+u8++W5X52h+l1"
+    "75HoKpNG9p5BlRBc60l9KdyNFVzEI+MCtLdXpDGccJpb4z1BHi2X8100SbeeuB0EjMipFkjg"
+    "o1x+qwJxRS9+ifoIIVkqaL2/lxAN7Y2BSOUpjGwi5+zY+hgPGNy71HI5VDXKdBKPx7qSb2/r"
+    "22++wWkLu7S77627tOskDDQlXYuRngBjrbVLdXvZj3UFIJQW44rgWdv8OfM3Fx/sqzpLKVxE"
+    "QoQeYdKOjJjHga1fkUkiR1XgT3hsxRn2AJ1UNNB6VaudCAubV75UmxTKcHMrIHNFKUZ56yhg"
+    "KDPUpe4E+0iaq5qMtlWb6Vs6aBlT2izTonVddC1TZRdEo5HDavZ+kzErdAeae8xS3bPLlEpd"
+    "7hi9XuKEANfMOLDO6KK6g7mW7XT226ig7fj4GKYHxEBecYH0d3E9HpkGEkRyESdy3RfGRDiD"
+    "83OLgRVZeyezSxJXLLjHuaje0h3BzMtjpxKIKHWhFROsN8GOVWytsHEqBHmI0GZfFucWiihV"
+    "9fbeLiPUfV2Puy3thpm++Z+vtD6TYePOHNZVHcAaYeAM3RmhiPfqj22cQhj/tgLEsGkOyo0v"
+    "mYGEvW8QK+JxXV4ejJYFGKWDh97VMdxEIhmZj8ejQh38UD/JHikvd2E377JhjIi4HkvN2k7w"
+    "M9QNtcuZtFW+U+cXdKiKkwEymCuuKwmti7137wLY4vOJ+1Zk3jWpuw7HyYx1rZrhrEVF6haT"
+    "68qVlltOQEnc/an5Z+v681zfygC6SEsjJUhXDjPaFM7ePaYmnjHPvLSWBdrB22clr7Fw0ODy"
+    "8tXkulrSOvgoH2veB3cfJ3Qcgs8gWKW2vSzLTo8gMxBWf5luza9/1skQtLiao5kadLr8/swR"
+    "sD2hOg5eUO41wjNlCthutg+keuTlM3I/BOauwY9FeMvt2amG4RORWWW/t/yf9tyC7WXt1Au2"
+    "/t1bmCwSBVFVdhv5i31cF1o9M5YpBSNW5BK4Mq3y2b1dInWJmZ7wnaZggdGNxYwJu4xuOGST"
+    "cP+8I6Isr3dBkZdf5qq2LL/LjB5u29zdiidblf+BIqf1lSTmixhqbcbh5YexKBv68TZPzsWk"
+    "9QZNoNuTUhcCdg2kg92naXRegzTcbYaqEYM78+OVCBhBaI904AP6Ufpo8dMjPz1293NXtQrz"
+    "xY/k4zyD1Sh1Rvo1nmbvDAxfAqax/qKHL6u2n7mrq3pv1UYrAH752HQWB0giV8SKvWfa0Wf6"
+    "bdKLQe7GQEnivT/d+pPr8edXfCNl9yJd/SSxMh4D1juZRDiw8Bh93pC6wrESa3BNMQw3zzlP"
+    "Bz4s2nHquaI2TvVsEU8wmqyumfvPxuCZdc3f5h6CGQduY+lrzaDOfspjMrG8S5NMekyGR8jl"
+    "ZltEvmr4MUG2VZmehM+YLNjdNja/7NIk17oOpNbGv2n3O/gyvSAsn3qMEfYkTsX5i/xPrAFU"
+    "sDtChmBtr2TjjE4yl0qjicoMJhGBMMV2ZU4aNtrzLYyDn4wcy/vyU43k1WUze5xgrCWxwVwZ"
+    "SdXIxvxlPUdeFyuv438uoa5redW8950rujeg/DtiDWE77hkam9OsjPRzEQIzEdGRd+vu9pAw"
+    "zaG3OLjFSLtGTnDuiVuGjCaahm3wwnNvTLmLoTBV23zf1WV/1g9V3zcqWRdr1uVo0UsvZ8E3"
+    "VKW9ZzJvWT5O5NaIXkbT4+F24EyFWuzpoCDxLlUNg3lX68SIuCqyNNIBSE6ZNZ7SOjC7EMNs"
+    "bGlt/YH4pxl/SFy9oV4ku1eSXQxEeuQ00AyVrXKgZdtf+ZL+T6xZeE28WPrzrBHsxytdbGSt"
+    "B65HcIpPjUxdaKMZ/CrVnk3AT0TNFvcBEVX+w8ozqJu5jsRMJc+3kFaDRXpSPQul0T75Do/o"
+    "gzp6pb2Zdu8D1r+UTxk7Wyd/1OVJHwvmCDzp7HZHxyFoaRxPGk13r0wPAo3K6TYZb83ydiuD"
+    "GYj0IKatSJtZlITWdV1tPn1pTbHulJyq3j3hodi13YVWtbUZwAwCM0xJ6YjsSYZbxKQ2eISX"
+    "y3I67l0GivjXH6GY9rWIgHnTkQTweFsRyP+6YmXsXY0xJIyB7GWH646D4Xp2vd/bDZCVro91"
+    "UVgv9Z41aPNBIoKIierwJxI5E0745s3MyO5OHT/SCszcySUZ36H3FfnpUvDWBrSbBSjiTLlM"
+    "48VIdsMoSStm5wo6GZYeOc445Mx9MmLZzQpNIJvEvYf06jbeT5jf/SOd//qs+5dNzNFipMEv"
+    "wL+4rnl7gQhG62pFy1n1PDpMjm7CGaODigzMjMTvzN67qg1R9YgI4/7hjJ9yEOr2NkCIwZuE"
+    "UalHFOmt/1jmvW6Y6NOXGuQI4zxZnKbMN8+MShWZxRYRaw0AW3BKCK2LUsdAP5BpmDbW9XY/"
+    "dw5f8qtx3GK2F6/kFAJxLNNnsHJSiO3sZ8ZJWk9JwcyL2m1bVWSqS1X2TkPjOTuhc45VMy6P"
+    "U5JYV7EuhzkFo26vXnMFz2wBgk2a0SgTOZQBMnPZqlF2FQTC7b0EGZPmAMqwRsBKfWimg4PU"
+    "X9nducKL+q6t3urbSH3Xdj0isMq/v5IZY1bArIUuK9YA7RrQOcDIj6oO9nSC5sjgwvi0hCI1"
+    "94mAXC6V1SqvwXnY3LTlWBMx1rB7yaEBUJFREDOe6ndoL2BRyQ1PcuJj39tGsNlIjfEmFzUu"
+    "uZlReY1m0vgRzkKy/CZbFFTl+PGo3fQcqACut8fySxuRI5WcNyUlFY12823Qgj6dgu8t1qP7"
+    "z6/HH9llF1xkFqJGNEtaOBm2f7EbGnrGyLDts204acWPY08gyzoGKCCQl5Oc58CeQTSBIx7s"
+    "7hcKY5bwPNioV+0Oero5oxSLja2H8nvWck7imMwiTEc446hwGioNp+8yQR46nBM/fEDVZuBU"
+    "ta7iJVeyQQhrTl95xWpigsT7eZ/fmkPStjEml9VUoFYmqYm096kw8B9dsTKCSQIr0ic+87Gu"
+    "1are+6QOMhlXZu9itYw6vFa3GTWSigxfHrMlYLbTvzaOmKTSvWPD299wJqpGSe7xnq1oYSdz"
+    "BJgUQ9HaHmi7CvG9DhbRD0+sIoNprm3+/bI6KqwOdxiuyliBoaNEBjN368v0ChyZWQRaec5F"
+    "8/J9o/RrMaDTZ3lLeRZ0DhkcPvjLMKGR63j43NAtVUZdEY+IKxHo7ltodazLRW/tnkCzXINi"
+    "mkplerzHlXB+dECceWPDH7vlVDAIoK1Bd+VzXbVvlyvW7oExtiUqIw4IerZeYQ0Z+DPy161f"
+    "P65fMC51QNlcYKgX8VjLCqZrpTUkV6ZhSjkrZdA7Krdt1h4GW5pumd1drY4YR59JJgN7Po51"
+    "TgphGOY4TsCBL83O1isAz7Re+gpwliVnQQJr7p3HW/3SME+P6qrKkgvPrnwsn0TyNhp6/ETd"
+    "J2bltUs/lCJDsCNrXJp2FNYLUr0yz3+U4xWIyUjLZKjfMoim4T4A0Ivxdj1GYR0h6L7vzOly"
+    "gvnaZwXYo4mdeiTDkqdVJmES1tIx06opBy+WLS6Y8UVOUM4kk/u6e9UatlgGl6omaI5JKsbE"
+    "v6zP79oZIWrvHWFTdgHd1QNKtl23kf/wklJGCIHuIO1AzIgMYzq6Izb4XlsRFjzJjwHBkofU"
+    "rSZz13Y44Nd2zXbUnOX9zLjilfJz7gZC4a5GDFaAER2xV/TC7troLe3qskH1eljy2SQ0Asx9"
+    "CBXTb8uNCcZRhNhiVRs04GJQkhM9unnscgKw9/aqbtRjrWo/fx4EojHW35k3tTbxaP7FWn9O"
+    "/AK8ykpTXIXHCseIOOAzI6saE8DjTKWZktEgZn8uzVHVz+HuXtevN5xa1sJaEbFmrOWx4Uka"
+    "Fo5VXfBH5BSiBnbVsQ/w2JWPmm1Kdx21F7v7fGXUnOx5sqV69l6ksw4noRMu7029d9RLvGw6"
+    "Vi/f1YgJTDFBq+dfDEPxRxpoi6IDJcb0ypPz0Bm8IlC1iCTV/VgrV6h7ceLCRzQEBeWILB/6"
+    "ppT4F5wNqJSZK7NLZDqLiOebvu8NhuwkgWYPEbk9rEXy0M4ohtKWjHVdQq81eH0qXLq7cvYl"
+    "sXeFCxaVpeu1t00jmVRXDhpF6umCgpn/JbMb5X2PU8WIQKQ/4qpcq4ln4d2ULn9wQOTlHPU8"
+    "y95zgzHXZaL3K4oSdo1rRr5MTo52i+IKD8ReaqH0cskBgpv0baBc5kHEdVXr3vu+nTZGByYM"
+    "5pNwNdcm9BBHmhyNuO9xjM8mOrJK5pnvCRMyo3es6pYWX5d5/4r4ejYFCbRFTza+ResPgb/5"
+    "9Papd1Y9yBAucnV7FhjgStJLrOogVgzAyqvHKxPVZgn6VCppvsVInLA9lcLn99ml+5R0to9l"
+    "HkmKiMXhpVv5YGSxh3tHSGZpBFfaGd7sbo/x9eq0RyMx6o4+ne0LB2tjmX12xhOafpH77pWr"
+    "u4LT5PrHm6mh5ZMEMyyMyIhtRNvxTruRNljCnsE69YVPvRVpGc2geMLdRwtw9VFV8+cDLp2s"
+    "ENSr+z7ByBGWdnsK21YTlQrE9phkXBU5OxX1K5QvyNe2ZWJtYCzO2BWDSneIsnvK4y5/Ax7n"
+    "hKprlz3YJ9RC970PuDo1TBMT+CP/jmRGNaSmV3NtXaS6OiNiRYMfB/JjSf1EXR4HUjo31YuT"
+    "DC+KiLPXsfp7kK9WlukYX468j2qgxZ4hiuqsPkuzHtxkMd7d/K5131Xd3dil6j5uarbi5c2w"
+    "ssg95l3q+Q+YxpoB3rf3lxTRwjVsynEpOBz58XAwz4kOHmbqIGwCmENK+Bnxb1b8fJfQK/LB"
+    "DPQKJ+84234W1L4/D8b5RZtAYtQw967d5SmO95lWTVZVNDLSs5iBJ2vCHDSkCPgqMxbELcAI"
+    "m86LO5FNc29GU3eXfbjbHtbj08ChcHzdo8ZIZXVIWaqO+T18809gd5fZtDGN87nP1aqu0SoG"
+    "Bd0echoMRHRrrRUZtYtH/1jdVcUYBuWKFe5bqwJ85IUe87OVJ3oVS5Sn7BzTIpunyqGX3lV9"
+    "259KoHvf981IkREolXHRHPxGlOAVDcnMdVeFhjVvz6mlEHvb5gEfD/Ear/Yo0n1RaeToywDG"
+    "zCWIK553RV4+Ezz4CMZBvI3ONP/zGaBDzqRPQldgBaHOlVu6wdtZkphbLhoJqneSg0MPnqH3"
+    "S4wVNXioMErqpGYICBEDjZweE5FpDMoMxSIy+OwCmCtu6aO1gdIIJwpc6+EVESbwx4V4f2XY"
+    "HI13yemEcsVyAM7uS1SmCpOZFFi7M7FiOLLoCvSVM++OiC6ZFxqnY2fjivgt+etGRFzSEi9i"
+    "AWuyAGZnu64LVpy5QO3jX/VW+Tiw3aya+9Ho+c7cvEw4s4+PwUCO6sMxXDj6psNjPZ8Izy0x"
+    "SgAn3E7xRbZhgOPft8EdPpEZtCa5ecik0HGhGNiHFnJNhrHrTHOeRS8XXQo5+JG5VjcUqK6t"
+    "0Y2NOgATFVDH9O+jwl6KK2OrM5dQ6MqTM+ztN3NVj09sOrSDF9LYIiZNYndHPiwfkuyyRquq"
+    "y5dlIQCWNhnlY5ejpSnptTbv6rDsC8qgyL2LajJHTtrldfSyTbVE4lpXZEDI4DaV+u5XJnOs"
+    "t+ou3TaLxqRWZKljpfnJGex+5n+IET4dqi4AXXwBk6Kg9yoXnoxBCiVpJkqOSsjJmsspchOm"
+    "jPl/o1Y/0APa24DwYMY95FqrhY+9PRTxieWUk63myoKe6i0oHBPhnawhWN4xYhJLZF0UZikv"
+    "ycpVzON2FhV0FrsXwpM/JnR1hgdgDk/pYDjhAePnm6NiQXmGLY/mH2f8yeIDCuIhvK2VVKoX"
+    "p9vOiGCo1bXRWisDXBEvDfNs7cdQJGftvjRSZzyFs84Az2jXk2qdX3l21wat7BoqV8tOA5tZ"
+    "RjmM8egjw/tknpPFF/hPwlGxMs9RQ6crvSLqX3+SDOYl4t5bUwIY6c4p1P2lEBJu79kFZi6P"
+    "JA3Tr7a0tHcZqT/HupWeGCz38sAJzFhBW38m6WIe5mALPDa4yDgDvvnbSiKx9zYzobqYueVV"
+    "jcOfJeCu/QKL5gSUYPQtQJUBLzpt9qTcnAJfBgAM9EMmT2Rk+mk1ni4mIsDu2JRYtd0bZ8IE"
+    "0ECgVb1tAgGBVv6HZZjr6JbpNOeYn5IRu/U8cxSPoAz4dMRWnOt8AAieoqbFrsNVFlHdAwaL"
+    "SZxWxC4XpYzgtl36xV4dKWJkRl7rrr2rFaHIAg7JkLPpJnrgZuZIzwZxqFr5KlGnzPcT6ZJ7"
+    "fiNybgbRDspwyAhY1dfKt8fl/+i89jxYRUP7wF9m/vXKb9DRWsIbGero9kc041L/W11BLj+J"
+    "3QcKNSD9mvnnMF1PGR996Kr+azy/GUqeMWv+nOdomxQDj5r5ChgdXXaDWOsKej8/uWF15sCv"
+    "Gur40pCRDlvcNQxfM25eOd1nHRWR667SQP0guKxzlTiuVQBG/QgZscjYXfJEPL4qKKx4MOAF"
+    "UK71InLRHe9s4NMCtlLHMbH1CEhOLrCnhLbk+Z2xBRToLj/z1VtG/81UqGmklNffGZZzwCk7"
+    "R8XgPh80XbCCzjHWiTu2sVkk1kq/xoyBH+mkRo8aQQFE6QCFoqEdEZxV02w6SttDgSo93h75"
+    "7xGZ67z+g3HBkAHTRtwm45Td1wpIK+IK7xqbmZhMSgIo4K69RwDA0QxIsZZ91RO9YbNRjIvh"
+    "qHs9Wpj5x0uTUFXd2A68aG1rXCXbR6vV4N7dCI03eMzEcZrAryknc3u9GrJjXwUDyMBKK96A"
+    "iUELX74r0+yV6fHclzIIfJJ+vfIPqt5Cn+O6EIy+PJ2SBrwqlaHTa6EVY0M/AZ+cb9QSook4"
+    "OM3nus5nohEGdpXFQ3oFKUw4KCYsF8qVTgP3zzyn1MGEHHpUjwCm51uOs/z7ymSLMKqeR7pi"
+    "TJfLH0fpHnmcoxuO5O6AI90qfrVVDzg8IpeFrYZWRsTe5bMu47TOZ3720ggGQ12uXITogz3y"
+    "FD3WstlQdqEak5KJxv3cKCFig3ldUgh9EjOcm7PAhJLzbIsZTPZEsw0k2InBI9Mkydj3toTb"
+    "n7Nlanm9+S93k+O9mmffg0qMOXeg3vcetfUhfgYV2Y9TmBhv2iqniTPSNqn8u2u5qojgilgr"
+    "ITsuychN9ShznKSOeZpfoxeyuoZoNKGv4EoAK6+zS6RNNRN5FTGSlJnsTN/lyYQnnG+PNVhe"
+    "GdIbQcZ1NaI4Tpxm2L6zW3fZHpsj33zR1c/BcPwA9oWOkNs33wzVIyJ4JSPweFwt7K2INLTD"
+    "MxsPkwLsLjbUoLAaf7jy14xPFLsfHY/IjWLB03AhmifHR1prMdh3BWOtrF2A8XEEWHtrYnI8"
+    "pe8gdn/NtLA6wiWV3x8T6v28v+IuXCGPukwmnUysWkRQISkZTE7fddBoh84TX/9OxexaBtkX"
+    "c8HQ3oEcTyXTl6SVSTgzTD8ofd6Q3SODt/TLeeKO0bKH1GSfDKuyjqVsKLiy4ydJQNd1MXK3"
+    "SnKKZ8u4Gvoq82kyQroqNKy9dnMioVUZiwyvxKpbTYc3RQwlH9Sube2ENwXuA/VCDbgHYeZX"
+    "t2O+MndWLtfU/Np35HyFEWX39d5DvfauZNL2GuyVl04mACixH2+PQMxSsDv/bq3ufSUvR7nO"
+    "iCyKLPKjqx1yldbTNC0rIyXsiEYvg0Ct9glWFRHqmLA06KsleGb74wUPRr/QKp4GdY0PwynJ"
+    "4V89ktkw7NaJll30DEpb1RpEi0GKIxuasevoFV+wROsNd89SxP/plXysnMlA5rP6uQcrtatb"
+    "JXJ3V2Ex4OC1JqFi/Zz8y1i/gD4FL0aoIzqBbGXw7e3R0u32b8pb1N4RcV3X6xOarn5E7NON"
+    "Q51ukhNSpxnHUkEF7l1+LXHw8UbSj6ixVbsmyGWiUhQRQswwy+zRHjqMoJxgaxyGFvYeFuQ5"
+    "FxpAaga43oCUhj6rM6aypyc8ZT+5KuQy9dYiNiEUC62khKYjJZORSWExCFm2ISmDmVF7H2vO"
+    "VHWM3Or3XQ2sK8deDz1rO2xl6oUYAZ13Hh2sCTsf1i4gVQcT+YaI6tqqrgHWN4fC7FNv4ld3"
+    "MRJqoHKlCIk1VrcY7ME4wMr2L7dfGDUYR87tZlpKx7eiQUWuKVIbvffubqIwX91jXaDHivl4"
+    "u/I/Bh8rx3Q+BaaYGW+PL3s/CwfeSwnqzhO3N3km4xs3Dcfav5j2XXXc6JxMZPPTLQY1PEWv"
+    "2EMcpHAcN++AlcwSOFTcENkRH9UtVenuabmatNJweKW+bI+X8mRkDf0Fg92CBWSPa0Ww1Znr"
+    "3nVvC/G4t+zB3VvdcND6c1dLyQT51vqzXL+GHl0JeIUVsxyCt6YliQbHj46FxMrVkEkgnhUf"
+    "ZbRBZ+Cx5gyN2X9OA4vYox+wnJdBqrp2RwRq6DbIaPdCxhVp/v8HE43twderCOdP0I0DRvj/"
+    "q1P0cvY4f3jY/Y4aG+OKe7y1pvFzweUB7ks2Q2szwtbqYvphQHd19cpZpVZv/w1BZ6kkMKeD"
+    "FXsOoGqmMQAabOhkFXoPqUM7c4M+T2P1mPQZzKhXe5Dr3pvj0TcPC1WduaCYsbMj0hFbOwIz"
+    "3AQQOXJXVZlbLEYs3809OczDwI/I6prhGSPS8Q44nbxXC7CyeiAnaKmvFVc8Pp63X1ZI+Xd+"
+    "k45m3erDW7qlp1CNtS5H2pefUbtn5t0C6tWNn8J1rvxx2E1kdcvr+lcaEAY6oYNlSw9gbS18"
+    "ZbyWYaJhUxsU4a9tA/fWLnVEjx/lJY33MO5cvP5HrWutpE3nOOKLoZxXlZfetXU/a+hrNrsK"
+    "VV7qDCrMYGO2Wvol4jcrv0Enykv3R2YchO/AU5ed3yJwrfSF5LvXTDZj3dJniiFv7lnyFVYy"
+    "q2ZVM+hyd+bPgZjRgjLixEqAGUUxo8uLorOC5ylqDe49L2ocHuXjuq5Ma6PGInMyPD1PXvbW"
+    "BF27jluqJz3yutYyjuMn4+uI3GXGmQt1QvWsO9APNxT99ZqyOMZ8+Zd9X1ORxZCvjSiJ1Qjv"
+    "jKoq15J5g+ZWGimxPCuJyVUE276uw3gwXMdRSS16aoUQI9Bd6shETc1rq4/zDJs98SPdYX2u"
+    "G2AoVu5dPmBxhtL38w5yDWQQw8eM2LPXmuO1VeERMb0eirZ9LearaI0ry/dk/tdcJ3gmvIf0"
+    "Vud99/vuTKOHpuGLoRyODmYJ3sIEaAfvTN8mJwA1NLIz4DqR6gR9/+Shw/hKvK4LwG73fGHN"
+    "EIINzoqdS81C3927ZmsyHfVoNH0bxDo3CF8LgIwqJyVSX7MlcN9O5COAfftwftnqYDLeyRmk"
+    "Cq0JAvw28JuVv1Cz9sUMaYE+kD00XuuMYY6VbwXToGa98k318gNhXqpZHTlWF6N+ngVhA/2T"
+    "qZTHXX2GScChVXIG3491+Yt/DahQQ9U5XmK4qsuXud+79Va9/BAMnyMebsqzSdMCQZrRQecw"
+    "dZdNn7NtOhRDusgT5ohnyunDPvCfd5W4Vr7CowdvCqAUa1n7T8Yot4ykygRj771WTjbChMe1"
+    "4/wOBQY9Th1DRchMY+zs9Wr/b7W5CJ4/mywrUOLb443Jqj0O2RxF6UeV4PFNGzTcMg3ysH5H"
+    "Ao1g2Lc7Cx2M8GFwTuu6+yt53/2g2+uMYd4CyXhYI5hwtKJf4BjRaXU1pYgCP6qVC0BS0WOM"
+    "wpElulR7mxwXDALi7FfNS7SRrWaDkLHSdud727+sTGMKNPQkDIppV/VkIzFyAq/kvBUnPbK3"
+    "BGbLEcSIV5oxj6XRaLiXtiTYfQKfbWqFQhYjD6Rm4D7JgW/rlT84a0VvjER26+dX/tXj+iPh"
+    "064rY3VAfV2pY4yaK16IzHs3nUCJTiooZ53PFa+R+BsRRqLPcxhHxpBrWWpa4wSbmJ+XTp6g"
+    "6Qjy6iiOxHLgeHOtq52oGq6bx6rqFVsfq5JVOCZ162u4klVIrjm7hVhWwvSQA2aw7x+oCl0a"
+    "Dt7AHdJpAWM4T1wra9ckgViT4kYBKAeoDNogNM1UMNeudoa7cYURy/O58wM6kcy4Su5qUyNt"
+    "brcq7QyYbEha9H7h3D15raryfpCRA7U2fkVtF7andIgU06muydkgjMqyauUEw83WwNbFNa7p"
+    "Fy7beZ2FqA4N59TkQI9/HAPZTmOo7SHJ8uaAUP4X+3dPsDkRRRbioxriCqzAdTlBs/XiGAJO"
+    "3FI3EMxViD1AbkzjthJB6ez1SIm1ha+j9agBLkf39B5labylqh42dJtrFYy80oaCYJRkg9mg"
+    "1TSv6zFSfb31D0bMdY7JeYrBBs6fMxMQ7dL9Za9w2kOsleHkB+Qd+Ab6D1x/3PvqujIeEVBN"
+    "Qp7NclMHk0ovvQ6L1bHSMJzsZGdxFLy0Tv+VUTKo6mM91uu4xGGGeoi7mObdOLvY+sCx+Doa"
+    "wtHEpttNUzyuwDqxWlKvSP+XPGz0skMSEw17RijG3XN6DkHwWBc87KgWIjpcXStWgKzJxjpN"
+    "aYYr6d0FnlStWc/Mlj4mhmYkTZ70+VrctUXkWhDv2jo3fu8mmGvVyXYAubsROVYKU7A8H45E"
+    "YHc3bDkSk+EA7noqbDluznfqhzFg2hOSsSS+wo1yeT1fVy50L08vShk5AYtM0wV37bu9eJvF"
+    "dVHBK5CEGKqBzdA8SeFeisjHBDcXWlkNBDIi/+uyO5oN9Epea3d/2du1x5vVXyMoNziCcDqW"
+    "+qwcwci7+8gAaX/Z7r73jgy+4H2j9ygLVgfT1N1SLrNoWGcLLFv/2gctMmLaYykj11pbKrDP"
+    "TWfNhtEZQ2YZEwXmf0f7q9bokDl+QMuxzC+Y9BMrdPk1ehAhrI0mP0P/jvFX5IopHUKdYUFm"
+    "eIky87egz7fJ0VWr2w1O8Cdy1uQBWRkU3C8L+4tDfRiFNlEch9fBEtDXlDuInyh+Mh1r3BMS"
+    "7QAUfZ1B1tSYno8akTdJeJPK7aK7B8E1YqfIHgzjIHjsfdOJHYxcoyfDa9XObe2HRSN7gEiW"
+    "/K2zEJqjLzGHO/xi8wUe42Q8mczTY0nHSQYadBURYc2ZeVq+G73XMkmmpzyc0INd29GO1ZtB"
+    "Ju+uF7NluiJ1XhcPb8yXp0HTGYT2dPxqzmNp/rYyAzUzgnFKmtLjE3y+35xEWAgycMta5iW1"
+    "7ua6NmJvwbxOEqxG538EQNg412QBHx4pCEE+RkBIzwDaRgzOKLrBwmiAdhcOGu+rrOcllIUM"
+    "2RnDJPv1DQ3aYkjb3NWNyJVNVHe1SFzXRYa607eiIOnZdau7tTJCTItiJesTvW3yL9olJpNm"
+    "VmMZdmFzHxRCDGobV/ICrlTO8IsJEkbDmYys3zL+JtfKO5mLDCM4zL484wWNW33eTKNYD0wD"
+    "EYH2rmXyGT28d/MzLJuJUUZLpitVtZEma80Wmz8JDQPtPycDloiu67J/xmcldBLVT5ii8z6N"
+    "Np+9G9yNT9d6jq44yWo4VmGNN2WWrniZGg6L/7CODut07+JxoTasgvTc11lcvEuvOXnJo1G2"
+    "w7tNWRzzBBqdp1WuOu/Sa4PDaHSsfOHgzbLKQxGDI4qHQ27w18QylTqC11rVtVYadZw5odBY"
+    "a5agHLybf8fuMrHVra+1McwA6DCqwc27gB14/bLj97ouT9jdvzgX9hWLReK5n2Sw6VhkINDF"
+    "IBNSFTv/fZh3Rc/3Pqq3ZL21Y7J82e6t7biiWBolOwoTF6qD1rY28IyRcbb87XZrhIP+yiPK"
+    "9v1Trw4vMrKPxLd1Gls3eNWcdHUxuIEGG1pkUAmGOgVTqeh/vYE6y1JpAQku8BN5AQ/oQSzg"
+    "IlPI1gIexFswMwDUnnjet8DVeBPfqD/6FL9SP2aVMQJWHCp1SbkWrbCZPL5XkEIyMCqurzGP"
+    "QcTJ7HlN6V/xJB5+ClJmZOCxcubsEcclGa66MV7Z+XYQhDWqav8TAZm5HB0EwSiZMWmf70Wy"
+    "CJ/J1zspsZtgY0IjRktuT1zbVJE5NcJPeT22r8zDPl0+HNHgULGGi1rbUBHcvcGXrNmmEY9q"
+    "fUh1Zk5eT8/cPhFpc/JB7N4OLnGFZRidVKqtPgjeOIfS5Om9sD2A1MUANcMUuzbMvv0a3zbf"
+    "ncfF5fg3cc58N0Zr0sqG7EFxYlCF3t6HqfastOaIaYSDncfuZvYn+7hZ3Zj5hxOR/1vwkKvp"
+    "oL+504+bxUPIPcvMJrhmHjCdkx+61pGJTrLh3CBHi2ej4TJ+Na/VsnE0BOYs6GxJgcfeZ5GU"
+    "KqkL1T625+eMKHukhsqDFC/G5UPAKsgIiddM376+qBdxBS/oLbiCj4wlpPCI+BTxyHi7kpHP"
+    "24MSXMFPwCX8jPzL6+2PpUvNkR3DCMX5EMasEc4BsFVFR5OMyQGZ/KiXgNj94ysnyqXgvTfO"
+    "1eZKPYlrGV7KIN3SN0QEZKuATwMi2ARsf0++WFNOA/UGMa/c3S0MwAdDvGbmiNVnMO4b2MID"
+    "trCua0SRiwZTjE1FeA3Y/HpYvNnTBsc4XlsT/Gs/cyxm+iZsqboMB/cL7CvEvZmFeg498IS4"
+    "qhiGepKOmD4dxe4uy+bMGHAKx0rXaxQtRHXnqMj1eOOoSRRDwoTqfNh+vxhHl2oXt0MbHLOm"
+    "FktOmbCjLiJXD6dkFHgZaSezZzY5ph0QkedYv9bVffsHz1w2q18xCRsrwjATn613V/6nlVPN"
+    "RNzSc+9jfcNKnoLKrV0NoiVCDMcO7lZTUidCpIyD5aSpWe97QNXYtQUop5/xUGFqkgwGHJNC"
+    "Sp55BGpvhriIHr0BichAxA1uzRN/AY/AIyOIkPIUySvst9AnxlvwwXgjPgUegU8Zj7VSSCGJ"
+    "R+Aivkl+XhFQNT6qA3hkvAXfpJ8Ff0X8YeAz3SQvg4NWRiSFkxbrG6h9qSAYu9tRWuqC6rgC"
+    "Zd6ys5DiuHl8XrZjuI97AWfyFETtE05G4nBVmIfDKSBpvhAiqicIj0JYQUWW7LDB3rL3hQx5"
+    "aJSxqzBiG7ay5iuEoIywaJEv0cng8WZNfZQl7ipo9IezwY4Km+qKcS5bm8F7b0nrsl1kMrjR"
+    "tGnRn1Wu1cBW+SVpT3dfSJAW0CcEbzbG49xuBWgYjYAYt2lnRmTcXkWuAFq7/YfP9RYmSFvh"
+    "06ehb2p0UZjac+UiU+oVkZF11+m82dVdncHFsHpEYMaCcX9MW5WQaQ8QQ9IOITy9lTIe7Dzg"
+    "vpBqNLF+C9T57/k66NHgPZp2s/9mieE/sNayIrfVu2rX3t37GDUdN95QYVKmDU9+6WZnn4MZ"
+    "celEV57g9ikCrY8ZH2LOgxq2R+F42aAm7tYWzO+L1kVcETGl5oj4Alzkg/y0ltPDPtn/or4C"
+    "FxmNi3FlZOuSPj3WFQTw7P7YDfJTxM9W/izw88xvyW8YRiFcsaYOXTkRZBpjpjdYOXM7ZoRL"
+    "L1jHdiS087Y7vkCD13jN/HDeaksdz5Pah5hvpQxoSxb6JOgKJlQNxtUPRXtWHMRtrGFM3k8k"
+    "4EHr4bU6XWH+9TXO6dm/HFPaKBNV/tJHPNfTinf78jfQ6sVlcJrEUKPc2YpwbczASTPyKeTx"
+    "rF4O5xIKuHuXTns9zedxc73WFhozj0YtN9aB3R2RjRDZxHPfviU97vf4GvYtgxJKAhPyiWbq"
+    "JcbPMCvSnLlYrhp/XzRU3R4fW/XJ4+rCMTyeoOk8k4UGsWKpO0rsSmCtyIhWPDd2a3dNTdfV"
+    "qOMNFaT8jxagRtzSxy5LOngGpDiuIPO91Lp7M63D7nEe5pTQotlsA18YmqbDSn1O5xp1vb8t"
+    "p7DGyLLDub521Uym2wEUTxgpIT8faLIZ208hdCUfEVG9OFkVCTwyFrSki7qABazWkhb1yHjL"
+    "i9VRujKWsIRPmRcQUEPPwlNgxLcZ39b+BfBN8A34FF9PN3RZ1qJDFXBHeU31/OrC4JAUq3KS"
+    "pHjYQbmP1OU19H0Z9Dw48KifQfy0S44w4rlbTIwV6QQ3LdtTX1iDc01Ve8eGXc1IT3T9d9Ys"
+    "xOE4KyGZF5LV5UKJPxl9V9VwpCMGwu6EZ+D2suGVGCE7ImLA5ZbIUF7IO5ZIA8GZ1vqksaHL"
+    "mxtaOX+3EIGAjUqD7BrAuBzG7d93LeMHpw07CBJ7WlfMgm10dZy4NlM0dFhLnoSG2uU3wyHU"
+    "VnH5/JglZcCxlSNdwXna5xvxs+C31MWObQrPvcF4PC7f5SsWS6FWVSb9U5WoWFyPCZTsOj5e"
+    "M6gQjPxPj5VrbfEmn2eKeeyo9gMhV+YVe1IdqRy5TwM1Wmh2dbWRJIyVLe1dbq4n1CIT5G0P"
+    "sGXcGsuBpX8jFQZjzfC2xsm49j5DCfsylrmeqJNRvWZuYJmO1FqRSaS0iAt8RHhR95YZwBXx"
+    "iDQIhuqklrDAQAcBx8c0AH1L/AH1LfCJTPVC+KKL6gFxjqhUlu9kZoAqrxaOrEoKUerHlZnp"
+    "WFNDR8o7m5ybzcZmHDuBe6G99zD2Bx4/KcqO8/QnkGvBE48j/4gT12aJlcmKOlEDL2KQBZgj"
+    "bj0x86Jt98TY/czp9DJCL9mNJEe9+CYhc/a8U1tmHvCo8fHtuhdfwydMBZnhpM3dEV2lGm/e"
+    "mK5n6O2ndvJEMzIiZGX/MC7BCLfxQccDjOqlpdfTQsRa12Qk93EMj87Zlb5fQsOMknhlAtdr"
+    "gVS9nenpQsD1Os5DCioCzjNwFcb5ysQIA8CcPmF/maMb/KJaMHBXNVjtr4h778wxAZIpsbs/"
+    "fXrk/5ZExLP72b1nNQ+reQVvzxErWr09Tk0W1ETJYjVkjvTwJOUgls8/q9bTAJqeLaJGW99j"
+    "oxlpztE80iVfxm5tUORzjyXwejiIAh0gY5ugP12ihVOqsxT193DlWkE7FfJl635FQms2WAEk"
+    "cGXSFtxY3+96b6zELxN/sNa3mTYGzYhJXPyJ4Oy8ISa0Dz+eY4jlseMf0y6Mvz4EcK/fuCLN"
+    "9Z5xlDeKth9R9y6LKErdbqa7W0TQekdHqw+m5OssWFORe8qZzLxm8Z5ToR5x7jCkhxDm+KKW"
+    "2r7iFqf/tirTos6RfEzxkQfsxmOBHZaere0njzN22dRoda+t3ZBs0FRVp40HADOMspnBWI98"
+    "pe49IaxDxD1mFSlylXRP+lNMnotFIGo/2DFEhHa6+eF+xU9W/ni8mbBlMgkyuAdxOjrh1sbs"
+    "CNp937XWOCRtMkKZ63LskHRCakTetf1OmfXnIKhc15BRSU2dDjLQyMjrsda67l0gV1zj3FDl"
+    "3z2uLXxU35MPPLyMOorZ67pKvX3WcISvtWch6/wOlxCjD0tsJ4zFJbGJyNCxmladT+qVmRch"
+    "okzW9l5f6EOHbWC3zDEOUDWbb6/v9xBJzup1rHhQt2syNlJAa83iHHy5zAMIlLU7xCNjnTHM"
+    "l8Z3d5H6VcSf5vq565cuVjtBxcoWapivHA3Ga2qC4Fnkg5a8x/Ekj6XoeLomCXNSG/Ei9hhY"
+    "BwNfgrlyd4HRYKE9JkBrrRhWA2znXjy+527YA1N3UXbhHTmYxYAAKIc8edY61kDYdRA+oT2B"
+    "3Nb22E2XRuoFREmeVK0IaHNK5df3OFwHe/piprgBCz8w66WX+cTRhy4ZIodbefBMxq9qEPX0"
+    "JFkT/EV4iTq6v5ZmrBCTrDo3JKHwZnv3Pis7DBHdMYbu89uC6/DMb/RFsxMdP1REdN9hGflB"
+    "RxzTfzmStLY1HDp0Qf8ChunWikAfUwAk9a4m864aJvv5ahisOkMnws5SCPm3wVt9jyAkwjKA"
+    "A52PyFixJ3tqtvYDMoIiYhnLGmF75BCuMGetUQ8zkJh+Qye7zW47p62yppoOzsPuoR1PwM5Y"
+    "sdKvwUxx08MGv8NzHpg7gSaxGNTkaEltlIzPAobjnJDjMdQiaFOB9KXxXp3EH138gyuzSl0U"
+    "LUs9ZZKcn4KAI20n9j7cNWg0lQesEZP04e5rksdeje7JWNHgK3Uk3Bkn6wcvVVhEqJXHLG/q"
+    "+rom/26iy2IeXOsmNam8M0uM4yjEiWUxQXZd174NEV2CkbQeO/NI1/Cidpkmb42docoH75wS"
+    "fXWfCILwxTLrxglvmvLk1f3PL/sVzeaXhDnehq8FME7UsLW9BgngWFkO1OLYDu0HsiA8Vx94"
+    "1bAcpjzJ6tpH+eGPu7tqTFThhZsDdPzEYoxWMyZrGf4xuEuDLfzW5LVs/rcwfs4kMnOAbNYg"
+    "RaTIx6fPPfvblvq6FjP2fnbtVgu61mqVb7jMzL9JPluN6IFFxJnLwzrqu6uo26ZJD5C966dT"
+    "PEeQbxWGnwkvGHtuEkWmHVs15ljGWrCwJvN6exNwV8c1c7L5FDL3FsM6WFyZ8j+n+gBhqsGM"
+    "Bu5Wmyw/ZHI6oTeOUeH1IilwlhM4XRkjaCNRAiV9iNX9syv+9IrPrbDJQUjCNTyONOVM+ljW"
+    "T7oOP+Gpo3ny+X0yvowHC8ZaSyf4YyjTRzfpMaqjqH32zTPqhPQWwYx17Hd6PC51OzyJJ9gV"
+    "L611RphHJ+UYPGzTbYSJ8JBQ24BMZs7w1u/PWmv0kvMzTHcAcOwoB/MQQUNHh+wdlsRGHRnt"
+    "VxQtkBErl38wHzuvKYffz3NwuEsvd6p50nk4XO5ZYfh3dHF+IkEOamwkRgrkqNmmQJC1GZ4I"
+    "jkdtACLKqYGsjoaA7Sb6YD1dwHMGjIJ6ndiUMzWj3QgQbnWutdZqp/bZepird8WrDADJPBWE"
+    "6Ui4rvXc92wlMnNlq1aG5T0M5m8jt5oZsRYCVbP0sl4CGRvaAiMjV3evXO6TM7yA6CPmmdjL"
+    "PvwU7x851QVqhv48jTg6wm/18y7PnLf3K4PgG/GD1SNOfvCG/EwgTWaZw6Udh5sRp5mZjasL"
+    "0zi2D+urOfpkHxlJXMG5gcmP0kX+8efrW4i7eCALi44CnUuAx3Gg8Za6rjcCbuKHjg5ptuE1"
+    "NJZXGT8OvuSC7XJA15Qcdf69l3ZZJxZiZV7XtasayhVhQIdj72SB73Q0HiJuNU6sueXlk4+Q"
+    "qWFfUee4OUop+jqNMdN6+zU+fvPArrV4uHBWtfi4eflG6qSSD0r+JRIb6oj2vl8ji5HwmVUa"
+    "cT5dnjp8PoduWKl+LFxInJYRp2Y+w/o+dOsBKU4mrgUvk3fR0HbDobFhe+HnTFZnzFl9Q2Et"
+    "CydGeO1vfmUG0VUeyrSJdmoTds1s85TRYuTp5P2N6KilEMawub2PFaM59xAjYq01PIMeEvCu"
+    "nb+1gzRpXC8mq/J0SsbkT0iBt4boXfYiRoY8gI8ZoPvj4IEDjqBdX6VHmsnEAN8bx/AX8fq3"
+    "IpPMvScZ8PRBI3BvId018iR9gAP4msTTqHtI95YEYjoyKtgjXviar2sbgfmIauxuiT9/XL8I"
+    "sTvGOcs1JZn7qK93hf/hC8nvl8SFn4NtrMTyuvi1t/DTUtUzYzwAZN+xE1wzV/IA7lakPZ2m"
+    "Id57z4fpkrvn2cU5fA81kpqHhNEz22qIy/mpLxqh11dD7zpfVphOrtPkO5XgWpmRaU8fFPzJ"
+    "lstzcjJWCOBaAu6qtS6OB31koS+W0NFX9VTEZ24/LHqzu857OD9WJoAuuYKNcCRQaKgBkZnd"
+    "1d25nNbLLngW5Zg6T1z3yQ/o+d+hc1PtnAYeVeu9byfb2Bj4FffpEvyMeFqIlWfaQYmSdiuu"
+    "da11EF3GGOQoFdzyjICkz0M22InGqEyr+963H62qGgMhkX9JKhArDjOTpPfIzOtRMp7KvYf7"
+    "yHKGz0ig/Zvb99NNpGV31XVM7Qt0dF64uDpK+slS87Daywac+YtBrA1wXTaaePvvJdQR9mCO"
+    "3UElvOSJ/MmqY7yXDkPVsfXWWaKrO6VUrIjkSA0/r/g2I4XlPnGSPq0P6aPRDdBvXXvYaHaE"
+    "HRWU1JzsMAYQKpdNYf/PyjjxKGGBRLdOju7J5tAIKgY+3jD2LxUEm7irmGsEj0JbARSx1kMO"
+    "70A3OgPJQB0GfUbJooIgoqFYazrsVySFrUp0mzJnpRvKcMnYTWHXPWfTWfPZbrrW5SFvA3fV"
+    "tS7/Xx/X5egmZ0XmSmUgQh3VdRJJzhCLZ19wQslPMOh4fW1j9g7E176Q13og4r63IwJr769R"
+    "Pg5o6poXmNHpG3wpsnSOHg+ZKKBe0zi1Vq7Z8UwkjN/ODTg16haQ10PCvu/MZU5jO8Iks6og"
+    "hTpOGzHvDjZZU67OVIWA8hoMR++R1vrmP283St1A/nUeEa+kwooIyEj5Lt0nDobHqDns/7Fb"
+    "GoM2itCMVZZej49gkgEsLBoIBs8hGrHWBXz1sp9IuJHUeJZSPcOnTIenxTkCYL5JZu75hF+7"
+    "R77AThoCB62/sSsIRz/kxI+k315CWvY2BFMdMvzVkZTyJPqEFvjOkVUKvj0WTyaroyFKI1E4"
+    "zuSqsnBXLXYbfTgIHb0svlOVY+x+1iENnc7dhAaCPfk942f6mvETziHxZeexoDd5TtlTzJLG"
+    "w8yYDXzP0NOLpe4MntDtUUtPqW19v8HiAzNyvZMNHS/KMYqWImKt9E+PbmdzRCDWuk0S54m7"
+    "s+QjcJyVP50C4spVg4IZLsGyDlpRXS7fI7MsyZ6kRrSYK+3Id1UxkeoHb2xMwkwjveIce6Ay"
+    "+QIonNtlBmn5Vbv6tUkUY+8ScT0emkGGNTPDVzqThQFo76p1LQby2KFOuFf5sulS5jXSJobn"
+    "AsmMXGiDRCP/OmD/N0SDj98iQ127CzD36HjQXpkphzb1so3GGlSaYFi7vak2cpzKQZL5IEe0"
+    "0F1VJ7XnhGjxqBQwNMBdU6ILiLVsQDFKCkCs2KX7wFB6UsJmAskDOPeFYJ2Jy/GV2d3BvEaN"
+    "XlfgU8SVfGOyK2AdIl5EdbsO3OL6fc6Mx+OSaq18ZHYVx4kZOvihrs5YY8eBffPOfwingBlH"
+    "+tMYsQkX8KcH7ar5b3osNrR483qO4MsVyLzmzZ/MzCKP/ch5kjym61lmYpokME6Kgtu0GdHR"
+    "GBpEpAe29jb2kWif7KU4O75odVcl8+yZRwqmanX579ktMApOnS+/Ax4J+cByRTFBRxb2+sIw"
+    "n8Slb/UrenH4Su4POVKxvBbpjGytMDqijrHZfDqvs47pXXIAhUjLNvwzAPJFMnFAUvV+rAVg"
+    "rQtEFchEpMieE0xouEn0Xr+2YyQuMneXIp3u7TXayCqAWA46zW67dckhLo+LnmCkoQWRf50H"
+    "/9mCFNAjI40IIp9V5ZgpnkhmNaQVs950OSoRwQJe8eQ8CzRfKhMRfvqYODmXL6i//yEazl7o"
+    "SX8dx0xEMpyIKZ/Z1jH5dNxOgXBMAR1jeSJA3K5Y1AW2xeg1mdYujKFi6xFxRUTLb1WIK08K"
+    "4SttjnNIx+HDZ3B28UmHRB+Zjl6knxBfkA11kcrR8fEkng94Tyc72/utMxeNWDQ6f3ZqYHXX"
+    "2ARJZ4v5+xGqt4sLhwgfiz+PlMJu7eEtS+qemBWg47xvHvhZNPTSOexx2OcuNewzBcBbbbky"
+    "clRQk7wcRyczPTnPFT4IWDkKC0CyR+R8MN0cH9sQ/HEcReG5t+M7ypX4VwnKcBEguiVUdas6"
+    "Q6o+UnpXRjmbHXfNTNv3Jls6QhGWP5JMM20II7s0LGt0l7UtEyPIuKtoUroNwt60rNVVJ/aJ"
+    "QmS+3aUGpV72qaMjMzIKvXuWD2n3dNcrDgHJsAl9xoXMv1mzP0TrOKbUJgmB95he4qQEMYlr"
+    "pdehZXaYBT2T/txuj1/rEUZI/QKm4eDkMnNXV/Ww5zLRXj/S4DAwbvfRI3Tj3uWI0BHRgvQ3"
+    "xDHQ1Ul+cVB9BFfGwfZzS8z1dTLZZ7suhbTsMneHFoGW7LM6uoLuTjARCajaoRrGDMGo1tI8"
+    "lwyXz1WVkdZU2NRisEp37zEvBeA0I0VGabBFay0HVnikaSmxGA01pdbek/SjRjqWcip7ih0x"
+    "z05PH80W8rpKk4R+Cp1XgOSEEcTXLU52o2ac0dda/tualtaMdVvHEAZGc4ANxwasEyPyuo38"
+    "iSIy910cwvZWonFcot01cnG8Js+Gphu8vqscQWigp8dl/nX8sDXwrBohF+e+Qfdaaaqh29w9"
+    "5CEXYupWVYts9TZbhkzmiuxqyhPFtiOqNU6gScYZGyyfdx0wcMh+qQmC8dDE2X1+gGNP6dDo"
+    "WsmINGlM5G5Fpi0CV/pyjwL6AM8miYFB8P83AFDjRuw5FsFJAAAAAElFTkSuQmCC")
+getBaneData = Bane.GetData
+getBaneImage = Bane.GetImage
+getBaneBitmap = Bane.GetBitmap
+getBaneIcon = Bane.GetIcon
+
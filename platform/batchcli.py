@@ -0,0 +1,275 @@
+'''batchcli.py - headless batch frontend to the SkinDepth calculator
+
+Reads (material, value, units) records as CSV or JSON lines from files or stdin and writes the skin depth
+(for a frequency) or the excitation frequency (for a depth) of each record to stdout, one output record
+per input record in the same order.  Input is processed chunksize records at a time, so memory use is
+independent of the size of the input; with more than one job the chunks are calculated in parallel by a
+pool of worker processes.  Doesn't use (or import) wxPython.
+
+    python skindepthcli.py --db materials.db [--format csv|jsonl] [--jobs N] [input files]
+'''
+import argparse
+import collections
+import csv
+import io
+import itertools
+import json
+import math
+import multiprocessing
+import os.path
+import sys
+from material import constants
+from platform import SkinDepthController
+
+# Unit conversion factors to Hz and metres; records in frequency units are converted to skin depths and
+# records in depth units to excitation frequencies
+FREQUENCY_UNITS = {'mHz':1e-3, 'Hz':1.0, 'kHz':1e3, 'MHz':1e6, 'GHz':1e9}
+DEPTH_UNITS = {'mm':1e-3, 'm':1.0, 'inches':constants.MillimetresPerInch * 1e-3,
+               'in':constants.MillimetresPerInch * 1e-3, 'feet':12.0 * constants.MillimetresPerInch * 1e-3,
+               'ft':12.0 * constants.MillimetresPerInch * 1e-3}
+
+CSV_COLUMNS = ('material', 'value', 'units', 'result', 'result_units', 'error')
+
+PY2 = sys.version_info[0] < 3
+
+# Controller of the current (worker) process, see init_worker
+_controller = None
+
+def _text(value):
+    '''Returns value as unicode text (Python 2 csv fields are UTF-8 byte strings)'''
+    if PY2 and isinstance(value, str):
+        return value.decode('utf-8')
+    return value
+
+def _native(value):
+    '''Returns unicode text value as the native str type for csv / output'''
+    if PY2 and isinstance(value, unicode):
+        return value.encode('utf-8')
+    return value
+
+class _LineWriter(object):
+    '''File-like object that collects what csv.writer writes'''
+    def __init__(self):
+        self.lines = []
+
+    def write(self, text):
+        self.lines.append(text)
+
+def init_worker(dbfilename, cachesize=128):
+    '''Opens the materials database for the current process'''
+    global _controller
+    _controller = SkinDepthController.SkinDepthController(dbfilename, cachesize=cachesize)
+    _controller.open()
+
+def parse_csv(lines, columns=None):
+    '''Returns the (material, value, units) records of CSV lines.  columns is the position of the material,
+    value and units fields, default is the first three fields.'''
+    if columns is None:
+        columns = (0, 1, 2)
+    records = []
+    for row in csv.reader(lines):
+        if not row:
+            continue
+        try:
+            records.append(tuple(_text(row[column]).strip() for column in columns))
+        except IndexError:
+            records.append((_text(','.join(row)), None, None))
+    return records
+
+def csv_columns(header_line):
+    '''Returns the positions of the material, value and units fields if header_line is a CSV header naming
+    them, otherwise None'''
+    row = next(csv.reader([header_line]), [])
+    names = [_text(field).strip().lower() for field in row]
+    try:
+        return tuple(names.index(name) for name in ('material', 'value', 'units'))
+    except ValueError:
+        return None
+
+def parse_jsonl(lines):
+    '''Returns the (material, value, units) records of JSON lines, each line an object with material, value
+    and units keys'''
+    records = []
+    for line in lines:
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(_text(line))
+            records.append((record['material'], record['value'], record['units']))
+        except (ValueError, KeyError, TypeError):
+            records.append((_text(line).strip(), None, None))
+    return records
+
+def calculate(controller, records, depth_units='mm', frequency_units='Hz'):
+    '''Returns a list of (material, value, units, result, result_units, error) tuples for the records.
+    Records are grouped by material and direction of calculation so each group is calculated in one
+    vectorized call, and the materials are retrieved together.'''
+    records = list(records)
+    results = [None] * len(records)
+    groups = collections.OrderedDict()
+    for idx, (materialname, value, units) in enumerate(records):
+        if value is None:
+            results[idx] = (materialname, value, units, None, None, 'unreadable record')
+            continue
+        try:
+            value = float(value)
+            records[idx] = (materialname, value, units)
+        except (TypeError, ValueError):
+            results[idx] = (materialname, value, units, None, None, 'value is not a number')
+            continue
+        if units in FREQUENCY_UNITS:
+            key = (materialname, 'skindepth')
+            factor = FREQUENCY_UNITS[units]
+        elif units in DEPTH_UNITS:
+            key = (materialname, 'frequency')
+            factor = DEPTH_UNITS[units]
+        else:
+            results[idx] = (materialname, value, units, None, None, 'unknown units')
+            continue
+        indices, values = groups.setdefault(key, ([], []))
+        indices.append(idx)
+        values.append(value * factor)
+    materials, unknown = controller.retrieve_many(materialname for materialname, direction in groups)
+    for (materialname, direction), (indices, values) in groups.items():
+        thematerial = materials.get(materialname)
+        if thematerial is None:
+            for idx in indices:
+                results[idx] = records[idx] + (None, None, 'unknown material')
+            continue
+        if direction == 'skindepth':
+            calculated = thematerial.calc_skindepths(values)
+            result_units = depth_units
+            factor = DEPTH_UNITS[depth_units]
+        else:
+            calculated = thematerial.calc_frequencies(values)
+            result_units = frequency_units
+            factor = FREQUENCY_UNITS[frequency_units]
+        for idx, result in zip(indices, calculated):
+            results[idx] = records[idx] + (float(result) / factor, result_units, None)
+    return results
+
+def format_csv(results):
+    '''Returns the results as a list of CSV lines'''
+    writer = _LineWriter()
+    csvwriter = csv.writer(writer, lineterminator='\n')
+    for result in results:
+        csvwriter.writerow([_native('' if field is None else
+                                    repr(field) if isinstance(field, float) else field) for field in result])
+    return writer.lines
+
+def format_jsonl(results):
+    '''Returns the results as a list of JSON lines.  Infinite / undefined results are written as null.'''
+    lines = []
+    for result in results:
+        record = dict(zip(CSV_COLUMNS, result))
+        if record['result'] is not None and (math.isinf(record['result']) or math.isnan(record['result'])):
+            record['result'] = None
+            record['error'] = 'no finite result'
+        if record['error'] is None:
+            del record['error']
+        lines.append(json.dumps(record, sort_keys=True) + '\n')
+    return lines
+
+def process_chunk(lines, fmt='csv', columns=None, depth_units='mm', frequency_units='Hz'):
+    '''Parses, calculates and formats a chunk of input lines with the current process's controller, returning
+    the output lines'''
+    if fmt == 'jsonl':
+        records = parse_jsonl(lines)
+    else:
+        records = parse_csv(lines, columns)
+    results = calculate(_controller, records, depth_units, frequency_units)
+    if fmt == 'jsonl':
+        return format_jsonl(results)
+    return format_csv(results)
+
+def _process_chunk(args):
+    return process_chunk(*args)
+
+def iter_chunks(lines, chunksize):
+    '''Generator that yields lists of up to chunksize lines'''
+    lines = iter(lines)
+    while True:
+        chunk = list(itertools.islice(lines, chunksize))
+        if not chunk:
+            return
+        yield chunk
+
+def iter_tasks(inputs, fmt, chunksize, depth_units, frequency_units):
+    '''Generator that yields the process_chunk arguments for each chunk of the input files, taking the column
+    positions from each CSV file's header if it has one'''
+    for fidin in inputs:
+        lines = iter(fidin)
+        columns = None
+        if fmt == 'csv':
+            first = next(lines, None)
+            if first is None:
+                continue
+            columns = csv_columns(first)
+            if columns is None:
+                lines = itertools.chain([first], lines)
+        for chunk in iter_chunks(lines, chunksize):
+            yield (chunk, fmt, columns, depth_units, frequency_units)
+
+def run(dbfilename, inputs, output, fmt='csv', jobs=1, chunksize=10000, depth_units='mm', frequency_units='Hz'):
+    '''Calculates the records in inputs (iterable of files / iterables of lines) and writes the results to the
+    file output.  With jobs > 1 the chunks are calculated by a pool of worker processes; at most 2 * jobs
+    chunks are in progress at a time and the results are written in input order.  Returns the number of
+    chunks processed.'''
+    tasks = iter_tasks(inputs, fmt, chunksize, depth_units, frequency_units)
+    if fmt == 'csv':
+        output.write(''.join(format_csv([CSV_COLUMNS])))
+    count = 0
+    if jobs <= 1:
+        init_worker(dbfilename)
+        try:
+            for task in tasks:
+                output.write(''.join(_process_chunk(task)))
+                count += 1
+        finally:
+            _controller.db.close()
+        return count
+    pool = multiprocessing.Pool(jobs, initializer=init_worker, initargs=(dbfilename,))
+    try:
+        pending = collections.deque()
+        for task in tasks:
+            pending.append(pool.apply_async(_process_chunk, (task,)))
+            if len(pending) >= 2 * jobs:
+                output.write(''.join(pending.popleft().get()))
+                count += 1
+        while pending:
+            output.write(''.join(pending.popleft().get()))
+            count += 1
+        pool.close()
+    finally:
+        pool.terminate()
+        pool.join()
+    return count
+
+def _open_input(filename):
+    '''Opens an input file, - for stdin'''
+    if filename == '-':
+        return sys.stdin
+    if PY2:
+        return open(filename, 'rb')
+    return io.open(filename, 'r', encoding='utf-8', newline='')
+
+def main(argv=None):
+    '''Command line entry point, returns the exit status'''
+    parser = argparse.ArgumentParser(description='Calculates skin depths (for records in frequency units) or '
+                                     'excitation frequencies (for records in depth units) of materials in bulk.')
+    parser.add_argument('inputs', nargs='*', default=['-'],
+                        help='CSV or JSON lines files of material, value, units records (default stdin)')
+    parser.add_argument('--db', required=True, help='SkinDepth materials database')
+    parser.add_argument('--format', choices=['csv', 'jsonl'], default='csv', help='input and output format')
+    parser.add_argument('--jobs', type=int, default=1, help='number of worker processes')
+    parser.add_argument('--chunksize', type=int, default=10000, help='records per chunk')
+    parser.add_argument('--depth-units', choices=sorted(DEPTH_UNITS), default='mm', help='skin depth output units')
+    parser.add_argument('--frequency-units', choices=sorted(FREQUENCY_UNITS), default='Hz',
+                        help='excitation frequency output units')
+    args = parser.parse_args(argv)
+    if not os.path.exists(args.db):
+        parser.error('database {0} not found'.format(args.db))
+    inputs = (_open_input(filename) for filename in args.inputs)
+    run(args.db, inputs, sys.stdout, fmt=args.format, jobs=args.jobs, chunksize=args.chunksize,
+        depth_units=args.depth_units, frequency_units=args.frequency_units)
+    return 0
@@ -1,7 +1,7 @@
-#!/usr/bin/env python
-
-''' skindepth.py - wxPython frontend to the electromagnetic wave attenuation calculator. '''
-
-__author__ = 'Chris'
-from platform import wxSkinDepth
+#!/usr/bin/env python
+
+''' skindepth.py - wxPython frontend to the electromagnetic wave attenuation calculator. '''
+
+__author__ = 'Chris'
+from platform import wxSkinDepth
 wxSkinDepth.main()
\ No newline at end of file
@@ -0,0 +1,9 @@
+#!/usr/bin/env python
+
+''' skindepthcli.py - command line batch frontend to the electromagnetic wave attenuation calculator. '''
+
+import sys
+from platform import batchcli
+
+if __name__ == "__main__":
+    sys.exit(batchcli.main())
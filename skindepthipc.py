@@ -0,0 +1,9 @@
+#!/usr/bin/env python
+
+''' skindepthipc.py - local socket service frontend to the electromagnetic wave attenuation calculator. '''
+
+import sys
+from platform import SkinDepthIPC
+
+if __name__ == "__main__":
+    sys.exit(SkinDepthIPC.main())
@@ -0,0 +1,9 @@
+#!/usr/bin/env python
+
+''' skindepthserver.py - HTTP / JSON service frontend to the electromagnetic wave attenuation calculator. '''
+
+import sys
+from platform import SkinDepthServer
+
+if __name__ == "__main__":
+    sys.exit(SkinDepthServer.main())
@@ -0,0 +1,40 @@
+'''fixtures.py- Shared fixtures for the tests of the SkinDepth frontends'''
+
+import os
+import os.path
+import tempfile
+import unittest
+from platform import SkinDepthController
+from material import Material
+
+def material_dict(amaterial):
+    '''Returns a Material as the dict taken by SkinDepthController.add'''
+    return {"name":amaterial.name, "notes":amaterial.notes, "iacs":amaterial.iacs, "mu_r":amaterial.mu_r}
+
+class MaterialsTestCase(unittest.TestCase):
+    '''Base for tests that need a database file of sample materials in a temporary folder.  setUp makes
+    the folder and the sample materials self.iron and self.copper, tearDown removes the folder and
+    everything in it.'''
+    dbname = "materials.db"
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.db_path = os.path.join(self.temp_dir, self.dbname)
+        self.iron = Material.Material(name="Iron", sigma_iacs=18, mu_rel=150, notes="Pure Iron")
+        self.copper = Material.Material(name="Copper", sigma_iacs=100, mu_rel=1, notes="IACS Copper Standard")
+        self.materials = (self.iron, self.copper)
+
+    def open_controller(self, **kwargs):
+        '''Returns a new SkinDepthController of the database file with the sample materials added and
+        commited, kwargs are passed to the controller'''
+        controller = SkinDepthController.SkinDepthController(self.db_path, **kwargs)
+        controller.open()
+        for amaterial in self.materials:
+            controller.add(material_dict(amaterial))
+        controller.update()
+        return controller
+
+    def tearDown(self):
+        for filename in os.listdir(self.temp_dir):
+            os.remove(os.path.join(self.temp_dir, filename))
+        os.rmdir(self.temp_dir)
@@ -0,0 +1,101 @@
+'''testasynccontroller.py- Tests the asyncio front-end to the controller'''
+
+import unittest
+try:
+    import asyncio
+except ImportError:
+    asyncio = None
+from platform import AsyncSkinDepthController
+from tests import fixtures
+
+@unittest.skipIf(asyncio is None, "asyncio not available")
+class TestAsyncSkinDepthController(fixtures.MaterialsTestCase):
+    '''Tests the asyncio front-end to the controller'''
+    dbname = "async.db"
+
+    def setUp(self):
+        fixtures.MaterialsTestCase.setUp(self)
+        self.loop = asyncio.new_event_loop()
+        self.testctrl = AsyncSkinDepthController.AsyncSkinDepthController(self.db_path, maxpending=4,
+                                                                            loop=self.loop)
+        self.run_futures(self.testctrl.open())
+        for amat in self.materials:
+            self.run_futures(self.testctrl.add(fixtures.material_dict(amat)))
+        self.run_futures(self.testctrl.update())
+
+    def run_futures(self, *futures):
+        '''Runs the event loop until all the futures are done, returning their results'''
+        results = self.loop.run_until_complete(asyncio.gather(*futures))
+        return results if len(futures) > 1 else results[0]
+
+    def test_calcdelta(self):
+        '''Verify concurrent skin depth calculations'''
+        freqs = [60. * (idx + 1) for idx in range(50)]
+        futures = [self.testctrl.calcdelta("Iron", freq) for freq in freqs]
+        # At most maxpending calls are handed to the worker threads, the rest wait on the event loop
+        self.assertEqual(4, self.testctrl._running)
+        self.assertEqual(len(freqs) - 4, len(self.testctrl._waiting))
+        depths = self.run_futures(*futures)
+        self.assertEqual([self.iron.calc_skindepth(freq) for freq in freqs], depths)
+        self.assertEqual(None, self.run_futures(self.testctrl.calcdelta("Adamantium", 60.)))
+        self.assertAlmostEqual(self.copper.calc_frequency(1.0E-3),
+                               self.run_futures(self.testctrl.calcfrequency("Copper", 1.0E-3)), places=6)
+
+    def test_maxwaiting(self):
+        '''Verify calls beyond maxwaiting waiting calls are refused until the waiting calls are started'''
+        self.testctrl.maxwaiting = 10
+        freqs = [60. * (idx + 1) for idx in range(14)]
+        futures = [self.testctrl.calcdelta("Iron", freq) for freq in freqs]
+        self.assertEqual(10, len(self.testctrl._waiting))
+        self.assertRaises(asyncio.QueueFull, self.testctrl.calcdelta, "Iron", 1.0E3)
+        self.assertRaises(asyncio.QueueFull, self.testctrl.update)
+        # Identical calls still share the call in progress
+        futures.append(self.testctrl.calcdelta("Iron", freqs[-1]))
+        depths = self.run_futures(*futures)
+        self.assertEqual([self.iron.calc_skindepth(freq) for freq in freqs + freqs[-1:]], depths)
+        self.assertEqual(self.iron.calc_skindepth(1.0E3), self.run_futures(self.testctrl.calcdelta("Iron", 1.0E3)))
+
+    def test_coalesce(self):
+        '''Verify concurrent identical requests share one lookup'''
+        futures = [self.testctrl.fetch("Copper") for idx in range(20)]
+        self.assertEqual(1, len(self.testctrl._inflight))
+        results = self.run_futures(*futures)
+        self.assertEqual(["Copper"] * 20, [result["name"] for result in results])
+        stats = self.testctrl.controller.cache_stats()
+        self.assertEqual(1, stats["hits"] + stats["misses"])
+        self.assertEqual({}, self.testctrl._inflight)
+
+    def test_calc_many(self):
+        '''Verify the awaitable batch calculations'''
+        results, unknown = self.run_futures(self.testctrl.calcdelta_many(["Copper", "Unobtainium", "Iron"],
+                                                                          [60., 1.0E3]))
+        self.assertEqual(["Copper", "Iron"], list(results.keys()))
+        self.assertEqual(["Unobtainium"], unknown)
+        self.assertAlmostEqual(self.iron.calc_skindepth(1.0E3), results["Iron"][1], places=12)
+        self.assertEqual(["Copper", "Iron"], self.run_futures(self.testctrl.fetchlist()))
+
+    def test_update(self):
+        '''Verify readers see a change made on the writer thread once it's commited'''
+        self.run_futures(self.testctrl.calcdelta("Copper", 60.))
+        self.run_futures(self.testctrl.add({"name":"Copper", "notes":"", "iacs":self.iron.iacs,
+                                            "mu_r":self.iron.mu_r}))
+        self.assertAlmostEqual(self.copper.calc_skindepth(60.),
+                               self.run_futures(self.testctrl.calcdelta("Copper", 60.)), places=12)
+        self.run_futures(self.testctrl.update())
+        for idx in range(4):
+            self.assertAlmostEqual(self.iron.calc_skindepth(60.),
+                                   self.run_futures(self.testctrl.calcdelta("Copper", 60.)), places=12)
+
+    def test_errors(self):
+        '''Verify exceptions are passed to the awaiting caller'''
+        self.assertRaises(ValueError, self.run_futures, self.testctrl.read(self.testctrl.controller.find_materials, 60.))
+
+    def tearDown(self):
+        self.testctrl.close()
+        self.loop.close()
+        fixtures.MaterialsTestCase.tearDown(self)
+
+def run():
+    '''Runs the suite of tests'''
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestAsyncSkinDepthController)
+    unittest.TextTestRunner(verbosity=2).run(suite)
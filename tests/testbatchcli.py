@@ -0,0 +1,77 @@
+'''testbatchcli.py- Tests the headless batch frontend'''
+
+import json
+import os.path
+import subprocess
+import sys
+import unittest
+from platform import batchcli
+from tests import fixtures
+
+class TestBatchCLI(fixtures.MaterialsTestCase):
+    '''Tests the batch calculation command line frontend'''
+    dbname = "batch.db"
+
+    def setUp(self):
+        fixtures.MaterialsTestCase.setUp(self)
+        self.open_controller().db.close()
+
+    def run_batch(self, lines, **kwargs):
+        '''Runs the batch calculation of the input lines, returning the output lines'''
+        output = batchcli._LineWriter()
+        batchcli.run(self.db_path, [lines], output, **kwargs)
+        return ''.join(output.lines).splitlines()
+
+    def test_csv(self):
+        '''Verify calculating CSV records'''
+        lines = ["units,value,material\n", "kHz,1,Copper\n", "mm,1.5,Iron\n", "Hz,60,Adamantium\n", "Hz,x,Iron\n",
+                 "furlongs,1,Iron\n"]
+        output = self.run_batch(lines)
+        self.assertEqual(",".join(batchcli.CSV_COLUMNS), output[0])
+        self.assertEqual(6, len(output))
+        material, value, units, result, result_units, error = output[1].split(",")
+        self.assertEqual(("Copper", "kHz", "mm", ""), (material, units, result_units, error))
+        self.assertAlmostEqual(self.copper.calc_skindepth(1.0E3) * 1.0E3, float(result), places=9)
+        result = float(output[2].split(",")[3])
+        self.assertAlmostEqual(self.iron.calc_frequency(1.5E-3), result, delta=1e-9 * result)
+        self.assertEqual(["unknown material", "value is not a number", "unknown units"],
+                         [line.split(",")[-1] for line in output[3:]])
+        # Without a header the fields are material, value, units
+        self.assertEqual(output, self.run_batch(["Copper,1,kHz\n", "Iron,1.5,mm\n", "Adamantium,60,Hz\n",
+                                                     "Iron,x,Hz\n", "Iron,1,furlongs\n"]))
+
+    def test_jsonl(self):
+        '''Verify calculating JSON lines records'''
+        lines = ['{"material": "Iron", "value": 60, "units": "Hz"}\n', '{"material": "Iron", "value": 0, "units": "Hz"}\n',
+                 'Iron,60,Hz\n']
+        output = [json.loads(line) for line in self.run_batch(lines, fmt="jsonl", depth_units="m")]
+        self.assertAlmostEqual(self.iron.calc_skindepth(60.), output[0]["result"], places=12)
+        self.assertEqual("m", output[0]["result_units"])
+        self.assertFalse("error" in output[0])
+        self.assertEqual((None, "no finite result"), (output[1]["result"], output[1]["error"]))
+        self.assertEqual("unreadable record", output[2]["error"])
+
+    def test_parallel(self):
+        '''Verify worker processes give the same output in the same order'''
+        lines = ["{0},{1},{2}\n".format(name, idx + 1, units) for idx in range(50)
+                 for name, units in (("Iron", "Hz"), ("Copper", "kHz"), ("Iron", "inches"))]
+        expected = self.run_batch(lines, chunksize=1000)
+        self.assertEqual(len(lines) + 1, len(expected))
+        self.assertEqual(expected, self.run_batch(lines, jobs=2, chunksize=7))
+
+    def test_no_wx(self):
+        '''Verify the batch frontend runs without wxPython, in a new interpreter where importing wx fails'''
+        code = ("import sys; sys.modules['wx'] = None; from platform import batchcli; "
+                "sys.exit(batchcli.main(sys.argv[1:]))")
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        for args, stdin in ((["--help"], b""), (["--db", self.db_path], b"Iron,60,Hz\n")):
+            process = subprocess.Popen([sys.executable, "-c", code] + args, cwd=root, stdin=subprocess.PIPE,
+                                       stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+            output, errors = process.communicate(stdin)
+            self.assertEqual(0, process.returncode, errors)
+        self.assertTrue(b"Iron,60" in output)
+
+def run():
+    '''Runs the suite of tests'''
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestBatchCLI)
+    unittest.TextTestRunner(verbosity=2).run(suite)
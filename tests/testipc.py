@@ -0,0 +1,128 @@
+'''testipc.py- Tests the local socket calculation server and client'''
+
+import os
+import socket
+import struct
+import threading
+import unittest
+from platform import SkinDepthIPC
+from tests import fixtures
+
+class TestSkinDepthIPC(fixtures.MaterialsTestCase):
+    '''Tests the local socket calculation server and client'''
+    dbname = "ipc.db"
+
+    def setUp(self):
+        fixtures.MaterialsTestCase.setUp(self)
+        self.controller = self.open_controller(threaded=True)
+        if hasattr(socket, "AF_UNIX"):
+            self.address = os.path.join(self.temp_dir, "skindepth.sock")
+        else:
+            self.address = ("127.0.0.1", 0)
+        self.server = SkinDepthIPC.SkinDepthIPCServer(self.address, self.controller)
+        self.server_thread = threading.Thread(target=self.server.serve_forever, kwargs={"poll_interval":0.05})
+        self.server_thread.start()
+        self.client = SkinDepthIPC.SkinDepthIPCClient(self.server.server_address, timeout=10)
+
+    def test_calculations(self):
+        '''Verify single calculations'''
+        self.assertTrue(self.client.ping())
+        self.assertAlmostEqual(self.iron.calc_skindepth(60.), self.client.calcdelta("Iron", 60.), places=12)
+        self.assertAlmostEqual(self.copper.calc_frequency(1.0E-3), self.client.calcfrequency(u"Copper", 1.0E-3),
+                               places=6)
+        self.assertEqual(None, self.client.calcdelta("Adamantium", 60.))
+        frequencies = [60., 1.0E3, 1.0E6]
+        for expected, result in zip(self.iron.calc_skindepths(frequencies),
+                                    self.client.calcdelta_many("Iron", frequencies)):
+            self.assertAlmostEqual(expected, result, places=12)
+        depths = [1.0E-3, 1.0E-4]
+        for expected, result in zip(self.copper.calc_frequencies(depths),
+                                    self.client.calcfrequency_many("Copper", depths)):
+            self.assertAlmostEqual(expected, result, places=4)
+        self.assertEqual(None, self.client.calcfrequency_many("Adamantium", depths))
+
+    def test_pipeline(self):
+        '''Verify pipelined requests are answered in order'''
+        calls = [("calcdelta", "Iron", float(freq)) for freq in range(1, 201)]
+        calls.append(("calcdelta", "Adamantium", 60.))
+        calls.append(("calcfrequency", "Copper", 1.0E-3))
+        results = self.client.pipeline(calls)
+        self.assertEqual(len(calls), len(results))
+        for freq, result in zip(range(1, 201), results):
+            self.assertAlmostEqual(self.iron.calc_skindepth(float(freq)), result, places=12)
+        self.assertEqual(None, results[-2])
+        self.assertAlmostEqual(self.copper.calc_frequency(1.0E-3), results[-1], places=6)
+
+    def test_pipeline_large(self):
+        '''Verify a pipeline larger than the socket buffers doesn't deadlock'''
+        results = self.client.pipeline([("calcdelta", "Iron", 60.)] * 50000)
+        self.assertEqual(50000, len(results))
+        self.assertEqual(set([self.iron.calc_skindepth(60.)]), set(results))
+        self.assertAlmostEqual(self.iron.calc_skindepth(60.), self.client.calcdelta("Iron", 60.), places=12)
+
+    def test_batch(self):
+        '''Verify batch frames'''
+        results = self.client.batch([("calcdelta", "Iron", 60.), ("calcfrequency", "Copper", 1.0E-3),
+                                     ("calcdelta", "Adamantium", 60.), ("calcdelta", "Iron", 1.0E3)])
+        self.assertAlmostEqual(self.iron.calc_skindepth(60.), results[0], places=12)
+        self.assertAlmostEqual(self.copper.calc_frequency(1.0E-3), results[1], places=6)
+        self.assertEqual(None, results[2])
+        self.assertAlmostEqual(self.iron.calc_skindepth(1.0E3), results[3], places=12)
+        self.assertEqual([], self.client.batch([]))
+
+    def test_bad_requests(self):
+        '''Verify malformed requests are answered with an error and don't drop the connection'''
+        request = struct.pack("!BI", 99, 7)
+        self.client.socket.sendall(struct.pack("!I", len(request)) + request)
+        responseid, status = struct.unpack_from("!IB", self.client._receive())
+        self.assertEqual((7, SkinDepthIPC.STATUS_BAD_REQUEST), (responseid, status))
+        request = struct.pack("!BI", SkinDepthIPC.OP_SKINDEPTH, 8) + SkinDepthIPC.pack_name("Iron")
+        self.client.socket.sendall(struct.pack("!I", len(request)) + request)
+        responseid, status = struct.unpack_from("!IB", self.client._receive())
+        self.assertEqual((8, SkinDepthIPC.STATUS_BAD_REQUEST), (responseid, status))
+        self.assertRaises(ValueError, self.client.pipeline, [("teleport", "Iron")])
+        self.assertAlmostEqual(self.iron.calc_skindepth(60.), self.client.calcdelta("Iron", 60.), places=12)
+
+    def test_clients(self):
+        '''Verify concurrent clients'''
+        errors = []
+        def worker():
+            client = SkinDepthIPC.SkinDepthIPCClient(self.server.server_address, timeout=10)
+            try:
+                for freq in range(1, 51):
+                    if abs(client.calcdelta("Iron", float(freq)) - self.iron.calc_skindepth(float(freq))) > 1e-12:
+                        errors.append(freq)
+            finally:
+                client.close()
+        threads = [threading.Thread(target=worker) for i in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual([], errors)
+
+    @unittest.skipIf(not hasattr(socket, "AF_UNIX"), "Unix sockets not available")
+    def test_existing_file(self):
+        '''Verify an existing socket at the path is replaced, and anything else is left alone'''
+        server = SkinDepthIPC.SkinDepthIPCServer(self.address, self.controller)
+        server.server_close()
+        self.assertFalse(os.path.exists(self.address))
+        path = os.path.join(self.temp_dir, "notasocket")
+        with open(path, "w") as fidout:
+            fidout.write("keep me")
+        self.assertRaises(OSError, SkinDepthIPC.SkinDepthIPCServer, path, self.controller)
+        with open(path) as fidin:
+            self.assertEqual("keep me", fidin.read())
+
+    def tearDown(self):
+        self.client.close()
+        self.server.shutdown()
+        self.server.server_close()
+        self.server_thread.join()
+        self.controller.db.close()
+        fixtures.MaterialsTestCase.tearDown(self)
+
+def run():
+    '''Runs the suite of tests'''
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestSkinDepthIPC)
+    unittest.TextTestRunner(verbosity=2).run(suite)
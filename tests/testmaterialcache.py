@@ -0,0 +1,60 @@
+'''testmaterialcache.py- Tests the controller's least-recently-used material cache'''
+
+import unittest
+from platform import MaterialCache
+from material import Material
+
+class TestMaterialCache(unittest.TestCase):
+    '''Tests the MaterialCache class'''
+
+    def setUp(self):
+        self.testcache = MaterialCache.MaterialCache(maxsize=2)
+        self.iron = Material.Material(name="Iron", sigma_iacs=18, mu_rel=150, notes="Pure Iron")
+        self.copper = Material.Material(name="Copper", sigma_iacs=100, mu_rel=1, notes="IACS Copper Standard")
+        self.water = Material.Material(name="Water", sigma_iacs=4.353e-10, mu_rel=1, notes="Tap water")
+
+    def test_getput(self):
+        '''Verify cache hits and misses'''
+        self.assertEqual(None, self.testcache.get("Iron"))
+        self.testcache.put(self.iron)
+        self.assertTrue(self.testcache.get("Iron") is self.iron)
+        stats = self.testcache.stats()
+        self.assertEqual(1, stats["hits"])
+        self.assertEqual(1, stats["misses"])
+        self.assertEqual(1, stats["size"])
+
+    def test_eviction(self):
+        '''Verify the least recently used material is evicted when the cache is full'''
+        self.testcache.put(self.iron)
+        self.testcache.put(self.copper)
+        self.testcache.get("Iron")
+        self.testcache.put(self.water)
+        self.assertTrue("Iron" in self.testcache)
+        self.assertFalse("Copper" in self.testcache)
+        self.assertTrue("Water" in self.testcache)
+        self.assertEqual(1, self.testcache.stats()["evictions"])
+        self.assertEqual(2, len(self.testcache))
+
+    def test_invalidate(self):
+        '''Verify dropping one or all materials from the cache'''
+        self.testcache.put(self.iron)
+        self.testcache.put(self.copper)
+        self.testcache.invalidate("Iron")
+        self.assertFalse("Iron" in self.testcache)
+        self.assertTrue("Copper" in self.testcache)
+        self.testcache.invalidate()
+        self.assertEqual(0, len(self.testcache))
+
+    def test_generation(self):
+        '''Verify a material read before an invalidation isn't cached'''
+        generation = self.testcache.generation
+        self.testcache.invalidate("Iron")
+        self.testcache.put(self.iron, generation)
+        self.assertFalse("Iron" in self.testcache)
+        self.testcache.put(self.iron, self.testcache.generation)
+        self.assertTrue("Iron" in self.testcache)
+
+def run():
+    '''Runs the suite of tests'''
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestMaterialCache)
+    unittest.TextTestRunner(verbosity=2).run(suite)
@@ -0,0 +1,74 @@
+'''testmaterialcatalog.py- Tests the struct-of-arrays MaterialCatalog'''
+
+import math
+import unittest
+from material import MaterialCatalog
+from material import MaterialDB
+from material import Material
+
+class TestMaterialCatalog(unittest.TestCase):
+    '''Tests the MaterialCatalog class'''
+
+    def setUp(self):
+        self.testdb = MaterialDB.MaterialDB(":memory:")
+        self.testdb.connect()
+        self.testdb.create()
+        self.materials = [
+            Material.Material(name="Copper", sigma_iacs=100, mu_rel=1, notes="IACS Copper Standard"),
+            Material.Material(name="Iron", sigma_iacs=18, mu_rel=150, notes="Pure Iron"),
+            Material.Material(name="Teflon", sigma_iacs=0, mu_rel=1, notes="Insulator")]
+        for amaterial in self.materials:
+            self.testdb.add(amaterial)
+
+    def test_fromdb(self):
+        '''Verify building a catalog from the database'''
+        catalog = MaterialCatalog.MaterialCatalog.fromdb(self.testdb)
+        self.assertEqual(len(self.materials), len(catalog))
+        self.assertEqual(["Copper", "Iron", "Teflon"], catalog.names)
+        self.assertAlmostEqual(18, catalog.iacs[catalog.index("Iron")], places=6)
+        self.assertAlmostEqual(150, catalog.mu_r[catalog.index("Iron")], places=6)
+
+    def test_views(self):
+        '''Verify Materials are created on demand from the catalog'''
+        catalog = MaterialCatalog.MaterialCatalog.fromdb(self.testdb)
+        iron = catalog.retrieve("Iron")
+        self.assertTrue(isinstance(iron, Material.Material))
+        self.assertEqual("Pure Iron", iron.notes)
+        self.assertAlmostEqual(self.materials[1].calc_skindepth(60), iron.calc_skindepth(60), places=12)
+        self.assertEqual(None, catalog.retrieve("Adamantium"))
+        self.assertTrue("Teflon" in catalog)
+        self.assertFalse("Adamantium" in catalog)
+        self.assertEqual(["Copper", "Iron", "Teflon"], [amaterial.name for amaterial in catalog])
+
+    def test_skindepth_matrix(self):
+        '''Verify the (materials x frequencies) skin depth matrix matches the per-material calculation'''
+        catalog = MaterialCatalog.MaterialCatalog(self.materials)
+        freqs = [0., 60., 1.0E3, -1.]
+        depths = catalog.skindepth_matrix(freqs)
+        self.assertEqual(len(self.materials), len(depths))
+        for amaterial, row in zip(self.materials, depths):
+            for freq, depth in zip(freqs, row):
+                expected = amaterial.calc_skindepth(freq)
+                if math.isnan(expected):
+                    self.assertTrue(math.isnan(depth))
+                else:
+                    self.assertAlmostEqual(expected, depth, places=12)
+
+    def test_frequency_matrix(self):
+        '''Verify the (materials x depths) excitation frequency matrix matches the per-material calculation'''
+        catalog = MaterialCatalog.MaterialCatalog(self.materials)
+        attenuations = [1.272e-3, 0.75, 0.]
+        freqs = catalog.frequency_matrix(attenuations)
+        for amaterial, row in zip(self.materials, freqs):
+            for attenuation, freq in zip(attenuations, row):
+                self.assertAlmostEqual(amaterial.calc_frequency(attenuation), freq,
+                    delta=1e-9*amaterial.calc_frequency(attenuation))
+
+    def tearDown(self):
+        '''Closes the SQLite3 database in memory'''
+        self.testdb.close()
+
+def run():
+    '''Runs the suite of tests'''
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestMaterialCatalog)
+    unittest.TextTestRunner(verbosity=2).run(suite)
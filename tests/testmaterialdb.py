@@ -1,239 +1,665 @@
-'''testmaterialdb.py- Tests the sqlite3 interface'''
-
-import os
-import os.path
-import sqlite3
-import tempfile
-import unittest
-from material import MaterialDB
-from material import Material
-
-class TestMaterialDB(unittest.TestCase):
-    '''Tests the SQLite3 database for SkinDepth'''
-
-    def setUp(self):
-        self.testdb = MaterialDB.MaterialDB(":memory:")
-        self.testdb.connect()
-        self.testdb.create()
-
-    def test_badconnection(self):
-        '''Verify throws OperationalError if unable to connect to database'''
-        atestdb = MaterialDB.MaterialDB("x:/werd/test.db")
-        try:
-            with self.assertRaises(sqlite3.OperationalError):
-                atestdb.connect()
-                atestdb.create()
-        except TypeError:
-            # Handle assertRaises under 2.6
-            self.assertRaises(sqlite3.OperationalError,atestdb.connect)
-
-    def test_add(self):
-        '''Verify adding / revising materials'''
-        testmaterial = Material.Material(name="Iron", sigma_iacs=18, mu_rel=150, notes="Pure Iron")
-        self.testdb.add(testmaterial)
-        retrieved_material = self.testdb.retrieve("Iron")
-        self.assertEqual(testmaterial.name, retrieved_material.name)
-        self.assertEqual(testmaterial.notes, retrieved_material.notes)
-        try:
-            self.assertAlmostEqual(testmaterial.iacs, retrieved_material.iacs, delta=0.01*testmaterial.iacs)
-            self.assertAlmostEqual(testmaterial.mu_r, retrieved_material.mu_r, delta=0.01*testmaterial.mu_r)
-        except TypeError:
-            # Use places instead of delta for 2.6
-            self.assertAlmostEqual(testmaterial.iacs, retrieved_material.iacs, places=1)
-            self.assertAlmostEqual(testmaterial.mu_r, retrieved_material.mu_r, places=1)
-
-        #Verify adding material w. existing material's name updates the existing entry
-        newiron = Material.Material(name="Iron", sigma_iacs=18, mu_rel=5000,
-            notes="Relative Permeability can range anywhere between 150 to 5000")
-        self.testdb.add(newiron)
-        revised_material = self.testdb.retrieve("Iron")
-        self.assertEqual(newiron.name, revised_material.name)
-        self.assertEqual(newiron.notes, revised_material.notes)
-        try:
-            self.assertAlmostEqual(newiron.iacs, revised_material.iacs, delta=0.01*newiron.iacs)
-            self.assertAlmostEqual(newiron.mu_r, revised_material.mu_r, delta=0.01*newiron.mu_r)
-        except TypeError:
-            # Use places instead of delta for 2.6
-            self.assertAlmostEqual(newiron.iacs, revised_material.iacs, places=1)
-            self.assertAlmostEqual(newiron.mu_r, revised_material.mu_r, places=1)
-
-    def test_retrieve(self):
-        '''Verify retrieving materials'''
-        copper = Material.Material(name="Copper", sigma_iacs=100, mu_rel=1, notes="IACS Copper Standard")
-        self.testdb.add(copper)
-        retrieved = self.testdb.retrieve("Copper")
-        self.assertEqual(copper.name, retrieved.name)
-        self.assertEqual(copper.notes, retrieved.notes)
-        try:
-            self.assertAlmostEqual(copper.iacs, retrieved.iacs, delta=0.01*copper.iacs)
-            self.assertAlmostEqual(copper.mu_r, retrieved.mu_r, delta=0.01*copper.mu_r)
-        except TypeError:
-            # Use places instead of delta for 2.6
-            self.assertAlmostEqual(copper.iacs, retrieved.iacs, places=1)
-            self.assertAlmostEqual(copper.mu_r, retrieved.mu_r, places=1)
-
-    def test_retrieveall(self):
-        '''Verify retrieving complete material list'''
-        copper = Material.Material(name="Copper", sigma_iacs=100, mu_rel=1, notes="IACS Copper Standard")
-        self.testdb.add(copper)
-        iron = Material.Material(name="Iron", sigma_iacs=18, mu_rel=150, notes="Pure Iron")
-        self.testdb.add(iron)
-        aluminum = Material.Material(name="Aluminum", sigma_iacs=61, mu_rel=1, notes="Unalloyed Pure Aluminum")
-        self.testdb.add(aluminum)
-        cobalt = Material.Material(name="Cobalt", sigma_iacs=27.6, mu_rel=70, 
-            notes="Relative permeability can range between 70-250")
-        self.testdb.add(cobalt)
-        water = Material.Material(name="Water", sigma_iacs=4.353e-10, mu_rel=1, notes="Tap water")
-        self.testdb.add(water)
-        input_materials = [copper, iron, aluminum, cobalt, water]
-        retrieved_materials = self.testdb.retrieveall()
-        self.assertEqual(len(input_materials), len(retrieved_materials))
-        for im in input_materials:
-            for rm in retrieved_materials:
-                if im.name == rm.name:
-                    self.assertEqual(im.notes, rm.notes)
-                    try:
-                        self.assertAlmostEqual(im.iacs, rm.iacs, delta=0.01*im.iacs)
-                        self.assertAlmostEqual(im.mu_r, rm.mu_r, delta=0.01*im.mu_r)
-                    except TypeError:
-                        # Use places instead of delta for 2.6
-                        self.assertAlmostEqual(im.iacs, rm.iacs, places=1)
-                        self.assertAlmostEqual(im.mu_r, rm.mu_r, places=1)
-
-    def test_noentry(self):
-        '''Verifying retrieve returns None when no entry found'''
-        self.assertEqual(None, self.testdb.retrieve("Adamantium"))
-
-    def test_delete(self):
-        '''Verify deletion of an existing entry'''
-        testmaterial = Material.Material(name="Iron", sigma_iacs=18, mu_rel=150, notes="Pure Iron")
-        self.testdb.add(testmaterial)
-        self.testdb.delete(testmaterial.name)
-        retrieved = self.testdb.retrieve(testmaterial.name)
-        self.assertEqual(None, retrieved)
-
-    def test_undo(self):
-        '''Verify rollback of last operation'''
-        origmaterial = Material.Material(name="Iron", sigma_iacs=18, mu_rel=150, notes="Pure Iron")
-        self.testdb.add(origmaterial, update=True)
-        newiron = Material.Material(name="Iron", sigma_iacs=18, mu_rel=5000,
-            notes="Relative Permeability can range anywhere between 150 to 5000")
-        self.testdb.add(newiron)
-        self.testdb.undo()
-        revised_material = self.testdb.retrieve("Iron")
-        self.assertEqual(origmaterial.name, revised_material.name)
-        self.assertEqual(origmaterial.notes, revised_material.notes)
-        try:
-            self.assertAlmostEqual(origmaterial.iacs, revised_material.iacs, delta=0.01*origmaterial.iacs)
-            self.assertAlmostEqual(origmaterial.mu_r, revised_material.mu_r, delta=0.01*origmaterial.mu_r)
-        except TypeError:
-            # Use places instead of delta for 2.6
-            self.assertAlmostEqual(origmaterial.iacs, revised_material.iacs, places=1)
-            self.assertAlmostEqual(origmaterial.mu_r, revised_material.mu_r, places=1)
-
-    def test_exportimportsql(self):
-        '''Verifying export and import of SQL'''
-        testmaterial = Material.Material(name="Iron", sigma_iacs=18, mu_rel=150, notes="Pure Iron")
-        self.testdb.add(testmaterial)
-        self.testdb.update()
-        temp_sql_file = tempfile.NamedTemporaryFile(delete=False)
-        self.testdb.exportsql(temp_sql_file.name)
-        file_db = MaterialDB.MaterialDB(":memory:")
-        file_db.importsql(temp_sql_file.name)
-        retrieved_material = file_db.retrieve("Iron")
-        temp_sql_file.close()
-        if os.path.exists(temp_sql_file.name):
-            os.remove(temp_sql_file.name)
-        self.assertEqual(testmaterial.name, retrieved_material.name)
-        self.assertEqual(testmaterial.notes, retrieved_material.notes)
-        try:
-            self.assertAlmostEqual(testmaterial.iacs , retrieved_material.iacs, delta=0.01*testmaterial.iacs)
-            self.assertAlmostEqual(testmaterial.mu_r, retrieved_material.mu_r, delta=0.01*testmaterial.mu_r)
-        except TypeError:
-            # Use places instead of delta for 2.6
-            self.assertAlmostEqual(testmaterial.iacs , retrieved_material.iacs, places=1)
-            self.assertAlmostEqual(testmaterial.mu_r, retrieved_material.mu_r, places=1)
-
-    def test_importdb(self):
-        '''Verify importing another database'''
-        copper = Material.Material(name="Copper", sigma_iacs=100, mu_rel=1, notes="IACS Copper Standard")
-        self.testdb.add(copper)
-        iron = Material.Material(name="Iron", sigma_iacs=18, mu_rel=150, notes="Pure Iron")
-        self.testdb.add(iron)
-        aluminum = Material.Material(name="Aluminum", sigma_iacs=61, mu_rel=1, notes="Unalloyed Pure Aluminum")
-        self.testdb.add(aluminum)
-        cobalt = Material.Material(name="Cobalt", sigma_iacs=27.6, mu_rel=70, 
-            notes="Relative permeability can range between 70-250")
-        self.testdb.add(cobalt)
-        water = Material.Material(name="Water", sigma_iacs=4.353e-10, mu_rel=1, notes="Tap water")
-        self.testdb.add(water)
-        # Create another database for import
-        another_db_fn = tempfile.NamedTemporaryFile(delete=False)
-        another_db = MaterialDB.MaterialDB(another_db_fn.name)
-        another_db.connect()
-        another_db.create()
-        # Create another Cobalt, make sure it doesn't overwrite the existing
-        fake_cobalt = Material.Material(name="Cobalt", sigma_iacs=1000, mu_rel=7e10, 
-            notes="Relative permeability can range between 70-250")
-        another_db.add(fake_cobalt)
-        another_db.add(water)
-        # Create a couple of new materials for import
-        unobtanium = Material.Material(name="Unobtanium", sigma_iacs=1.0, mu_rel=1.0, 
-            notes="Not a real material, sorry.")
-        vibranium = Material.Material(name="Vibranium", sigma_iacs=1.0, mu_rel=1.0, notes="Captain America's shield")
-        another_db.add(unobtanium)
-        another_db.add(vibranium)
-        another_db.close(update=True)
-        # Import the new database, and check the results
-        self.testdb.importdb(another_db_fn.name)
-        # Verify we didn't overwrite the good Cobalt entry
-        cobalt_entry = self.testdb.retrieve("Cobalt")
-        self.assertEqual(cobalt_entry.name, cobalt.name)
-        self.assertEqual(cobalt_entry.notes, cobalt.notes)
-        try:
-            self.assertAlmostEqual(cobalt_entry.iacs, cobalt.iacs, delta=0.01*cobalt_entry.iacs)
-            self.assertAlmostEqual(cobalt_entry.mu_r, cobalt.mu_r, delta=0.01*cobalt_entry.mu_r)
-        except TypeError:
-            # Use places instead of delta for 2.6
-            self.assertAlmostEqual(cobalt_entry.iacs, cobalt.iacs, places=1)
-            self.assertAlmostEqual(cobalt_entry.mu_r, cobalt.mu_r, places=1)
-        # Now verify we did import the other two materials that were unique
-        unobtanium_entry = self.testdb.retrieve("Unobtanium")
-        self.assertEqual(unobtanium_entry.name, unobtanium.name)
-        self.assertEqual(unobtanium_entry.notes, unobtanium.notes)
-        try:
-            self.assertAlmostEqual(unobtanium_entry.iacs, unobtanium.iacs, delta=0.01*unobtanium.iacs)
-            self.assertAlmostEqual(unobtanium_entry.mu_r, unobtanium.mu_r, delta=0.01*unobtanium.mu_r)
-        except TypeError:
-            # Use places instead of delta for 2.6
-            self.assertAlmostEqual(unobtanium_entry.iacs, unobtanium.iacs, places=1)
-            self.assertAlmostEqual(unobtanium_entry.mu_r, unobtanium.mu_r, places=1)
-        vibranium_entry = self.testdb.retrieve("Vibranium")
-        self.assertEqual(vibranium_entry.name, vibranium.name)
-        self.assertEqual(vibranium_entry.notes, vibranium.notes)
-        try:
-            self.assertAlmostEqual(vibranium_entry.iacs, vibranium.iacs, delta=0.01*vibranium.iacs)
-            self.assertAlmostEqual(vibranium_entry.mu_r, vibranium.mu_r, delta=0.01*vibranium.mu_r)
-        except TypeError:
-            # Use places instead of delta for 2.6
-            self.assertAlmostEqual(vibranium_entry.iacs, vibranium.iacs, places=1)
-            self.assertAlmostEqual(vibranium_entry.mu_r, vibranium.mu_r, places=1)
-        another_db_fn.close()
-
-    def test_importbaddb(self):
-        '''Verify that attempting to import a bad SQLite3 database raises an exception'''
-        try:
-            with self.assertRaises(sqlite3.OperationalError):
-                self.testdb.importdb("x:/werd/test.db")
-        except TypeError:
-            # Handles assertRaises under 2.6
-            self.assertRaises(sqlite3.OperationalError, self.testdb.importdb, "x:/werd/test.db")
-
-    def tearDown(self):
-        '''Closes the SQLite3 database in memory'''
-        self.testdb.close()
-
-def run():
-    '''Runs the suite of tests'''
-    suite = unittest.TestLoader().loadTestsFromTestCase(TestMaterialDB)
+'''testmaterialdb.py- Tests the sqlite3 interface'''
+
+import os
+import os.path
+import sqlite3
+import stat
+import tempfile
+import threading
+import time
+import unittest
+from material import MaterialDB
+from material import Material
+
+class TestMaterialDB(unittest.TestCase):
+    '''Tests the SQLite3 database for SkinDepth'''
+
+    def setUp(self):
+        self.testdb = MaterialDB.MaterialDB(":memory:")
+        self.testdb.connect()
+        self.testdb.create()
+
+    def test_badconnection(self):
+        '''Verify throws OperationalError if unable to connect to database'''
+        atestdb = MaterialDB.MaterialDB("x:/werd/test.db")
+        try:
+            with self.assertRaises(sqlite3.OperationalError):
+                atestdb.connect()
+                atestdb.create()
+        except TypeError:
+            # Handle assertRaises under 2.6
+            self.assertRaises(sqlite3.OperationalError,atestdb.connect)
+
+    def test_add(self):
+        '''Verify adding / revising materials'''
+        testmaterial = Material.Material(name="Iron", sigma_iacs=18, mu_rel=150, notes="Pure Iron")
+        self.testdb.add(testmaterial)
+        retrieved_material = self.testdb.retrieve("Iron")
+        self.assertEqual(testmaterial.name, retrieved_material.name)
+        self.assertEqual(testmaterial.notes, retrieved_material.notes)
+        try:
+            self.assertAlmostEqual(testmaterial.iacs, retrieved_material.iacs, delta=0.01*testmaterial.iacs)
+            self.assertAlmostEqual(testmaterial.mu_r, retrieved_material.mu_r, delta=0.01*testmaterial.mu_r)
+        except TypeError:
+            # Use places instead of delta for 2.6
+            self.assertAlmostEqual(testmaterial.iacs, retrieved_material.iacs, places=1)
+            self.assertAlmostEqual(testmaterial.mu_r, retrieved_material.mu_r, places=1)
+
+        #Verify adding material w. existing material's name updates the existing entry
+        newiron = Material.Material(name="Iron", sigma_iacs=18, mu_rel=5000,
+            notes="Relative Permeability can range anywhere between 150 to 5000")
+        self.testdb.add(newiron)
+        revised_material = self.testdb.retrieve("Iron")
+        self.assertEqual(newiron.name, revised_material.name)
+        self.assertEqual(newiron.notes, revised_material.notes)
+        try:
+            self.assertAlmostEqual(newiron.iacs, revised_material.iacs, delta=0.01*newiron.iacs)
+            self.assertAlmostEqual(newiron.mu_r, revised_material.mu_r, delta=0.01*newiron.mu_r)
+        except TypeError:
+            # Use places instead of delta for 2.6
+            self.assertAlmostEqual(newiron.iacs, revised_material.iacs, places=1)
+            self.assertAlmostEqual(newiron.mu_r, revised_material.mu_r, places=1)
+
+    def test_add_many(self):
+        '''Verify bulk adding / revising materials from Materials and row tuples'''
+        copper = Material.Material(name="Copper", sigma_iacs=100, mu_rel=1, notes="IACS Copper Standard")
+        iron = Material.Material(name="Iron", sigma_iacs=18, mu_rel=150, notes="Pure Iron")
+        self.testdb.add(iron)
+        rows = [copper, ("Iron", "Relative Permeability can range anywhere between 150 to 5000", 18, 5000),
+                ("Water", "Tap water", 4.353e-10, 1)]
+        self.assertEqual(3, self.testdb.add_many(iter(rows)))
+        self.assertEqual(["Copper", "Iron", "Water"], [amaterial.name for amaterial in self.testdb.iter_all()])
+        revised_iron = self.testdb.retrieve("Iron")
+        self.assertEqual(rows[1][1], revised_iron.notes)
+        self.assertAlmostEqual(5000, revised_iron.mu_r, places=6)
+        self.assertEqual(0, self.testdb.add_many([]))
+
+    def test_retrieve(self):
+        '''Verify retrieving materials'''
+        copper = Material.Material(name="Copper", sigma_iacs=100, mu_rel=1, notes="IACS Copper Standard")
+        self.testdb.add(copper)
+        retrieved = self.testdb.retrieve("Copper")
+        self.assertEqual(copper.name, retrieved.name)
+        self.assertEqual(copper.notes, retrieved.notes)
+        try:
+            self.assertAlmostEqual(copper.iacs, retrieved.iacs, delta=0.01*copper.iacs)
+            self.assertAlmostEqual(copper.mu_r, retrieved.mu_r, delta=0.01*copper.mu_r)
+        except TypeError:
+            # Use places instead of delta for 2.6
+            self.assertAlmostEqual(copper.iacs, retrieved.iacs, places=1)
+            self.assertAlmostEqual(copper.mu_r, retrieved.mu_r, places=1)
+
+    def test_retrieve_many(self):
+        '''Verify retrieving a list of materials, in order, in chunks'''
+        names = ["Alloy {0:02d}".format(idx) for idx in range(30)]
+        self.testdb.add_many((name, None, idx, 1.0) for idx, name in enumerate(names))
+        wanted = ["Alloy 07", "Adamantium", "Alloy 29", "Alloy 00", "Alloy 07", "Mithril"] + names[10:20]
+        materials, missing = self.testdb.retrieve_many(wanted, chunksize=4)
+        self.assertEqual(["Adamantium", "Mithril"], missing)
+        self.assertEqual(sorted(["Alloy 07", "Alloy 29", "Alloy 00"] + names[10:20]), sorted(materials.keys()))
+        self.assertAlmostEqual(29, materials["Alloy 29"].iacs, places=6)
+        self.assertEqual(({}, []), self.testdb.retrieve_many([]))
+
+    def test_retrieveall(self):
+        '''Verify retrieving complete material list'''
+        copper = Material.Material(name="Copper", sigma_iacs=100, mu_rel=1, notes="IACS Copper Standard")
+        self.testdb.add(copper)
+        iron = Material.Material(name="Iron", sigma_iacs=18, mu_rel=150, notes="Pure Iron")
+        self.testdb.add(iron)
+        aluminum = Material.Material(name="Aluminum", sigma_iacs=61, mu_rel=1, notes="Unalloyed Pure Aluminum")
+        self.testdb.add(aluminum)
+        cobalt = Material.Material(name="Cobalt", sigma_iacs=27.6, mu_rel=70, 
+            notes="Relative permeability can range between 70-250")
+        self.testdb.add(cobalt)
+        water = Material.Material(name="Water", sigma_iacs=4.353e-10, mu_rel=1, notes="Tap water")
+        self.testdb.add(water)
+        input_materials = [copper, iron, aluminum, cobalt, water]
+        retrieved_materials = self.testdb.retrieveall()
+        self.assertEqual(len(input_materials), len(retrieved_materials))
+        for im in input_materials:
+            for rm in retrieved_materials:
+                if im.name == rm.name:
+                    self.assertEqual(im.notes, rm.notes)
+                    try:
+                        self.assertAlmostEqual(im.iacs, rm.iacs, delta=0.01*im.iacs)
+                        self.assertAlmostEqual(im.mu_r, rm.mu_r, delta=0.01*im.mu_r)
+                    except TypeError:
+                        # Use places instead of delta for 2.6
+                        self.assertAlmostEqual(im.iacs, rm.iacs, places=1)
+                        self.assertAlmostEqual(im.mu_r, rm.mu_r, places=1)
+
+    def test_iter_all(self):
+        '''Verify streaming the complete material list in chunks'''
+        names = ["Water", "Copper", "Iron", "Aluminum", "Cobalt"]
+        for name in names:
+            self.testdb.add(Material.Material(name=name, sigma_iacs=1.0, mu_rel=1.0))
+        materials = self.testdb.iter_all(chunksize=2)
+        self.assertFalse(isinstance(materials, list))
+        self.assertEqual(sorted(names), [amaterial.name for amaterial in materials])
+        self.assertEqual(sorted(names), sorted(amaterial.name for amaterial in
+                                               self.testdb.iter_all(chunksize=1, ordered=False)))
+
+    def add_samples(self):
+        '''Adds a few sample materials to the test database, returns the list of Materials'''
+        samples = [
+            Material.Material(name="Copper", sigma_iacs=100, mu_rel=1, notes="IACS Copper Standard"),
+            Material.Material(name="Iron", sigma_iacs=18, mu_rel=150, notes="Pure Iron"),
+            Material.Material(name="Aluminum", sigma_iacs=61, mu_rel=1, notes="Unalloyed Pure Aluminum"),
+            Material.Material(name="Cobalt", sigma_iacs=27.6, mu_rel=70,
+                notes="Relative permeability can range between 70-250"),
+            Material.Material(name="Mu-Metal", sigma_iacs=3, mu_rel=20000, notes="Nickel-iron alloy"),
+            Material.Material(name="Water", sigma_iacs=4.353e-10, mu_rel=1, notes="Tap water")]
+        self.testdb.add_many(samples)
+        return samples
+
+    def test_retrieve_range(self):
+        '''Verify range queries on conductivity and permeability'''
+        self.add_samples()
+        self.assertEqual(["Aluminum", "Copper"],
+            [amaterial.name for amaterial in self.testdb.retrieve_range(min_iacs=50)])
+        self.assertEqual(["Cobalt", "Iron"],
+            [amaterial.name for amaterial in self.testdb.retrieve_range(min_iacs=10, max_iacs=50, min_mu_r=2)])
+        self.assertEqual(["Mu-Metal"],
+            [amaterial.name for amaterial in self.testdb.retrieve_range(min_mu_r=1000)])
+        self.assertEqual(2, len(self.testdb.retrieve_range(max_mu_r=1, limit=2)))
+
+    def test_retrieve_top(self):
+        '''Verify top-k queries on conductivity, permeability and their product'''
+        self.add_samples()
+        self.assertEqual(["Copper", "Aluminum"],
+            [amaterial.name for amaterial in self.testdb.retrieve_top('iacs', 2)])
+        self.assertEqual(["Mu-Metal", "Iron", "Cobalt"],
+            [amaterial.name for amaterial in self.testdb.retrieve_top('mu_r', 3)])
+        self.assertEqual(["Water"],
+            [amaterial.name for amaterial in self.testdb.retrieve_top('sigma_mu', 1, largest=False)])
+        self.assertRaises(KeyError, self.testdb.retrieve_top, 'notes')
+
+    def test_retrieve_skindepth_range(self):
+        '''Verify finding the materials with a skin depth in a given range'''
+        samples = self.add_samples()
+        freq = 60.
+        min_depth, max_depth = 1.0E-3, 1.0E-2
+        expected = sorted([amaterial for amaterial in samples
+                           if min_depth <= amaterial.calc_skindepth(freq) <= max_depth],
+                          key=lambda amaterial: amaterial.calc_skindepth(freq))
+        self.assertTrue(len(expected) > 1)
+        self.assertEqual([amaterial.name for amaterial in expected],
+            [amaterial.name for amaterial in self.testdb.retrieve_skindepth_range(freq, min_depth, max_depth)])
+        self.assertEqual([amaterial.name for amaterial in samples if amaterial.calc_skindepth(freq) <= max_depth],
+            sorted([amaterial.name for amaterial in self.testdb.retrieve_skindepth_range(freq, max_depth=max_depth)],
+                   key=[amaterial.name for amaterial in samples].index))
+        self.assertEqual(len(samples), len(self.testdb.retrieve_skindepth_range(freq)))
+        self.assertRaises(ValueError, self.testdb.retrieve_skindepth_range, 0, min_depth, max_depth)
+
+    def test_retrieve_skindepth_nearest(self):
+        '''Verify finding the materials with the skin depth closest to a target'''
+        self.add_samples()
+        for idx in range(1, 200):
+            self.testdb.add(Material.Material(name="Alloy {0:03d}".format(idx), sigma_iacs=idx / 2.0, mu_rel=idx))
+        everything = self.testdb.retrieveall()
+        freq, target = 1.0E3, 0.5E-3
+        for min_depth, max_depth in ((0, None), (0.45E-3, 0.52E-3)):
+            in_range = [amaterial for amaterial in everything if min_depth <= amaterial.calc_skindepth(freq) and
+                        (max_depth is None or amaterial.calc_skindepth(freq) <= max_depth)]
+            in_range.sort(key=lambda amaterial: abs(amaterial.calc_skindepth(freq) - target))
+            nearest = self.testdb.retrieve_skindepth_nearest(freq, target, count=5, min_depth=min_depth,
+                max_depth=max_depth)
+            self.assertEqual([amaterial.name for amaterial in in_range[:5]], [amaterial.name for amaterial in nearest])
+        self.assertRaises(ValueError, self.testdb.retrieve_skindepth_nearest, freq, 0)
+
+    def test_search(self):
+        '''Verify full-text searching of material names and notes'''
+        self.testdb.add(Material.Material(name="Copper", sigma_iacs=100, mu_rel=1, notes="IACS Copper Standard"))
+        self.testdb.add(Material.Material(name="Beryllium Copper", sigma_iacs=22, mu_rel=1,
+            notes="%IACS can range between 22 - 25"))
+        self.testdb.add(Material.Material(name="Iron", sigma_iacs=18, mu_rel=150, notes="Pure Iron"))
+        self.testdb.update()
+        self.assertEqual(["Copper", "Beryllium Copper"], [amaterial.name for amaterial in self.testdb.search("copper")])
+        self.assertEqual(["Beryllium Copper"], [amaterial.name for amaterial in self.testdb.search("cop rang")])
+        self.assertEqual(["Copper"], [amaterial.name for amaterial in self.testdb.search("copper", limit=1)])
+        self.assertEqual([], self.testdb.search("cop AND (NOT"))
+        self.assertEqual([], self.testdb.search("  "))
+        # The index follows replacements, deletions and rollbacks
+        self.testdb.add(Material.Material(name="Iron", sigma_iacs=18, mu_rel=5000, notes="Annealed"))
+        self.assertEqual([], self.testdb.search("pure"))
+        self.assertEqual(["Iron"], [amaterial.name for amaterial in self.testdb.search("annealed")])
+        self.testdb.delete("Copper")
+        self.assertEqual(["Beryllium Copper"], [amaterial.name for amaterial in self.testdb.search("copper")])
+        self.testdb.undo()
+        self.assertEqual(2, len(self.testdb.search("copper")))
+        self.assertEqual(["Iron"], [amaterial.name for amaterial in self.testdb.search("pure")])
+
+    def test_search_fallback(self):
+        '''Verify searching without a full-text index'''
+        if self.testdb.has_search_index():
+            for trigger in ("insert", "delete", "update"):
+                self.testdb.dbcursor.execute("drop trigger materials_fts_{0}".format(trigger))
+            self.testdb.dbcursor.execute("drop table materials_fts")
+        self.testdb.add(Material.Material(name="Copper", sigma_iacs=100, mu_rel=1, notes="IACS Copper Standard"))
+        self.testdb.add(Material.Material(name="Beryllium_Copper", sigma_iacs=22, mu_rel=1, notes="%IACS 22 - 25"))
+        self.assertFalse(self.testdb.has_search_index())
+        self.assertEqual(["Beryllium_Copper", "Copper"],
+            [amaterial.name for amaterial in self.testdb.search("copper iacs")])
+        self.assertEqual(["Beryllium_Copper"], [amaterial.name for amaterial in self.testdb.search("m_c")])
+
+    def test_search_existing(self):
+        '''Verify the full-text index is built for databases created without one'''
+        for trigger in ("insert", "delete", "update"):
+            self.testdb.dbcursor.execute("drop trigger materials_fts_{0}".format(trigger))
+        self.testdb.dbcursor.execute("drop table materials_fts")
+        self.testdb.dbcursor.execute("insert into materials values ('Copper', 'IACS Copper Standard', 100, 1)")
+        self.testdb.create()
+        self.assertEqual(["Copper"], [amaterial.name for amaterial in self.testdb.search("standard")])
+
+    def test_threaded(self):
+        '''Verify sharing a database between threads'''
+        temp_dir = tempfile.mkdtemp()
+        for dbfile in (os.path.join(temp_dir, "threaded.db"), ":memory:"):
+            threaded_db = MaterialDB.MaterialDB(dbfile, threaded=True)
+            threaded_db.connect()
+            threaded_db.create()
+            connections = {}
+            errors = []
+            def worker(idx):
+                try:
+                    for step in range(20):
+                        name = "Alloy {0}-{1}".format(idx, step)
+                        threaded_db.add(Material.Material(name=name, sigma_iacs=idx + 1, mu_rel=1), update=True)
+                        self.assertEqual(name, threaded_db.retrieve(name).name)
+                    connections[idx] = threaded_db.dbconnection
+                except Exception as err:
+                    errors.append(err)
+            workers = [threading.Thread(target=worker, args=(idx,)) for idx in range(6)]
+            for thread in workers:
+                thread.start()
+            for thread in workers:
+                thread.join()
+            self.assertEqual([], errors)
+            self.assertEqual(6 * 20, len(threaded_db.retrievenames()))
+            if dbfile == ":memory:":
+                self.assertEqual(set([threaded_db.dbconnection]), set(connections.values()))
+            else:
+                self.assertEqual(6, len(set(connections.values())))
+                self.assertFalse(threaded_db.dbconnection in connections.values())
+            threaded_db.close()
+            self.assertEqual(None, threaded_db.dbconnection)
+        os.remove(os.path.join(temp_dir, "threaded.db"))
+        os.rmdir(temp_dir)
+
+    def test_threaded_writes(self):
+        '''Verify changes made on any thread are commited and rolled back together'''
+        temp_dir = tempfile.mkdtemp()
+        db_path = os.path.join(temp_dir, "threaded.db")
+        threaded_db = MaterialDB.MaterialDB(db_path, threaded=True, timeout=1.0)
+        threaded_db.connect()
+        threaded_db.create()
+        def run_thread(target, *args):
+            errors = []
+            def worker():
+                try:
+                    target(*args)
+                except Exception as err:
+                    errors.append(err)
+            thread = threading.Thread(target=worker)
+            thread.start()
+            thread.join()
+            self.assertEqual([], errors)
+        try:
+            run_thread(threaded_db.add, Material.Material(name="Iron", sigma_iacs=18, mu_rel=150))
+            # Doesn't wait on the other thread's uncommited change
+            start = time.time()
+            run_thread(threaded_db.add, Material.Material(name="Copper", sigma_iacs=100, mu_rel=1))
+            self.assertTrue(time.time() - start < threaded_db.timeout)
+            self.assertEqual(None, threaded_db.retrieve("Iron"))
+            threaded_db.update()
+            self.assertEqual(["Copper", "Iron"], threaded_db.retrievenames())
+            names = []
+            run_thread(lambda: names.extend(threaded_db.retrievenames()))
+            self.assertEqual(["Copper", "Iron"], names)
+            run_thread(threaded_db.delete, "Iron")
+            threaded_db.undo()
+            self.assertEqual(["Copper", "Iron"], threaded_db.retrievenames())
+        finally:
+            threaded_db.close()
+            os.remove(db_path)
+            os.rmdir(temp_dir)
+
+    def test_profiles(self):
+        '''Verify switching between connection profiles'''
+        temp_dir = tempfile.mkdtemp()
+        db_path = os.path.join(temp_dir, "profiles.db")
+        import_path = os.path.join(temp_dir, "import.db")
+        import_db = MaterialDB.MaterialDB(import_path)
+        import_db.connect()
+        import_db.create()
+        import_db.add(Material.Material(name="Iron", sigma_iacs=18, mu_rel=150, notes="Pure Iron"), update=True)
+        import_db.close()
+        file_db = MaterialDB.MaterialDB(db_path)
+        file_db.connect()
+        file_db.create()
+        def pragma(name):
+            return file_db.dbconnection.execute("pragma {0}".format(name)).fetchone()[0]
+        self.assertEqual(("delete", 2), (pragma("journal_mode"), pragma("synchronous")))
+        with file_db.using_profile("bulk-load"):
+            self.assertEqual("bulk-load", file_db.profile)
+            self.assertEqual(("wal", 0, 2), (pragma("journal_mode"), pragma("synchronous"), pragma("temp_store")))
+        self.assertEqual("interactive", file_db.profile)
+        self.assertEqual(("delete", 2, -2000), (pragma("journal_mode"), pragma("synchronous"), pragma("cache_size")))
+        # Imports switch to bulk-load and back
+        self.assertEqual(1, file_db.importdb(import_path))
+        self.assertEqual(("interactive", "delete"), (file_db.profile, pragma("journal_mode")))
+        file_db.set_profile("read-mostly")
+        self.assertEqual(("wal", 1), (pragma("journal_mode"), pragma("query_only")))
+        self.assertEqual("Iron", file_db.retrieve("Iron").name)
+        self.assertRaises(sqlite3.OperationalError, file_db.delete, "Iron")
+        # The copy's write-ahead log is checkpointed before the copy is renamed
+        copy_path = os.path.join(temp_dir, "copy.db")
+        file_db.backup(copy_path)
+        self.assertFalse([filename for filename in os.listdir(temp_dir) if filename.endswith("-wal")
+                          and not filename.startswith("profiles.db")])
+        copy_db = MaterialDB.MaterialDB(copy_path, profile="read-mostly")
+        copy_db.connect()
+        self.assertEqual(["Iron"], copy_db.retrievenames())
+        copy_db.close()
+        file_db.set_profile("interactive")
+        self.assertRaises(ValueError, file_db.set_profile, "turbo")
+        self.assertRaises(ValueError, MaterialDB.MaterialDB, db_path, profile="turbo")
+        file_db.close()
+        for filename in os.listdir(temp_dir):
+            os.remove(os.path.join(temp_dir, filename))
+        os.rmdir(temp_dir)
+
+    def test_noentry(self):
+        '''Verifying retrieve returns None when no entry found'''
+        self.assertEqual(None, self.testdb.retrieve("Adamantium"))
+
+    def test_delete(self):
+        '''Verify deletion of an existing entry'''
+        testmaterial = Material.Material(name="Iron", sigma_iacs=18, mu_rel=150, notes="Pure Iron")
+        self.testdb.add(testmaterial)
+        self.testdb.delete(testmaterial.name)
+        retrieved = self.testdb.retrieve(testmaterial.name)
+        self.assertEqual(None, retrieved)
+
+    def test_undo(self):
+        '''Verify rollback of last operation'''
+        origmaterial = Material.Material(name="Iron", sigma_iacs=18, mu_rel=150, notes="Pure Iron")
+        self.testdb.add(origmaterial, update=True)
+        newiron = Material.Material(name="Iron", sigma_iacs=18, mu_rel=5000,
+            notes="Relative Permeability can range anywhere between 150 to 5000")
+        self.testdb.add(newiron)
+        self.testdb.undo()
+        revised_material = self.testdb.retrieve("Iron")
+        self.assertEqual(origmaterial.name, revised_material.name)
+        self.assertEqual(origmaterial.notes, revised_material.notes)
+        try:
+            self.assertAlmostEqual(origmaterial.iacs, revised_material.iacs, delta=0.01*origmaterial.iacs)
+            self.assertAlmostEqual(origmaterial.mu_r, revised_material.mu_r, delta=0.01*origmaterial.mu_r)
+        except TypeError:
+            # Use places instead of delta for 2.6
+            self.assertAlmostEqual(origmaterial.iacs, revised_material.iacs, places=1)
+            self.assertAlmostEqual(origmaterial.mu_r, revised_material.mu_r, places=1)
+
+    def test_exportimportsql(self):
+        '''Verifying export and import of SQL'''
+        testmaterial = Material.Material(name="Iron", sigma_iacs=18, mu_rel=150, notes="Pure Iron")
+        self.testdb.add(testmaterial)
+        self.testdb.update()
+        temp_sql_file = tempfile.NamedTemporaryFile(delete=False)
+        self.testdb.exportsql(temp_sql_file.name)
+        file_db = MaterialDB.MaterialDB(":memory:")
+        file_db.importsql(temp_sql_file.name)
+        retrieved_material = file_db.retrieve("Iron")
+        temp_sql_file.close()
+        if os.path.exists(temp_sql_file.name):
+            os.remove(temp_sql_file.name)
+        self.assertEqual(testmaterial.name, retrieved_material.name)
+        self.assertEqual(testmaterial.notes, retrieved_material.notes)
+        try:
+            self.assertAlmostEqual(testmaterial.iacs , retrieved_material.iacs, delta=0.01*testmaterial.iacs)
+            self.assertAlmostEqual(testmaterial.mu_r, retrieved_material.mu_r, delta=0.01*testmaterial.mu_r)
+        except TypeError:
+            # Use places instead of delta for 2.6
+            self.assertAlmostEqual(testmaterial.iacs , retrieved_material.iacs, places=1)
+            self.assertAlmostEqual(testmaterial.mu_r, retrieved_material.mu_r, places=1)
+
+    def test_backup(self):
+        '''Verify copying the database to another file, and that a failed copy leaves the destination intact'''
+        for idx in range(10):
+            self.testdb.add(Material.Material(name="Alloy {0}".format(idx), sigma_iacs=idx, mu_rel=1.0))
+        self.testdb.update()
+        backup_dir = tempfile.mkdtemp()
+        backup_fn = os.path.join(backup_dir, "backup.db")
+        with open(backup_fn, 'wb') as fidout:
+            fidout.write(b"Not yet a materials database")
+        def fail(status, remaining, total):
+            raise KeyboardInterrupt
+        try:
+            self.assertRaises(KeyboardInterrupt, self.testdb.backup, backup_fn, 3, fail)
+            with open(backup_fn, 'rb') as fidin:
+                self.assertEqual(b"Not yet a materials database", fidin.read())
+            self.assertEqual(["backup.db"], os.listdir(backup_dir))
+            steps = []
+            self.testdb.backup(backup_fn, pages=3, progress=lambda *status: steps.append(status))
+            self.assertTrue(len(steps) > 0)
+            self.assertEqual(0, steps[-1][1])
+            copydb = MaterialDB.MaterialDB(backup_fn)
+            copydb.connect()
+            self.assertEqual([amaterial.name for amaterial in self.testdb.iter_all()],
+                [amaterial.name for amaterial in copydb.iter_all()])
+            copydb.close()
+            # The copy has the replaced file's permissions, a new copy those of any new file
+            os.chmod(backup_fn, 0o640)
+            self.testdb.backup(backup_fn)
+            if os.name != 'nt':
+                self.assertEqual(0o640, stat.S_IMODE(os.stat(backup_fn).st_mode))
+            os.remove(backup_fn)
+            # The process-wide umask isn't changed, not even briefly, as other threads may be creating files
+            umask = os.umask(0o022)
+            set_umask = os.umask
+            os.umask = lambda mask: self.fail("umask set to {0:o}".format(mask))
+            try:
+                self.testdb.backup(backup_fn)
+            finally:
+                os.umask = set_umask
+                os.umask(umask)
+            if os.name != 'nt':
+                self.assertEqual(0o644, stat.S_IMODE(os.stat(backup_fn).st_mode))
+        finally:
+            os.remove(backup_fn)
+            os.rmdir(backup_dir)
+
+    def test_exportsql_restore(self):
+        '''Verify a full SQL export can be restored as a script into a new database'''
+        self.testdb.add(Material.Material(name="Iron", sigma_iacs=18, mu_rel=150, notes="Pure Iron"))
+        self.testdb.update()
+        temp_sql_file = tempfile.NamedTemporaryFile(delete=False)
+        temp_sql_file.close()
+        try:
+            self.testdb.exportsql(temp_sql_file.name)
+            with open(temp_sql_file.name, 'rb') as fidin:
+                script = fidin.read().decode('utf-8')
+        finally:
+            os.remove(temp_sql_file.name)
+        self.assertFalse("materials_fts" in script)
+        restored = sqlite3.connect(":memory:")
+        restored.executescript(script)
+        self.assertEqual([("Iron", "Pure Iron")], restored.execute("select name, notes from materials").fetchall())
+        restored.close()
+
+    def test_exportsql_compressed(self):
+        '''Verifying compressed and materials-only export and import of SQL'''
+        iron = Material.Material(name="Iron", sigma_iacs=18, mu_rel=150, notes="Pure Iron's notes")
+        self.testdb.add(iron)
+        self.testdb.add(Material.Material(name="Teflon", sigma_iacs=0, mu_rel=1, notes=None))
+        self.testdb.update()
+        temp_dir = tempfile.mkdtemp()
+        exports = [("full.sql.gz", None, False), ("materials.sql.gz", None, True),
+                   ("materials.sql", None, True), ("materials.dat", "gzip", True)]
+        if MaterialDB.lzma is not None:
+            exports.append(("materials.sql.xz", None, True))
+        try:
+            for export_fn, compression, materials_only in exports:
+                export_path = os.path.join(temp_dir, export_fn)
+                self.testdb.exportsql(export_path, compression=compression, materials_only=materials_only,
+                    buffersize=16)
+                file_db = MaterialDB.MaterialDB(":memory:")
+                self.assertEqual(2, file_db.importsql(export_path))
+                retrieved_material = file_db.retrieve("Iron")
+                self.assertEqual(iron.notes, retrieved_material.notes)
+                self.assertAlmostEqual(iron.mu_r, retrieved_material.mu_r, places=6)
+                self.assertEqual(None, file_db.retrieve("Teflon").notes)
+                file_db.close()
+                os.remove(export_path)
+            self.assertRaises(ValueError, self.testdb.exportsql, os.path.join(temp_dir, "bad.sql"), "zip")
+        finally:
+            for leftover in os.listdir(temp_dir):
+                os.remove(os.path.join(temp_dir, leftover))
+            os.rmdir(temp_dir)
+
+    def test_importsql_streaming(self):
+        '''Verify importing a SQL script statement by statement'''
+        script = tempfile.NamedTemporaryFile(mode='w', delete=False)
+        script.write('''BEGIN TRANSACTION;
+CREATE TABLE materials(name text unique, notes text, conductivity_iacs real,
+                 rel_permeability real);
+INSERT INTO "materials" VALUES('Iron','Relative Permeability; 150 to 5000',18.0,5000.0);
+INSERT INTO "materials" VALUES('Cobalt','Relative permeability
+can range between 70-250',27.6,70.0);
+insert into materials(name, notes, conductivity_iacs, rel_permeability) values ('Water', 'Tap water', 4.353e-10, 1);
+CREATE TABLE materials_notes(name text);
+INSERT INTO "materials_notes" VALUES('Vibranium');
+COMMIT;
+''')
+        script.close()
+        try:
+            self.assertEqual(3, self.testdb.importsql(script.name, batchsize=2))
+        finally:
+            os.remove(script.name)
+        self.assertEqual(["Cobalt", "Iron", "Water"], [amaterial.name for amaterial in self.testdb.iter_all()])
+        self.assertEqual("Relative Permeability; 150 to 5000", self.testdb.retrieve("Iron").notes)
+        self.assertEqual("Relative permeability\ncan range between 70-250", self.testdb.retrieve("Cobalt").notes)
+
+    def test_iter_statements(self):
+        '''Verify splitting a SQL script into statements at every semicolon'''
+        lines = ["BEGIN;INSERT INTO materials VALUES('Iron','a; b',18.0,150.0);", "INSERT INTO materials\n",
+                 "VALUES('Cobalt',NULL,27.6,70.0); INSERT INTO materials VALUES('Water'", ",NULL,0,1);COMMIT;\n"]
+        self.assertEqual(["BEGIN;", "INSERT INTO materials VALUES('Iron','a; b',18.0,150.0);",
+                          "INSERT INTO materials\nVALUES('Cobalt',NULL,27.6,70.0);",
+                          "INSERT INTO materials VALUES('Water',NULL,0,1);", "COMMIT;"],
+                         list(MaterialDB.iter_statements(lines)))
+        self.assertEqual(["SELECT 1;", "SELECT 2"], list(MaterialDB.iter_statements(["SELECT 1;SELECT 2"])))
+
+    def test_importsql_one_line(self):
+        '''Verify importing a SQL script with several statements on a line'''
+        scripts = ["BEGIN;INSERT INTO materials VALUES('Iron',NULL,18.0,150.0);"
+                   "INSERT INTO materials VALUES('Cobalt',NULL,27.6,70.0);COMMIT;",
+                   "INSERT INTO materials VALUES('Nickel',NULL,25.0,600.0);"
+                   "INSERT INTO materials VALUES('Water',NULL,4.353e-10,1.0);\n"]
+        for script in scripts:
+            script_file = tempfile.NamedTemporaryFile(mode='w', delete=False)
+            script_file.write(script)
+            script_file.close()
+            try:
+                self.assertEqual(2, self.testdb.importsql(script_file.name))
+            finally:
+                os.remove(script_file.name)
+        self.assertEqual(["Cobalt", "Iron", "Nickel", "Water"],
+                         [amaterial.name for amaterial in self.testdb.iter_all()])
+
+    def test_importdb(self):
+        '''Verify importing another database'''
+        copper = Material.Material(name="Copper", sigma_iacs=100, mu_rel=1, notes="IACS Copper Standard")
+        self.testdb.add(copper)
+        iron = Material.Material(name="Iron", sigma_iacs=18, mu_rel=150, notes="Pure Iron")
+        self.testdb.add(iron)
+        aluminum = Material.Material(name="Aluminum", sigma_iacs=61, mu_rel=1, notes="Unalloyed Pure Aluminum")
+        self.testdb.add(aluminum)
+        cobalt = Material.Material(name="Cobalt", sigma_iacs=27.6, mu_rel=70, 
+            notes="Relative permeability can range between 70-250")
+        self.testdb.add(cobalt)
+        water = Material.Material(name="Water", sigma_iacs=4.353e-10, mu_rel=1, notes="Tap water")
+        self.testdb.add(water)
+        # Create another database for import
+        another_db_fn = tempfile.NamedTemporaryFile(delete=False)
+        another_db = MaterialDB.MaterialDB(another_db_fn.name)
+        another_db.connect()
+        another_db.create()
+        # Create another Cobalt, make sure it doesn't overwrite the existing
+        fake_cobalt = Material.Material(name="Cobalt", sigma_iacs=1000, mu_rel=7e10, 
+            notes="Relative permeability can range between 70-250")
+        another_db.add(fake_cobalt)
+        another_db.add(water)
+        # Create a couple of new materials for import
+        unobtanium = Material.Material(name="Unobtanium", sigma_iacs=1.0, mu_rel=1.0, 
+            notes="Not a real material, sorry.")
+        vibranium = Material.Material(name="Vibranium", sigma_iacs=1.0, mu_rel=1.0, notes="Captain America's shield")
+        another_db.add(unobtanium)
+        another_db.add(vibranium)
+        another_db.close(update=True)
+        # Import the new database, and check the results
+        self.assertEqual(2, self.testdb.importdb(another_db_fn.name))
+        # Verify we didn't overwrite the good Cobalt entry
+        cobalt_entry = self.testdb.retrieve("Cobalt")
+        self.assertEqual(cobalt_entry.name, cobalt.name)
+        self.assertEqual(cobalt_entry.notes, cobalt.notes)
+        try:
+            self.assertAlmostEqual(cobalt_entry.iacs, cobalt.iacs, delta=0.01*cobalt_entry.iacs)
+            self.assertAlmostEqual(cobalt_entry.mu_r, cobalt.mu_r, delta=0.01*cobalt_entry.mu_r)
+        except TypeError:
+            # Use places instead of delta for 2.6
+            self.assertAlmostEqual(cobalt_entry.iacs, cobalt.iacs, places=1)
+            self.assertAlmostEqual(cobalt_entry.mu_r, cobalt.mu_r, places=1)
+        # Now verify we did import the other two materials that were unique
+        unobtanium_entry = self.testdb.retrieve("Unobtanium")
+        self.assertEqual(unobtanium_entry.name, unobtanium.name)
+        self.assertEqual(unobtanium_entry.notes, unobtanium.notes)
+        try:
+            self.assertAlmostEqual(unobtanium_entry.iacs, unobtanium.iacs, delta=0.01*unobtanium.iacs)
+            self.assertAlmostEqual(unobtanium_entry.mu_r, unobtanium.mu_r, delta=0.01*unobtanium.mu_r)
+        except TypeError:
+            # Use places instead of delta for 2.6
+            self.assertAlmostEqual(unobtanium_entry.iacs, unobtanium.iacs, places=1)
+            self.assertAlmostEqual(unobtanium_entry.mu_r, unobtanium.mu_r, places=1)
+        vibranium_entry = self.testdb.retrieve("Vibranium")
+        self.assertEqual(vibranium_entry.name, vibranium.name)
+        self.assertEqual(vibranium_entry.notes, vibranium.notes)
+        try:
+            self.assertAlmostEqual(vibranium_entry.iacs, vibranium.iacs, delta=0.01*vibranium.iacs)
+            self.assertAlmostEqual(vibranium_entry.mu_r, vibranium.mu_r, delta=0.01*vibranium.mu_r)
+        except TypeError:
+            # Use places instead of delta for 2.6
+            self.assertAlmostEqual(vibranium_entry.iacs, vibranium.iacs, places=1)
+            self.assertAlmostEqual(vibranium_entry.mu_r, vibranium.mu_r, places=1)
+        another_db_fn.close()
+
+    def test_importdb_notadb(self):
+        '''Verify that importing a file that isn't a materials database raises an exception and leaves
+        the current database usable'''
+        not_a_db = tempfile.NamedTemporaryFile(delete=False)
+        not_a_db.write(b"Not a SQLite database" * 100)
+        not_a_db.close()
+        try:
+            self.assertRaises(sqlite3.DatabaseError, self.testdb.importdb, not_a_db.name)
+        finally:
+            os.remove(not_a_db.name)
+        self.testdb.add(Material.Material(name="Iron", sigma_iacs=18, mu_rel=150))
+        self.assertEqual("Iron", self.testdb.retrieve("Iron").name)
+
+    def test_importbaddb(self):
+        '''Verify that attempting to import a bad SQLite3 database raises an exception'''
+        try:
+            with self.assertRaises(sqlite3.OperationalError):
+                self.testdb.importdb("x:/werd/test.db")
+        except TypeError:
+            # Handles assertRaises under 2.6
+            self.assertRaises(sqlite3.OperationalError, self.testdb.importdb, "x:/werd/test.db")
+
+    def tearDown(self):
+        '''Closes the SQLite3 database in memory'''
+        self.testdb.close()
+
+def run():
+    '''Runs the suite of tests'''
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestMaterialDB)
     unittest.TextTestRunner(verbosity=2).run(suite)
\ No newline at end of file
@@ -0,0 +1,106 @@
+'''testnameindex.py- Tests the material name autocompletion index'''
+
+import random
+import time
+import unittest
+try:
+    import tracemalloc
+except ImportError:
+    tracemalloc = None
+from material import NameIndex
+
+class TestNameIndex(unittest.TestCase):
+    '''Tests the NameIndex class'''
+
+    def setUp(self):
+        self.names = ["Aluminum, 2024-T4XX", "Aluminum, 6061-T6", "aluminum-lithium 8090", "Copper",
+                      "Beryllium Copper", "Graphite Epoxy Composite, 1.96%, 4kHz", "Iron"]
+        self.testindex = NameIndex.NameIndex(self.names)
+
+    def test_complete(self):
+        '''Verify case-insensitive completion from the start of the name'''
+        self.assertEqual(["Aluminum, 2024-T4XX", "Aluminum, 6061-T6", "aluminum-lithium 8090"],
+                         self.testindex.complete("ALUM"))
+        self.assertEqual(["Aluminum, 2024-T4XX", "Aluminum, 6061-T6"], self.testindex.complete("alum", limit=2))
+        self.assertEqual(["Aluminum, 6061-T6"], self.testindex.complete("aluminum, 6"))
+        self.assertEqual([], self.testindex.complete("copper, "))
+        self.assertEqual(sorted(self.names, key=lambda name: (name.lower(), name)),
+                         self.testindex.complete("", limit=None))
+
+    def test_complete_tokens(self):
+        '''Verify completion from the start of any word in the name'''
+        self.assertEqual(["Beryllium Copper", "Copper"], self.testindex.complete("cop", tokens=True))
+        self.assertEqual(["Aluminum, 2024-T4XX"], self.testindex.complete("t4", tokens=True))
+        self.assertEqual(["Graphite Epoxy Composite, 1.96%, 4kHz"], self.testindex.complete("epoxy com", tokens=True))
+        self.assertEqual([], self.testindex.complete("opper", tokens=True))
+
+    def test_add_remove(self):
+        '''Verify the index is updated incrementally'''
+        self.testindex.add("Aluminum, 1100")
+        self.assertEqual(["Aluminum, 1100", "Aluminum, 2024-T4XX", "Aluminum, 6061-T6"],
+                         self.testindex.complete("alum", limit=3))
+        self.testindex.remove("Aluminum, 2024-T4XX")
+        self.testindex.remove("Aluminum, 1100")
+        self.assertEqual(["Aluminum, 6061-T6", "aluminum-lithium 8090"], self.testindex.complete("alum"))
+        self.assertEqual([], self.testindex.complete("t4", tokens=True))
+        self.assertFalse("Aluminum, 1100" in self.testindex)
+        self.assertEqual(len(self.names) - 1, len(self.testindex))
+
+    def test_random(self):
+        '''Verify completions match a brute force search after random adds and removes'''
+        rng = random.Random(1)
+        words = ["Alloy", "alpha", "Steel", "Stainless", "304", "316L", "Cast", "Iron"]
+        testindex = NameIndex.NameIndex()
+        current = set()
+        for step in range(400):
+            name = " ".join(rng.choice(words) for idx in range(rng.randint(1, 3)))
+            if name in current and rng.random() < 0.5:
+                testindex.remove(name)
+                current.discard(name)
+            else:
+                testindex.add(name)
+                current.add(name)
+        ranked = sorted(current, key=lambda name: (name.lower(), name))
+        for prefix in ("a", "al", "alloy s", "s", "st", "3", "cast i", "x"):
+            expected = [name for name in ranked if name.lower().startswith(prefix)]
+            self.assertEqual(expected[:5], testindex.complete(prefix, limit=5))
+            self.assertEqual(expected, testindex.complete(prefix, limit=None))
+            expected = [name for name in ranked
+                        if any(word.lower().startswith(prefix) for word in name.split())
+                        or " " in prefix and prefix in name.lower()]
+            self.assertEqual(expected[:5], testindex.complete(prefix, limit=5, tokens=True))
+
+    def test_scale(self):
+        '''Verify an index of 100,000 names is built and completed from in bounded time and memory'''
+        rng = random.Random(2)
+        alloys = ["Aluminum", "Stainless Steel", "Copper", "Brass", "Titanium", "Nickel", "Cast Iron",
+                  "Graphite Epoxy Composite"]
+        conditions = ["annealed", "cold worked", "hardened", "plate", "sheet", "wire"]
+        names = ["{0} {1}-T{2}, {3} {4:.2f}%".format(rng.choice(alloys), rng.randint(1000, 9999), rng.randint(0, 9),
+                                                     rng.choice(conditions), rng.random() * 100)
+                 for idx in range(100000)]
+        if tracemalloc is not None:
+            tracemalloc.start()
+        start = time.time()
+        try:
+            testindex = NameIndex.NameIndex(names)
+            if tracemalloc is not None:
+                self.assertTrue(tracemalloc.get_traced_memory()[1] < 100 * 1024 * 1024)
+        finally:
+            if tracemalloc is not None:
+                tracemalloc.stop()
+        for prefix in ("a", "c", "stainless s", "ann", "4"):
+            testindex.complete(prefix, tokens=True)
+        testindex.add("Zirconium 702")
+        self.assertEqual(["Zirconium 702"], testindex.complete("zirc", tokens=True))
+        self.assertTrue(time.time() - start < 20)
+        ranked = sorted(names, key=lambda name: (name.lower(), name))
+        self.assertEqual([name for name in ranked if "cold worked" in name.lower()][:10],
+                         testindex.complete("cold w", tokens=True))
+        self.assertEqual([name for name in ranked if name.lower().startswith("nickel 5")][:10],
+                         testindex.complete("NICKEL 5"))
+
+def run():
+    '''Runs the suite of tests'''
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestNameIndex)
+    unittest.TextTestRunner(verbosity=2).run(suite)
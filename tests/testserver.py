@@ -0,0 +1,127 @@
+'''testserver.py- Tests the HTTP / JSON calculation service'''
+
+import json
+import threading
+import unittest
+try:
+    import httplib
+except ImportError:
+    import http.client as httplib
+from platform import SkinDepthServer
+from tests import fixtures
+
+class TestSkinDepthServer(fixtures.MaterialsTestCase):
+    '''Tests the HTTP / JSON calculation service'''
+    dbname = "server.db"
+
+    def setUp(self):
+        fixtures.MaterialsTestCase.setUp(self)
+        self.controller = self.open_controller(threaded=True)
+        self.server = SkinDepthServer.SkinDepthServer(("127.0.0.1", 0), self.controller, batchwindow=0.05)
+        self.server_thread = threading.Thread(target=self.server.serve_forever, kwargs={"poll_interval":0.05})
+        self.server_thread.start()
+        self.connection = httplib.HTTPConnection("127.0.0.1", self.server.server_address[1], timeout=10)
+
+    def request(self, method, path, body=None, connection=None):
+        '''Makes a request over the keep-alive connection, returning the status and decoded JSON response'''
+        connection = connection or self.connection
+        headers = {}
+        if body is not None:
+            body = json.dumps(body)
+            headers["Content-Type"] = "application/json"
+        connection.request(method, path, body, headers)
+        response = connection.getresponse()
+        self.last_response = response
+        return response.status, json.loads(response.read().decode("utf-8"))
+
+    def test_calculations(self):
+        '''Verify the calcdelta and calcfrequency endpoints'''
+        status, response = self.request("GET", "/calcdelta?material=Iron&frequency=60")
+        self.assertEqual(200, status)
+        self.assertAlmostEqual(self.iron.calc_skindepth(60.), response["skindepth"], places=12)
+        # HTTP/1.1 keep-alive
+        self.assertFalse(self.last_response.will_close)
+        status, response = self.request("GET", "/calcfrequency?material=Copper&skindepth=0.001")
+        self.assertAlmostEqual(self.copper.calc_frequency(1.0E-3), response["frequency"], places=6)
+        self.assertEqual(None, self.request("GET", "/calcdelta?material=Iron&frequency=0")[1]["skindepth"])
+        self.assertEqual(404, self.request("GET", "/calcdelta?material=Adamantium&frequency=60")[0])
+        self.assertEqual(400, self.request("GET", "/calcdelta?material=Iron&frequency=sixty")[0])
+        self.assertEqual(400, self.request("GET", "/calcfrequency?material=Iron")[0])
+        self.assertEqual(404, self.request("GET", "/teleport")[0])
+        self.assertEqual(405, self.request("DELETE", "/calcdelta")[0])
+
+    def test_batching(self):
+        '''Verify concurrent calculations are batched together'''
+        freqs = [60. * (idx + 1) for idx in range(8)]
+        results = {}
+        def worker(freq):
+            connection = httplib.HTTPConnection("127.0.0.1", self.server.server_address[1], timeout=10)
+            results[freq] = self.request("GET", "/calcdelta?material=Iron&frequency={0!r}".format(freq),
+                                         connection=connection)[1]["skindepth"]
+            connection.close()
+        workers = [threading.Thread(target=worker, args=(freq,)) for freq in freqs]
+        for thread in workers:
+            thread.start()
+        for thread in workers:
+            thread.join()
+        for freq in freqs:
+            self.assertAlmostEqual(self.iron.calc_skindepth(freq), results[freq], places=12)
+        stats = self.request("GET", "/stats")[1]
+        self.assertEqual(len(freqs), stats["batching"]["calculations"])
+        self.assertTrue(stats["batching"]["batches"] < len(freqs))
+        self.assertEqual(len(freqs), stats["latency"]["calcdelta"]["count"])
+
+    def test_sweep(self):
+        '''Verify sweeping materials over frequencies and skin depths'''
+        status, response = self.request("POST", "/sweep", {"materials":["Iron", "Unobtainium"],
+                                                          "frequencies":[60, 1000]})
+        self.assertEqual(["Unobtainium"], response["unknown"])
+        self.assertAlmostEqual(self.iron.calc_skindepth(1000.), response["results"]["Iron"][1], places=12)
+        status, response = self.request("POST", "/sweep", {"materials":["Copper"], "skindepths":[0.001]})
+        self.assertAlmostEqual(self.copper.calc_frequency(0.001), response["results"]["Copper"][0], places=6)
+        self.assertEqual(400, self.request("POST", "/sweep", {"materials":["Copper"]})[0])
+
+    def test_materials(self):
+        '''Verify listing, adding, fetching, searching and removing materials'''
+        self.assertEqual(["Copper", "Iron"], self.request("GET", "/materials")[1]["materials"])
+        status, response = self.request("PUT", "/materials/Beryllium%20Copper",
+                                        {"notes":"Copper alloy", "iacs":22, "mu_r":1})
+        self.assertEqual((200, "Beryllium Copper"), (status, response["name"]))
+        self.assertEqual(400, self.request("PUT", "/materials/Lead", {"iacs":"heavy"})[0])
+        self.assertEqual(["Copper", "Iron"], self.request("GET", "/materials?after=Beryllium%20Copper")[1]["materials"])
+        self.assertEqual("Pure Iron", self.request("GET", "/materials/Iron")[1]["notes"])
+        self.assertEqual(["Copper", "Beryllium Copper"], self.request("GET", "/search?q=copper")[1]["materials"])
+        self.assertEqual(["Beryllium Copper", "Copper"],
+                         self.request("GET", "/complete?prefix=co&tokens=1")[1]["materials"])
+        self.assertEqual(200, self.request("DELETE", "/materials/Beryllium%20Copper")[0])
+        self.assertEqual(404, self.request("DELETE", "/materials/Beryllium%20Copper")[0])
+        self.assertEqual(404, self.request("GET", "/materials/Beryllium%20Copper")[0])
+        # Changes are commited
+        self.assertEqual(["Copper", "Iron"], self.controller.db.retrievenames())
+
+    def test_latency_histogram(self):
+        '''Verify the latency histogram percentiles'''
+        histogram = SkinDepthServer.LatencyHistogram()
+        for idx in range(90):
+            histogram.record(0.00015)
+        for idx in range(10):
+            histogram.record(0.05)
+        stats = histogram.stats()
+        self.assertEqual(100, stats["count"])
+        self.assertAlmostEqual(0.2, stats["p50_ms"])
+        self.assertAlmostEqual(0.2, stats["p90_ms"])
+        self.assertAlmostEqual(51.2, stats["p99_ms"])
+        self.assertEqual([[0.2, 90], [51.2, 10]], [[round(bound, 6), count] for bound, count in stats["buckets"]])
+
+    def tearDown(self):
+        self.connection.close()
+        self.server.shutdown()
+        self.server.server_close()
+        self.server_thread.join()
+        self.controller.db.close()
+        fixtures.MaterialsTestCase.tearDown(self)
+
+def run():
+    '''Runs the suite of tests'''
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestSkinDepthServer)
+    unittest.TextTestRunner(verbosity=2).run(suite)
@@ -0,0 +1,79 @@
+'''testsweep.py- Tests the parallel sweep executor'''
+
+import math
+import unittest
+from platform import SweepExecutor
+from material import vectorcalc
+from tests import fixtures
+
+class TestSweepExecutor(fixtures.MaterialsTestCase):
+    '''Tests the parallel sweep executor'''
+    dbname = "sweep.db"
+
+    def setUp(self):
+        fixtures.MaterialsTestCase.setUp(self)
+        self.controller = self.open_controller()
+        self.frequencies = [float(freq) for freq in range(1, 101)]
+
+    def result(self, results, index, shape):
+        '''Returns the result at index of the results array of the given shape'''
+        if vectorcalc.numpy is not None:
+            return results[index]
+        flat = 0
+        for idx, size in zip(index, shape):
+            flat = flat * size + idx
+        return results[flat]
+
+    def test_skindepths(self):
+        '''Verify sweeping skin depths in and out of process'''
+        for jobs in (1, 2):
+            progress = []
+            executor = SweepExecutor.SweepExecutor(self.controller, jobs=jobs, chunksize=30)
+            names, results, unknown = executor.run(["Iron", "Adamantium", "Copper"], self.frequencies,
+                                                   progress=lambda *args: progress.append(args))
+            self.assertEqual(["Iron", "Copper"], names)
+            self.assertEqual(["Adamantium"], unknown)
+            shape = (2, len(self.frequencies))
+            for row, amat in enumerate((self.iron, self.copper)):
+                for col, freq in enumerate(self.frequencies):
+                    self.assertAlmostEqual(amat.calc_skindepth(freq), self.result(results, (row, col), shape),
+                                           places=12)
+            # 4 chunks of frequencies per material
+            self.assertEqual(8, len(progress))
+            self.assertEqual((0, 0, 200), progress[-1])
+
+    def test_thicknesses(self):
+        '''Verify sweeping the attenuation through thicknesses of all the materials'''
+        executor = SweepExecutor.SweepExecutor(self.controller, jobs=2, chunksize=64)
+        thicknesses = [0., 1.0E-3, 5.0E-3]
+        names, results, unknown = executor.run(None, self.frequencies, thicknesses)
+        self.assertEqual(["Copper", "Iron"], sorted(names))
+        shape = (2, len(thicknesses), len(self.frequencies))
+        for row, name in enumerate(names):
+            amat = self.controller.retrieve(name)
+            for idx, thickness in enumerate(thicknesses):
+                for col, freq in enumerate(self.frequencies):
+                    expected = math.exp(-thickness / amat.calc_skindepth(freq))
+                    self.assertAlmostEqual(expected, self.result(results, (row, idx, col), shape), places=12)
+
+    def test_cancel(self):
+        '''Verify cancelling a sweep from the progress callback'''
+        executor = SweepExecutor.SweepExecutor(self.controller, jobs=1, chunksize=10)
+        progress = []
+        def cancel(status, remaining, total):
+            progress.append(remaining)
+            executor.cancel()
+        self.assertRaises(SweepExecutor.SweepCancelled, executor.run, ["Iron"], self.frequencies, progress=cancel)
+        self.assertEqual([90], progress)
+        # A new run isn't affected by the earlier cancellation
+        names, results, unknown = executor.run(["Iron"], self.frequencies)
+        self.assertEqual(["Iron"], names)
+
+    def tearDown(self):
+        self.controller.db.close()
+        fixtures.MaterialsTestCase.tearDown(self)
+
+def run():
+    '''Runs the suite of tests'''
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestSweepExecutor)
+    unittest.TextTestRunner(verbosity=2).run(suite)